@@ -131,9 +131,100 @@ public:
  *   a Config instance or the GPU and CPU Processor caches in a Processor instance. So in cases
  *   where you still have a Config instance after calling ClearAllCaches, you should also call 
  *   the Config's clearProcessorCache method.
+ *
+ * The configs cached by \ref Config::CreateFromFileCached are also discarded, as well as the
+ * precomputed parameters & tables of the ACES 2.0 output transforms and the 3D LUTs baked from
+ * the inverse 3D LUTs.
  */
 extern OCIOEXPORT void ClearAllCaches();
 
+/// Statistics about the usage of a cache.
+struct OCIOEXPORT CacheStatistics
+{
+    /// Number of lookups which found an existing entry.
+    size_t m_hits{ 0 };
+    /// Number of lookups which needed to create a new entry.
+    size_t m_misses{ 0 };
+    /// Number of entries evicted to respect the capacity of the cache.
+    size_t m_evictions{ 0 };
+    /// Number of entries discarded because their content was out of date.
+    size_t m_invalidations{ 0 };
+    /// Current number of entries.
+    size_t m_size{ 0 };
+    /// Maximum number of entries (i.e. 0 means no limit).
+    size_t m_capacity{ 0 };
+};
+
+extern OCIOEXPORT std::ostream & operator<<(std::ostream &, const CacheStatistics &);
+
+/**
+ * \brief Set the maximum number of files kept in the FileTransform cache.
+ *
+ * The least recently used files are evicted when the cache is full. The default value of 0 means
+ * no limit, unless the \ref OCIO_FILE_CACHE_CAPACITY environment variable is set.
+ */
+extern OCIOEXPORT void SetFileCacheCapacity(size_t capacity);
+/// Get the maximum number of files kept in the FileTransform cache (i.e. 0 means no limit).
+extern OCIOEXPORT size_t GetFileCacheCapacity();
+/**
+ * \brief Get the hits, misses and evictions of the FileTransform cache since the start of the
+ * process, and its current size.
+ */
+extern OCIOEXPORT CacheStatistics GetFileCacheStatistics();
+
+/**
+ * \brief Set how often the files of the FileTransform cache are checked for modifications.
+ *
+ * A cached file is modified when its modification time, size or inode changed since it was
+ * loaded. Only that file is then reloaded, and the Config instances only rebuild the cached
+ * processors using it.
+ *
+ * A negative value disables the check (i.e. that's the default value, unless the
+ * \ref OCIO_FILE_CACHE_VALIDATION_INTERVAL environment variable is set), zero checks the files on
+ * each access, and a positive value checks a file at most once per interval in milliseconds.
+ */
+extern OCIOEXPORT void SetFileCacheValidationInterval(int milliseconds);
+/// Get how often the files of the FileTransform cache are checked for modifications.
+extern OCIOEXPORT int GetFileCacheValidationInterval();
+
+/**
+ * \brief Discard the configs cached by \ref Config::CreateFromFileCached.
+ *
+ * The Config instances already returned remain valid.
+ */
+extern OCIOEXPORT void ClearConfigCache();
+/**
+ * \brief Set the maximum number of configs kept by \ref Config::CreateFromFileCached.
+ *
+ * The least recently used configs are evicted when the cache is full. The default value of 0
+ * means no limit.
+ */
+extern OCIOEXPORT void SetConfigCacheCapacity(size_t capacity);
+/// Get the maximum number of configs kept in the config cache (i.e. 0 means no limit).
+extern OCIOEXPORT size_t GetConfigCacheCapacity();
+/**
+ * \brief Get the hits, misses, evictions and invalidations of the config cache since the start
+ * of the process, and its current size.
+ */
+extern OCIOEXPORT CacheStatistics GetConfigCacheStatistics();
+
+/**
+ * \brief Enable the lazy loading of the configs read from a file or a stream.
+ *
+ * A lazily loaded config keeps the YAML document and only creates the transforms of a color
+ * space, look or named transform on their first access (e.g. when creating a processor using
+ * it). That reduces the loading time of large configs when only a few of their elements are
+ * used. The results are the same as with the default eager loading, except that an
+ * invalid transform is only reported on its first access, or by \ref Config::validate which
+ * creates all the transforms.
+ *
+ * The default value is false, unless the \ref OCIO_LAZY_CONFIG_LOADING_ENVVAR environment
+ * variable is set to a non-zero value.
+ */
+extern OCIOEXPORT void SetLazyConfigLoading(bool lazy);
+/// Return true if the configs are lazily loaded.
+extern OCIOEXPORT bool GetLazyConfigLoading();
+
 /**
  * \brief Get the version number for the library, as a dot-delimited string 
  *     (e.g., "1.0.0").
@@ -185,6 +276,44 @@ extern OCIOEXPORT void LogMessage(LoggingLevel level, const char * message);
 extern OCIOEXPORT void SetComputeHashFunction(ComputeHashFunction hashFunction);
 extern OCIOEXPORT void ResetComputeHashFunction();
 
+/**
+ * \brief Get the number of pixels processed at once by the CPU processors.
+ *
+ * The CPU processors apply all their ops to a chunk of pixels before moving to the next
+ * one. The default value of 0 means that complete scanlines are processed. A chunk size of a
+ * few hundred pixels keeps the intermediate buffers in the CPU caches when processing very
+ * wide images with long op chains.
+ */
+extern OCIOEXPORT unsigned GetCPUProcessorChunkSize();
+/**
+ * \brief Set the number of pixels processed at once by the CPU processors (i.e. 0 means
+ * complete scanlines).
+ *
+ * \note
+ *     The chunk size has no impact on the processing results.
+ */
+extern OCIOEXPORT void SetCPUProcessorChunkSize(unsigned numPixels);
+
+/**
+ * \brief Get the grid size of the 3D LUTs approximating the inverse 3D LUTs.
+ *
+ * The inverse 3D LUTs are baked into a forward 3D LUT when using the fast inversion (i.e.
+ * \ref OPTIMIZATION_LUT_INV_FAST) and for the GPU renderers. The baked LUT uses the larger of
+ * this grid size and the size of the forward LUT. The default value is 48.
+ */
+extern OCIOEXPORT unsigned GetFastInverseLut3DGridSize();
+/**
+ * \brief Set the grid size of the 3D LUTs approximating the inverse 3D LUTs.
+ *
+ * A larger grid size is more accurate but takes more time to compute and more memory. The
+ * valid sizes are from 2 to 129.
+ *
+ * \note
+ *     The processors already created (including the ones cached by the configs) are not
+ *     affected.
+ */
+extern OCIOEXPORT void SetFastInverseLut3DGridSize(unsigned gridSize);
+
 //
 // Note that the following environment variable access methods are not thread safe.
 //
@@ -331,6 +460,33 @@ public:
      */
     static ConstConfigRcPtr CreateFromFile(const char * filename);
 
+    /**
+     * \brief Same as \ref Config::CreateFromFile but the config is shared with the previous
+     * calls using the same file.
+     *
+     * The cache is keyed by the absolute filepath. A cached config is loaded again when the
+     * modification time, size or inode of the file changed, or when one of the environment
+     * variables used by the config (i.e. its context variables and the ones overriding the
+     * active displays, views and color spaces) changed since it was loaded. Note that a change
+     * in a file included by the config (e.g. a LUT file) is not detected.
+     *
+     * The returned config must not be modified, use \ref Config::createEditableCopy instead.
+     * The copy still keeps the processors of the cached config. As the constness is lost in
+     * Python, the Python binding always returns such a copy.
+     * The cache is disabled by the \ref OCIO_DISABLE_ALL_CACHES environment variable, and is
+     * cleared by \ref ClearConfigCache or \ref ClearAllCaches.
+     *
+     * \throw Exception If the file may not be read or does not parse.
+     * \return The Config object.
+     */
+    static ConstConfigRcPtr CreateFromFileCached(const char * filename);
+
+    /**
+     * \brief Same as \ref Config::CreateFromEnv but uses \ref Config::CreateFromFileCached to
+     * load the config.
+     */
+    static ConstConfigRcPtr CreateFromEnvCached();
+
     /**
      * \brief Create a configuration using a stream.
      * 
@@ -393,6 +549,15 @@ public:
      */
     static ConstConfigRcPtr CreateFromBuiltinConfig(const char * configName);
 
+    /**
+     * \brief Create a deep copy of the config.
+     *
+     * All the config elements (e.g. color spaces, looks and view transforms) are copied so the
+     * copy never shares an element with the config. The copy keeps the processors and the cache
+     * IDs of the config. A change of a color space, look, view transform or named transform of
+     * the copy only flushes the processors created from it, while the other changes flush all
+     * the processors.
+     */
     ConfigRcPtr createEditableCopy() const;
 
     /// Get the configuration major version.
@@ -657,6 +822,9 @@ public:
      *
      * \note
      *    Name must be the canonical name.
+     * \note
+     *    It also returns true if a transform of a lazily loaded config (see
+     *    \ref SetLazyConfigLoading) fails to load.
      */
     bool isColorSpaceUsed(const char * name) const noexcept;
 
@@ -737,6 +905,10 @@ public:
      *
      *        The method only looks at active color spaces.  If the interchange roles are
      *        missing and heuristics are used, only scene-referred color spaces are searched.
+     *
+     *        The color spaces are tested in parallel and the results of the heuristics are
+     *        cached per pair of configs (i.e. using their cache IDs), until
+     *        \ref ClearAllCaches is called.
      * 
      * \param srcConfig The config to search for the desired color space.
      * \param builtinConfig The built-in config to use.  See \ref Config::CreateFromBuiltinConfig.
@@ -1309,6 +1481,25 @@ public:
      */
     const char * getColorSpaceFromFilepath(const char * filePath, size_t & ruleIndex) const;
 
+    /**
+     * \brief Get the color spaces of a list of file paths, and optionally the indices of the
+     *        matching rules. This is equivalent to calling \ref getColorSpaceFromFilepath for
+     *        each file path, but faster for long lists e.g. when scanning image sequences as the
+     *        rules only depending on the directory and on the extension of the file path (e.g.
+     *        pattern "*" and extension "exr") are only evaluated once per directory and extension.
+     *
+     * \param filePaths The file paths. A null file path is handled as an empty one.
+     * \param numFilePaths The number of file paths.
+     * \param[out] colorSpaces The color space names, must have numFilePaths elements. The names
+     *        are owned by the config.
+     * \param[out] ruleIndices The indices of the matching rules (when not null), must have
+     *        numFilePaths elements.
+     */
+    void getColorSpacesFromFilepaths(const char * const * filePaths,
+                                     size_t numFilePaths,
+                                     const char ** colorSpaces,
+                                     size_t * ruleIndices = nullptr) const;
+
     /**
      * \brief
      * 
@@ -1542,6 +1733,21 @@ public:
      */
     void clearProcessorCache() noexcept;
 
+    /**
+     * \brief Set the maximum number of processors kept in the processor cache.
+     *
+     * The least recently used processors are evicted when the cache is full. The default value
+     * of 0 means no limit.
+     */
+    void setProcessorCacheCapacity(size_t capacity);
+    /// Get the maximum number of processors kept in the processor cache (i.e. 0 means no limit).
+    size_t getProcessorCacheCapacity() const noexcept;
+    /**
+     * \brief Get the hits, misses and evictions of the processor cache since the creation of the
+     * config instance, and its current size.
+     */
+    CacheStatistics getProcessorCacheStatistics() const;
+
     /// Set the ConfigIOProxy object used to provision the config and LUTs from somewhere other
     /// than the file system.  (This is set on the config's embedded Context object.)
     void setConfigIOProxy(ConfigIOProxyRcPtr ciop);
@@ -2104,8 +2310,11 @@ public:
      * 
      * If a transform in the specified direction has been specified,
      * return it. Otherwise return a null ConstTransformRcPtr
+     *
+     * \throw Exception If the config is lazily loaded (see \ref SetLazyConfigLoading) and the
+     *     transform fails to load on its first access.
      */
-    ConstTransformRcPtr getTransform(ColorSpaceDirection dir) const noexcept;
+    ConstTransformRcPtr getTransform(ColorSpaceDirection dir) const;
     /**
      * Specify the transform for the appropriate direction.
      * Setting the transform to null will clear it.
@@ -2123,6 +2332,9 @@ private:
 
     static void deleter(ColorSpace* c);
 
+    friend class ColorSpaceSet;
+    friend class Config;
+
     class Impl;
     Impl * m_impl;
     Impl * getImpl() { return m_impl; }
@@ -2336,6 +2548,8 @@ private:
 
     static void deleter(Look* c);
 
+    friend class Config;
+
     class Impl;
     Impl * m_impl;
     Impl * getImpl() { return m_impl; }
@@ -2499,6 +2713,8 @@ private:
 
     static void deleter(ViewTransform * c);
 
+    friend class Config;
+
     class Impl;
     Impl * m_impl;
     Impl * getImpl() { return m_impl; }
@@ -2726,6 +2942,17 @@ public:
     void apply(const ImageDesc & imgDesc) const;
     void apply(const ImageDesc & srcImgDesc, ImageDesc & dstImgDesc) const;
 
+    /**
+     * \brief Apply to an image while splitting the processing between several threads.
+     *
+     * The image is split into bands of lines (or of columns when the image has fewer lines
+     * than threads) which are processed concurrently, each thread using its own scanline
+     * buffers while sharing the CPU processor. A numThreads of 0 uses all the hardware threads
+     * and a numThreads of 1 is equivalent to the single-threaded apply methods.
+     */
+    void apply(const ImageDesc & imgDesc, unsigned numThreads) const;
+    void apply(const ImageDesc & srcImgDesc, ImageDesc & dstImgDesc, unsigned numThreads) const;
+
     /**
      * Apply to a single pixel respecting that the input and output bit-depths
      * be 32-bit float and the image buffer be packed RGB/RGBA.
@@ -2738,6 +2965,52 @@ public:
     void applyRGB(float * pixel) const;
     void applyRGBA(float * pixel) const;
 
+    /**
+     * Apply to an array of numPoints packed RGB pixels respecting that the input and output
+     * bit-depths be 32-bit float, e.g. scattered color samples from a picker tool.
+     *
+     * The result is the same as calling applyRGB on each pixel, but each op processes a block
+     * of pixels at once and the intermediate buffer comes from the scratch buffer pool of the
+     * CPU processor.
+     */
+    void applyRGBPoints(float * points, size_t numPoints) const;
+    /// Apply to an array of numPoints packed RGBA pixels, refer to applyRGBPoints.
+    void applyRGBAPoints(float * points, size_t numPoints) const;
+
+    /**
+     * \brief Apply using a set of dynamic property values for that call only.
+     *
+     * The values override the ones of the dynamic properties of the CPU processor without
+     * changing them, so that one CPU processor can concurrently serve several requests using
+     * different values, e.g. different grading values per image. Only the CPU ops having a
+     * dynamic property with a value in the set are created again for the call, all the other
+     * ones are shared. Refer to the methods above for the other arguments.
+     */
+    void apply(const ImageDesc & imgDesc,
+               const DynamicPropertyValues & values,
+               unsigned numThreads = 1) const;
+    void apply(const ImageDesc & srcImgDesc,
+               ImageDesc & dstImgDesc,
+               const DynamicPropertyValues & values,
+               unsigned numThreads = 1) const;
+    void applyRGB(float * pixel, const DynamicPropertyValues & values) const;
+    void applyRGBA(float * pixel, const DynamicPropertyValues & values) const;
+    void applyRGBPoints(float * points,
+                        size_t numPoints,
+                        const DynamicPropertyValues & values) const;
+    void applyRGBAPoints(float * points,
+                         size_t numPoints,
+                         const DynamicPropertyValues & values) const;
+
+    /**
+     * The intermediate buffers needed by the apply methods come from a thread-safe memory pool
+     * owned by the CPU processor, so that repeated calls do not allocate memory. The hits are
+     * the buffer requests served by previously released buffers and the misses are the buffer
+     * requests which needed a memory allocation.
+     */
+    size_t getScratchBufferPoolHits() const noexcept;
+    size_t getScratchBufferPoolMisses() const noexcept;
+
     CPUProcessor(const CPUProcessor &) = delete;
     CPUProcessor& operator= (const CPUProcessor &) = delete;
     /// Do not use (needed only for pybind11).
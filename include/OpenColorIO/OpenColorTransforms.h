@@ -808,6 +808,68 @@ protected:
     DynamicPropertyGradingTone() = default;
 };
 
+/**
+ * \brief A set of dynamic property values used by a single apply call of a \ref CPUProcessor.
+ *
+ * The values override the ones of the dynamic properties of the same types in the CPU
+ * processor for that call only, so that one CPU processor can concurrently process several
+ * requests using different values (e.g. different grading values per image) without any
+ * change to the CPU processor itself. The types without a value in the set use the current
+ * values of the dynamic properties of the CPU processor.
+ *
+ * \code{.cpp}
+ *    OCIO::DynamicPropertyValuesRcPtr values = OCIO::DynamicPropertyValues::Create();
+ *    values->setDouble(OCIO::DYNAMIC_PROPERTY_EXPOSURE, 1.5);
+ *
+ *    cpuProcessor->apply(imgDesc, *values);
+ * \endcode
+ */
+class OCIOEXPORT DynamicPropertyValues
+{
+public:
+    static DynamicPropertyValuesRcPtr Create();
+
+    virtual DynamicPropertyValuesRcPtr createEditableCopy() const = 0;
+
+    /// True if the set holds a value for that type.
+    virtual bool hasValue(DynamicPropertyType type) const noexcept = 0;
+    /// Remove the value for that type from the set, if any.
+    virtual void removeValue(DynamicPropertyType type) noexcept = 0;
+    /// Remove all the values from the set.
+    virtual void clear() noexcept = 0;
+
+    /**
+     * Will throw if the type is not a type that holds a double such as
+     * DYNAMIC_PROPERTY_EXPOSURE, or if the set holds no value for that type.
+     */
+    virtual double getDouble(DynamicPropertyType type) const = 0;
+    /// Will throw if the type is not a type that holds a double.
+    virtual void setDouble(DynamicPropertyType type, double value) = 0;
+
+    /// Will throw if the set holds no DYNAMIC_PROPERTY_GRADING_PRIMARY value.
+    virtual const GradingPrimary & getGradingPrimary() const = 0;
+    /// The value is validated by the apply call, using the style of the processed op.
+    virtual void setGradingPrimary(const GradingPrimary & value) = 0;
+
+    /// Will throw if the set holds no DYNAMIC_PROPERTY_GRADING_RGBCURVE value.
+    virtual const ConstGradingRGBCurveRcPtr & getGradingRGBCurve() const = 0;
+    /// Will throw if value is null.
+    virtual void setGradingRGBCurve(const ConstGradingRGBCurveRcPtr & value) = 0;
+
+    /// Will throw if the set holds no DYNAMIC_PROPERTY_GRADING_TONE value.
+    virtual const GradingTone & getGradingTone() const = 0;
+    /// Will throw if value is not valid.
+    virtual void setGradingTone(const GradingTone & value) = 0;
+
+    DynamicPropertyValues(const DynamicPropertyValues &) = delete;
+    DynamicPropertyValues & operator=(const DynamicPropertyValues &) = delete;
+    /// Do not use (needed only for pybind11).
+    virtual ~DynamicPropertyValues() = default;
+
+protected:
+    DynamicPropertyValues() = default;
+};
+
 
 /**
  * \brief Represents exponent transform: pow( clamp(color), value ).
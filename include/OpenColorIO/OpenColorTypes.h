@@ -167,6 +167,10 @@ class OCIOEXPORT DynamicPropertyGradingTone;
 typedef OCIO_SHARED_PTR<const DynamicPropertyGradingTone> ConstDynamicPropertyGradingToneRcPtr;
 typedef OCIO_SHARED_PTR<DynamicPropertyGradingTone> DynamicPropertyGradingToneRcPtr;
 
+class OCIOEXPORT DynamicPropertyValues;
+typedef OCIO_SHARED_PTR<const DynamicPropertyValues> ConstDynamicPropertyValuesRcPtr;
+typedef OCIO_SHARED_PTR<DynamicPropertyValues> DynamicPropertyValuesRcPtr;
+
 class OCIOEXPORT ExponentTransform;
 typedef OCIO_SHARED_PTR<const ExponentTransform> ConstExponentTransformRcPtr;
 typedef OCIO_SHARED_PTR<ExponentTransform> ExponentTransformRcPtr;
@@ -629,6 +633,21 @@ enum OptimizationFlags : unsigned long
      */
     OPTIMIZATION_NO_DYNAMIC_PROPERTIES           = 0x10000000,
 
+    /**
+     * For CPU processor, store the Lut1D and Lut3D values as half floats (i.e. less memory but
+     * less accurate).  The relative error of each LUT entry is at most 2^-11 and the values are
+     * clamped to the half float range.  Note that only the forward LUTs are impacted.
+     */
+    OPTIMIZATION_COMPACT_LUTS                    = 0x20000000,
+
+    /**
+     * For CPU processor, use the SSE2, AVX2 and AVX-512 versions of the ACES 2 output transform,
+     * RGB to JMh and tonescale compression fixed functions (i.e. faster but less accurate).  They
+     * rely on approximated pow, atan2 and sincos so the results differ from the scalar ones by up
+     * to 2e-3 (i.e. absolute error below one and relative error above).
+     */
+    OPTIMIZATION_FAST_ACES2                      = 0x40000000,
+
     /// Apply all possible optimizations.
     OPTIMIZATION_ALL                             = 0xFFFFFFFF,
 
@@ -785,6 +804,13 @@ extern OCIOEXPORT const char * OCIO_OPTIMIZATION_FLAGS_ENVVAR;
  */
 extern OCIOEXPORT const char * OCIO_USER_CATEGORIES_ENVVAR;
 
+/**
+ * The envvar 'OCIO_LAZY_CONFIG_LOADING' enables the lazy loading of the configs when set to a
+ * non-zero value i.e. the transforms of the config elements are only created on their first
+ * access. See \ref SetLazyConfigLoading.
+ */
+extern OCIOEXPORT const char * OCIO_LAZY_CONFIG_LOADING_ENVVAR;
+
 // TODO: Move to .rst
 /*!rst::
 Roles
@@ -948,6 +974,20 @@ extern OCIOEXPORT const char * OCIO_DISABLE_PROCESSOR_CACHES;
 // variable to disable the fallback.
 extern OCIOEXPORT const char * OCIO_DISABLE_CACHE_FALLBACK;
 
+//!rst::
+// .. c:var:: const char * OCIO_FILE_CACHE_CAPACITY
+//
+// The maximum number of files kept in the FileTransform cache. The least recently used files are
+// evicted when the cache is full. By default, the cache is unbounded.
+extern OCIOEXPORT const char * OCIO_FILE_CACHE_CAPACITY;
+
+//!rst::
+// .. c:var:: const char * OCIO_FILE_CACHE_VALIDATION_INTERVAL
+//
+// The interval in milliseconds between two checks for modifications of a file of the
+// FileTransform cache (i.e. zero checks on each access). By default, the files are not checked.
+extern OCIOEXPORT const char * OCIO_FILE_CACHE_VALIDATION_INTERVAL;
+
 
 // Archive config feature
 // Default filename (with extension) of an config.
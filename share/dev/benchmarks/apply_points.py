@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright Contributors to the OpenColorIO Project.
+#
+# This script compares the processing of a set of independent RGB points (e.g. color pickers,
+# gamut hull vertices, plot samples) by calling CPUProcessor.applyRGB once per point, against a
+# single call of CPUProcessor.applyRGBPoints on the packed NumPy array.
+#
+# Usage: python apply_points.py [num_points] [config]
+#
+import sys
+import time
+
+import numpy as np
+import PyOpenColorIO as OCIO
+
+num_points = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+config_name = sys.argv[2] if len(sys.argv) > 2 else 'ocio://studio-config-latest'
+
+config = OCIO.Config.CreateFromFile(config_name)
+src = config.getColorSpace(OCIO.ROLE_SCENE_LINEAR).getName()
+display = config.getDefaultDisplay()
+view = config.getDefaultView(display)
+
+proc = config.getProcessor(src, display, view, OCIO.TRANSFORM_DIR_FORWARD)
+cpu_proc = proc.getDefaultCPUProcessor()
+
+points = np.random.default_rng(0).random((num_points, 3), dtype=np.float32)
+
+ref = points.copy()
+start = time.perf_counter()
+for point in ref:
+    cpu_proc.applyRGB(point)
+per_point = time.perf_counter() - start
+
+res = points.copy()
+start = time.perf_counter()
+cpu_proc.applyRGBPoints(res)
+batched = time.perf_counter() - start
+
+print('Processing %d points from "%s" to "%s - %s":' % (num_points, src, display, view))
+print('    applyRGB per point: %.3f ms (%.1f ns/point)'
+      % (per_point * 1e3, per_point * 1e9 / num_points))
+print('    applyRGBPoints:     %.3f ms (%.1f ns/point)'
+      % (batched * 1e3, batched * 1e9 / num_points))
+print('    speedup:            %.1fx' % (per_point / batched))
+print('    max difference:     %g' % np.abs(ref - res).max())
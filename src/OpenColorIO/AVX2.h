@@ -10,6 +10,8 @@
 
 #include <immintrin.h>
 
+#include <limits>
+
 #include <OpenColorIO/OpenColorIO.h>
 #include "BitDepthUtils.h"
 
@@ -299,6 +301,278 @@ struct AVX2RGBAPack<BIT_DEPTH_F32>
     }
 };
 
+// The following functions are the AVX2 versions of the SSE2 approximations from SSE.h (refer
+// to the SSE2 versions for the algorithm explanations) and have the same accuracy. Note that
+// the constants are local to the functions so that no AVX2 instructions are executed when
+// initializing the library on a CPU without AVX2.
+
+// log2 function in AVX2 (refer to sseLog2).
+inline __m256 avx2Log2(__m256 x)
+{
+    const __m256i emask = _mm256_set1_epi32(0x7F800000);
+    const __m256i ebias = _mm256_set1_epi32(127);
+
+    // Coefficients of Chebyshev (minimax) degree 5 polynomial
+    // approximation to log2() over the range [1.0, 2.0[.
+    const __m256 pnlog5 = _mm256_set1_ps((float)+4.487361286440374006195e-2);
+    const __m256 pnlog4 = _mm256_set1_ps((float)-4.165637071209677112635e-1);
+    const __m256 pnlog3 = _mm256_set1_ps((float)+1.631148826119436277100);
+    const __m256 pnlog2 = _mm256_set1_ps((float)-3.550793018041176193407);
+    const __m256 pnlog1 = _mm256_set1_ps((float)+5.091710879305474367557);
+    const __m256 pnlog0 = _mm256_set1_ps((float)-2.800364054395965731506);
+
+    const __m256 mantissa
+        = _mm256_or_ps(_mm256_andnot_ps(_mm256_castsi256_ps(emask), x), _mm256_set1_ps(1.0f));
+
+    __m256 log2 = _mm256_fmadd_ps(pnlog5, mantissa, pnlog4);
+    log2 = _mm256_fmadd_ps(log2, mantissa, pnlog3);
+    log2 = _mm256_fmadd_ps(log2, mantissa, pnlog2);
+    log2 = _mm256_fmadd_ps(log2, mantissa, pnlog1);
+    log2 = _mm256_fmadd_ps(log2, mantissa, pnlog0);
+
+    const __m256i exponent
+        = _mm256_sub_epi32(_mm256_srli_epi32(_mm256_and_si256(_mm256_castps_si256(x), emask), 23),
+                           ebias);
+
+    return _mm256_add_ps(log2, _mm256_cvtepi32_ps(exponent));
+}
+
+// exp2 function in AVX2 (refer to sseExp2).
+inline __m256 avx2Exp2(__m256 x)
+{
+    // Coefficients of Chebyshev (minimax) degree 4 polynomial
+    // approximation to exp2() over the range [0.0, 1.0[.
+    const __m256 pnexp4 = _mm256_set1_ps((float)1.353416792833547468620e-2);
+    const __m256 pnexp3 = _mm256_set1_ps((float)5.201146058412685018921e-2);
+    const __m256 pnexp2 = _mm256_set1_ps((float)2.414427569091865207710e-1);
+    const __m256 pnexp1 = _mm256_set1_ps((float)6.930038344665415134202e-1);
+    const __m256 pnexp0 = _mm256_set1_ps((float)1.000002593370603213644);
+
+    const __m256 floor_x = _mm256_floor_ps(x);
+
+    // Compute exp2(floor_x) by moving floor_x to the exponent bits of the floating-point number.
+    // Out of range values are handled by the checks at the bottom.
+    const __m256 zf
+        = _mm256_castsi256_ps(_mm256_slli_epi32(_mm256_add_epi32(_mm256_cvttps_epi32(floor_x),
+                                                                 _mm256_set1_epi32(127)),
+                                                23));
+
+    const __m256 fraction = _mm256_sub_ps(x, floor_x);
+
+    __m256 mexp = _mm256_fmadd_ps(pnexp4, fraction, pnexp3);
+    mexp = _mm256_fmadd_ps(mexp, fraction, pnexp2);
+    mexp = _mm256_fmadd_ps(mexp, fraction, pnexp1);
+    mexp = _mm256_fmadd_ps(mexp, fraction, pnexp0);
+
+    __m256 exp2 = _mm256_mul_ps(zf, mexp);
+
+    // Handle underflow.
+    exp2 = _mm256_andnot_ps(_mm256_cmp_ps(x, _mm256_set1_ps(-126.0f), _CMP_LT_OQ), exp2);
+
+    // Handle overflow.
+    exp2 = _mm256_blendv_ps(exp2,
+                            _mm256_set1_ps(std::numeric_limits<float>::infinity()),
+                            _mm256_cmp_ps(x, _mm256_set1_ps(128.0f), _CMP_GE_OQ));
+
+    return exp2;
+}
+
+// Power function in AVX2 (refer to ssePower). Results from base values smaller than zero are
+// mapped to zero.
+inline __m256 avx2Power(__m256 x, __m256 exp)
+{
+    const __m256 values = avx2Exp2(_mm256_mul_ps(exp, avx2Log2(x)));
+
+    // Handle values where base is smaller or equal than zero.
+    return _mm256_and_ps(values, _mm256_cmp_ps(x, _mm256_setzero_ps(), _CMP_GT_OQ));
+}
+
+// Arc tangent function in AVX2 (refer to sseAtan).
+inline __m256 avx2Atan(__m256 x)
+{
+    // Rational polynomial coefficients for the arc tangent approximation.
+    // Original source: http://www.ganssle.com/approx/approx.pdf
+    const __m256 pn_atan_a1 = _mm256_set1_ps((float) 48.70107004404898384);
+    const __m256 pn_atan_a2 = _mm256_set1_ps((float) 49.5326263772254345);
+    const __m256 pn_atan_a3 = _mm256_set1_ps((float)  9.40604244231624);
+    const __m256 pn_atan_b1 = _mm256_set1_ps((float) 48.70107004404996166);
+    const __m256 pn_atan_b2 = _mm256_set1_ps((float) 65.7663163908956299);
+    const __m256 pn_atan_b3 = _mm256_set1_ps((float) 21.587934067020262);
+
+    const __m256 one       = _mm256_set1_ps(1.0f);
+    const __m256 sign_mask = _mm256_castsi256_ps(_mm256_set1_epi32(0x80000000));
+
+    // Apply identity atan(x) = -atan(-x) to reduce domain to [0, Inf).
+    const __m256 sign_x = _mm256_and_ps(x, sign_mask);
+    const __m256 abs_x  = _mm256_andnot_ps(sign_mask, x);
+
+    // Apply identity atan(x) = PI/2 - atan(1/x) to reduce domain to [0,1].
+    const __m256 inv_mask = _mm256_cmp_ps(abs_x, one, _CMP_GT_OQ);
+    const __m256 norm_x   = _mm256_blendv_ps(abs_x, _mm256_div_ps(one, abs_x), inv_mask);
+
+    const __m256 norm_x2 = _mm256_mul_ps(norm_x, norm_x);
+
+    __m256 num = _mm256_fmadd_ps(norm_x2, pn_atan_a3, pn_atan_a2);
+    num = _mm256_fmadd_ps(num, norm_x2, pn_atan_a1);
+    num = _mm256_mul_ps(num, norm_x);
+
+    __m256 denom = _mm256_add_ps(norm_x2, pn_atan_b3);
+    denom = _mm256_fmadd_ps(denom, norm_x2, pn_atan_b2);
+    denom = _mm256_fmadd_ps(denom, norm_x2, pn_atan_b1);
+
+    __m256 res = _mm256_div_ps(num, denom);
+
+    // Correct the result of the domain reductions.
+    res = _mm256_blendv_ps(res,
+                           _mm256_sub_ps(_mm256_set1_ps((float) 1.57079632679489661923), res),
+                           inv_mask);
+
+    return _mm256_or_ps(sign_x, res);
+}
+
+// Arc tangent function of two variables in AVX2 (refer to sseAtan2).
+inline __m256 avx2Atan2(__m256 y, __m256 x)
+{
+    const __m256 zero = _mm256_setzero_ps();
+
+    __m256 res = avx2Atan(_mm256_div_ps(y, x));
+
+    // Fix for x=0 and y=0.
+    res = _mm256_and_ps(res, _mm256_or_ps(_mm256_cmp_ps(x, zero, _CMP_NEQ_UQ),
+                                          _mm256_cmp_ps(y, zero, _CMP_NEQ_UQ)));
+
+    // Adjust quadrants 2 and 3 based on the sign of the arguments.
+    const __m256 neg_x  = _mm256_castsi256_ps(_mm256_srai_epi32(_mm256_castps_si256(x), 31));
+    const __m256 sign_y = _mm256_and_ps(y, _mm256_castsi256_ps(_mm256_set1_epi32(0x80000000)));
+    const __m256 pi     = _mm256_set1_ps((float) 3.14159265358979323846);
+
+    return _mm256_add_ps(res, _mm256_and_ps(_mm256_or_ps(sign_y, pi), neg_x));
+}
+
+// Sine and cosine function in AVX2 (refer to sseSinCos).
+inline void avx2SinCos(__m256 x, __m256 & sin_x, __m256 & cos_x)
+{
+    // Chebyshev polynomial coefficients for the cosine approximation.
+    // Original source: http://www.ganssle.com/approx/approx.pdf
+    const __m256 pn_cos_c1 = _mm256_set1_ps((float)  0.999999953464);
+    const __m256 pn_cos_c2 = _mm256_set1_ps((float)-0.499999053455);
+    const __m256 pn_cos_c3 = _mm256_set1_ps((float)  0.0416635846769);
+    const __m256 pn_cos_c4 = _mm256_set1_ps((float)-0.0013853704264);
+    const __m256 pn_cos_c5 = _mm256_set1_ps((float)  0.00002315393167);
+
+    // Reduce to [-pi/2, pi/2].
+    const __m256i cycles
+        = _mm256_cvtps_epi32(_mm256_mul_ps(x,
+                                           _mm256_set1_ps((float) 0.31830988618379067153776752674503)));
+
+    const __m256 xr  = _mm256_fnmadd_ps(_mm256_cvtepi32_ps(cycles),
+                                        _mm256_set1_ps((float) 3.14159265358979323846),
+                                        x);
+    const __m256 xr2 = _mm256_mul_ps(xr, xr);
+
+    cos_x = _mm256_fmadd_ps(pn_cos_c5, xr2, pn_cos_c4);
+    cos_x = _mm256_fmadd_ps(cos_x, xr2, pn_cos_c3);
+    cos_x = _mm256_fmadd_ps(cos_x, xr2, pn_cos_c2);
+    cos_x = _mm256_fmadd_ps(cos_x, xr2, pn_cos_c1);
+
+    // If cycles is odd, then the angle is in either quadrant 2 or 3.
+    const __m256 flip_sign_cos_x = _mm256_castsi256_ps(_mm256_slli_epi32(cycles, 31));
+    cos_x = _mm256_xor_ps(cos_x, flip_sign_cos_x);
+
+    // When cos(x) becomes too close to 1, use xr to approximate sin(x) instead.
+    __m256 sin_x2 = _mm256_fnmadd_ps(cos_x, cos_x, _mm256_set1_ps(1.0f));
+    sin_x2 = _mm256_blendv_ps(xr2,
+                              sin_x2,
+                              _mm256_cmp_ps(xr2, _mm256_set1_ps((float) 0.00006103515625), _CMP_GT_OQ));
+    sin_x = _mm256_sqrt_ps(sin_x2);
+
+    // Flip the sign of sin(x) if the angle was in quadrants 3 or 4.
+    const __m256 xr_sign = _mm256_and_ps(xr, _mm256_castsi256_ps(_mm256_set1_epi32(0x80000000)));
+    sin_x = _mm256_xor_ps(sin_x, _mm256_xor_ps(flip_sign_cos_x, xr_sign));
+}
+
+// Convert the half floats stored in the low 16 bits of the 32-bit lanes (i.e. the high bits are
+// ignored) to float. Note that the half float infinities & NaNs are not supported.
+inline __m256 avx2HalfToFloat(__m256i h)
+{
+    // Move the exponent & mantissa bits to their float positions, then fix the exponent bias by
+    // multiplying with 2^112 (which also normalizes the half float denormals).
+    const __m256i mag  = _mm256_and_si256(_mm256_slli_epi32(h, 13), _mm256_set1_epi32(0x0FFFE000));
+    const __m256i sign = _mm256_and_si256(_mm256_slli_epi32(h, 16), _mm256_set1_epi32(0x80000000));
+
+    const __m256 res = _mm256_mul_ps(_mm256_castsi256_ps(mag),
+                                     _mm256_castsi256_ps(_mm256_set1_epi32(0x77800000)));
+    return _mm256_or_ps(res, _mm256_castsi256_ps(sign));
+}
+
+// Arithmetic of one AVX2 register holding N float values, used by the templated SIMD
+// kernels (e.g. refer to ops/fixedfunction/ACES2/TransformSIMD.h) to share the same code
+// between the SSE2, AVX2 and AVX-512 versions. The load & store methods (un)pack N RGBA
+// pixels from/to four registers.
+struct VecAVX2
+{
+    typedef __m256 vec;
+    typedef __m256 mask;
+
+    static constexpr int N = 8;
+
+    static inline vec set1(float v) { return _mm256_set1_ps(v); }
+    static inline vec load(const float * in) { return _mm256_load_ps(in); }
+    static inline void store(float * out, vec v) { _mm256_store_ps(out, v); }
+
+    static inline void loadRGBA(const float * in, vec & r, vec & g, vec & b, vec & a)
+    {
+        AVX2RGBAPack<BIT_DEPTH_F32>::Load(in, r, g, b, a);
+    }
+
+    static inline void storeRGBA(float * out, vec r, vec g, vec b, vec a)
+    {
+        AVX2RGBAPack<BIT_DEPTH_F32>::Store(out, r, g, b, a);
+    }
+
+    static inline vec add(vec a, vec b) { return _mm256_add_ps(a, b); }
+    static inline vec sub(vec a, vec b) { return _mm256_sub_ps(a, b); }
+    static inline vec mul(vec a, vec b) { return _mm256_mul_ps(a, b); }
+    static inline vec div(vec a, vec b) { return _mm256_div_ps(a, b); }
+    static inline vec min(vec a, vec b) { return _mm256_min_ps(a, b); }
+    static inline vec max(vec a, vec b) { return _mm256_max_ps(a, b); }
+    static inline vec sqrt(vec a) { return _mm256_sqrt_ps(a); }
+
+    static inline vec abs(vec a)
+    {
+        return _mm256_andnot_ps(_mm256_castsi256_ps(_mm256_set1_epi32(0x80000000)), a);
+    }
+
+    // Magnitude of 'a' with the sign of 'b'.
+    static inline vec copysign(vec a, vec b)
+    {
+        const __m256 sign_mask = _mm256_castsi256_ps(_mm256_set1_epi32(0x80000000));
+        return _mm256_or_ps(_mm256_andnot_ps(sign_mask, a), _mm256_and_ps(sign_mask, b));
+    }
+
+    static inline mask less(vec a, vec b) { return _mm256_cmp_ps(a, b, _CMP_LT_OQ); }
+    static inline mask greater(vec a, vec b) { return _mm256_cmp_ps(a, b, _CMP_GT_OQ); }
+    static inline vec select(mask m, vec t, vec f) { return _mm256_blendv_ps(f, t, m); }
+
+    static inline vec trunc(vec a) { return _mm256_round_ps(a, _MM_FROUND_TO_ZERO | _MM_FROUND_NO_EXC); }
+
+    // Load the half floats at the 'idx' positions (i.e. integer values) of 'base' as floats.
+    // Refer to avx2HalfToFloat() for the limitations. Note that the 32-bit gather also reads the
+    // next half float so 'base' needs one extra element.
+    static inline vec gatherHalf(const uint16_t * base, vec idx)
+    {
+        const __m256i h = _mm256_i32gather_epi32(reinterpret_cast<const int *>(base),
+                                                 _mm256_cvttps_epi32(idx), 2);
+        return avx2HalfToFloat(h);
+    }
+
+    static inline vec log2(vec x) { return avx2Log2(x); }
+    static inline vec exp2(vec x) { return avx2Exp2(x); }
+    static inline vec pow(vec x, vec exp) { return avx2Power(x, exp); }
+    static inline vec atan2(vec y, vec x) { return avx2Atan2(y, x); }
+    static inline void sincos(vec x, vec & sin_x, vec & cos_x) { avx2SinCos(x, sin_x, cos_x); }
+};
+
 } // namespace OCIO_NAMESPACE
 
 #endif // OCIO_USE_AVX2
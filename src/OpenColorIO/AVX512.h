@@ -10,6 +10,8 @@
 
 #include <immintrin.h>
 
+#include <limits>
+
 #include <OpenColorIO/OpenColorIO.h>
 #include "BitDepthUtils.h"
 
@@ -460,6 +462,297 @@ struct AVX512RGBAPack<BIT_DEPTH_F32>
     }
 };
 
+// The following functions are the AVX-512 versions of the SSE2 approximations from SSE.h (refer
+// to the SSE2 versions for the algorithm explanations) and have the same accuracy. Note that
+// only AVX-512F instructions are used (i.e. the bitwise operations on floats are done with
+// the integer instructions) and that the constants are local to the functions so that no
+// AVX-512 instructions are executed when initializing the library on a CPU without AVX-512.
+
+inline __m512 avx512_and_ps(__m512 a, __m512 b)
+{
+    return _mm512_castsi512_ps(_mm512_and_epi32(_mm512_castps_si512(a), _mm512_castps_si512(b)));
+}
+
+inline __m512 avx512_or_ps(__m512 a, __m512 b)
+{
+    return _mm512_castsi512_ps(_mm512_or_epi32(_mm512_castps_si512(a), _mm512_castps_si512(b)));
+}
+
+inline __m512 avx512_xor_ps(__m512 a, __m512 b)
+{
+    return _mm512_castsi512_ps(_mm512_xor_epi32(_mm512_castps_si512(a), _mm512_castps_si512(b)));
+}
+
+// log2 function in AVX-512 (refer to sseLog2).
+inline __m512 avx512Log2(__m512 x)
+{
+    const __m512i emask = _mm512_set1_epi32(0x7F800000);
+    const __m512i ebias = _mm512_set1_epi32(127);
+
+    // Coefficients of Chebyshev (minimax) degree 5 polynomial
+    // approximation to log2() over the range [1.0, 2.0[.
+    const __m512 pnlog5 = _mm512_set1_ps((float)+4.487361286440374006195e-2);
+    const __m512 pnlog4 = _mm512_set1_ps((float)-4.165637071209677112635e-1);
+    const __m512 pnlog3 = _mm512_set1_ps((float)+1.631148826119436277100);
+    const __m512 pnlog2 = _mm512_set1_ps((float)-3.550793018041176193407);
+    const __m512 pnlog1 = _mm512_set1_ps((float)+5.091710879305474367557);
+    const __m512 pnlog0 = _mm512_set1_ps((float)-2.800364054395965731506);
+
+    const __m512 mantissa
+        = _mm512_castsi512_ps(_mm512_or_epi32(_mm512_andnot_epi32(emask, _mm512_castps_si512(x)),
+                                              _mm512_castps_si512(_mm512_set1_ps(1.0f))));
+
+    __m512 log2 = _mm512_fmadd_ps(pnlog5, mantissa, pnlog4);
+    log2 = _mm512_fmadd_ps(log2, mantissa, pnlog3);
+    log2 = _mm512_fmadd_ps(log2, mantissa, pnlog2);
+    log2 = _mm512_fmadd_ps(log2, mantissa, pnlog1);
+    log2 = _mm512_fmadd_ps(log2, mantissa, pnlog0);
+
+    const __m512i exponent
+        = _mm512_sub_epi32(_mm512_srli_epi32(_mm512_and_epi32(_mm512_castps_si512(x), emask), 23),
+                           ebias);
+
+    return _mm512_add_ps(log2, _mm512_cvtepi32_ps(exponent));
+}
+
+// exp2 function in AVX-512 (refer to sseExp2).
+inline __m512 avx512Exp2(__m512 x)
+{
+    // Coefficients of Chebyshev (minimax) degree 4 polynomial
+    // approximation to exp2() over the range [0.0, 1.0[.
+    const __m512 pnexp4 = _mm512_set1_ps((float)1.353416792833547468620e-2);
+    const __m512 pnexp3 = _mm512_set1_ps((float)5.201146058412685018921e-2);
+    const __m512 pnexp2 = _mm512_set1_ps((float)2.414427569091865207710e-1);
+    const __m512 pnexp1 = _mm512_set1_ps((float)6.930038344665415134202e-1);
+    const __m512 pnexp0 = _mm512_set1_ps((float)1.000002593370603213644);
+
+    const __m512 floor_x = _mm512_roundscale_ps(x, _MM_FROUND_TO_NEG_INF | _MM_FROUND_NO_EXC);
+
+    // Compute exp2(floor_x) by moving floor_x to the exponent bits of the floating-point number.
+    // Out of range values are handled by the checks at the bottom.
+    const __m512 zf
+        = _mm512_castsi512_ps(_mm512_slli_epi32(_mm512_add_epi32(_mm512_cvttps_epi32(floor_x),
+                                                                 _mm512_set1_epi32(127)),
+                                                23));
+
+    const __m512 fraction = _mm512_sub_ps(x, floor_x);
+
+    __m512 mexp = _mm512_fmadd_ps(pnexp4, fraction, pnexp3);
+    mexp = _mm512_fmadd_ps(mexp, fraction, pnexp2);
+    mexp = _mm512_fmadd_ps(mexp, fraction, pnexp1);
+    mexp = _mm512_fmadd_ps(mexp, fraction, pnexp0);
+
+    __m512 exp2 = _mm512_mul_ps(zf, mexp);
+
+    // Handle underflow.
+    exp2 = _mm512_maskz_mov_ps(_mm512_cmp_ps_mask(x, _mm512_set1_ps(-126.0f), _CMP_NLT_UQ), exp2);
+
+    // Handle overflow.
+    exp2 = _mm512_mask_blend_ps(_mm512_cmp_ps_mask(x, _mm512_set1_ps(128.0f), _CMP_GE_OQ),
+                                exp2,
+                                _mm512_set1_ps(std::numeric_limits<float>::infinity()));
+
+    return exp2;
+}
+
+// Power function in AVX-512 (refer to ssePower). Results from base values smaller than zero
+// are mapped to zero.
+inline __m512 avx512Power(__m512 x, __m512 exp)
+{
+    const __m512 values = avx512Exp2(_mm512_mul_ps(exp, avx512Log2(x)));
+
+    // Handle values where base is smaller or equal than zero.
+    return _mm512_maskz_mov_ps(_mm512_cmp_ps_mask(x, _mm512_setzero_ps(), _CMP_GT_OQ), values);
+}
+
+// Arc tangent function in AVX-512 (refer to sseAtan).
+inline __m512 avx512Atan(__m512 x)
+{
+    // Rational polynomial coefficients for the arc tangent approximation.
+    // Original source: http://www.ganssle.com/approx/approx.pdf
+    const __m512 pn_atan_a1 = _mm512_set1_ps((float) 48.70107004404898384);
+    const __m512 pn_atan_a2 = _mm512_set1_ps((float) 49.5326263772254345);
+    const __m512 pn_atan_a3 = _mm512_set1_ps((float)  9.40604244231624);
+    const __m512 pn_atan_b1 = _mm512_set1_ps((float) 48.70107004404996166);
+    const __m512 pn_atan_b2 = _mm512_set1_ps((float) 65.7663163908956299);
+    const __m512 pn_atan_b3 = _mm512_set1_ps((float) 21.587934067020262);
+
+    const __m512 one       = _mm512_set1_ps(1.0f);
+    const __m512 sign_mask = _mm512_castsi512_ps(_mm512_set1_epi32(0x80000000));
+
+    // Apply identity atan(x) = -atan(-x) to reduce domain to [0, Inf).
+    const __m512 sign_x = avx512_and_ps(x, sign_mask);
+    const __m512 abs_x  = avx512_xor_ps(x, sign_x);
+
+    // Apply identity atan(x) = PI/2 - atan(1/x) to reduce domain to [0,1].
+    const __mmask16 inv_mask = _mm512_cmp_ps_mask(abs_x, one, _CMP_GT_OQ);
+    const __m512 norm_x      = _mm512_mask_blend_ps(inv_mask, abs_x, _mm512_div_ps(one, abs_x));
+
+    const __m512 norm_x2 = _mm512_mul_ps(norm_x, norm_x);
+
+    __m512 num = _mm512_fmadd_ps(norm_x2, pn_atan_a3, pn_atan_a2);
+    num = _mm512_fmadd_ps(num, norm_x2, pn_atan_a1);
+    num = _mm512_mul_ps(num, norm_x);
+
+    __m512 denom = _mm512_add_ps(norm_x2, pn_atan_b3);
+    denom = _mm512_fmadd_ps(denom, norm_x2, pn_atan_b2);
+    denom = _mm512_fmadd_ps(denom, norm_x2, pn_atan_b1);
+
+    __m512 res = _mm512_div_ps(num, denom);
+
+    // Correct the result of the domain reductions.
+    res = _mm512_mask_blend_ps(inv_mask,
+                               res,
+                               _mm512_sub_ps(_mm512_set1_ps((float) 1.57079632679489661923), res));
+
+    return avx512_or_ps(sign_x, res);
+}
+
+// Arc tangent function of two variables in AVX-512 (refer to sseAtan2).
+inline __m512 avx512Atan2(__m512 y, __m512 x)
+{
+    const __m512 zero = _mm512_setzero_ps();
+
+    __m512 res = avx512Atan(_mm512_div_ps(y, x));
+
+    // Fix for x=0 and y=0.
+    res = _mm512_maskz_mov_ps(_mm512_cmp_ps_mask(x, zero, _CMP_NEQ_UQ)
+                                | _mm512_cmp_ps_mask(y, zero, _CMP_NEQ_UQ),
+                              res);
+
+    // Adjust quadrants 2 and 3 based on the sign of the arguments.
+    const __m512 neg_x  = _mm512_castsi512_ps(_mm512_srai_epi32(_mm512_castps_si512(x), 31));
+    const __m512 sign_y = avx512_and_ps(y, _mm512_castsi512_ps(_mm512_set1_epi32(0x80000000)));
+    const __m512 pi     = _mm512_set1_ps((float) 3.14159265358979323846);
+
+    return _mm512_add_ps(res, avx512_and_ps(avx512_or_ps(sign_y, pi), neg_x));
+}
+
+// Sine and cosine function in AVX-512 (refer to sseSinCos).
+inline void avx512SinCos(__m512 x, __m512 & sin_x, __m512 & cos_x)
+{
+    // Chebyshev polynomial coefficients for the cosine approximation.
+    // Original source: http://www.ganssle.com/approx/approx.pdf
+    const __m512 pn_cos_c1 = _mm512_set1_ps((float)  0.999999953464);
+    const __m512 pn_cos_c2 = _mm512_set1_ps((float)-0.499999053455);
+    const __m512 pn_cos_c3 = _mm512_set1_ps((float)  0.0416635846769);
+    const __m512 pn_cos_c4 = _mm512_set1_ps((float)-0.0013853704264);
+    const __m512 pn_cos_c5 = _mm512_set1_ps((float)  0.00002315393167);
+
+    // Reduce to [-pi/2, pi/2].
+    const __m512i cycles
+        = _mm512_cvtps_epi32(_mm512_mul_ps(x,
+                                           _mm512_set1_ps((float) 0.31830988618379067153776752674503)));
+
+    const __m512 xr  = _mm512_fnmadd_ps(_mm512_cvtepi32_ps(cycles),
+                                        _mm512_set1_ps((float) 3.14159265358979323846),
+                                        x);
+    const __m512 xr2 = _mm512_mul_ps(xr, xr);
+
+    cos_x = _mm512_fmadd_ps(pn_cos_c5, xr2, pn_cos_c4);
+    cos_x = _mm512_fmadd_ps(cos_x, xr2, pn_cos_c3);
+    cos_x = _mm512_fmadd_ps(cos_x, xr2, pn_cos_c2);
+    cos_x = _mm512_fmadd_ps(cos_x, xr2, pn_cos_c1);
+
+    // If cycles is odd, then the angle is in either quadrant 2 or 3.
+    const __m512 flip_sign_cos_x = _mm512_castsi512_ps(_mm512_slli_epi32(cycles, 31));
+    cos_x = avx512_xor_ps(cos_x, flip_sign_cos_x);
+
+    // When cos(x) becomes too close to 1, use xr to approximate sin(x) instead.
+    __m512 sin_x2 = _mm512_fnmadd_ps(cos_x, cos_x, _mm512_set1_ps(1.0f));
+    sin_x2 = _mm512_mask_blend_ps(_mm512_cmp_ps_mask(xr2, _mm512_set1_ps((float) 0.00006103515625), _CMP_GT_OQ),
+                                  xr2,
+                                  sin_x2);
+    sin_x = _mm512_sqrt_ps(sin_x2);
+
+    // Flip the sign of sin(x) if the angle was in quadrants 3 or 4.
+    const __m512 xr_sign = avx512_and_ps(xr, _mm512_castsi512_ps(_mm512_set1_epi32(0x80000000)));
+    sin_x = avx512_xor_ps(sin_x, avx512_xor_ps(flip_sign_cos_x, xr_sign));
+}
+
+// Convert the half floats stored in the low 16 bits of the 32-bit lanes (i.e. the high bits are
+// ignored) to float. Note that the half float infinities & NaNs are not supported.
+inline __m512 avx512HalfToFloat(__m512i h)
+{
+    // Move the exponent & mantissa bits to their float positions, then fix the exponent bias by
+    // multiplying with 2^112 (which also normalizes the half float denormals).
+    const __m512i mag  = _mm512_and_si512(_mm512_slli_epi32(h, 13), _mm512_set1_epi32(0x0FFFE000));
+    const __m512i sign = _mm512_and_si512(_mm512_slli_epi32(h, 16), _mm512_set1_epi32(0x80000000));
+
+    const __m512 res = _mm512_mul_ps(_mm512_castsi512_ps(mag),
+                                     _mm512_castsi512_ps(_mm512_set1_epi32(0x77800000)));
+    return avx512_or_ps(res, _mm512_castsi512_ps(sign));
+}
+
+// Arithmetic of one AVX-512 register holding N float values, used by the templated SIMD
+// kernels (e.g. refer to ops/fixedfunction/ACES2/TransformSIMD.h) to share the same code
+// between the SSE2, AVX2 and AVX-512 versions. The load & store methods (un)pack N RGBA
+// pixels from/to four registers.
+struct VecAVX512
+{
+    typedef __m512 vec;
+    typedef __mmask16 mask;
+
+    static constexpr int N = 16;
+
+    static inline vec set1(float v) { return _mm512_set1_ps(v); }
+    static inline vec load(const float * in) { return _mm512_load_ps(in); }
+    static inline void store(float * out, vec v) { _mm512_store_ps(out, v); }
+
+    static inline void loadRGBA(const float * in, vec & r, vec & g, vec & b, vec & a)
+    {
+        AVX512RGBAPack<BIT_DEPTH_F32>::Load(in, r, g, b, a);
+    }
+
+    static inline void storeRGBA(float * out, vec r, vec g, vec b, vec a)
+    {
+        AVX512RGBAPack<BIT_DEPTH_F32>::Store(out, r, g, b, a);
+    }
+
+    static inline vec add(vec a, vec b) { return _mm512_add_ps(a, b); }
+    static inline vec sub(vec a, vec b) { return _mm512_sub_ps(a, b); }
+    static inline vec mul(vec a, vec b) { return _mm512_mul_ps(a, b); }
+    static inline vec div(vec a, vec b) { return _mm512_div_ps(a, b); }
+    static inline vec min(vec a, vec b) { return _mm512_min_ps(a, b); }
+    static inline vec max(vec a, vec b) { return _mm512_max_ps(a, b); }
+    static inline vec sqrt(vec a) { return _mm512_sqrt_ps(a); }
+
+    static inline vec abs(vec a)
+    {
+        return avx512_and_ps(a, _mm512_castsi512_ps(_mm512_set1_epi32(0x7fffffff)));
+    }
+
+    // Magnitude of 'a' with the sign of 'b'.
+    static inline vec copysign(vec a, vec b)
+    {
+        return _mm512_castsi512_ps(_mm512_ternarylogic_epi32(_mm512_set1_epi32(0x80000000),
+                                                             _mm512_castps_si512(b),
+                                                             _mm512_castps_si512(a),
+                                                             0xCA));
+    }
+
+    static inline mask less(vec a, vec b) { return _mm512_cmp_ps_mask(a, b, _CMP_LT_OQ); }
+    static inline mask greater(vec a, vec b) { return _mm512_cmp_ps_mask(a, b, _CMP_GT_OQ); }
+    static inline vec select(mask m, vec t, vec f) { return _mm512_mask_blend_ps(m, f, t); }
+
+    static inline vec trunc(vec a) { return _mm512_roundscale_ps(a, _MM_FROUND_TO_ZERO | _MM_FROUND_NO_EXC); }
+
+    // Load the half floats at the 'idx' positions (i.e. integer values) of 'base' as floats.
+    // Refer to avx512HalfToFloat() for the limitations. Note that the 32-bit gather also reads
+    // the next half float so 'base' needs one extra element.
+    static inline vec gatherHalf(const uint16_t * base, vec idx)
+    {
+        const __m512i h = _mm512_i32gather_epi32(_mm512_cvttps_epi32(idx), base, 2);
+        return avx512HalfToFloat(h);
+    }
+
+    static inline vec log2(vec x) { return avx512Log2(x); }
+    static inline vec exp2(vec x) { return avx512Exp2(x); }
+    static inline vec pow(vec x, vec exp) { return avx512Power(x, exp); }
+    static inline vec atan2(vec y, vec x) { return avx512Atan2(y, x); }
+    static inline void sincos(vec x, vec & sin_x, vec & cos_x) { avx512SinCos(x, sin_x, cos_x); }
+};
+
 } // namespace OCIO_NAMESPACE
 
 #endif // OCIO_USE_AVX512
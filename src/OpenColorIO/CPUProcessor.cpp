@@ -1,12 +1,18 @@
 // SPDX-License-Identifier: BSD-3-Clause
 // Copyright Contributors to the OpenColorIO Project.
 
+#include <algorithm>
+#include <atomic>
+#include <exception>
 #include <string.h>
+#include <system_error>
+#include <thread>
 
 #include <OpenColorIO/OpenColorIO.h>
 
 #include "BitDepthUtils.h"
 #include "CPUProcessor.h"
+#include "ops/fixedfunction/FixedFunctionOpCPU.h"
 #include "ops/lut1d/Lut1DOpCPU.h"
 #include "ops/lut3d/Lut3DOpCPU.h"
 #include "ops/matrix/MatrixOp.h"
@@ -119,6 +125,38 @@ case in:                                              \
     throw Exception("Unsupported bit-depths");
 }
 
+// Get the CPU op, using the renderers storing the LUT values as half floats and the SIMD
+// versions of the ACES 2 renderers when requested.
+ConstOpCPURcPtr GetCPUOp(const ConstOpRcPtr & op, bool fastLogExpPow, bool compactLuts, bool fastACES2)
+{
+    if (fastACES2)
+    {
+        ConstOpDataRcPtr opData = op->data();
+        if (opData->getType() == OpData::FixedFunctionType)
+        {
+            ConstFixedFunctionOpDataRcPtr func = DynamicPtrCast<const FixedFunctionOpData>(opData);
+            return GetFixedFunctionCPURenderer(func, fastLogExpPow, true);
+        }
+    }
+
+    if (compactLuts)
+    {
+        ConstOpDataRcPtr opData = op->data();
+        if (opData->getType() == OpData::Lut1DType)
+        {
+            ConstLut1DOpDataRcPtr lut = DynamicPtrCast<const Lut1DOpData>(opData);
+            return GetLut1DCompactRenderer(lut);
+        }
+        else if (opData->getType() == OpData::Lut3DType)
+        {
+            ConstLut3DOpDataRcPtr lut = DynamicPtrCast<const Lut3DOpData>(opData);
+            return GetLut3DCompactRenderer(lut);
+        }
+    }
+
+    return op->getCPUOp(fastLogExpPow);
+}
+
 void CreateCPUEngine(const OpRcPtrVec & ops, 
                      BitDepth in, 
                      BitDepth out,
@@ -132,6 +170,8 @@ void CreateCPUEngine(const OpRcPtrVec & ops,
 {
     const size_t maxOps = ops.size();
     const bool fastLogExpPow = HasFlag(oFlags, OPTIMIZATION_FAST_LOG_EXP_POW);
+    const bool compactLuts = HasFlag(oFlags, OPTIMIZATION_COMPACT_LUTS);
+    const bool fastACES2 = HasFlag(oFlags, OPTIMIZATION_FAST_ACES2);
     for(size_t idx=0; idx<maxOps; ++idx)
     {
         ConstOpRcPtr op = ops[idx];
@@ -139,19 +179,20 @@ void CreateCPUEngine(const OpRcPtrVec & ops,
 
         if(idx==0)
         {
-            if(opData->getType()==OpData::Lut1DType)
+            // Note that the lookup renderers are faster & already compact for integer inputs.
+            if(opData->getType()==OpData::Lut1DType && !(compactLuts && in==BIT_DEPTH_F32))
             {
                 ConstLut1DOpDataRcPtr lut = DynamicPtrCast<const Lut1DOpData>(opData);
                 inBitDepthOp = GetLut1DRenderer(lut, in, BIT_DEPTH_F32);
             }
             else if(in==BIT_DEPTH_F32)
             {
-                inBitDepthOp = op->getCPUOp(fastLogExpPow);
+                inBitDepthOp = GetCPUOp(op, fastLogExpPow, compactLuts, fastACES2);
             }
             else
             {
                 inBitDepthOp = CreateGenericBitDepthHelper(in, BIT_DEPTH_F32);
-                cpuOps.push_back(op->getCPUOp(fastLogExpPow));
+                cpuOps.push_back(GetCPUOp(op, fastLogExpPow, compactLuts, fastACES2));
             }
 
             if(maxOps==1)
@@ -161,31 +202,32 @@ void CreateCPUEngine(const OpRcPtrVec & ops,
         }
         else if(idx==(maxOps-1))
         {
-            if(opData->getType()==OpData::Lut1DType)
+            if(opData->getType()==OpData::Lut1DType && !(compactLuts && out==BIT_DEPTH_F32))
             {
                 ConstLut1DOpDataRcPtr lut = DynamicPtrCast<const Lut1DOpData>(opData);
                 outBitDepthOp = GetLut1DRenderer(lut, BIT_DEPTH_F32, out);
             }
             else if(out==BIT_DEPTH_F32)
             {
-                outBitDepthOp = op->getCPUOp(fastLogExpPow);
+                outBitDepthOp = GetCPUOp(op, fastLogExpPow, compactLuts, fastACES2);
             }
             else
             {
                 outBitDepthOp = CreateGenericBitDepthHelper(BIT_DEPTH_F32, out);
-                cpuOps.push_back(op->getCPUOp(fastLogExpPow));
+                cpuOps.push_back(GetCPUOp(op, fastLogExpPow, compactLuts, fastACES2));
             }
         }
         else
         {
-            cpuOps.push_back(op->getCPUOp(fastLogExpPow));
+            cpuOps.push_back(GetCPUOp(op, fastLogExpPow, compactLuts, fastACES2));
         }
     }
 }
 
 
 ScanlineHelper * CreateScanlineHelper(BitDepth in, const ConstOpCPURcPtr & inBitDepthOp,
-                                      BitDepth out, const ConstOpCPURcPtr & outBitDepthOp)
+                                      BitDepth out, const ConstOpCPURcPtr & outBitDepthOp,
+                                      ScratchBufferPool & bufferPool, long chunkSize)
 {
 
 #define ADD_OUT_BIT_DEPTH(in, out)                    \
@@ -193,7 +235,9 @@ case out:                                             \
 {                                                     \
     return new GenericScanlineHelper<BitDepthInfo<in>::Type,                      \
                                      BitDepthInfo<out>::Type>(in, inBitDepthOp,   \
-                                                              out, outBitDepthOp);\
+                                                              out, outBitDepthOp, \
+                                                              bufferPool,         \
+                                                              chunkSize);         \
     break;                                            \
 }
 
@@ -241,12 +285,12 @@ case in:                                              \
 
 bool CPUProcessor::Impl::isDynamic() const noexcept
 {
-    if (m_inBitDepthOp->isDynamic())
+    if (m_ops.m_inBitDepthOp->isDynamic())
     {
         return true;
     }
 
-    for (const auto & op : m_cpuOps)
+    for (const auto & op : m_ops.m_cpuOps)
     {
         if (op->isDynamic())
         {
@@ -254,7 +298,7 @@ bool CPUProcessor::Impl::isDynamic() const noexcept
         }
     }
 
-    if (m_outBitDepthOp->isDynamic())
+    if (m_ops.m_outBitDepthOp->isDynamic())
     {
         return true;
     }
@@ -264,12 +308,12 @@ bool CPUProcessor::Impl::isDynamic() const noexcept
 
 bool CPUProcessor::Impl::hasDynamicProperty(DynamicPropertyType type) const noexcept
 {
-    if (m_inBitDepthOp->hasDynamicProperty(type))
+    if (m_ops.m_inBitDepthOp->hasDynamicProperty(type))
     {
         return true;
     }
 
-    for (const auto & op : m_cpuOps)
+    for (const auto & op : m_ops.m_cpuOps)
     {
         if (op->hasDynamicProperty(type))
         {
@@ -277,7 +321,7 @@ bool CPUProcessor::Impl::hasDynamicProperty(DynamicPropertyType type) const noex
         }
     }
 
-    if (m_outBitDepthOp->hasDynamicProperty(type))
+    if (m_ops.m_outBitDepthOp->hasDynamicProperty(type))
     {
         return true;
     }
@@ -287,12 +331,12 @@ bool CPUProcessor::Impl::hasDynamicProperty(DynamicPropertyType type) const noex
 
 DynamicPropertyRcPtr CPUProcessor::Impl::getDynamicProperty(DynamicPropertyType type) const
 {
-    if (m_inBitDepthOp->hasDynamicProperty(type))
+    if (m_ops.m_inBitDepthOp->hasDynamicProperty(type))
     {
-        return m_inBitDepthOp->getDynamicProperty(type);
+        return m_ops.m_inBitDepthOp->getDynamicProperty(type);
     }
 
-    for (const auto & op : m_cpuOps)
+    for (const auto & op : m_ops.m_cpuOps)
     {
         if (op->hasDynamicProperty(type))
         {
@@ -300,9 +344,9 @@ DynamicPropertyRcPtr CPUProcessor::Impl::getDynamicProperty(DynamicPropertyType
         }
     }
 
-    if (m_outBitDepthOp->hasDynamicProperty(type))
+    if (m_ops.m_outBitDepthOp->hasDynamicProperty(type))
     {
-        return m_outBitDepthOp->getDynamicProperty(type);
+        return m_ops.m_outBitDepthOp->getDynamicProperty(type);
     }
 
     throw Exception("Cannot find dynamic property; not used by CPU processor.");
@@ -360,10 +404,24 @@ void CPUProcessor::Impl::finalize(const OpRcPtrVec & rawOps,
 
     // Get the CPU Ops while taking care of the input and output bit-depths.
 
-    m_cpuOps.clear();
-    m_inBitDepthOp = nullptr;
-    m_outBitDepthOp = nullptr;
-    CreateCPUEngine(ops, in, out, oFlags, m_inBitDepthOp, m_cpuOps, m_outBitDepthOp);
+    m_ops.m_cpuOps.clear();
+    m_ops.m_inBitDepthOp = nullptr;
+    m_ops.m_outBitDepthOp = nullptr;
+    CreateCPUEngine(ops, in, out, oFlags,
+                    m_ops.m_inBitDepthOp, m_ops.m_cpuOps, m_ops.m_outBitDepthOp);
+
+    // Keep the dynamic ops to create the dynamic CPU ops again when an apply call overrides the
+    // dynamic property values.
+
+    m_dynamicOps.clear();
+    for (const auto & op : ops)
+    {
+        if (op->isDynamic())
+        {
+            m_dynamicOps.push_back(op);
+        }
+    }
+    m_fastLogExpPow = HasFlag(oFlags, OPTIMIZATION_FAST_LOG_EXP_POW);
 
     // Compute the cache id.
 
@@ -376,100 +434,472 @@ void CPUProcessor::Impl::finalize(const OpRcPtrVec & rawOps,
     m_cacheID = ss.str();
 }
 
-void CPUProcessor::Impl::apply(const ImageDesc & imgDesc) const
-{   
-    // Get the ScanlineHelper for this thread (no significant performance impact).
-    std::unique_ptr<ScanlineHelper> 
-        scanlineBuilder(CreateScanlineHelper(m_inBitDepth, m_inBitDepthOp,
-                                             m_outBitDepth, m_outBitDepthOp));
-
-    // Prepare the processing.
-    scanlineBuilder->init(imgDesc);
-
+// Process all the scanlines of the image region selected by the scanline helper.
+void ProcessScanlines(ScanlineHelper & scanlineBuilder, const ConstOpCPURcPtrVec & cpuOps)
+{
     float * rgbaBuffer = nullptr;
     long numPixels = 0;
 
     while(true)
     {
-        scanlineBuilder->prepRGBAScanline(&rgbaBuffer, numPixels);
+        scanlineBuilder.prepRGBAScanline(&rgbaBuffer, numPixels);
         if(numPixels == 0) break;
 
-        const size_t numOps = m_cpuOps.size();
+        const size_t numOps = cpuOps.size();
         for(size_t i = 0; i<numOps; ++i)
         {
-            m_cpuOps[i]->apply(rgbaBuffer, rgbaBuffer, numPixels);
+            cpuOps[i]->apply(rgbaBuffer, rgbaBuffer, numPixels);
         }
 
-        scanlineBuilder->finishRGBAScanline();
+        scanlineBuilder.finishRGBAScanline();
+    }
+}
+
+ScanlineHelper * CPUProcessor::Impl::createScanlineHelper(const CPUOps & ops) const
+{
+    return CreateScanlineHelper(m_inBitDepth, ops.m_inBitDepthOp,
+                                m_outBitDepth, ops.m_outBitDepthOp,
+                                m_scratchBufferPool,
+                                static_cast<long>(GetCPUProcessorChunkSize()));
+}
+
+namespace
+{
+const DynamicPropertyType DynamicPropertyTypes[]{ DYNAMIC_PROPERTY_EXPOSURE,
+                                                  DYNAMIC_PROPERTY_CONTRAST,
+                                                  DYNAMIC_PROPERTY_GAMMA,
+                                                  DYNAMIC_PROPERTY_GRADING_PRIMARY,
+                                                  DYNAMIC_PROPERTY_GRADING_RGBCURVE,
+                                                  DYNAMIC_PROPERTY_GRADING_TONE };
+
+void SetDynamicPropertyValue(DynamicPropertyRcPtr & prop, const DynamicPropertyValues & values)
+{
+    const DynamicPropertyType type = prop->getType();
+    switch (type)
+    {
+    case DYNAMIC_PROPERTY_EXPOSURE:
+    case DYNAMIC_PROPERTY_CONTRAST:
+    case DYNAMIC_PROPERTY_GAMMA:
+        DynamicPropertyValue::AsDouble(prop)->setValue(values.getDouble(type));
+        break;
+    case DYNAMIC_PROPERTY_GRADING_PRIMARY:
+        DynamicPropertyValue::AsGradingPrimary(prop)->setValue(values.getGradingPrimary());
+        break;
+    case DYNAMIC_PROPERTY_GRADING_RGBCURVE:
+        DynamicPropertyValue::AsGradingRGBCurve(prop)->setValue(values.getGradingRGBCurve());
+        break;
+    case DYNAMIC_PROPERTY_GRADING_TONE:
+        DynamicPropertyValue::AsGradingTone(prop)->setValue(values.getGradingTone());
+        break;
+    }
+}
+
+void CopyDynamicPropertyValue(DynamicPropertyRcPtr & dst, DynamicPropertyRcPtr & src)
+{
+    switch (dst->getType())
+    {
+    case DYNAMIC_PROPERTY_EXPOSURE:
+    case DYNAMIC_PROPERTY_CONTRAST:
+    case DYNAMIC_PROPERTY_GAMMA:
+        DynamicPropertyValue::AsDouble(dst)->setValue(
+            DynamicPropertyValue::AsDouble(src)->getValue());
+        break;
+    case DYNAMIC_PROPERTY_GRADING_PRIMARY:
+        DynamicPropertyValue::AsGradingPrimary(dst)->setValue(
+            DynamicPropertyValue::AsGradingPrimary(src)->getValue());
+        break;
+    case DYNAMIC_PROPERTY_GRADING_RGBCURVE:
+        DynamicPropertyValue::AsGradingRGBCurve(dst)->setValue(
+            DynamicPropertyValue::AsGradingRGBCurve(src)->getValue());
+        break;
+    case DYNAMIC_PROPERTY_GRADING_TONE:
+        DynamicPropertyValue::AsGradingTone(dst)->setValue(
+            DynamicPropertyValue::AsGradingTone(src)->getValue());
+        break;
     }
 }
 
+// Create a CPU op using the dynamic property values, or return the CPU op of the processor if
+// none of its dynamic properties has a value in the set. The new CPU op has its own decoupled
+// dynamic properties, the ones without a value in the set get the current value of the
+// processor's CPU op.
+ConstOpCPURcPtr CreateDynamicCPUOp(const ConstOpCPURcPtr & cpuOp,
+                                   const ConstOpRcPtr & op,
+                                   bool fastLogExpPow,
+                                   const DynamicPropertyValues & values)
+{
+    bool hasValue = false;
+    for (const auto type : DynamicPropertyTypes)
+    {
+        if (values.hasValue(type) && cpuOp->hasDynamicProperty(type))
+        {
+            hasValue = true;
+            break;
+        }
+    }
+
+    if (!hasValue)
+    {
+        return cpuOp;
+    }
+
+    ConstOpCPURcPtr newOp = op->getCPUOp(fastLogExpPow);
+
+    for (const auto type : DynamicPropertyTypes)
+    {
+        if (cpuOp->hasDynamicProperty(type))
+        {
+            DynamicPropertyRcPtr prop = newOp->getDynamicProperty(type);
+            if (values.hasValue(type))
+            {
+                SetDynamicPropertyValue(prop, values);
+            }
+            else
+            {
+                DynamicPropertyRcPtr current = cpuOp->getDynamicProperty(type);
+                CopyDynamicPropertyValue(prop, current);
+            }
+        }
+    }
+
+    return newOp;
+}
+} // anon.
+
+void CPUProcessor::Impl::createOps(const DynamicPropertyValues & values, CPUOps & ops) const
+{
+    ops = m_ops;
+
+    // The dynamic CPU ops are in the same order as the dynamic ops they were created from.
+    size_t dynamicIdx = 0;
+    auto updateOp = [this, &values, &dynamicIdx](ConstOpCPURcPtr & cpuOp)
+    {
+        if (cpuOp->isDynamic())
+        {
+            if (dynamicIdx >= m_dynamicOps.size())
+            {
+                throw Exception("Cannot find the dynamic op of a dynamic CPU op.");
+            }
+
+            cpuOp = CreateDynamicCPUOp(cpuOp, m_dynamicOps[dynamicIdx++], m_fastLogExpPow, values);
+        }
+    };
+
+    updateOp(ops.m_inBitDepthOp);
+    for (auto & cpuOp : ops.m_cpuOps)
+    {
+        updateOp(cpuOp);
+    }
+    updateOp(ops.m_outBitDepthOp);
+}
+
+void CPUProcessor::Impl::apply(const ImageDesc & imgDesc) const
+{   
+    // Get the ScanlineHelper for this thread (no significant performance impact).
+    std::unique_ptr<ScanlineHelper> scanlineBuilder(createScanlineHelper(m_ops));
+
+    // Prepare the processing.
+    scanlineBuilder->init(imgDesc);
+
+    ProcessScanlines(*scanlineBuilder, m_ops.m_cpuOps);
+}
+
 void CPUProcessor::Impl::apply(const ImageDesc & srcImgDesc, ImageDesc & dstImgDesc) const
 {
     // Get the ScanlineHelper for this thread (no significant performance impact).
-    std::unique_ptr<ScanlineHelper> 
-        scanlineBuilder(CreateScanlineHelper(m_inBitDepth, m_inBitDepthOp,
-                                             m_outBitDepth, m_outBitDepthOp));
+    std::unique_ptr<ScanlineHelper> scanlineBuilder(createScanlineHelper(m_ops));
 
     // Prepare the processing.
     scanlineBuilder->init(srcImgDesc, dstImgDesc);
 
-    float * rgbaBuffer = nullptr;
-    long numPixels = 0;
+    ProcessScanlines(*scanlineBuilder, m_ops.m_cpuOps);
+}
 
-    while(true)
+void CPUProcessor::Impl::apply(const ImageDesc & imgDesc, unsigned numThreads) const
+{
+    applyInBands(m_ops, imgDesc.getWidth(), imgDesc.getHeight(), numThreads,
+                 [&imgDesc](ScanlineHelper & helper) { helper.init(imgDesc); });
+}
+
+void CPUProcessor::Impl::apply(const ImageDesc & srcImgDesc,
+                               ImageDesc & dstImgDesc,
+                               unsigned numThreads) const
+{
+    applyInBands(m_ops, dstImgDesc.getWidth(), dstImgDesc.getHeight(), numThreads,
+                 [&srcImgDesc, &dstImgDesc](ScanlineHelper & helper)
+                 {
+                     helper.init(srcImgDesc, dstImgDesc);
+                 });
+}
+
+void CPUProcessor::Impl::apply(const ImageDesc & imgDesc,
+                               const DynamicPropertyValues & values,
+                               unsigned numThreads) const
+{
+    CPUOps ops;
+    createOps(values, ops);
+
+    applyInBands(ops, imgDesc.getWidth(), imgDesc.getHeight(), numThreads,
+                 [&imgDesc](ScanlineHelper & helper) { helper.init(imgDesc); });
+}
+
+void CPUProcessor::Impl::apply(const ImageDesc & srcImgDesc,
+                               ImageDesc & dstImgDesc,
+                               const DynamicPropertyValues & values,
+                               unsigned numThreads) const
+{
+    CPUOps ops;
+    createOps(values, ops);
+
+    applyInBands(ops, dstImgDesc.getWidth(), dstImgDesc.getHeight(), numThreads,
+                 [&srcImgDesc, &dstImgDesc](ScanlineHelper & helper)
+                 {
+                     helper.init(srcImgDesc, dstImgDesc);
+                 });
+}
+
+void CPUProcessor::Impl::applyInBands(const CPUOps & ops,
+                                      long width, long height, unsigned numThreads,
+                                      const std::function<void(ScanlineHelper &)> & initHelper) const
+{
+    if (numThreads == 0)
     {
-        scanlineBuilder->prepRGBAScanline(&rgbaBuffer, numPixels);
-        if(numPixels == 0) break;
+        numThreads = std::max(1u, std::thread::hardware_concurrency());
+    }
 
-        const size_t numOps = m_cpuOps.size();
-        for(size_t i = 0; i<numOps; ++i)
+    // Split the lines between the threads unless the image is too small in that dimension
+    // (e.g. a single line of pixels), in which case the columns are split instead.
+    const bool splitLines = height >= static_cast<long>(numThreads) || height >= width;
+    const long length     = splitLines ? height : width;
+    const long numBands   = std::max(1L, std::min(static_cast<long>(numThreads), length));
+
+    // Each band has its own ScanlineHelper i.e. its own intermediate buffers, but all of them
+    // share the CPU ops. Any error on the image descriptions is then reported by the caller
+    // thread before starting the processing.
+    std::vector<std::unique_ptr<ScanlineHelper>> scanlineBuilders(numBands);
+    for (long band = 0; band < numBands; ++band)
+    {
+        scanlineBuilders[band].reset(createScanlineHelper(ops));
+        initHelper(*scanlineBuilders[band]);
+
+        if (numBands > 1)
+        {
+            const long begin = length * band / numBands;
+            const long end   = length * (band + 1) / numBands;
+
+            if (splitLines)
+            {
+                scanlineBuilders[band]->setRegion(0, width, begin, end);
+            }
+            else
+            {
+                scanlineBuilders[band]->setRegion(begin, end, 0, height);
+            }
+        }
+    }
+
+    std::vector<std::exception_ptr> errors(numBands);
+
+    auto processBand = [&ops, &scanlineBuilders, &errors](long band)
+    {
+        try
+        {
+            ProcessScanlines(*scanlineBuilders[band], ops.m_cpuOps);
+        }
+        catch (...)
+        {
+            errors[band] = std::current_exception();
+        }
+    };
+
+    std::vector<std::thread> workers;
+    workers.reserve(numBands - 1);
+
+    for (long band = 1; band < numBands; ++band)
+    {
+        try
+        {
+            workers.emplace_back(processBand, band);
+        }
+        catch (const std::system_error &)
         {
-            m_cpuOps[i]->apply(rgbaBuffer, rgbaBuffer, numPixels);
+            // Process the band in the caller thread if a new thread cannot be started.
+            processBand(band);
         }
+    }
+
+    // The caller thread processes the first band.
+    processBand(0);
+
+    for (auto & worker : workers)
+    {
+        worker.join();
+    }
 
-        scanlineBuilder->finishRGBAScanline();
+    for (const auto & error : errors)
+    {
+        if (error)
+        {
+            std::rethrow_exception(error);
+        }
     }
 }
 
-void CPUProcessor::Impl::applyRGB(float * pixel) const
+namespace
 {
-    float v[4]{pixel[0], pixel[1], pixel[2], 0.0f};
+// The number of points processed at once by all the ops i.e. small enough to stay in the CPU
+// caches.
+constexpr size_t PointsBlockSize = 1024;
 
-    m_inBitDepthOp->apply(v, v, 1);
+// Apply all the ops to packed RGBA and 32-bit float pixels (in place).
+void ApplyOps(const CPUOps & ops, float * pixels, long numPixels)
+{
+    ops.m_inBitDepthOp->apply(pixels, pixels, numPixels);
 
-    const size_t numOps = m_cpuOps.size();
+    const size_t numOps = ops.m_cpuOps.size();
     for(size_t i = 0; i<numOps; ++i)
     {
-        m_cpuOps[i]->apply(v, v, 1);
+        ops.m_cpuOps[i]->apply(pixels, pixels, numPixels);
     }
 
-    m_outBitDepthOp->apply(v, v, 1);
+    ops.m_outBitDepthOp->apply(pixels, pixels, numPixels);
+}
+
+void ApplyRGB(const CPUOps & ops, float * pixel)
+{
+    float v[4]{pixel[0], pixel[1], pixel[2], 0.0f};
+
+    ApplyOps(ops, v, 1);
 
     pixel[0] = v[0];
     pixel[1] = v[1];
     pixel[2] = v[2];
 }
 
+void ApplyRGBAPoints(const CPUOps & ops, float * points, size_t numPoints)
+{
+    for (size_t start = 0; start < numPoints; start += PointsBlockSize)
+    {
+        const size_t count = std::min(PointsBlockSize, numPoints - start);
+        ApplyOps(ops, points + 4 * start, static_cast<long>(count));
+    }
+}
+} // anon.
+
+void CPUProcessor::Impl::applyRGB(float * pixel) const
+{
+    ApplyRGB(m_ops, pixel);
+}
+
 void CPUProcessor::Impl::applyRGBA(float * pixel) const
 {
-    m_inBitDepthOp->apply(pixel, pixel, 1);
+    ApplyOps(m_ops, pixel, 1);
+}
 
-    const size_t numOps = m_cpuOps.size();
-    for(size_t i = 0; i<numOps; ++i)
+void CPUProcessor::Impl::applyRGB(float * pixel, const DynamicPropertyValues & values) const
+{
+    CPUOps ops;
+    createOps(values, ops);
+
+    ApplyRGB(ops, pixel);
+}
+
+void CPUProcessor::Impl::applyRGBA(float * pixel, const DynamicPropertyValues & values) const
+{
+    CPUOps ops;
+    createOps(values, ops);
+
+    ApplyOps(ops, pixel, 1);
+}
+
+void CPUProcessor::Impl::applyRGBPoints(const CPUOps & ops,
+                                        float * points,
+                                        size_t numPoints) const
+{
+    if (numPoints == 0)
     {
-        m_cpuOps[i]->apply(pixel, pixel, 1);
+        return;
     }
 
-    m_outBitDepthOp->apply(pixel, pixel, 1);
+    const size_t blockSize = std::min(numPoints, PointsBlockSize);
+
+    ScratchBufferPool::Buffer buffer = m_scratchBufferPool.acquire(4 * blockSize * sizeof(float));
+    float * rgba = buffer.get<float>();
+
+    for (size_t start = 0; start < numPoints; start += blockSize)
+    {
+        const size_t count = std::min(blockSize, numPoints - start);
+        float * rgb = points + 3 * start;
+
+        for (size_t idx = 0; idx < count; ++idx)
+        {
+            rgba[4 * idx]     = rgb[3 * idx];
+            rgba[4 * idx + 1] = rgb[3 * idx + 1];
+            rgba[4 * idx + 2] = rgb[3 * idx + 2];
+            rgba[4 * idx + 3] = 0.0f;
+        }
+
+        ApplyOps(ops, rgba, static_cast<long>(count));
+
+        for (size_t idx = 0; idx < count; ++idx)
+        {
+            rgb[3 * idx]     = rgba[4 * idx];
+            rgb[3 * idx + 1] = rgba[4 * idx + 1];
+            rgb[3 * idx + 2] = rgba[4 * idx + 2];
+        }
+    }
 }
 
+void CPUProcessor::Impl::applyRGBPoints(float * points, size_t numPoints) const
+{
+    applyRGBPoints(m_ops, points, numPoints);
+}
 
+void CPUProcessor::Impl::applyRGBAPoints(float * points, size_t numPoints) const
+{
+    ApplyRGBAPoints(m_ops, points, numPoints);
+}
+
+void CPUProcessor::Impl::applyRGBPoints(float * points,
+                                        size_t numPoints,
+                                        const DynamicPropertyValues & values) const
+{
+    CPUOps ops;
+    createOps(values, ops);
+
+    applyRGBPoints(ops, points, numPoints);
+}
+
+void CPUProcessor::Impl::applyRGBAPoints(float * points,
+                                         size_t numPoints,
+                                         const DynamicPropertyValues & values) const
+{
+    CPUOps ops;
+    createOps(values, ops);
+
+    ApplyRGBAPoints(ops, points, numPoints);
+}
 
 
 //////////////////////////////////////////////////////////////////////////
 
 
+namespace
+{
+// The chunk size used by all the CPU processors (i.e. 0 means complete scanlines).
+std::atomic<unsigned> g_chunkSize{ 0 };
+}
+
+unsigned GetCPUProcessorChunkSize()
+{
+    return g_chunkSize;
+}
+
+void SetCPUProcessorChunkSize(unsigned numPixels)
+{
+    g_chunkSize = numPixels;
+}
+
 
 
 void CPUProcessor::deleter(CPUProcessor * c)
@@ -543,6 +973,28 @@ void CPUProcessor::apply(const ImageDesc & srcImgDesc, ImageDesc & dstImgDesc) c
     getImpl()->apply(srcImgDesc, dstImgDesc);
 }
 
+void CPUProcessor::apply(const ImageDesc & imgDesc, unsigned numThreads) const
+{
+    getImpl()->apply(imgDesc, numThreads);
+}
+
+void CPUProcessor::apply(const ImageDesc & srcImgDesc,
+                         ImageDesc & dstImgDesc,
+                         unsigned numThreads) const
+{
+    getImpl()->apply(srcImgDesc, dstImgDesc, numThreads);
+}
+
+size_t CPUProcessor::getScratchBufferPoolHits() const noexcept
+{
+    return getImpl()->getScratchBufferPoolHits();
+}
+
+size_t CPUProcessor::getScratchBufferPoolMisses() const noexcept
+{
+    return getImpl()->getScratchBufferPoolMisses();
+}
+
 void CPUProcessor::applyRGB(float * pixel) const
 {
     getImpl()->applyRGB(pixel);
@@ -553,4 +1005,53 @@ void CPUProcessor::applyRGBA(float * pixel) const
     getImpl()->applyRGBA(pixel);
 }
 
+void CPUProcessor::applyRGBPoints(float * points, size_t numPoints) const
+{
+    getImpl()->applyRGBPoints(points, numPoints);
+}
+
+void CPUProcessor::applyRGBAPoints(float * points, size_t numPoints) const
+{
+    getImpl()->applyRGBAPoints(points, numPoints);
+}
+
+void CPUProcessor::apply(const ImageDesc & imgDesc,
+                         const DynamicPropertyValues & values,
+                         unsigned numThreads) const
+{
+    getImpl()->apply(imgDesc, values, numThreads);
+}
+
+void CPUProcessor::apply(const ImageDesc & srcImgDesc,
+                         ImageDesc & dstImgDesc,
+                         const DynamicPropertyValues & values,
+                         unsigned numThreads) const
+{
+    getImpl()->apply(srcImgDesc, dstImgDesc, values, numThreads);
+}
+
+void CPUProcessor::applyRGB(float * pixel, const DynamicPropertyValues & values) const
+{
+    getImpl()->applyRGB(pixel, values);
+}
+
+void CPUProcessor::applyRGBA(float * pixel, const DynamicPropertyValues & values) const
+{
+    getImpl()->applyRGBA(pixel, values);
+}
+
+void CPUProcessor::applyRGBPoints(float * points,
+                                  size_t numPoints,
+                                  const DynamicPropertyValues & values) const
+{
+    getImpl()->applyRGBPoints(points, numPoints, values);
+}
+
+void CPUProcessor::applyRGBAPoints(float * points,
+                                   size_t numPoints,
+                                   const DynamicPropertyValues & values) const
+{
+    getImpl()->applyRGBAPoints(points, numPoints, values);
+}
+
 } // namespace OCIO_NAMESPACE
@@ -6,9 +6,12 @@
 #define INCLUDED_OCIO_CPUPROCESSOR_H
 
 
+#include <functional>
+
 #include <OpenColorIO/OpenColorIO.h>
 
 #include "Op.h"
+#include "ScratchBufferPool.h"
 
 
 namespace OCIO_NAMESPACE
@@ -16,6 +19,15 @@ namespace OCIO_NAMESPACE
 
 class ScanlineHelper;
 
+// The CPU ops processing the pixels, including the bit-depth conversions.
+struct CPUOps
+{
+    ConstOpCPURcPtr    m_inBitDepthOp; // Converts from in to F32. It could be done by the first op.
+    ConstOpCPURcPtrVec m_cpuOps;       // It could be empty if the OpVec only contains a 1D LUT op
+                                       // (e.g. the 1D LUT CPUOp instance would be in the m_inBitDepthOp).
+    ConstOpCPURcPtr    m_outBitDepthOp;// Converts from F32 to out. It could be done by the last op.
+};
+
 class CPUProcessor::Impl
 {
 public:
@@ -46,11 +58,38 @@ public:
     void apply(const ImageDesc & imgDesc) const;
     void apply(const ImageDesc & srcImgDesc, ImageDesc & dstImgDesc) const;
 
+    void apply(const ImageDesc & imgDesc, unsigned numThreads) const;
+    void apply(const ImageDesc & srcImgDesc, ImageDesc & dstImgDesc, unsigned numThreads) const;
+
     // Note that the method only accepts one packed RGB and 32-bit float pixel.
     void applyRGB(float * pixel) const;
     // Note that the method only accepts one packed RGBA and 32-bit float pixel.
     void applyRGBA(float * pixel) const;
 
+    // Note that the methods only accept packed RGB (or RGBA) and 32-bit float pixels.
+    void applyRGBPoints(float * points, size_t numPoints) const;
+    void applyRGBAPoints(float * points, size_t numPoints) const;
+
+    // The dynamic property values override the ones of the CPU processor for that call only.
+    void apply(const ImageDesc & imgDesc,
+               const DynamicPropertyValues & values,
+               unsigned numThreads) const;
+    void apply(const ImageDesc & srcImgDesc,
+               ImageDesc & dstImgDesc,
+               const DynamicPropertyValues & values,
+               unsigned numThreads) const;
+
+    void applyRGB(float * pixel, const DynamicPropertyValues & values) const;
+    void applyRGBA(float * pixel, const DynamicPropertyValues & values) const;
+
+    void applyRGBPoints(float * points, size_t numPoints,
+                        const DynamicPropertyValues & values) const;
+    void applyRGBAPoints(float * points, size_t numPoints,
+                         const DynamicPropertyValues & values) const;
+
+    size_t getScratchBufferPoolHits() const noexcept { return m_scratchBufferPool.getHits(); }
+    size_t getScratchBufferPoolMisses() const noexcept { return m_scratchBufferPool.getMisses(); }
+
     ////////////////////////////////////////////
     //
     // Functions not exposed to the OCIO public API.
@@ -58,10 +97,25 @@ public:
     void finalize(const OpRcPtrVec & rawOps, BitDepth in, BitDepth out, OptimizationFlags oFlags);
 
 private:
-    ConstOpCPURcPtr    m_inBitDepthOp; // Converts from in to F32. It could be done by the first op.
-    ConstOpCPURcPtrVec m_cpuOps;       // It could be empty if the OpVec only contains a 1D LUT op
-                                       // (e.g. the 1D LUT CPUOp instance would be in the m_inBitDepthOp).
-    ConstOpCPURcPtr    m_outBitDepthOp;// Converts from F32 to out. It could be done by the last op.
+    // Get the CPU ops using the dynamic property values. Only the dynamic CPU ops having a value
+    // in the set are created again, all the other ones are shared with the CPU processor.
+    void createOps(const DynamicPropertyValues & values, CPUOps & ops) const;
+
+    ScanlineHelper * createScanlineHelper(const CPUOps & ops) const;
+
+    // Split the image in bands processed concurrently. The initHelper function initializes
+    // a scanline helper for the complete image.
+    void applyInBands(const CPUOps & ops, long width, long height, unsigned numThreads,
+                      const std::function<void(ScanlineHelper &)> & initHelper) const;
+
+    // Note that the method only accepts packed RGB and 32-bit float pixels.
+    void applyRGBPoints(const CPUOps & ops, float * points, size_t numPoints) const;
+
+    CPUOps             m_ops;
+
+    // The dynamic ops of the color transformation, in the order of their dynamic CPU ops.
+    std::vector<ConstOpRcPtr> m_dynamicOps;
+    bool               m_fastLogExpPow = false;
 
     BitDepth           m_inBitDepth = BIT_DEPTH_F32;
     BitDepth           m_outBitDepth = BIT_DEPTH_F32;
@@ -70,6 +124,9 @@ private:
     bool               m_hasChannelCrosstalk = true;
     std::string        m_cacheID;
     Mutex              m_mutex;
+
+    // Intermediate buffers of the scanline helpers, shared by all the apply calls.
+    mutable ScratchBufferPool m_scratchBufferPool;
 };
 
 } // namespace OCIO_NAMESPACE
@@ -2,9 +2,14 @@
 // Copyright Contributors to the OpenColorIO Project.
 
 
+#include <ostream>
+
 #include <OpenColorIO/OpenColorIO.h>
 
 #include "Caching.h"
+#include "ConfigUtils.h"
+#include "ops/fixedfunction/ACES2/Transform.h"
+#include "ops/lut3d/Lut3DOpData.h"
 #include "transforms/CDLTransform.h"
 #include "PathUtils.h"
 #include "transforms/FileTransform.h"
@@ -13,9 +18,11 @@
 namespace OCIO_NAMESPACE
 {
 
-const char * OCIO_DISABLE_ALL_CACHES       = "OCIO_DISABLE_ALL_CACHES";
-const char * OCIO_DISABLE_PROCESSOR_CACHES = "OCIO_DISABLE_PROCESSOR_CACHES";
-const char * OCIO_DISABLE_CACHE_FALLBACK   = "OCIO_DISABLE_CACHE_FALLBACK";
+const char * OCIO_DISABLE_ALL_CACHES             = "OCIO_DISABLE_ALL_CACHES";
+const char * OCIO_DISABLE_PROCESSOR_CACHES       = "OCIO_DISABLE_PROCESSOR_CACHES";
+const char * OCIO_DISABLE_CACHE_FALLBACK         = "OCIO_DISABLE_CACHE_FALLBACK";
+const char * OCIO_FILE_CACHE_CAPACITY            = "OCIO_FILE_CACHE_CAPACITY";
+const char * OCIO_FILE_CACHE_VALIDATION_INTERVAL = "OCIO_FILE_CACHE_VALIDATION_INTERVAL";
 
 
 // TODO: Processors which the user hangs onto have local caches.
@@ -25,5 +32,21 @@ void ClearAllCaches()
 {
     ClearPathCaches();
     ClearFileTransformCaches();
+    ClearConfigCache();
+    ConfigUtils::ClearHeuristicsCache();
+    ACES2::ClearParamsCaches();
+    ClearFastInverseLut3DCache();
 }
+
+std::ostream & operator<<(std::ostream & os, const CacheStatistics & stats)
+{
+    os << "<CacheStatistics hits=" << stats.m_hits
+       << ", misses=" << stats.m_misses
+       << ", evictions=" << stats.m_evictions
+       << ", invalidations=" << stats.m_invalidations
+       << ", size=" << stats.m_size
+       << ", capacity=" << stats.m_capacity << ">";
+    return os;
+}
+
 } // namespace OCIO_NAMESPACE
@@ -6,7 +6,9 @@
 #define INCLUDED_OCIO_CACHING_H
 
 
+#include <list>
 #include <map>
+#include <memory>
 
 #include <OpenColorIO/OpenColorIO.h>
 
@@ -21,6 +23,9 @@ namespace OCIO_NAMESPACE
 // instance type of the key. Note that having efficient key generation & comparison are critical.
 // For example integer comparison is efficent but string one could be far less efficient depending
 // of its length & where changes occur (e.g. absolute filepaths are inefficient). 
+//
+// The cache is unbounded by default. When a capacity is set, the least recently used entries are
+// evicted to keep the number of entries within the capacity.
 template<typename KeyType, typename EntryType>
 class GenericCache
 {
@@ -47,6 +52,92 @@ public:
         AutoMutex lock(m_mutex);
 
         m_entries.clear();
+        m_lruKeys.clear();
+        m_lruPositions.clear();
+    }
+
+    // Set the maximum number of entries (i.e. 0 means no limit). The least recently used entries
+    // are evicted if the cache already contains more entries.
+    void setCapacity(size_t capacity)
+    {
+        AutoMutex lock(m_mutex);
+
+        m_capacity = capacity;
+
+        m_lruKeys.clear();
+        m_lruPositions.clear();
+
+        if (m_capacity > 0)
+        {
+            // The usage of the existing entries is unknown.
+            for (const auto & entry : m_entries)
+            {
+                touch(entry.first);
+            }
+            evict();
+        }
+    }
+
+    size_t getCapacity() const noexcept { return m_capacity; }
+
+    // Copy the entries of another cache with their usage order, within the capacity of this
+    // cache. The statistics are unchanged.
+    void copyEntries(const GenericCache & rhs)
+    {
+        if (this == &rhs) return;
+
+        Entries entries;
+        LruKeys lruKeys;
+        {
+            AutoMutex lock(rhs.m_mutex);
+
+            entries = rhs.m_entries;
+            lruKeys = rhs.m_lruKeys;
+        }
+
+        AutoMutex lock(m_mutex);
+
+        m_entries = std::move(entries);
+
+        m_lruKeys.clear();
+        m_lruPositions.clear();
+
+        if (m_capacity > 0)
+        {
+            // The entries without a known usage are the least recently used ones.
+            for (const auto & entry : m_entries)
+            {
+                touch(entry.first);
+            }
+            for (auto key = lruKeys.rbegin(); key != lruKeys.rend(); ++key)
+            {
+                touch(*key);
+            }
+            evict();
+        }
+    }
+
+    // Note that the lock must not be already held.
+    CacheStatistics getStatistics() const
+    {
+        AutoMutex lock(m_mutex);
+
+        CacheStatistics stats;
+        stats.m_hits      = m_hits;
+        stats.m_misses    = m_misses;
+        stats.m_evictions = m_evictions;
+        stats.m_size      = m_entries.size();
+        stats.m_capacity  = m_capacity;
+        return stats;
+    }
+
+    void resetStatistics() noexcept
+    {
+        AutoMutex lock(m_mutex);
+
+        m_hits      = 0;
+        m_misses    = 0;
+        m_evictions = 0;
     }
 
     inline void enable(bool enable) noexcept
@@ -68,12 +159,97 @@ public:
         return isEnabled() && m_entries.end() != m_entries.find(key);
     }
 
+    // Find a cache entry without creating it, nor changing the statistics & the LRU order.
+    // To only use when lock is on to protect the cache access.
+    Iterator find(const KeyType & key) noexcept
+    {
+        return isEnabled() ? m_entries.find(key) : m_entries.end();
+    }
+
+    // Remove the entries for which the predicate returns true. Note that they are not counted as
+    // evictions (i.e. the statistics are unchanged).
+    // To only use when lock is on to protect the cache access.
+    template<typename Predicate>
+    void erase(Predicate predicate)
+    {
+        for (auto it = m_entries.begin(); it != m_entries.end();)
+        {
+            if (predicate(it->second))
+            {
+                auto pos = m_lruPositions.find(it->first);
+                if (pos != m_lruPositions.end())
+                {
+                    m_lruKeys.erase(pos->second);
+                    m_lruPositions.erase(pos);
+                }
+                it = m_entries.erase(it);
+            }
+            else
+            {
+                ++it;
+            }
+        }
+    }
+
     // Get a cache entry. It creates the cache entry if not existing.
     // To only use when lock is on to protect the cache access.
     EntryType & operator[](const KeyType & key) noexcept
     {
         static EntryType dummy;
-        return isEnabled() ? m_entries[key] : dummy;
+        if (!isEnabled())
+        {
+            return dummy;
+        }
+
+        auto it = m_entries.find(key);
+        if (it != m_entries.end())
+        {
+            ++m_hits;
+            if (m_capacity > 0)
+            {
+                touch(key);
+            }
+            return it->second;
+        }
+
+        ++m_misses;
+
+        // Note that the new entry is the most recently used one so it is never evicted.
+        EntryType & entry = m_entries[key];
+        if (m_capacity > 0)
+        {
+            touch(key);
+            evict();
+        }
+        return entry;
+    }
+
+    // Get the shared holder of an entry, where EntryType is a shared pointer to a holder type
+    // having its own mutex. The holder is created if not existing, or is not kept in the cache
+    // when the cache is disabled.
+    //
+    // It allows a two-mutex approach: the cache lock is only held to get the holder, and the
+    // (potentially slow) creation of the entry content (e.g. a loaded file) is done under the
+    // mutex of the holder. So it does not block the lookups of the other entries, while the
+    // creations of the same entry still mutually block. Refer to PR #309 for details.
+    // Note that the lock must not be already held.
+    EntryType getSharedEntry(const KeyType & key)
+    {
+        typedef typename EntryType::element_type Holder;
+
+        AutoMutex lock(m_mutex);
+
+        if (!isEnabled())
+        {
+            return std::make_shared<Holder>();
+        }
+
+        EntryType & entry = (*this)[key];
+        if (!entry)
+        {
+            entry = std::make_shared<Holder>();
+        }
+        return entry;
     }
 
     Iterator begin() noexcept { return m_entries.begin(); }
@@ -89,8 +265,50 @@ protected:
     bool m_enabled = true;
 
 private:
-    Mutex m_mutex;
+    using LruKeys = std::list<KeyType>;
+
+    // Move the key to the front of the LRU list.
+    void touch(const KeyType & key)
+    {
+        auto pos = m_lruPositions.find(key);
+        if (pos != m_lruPositions.end())
+        {
+            m_lruKeys.splice(m_lruKeys.begin(), m_lruKeys, pos->second);
+        }
+        else
+        {
+            m_lruKeys.push_front(key);
+            m_lruPositions[key] = m_lruKeys.begin();
+        }
+    }
+
+    // Remove the least recently used entries exceeding the capacity.
+    void evict()
+    {
+        while (m_entries.size() > m_capacity && !m_lruKeys.empty())
+        {
+            const KeyType & key = m_lruKeys.back();
+            m_entries.erase(key);
+            m_lruPositions.erase(key);
+            m_lruKeys.pop_back();
+
+            ++m_evictions;
+        }
+    }
+
+    mutable Mutex m_mutex;
     Entries m_entries;
+
+    size_t m_capacity = 0;
+
+    // The keys ordered from the most to the least recently used, only maintained when the
+    // capacity is not zero.
+    LruKeys m_lruKeys;
+    std::map<KeyType, typename LruKeys::iterator> m_lruPositions;
+
+    size_t m_hits = 0;
+    size_t m_misses = 0;
+    size_t m_evictions = 0;
 };
 
 // A Processor instance uses this class to cache its derived optimized, CPU, and GPU Processors.
@@ -7,6 +7,8 @@
 
 #include <OpenColorIO/OpenColorIO.h>
 
+#include "ColorSpace.h"
+#include "DeferredTransform.h"
 #include "TokensManager.h"
 #include "Platform.h"
 #include "PrivateTypes.h"
@@ -16,74 +18,40 @@
 namespace OCIO_NAMESPACE
 {
 
-class ColorSpace::Impl
+ColorSpace::Impl & ColorSpace::Impl::operator= (const Impl & rhs)
 {
-public:
-    std::string m_name;
-    std::string m_family;
-    std::string m_equalityGroup;
-    std::string m_description;
-    std::string m_encoding;
-    StringUtils::StringVec m_aliases;
-
-    BitDepth m_bitDepth{ BIT_DEPTH_UNKNOWN };
-    bool m_isData{ false };
-
-    ReferenceSpaceType m_referenceSpaceType{ REFERENCE_SPACE_SCENE };
-
-    Allocation m_allocation{ ALLOCATION_UNIFORM };
-    std::vector<float> m_allocationVars;
-
-    TransformRcPtr m_toRefTransform;
-    TransformRcPtr m_fromRefTransform;
-
-    bool m_toRefSpecified{ false };
-    bool m_fromRefSpecified{ false };
-
-    TokensManager m_categories;
-
-    Impl() = delete;
-    explicit Impl(ReferenceSpaceType referenceSpace)
-        : m_referenceSpaceType(referenceSpace)
+    if (this != &rhs)
     {
+        m_name = rhs.m_name;
+        m_aliases = rhs.m_aliases;
+        m_family = rhs.m_family;
+        m_equalityGroup = rhs.m_equalityGroup;
+        m_description = rhs.m_description;
+        m_encoding = rhs.m_encoding;
+        m_bitDepth = rhs.m_bitDepth;
+        m_isData = rhs.m_isData;
+        m_referenceSpaceType = rhs.m_referenceSpaceType;
+        m_allocation = rhs.m_allocation;
+        m_allocationVars = rhs.m_allocationVars;
+
+        m_toRefTransform = rhs.m_toRefTransform?
+            rhs.m_toRefTransform->createEditableCopy()
+            : rhs.m_toRefTransform;
+
+        m_fromRefTransform = rhs.m_fromRefTransform?
+            rhs.m_fromRefTransform->createEditableCopy()
+            : rhs.m_fromRefTransform;
+
+        m_toRefDeferred = CopyDeferredTransform(rhs.m_toRefDeferred);
+        m_fromRefDeferred = CopyDeferredTransform(rhs.m_fromRefDeferred);
+
+        m_toRefSpecified = rhs.m_toRefSpecified;
+        m_fromRefSpecified = rhs.m_fromRefSpecified;
+        m_categories = rhs.m_categories;
+        m_version = rhs.m_version;
     }
-
-    Impl(const Impl &) = delete;
-
-    ~Impl() = default;
-
-    Impl& operator= (const Impl & rhs)
-    {
-        if (this != &rhs)
-        {
-            m_name = rhs.m_name;
-            m_aliases = rhs.m_aliases;
-            m_family = rhs.m_family;
-            m_equalityGroup = rhs.m_equalityGroup;
-            m_description = rhs.m_description;
-            m_encoding = rhs.m_encoding;
-            m_bitDepth = rhs.m_bitDepth;
-            m_isData = rhs.m_isData;
-            m_referenceSpaceType = rhs.m_referenceSpaceType;
-            m_allocation = rhs.m_allocation;
-            m_allocationVars = rhs.m_allocationVars;
-
-            m_toRefTransform = rhs.m_toRefTransform?
-                rhs.m_toRefTransform->createEditableCopy()
-                : rhs.m_toRefTransform;
-
-            m_fromRefTransform = rhs.m_fromRefTransform?
-                rhs.m_fromRefTransform->createEditableCopy()
-                : rhs.m_fromRefTransform;
-
-            m_toRefSpecified = rhs.m_toRefSpecified;
-            m_fromRefSpecified = rhs.m_fromRefSpecified;
-            m_categories = rhs.m_categories;
-        }
-        return *this;
-    }
-
-};
+    return *this;
+}
 
 
 ///////////////////////////////////////////////////////////////////////////
@@ -132,6 +100,8 @@ void ColorSpace::setName(const char * name) noexcept
     getImpl()->m_name = name ? name : "";
     // Name can no longer be an alias.
     StringUtils::Remove(getImpl()->m_aliases, getImpl()->m_name);
+    getImpl()->namesChanged();
+    getImpl()->m_version.changed();
 }
 
 size_t ColorSpace::getNumAliases() const noexcept
@@ -169,9 +139,11 @@ void ColorSpace::addAlias(const char * alias) noexcept
             if (!StringUtils::Contain(getImpl()->m_aliases, alias))
             {
                 getImpl()->m_aliases.push_back(alias);
+                getImpl()->namesChanged();
             }
         }
     }
+    getImpl()->m_version.changed();
 }
 
 void ColorSpace::removeAlias(const char * name) noexcept
@@ -179,13 +151,19 @@ void ColorSpace::removeAlias(const char * name) noexcept
     if (name && *name)
     {
         const std::string alias{ name };
-        StringUtils::Remove(getImpl()->m_aliases, alias);
+        if (StringUtils::Remove(getImpl()->m_aliases, alias))
+        {
+            getImpl()->namesChanged();
+        }
     }
+    getImpl()->m_version.changed();
 }
 
 void ColorSpace::clearAliases() noexcept
 {
     getImpl()->m_aliases.clear();
+    getImpl()->namesChanged();
+    getImpl()->m_version.changed();
 }
 
 const char * ColorSpace::getFamily() const noexcept
@@ -196,6 +174,7 @@ const char * ColorSpace::getFamily() const noexcept
 void ColorSpace::setFamily(const char * family)
 {
     getImpl()->m_family = family;
+    getImpl()->m_version.changed();
 }
 
 const char * ColorSpace::getEqualityGroup() const noexcept
@@ -206,6 +185,7 @@ const char * ColorSpace::getEqualityGroup() const noexcept
 void ColorSpace::setEqualityGroup(const char * equalityGroup)
 {
     getImpl()->m_equalityGroup = equalityGroup;
+    getImpl()->m_version.changed();
 }
 
 const char * ColorSpace::getDescription() const noexcept
@@ -216,6 +196,7 @@ const char * ColorSpace::getDescription() const noexcept
 void ColorSpace::setDescription(const char * description)
 {
     getImpl()->m_description = description;
+    getImpl()->m_version.changed();
 }
 
 BitDepth ColorSpace::getBitDepth() const noexcept
@@ -226,6 +207,7 @@ BitDepth ColorSpace::getBitDepth() const noexcept
 void ColorSpace::setBitDepth(BitDepth bitDepth)
 {
     getImpl()->m_bitDepth = bitDepth;
+    getImpl()->m_version.changed();
 }
 
 bool ColorSpace::hasCategory(const char * category) const
@@ -236,11 +218,13 @@ bool ColorSpace::hasCategory(const char * category) const
 void ColorSpace::addCategory(const char * category)
 {
     getImpl()->m_categories.addToken(category);
+    getImpl()->m_version.changed();
 }
 
 void ColorSpace::removeCategory(const char * category)
 {
     getImpl()->m_categories.removeToken(category);
+    getImpl()->m_version.changed();
 }
 
 int ColorSpace::getNumCategories() const
@@ -256,6 +240,7 @@ const char * ColorSpace::getCategory(int index) const
 void ColorSpace::clearCategories()
 {
     getImpl()->m_categories.clearTokens();
+    getImpl()->m_version.changed();
 }
 
 const char * ColorSpace::getEncoding() const noexcept
@@ -266,6 +251,7 @@ const char * ColorSpace::getEncoding() const noexcept
 void ColorSpace::setEncoding(const char * encoding)
 {
     getImpl()->m_encoding = encoding;
+    getImpl()->m_version.changed();
 }
 
 bool ColorSpace::isData() const noexcept
@@ -276,6 +262,7 @@ bool ColorSpace::isData() const noexcept
 void ColorSpace::setIsData(bool val) noexcept
 {
     getImpl()->m_isData = val;
+    getImpl()->m_version.changed();
 }
 
 ReferenceSpaceType ColorSpace::getReferenceSpaceType() const noexcept
@@ -291,6 +278,7 @@ Allocation ColorSpace::getAllocation() const noexcept
 void ColorSpace::setAllocation(Allocation allocation) noexcept
 {
     getImpl()->m_allocation = allocation;
+    getImpl()->m_version.changed();
 }
 
 int ColorSpace::getAllocationNumVars() const
@@ -318,16 +306,17 @@ void ColorSpace::setAllocationVars(int numvars, const float * vars)
             vars,
             numvars*sizeof(float));
     }
+    getImpl()->m_version.changed();
 }
 
-ConstTransformRcPtr ColorSpace::getTransform(ColorSpaceDirection dir) const noexcept
+ConstTransformRcPtr ColorSpace::getTransform(ColorSpaceDirection dir) const
 {
     switch (dir)
     {
     case COLORSPACE_DIR_TO_REFERENCE:
-        return getImpl()->m_toRefTransform;
+        return ResolveTransform(getImpl()->m_toRefTransform, getImpl()->m_toRefDeferred);
     case COLORSPACE_DIR_FROM_REFERENCE:
-        return getImpl()->m_fromRefTransform;
+        return ResolveTransform(getImpl()->m_fromRefTransform, getImpl()->m_fromRefDeferred);
     }
     return ConstTransformRcPtr();
 }
@@ -335,18 +324,24 @@ ConstTransformRcPtr ColorSpace::getTransform(ColorSpaceDirection dir) const noex
 void ColorSpace::setTransform(const ConstTransformRcPtr & transform,
                                 ColorSpaceDirection dir)
 {
+    // A deferred transform (i.e. lazily loaded config) is only created on its first access.
+    ConstDeferredTransformRcPtr deferred = GetDeferredTransform(transform);
+
     TransformRcPtr transformCopy;
-    if(transform) transformCopy = transform->createEditableCopy();
+    if(transform && !deferred) transformCopy = transform->createEditableCopy();
 
     switch (dir)
     {
     case COLORSPACE_DIR_TO_REFERENCE:
         getImpl()->m_toRefTransform = transformCopy;
+        getImpl()->m_toRefDeferred = deferred;
         break;
     case COLORSPACE_DIR_FROM_REFERENCE:
         getImpl()->m_fromRefTransform = transformCopy;
+        getImpl()->m_fromRefDeferred = deferred;
         break;
     }
+    getImpl()->m_version.changed();
 }
 
 std::ostream & operator<< (std::ostream & os, const ColorSpace & cs)
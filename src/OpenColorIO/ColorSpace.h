@@ -0,0 +1,86 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#ifndef INCLUDED_OCIO_COLORSPACE_H
+#define INCLUDED_OCIO_COLORSPACE_H
+
+#include <atomic>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "DeferredTransform.h"
+#include "ElementVersion.h"
+#include "TokensManager.h"
+#include "utils/StringUtils.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+class ColorSpace::Impl
+{
+public:
+    std::string m_name;
+    std::string m_family;
+    std::string m_equalityGroup;
+    std::string m_description;
+    std::string m_encoding;
+    StringUtils::StringVec m_aliases;
+
+    BitDepth m_bitDepth{ BIT_DEPTH_UNKNOWN };
+    bool m_isData{ false };
+
+    ReferenceSpaceType m_referenceSpaceType{ REFERENCE_SPACE_SCENE };
+
+    Allocation m_allocation{ ALLOCATION_UNIFORM };
+    std::vector<float> m_allocationVars;
+
+    TransformRcPtr m_toRefTransform;
+    TransformRcPtr m_fromRefTransform;
+
+    // The transforms of a lazily loaded config.
+    ConstDeferredTransformRcPtr m_toRefDeferred;
+    ConstDeferredTransformRcPtr m_fromRefDeferred;
+
+    bool m_toRefSpecified{ false };
+    bool m_fromRefSpecified{ false };
+
+    TokensManager m_categories;
+
+    // Changed by all the setters (refer to ElementVersion).
+    ElementVersion m_version;
+
+    // The counter of the name and alias changes of the color spaces of a set, if the color space
+    // belongs to one, so the set knows when its name index is stale (refer to ColorSpaceSet).
+    std::shared_ptr<std::atomic<size_t>> m_namesVersion;
+
+    Impl() = delete;
+    explicit Impl(ReferenceSpaceType referenceSpace)
+        : m_referenceSpaceType(referenceSpace)
+    {
+    }
+
+    Impl(const Impl &) = delete;
+
+    ~Impl() = default;
+
+    // The copy is not part of the color space set of rhs, so the names version is not copied.
+    Impl & operator= (const Impl & rhs);
+
+    // Count a change of the name or of the aliases.
+    void namesChanged() noexcept
+    {
+        if (m_namesVersion)
+        {
+            ++(*m_namesVersion);
+        }
+    }
+};
+
+} // namespace OCIO_NAMESPACE
+
+#endif // INCLUDED_OCIO_COLORSPACE_H
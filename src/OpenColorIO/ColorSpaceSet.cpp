@@ -3,9 +3,12 @@
 
 #include <sstream>
 #include <string>
+#include <unordered_map>
 
 #include <OpenColorIO/OpenColorIO.h>
 
+#include "ColorSpace.h"
+#include "Mutex.h"
 #include "PrivateTypes.h"
 #include "utils/StringUtils.h"
 
@@ -13,6 +16,25 @@
 namespace OCIO_NAMESPACE
 {
 
+namespace
+{
+
+// Case insensitive comparison (refer to StringUtils::Lower()) without string allocations.
+bool EqualsNoCase(const char * str1, const char * str2)
+{
+    for (; *str1 && *str2; ++str1, ++str2)
+    {
+        if (StringUtils::Lower(static_cast<unsigned char>(*str1))
+            != StringUtils::Lower(static_cast<unsigned char>(*str2)))
+        {
+            return false;
+        }
+    }
+    return *str1 == *str2;
+}
+
+} // anon.
+
 class ColorSpaceSet::Impl
 {
 public:
@@ -29,7 +51,8 @@ public:
 
             for (auto & cs: rhs.m_colorSpaces)
             {
-                m_colorSpaces.push_back(cs->createEditableCopy());
+                m_colorSpaces.push_back(createMember(cs));
+                addToIndex(m_colorSpaces.size() - 1);
             }
         }
         return *this;
@@ -91,21 +114,19 @@ public:
         // Search for name and aliases.
         if (csName && *csName)
         {
-            const std::string str = StringUtils::Lower(csName);
-            for (size_t idx = 0; idx < m_colorSpaces.size(); ++idx)
+            AutoMutex lock(m_indexMutex);
+
+            // A color space of the set could be renamed or re-aliased in place (e.g. the const
+            // is lost in the Python binding), so the index is rebuilt after such a change.
+            if (m_indexVersion != *m_namesVersion)
             {
-                if (StringUtils::Compare(m_colorSpaces[idx]->getName(), str))
-                {
-                    return static_cast<int>(idx);
-                }
-                const size_t numAliases = m_colorSpaces[idx]->getNumAliases();
-                for (size_t aidx = 0; aidx < numAliases; ++aidx)
-                {
-                    if (StringUtils::Compare(m_colorSpaces[idx]->getAlias(aidx), str))
-                    {
-                        return static_cast<int>(idx);
-                    }
-                }
+                rebuildIndex();
+            }
+
+            const auto entry = m_index.find(StringUtils::Lower(csName));
+            if (entry != m_index.end())
+            {
+                return static_cast<int>(entry->second);
             }
         }
 
@@ -163,11 +184,15 @@ public:
         if (replaceIdx != (size_t)-1)
         {
             // The color space replaces the existing one.
-            m_colorSpaces[replaceIdx] = cs->createEditableCopy();
+            removeFromIndex(replaceIdx);
+            releaseMember(m_colorSpaces[replaceIdx]);
+            m_colorSpaces[replaceIdx] = createMember(cs);
+            addToIndex(replaceIdx);
             return;
         }
 
-        m_colorSpaces.push_back(cs->createEditableCopy());
+        m_colorSpaces.push_back(createMember(cs));
+        addToIndex(m_colorSpaces.size() - 1);
     }
 
     void add(const Impl & rhs)
@@ -180,15 +205,23 @@ public:
 
     void remove(const char * csName)
     {
-        const std::string name = StringUtils::Lower(csName);
-        if (name.empty()) return;
+        // Only the color space names are removed (i.e. not the aliases).
+        const int entryIdx = getIndex(csName);
+        if (entryIdx == -1 || !EqualsNoCase(m_colorSpaces[entryIdx]->getName(), csName))
+        {
+            return;
+        }
+
+        removeFromIndex(entryIdx);
+        releaseMember(m_colorSpaces[entryIdx]);
+        m_colorSpaces.erase(m_colorSpaces.begin() + entryIdx);
 
-        for (auto itr = m_colorSpaces.begin(); itr != m_colorSpaces.end(); ++itr)
+        // The following color spaces are moved by one position.
+        for (auto & entry : m_index)
         {
-            if (StringUtils::Lower((*itr)->getName())==name)
+            if (entry.second > static_cast<size_t>(entryIdx))
             {
-                m_colorSpaces.erase(itr);
-                return;
+                --entry.second;
             }
         }
     }
@@ -203,12 +236,125 @@ public:
 
     void clear()
     {
+        for (auto & cs : m_colorSpaces)
+        {
+            releaseMember(cs);
+        }
         m_colorSpaces.clear();
+        m_index.clear();
+        m_indexCollisions = false;
     }
 
 private:
+    // Return the copy of the color space to add to the set, which counts the changes of its
+    // name and aliases in the names version of the set.
+    ColorSpaceRcPtr createMember(const ConstColorSpaceRcPtr & cs) const
+    {
+        ColorSpaceRcPtr member = cs->createEditableCopy();
+        member->getImpl()->m_namesVersion = m_namesVersion;
+        return member;
+    }
+
+    // The color space is removed from the set (but could still be used elsewhere).
+    static void releaseMember(const ColorSpaceRcPtr & cs)
+    {
+        cs->getImpl()->m_namesVersion.reset();
+    }
+
+    // Index the (lower case) name and aliases of the color space at the position idx.
+    void addToIndex(size_t idx) const
+    {
+        const ColorSpaceRcPtr & cs = m_colorSpaces[idx];
+
+        addToIndex(StringUtils::Lower(cs->getName()), idx);
+
+        const size_t numAliases = cs->getNumAliases();
+        for (size_t aidx = 0; aidx < numAliases; ++aidx)
+        {
+            addToIndex(StringUtils::Lower(cs->getAlias(aidx)), idx);
+        }
+    }
+
+    // A name or an alias could be used by several color spaces after an in-place rename, then
+    // the first color space wins (i.e. same result as a linear search).
+    void addToIndex(const std::string & key, size_t idx) const
+    {
+        const auto entry = m_index.emplace(key, idx);
+        if (!entry.second && entry.first->second != idx)
+        {
+            m_indexCollisions = true;
+        }
+    }
+
+    void rebuildIndex() const
+    {
+        m_indexVersion = *m_namesVersion;
+        m_index.clear();
+        m_indexCollisions = false;
+        for (size_t idx = 0; idx < m_colorSpaces.size(); ++idx)
+        {
+            addToIndex(idx);
+        }
+    }
+
+    void removeFromIndex(size_t idx)
+    {
+        const ColorSpaceRcPtr & cs = m_colorSpaces[idx];
+
+        removeFromIndex(StringUtils::Lower(cs->getName()), idx);
+
+        const size_t numAliases = cs->getNumAliases();
+        for (size_t aidx = 0; aidx < numAliases; ++aidx)
+        {
+            removeFromIndex(StringUtils::Lower(cs->getAlias(aidx)), idx);
+        }
+    }
+
+    void removeFromIndex(const std::string & key, size_t idx)
+    {
+        const auto entry = m_index.find(key);
+        if (entry == m_index.end() || entry->second != idx)
+        {
+            return;
+        }
+
+        m_index.erase(entry);
+
+        if (m_indexCollisions)
+        {
+            // The key then refers to the next color space using it, if any.
+            for (size_t other = idx + 1; other < m_colorSpaces.size(); ++other)
+            {
+                const ColorSpaceRcPtr & cs = m_colorSpaces[other];
+                bool found = EqualsNoCase(cs->getName(), key.c_str());
+                for (size_t aidx = 0; !found && aidx < cs->getNumAliases(); ++aidx)
+                {
+                    found = EqualsNoCase(cs->getAlias(aidx), key.c_str());
+                }
+
+                if (found)
+                {
+                    m_index.emplace(key, other);
+                    return;
+                }
+            }
+        }
+    }
+
     typedef std::vector<ColorSpaceRcPtr> ColorSpaceVec;
     ColorSpaceVec m_colorSpaces;
+
+    // Counter of the name and alias changes of the color spaces of the set.
+    std::shared_ptr<std::atomic<size_t>> m_namesVersion{ std::make_shared<std::atomic<size_t>>(0) };
+
+    // Case insensitive index of the color space names and aliases i.e. the lower case names and
+    // aliases with the position of their color space. It is up to date with the color space
+    // names when its version is the names version of the set.
+    mutable Mutex m_indexMutex;
+    mutable size_t m_indexVersion{ 0 };
+    mutable std::unordered_map<std::string, size_t> m_index;
+    // A name or an alias of the index is used by several color spaces.
+    mutable bool m_indexCollisions{ false };
 };
 
 
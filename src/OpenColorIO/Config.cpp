@@ -2,11 +2,13 @@
 // Copyright Contributors to the OpenColorIO Project.
 
 
+#include <atomic>
 #include <cstdlib>
 #include <cstring>
 #include <set>
 #include <sstream>
 #include <fstream>
+#include <map>
 #include <utility>
 #include <vector>
 #include <regex>
@@ -17,13 +19,17 @@
 #include <OpenColorIO/OpenColorIO.h>
 
 #include "builtinconfigs/BuiltinConfigRegistry.h"
+#include "Caching.h"
+#include "ColorSpace.h"
 #include "ConfigUtils.h"
 #include "ContextVariableUtils.h"
+#include "DeferredTransform.h"
 #include "Display.h"
 #include "fileformats/FileFormatICC.h"
 #include "FileRules.h"
 #include "HashUtils.h"
 #include "Logging.h"
+#include "Look.h"
 #include "LookParse.h"
 #include "MathUtils.h"
 #include "Mutex.h"
@@ -36,9 +42,11 @@
 #include "Platform.h"
 #include "PrivateTypes.h"
 #include "Processor.h"
+#include "TransformHash.h"
 #include "transforms/FileTransform.h"
 #include "utils/StringUtils.h"
 #include "ViewingRules.h"
+#include "ViewTransform.h"
 #include "SystemMonitor.h"
 
 namespace OCIO_NAMESPACE
@@ -50,6 +58,7 @@ const char * OCIO_ACTIVE_VIEWS_ENVVAR         = "OCIO_ACTIVE_VIEWS";
 const char * OCIO_INACTIVE_COLORSPACES_ENVVAR = "OCIO_INACTIVE_COLORSPACES";
 const char * OCIO_OPTIMIZATION_FLAGS_ENVVAR   = "OCIO_OPTIMIZATION_FLAGS";
 const char * OCIO_USER_CATEGORIES_ENVVAR      = "OCIO_USER_CATEGORIES";
+const char * OCIO_LAZY_CONFIG_LOADING_ENVVAR  = "OCIO_LAZY_CONFIG_LOADING";
 
 // Default filename (with extension) of a config and archived config.
 const char * OCIO_CONFIG_DEFAULT_NAME         = "config";
@@ -262,6 +271,90 @@ public:
         VALIDATION_FAILED
     };
 
+    // The element versions are only accessible to the config.
+    class ElementHashes : public OCIOYaml::ElementHashCache
+    {
+    protected:
+        size_t getVersion(const ColorSpace & cs) const override
+        {
+            return cs.getImpl()->m_version.get();
+        }
+        size_t getVersion(const Look & look) const override
+        {
+            return look.getImpl()->m_version.get();
+        }
+        size_t getVersion(const ViewTransform & vt) const override
+        {
+            return vt.getImpl()->m_version.get();
+        }
+        // Throw for a named transform not created by NamedTransform::Create().
+        size_t getVersion(const NamedTransform & nt) const override
+        {
+            return dynamic_cast<const NamedTransformImpl &>(nt).getVersion();
+        }
+    };
+
+    // The config elements used to create a processor.
+    enum ElementType
+    {
+        ELEMENT_COLORSPACE = 0,
+        ELEMENT_LOOK,
+        ELEMENT_VIEWTRANSFORM,
+        ELEMENT_NAMEDTRANSFORM,
+        ELEMENT_DEFAULT_VIEWTRANSFORM  // Refer to getDefaultSceneToDisplayViewTransform().
+    };
+
+    // The versions of the elements (by type and lower case name) used to create a processor,
+    // where zero means that the element does not exist (refer to ElementVersion).
+    typedef std::map<std::pair<ElementType, std::string>, size_t> ElementVersions;
+
+    // An entry of the processor cache. The versions of the elements used to create the processor
+    // allow the element setters to only remove the processors using a changed element.
+    struct CachedProcessor
+    {
+        ProcessorRcPtr m_processor;
+        ElementVersions m_elementVersions;
+    };
+
+    // The element lookups of the processor creation in progress in the current thread. Note that
+    // the processor creation is done under the lock of the processor cache, but other threads
+    // could still look up the elements of the same config.
+    struct ElementLookups
+    {
+        const Impl * m_config = nullptr;
+        ElementVersions * m_elementVersions = nullptr;
+    };
+
+    static ElementLookups & CurrentElementLookups() noexcept
+    {
+        static thread_local ElementLookups lookups;
+        return lookups;
+    }
+
+    // Record the element lookups of a config in the current thread, while the instance exists.
+    class ElementLookupsGuard
+    {
+    public:
+        ElementLookupsGuard() = delete;
+        ElementLookupsGuard(const ElementLookupsGuard &) = delete;
+        ElementLookupsGuard & operator=(const ElementLookupsGuard &) = delete;
+
+        ElementLookupsGuard(const Impl * config, ElementVersions & elementVersions)
+            :   m_previous(CurrentElementLookups())
+        {
+            CurrentElementLookups().m_config = config;
+            CurrentElementLookups().m_elementVersions = &elementVersions;
+        }
+
+        ~ElementLookupsGuard()
+        {
+            CurrentElementLookups() = m_previous;
+        }
+
+    private:
+        const ElementLookups m_previous;
+    };
+
     unsigned int m_majorVersion;
     unsigned int m_minorVersion;
     StringMap m_env;
@@ -327,10 +420,15 @@ public:
     mutable Mutex m_cacheidMutex;
     mutable StringMap m_cacheids;
     mutable std::string m_cacheidnocontext;
+    // Hashes of the config elements to only serialize again the changed ones.
+    mutable ElementHashes m_elementHashes;
     FileRulesRcPtr m_fileRules;
 
     mutable ProcessorCacheFlags m_cacheFlags { PROCESSOR_CACHE_DEFAULT };
-    mutable ProcessorCache<std::size_t, ProcessorRcPtr> m_processorCache;
+    mutable ProcessorCache<std::size_t, CachedProcessor> m_processorCache;
+    // The processor cache contains processors of the source config (i.e. for a copy), which were
+    // created using its cache flags.
+    mutable bool m_copiedProcessors { false };
 
     Impl() :
         m_majorVersion(LastSupportedMajorVersion),
@@ -443,19 +541,69 @@ public:
             m_validation = rhs.m_validation;
             m_validationtext = rhs.m_validationtext;
 
-            m_cacheids = rhs.m_cacheids;
-            m_cacheidnocontext = rhs.m_cacheidnocontext;
+            {
+                AutoMutex lock(rhs.m_cacheidMutex);
+
+                m_cacheids = rhs.m_cacheids;
+                m_cacheidnocontext = rhs.m_cacheidnocontext;
+
+                // The copy is identical so it reuses the hashes of the source elements and the
+                // serialization of the other members (i.e. the cache ID computation of the copy
+                // does not serialize them).
+                copyElementHashes(rhs);
+            }
 
+            // Deep copy the file rules (only the compiled matchers, which are immutable, are
+            // shared).
             m_fileRules = rhs.m_fileRules->createEditableCopy();
             
             m_cacheFlags = rhs.m_cacheFlags;
 
+            // The copy is identical so the processors of the source config remain valid. A
+            // change of an element only flushes the processors created from it.
             m_processorCache.clear();
+            m_processorCache.setCapacity(rhs.m_processorCache.getCapacity());
             m_processorCache.enable((m_cacheFlags & PROCESSOR_CACHE_ENABLED) == PROCESSOR_CACHE_ENABLED);
+            m_processorCache.copyEntries(rhs.m_processorCache);
+            m_copiedProcessors = m_processorCache.getStatistics().m_size > 0;
         }
         return *this;
     }
 
+    // Reuse the cached hashes of the source config elements for their (identical) copies, and
+    // the serialization of the other members. Note that the cache ID mutex of the source config
+    // must be held.
+    void copyElementHashes(const Impl & rhs)
+    {
+        m_elementHashes = ElementHashes();
+        m_elementHashes.copyMembers(rhs.m_elementHashes);
+
+        for (int i = 0; i < m_allColorSpaces->getNumColorSpaces(); ++i)
+        {
+            m_elementHashes.copyEntry(rhs.m_elementHashes,
+                                      rhs.m_allColorSpaces->getColorSpaceByIndex(i).get(),
+                                      m_allColorSpaces->getColorSpaceByIndex(i));
+        }
+        for (size_t i = 0; i < m_looksList.size(); ++i)
+        {
+            m_elementHashes.copyEntry(rhs.m_elementHashes,
+                                      rhs.m_looksList[i].get(),
+                                      m_looksList[i]);
+        }
+        for (size_t i = 0; i < m_viewTransforms.size(); ++i)
+        {
+            m_elementHashes.copyEntry(rhs.m_elementHashes,
+                                      rhs.m_viewTransforms[i].get(),
+                                      m_viewTransforms[i]);
+        }
+        for (size_t i = 0; i < m_allNamedTransforms.size(); ++i)
+        {
+            m_elementHashes.copyEntry(rhs.m_elementHashes,
+                                      rhs.m_allNamedTransforms[i].get(),
+                                      m_allNamedTransforms[i]);
+        }
+    }
+
     ConstColorSpaceRcPtr getColorSpace(const char * name) const
     {
         // Check to see if the name is a color space.
@@ -467,6 +615,8 @@ public:
             cs = m_allColorSpaces->getColorSpace(csname);
         }
 
+        recordLookup(ELEMENT_COLORSPACE, name, cs ? cs->getImpl()->m_version.get() : 0);
+
         return cs;
     }
 
@@ -487,9 +637,13 @@ public:
         size_t index = getNamedTransformIndex(name);
         if (index >= m_allNamedTransforms.size())
         {
+            recordLookup(ELEMENT_NAMEDTRANSFORM, name, 0);
             return ConstNamedTransformRcPtr();
         }
 
+        recordLookup(ELEMENT_NAMEDTRANSFORM, name,
+                     dynamic_cast<const NamedTransformImpl &>(*m_allNamedTransforms[index]).getVersion());
+
         return m_allNamedTransforms[index];
     }
 
@@ -534,13 +688,49 @@ public:
         {
             if (StringUtils::Lower(vt->getName()) == namelower)
             {
+                recordLookup(ELEMENT_VIEWTRANSFORM, name, vt->getImpl()->m_version.get());
                 return vt;
             }
         }
 
+        recordLookup(ELEMENT_VIEWTRANSFORM, name, 0);
         return ConstViewTransformRcPtr();
     }
 
+    ConstViewTransformRcPtr getDefaultSceneToDisplayViewTransform() const
+    {
+        // The default view transform between the main reference space (scene-referred) and the
+        // display-referred space if it is not defined, it is the first one in the list that uses
+        // a scene-referred reference space.
+
+        ConstViewTransformRcPtr defaultVT;
+
+        if (!m_defaultViewTransform.empty())
+        {
+            const auto vt = getViewTransform(m_defaultViewTransform.c_str());
+            if (vt && vt->getReferenceSpaceType() == REFERENCE_SPACE_SCENE)
+            {
+                defaultVT = vt;
+            }
+        }
+        if (!defaultVT)
+        {
+            for (const auto & viewTransform : m_viewTransforms)
+            {
+                if (viewTransform->getReferenceSpaceType() == REFERENCE_SPACE_SCENE)
+                {
+                    defaultVT = viewTransform;
+                    break;
+                }
+            }
+        }
+
+        recordLookup(ELEMENT_DEFAULT_VIEWTRANSFORM, "",
+                     defaultVT ? defaultVT->getImpl()->m_version.get() : 0);
+
+        return defaultVT;
+    }
+
     ConstLookRcPtr getLook(const char * name) const
     {
         const std::string namelower = StringUtils::Lower(name);
@@ -549,13 +739,79 @@ public:
         {
             if (StringUtils::Lower(look->getName()) == namelower)
             {
+                recordLookup(ELEMENT_LOOK, name, look->getImpl()->m_version.get());
                 return look;
             }
         }
 
+        recordLookup(ELEMENT_LOOK, name, 0);
         return ConstLookRcPtr();
     }
 
+    // Record the version of a looked up element when the current thread creates a processor of
+    // the config (refer to Config::getProcessor()).
+    void recordLookup(ElementType type, const char * name, size_t version) const
+    {
+        const ElementLookups & lookups = CurrentElementLookups();
+        if (lookups.m_config == this)
+        {
+            (*lookups.m_elementVersions)[{ type, StringUtils::Lower(name) }] = version;
+        }
+    }
+
+    // Get the current version of an element, or zero if it does not exist.
+    size_t getElementVersion(ElementType type, const std::string & name) const
+    {
+        switch (type)
+        {
+            case ELEMENT_COLORSPACE:
+            {
+                const auto cs = getColorSpace(name.c_str());
+                return cs ? cs->getImpl()->m_version.get() : 0;
+            }
+            case ELEMENT_LOOK:
+            {
+                const auto look = getLook(name.c_str());
+                return look ? look->getImpl()->m_version.get() : 0;
+            }
+            case ELEMENT_VIEWTRANSFORM:
+            {
+                const auto vt = getViewTransform(name.c_str());
+                return vt ? vt->getImpl()->m_version.get() : 0;
+            }
+            case ELEMENT_NAMEDTRANSFORM:
+            {
+                const auto nt = getNamedTransform(name.c_str());
+                return nt ? dynamic_cast<const NamedTransformImpl &>(*nt).getVersion() : 0;
+            }
+            case ELEMENT_DEFAULT_VIEWTRANSFORM:
+            {
+                const auto vt = getDefaultSceneToDisplayViewTransform();
+                return vt ? vt->getImpl()->m_version.get() : 0;
+            }
+        }
+        return 0;
+    }
+
+    // Remove the cached processors created from an element which changed since then (i.e. an
+    // added, removed or edited element), and keep the others.
+    void evictChangedProcessors() const
+    {
+        AutoMutex guard(m_processorCache.lock());
+
+        m_processorCache.erase([this](const CachedProcessor & entry)
+        {
+            for (const auto & element : entry.m_elementVersions)
+            {
+                if (getElementVersion(element.first.first, element.first.second) != element.second)
+                {
+                    return true;
+                }
+            }
+            return false;
+        });
+    }
+
     ViewPtrVec getViews(const Display & display) const
     {
         ViewPtrVec views;
@@ -581,6 +837,13 @@ public:
     // thread safe manner by acquiring the m_cacheidMutex.
     void resetCacheIDs();
 
+    // Same as resetCacheIDs() after a change of the config elements only (i.e. the color spaces,
+    // looks, view transforms and named transforms), which keeps the serialization of the other
+    // config members for the cache ID, and the processors created from the unchanged elements.
+    void resetElementCacheIDs();
+
+    void clearCacheIDs();
+
     // Get all internal transforms (to generate cacheIDs, validation, etc).
     // This currently crawls colorspaces + looks + view transforms.
     void getAllInternalTransforms(ConstTransformVec & transformVec) const;
@@ -778,8 +1041,11 @@ public:
         refreshActiveColorSpaces();
     }
 
-    void checkVersionConsistency(ConstTransformRcPtr & transform) const;
-    void checkVersionConsistency() const;
+    static void CheckVersionConsistency(const ConstTransformRcPtr & transform,
+                                        unsigned int majorVersion,
+                                        unsigned int minorVersion);
+    // Note that the transforms of a lazily loaded config are created to be checked.
+    void checkVersionConsistency(bool checkTransforms = true) const;
 
     const View * getView(const char * display, const char * view) const
     {
@@ -928,6 +1194,14 @@ public:
 
     void setProcessorCacheFlags(ProcessorCacheFlags flags) const noexcept
     {
+        if (flags != m_cacheFlags && m_copiedProcessors)
+        {
+            // The processors of the source config must not be shared using other flags (e.g.
+            // the ones sharing the dynamic properties).
+            m_processorCache.clear();
+            m_copiedProcessors = false;
+        }
+
         m_cacheFlags = flags;
         m_processorCache.enable((m_cacheFlags & PROCESSOR_CACHE_ENABLED) == PROCESSOR_CACHE_ENABLED);
     }
@@ -1263,6 +1537,218 @@ ConstConfigRcPtr Config::CreateFromBuiltinConfig(const char * configName)
     return builtinConfig;
 }
 
+namespace
+{
+
+// The environment variables read when loading a config i.e. the ones overriding the active
+// displays, views and color spaces, and the context variables of the config.
+typedef std::vector<std::pair<std::string, std::string>> EnvSnapshot;
+
+void AddEnvVariable(EnvSnapshot & snapshot, const char * name)
+{
+    std::string value;
+    if (!Platform::Getenv(name, value))
+    {
+        // A missing variable differs from an empty one.
+        value = std::string(1, '\0');
+    }
+    snapshot.emplace_back(name, value);
+}
+
+EnvSnapshot GetEnvSnapshot(const Config & config)
+{
+    EnvSnapshot snapshot;
+
+    AddEnvVariable(snapshot, OCIO_ACTIVE_DISPLAYS_ENVVAR);
+    AddEnvVariable(snapshot, OCIO_ACTIVE_VIEWS_ENVVAR);
+    AddEnvVariable(snapshot, OCIO_INACTIVE_COLORSPACES_ENVVAR);
+
+    ConstContextRcPtr context = config.getCurrentContext();
+    const int numVars = context->getNumStringVars();
+    for (int idx = 0; idx < numVars; ++idx)
+    {
+        AddEnvVariable(snapshot, context->getStringVarNameByIndex(idx));
+    }
+
+    return snapshot;
+}
+
+bool IsEnvSnapshotValid(const EnvSnapshot & snapshot)
+{
+    std::string value;
+    for (const auto & var : snapshot)
+    {
+        if (!Platform::Getenv(var.first.c_str(), value))
+        {
+            value = std::string(1, '\0');
+        }
+
+        if (value != var.second)
+        {
+            return false;
+        }
+    }
+    return true;
+}
+
+struct ConfigCacheEntry
+{
+    Mutex mutex;
+    ConstConfigRcPtr config;
+
+    // The file system information and the environment when the config was loaded, to detect
+    // that the config must be loaded again.
+    bool exists = false;
+    Platform::FileStamp stamp;
+    EnvSnapshot env;
+
+    ConfigCacheEntry() = default;
+};
+
+typedef OCIO_SHARED_PTR<ConfigCacheEntry> ConfigCacheEntryRcPtr;
+
+// The cache of the configs created by Config::CreateFromFileCached, using the absolute config
+// filepaths (or the built-in config URIs) as keys.
+class ConfigCache : public GenericCache<std::string, ConfigCacheEntryRcPtr>
+{
+public:
+    ConfigCache() = default;
+
+    CacheStatistics getStatistics() const
+    {
+        CacheStatistics stats = GenericCache<std::string, ConfigCacheEntryRcPtr>::getStatistics();
+        stats.m_invalidations = m_invalidations;
+        return stats;
+    }
+
+    // Check if the config file or the environment changed since the config was loaded, in which
+    // case the config is discarded. Note that the lock of the entry must be held.
+    void validate(ConfigCacheEntry & entry, const std::string & filepath)
+    {
+        if (!entry.config)
+        {
+            return;
+        }
+
+        Platform::FileStamp stamp;
+        const bool exists = Platform::GetFileStamp(filepath, stamp);
+        if (exists == entry.exists && (!exists || stamp == entry.stamp)
+            && IsEnvSnapshotValid(entry.env))
+        {
+            return;
+        }
+
+        entry.config.reset();
+        ++m_invalidations;
+    }
+
+    // Note that the lock of the entry must be held.
+    void load(ConfigCacheEntry & entry, const std::string & filepath)
+    {
+        // Get the stamp before reading the file so that a concurrent change is never missed.
+        entry.exists = Platform::GetFileStamp(filepath, entry.stamp);
+        entry.config = Config::CreateFromFile(filepath.c_str());
+        entry.env    = GetEnvSnapshot(*entry.config);
+    }
+
+private:
+    std::atomic<size_t> m_invalidations{ 0 };
+};
+
+ConfigCache g_configCache;
+
+} // anon.
+
+ConstConfigRcPtr Config::CreateFromEnvCached()
+{
+    std::string file;
+    Platform::Getenv(OCIO_CONFIG_ENVVAR, file);
+
+    if(!file.empty()) return CreateFromFileCached(file.c_str());
+
+    static const char err[] =
+        "Color management disabled. (Specify the $OCIO environment variable to enable.)";
+
+    LogInfo(err);
+
+    return CreateRaw();
+}
+
+ConstConfigRcPtr Config::CreateFromFileCached(const char * filename)
+{
+    if (!filename || !*filename)
+    {
+        throw ExceptionMissingFile ("The config filepath is missing.");
+    }
+
+    if (!g_configCache.isEnabled())
+    {
+        return CreateFromFile(filename);
+    }
+
+    // The built-in config URIs are not file paths.
+    static const std::regex uriPattern(R"(ocio:\/\/([^\s]+))");
+    const std::string filepath
+        = std::regex_search(std::string(filename), uriPattern) ? filename : AbsPath(filename);
+
+    ConfigCacheEntryRcPtr entry = g_configCache.getSharedEntry(filepath);
+
+    AutoMutex lock(entry->mutex);
+
+    g_configCache.validate(*entry, filepath);
+    if (!entry->config)
+    {
+        g_configCache.load(*entry, filepath);
+    }
+
+    return entry->config;
+}
+
+void ClearConfigCache()
+{
+    g_configCache.clear();
+}
+
+void SetConfigCacheCapacity(size_t capacity)
+{
+    g_configCache.setCapacity(capacity);
+}
+
+size_t GetConfigCacheCapacity()
+{
+    return g_configCache.getCapacity();
+}
+
+CacheStatistics GetConfigCacheStatistics()
+{
+    return g_configCache.getStatistics();
+}
+
+namespace
+{
+
+bool IsLazyConfigLoadingEnvSet()
+{
+    std::string envvar;
+    int value = 0;
+    return Platform::Getenv(OCIO_LAZY_CONFIG_LOADING_ENVVAR, envvar)
+           && StringToInt(&value, envvar.c_str(), true) && value != 0;
+}
+
+std::atomic<bool> g_lazyConfigLoading{ IsLazyConfigLoadingEnvSet() };
+
+} // anon.
+
+void SetLazyConfigLoading(bool lazy)
+{
+    g_lazyConfigLoading = lazy;
+}
+
+bool GetLazyConfigLoading()
+{
+    return g_lazyConfigLoading;
+}
+
 ///////////////////////////////////////////////////////////////////////////
 
 Config::Config()
@@ -2097,6 +2583,9 @@ const char * Config::getName() const noexcept
 void Config::setName(const char * name) noexcept
 {
     getImpl()->m_name = (name ? name : "");
+
+    AutoMutex lock(getImpl()->m_cacheidMutex);
+    getImpl()->resetCacheIDs();
 }
 
 ///////////////////////////////////////////////////////////////////////////
@@ -2136,6 +2625,9 @@ const char * Config::getDescription() const
 void Config::setDescription(const char * description)
 {
     getImpl()->m_description = (description ? description : "");
+
+    AutoMutex lock(getImpl()->m_cacheidMutex);
+    getImpl()->resetCacheIDs();
 }
 
 // RESOURCES //////////////////////////////////////////////////////////////
@@ -2625,7 +3117,7 @@ void Config::addColorSpace(const ConstColorSpaceRcPtr & original)
     getImpl()->m_allColorSpaces->addColorSpace(original);
 
     AutoMutex lock(getImpl()->m_cacheidMutex);
-    getImpl()->resetCacheIDs();
+    getImpl()->resetElementCacheIDs();
     getImpl()->refreshActiveColorSpaces();
 }
 
@@ -2634,7 +3126,7 @@ void Config::removeColorSpace(const char * name)
     getImpl()->m_allColorSpaces->removeColorSpace(name);
 
     AutoMutex lock(getImpl()->m_cacheidMutex);
-    getImpl()->resetCacheIDs();
+    getImpl()->resetElementCacheIDs();
     getImpl()->refreshActiveColorSpaces();
 }
 
@@ -2649,7 +3141,16 @@ bool Config::isColorSpaceUsed(const char * name) const noexcept
     // Check for all color spaces, looks and view transforms.
 
     ConstTransformVec allTransforms;
-    getImpl()->getAllInternalTransforms(allTransforms);
+    try
+    {
+        getImpl()->getAllInternalTransforms(allTransforms);
+    }
+    catch (...)
+    {
+        // A transform of a lazily loaded config failed to load, so the color space may be used
+        // by it.
+        return true;
+    }
 
     std::set<std::string> colorSpaceNames;
     for (const auto & transform : allTransforms)
@@ -2757,7 +3258,7 @@ void Config::clearColorSpaces()
     getImpl()->m_allColorSpaces->clearColorSpaces();
 
     AutoMutex lock(getImpl()->m_cacheidMutex);
-    getImpl()->resetCacheIDs();
+    getImpl()->resetElementCacheIDs();
     getImpl()->refreshActiveColorSpaces();
 }
 
@@ -3159,8 +3660,9 @@ void Config::addNamedTransform(const ConstNamedTransformRcPtr & nt)
     {
         throw Exception("Named transform must have a non-empty name.");
     }
-    if (!nt->getTransform(TRANSFORM_DIR_FORWARD) &&
-        !nt->getTransform(TRANSFORM_DIR_INVERSE))
+    // Note that the transforms of a lazily loaded config are not created.
+    if (!HasTransform(*nt, TRANSFORM_DIR_FORWARD) &&
+        !HasTransform(*nt, TRANSFORM_DIR_INVERSE))
     {
         throw Exception("Named transform must define at least one transform.");
     }
@@ -3275,7 +3777,7 @@ void Config::addNamedTransform(const ConstNamedTransformRcPtr & nt)
         getImpl()->m_allNamedTransforms.push_back(namedTransformCopy);
     }
 
-    getImpl()->resetCacheIDs();
+    getImpl()->resetElementCacheIDs();
     getImpl()->refreshActiveColorSpaces();
 }
 
@@ -3283,7 +3785,7 @@ void Config::clearNamedTransforms()
 {
     getImpl()->m_allNamedTransforms.clear();
 
-    getImpl()->resetCacheIDs();
+    getImpl()->resetElementCacheIDs();
     getImpl()->refreshActiveColorSpaces();
 }
 
@@ -4283,7 +4785,7 @@ void Config::addLook(const ConstLookRcPtr & look)
             getImpl()->m_looksList[i] = look->createEditableCopy();
 
             AutoMutex lock(getImpl()->m_cacheidMutex);
-            getImpl()->resetCacheIDs();
+            getImpl()->resetElementCacheIDs();
 
             return;
         }
@@ -4293,7 +4795,7 @@ void Config::addLook(const ConstLookRcPtr & look)
     getImpl()->m_looksList.push_back(look->createEditableCopy());
 
     AutoMutex lock(getImpl()->m_cacheidMutex);
-    getImpl()->resetCacheIDs();
+    getImpl()->resetElementCacheIDs();
 }
 
 void Config::clearLooks()
@@ -4301,7 +4803,7 @@ void Config::clearLooks()
     getImpl()->m_looksList.clear();
 
     AutoMutex lock(getImpl()->m_cacheidMutex);
-    getImpl()->resetCacheIDs();
+    getImpl()->resetElementCacheIDs();
 }
 
 ///////////////////////////////////////////////////////////////////////////
@@ -4328,29 +4830,7 @@ const char * Config::getViewTransformNameByIndex(int index) const noexcept
 
 ConstViewTransformRcPtr Config::getDefaultSceneToDisplayViewTransform() const
 {
-    // The default view transform between the main reference space (scene-referred) and the
-    // display-referred space if it is not defined, it is the first one in the list that uses
-    // a scene-referred reference space.
-
-    if (!getImpl()->m_defaultViewTransform.empty())
-    {
-        const auto vt = getImpl()->getViewTransform(getImpl()->m_defaultViewTransform.c_str());
-        if (vt)
-        {
-            if (vt->getReferenceSpaceType() == REFERENCE_SPACE_SCENE)
-            {
-                return vt;
-            }
-        }
-    }
-    for (const auto & viewTransform : getImpl()->m_viewTransforms)
-    {
-        if (viewTransform->getReferenceSpaceType() == REFERENCE_SPACE_SCENE)
-        {
-            return viewTransform;
-        }
-    }
-    return ConstViewTransformRcPtr();
+    return getImpl()->getDefaultSceneToDisplayViewTransform();
 }
 
 const char * Config::getDefaultViewTransformName() const noexcept
@@ -4363,7 +4843,7 @@ void Config::setDefaultViewTransformName(const char * defaultVT) noexcept
     getImpl()->m_defaultViewTransform = defaultVT ? defaultVT : "";
 
     AutoMutex lock(getImpl()->m_cacheidMutex);
-    getImpl()->resetCacheIDs();
+    getImpl()->resetElementCacheIDs();
 }
 
 void Config::addViewTransform(const ConstViewTransformRcPtr & viewTransform)
@@ -4404,7 +4884,7 @@ void Config::addViewTransform(const ConstViewTransformRcPtr & viewTransform)
     }
 
     AutoMutex lock(getImpl()->m_cacheidMutex);
-    getImpl()->resetCacheIDs();
+    getImpl()->resetElementCacheIDs();
 }
 
 void Config::clearViewTransforms()
@@ -4412,7 +4892,7 @@ void Config::clearViewTransforms()
     getImpl()->m_viewTransforms.clear();
 
     AutoMutex lock(getImpl()->m_cacheidMutex);
-    getImpl()->resetCacheIDs();
+    getImpl()->resetElementCacheIDs();
 }
 
 ///////////////////////////////////////////////////////////////////////////
@@ -4443,6 +4923,29 @@ const char * Config::getColorSpaceFromFilepath(const char * filePath, size_t & r
                                                                         ruleIndex);
 }
 
+void Config::getColorSpacesFromFilepaths(const char * const * filePaths,
+                                         size_t numFilePaths,
+                                         const char ** colorSpaces,
+                                         size_t * ruleIndices) const
+{
+    if (numFilePaths == 0)
+    {
+        return;
+    }
+
+    if (!filePaths || !colorSpaces)
+    {
+        throw Exception("Config::getColorSpacesFromFilepaths: the file paths and the color "
+                        "spaces can't be null.");
+    }
+
+    getImpl()->m_fileRules->getImpl()->getColorSpacesFromFilepaths(*this,
+                                                                   filePaths,
+                                                                   numFilePaths,
+                                                                   colorSpaces,
+                                                                   ruleIndices);
+}
+
 bool Config::filepathOnlyMatchesDefaultRule(const char * filePath) const
 {
     return getImpl()->m_fileRules->getImpl()->filepathOnlyMatchesDefaultRule(*this,
@@ -4608,21 +5111,37 @@ ConstProcessorRcPtr Config::getProcessor(const ConstContextRcPtr & context,
     {
         AutoMutex guard(getImpl()->m_processorCache.lock());
 
-        // Note that the key includes a string description of the transform which does not include
-        // all the LUT entries (just the arguments of the FileTransforms for LUTs).
-        std::ostringstream oss;
-        oss << (needContextVariables ? std::string(usedContext->getCacheID()) : "")
-            << *transform
-            << direction;
+        // Note that the key is computed from the transform content without serializing it, and
+        // only includes the arguments of the FileTransforms for LUTs.
+        std::size_t key = GetTransformHash(*transform);
+        HashCombine(key, direction);
+        if (needContextVariables)
+        {
+            HashCombine(key, usedContext->getCacheID());
+        }
+
+        // As the entry holds a shared pointer instance, having an empty one means that the entry
+        // does not exist in the cache. So, it provides a fast existence check & access in one call.
+        Impl::CachedProcessor & entry = getImpl()->m_processorCache[key];
+        ProcessorRcPtr & processor = entry.m_processor;
 
-        const std::size_t key = std::hash<std::string>{}(oss.str());
+        // Only rebuild the processor if one of its files was modified (when the validation of the
+        // FileTransform cache is enabled).
+        if (processor && processor->getImpl()->hasModifiedFiles())
+        {
+            processor.reset();
+        }
 
-        // As the entry is a shared pointer instance, having an empty one means that the entry does
-        // not exist in the cache. So, it provides a fast existence check & access in one call.
-        ProcessorRcPtr & processor = getImpl()->m_processorCache[key];
         if (!processor)
         {
-            ProcessorRcPtr proc = CreateProcessor(*this, context, transform, direction);
+            Impl::ElementVersions elementVersions;
+            ProcessorRcPtr proc;
+            {
+                // Record the elements used to create the processor, so the changes of the other
+                // elements keep it in the cache (refer to Impl::evictChangedProcessors()).
+                Impl::ElementLookupsGuard guard(getImpl(), elementVersions);
+                proc = CreateProcessor(*this, context, transform, direction);
+            }
 
             const bool doFallback = !Platform::isEnvPresent(OCIO_DISABLE_CACHE_FALLBACK);
             if (doFallback)
@@ -4639,11 +5158,13 @@ ConstProcessorRcPtr Config::getProcessor(const ConstContextRcPtr & context,
                 // compare the two contexts before doing the lengthy Processor::getCacheID()
                 // computation.
 
-                for (auto & entry : getImpl()->m_processorCache)
+                for (auto & cached : getImpl()->m_processorCache)
                 {
-                    if (entry.second && 0 == strcmp(entry.second->getCacheID(), proc->getCacheID()))
+                    const ProcessorRcPtr & cachedProc = cached.second.m_processor;
+                    if (cachedProc && 0 == strcmp(cachedProc->getCacheID(), proc->getCacheID())
+                        && !cachedProc->getImpl()->hasModifiedFiles())
                     {
-                        processor = entry.second;
+                        processor = cachedProc;
                         break;
                     }
                 }
@@ -4653,6 +5174,7 @@ ConstProcessorRcPtr Config::getProcessor(const ConstContextRcPtr & context,
             {
                 processor = proc;
             }
+            entry.m_elementVersions = std::move(elementVersions);
         }
 
         return processor;
@@ -5038,11 +5560,32 @@ const char * Config::getCacheID(const ConstContextRcPtr & context) const
         return cacheiditer->second.c_str();
     }
 
-    // Include the hash of the yaml config serialization
+    // Include the hash of the yaml config serialization where the color spaces, looks, view
+    // transforms and named transforms are replaced by their own (cached) hash.
     if(getImpl()->m_cacheidnocontext.empty())
     {
         std::ostringstream cacheid;
-        serialize(cacheid);
+        try
+        {
+            getImpl()->checkVersionConsistency();
+
+            // The file rules, the viewing rules and the context could also be edited in place
+            // (e.g. the const is lost in the Python binding).
+            std::ostringstream membersVersion;
+            membersVersion << getImpl()->m_fileRules->getImpl()->m_version.get() << " "
+                           << getImpl()->m_viewingRules->getImpl()->m_version.get() << " "
+                           << getImpl()->m_context->getCacheID();
+            getImpl()->m_elementHashes.setMembersVersion(membersVersion.str());
+
+            OCIOYaml::WriteCacheID(cacheid, *this, getImpl()->m_elementHashes);
+        }
+        catch (const std::exception & e)
+        {
+            std::ostringstream error;
+            error << "Error building YAML: " << e.what();
+            throw Exception(error.str().c_str());
+        }
+
         const std::string fullstr = cacheid.str();
         getImpl()->m_cacheidnocontext = CacheIDHash(fullstr.c_str(), fullstr.size());
     }
@@ -5120,6 +5663,22 @@ void Config::setProcessorCacheFlags(ProcessorCacheFlags flags) const noexcept
 void Config::clearProcessorCache() noexcept
 {
     getImpl()->m_processorCache.clear();
+    getImpl()->m_copiedProcessors = false;
+}
+
+void Config::setProcessorCacheCapacity(size_t capacity)
+{
+    getImpl()->m_processorCache.setCapacity(capacity);
+}
+
+size_t Config::getProcessorCacheCapacity() const noexcept
+{
+    return getImpl()->m_processorCache.getCapacity();
+}
+
+CacheStatistics Config::getProcessorCacheStatistics() const
+{
+    return getImpl()->m_processorCache.getStatistics();
 }
 
 ///////////////////////////////////////////////////////////////////////////
@@ -5240,14 +5799,29 @@ void Config::Impl::refreshActiveColorSpaces()
 
 void Config::Impl::resetCacheIDs()
 {
-    m_cacheids.clear();
-    m_cacheidnocontext = "";
-    m_validation = VALIDATION_UNKNOWN;
-    m_validationtext = "";
+    m_elementHashes.resetMembers();
+    clearCacheIDs();
 
     // As any changes could impact the cache keys, it's better to always flush the cache
     // of processors to not keep in memory useless instances.
     m_processorCache.clear();
+    m_copiedProcessors = false;
+}
+
+void Config::Impl::resetElementCacheIDs()
+{
+    clearCacheIDs();
+
+    // Only flush the processors created from the changed elements.
+    evictChangedProcessors();
+}
+
+void Config::Impl::clearCacheIDs()
+{
+    m_cacheids.clear();
+    m_cacheidnocontext = "";
+    m_validation = VALIDATION_UNKNOWN;
+    m_validationtext = "";
 }
 
 void Config::Impl::getAllInternalTransforms(ConstTransformVec & transformVec) const
@@ -5325,9 +5899,13 @@ void Config::Impl::getAllInternalTransforms(ConstTransformVec & transformVec) co
 ConstConfigRcPtr Config::Impl::Read(std::istream & istream, const char * filename)
 {
     ConfigRcPtr config = Config::Create();
-    OCIOYaml::Read(istream, config, filename);
 
-    config->getImpl()->checkVersionConsistency();
+    // The transforms of a lazily loaded config are checked on their creation.
+    const bool lazy = GetLazyConfigLoading();
+    OCIOYaml::Read(istream, config, filename,
+                   lazy ? &Config::Impl::CheckVersionConsistency : OCIOYaml::TransformCheck());
+
+    config->getImpl()->checkVersionConsistency(!lazy);
 
     // An API request always supersedes the env. variable. As the OCIOYaml helper methods
     // use the Config public API, the variable reset highlights that only the
@@ -5344,9 +5922,11 @@ ConstConfigRcPtr Config::Impl::Read(std::istream & istream, ConfigIOProxyRcPtr c
     // Passing special string for the file path to enable the parser to provide a more
     // meaningful error message if a problem is encountered.  (The working directory is not
     // set to this string.)
-    OCIOYaml::Read(istream, config, "from Archive/ConfigIOProxy");
+    const bool lazy = GetLazyConfigLoading();
+    OCIOYaml::Read(istream, config, "from Archive/ConfigIOProxy",
+                   lazy ? &Config::Impl::CheckVersionConsistency : OCIOYaml::TransformCheck());
 
-    config->getImpl()->checkVersionConsistency();
+    config->getImpl()->checkVersionConsistency(!lazy);
 
     // An API request always supersedes the env. variable. As the OCIOYaml helper methods
     // use the Config public API, the variable reset highlights that only the
@@ -5360,24 +5940,26 @@ ConstConfigRcPtr Config::Impl::Read(std::istream & istream, ConfigIOProxyRcPtr c
     return config;
 }
 
-void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) const
+void Config::Impl::CheckVersionConsistency(const ConstTransformRcPtr & transform,
+                                           unsigned int majorVersion,
+                                           unsigned int minorVersion)
 {
     if (transform)
     {
         if (ConstBuiltinTransformRcPtr blt = DynamicPtrCast<const BuiltinTransform>(transform))
         {
-            if (m_majorVersion < 2)
+            if (majorVersion < 2)
             {
                 throw Exception("Only config version 2 (or higher) can have BuiltinInTransform.");
             }
 
-            if (m_majorVersion == 2 && m_minorVersion < 1
+            if (majorVersion == 2 && minorVersion < 1
                     && 0 == Platform::Strcasecmp(blt->getStyle(), "ACES-LMT - ACES 1.3 Reference Gamut Compression"))
             {
                 throw Exception("Only config version 2.1 (or higher) can have "
                                 "BuiltinTransform style 'ACES-LMT - ACES 1.3 Reference Gamut Compression'.");
             }
-            if (m_majorVersion == 2 && m_minorVersion < 2 
+            if (majorVersion == 2 && minorVersion < 2 
                     && (   0 == Platform::Strcasecmp(blt->getStyle(), "ARRI_LOGC4_to_ACES2065-1")
                         || 0 == Platform::Strcasecmp(blt->getStyle(), "CURVE - CANON_CLOG2_to_LINEAR")
                         || 0 == Platform::Strcasecmp(blt->getStyle(), "CURVE - CANON_CLOG3_to_LINEAR") )
@@ -5388,13 +5970,13 @@ void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) cons
                    << blt->getStyle() << "'.";
                 throw Exception(os.str().c_str());
             }
-            if (m_majorVersion == 2 && m_minorVersion < 3
+            if (majorVersion == 2 && minorVersion < 3
                     && 0 == Platform::Strcasecmp(blt->getStyle(), "DISPLAY - CIE-XYZ-D65_to_DisplayP3"))
             {
                 throw Exception("Only config version 2.3 (or higher) can have "
                                 "BuiltinTransform style 'DISPLAY - CIE-XYZ-D65_to_DisplayP3'.");
             }
-            if (m_majorVersion == 2 && m_minorVersion < 4 
+            if (majorVersion == 2 && minorVersion < 4 
                     && (   0 == Platform::Strcasecmp(blt->getStyle(), "APPLE_LOG_to_ACES2065-1")
                         || 0 == Platform::Strcasecmp(blt->getStyle(), "CURVE - APPLE_LOG_to_LINEAR")
                         || 0 == Platform::Strcasecmp(blt->getStyle(), "CURVE - HLG-OETF")
@@ -5444,7 +6026,7 @@ void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) cons
         }
         else if (ConstCDLTransformRcPtr cdl = DynamicPtrCast<const CDLTransform>(transform))
         {
-            if (m_majorVersion < 2 && cdl->getStyle() != CDL_TRANSFORM_DEFAULT)
+            if (majorVersion < 2 && cdl->getStyle() != CDL_TRANSFORM_DEFAULT)
             {
                 throw Exception("Only config version 2 (or higher) can have style for "
                                 "CDLTransform.");
@@ -5452,7 +6034,7 @@ void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) cons
         }
         else if (DynamicPtrCast<const DisplayViewTransform>(transform))
         {
-            if (m_majorVersion < 2)
+            if (majorVersion < 2)
             {
                 throw Exception("Only config version 2 (or higher) can have DisplayViewTransform.");
             }
@@ -5460,7 +6042,7 @@ void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) cons
         else if (ConstExponentTransformRcPtr ex =
                  DynamicPtrCast<const ExponentTransform>(transform))
         {
-            if (m_majorVersion < 2 && ex->getNegativeStyle() != NEGATIVE_CLAMP)
+            if (majorVersion < 2 && ex->getNegativeStyle() != NEGATIVE_CLAMP)
             {
                 throw Exception("Config version 1 only supports ExponentTransform clamping "
                                 "negative values.");
@@ -5468,7 +6050,7 @@ void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) cons
         }
         else if (DynamicPtrCast<const ExponentWithLinearTransform>(transform))
         {
-            if (m_majorVersion < 2)
+            if (majorVersion < 2)
             {
                 throw Exception("Only config version 2 (or higher) can have "
                                 "ExponentWithLinearTransform.");
@@ -5476,7 +6058,7 @@ void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) cons
         }
         else if (DynamicPtrCast<const ExposureContrastTransform>(transform))
         {
-            if (m_majorVersion < 2)
+            if (majorVersion < 2)
             {
                 throw Exception("Only config version 2 (or higher) can have "
                                 "ExposureContrastTransform.");
@@ -5484,7 +6066,7 @@ void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) cons
         }
         else if (ConstFileTransformRcPtr ft = DynamicPtrCast<const FileTransform>(transform))
         {
-            if (m_majorVersion < 2)
+            if (majorVersion < 2)
             {
                 if (ft->getInterpolation() == INTERP_CUBIC)
                 {
@@ -5501,19 +6083,19 @@ void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) cons
         else if (ConstFixedFunctionTransformRcPtr ff = DynamicPtrCast<const FixedFunctionTransform>(transform))
         {
             auto ffstyle = ff->getStyle();
-            if (m_majorVersion < 2)
+            if (majorVersion < 2)
             {
                 throw Exception("Only config version 2 (or higher) can have "
                                 "FixedFunctionTransform.");
             }
 
-            if (m_majorVersion == 2 && m_minorVersion < 1 && ffstyle == FIXED_FUNCTION_ACES_GAMUT_COMP_13)
+            if (majorVersion == 2 && minorVersion < 1 && ffstyle == FIXED_FUNCTION_ACES_GAMUT_COMP_13)
             {
                 throw Exception("Only config version 2.1 (or higher) can have "
                                 "FixedFunctionTransform style 'ACES_GAMUT_COMP_13'.");
             }
 
-            if (m_majorVersion == 2 && m_minorVersion < 4 )
+            if (majorVersion == 2 && minorVersion < 4 )
             {
                 if( ffstyle == FIXED_FUNCTION_LIN_TO_PQ  || 
                     ffstyle == FIXED_FUNCTION_LIN_TO_GAMMA_LOG || 
@@ -5532,7 +6114,7 @@ void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) cons
         }
         else if (DynamicPtrCast<const GradingPrimaryTransform>(transform))
         {
-            if (m_majorVersion < 2)
+            if (majorVersion < 2)
             {
                 throw Exception("Only config version 2 (or higher) can have "
                                 "GradingPrimaryTransform.");
@@ -5540,7 +6122,7 @@ void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) cons
         }
         else if (DynamicPtrCast<const GradingRGBCurveTransform>(transform))
         {
-            if (m_majorVersion < 2)
+            if (majorVersion < 2)
             {
                 throw Exception("Only config version 2 (or higher) can have "
                                 "GradingRGBCurveTransform.");
@@ -5548,7 +6130,7 @@ void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) cons
         }
         else if (DynamicPtrCast<const GradingToneTransform>(transform))
         {
-            if (m_majorVersion < 2)
+            if (majorVersion < 2)
             {
                 throw Exception("Only config version 2 (or higher) can have "
                                 "GradingToneTransform.");
@@ -5556,21 +6138,21 @@ void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) cons
         }
         else if (DynamicPtrCast<const LogAffineTransform>(transform))
         {
-            if (m_majorVersion < 2)
+            if (majorVersion < 2)
             {
                 throw Exception("Only config version 2 (or higher) can have LogAffineTransform.");
             }
         }
         else if (DynamicPtrCast<const LogCameraTransform>(transform))
         {
-            if (m_majorVersion < 2)
+            if (majorVersion < 2)
             {
                 throw Exception("Only config version 2 (or higher) can have LogCameraTransform.");
             }
         }
         else if (DynamicPtrCast<const RangeTransform>(transform))
         {
-            if (m_majorVersion < 2)
+            if (majorVersion < 2)
             {
                 throw Exception("Only config version 2 (or higher) can have RangeTransform.");
             }
@@ -5581,22 +6163,25 @@ void Config::Impl::checkVersionConsistency(ConstTransformRcPtr & transform) cons
             for (int idx = 0; idx < numTransforms; ++idx)
             {
                 ConstTransformRcPtr tr = grp->getTransform(idx);
-                checkVersionConsistency(tr);
+                CheckVersionConsistency(tr, majorVersion, minorVersion);
             }
         }
     }
 }
 
-void Config::Impl::checkVersionConsistency() const
+void Config::Impl::checkVersionConsistency(bool checkTransforms) const
 {
     // Check for the Transforms.
 
-    ConstTransformVec transforms;
-    getAllInternalTransforms(transforms);
-
-    for (auto & transform : transforms)
+    if (checkTransforms)
     {
-        checkVersionConsistency(transform);
+        ConstTransformVec transforms;
+        getAllInternalTransforms(transforms);
+
+        for (auto & transform : transforms)
+        {
+            CheckVersionConsistency(transform, m_majorVersion, m_minorVersion);
+        }
     }
 
     // Check for the family separator.
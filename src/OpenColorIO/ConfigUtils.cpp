@@ -1,10 +1,21 @@
 // SPDX-License-Identifier: BSD-3-Clause
 // Copyright Contributors to the OpenColorIO Project.
 
+#include <algorithm>
+#include <atomic>
+#include <exception>
+#include <functional>
+#include <sstream>
+#include <system_error>
+#include <thread>
+#include <vector>
+
 #include <pystring.h>
 
+#include "Caching.h"
 #include "ConfigUtils.h"
 #include "MathUtils.h"
+#include "Mutex.h"
 #include "utils/StringUtils.h"
 
 namespace OCIO_NAMESPACE
@@ -52,6 +63,162 @@ inline int getNumberOfbuiltinLinearSpaces()
 
 //////////////////////////////////////////////////////////////////////////////////////
 
+namespace
+{
+
+// The heuristics are expensive (i.e. they create a lot of processors) so their results are
+// memoized per pair of configs i.e. using the cache IDs of the source and built-in configs,
+// and per requested color space. Editing a config changes its cache ID so a stale result
+// is never returned. Note that a failure of the heuristics is also memoized.
+
+struct HeuristicsResult
+{
+    Mutex mutex;
+    bool ready = false;
+
+    // Index into the list of built-in linear spaces (i.e. interchange space heuristics).
+    int index = -1;
+    // Name of the color space found in the source config (i.e. built-in color space
+    // heuristics). Empty if not found.
+    std::string name;
+};
+
+typedef OCIO_SHARED_PTR<HeuristicsResult> HeuristicsResultPtr;
+
+class HeuristicsCache : public GenericCache<std::string, HeuristicsResultPtr>
+{
+};
+
+HeuristicsCache g_heuristicsCache;
+
+std::string GetHeuristicsKey(const ConstConfigRcPtr & srcConfig,
+                             const ConstConfigRcPtr & builtinConfig,
+                             const char * builtinColorSpaceName)
+{
+    std::ostringstream key;
+    key << srcConfig->getCacheID() << "|" << builtinConfig->getCacheID() << "|"
+        << (builtinColorSpaceName ? builtinColorSpaceName : "");
+
+    // The heuristics only search the active color spaces of the source config, but the cache
+    // ID does not reflect the inactive color spaces coming from the env. variable.
+    const int nbCs = srcConfig->getNumColorSpaces();
+    for (int i = 0; i < nbCs; ++i)
+    {
+        key << "|" << srcConfig->getColorSpaceNameByIndex(i);
+    }
+
+    return key.str();
+}
+
+} // anon.
+
+void ClearHeuristicsCache()
+{
+    g_heuristicsCache.clear();
+}
+
+CacheStatistics GetHeuristicsCacheStatistics()
+{
+    return g_heuristicsCache.getStatistics();
+}
+
+//////////////////////////////////////////////////////////////////////////////////////
+
+namespace
+{
+
+// Minimum number of candidates per thread, so that a short list of candidates (e.g. the color
+// spaces of a small config) is evaluated by the caller thread only.
+constexpr int MinCandidatesPerThread = 4;
+
+// Maximum number of threads evaluating the candidates, whatever the number of hardware threads.
+constexpr int MaxCandidateThreads = 8;
+
+} // anon.
+
+int FindFirstCandidate(int numCandidates, const std::function<bool(int)> & predicate)
+{
+    if (numCandidates <= 0)
+    {
+        return -1;
+    }
+
+    std::vector<char> matches(numCandidates, 0);
+    std::vector<std::exception_ptr> errors(numCandidates);
+
+    // The next candidate to evaluate and the lowest candidate that either matched or threw.
+    std::atomic<int> next{ 0 };
+    std::atomic<int> stop{ numCandidates };
+
+    auto evaluate = [&]()
+    {
+        for (int idx = next++; idx < numCandidates && idx < stop; idx = next++)
+        {
+            bool done = true;
+            try
+            {
+                matches[idx] = predicate(idx) ? 1 : 0;
+                done = matches[idx] != 0;
+            }
+            catch (...)
+            {
+                errors[idx] = std::current_exception();
+            }
+
+            if (done)
+            {
+                int current = stop;
+                while (idx < current && !stop.compare_exchange_weak(current, idx)) {}
+            }
+        }
+    };
+
+    const int maxThreads
+        = std::min(MaxCandidateThreads,
+                   static_cast<int>(std::max(1u, std::thread::hardware_concurrency())));
+    const int numThreads
+        = std::max(1, std::min(maxThreads, numCandidates / MinCandidatesPerThread));
+
+    std::vector<std::thread> workers;
+    workers.reserve(numThreads - 1);
+
+    for (int thread = 1; thread < numThreads; ++thread)
+    {
+        try
+        {
+            workers.emplace_back(evaluate);
+        }
+        catch (const std::system_error &)
+        {
+            // The caller thread evaluates all the remaining candidates.
+            break;
+        }
+    }
+
+    // The caller thread also evaluates candidates.
+    evaluate();
+
+    for (auto & worker : workers)
+    {
+        worker.join();
+    }
+
+    // All the candidates below the stop one were evaluated without a match or an error.
+    const int idx = stop;
+    if (idx < numCandidates)
+    {
+        if (errors[idx])
+        {
+            std::rethrow_exception(errors[idx]);
+        }
+        return idx;
+    }
+
+    return -1;
+}
+
+//////////////////////////////////////////////////////////////////////////////////////
+
 // Use the interchange roles in the pair of provided configs to return the color space
 // names to be used for the conversion between the provided pair of color spaces.
 // Note that the color space names returned depend on the image state of the provided
@@ -596,6 +763,75 @@ int getReferenceSpaceFromSRGBSpace(const ConstConfigRcPtr & srcConfig,
     return -1;
 }
 
+// Use heuristics to identify the reference space of the source config i.e. try to find
+// a color space in the source config that matches a color space in the built-in config.
+// The color spaces of the source config are tested in parallel.  Return the index into
+// the list of built-in linear spaces, or -1 if not found.
+//
+// srcConfig -- Source config object.
+// srcRefName -- Name of a scene-referred reference color space in the src config.
+// builtinConfig -- The built-in config object.
+// Returns the index into the list of built-in linear spaces.
+//
+int identifyReferenceSpace(const ConstConfigRcPtr & srcConfig,
+                           const char * srcRefName,
+                           const ConstConfigRcPtr & builtinConfig)
+{
+    // The heuristics need to create a lot of Processors and send RGB values through
+    // them to try and identify a known color space.  Turn off the Processor cache in
+    // the configs to avoid polluting the cache with transforms that won't be reused
+    // and avoid the overhead of maintaining the cache.
+    SuspendCacheGuard srcGuard(srcConfig);
+    SuspendCacheGuard builtinGuard(builtinConfig);
+
+    const int nbCs = srcConfig->getNumColorSpaces();
+    std::vector<int> refColorSpacePrimsIndices(nbCs, -1);
+
+    // Check for an sRGB texture space.
+    int csIndex = FindFirstCandidate(nbCs, [&](int i)
+    {
+        ConstColorSpaceRcPtr cs = srcConfig->getColorSpace(srcConfig->getColorSpaceNameByIndex(i));
+
+        // Exclude color spaces that may be too expensive to test or otherwise inappropriate.
+        // Currently only handling scene-referred spaces in the heuristics.
+        if (!containsSRGB(cs) || excludeColorSpaceFromHeuristics(cs, REFERENCE_SPACE_SCENE, true))
+        {
+            return false;
+        }
+
+        refColorSpacePrimsIndices[i] = getReferenceSpaceFromSRGBSpace(srcConfig,
+                                                                      srcRefName,
+                                                                      cs,
+                                                                      builtinConfig);
+        return refColorSpacePrimsIndices[i] > -1;
+    });
+
+    if (csIndex < 0)
+    {
+        // Check for a scene-linear space with known primaries.
+        csIndex = FindFirstCandidate(nbCs, [&](int i)
+        {
+            ConstColorSpaceRcPtr cs = srcConfig->getColorSpace(srcConfig->getColorSpaceNameByIndex(i));
+
+            // Exclude color spaces that may be too expensive to test or otherwise inappropriate.
+            // Currently only handling scene-referred spaces in the heuristics.
+            if (excludeColorSpaceFromHeuristics(cs, REFERENCE_SPACE_SCENE, true)
+                || !srcConfig->isColorSpaceLinear(cs->getName(), REFERENCE_SPACE_SCENE))
+            {
+                return false;
+            }
+
+            refColorSpacePrimsIndices[i] = getReferenceSpaceFromLinearSpace(srcConfig,
+                                                                            srcRefName,
+                                                                            cs,
+                                                                            builtinConfig);
+            return refColorSpacePrimsIndices[i] > -1;
+        });
+    }
+
+    return csIndex < 0 ? -1 : refColorSpacePrimsIndices[csIndex];
+}
+
 // Identify the interchange spaces of the source config and the built-in default config
 // that should be used to convert from the src color space to the built-in color space,
 // or vice-versa.  Throws if no suitable spaces are found.
@@ -655,64 +891,18 @@ void IdentifyInterchangeSpace(const char ** srcInterchange,
         throw Exception(os.str().c_str());
     }
 
-    // The heuristics need to create a lot of Processors and send RGB values through
-    // them to try and identify a known color space.  Turn off the Processor cache in
-    // the configs to avoid polluting the cache with transforms that won't be reused
-    // and avoid the overhead of maintaining the cache.
-    SuspendCacheGuard srcGuard(srcConfig);
-    SuspendCacheGuard builtinGuard(builtinConfig);
+    // The result of the heuristics only depends on the two configs.
+    HeuristicsResultPtr result
+        = g_heuristicsCache.getSharedEntry(GetHeuristicsKey(srcConfig, builtinConfig, nullptr));
 
-    // Check for an sRGB texture space.
-    int refColorSpacePrimsIndex = -1;
-    int nbCs = srcConfig->getNumColorSpaces();
-    for (int i = 0; i < nbCs; i++)
+    AutoMutex lock(result->mutex);
+    if (!result->ready)
     {
-        ConstColorSpaceRcPtr cs = srcConfig->getColorSpace(srcConfig->getColorSpaceNameByIndex(i));
-
-        if (containsSRGB(cs))
-        {
-            // Exclude color spaces that may be too expensive to test or otherwise inappropriate.
-            // Currently only handling scene-referred spaces in the heuristics.
-            if (excludeColorSpaceFromHeuristics(cs, REFERENCE_SPACE_SCENE, true))
-            {
-                continue;
-            }
-
-            refColorSpacePrimsIndex = getReferenceSpaceFromSRGBSpace(srcConfig, 
-                                                                     *srcInterchange,
-                                                                     cs, 
-                                                                     builtinConfig);
-            // Break out when a match is found.
-            if (refColorSpacePrimsIndex > -1) break; 
-        }
+        result->index = identifyReferenceSpace(srcConfig, *srcInterchange, builtinConfig);
+        result->ready = true;
     }
 
-    if (refColorSpacePrimsIndex < 0)
-    {
-        // Check for a scene-linear space with known primaries.
-        nbCs = srcConfig->getNumColorSpaces();
-        for (int i = 0; i < nbCs; i++)
-        {
-            ConstColorSpaceRcPtr cs = srcConfig->getColorSpace(srcConfig->getColorSpaceNameByIndex(i));
-
-            // Exclude color spaces that may be too expensive to test or otherwise inappropriate.
-            // Currently only handling scene-referred spaces in the heuristics.
-            if (excludeColorSpaceFromHeuristics(cs, REFERENCE_SPACE_SCENE, true))
-            {
-                continue;
-            }
-
-            if (srcConfig->isColorSpaceLinear(cs->getName(), REFERENCE_SPACE_SCENE))
-            {
-                refColorSpacePrimsIndex = getReferenceSpaceFromLinearSpace(srcConfig,
-                                                                           *srcInterchange,
-                                                                           cs, 
-                                                                           builtinConfig);
-                // Break out when a match is found.
-                if (refColorSpacePrimsIndex > -1) break; 
-            }
-        }
-    }
+    const int refColorSpacePrimsIndex = result->index;
 
     if (refColorSpacePrimsIndex > -1)
     {
@@ -727,6 +917,72 @@ void IdentifyInterchangeSpace(const char ** srcInterchange,
     }
 }
 
+// Use heuristics to find the color space in the source config that is equivalent to
+// the specified color space from the built-in config, using the interchange spaces.
+// The color spaces of the source config are tested in parallel.  Returns empty if not
+// found.
+//
+// srcConfig -- The source config object to search.
+// srcInterchangeName -- Name of the interchange color space from the source config.
+// builtinConfig -- The built-in config object containing the desired color space.
+// builtinColorSpaceName -- Name of the desired color space from the built-in config.
+// builtinInterchangeName -- Name of the interchange color space from the built-in config.
+// Returns the name of the color space in the source config.
+//
+std::string findBuiltinColorSpace(const ConstConfigRcPtr & srcConfig,
+                                  const char * srcInterchangeName,
+                                  const ConstConfigRcPtr & builtinConfig,
+                                  const char * builtinColorSpaceName,
+                                  const char * builtinInterchangeName)
+{
+    const ReferenceSpaceType builtinRefSpaceType
+        = builtinConfig->getColorSpace(builtinColorSpaceName)->getReferenceSpaceType();
+
+    // The heuristics need to create a lot of Processors and send RGB values through
+    // them to try and identify a known color space.  Turn off the Processor cache in
+    // the configs to avoid polluting the cache with transforms that won't be reused
+    // and avoid the overhead of maintaining the cache.
+    SuspendCacheGuard srcGuard(srcConfig);
+    SuspendCacheGuard builtinGuard(builtinConfig);
+
+    const std::vector<float> vals = { 0.7f,  0.4f,  0.02f, 0.f,
+                                      0.02f, 0.6f,  0.2f,  0.f,
+                                      0.3f,  0.02f, 0.5f,  0.f,
+                                      0.f,   0.f,   0.f,   0.f,
+                                      1.f,   1.f,   1.f,   0.f };
+
+    // Loop over the active, non-excluded, color spaces in the source config and test if the
+    // conversion to the specified space in the built-in config is an identity.
+    //
+    //    Note that there is a possibility that both the source and built-in sides of the
+    //    transform could be an identity (e.g., if the user asks for ACES2065-1 and that is
+    //    also the reference space in both configs).  However, this would not prevent the
+    //    algorithm from returning the correct result, as long as the interchange spaces
+    //    were correctly identified.
+
+    const int nbCs = srcConfig->getNumColorSpaces();
+    const int csIndex = FindFirstCandidate(nbCs, [&](int i)
+    {
+        ConstColorSpaceRcPtr cs = srcConfig->getColorSpace(srcConfig->getColorSpaceNameByIndex(i));
+
+        if (excludeColorSpaceFromHeuristics(cs, builtinRefSpaceType, false))
+        {
+            return false;
+        }
+
+        ConstProcessorRcPtr proc = Config::GetProcessorFromConfigs(srcConfig,
+                                                                   cs->getName(),
+                                                                   srcInterchangeName,
+                                                                   builtinConfig,
+                                                                   builtinColorSpaceName,
+                                                                   builtinInterchangeName);
+        std::vector<float> rgba = vals;
+        return isIdentityTransform(proc, rgba, 1e-3f);
+    });
+
+    return csIndex < 0 ? std::string() : srcConfig->getColorSpaceNameByIndex(csIndex);
+}
+
 // Try to find the name of a color space in the source config that is equivalent to the
 // specified color space from the provided built-in config.  Only active color spaces 
 // are searched.
@@ -767,8 +1023,6 @@ const char * IdentifyBuiltinColorSpace(const ConstConfigRcPtr & srcConfig,
         return dataName;
     }
 
-    ReferenceSpaceType builtinRefSpaceType = builtinColorSpace->getReferenceSpaceType();
-
     // Identify interchange spaces.  Passing an empty string for the source color space
     // means that only the builtinColorSpace will be used to determine the reference
     // space type of the interchange role.  Will throw if the space cannot be found.
@@ -783,50 +1037,28 @@ const char * IdentifyBuiltinColorSpace(const ConstConfigRcPtr & srcConfig,
                              builtinConfig,
                              builtinColorSpaceName);
 
-    // The heuristics need to create a lot of Processors and send RGB values through
-    // them to try and identify a known color space.  Turn off the Processor cache in
-    // the configs to avoid polluting the cache with transforms that won't be reused
-    // and avoid the overhead of maintaining the cache.
-    SuspendCacheGuard srcGuard(srcConfig);
-    SuspendCacheGuard builtinGuard(builtinConfig);
-
     if (*builtinInterchangeName)
     {
-        std::vector<float> vals = { 0.7f,  0.4f,  0.02f, 0.f,
-                                    0.02f, 0.6f,  0.2f,  0.f,
-                                    0.3f,  0.02f, 0.5f,  0.f,
-                                    0.f,   0.f,   0.f,   0.f,
-                                    1.f,   1.f,   1.f,   0.f };
-
-        // Loop over the active, non-excluded, color spaces in the source config and test if the
-        // conversion to the specified space in the built-in config is an identity.
-        //
-        //    Note that there is a possibility that both the source and built-in sides of the
-        //    transform could be an identity (e.g., if the user asks for ACES2065-1 and that is
-        //    also the reference space in both configs).  However, this would not prevent the
-        //    algorithm from returning the correct result, as long as the interchange spaces
-        //    were correctly identified.
-
-        int nbCs = srcConfig->getNumColorSpaces();
-        for (int i = 0; i < nbCs; i++)
-        {
-            ConstColorSpaceRcPtr cs = srcConfig->getColorSpace(srcConfig->getColorSpaceNameByIndex(i));
+        HeuristicsResultPtr result
+            = g_heuristicsCache.getSharedEntry(GetHeuristicsKey(srcConfig,
+                                                                builtinConfig,
+                                                                builtinColorSpaceName));
 
-            if (excludeColorSpaceFromHeuristics(cs, builtinRefSpaceType, false))
-            {
-                continue;
-            }
+        AutoMutex lock(result->mutex);
+        if (!result->ready)
+        {
+            result->name = findBuiltinColorSpace(srcConfig,
+                                                 srcInterchangeName,
+                                                 builtinConfig,
+                                                 builtinColorSpaceName,
+                                                 builtinInterchangeName);
+            result->ready = true;
+        }
 
-            ConstProcessorRcPtr proc = Config::GetProcessorFromConfigs(srcConfig,
-                                                                       cs->getName(),
-                                                                       srcInterchangeName,
-                                                                       builtinConfig,
-                                                                       builtinColorSpaceName,
-                                                                       builtinInterchangeName);
-            if (isIdentityTransform(proc, vals, 1e-3f))
-            {
-                return cs->getName();
-            }
+        if (!result->name.empty())
+        {
+            // Return the name owned by the source config.
+            return srcConfig->getColorSpace(result->name.c_str())->getName();
         }
     }
 
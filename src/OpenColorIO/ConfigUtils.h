@@ -4,6 +4,8 @@
 #ifndef INCLUDED_OCIO_CONFIG_UTILS_H
 #define INCLUDED_OCIO_CONFIG_UTILS_H
 
+#include <functional>
+
 #include <OpenColorIO/OpenColorIO.h>
 
 namespace OCIO_NAMESPACE
@@ -31,6 +33,25 @@ const char * IdentifyBuiltinColorSpace(const ConstConfigRcPtr & srcConfig,
                                        const ConstConfigRcPtr & builtinConfig, 
                                        const char * builtinColorSpaceName);
 
+// Clear the memoized results of the heuristics used by IdentifyInterchangeSpace and
+// IdentifyBuiltinColorSpace.
+void ClearHeuristicsCache();
+
+// Statistics of the memoized results of the heuristics, where a hit is a lookup of an existing
+// result (i.e. either found or not found by the heuristics).
+CacheStatistics GetHeuristicsCacheStatistics();
+
+// Evaluate the candidates in parallel and return the lowest candidate index for which the
+// predicate is true, or -1 if none.  The result (and the exception thrown, if any) is the
+// same as evaluating the candidates one after the other in increasing order: a candidate
+// is only skipped once a lower candidate has either matched or thrown.  Short lists of
+// candidates are evaluated by the caller thread only.
+//
+// numCandidates -- Number of candidates to evaluate.
+// predicate -- Return true if the candidate matches.  It must be thread-safe.
+//
+int FindFirstCandidate(int numCandidates, const std::function<bool(int)> & predicate);
+
 // Temporarily deactivate the Processor cache on a Config object.
 // Currently, this also clears the cache.
 //
@@ -0,0 +1,120 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "DeferredTransform.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+DeferredTransform::DeferredTransform(TransformType type,
+                                     TransformDirection dir,
+                                     const Loader & loader)
+    :   m_type(type)
+    ,   m_loader(loader)
+    ,   m_direction(dir)
+{
+    if (!m_loader)
+    {
+        throw Exception("DeferredTransform: the loader is missing.");
+    }
+}
+
+ConstTransformRcPtr DeferredTransform::get() const
+{
+    AutoMutex lock(m_mutex);
+
+    if (m_loader)
+    {
+        try
+        {
+            m_transform = m_loader();
+            if (m_transform)
+            {
+                m_transform->setDirection(m_direction);
+            }
+        }
+        catch (...)
+        {
+            m_error = std::current_exception();
+        }
+
+        // Release the loader resources (e.g. the YAML document) once the transform is created.
+        m_loader = nullptr;
+    }
+
+    if (m_error)
+    {
+        std::rethrow_exception(m_error);
+    }
+
+    return m_transform;
+}
+
+bool DeferredTransform::isLoaded() const
+{
+    AutoMutex lock(m_mutex);
+    return !m_loader;
+}
+
+ConstDeferredTransformRcPtr DeferredTransform::createDeferredCopy() const
+{
+    AutoMutex lock(m_mutex);
+
+    if (m_loader)
+    {
+        return std::make_shared<DeferredTransform>(m_type, m_direction, m_loader);
+    }
+
+    if (m_error)
+    {
+        const std::exception_ptr error = m_error;
+        return std::make_shared<DeferredTransform>(m_type, m_direction,
+                                                   [error]() -> TransformRcPtr
+                                                   {
+                                                       std::rethrow_exception(error);
+                                                   });
+    }
+
+    TransformRcPtr transform = m_transform ? m_transform->createEditableCopy() : TransformRcPtr();
+    return std::make_shared<DeferredTransform>(m_type, m_direction, [transform]()
+                                                                    {
+                                                                        return transform;
+                                                                    });
+}
+
+TransformRcPtr DeferredTransform::createEditableCopy() const
+{
+    ConstTransformRcPtr transform = get();
+    return transform ? transform->createEditableCopy() : TransformRcPtr();
+}
+
+TransformDirection DeferredTransform::getDirection() const noexcept
+{
+    AutoMutex lock(m_mutex);
+    return m_direction;
+}
+
+void DeferredTransform::setDirection(TransformDirection dir) noexcept
+{
+    AutoMutex lock(m_mutex);
+    m_direction = dir;
+    if (m_transform)
+    {
+        m_transform->setDirection(dir);
+    }
+}
+
+void DeferredTransform::validate() const
+{
+    ConstTransformRcPtr transform = get();
+    if (transform)
+    {
+        transform->validate();
+    }
+}
+
+} // namespace OCIO_NAMESPACE
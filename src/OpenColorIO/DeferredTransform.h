@@ -0,0 +1,95 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#ifndef INCLUDED_OCIO_DEFERREDTRANSFORM_H
+#define INCLUDED_OCIO_DEFERREDTRANSFORM_H
+
+#include <exception>
+#include <functional>
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "Mutex.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+class DeferredTransform;
+typedef OCIO_SHARED_PTR<const DeferredTransform> ConstDeferredTransformRcPtr;
+
+// A transform of a config element (i.e. color space, look or named transform) only created on
+// its first access. The lazy config loading uses it to only parse the transforms of the used
+// elements. It is set using the transform setters of the elements, which keep it apart from the
+// created transforms (refer to ResolveTransform()), so it is never returned by the elements. As
+// the created transform could be edited in place (e.g. from Python), each copy of an element
+// owns its deferred transform (refer to createDeferredCopy()).
+class DeferredTransform : public Transform
+{
+public:
+    typedef std::function<TransformRcPtr()> Loader;
+
+    DeferredTransform() = delete;
+    DeferredTransform(const DeferredTransform &) = delete;
+    DeferredTransform & operator=(const DeferredTransform &) = delete;
+
+    // The type and the direction are the ones of the transform to create (e.g. read from the
+    // YAML tag and direction key), so they are known without creating it.
+    DeferredTransform(TransformType type, TransformDirection dir, const Loader & loader);
+    ~DeferredTransform() override = default;
+
+    // Create the transform on the first call. The loading error, if any, is thrown by all the
+    // calls.
+    ConstTransformRcPtr get() const;
+
+    bool isLoaded() const;
+
+    // Return the deferred transform of a copy of the config element. A transform still to
+    // create is created by the copy on its own first access (i.e. the loader is shared), while
+    // a created transform is copied.
+    ConstDeferredTransformRcPtr createDeferredCopy() const;
+
+    // A copy is a copy of the created transform (i.e. the transform is created).
+    TransformRcPtr createEditableCopy() const override;
+
+    TransformDirection getDirection() const noexcept override;
+    void setDirection(TransformDirection dir) noexcept override;
+    TransformType getTransformType() const noexcept override { return m_type; }
+
+    // Create and validate the transform.
+    void validate() const override;
+
+private:
+    const TransformType m_type;
+    mutable Mutex m_mutex;
+    mutable Loader m_loader;
+    mutable TransformRcPtr m_transform;
+    mutable std::exception_ptr m_error;
+    TransformDirection m_direction;
+};
+
+// Return the deferred transform if the transform is one, or a null pointer otherwise.
+inline ConstDeferredTransformRcPtr GetDeferredTransform(const ConstTransformRcPtr & transform)
+{
+    return DynamicPtrCast<const DeferredTransform>(transform);
+}
+
+// Return the transform of a config element, which is either the deferred one (if any) or the
+// one already created.
+inline ConstTransformRcPtr ResolveTransform(const ConstTransformRcPtr & transform,
+                                            const ConstDeferredTransformRcPtr & deferred)
+{
+    return deferred ? deferred->get() : transform;
+}
+
+// Return the deferred transform of a copy of a config element, so the copies never share a
+// transform instance (refer to DeferredTransform::createDeferredCopy()).
+inline ConstDeferredTransformRcPtr CopyDeferredTransform(const ConstDeferredTransformRcPtr & deferred)
+{
+    return deferred ? deferred->createDeferredCopy() : ConstDeferredTransformRcPtr();
+}
+
+} // namespace OCIO_NAMESPACE
+
+#endif // INCLUDED_OCIO_DEFERREDTRANSFORM_H
@@ -2,6 +2,9 @@
 // Copyright Contributors to the OpenColorIO Project.
 
 
+#include <algorithm>
+#include <iterator>
+
 #include <OpenColorIO/OpenColorIO.h>
 
 #include "DynamicProperty.h"
@@ -316,4 +319,158 @@ void DynamicPropertyGradingToneImpl::setStyle(GradingStyle style)
     m_preRenderValues.update(m_value);
 }
 
+DynamicPropertyValuesRcPtr DynamicPropertyValues::Create()
+{
+    return DynamicPropertyValuesRcPtr(new DynamicPropertyValuesImpl(),
+                                      &DynamicPropertyValuesImpl::deleter);
+}
+
+void DynamicPropertyValuesImpl::deleter(DynamicPropertyValues * v)
+{
+    delete static_cast<DynamicPropertyValuesImpl *>(v);
+}
+
+DynamicPropertyValuesRcPtr DynamicPropertyValuesImpl::createEditableCopy() const
+{
+    DynamicPropertyValuesRcPtr values = DynamicPropertyValues::Create();
+    DynamicPropertyValuesImpl * copy = static_cast<DynamicPropertyValuesImpl *>(values.get());
+    std::copy(std::begin(m_hasValue), std::end(m_hasValue), std::begin(copy->m_hasValue));
+    copy->m_exposure        = m_exposure;
+    copy->m_contrast        = m_contrast;
+    copy->m_gamma           = m_gamma;
+    copy->m_gradingPrimary  = m_gradingPrimary;
+    copy->m_gradingRGBCurve = m_gradingRGBCurve;
+    copy->m_gradingTone     = m_gradingTone;
+    return values;
+}
+
+bool DynamicPropertyValuesImpl::hasValue(DynamicPropertyType type) const noexcept
+{
+    return type >= 0 && type < NumTypes && m_hasValue[type];
+}
+
+void DynamicPropertyValuesImpl::removeValue(DynamicPropertyType type) noexcept
+{
+    if (type >= 0 && type < NumTypes)
+    {
+        m_hasValue[type] = false;
+    }
+
+    if (type == DYNAMIC_PROPERTY_GRADING_RGBCURVE)
+    {
+        m_gradingRGBCurve.reset();
+    }
+}
+
+void DynamicPropertyValuesImpl::clear() noexcept
+{
+    for (auto & hasValue : m_hasValue)
+    {
+        hasValue = false;
+    }
+    m_gradingRGBCurve.reset();
+}
+
+double DynamicPropertyValuesImpl::getDouble(DynamicPropertyType type) const
+{
+    if (!hasValue(type))
+    {
+        throw Exception("Dynamic property values do not hold a value of that type.");
+    }
+
+    switch (type)
+    {
+    case DYNAMIC_PROPERTY_EXPOSURE:
+        return m_exposure;
+    case DYNAMIC_PROPERTY_CONTRAST:
+        return m_contrast;
+    case DYNAMIC_PROPERTY_GAMMA:
+        return m_gamma;
+    case DYNAMIC_PROPERTY_GRADING_PRIMARY:
+    case DYNAMIC_PROPERTY_GRADING_RGBCURVE:
+    case DYNAMIC_PROPERTY_GRADING_TONE:
+        break;
+    }
+
+    throw Exception("Dynamic property value is not a double.");
+}
+
+void DynamicPropertyValuesImpl::setDouble(DynamicPropertyType type, double value)
+{
+    switch (type)
+    {
+    case DYNAMIC_PROPERTY_EXPOSURE:
+        m_exposure = value;
+        break;
+    case DYNAMIC_PROPERTY_CONTRAST:
+        m_contrast = value;
+        break;
+    case DYNAMIC_PROPERTY_GAMMA:
+        m_gamma = value;
+        break;
+    case DYNAMIC_PROPERTY_GRADING_PRIMARY:
+    case DYNAMIC_PROPERTY_GRADING_RGBCURVE:
+    case DYNAMIC_PROPERTY_GRADING_TONE:
+    default:
+        throw Exception("Dynamic property value is not a double.");
+    }
+
+    m_hasValue[type] = true;
+}
+
+const GradingPrimary & DynamicPropertyValuesImpl::getGradingPrimary() const
+{
+    if (!hasValue(DYNAMIC_PROPERTY_GRADING_PRIMARY))
+    {
+        throw Exception("Dynamic property values do not hold a grading primary.");
+    }
+    return m_gradingPrimary;
+}
+
+void DynamicPropertyValuesImpl::setGradingPrimary(const GradingPrimary & value)
+{
+    m_gradingPrimary = value;
+    m_hasValue[DYNAMIC_PROPERTY_GRADING_PRIMARY] = true;
+}
+
+const ConstGradingRGBCurveRcPtr & DynamicPropertyValuesImpl::getGradingRGBCurve() const
+{
+    if (!hasValue(DYNAMIC_PROPERTY_GRADING_RGBCURVE))
+    {
+        throw Exception("Dynamic property values do not hold a grading RGB curve.");
+    }
+    return m_gradingRGBCurve;
+}
+
+void DynamicPropertyValuesImpl::setGradingRGBCurve(const ConstGradingRGBCurveRcPtr & value)
+{
+    if (!value)
+    {
+        throw Exception("Grading RGB curve value is null.");
+    }
+
+    value->validate();
+
+    // Copy the curve so that later changes by the caller do not affect the set.
+    m_gradingRGBCurve = value->createEditableCopy();
+    m_hasValue[DYNAMIC_PROPERTY_GRADING_RGBCURVE] = true;
+}
+
+const GradingTone & DynamicPropertyValuesImpl::getGradingTone() const
+{
+    if (!hasValue(DYNAMIC_PROPERTY_GRADING_TONE))
+    {
+        throw Exception("Dynamic property values do not hold a grading tone.");
+    }
+    return m_gradingTone;
+}
+
+void DynamicPropertyValuesImpl::setGradingTone(const GradingTone & value)
+{
+    value.validate();
+
+    m_gradingTone = value;
+    m_hasValue[DYNAMIC_PROPERTY_GRADING_TONE] = true;
+}
+
 } // namespace OCIO_NAMESPACE
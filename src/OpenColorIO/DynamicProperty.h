@@ -204,6 +204,46 @@ private:
     GradingTonePreRender m_preRenderValues;
 };
 
+// Holds the values of a DynamicPropertyValues set, at most one per dynamic property type.
+class DynamicPropertyValuesImpl : public DynamicPropertyValues
+{
+public:
+    DynamicPropertyValuesImpl() = default;
+    ~DynamicPropertyValuesImpl() = default;
+
+    DynamicPropertyValuesRcPtr createEditableCopy() const override;
+
+    bool hasValue(DynamicPropertyType type) const noexcept override;
+    void removeValue(DynamicPropertyType type) noexcept override;
+    void clear() noexcept override;
+
+    double getDouble(DynamicPropertyType type) const override;
+    void setDouble(DynamicPropertyType type, double value) override;
+
+    const GradingPrimary & getGradingPrimary() const override;
+    void setGradingPrimary(const GradingPrimary & value) override;
+
+    const ConstGradingRGBCurveRcPtr & getGradingRGBCurve() const override;
+    void setGradingRGBCurve(const ConstGradingRGBCurveRcPtr & value) override;
+
+    const GradingTone & getGradingTone() const override;
+    void setGradingTone(const GradingTone & value) override;
+
+    static void deleter(DynamicPropertyValues * v);
+
+private:
+    static constexpr int NumTypes = DYNAMIC_PROPERTY_GRADING_TONE + 1;
+
+    bool m_hasValue[NumTypes]{ false, false, false, false, false, false };
+
+    double m_exposure{ 0. };
+    double m_contrast{ 1. };
+    double m_gamma{ 1. };
+    GradingPrimary m_gradingPrimary{ GRADING_LOG };
+    ConstGradingRGBCurveRcPtr m_gradingRGBCurve;
+    GradingTone m_gradingTone{ GRADING_LOG };
+};
+
 } // namespace OCIO_NAMESPACE
 
 #endif
\ No newline at end of file
@@ -0,0 +1,40 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "ElementVersion.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+namespace
+{
+// The last version given to an element.
+std::atomic<size_t> g_lastVersion{ 0 };
+}
+
+ElementVersion::ElementVersion() noexcept
+    :   m_version(++g_lastVersion)
+{
+}
+
+ElementVersion::ElementVersion(const ElementVersion & rhs) noexcept
+    :   m_version(rhs.get())
+{
+}
+
+ElementVersion & ElementVersion::operator=(const ElementVersion & rhs) noexcept
+{
+    m_version = rhs.get();
+    return *this;
+}
+
+void ElementVersion::changed() noexcept
+{
+    m_version = ++g_lastVersion;
+}
+
+} // namespace OCIO_NAMESPACE
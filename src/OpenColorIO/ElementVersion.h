@@ -0,0 +1,46 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#ifndef INCLUDED_OCIO_ELEMENTVERSION_H
+#define INCLUDED_OCIO_ELEMENTVERSION_H
+
+#include <atomic>
+#include <cstddef>
+
+#include <OpenColorIO/OpenColorIO.h>
+
+
+namespace OCIO_NAMESPACE
+{
+
+// The version of a config element (i.e. a color space, look, view transform, named transform or
+// the file and viewing rules), changed by all the element setters, so the config cache ID only
+// serializes again the changed elements (refer to OCIOYaml::ElementHashCache).
+//
+// A version is unique across all the elements, and a copy of an element keeps its version, so
+// two elements with the same version have the same members. The element transforms could still
+// be edited in place (e.g. the const is lost in the Python binding) so they are compared using
+// their content instead (refer to GetTransformHash()).
+//
+// The versions are members of the element implementations, only accessible to the config.
+class ElementVersion
+{
+public:
+    ElementVersion() noexcept;
+    ElementVersion(const ElementVersion & rhs) noexcept;
+    ElementVersion & operator=(const ElementVersion & rhs) noexcept;
+    ~ElementVersion() = default;
+
+    size_t get() const noexcept { return m_version.load(); }
+
+    // Called by the element setters.
+    void changed() noexcept;
+
+private:
+    std::atomic<size_t> m_version;
+};
+
+} // namespace OCIO_NAMESPACE
+
+#endif // INCLUDED_OCIO_ELEMENTVERSION_H
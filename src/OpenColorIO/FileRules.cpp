@@ -7,6 +7,7 @@
 #include <map>
 #include <regex>
 #include <sstream>
+#include <unordered_map>
 
 #include <OpenColorIO/OpenColorIO.h>
 
@@ -260,7 +261,10 @@ std::string BuildRegularExpression(const char * filePathPattern, const char * fi
     return res;
 }
 
-void ValidateRegularExpression(const char * regex)
+typedef OCIO_SHARED_PTR<const std::regex> RegexRcPtr;
+
+// Compile the regular expression once for all the file path lookups.
+RegexRcPtr CompileRegularExpression(const char * regex)
 {
     if (!regex || !*regex)
     {
@@ -270,7 +274,7 @@ void ValidateRegularExpression(const char * regex)
     try
     {
         // Throws an exception if the expression is ill-formed.
-        const std::regex reg(regex);
+        return std::make_shared<const std::regex>(regex);
     }
     catch (std::regex_error & ex)
     {
@@ -284,10 +288,42 @@ void ValidateRegularExpression(const char * regex)
     }
 }
 
-void ValidateRegularExpression(const char * filePathPattern, const char * fileNameExtension)
+RegexRcPtr CompileRegularExpression(const char * filePathPattern, const char * fileNameExtension)
 {
     const std::string exp = BuildRegularExpression(filePathPattern, fileNameExtension);
-    ValidateRegularExpression(exp.c_str());
+    return CompileRegularExpression(exp.c_str());
+}
+
+// Return true if the match of the glob pattern & extension only depends on the directory and
+// on the extension of the file path (i.e. not on the file name), for example "*" and "exr".
+// That's the case when the pattern ends with "/*" as its last '/' can only match a '/' from
+// the directory, and when the extension has no wildcard, '.' nor '\' or is "*".
+bool IsDirectoryAndExtensionGlob(const std::string & filePathPattern,
+                                 const std::string & fileNameExtension)
+{
+    const bool anyFileName = filePathPattern == "*" || StringUtils::EndsWith(filePathPattern, "/*");
+    const bool extensionOnly = fileNameExtension == "*"
+                               || fileNameExtension.find_first_of("*?[].\\") == std::string::npos;
+    return anyFileName && extensionOnly;
+}
+
+// Build a key from the directory and the extension of the file path i.e. all the file paths
+// with the same key are matched by the same directory and extension glob rules. Note that the
+// extension includes the '.' to differentiate between an empty extension and no extension.
+std::string GetDirectoryAndExtensionKey(const char * filePath)
+{
+    const std::string path(filePath);
+
+    const size_t fileNamePos = path.find_last_of("/\\");
+    const size_t dirLength = (fileNamePos == std::string::npos) ? 0 : fileNamePos + 1;
+
+    const size_t extensionPos = path.find_last_of('.');
+    if (extensionPos == std::string::npos || extensionPos < dirLength)
+    {
+        return path.substr(0, dirLength);
+    }
+
+    return path.substr(0, dirLength) + path.substr(extensionPos);
 }
 
 }
@@ -326,9 +362,12 @@ public:
         }
         else
         {
-            m_pattern   = "*";
-            m_extension = "*";
-            m_type      = FILE_RULE_GLOB;
+            static const RegexRcPtr anyFile = CompileRegularExpression("*", "*");
+
+            m_pattern       = "*";
+            m_extension     = "*";
+            m_compiledRegex = anyFile;
+            m_type          = FILE_RULE_GLOB;
         }
     }
 
@@ -343,6 +382,9 @@ public:
         rule->m_regex      = m_regex;
         rule->m_type       = m_type;
 
+        // The compiled regular expression is immutable so it can be shared.
+        rule->m_compiledRegex = m_compiledRegex;
+
         return rule;
     }
 
@@ -376,7 +418,7 @@ public:
             {
                 throw Exception("File rules: The file name pattern is empty.");
             }
-            ValidateRegularExpression(pattern, m_extension.c_str());
+            m_compiledRegex = CompileRegularExpression(pattern, m_extension.c_str());
             m_pattern = pattern;
             m_regex = "";
             m_type = FILE_RULE_GLOB;
@@ -408,7 +450,7 @@ public:
             {
                 throw Exception("File rules: The file extension pattern is empty.");
             }
-            ValidateRegularExpression(m_pattern.c_str(), extension);
+            m_compiledRegex = CompileRegularExpression(m_pattern.c_str(), extension);
             m_extension = extension;
             m_regex = "";
             m_type = FILE_RULE_GLOB;
@@ -436,7 +478,7 @@ public:
         }
         else
         {
-            ValidateRegularExpression(regex);
+            m_compiledRegex = CompileRegularExpression(regex);
             m_regex = regex;
             m_pattern = "";
             m_extension = "";
@@ -469,40 +511,58 @@ public:
         }
     }
 
-    bool matches(const Config & config, const char * path) const
+    // Return true if the file path matches the rule, in which case colorSpace is the color space
+    // name. Note that the color space found by the ColorSpaceNamePathSearch rule is owned by the
+    // config.
+    bool matches(const Config & config, const char * path, const char * & colorSpace) const
     {
         switch (m_type)
         {
         case FILE_RULE_DEFAULT:
+            colorSpace = m_colorSpace.c_str();
             return true;
         case FILE_RULE_PARSE_FILEPATH:
         {
             const int rightMostColorSpaceIndex = ParseColorSpaceFromString(config, path);
             if (rightMostColorSpaceIndex >= 0)
             {
-                m_colorSpace = config.getColorSpaceNameByIndex(SEARCH_REFERENCE_SPACE_ALL,
-                                                               COLORSPACE_ALL,
-                                                               rightMostColorSpaceIndex);
+                colorSpace = config.getColorSpaceNameByIndex(SEARCH_REFERENCE_SPACE_ALL,
+                                                             COLORSPACE_ALL,
+                                                             rightMostColorSpaceIndex);
                 return true;
             }
             return false;
         }
         case FILE_RULE_REGEX:
-        {
-            const std::regex reg(m_regex.c_str());
-            return regex_match(path, reg);
-        }
         case FILE_RULE_GLOB:
         {
-            const std::string exp = BuildRegularExpression(m_pattern.c_str(),
-                                                           m_extension.c_str());
-            const std::regex reg(exp.c_str());
-            return regex_match(path, reg);
+            if (std::regex_match(path, *m_compiledRegex))
+            {
+                colorSpace = m_colorSpace.c_str();
+                return true;
+            }
+            return false;
         }
         }
         return false;
     }
 
+    // Return true if the match only depends on the directory and the extension of the file path.
+    bool matchesDirectoryAndExtension() const
+    {
+        switch (m_type)
+        {
+        case FILE_RULE_DEFAULT:
+            return true;
+        case FILE_RULE_PARSE_FILEPATH:
+        case FILE_RULE_REGEX:
+            return false;
+        case FILE_RULE_GLOB:
+            return IsDirectoryAndExtensionGlob(m_pattern, m_extension);
+        }
+        return false;
+    }
+
     void validate(const Config & cfg) const
     {
         if (m_type != FILE_RULE_PARSE_FILEPATH)
@@ -527,10 +587,11 @@ public:
 private:
 
     std::string m_name;
-    mutable std::string m_colorSpace;
+    std::string m_colorSpace;
     std::string m_pattern;
     std::string m_extension;
     std::string m_regex;
+    RegexRcPtr m_compiledRegex;
     RuleType m_type{ FILE_RULE_GLOB };
 };
 
@@ -579,6 +640,8 @@ FileRules::Impl & FileRules::Impl::operator=(const FileRules::Impl & rhs)
         {
             m_rules.push_back(rule->clone());
         }
+
+        m_version = rhs.m_version;
     }
 
     return *this;
@@ -631,20 +694,93 @@ void FileRules::Impl::validateNewRule(size_t ruleIndex, const char * name) const
 
 const char * FileRules::Impl::getRuleFromFilepath(const Config & config, const char * filePath,
                                                   size_t & ruleIndex) const
+{
+    return getRuleFromFilepath(config, filePath, 0, ruleIndex);
+}
+
+const char * FileRules::Impl::getRuleFromFilepath(const Config & config, const char * filePath,
+                                                  size_t firstRuleIndex, size_t & ruleIndex) const
 {
     const auto numRules = m_rules.size();
-    for (size_t i = 0; i < numRules; ++i)
+    for (size_t i = firstRuleIndex; i < numRules; ++i)
     {
-        if (m_rules[i]->matches(config, filePath))
+        const char * colorSpace = nullptr;
+        if (m_rules[i]->matches(config, filePath, colorSpace))
         {
             ruleIndex = i;
-            return m_rules[i]->getColorSpace();
+            return colorSpace;
         }
     }
     // Should not be reached since the default rule always matches.
+    ruleIndex = numRules - 1;
     return m_rules.back()->getColorSpace();
 }
 
+void FileRules::Impl::getColorSpacesFromFilepaths(const Config & config,
+                                                  const char * const * filePaths,
+                                                  size_t numFilePaths,
+                                                  const char ** colorSpaces,
+                                                  size_t * ruleIndices) const
+{
+    // The leading rules only depending on the directory and the extension of the file path are
+    // evaluated once per directory and extension, i.e. the first rule either matching or needing
+    // the complete file path is memoized. That's the case for the file sequences where thousands
+    // of file paths only differ by the frame number.
+
+    struct FirstRule
+    {
+        size_t m_index;
+        bool m_matched;
+    };
+    std::unordered_map<std::string, FirstRule> firstRules;
+
+    const auto numRules = m_rules.size();
+
+    for (size_t idx = 0; idx < numFilePaths; ++idx)
+    {
+        const char * filePath = (filePaths[idx] ? filePaths[idx] : "");
+
+        const std::string key = GetDirectoryAndExtensionKey(filePath);
+
+        auto it = firstRules.find(key);
+        if (it == firstRules.end())
+        {
+            FirstRule firstRule{ 0, false };
+            for (; firstRule.m_index < numRules; ++firstRule.m_index)
+            {
+                const FileRuleRcPtr & rule = m_rules[firstRule.m_index];
+                if (!rule->matchesDirectoryAndExtension())
+                {
+                    break;
+                }
+
+                const char * colorSpace = nullptr;
+                if (rule->matches(config, filePath, colorSpace))
+                {
+                    firstRule.m_matched = true;
+                    break;
+                }
+            }
+            it = firstRules.emplace(key, firstRule).first;
+        }
+
+        size_t ruleIndex = it->second.m_index;
+        if (it->second.m_matched)
+        {
+            colorSpaces[idx] = m_rules[ruleIndex]->getColorSpace();
+        }
+        else
+        {
+            colorSpaces[idx] = getRuleFromFilepath(config, filePath, ruleIndex, ruleIndex);
+        }
+
+        if (ruleIndices)
+        {
+            ruleIndices[idx] = ruleIndex;
+        }
+    }
+}
+
 void FileRules::Impl::moveRule(size_t ruleIndex, int offset)
 {
     validatePosition(ruleIndex, DEFAULT_NOT_ALLOWED);
@@ -721,6 +857,7 @@ void FileRules::setPattern(size_t ruleIndex, const char * pattern)
 {
     m_impl->validatePosition(ruleIndex, Impl::DEFAULT_NOT_ALLOWED);
     m_impl->m_rules[ruleIndex]->setPattern(pattern);
+    m_impl->m_version.changed();
 }
 
 const char * FileRules::getExtension(size_t ruleIndex) const
@@ -733,6 +870,7 @@ void FileRules::setExtension(size_t ruleIndex, const char * extension)
 {
     m_impl->validatePosition(ruleIndex, Impl::DEFAULT_NOT_ALLOWED);
     m_impl->m_rules[ruleIndex]->setExtension(extension);
+    m_impl->m_version.changed();
 }
 
 const char * FileRules::getRegex(size_t ruleIndex) const
@@ -745,6 +883,7 @@ void FileRules::setRegex(size_t ruleIndex, const char * regex)
 {
     m_impl->validatePosition(ruleIndex, Impl::DEFAULT_NOT_ALLOWED);
     m_impl->m_rules[ruleIndex]->setRegex(regex);
+    m_impl->m_version.changed();
 }
 
 // Color space or role.
@@ -758,6 +897,7 @@ void FileRules::setColorSpace(size_t ruleIndex, const char * colorSpace)
 {
     m_impl->validatePosition(ruleIndex, Impl::DEFAULT_ALLOWED);
     m_impl->m_rules[ruleIndex]->setColorSpace(colorSpace);
+    m_impl->m_version.changed();
 }
 
 size_t FileRules::getNumCustomKeys(size_t ruleIndex) const
@@ -814,6 +954,7 @@ void FileRules::setCustomKey(size_t ruleIndex, const char * key, const char * va
             << "' error: " << e.what();
         throw Exception(oss.str().c_str());
     }
+    m_impl->m_version.changed();
 }
 
 void FileRules::insertRule(size_t ruleIndex, const char * name, const char * colorSpace,
@@ -828,6 +969,7 @@ void FileRules::insertRule(size_t ruleIndex, const char * name, const char * col
     newRule->setPattern(pattern);
     newRule->setExtension(extension);
     m_impl->m_rules.insert(m_impl->m_rules.begin() + ruleIndex, newRule);
+    m_impl->m_version.changed();
 }
 
 void FileRules::insertRule(size_t ruleIndex, const char * name, const char * colorSpace,
@@ -841,6 +983,7 @@ void FileRules::insertRule(size_t ruleIndex, const char * name, const char * col
     newRule->setColorSpace(colorSpace);
     newRule->setRegex(regex);
     m_impl->m_rules.insert(m_impl->m_rules.begin() + ruleIndex, newRule);
+    m_impl->m_version.changed();
 }
 
 void FileRules::insertPathSearchRule(size_t ruleIndex)
@@ -851,22 +994,26 @@ void FileRules::insertPathSearchRule(size_t ruleIndex)
 void FileRules::setDefaultRuleColorSpace(const char * colorSpace)
 {
     m_impl->m_rules.back()->setColorSpace(colorSpace);
+    m_impl->m_version.changed();
 }
 
 void FileRules::removeRule(size_t ruleIndex)
 {
     m_impl->validatePosition(ruleIndex, Impl::DEFAULT_NOT_ALLOWED);
     m_impl->m_rules.erase(m_impl->m_rules.begin() + ruleIndex);
+    m_impl->m_version.changed();
 }
 
 void FileRules::increaseRulePriority(size_t ruleIndex)
 {
     m_impl->moveRule(ruleIndex, -1);
+    m_impl->m_version.changed();
 }
 
 void FileRules::decreaseRulePriority(size_t ruleIndex)
 {
     m_impl->moveRule(ruleIndex, 1);
+    m_impl->m_version.changed();
 }
 
 bool FileRules::isDefault() const noexcept
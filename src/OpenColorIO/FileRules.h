@@ -9,6 +9,8 @@
 
 #include <OpenColorIO/OpenColorIO.h>
 
+#include "ElementVersion.h"
+
 
 namespace OCIO_NAMESPACE
 {
@@ -45,6 +47,10 @@ public:
     const char * getRuleFromFilepath(const Config & config, const char * filePath,
                                      size_t & ruleIndex) const;
 
+    // Only evaluate the rules starting at firstRuleIndex.
+    const char * getRuleFromFilepath(const Config & config, const char * filePath,
+                                     size_t firstRuleIndex, size_t & ruleIndex) const;
+
     void validatePosition(size_t ruleIndex, DefaultAllowed allowDefault) const;
 
     // Throws if ruleIndex or name are invalid.
@@ -57,10 +63,20 @@ public:
     const char * getColorSpaceFromFilepath(const Config & config, const char * filePath,
                                            size_t & ruleIndex) const;
 
+    // Get the color spaces (and the matching rule indices if not null) of a list of file paths.
+    void getColorSpacesFromFilepaths(const Config & config,
+                                     const char * const * filePaths,
+                                     size_t numFilePaths,
+                                     const char ** colorSpaces,
+                                     size_t * ruleIndices) const;
+
     bool filepathOnlyMatchesDefaultRule(const Config & config, const char * filePath) const;
 
     void validate(const Config & cfg) const;
 
+    // Changed by all the setters (refer to ElementVersion).
+    ElementVersion m_version;
+
 private:
 
     friend class FileRules;
@@ -25,4 +25,9 @@ std::string CacheIDHash(const char * array, std::size_t size)
     return oss.str();
 }
 
+std::size_t CacheKeyHash(const char * array, std::size_t size)
+{
+    return static_cast<std::size_t>(XXH3_64bits(array, size));
+}
+
 } // namespace OCIO_NAMESPACE
@@ -7,6 +7,8 @@
 
 #include <OpenColorIO/OpenColorIO.h>
 
+#include <cstring>
+#include <functional>
 #include <string>
 
 namespace OCIO_NAMESPACE
@@ -14,6 +16,30 @@ namespace OCIO_NAMESPACE
 
 std::string CacheIDHash(const char * array, std::size_t size);
 
+// Compute a hash value of the buffer content e.g. to build a cache key without creating strings.
+std::size_t CacheKeyHash(const char * array, std::size_t size);
+
+// Mix the hash value of a member into the hash value of its owner.
+template<typename T>
+inline void HashCombine(std::size_t & seed, const T & value)
+{
+    seed ^= std::hash<T>{}(value) + 0x9e3779b9 + (seed << 6) + (seed >> 2);
+}
+
+inline void HashCombine(std::size_t & seed, const char * str)
+{
+    HashCombine(seed, str ? CacheKeyHash(str, std::strlen(str)) : 0);
+}
+
+template<typename T>
+inline void HashCombine(std::size_t & seed, const T * values, std::size_t size)
+{
+    for (std::size_t idx = 0; idx < size; ++idx)
+    {
+        HashCombine(seed, values[idx]);
+    }
+}
+
 } // namespace OCIO_NAMESPACE
 
 #endif
@@ -9,6 +9,8 @@
 #include <OpenColorIO/OpenColorIO.h>
 
 #include "ContextVariableUtils.h"
+#include "DeferredTransform.h"
+#include "Look.h"
 
 
 namespace OCIO_NAMESPACE
@@ -23,42 +25,6 @@ void Look::deleter(Look* c)
     delete c;
 }
 
-class Look::Impl
-{
-public:
-    std::string m_name;
-    std::string m_processSpace;
-    std::string m_description;
-    TransformRcPtr m_transform;
-    TransformRcPtr m_inverseTransform;
-
-    Impl()
-    { }
-
-    Impl(const Impl &) = delete;
-
-    ~Impl()
-    { }
-
-    Impl& operator= (const Impl & rhs)
-    {
-        if (this != &rhs)
-        {
-            m_name = rhs.m_name;
-            m_processSpace = rhs.m_processSpace;
-            m_description = rhs.m_description;
-
-            m_transform = rhs.m_transform?
-                rhs.m_transform->createEditableCopy() : rhs.m_transform;
-
-            m_inverseTransform = rhs.m_inverseTransform?
-                rhs.m_inverseTransform->createEditableCopy()
-                : rhs.m_inverseTransform;
-        }
-        return *this;
-    }
-};
-
 ///////////////////////////////////////////////////////////////////////////
 
 Look::Look()
@@ -87,6 +53,7 @@ const char * Look::getName() const
 void Look::setName(const char * name)
 {
     getImpl()->m_name = name;
+    getImpl()->m_version.changed();
 }
 
 const char * Look::getProcessSpace() const
@@ -97,26 +64,34 @@ const char * Look::getProcessSpace() const
 void Look::setProcessSpace(const char * processSpace)
 {
     getImpl()->m_processSpace = processSpace;
+    getImpl()->m_version.changed();
 }
 
 ConstTransformRcPtr Look::getTransform() const
 {
-    return getImpl()->m_transform;
+    return ResolveTransform(getImpl()->m_transform, getImpl()->m_deferred);
 }
 
 void Look::setTransform(const ConstTransformRcPtr & transform)
 {
-    getImpl()->m_transform = transform->createEditableCopy();
+    // A deferred transform (i.e. lazily loaded config) is only created on its first access.
+    getImpl()->m_deferred = GetDeferredTransform(transform);
+    getImpl()->m_transform = getImpl()->m_deferred ? TransformRcPtr()
+                                                   : transform->createEditableCopy();
+    getImpl()->m_version.changed();
 }
 
 ConstTransformRcPtr Look::getInverseTransform() const
 {
-    return getImpl()->m_inverseTransform;
+    return ResolveTransform(getImpl()->m_inverseTransform, getImpl()->m_inverseDeferred);
 }
 
 void Look::setInverseTransform(const ConstTransformRcPtr & transform)
 {
-    getImpl()->m_inverseTransform = transform->createEditableCopy();
+    getImpl()->m_inverseDeferred = GetDeferredTransform(transform);
+    getImpl()->m_inverseTransform = getImpl()->m_inverseDeferred ? TransformRcPtr()
+                                                                 : transform->createEditableCopy();
+    getImpl()->m_version.changed();
 }
 
 const char * Look::getDescription() const
@@ -127,6 +102,7 @@ const char * Look::getDescription() const
 void Look::setDescription(const char * description)
 {
     getImpl()->m_description = description;
+    getImpl()->m_version.changed();
 }
 
 bool CollectContextVariables(const Config & config,
@@ -0,0 +1,69 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#ifndef INCLUDED_OCIO_LOOK_H
+#define INCLUDED_OCIO_LOOK_H
+
+#include <string>
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "DeferredTransform.h"
+#include "ElementVersion.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+class Look::Impl
+{
+public:
+    std::string m_name;
+    std::string m_processSpace;
+    std::string m_description;
+    TransformRcPtr m_transform;
+    TransformRcPtr m_inverseTransform;
+
+    // The transforms of a lazily loaded config.
+    ConstDeferredTransformRcPtr m_deferred;
+    ConstDeferredTransformRcPtr m_inverseDeferred;
+
+    // Changed by all the setters (refer to ElementVersion).
+    ElementVersion m_version;
+
+    Impl()
+    { }
+
+    Impl(const Impl &) = delete;
+
+    ~Impl()
+    { }
+
+    Impl& operator= (const Impl & rhs)
+    {
+        if (this != &rhs)
+        {
+            m_name = rhs.m_name;
+            m_processSpace = rhs.m_processSpace;
+            m_description = rhs.m_description;
+
+            m_transform = rhs.m_transform?
+                rhs.m_transform->createEditableCopy() : rhs.m_transform;
+
+            m_inverseTransform = rhs.m_inverseTransform?
+                rhs.m_inverseTransform->createEditableCopy()
+                : rhs.m_inverseTransform;
+
+            m_deferred = CopyDeferredTransform(rhs.m_deferred);
+            m_inverseDeferred = CopyDeferredTransform(rhs.m_inverseDeferred);
+
+            m_version = rhs.m_version;
+        }
+        return *this;
+    }
+};
+
+} // namespace OCIO_NAMESPACE
+
+#endif // INCLUDED_OCIO_LOOK_H
@@ -36,6 +36,9 @@ NamedTransformRcPtr NamedTransformImpl::createEditableCopy() const
     {
         copy->m_inverseTransform = m_inverseTransform->createEditableCopy();
     }
+    copy->m_forwardDeferred = CopyDeferredTransform(m_forwardDeferred);
+    copy->m_inverseDeferred = CopyDeferredTransform(m_inverseDeferred);
+    copy->m_version = m_version;
     return copy;
 }
 
@@ -49,6 +52,7 @@ void NamedTransformImpl::setName(const char * name) noexcept
     m_name = name ? name : "";
     // Name can no longer be an alias.
     StringUtils::Remove(m_aliases, m_name);
+    m_version.changed();
 }
 
 size_t NamedTransformImpl::getNumAliases() const noexcept
@@ -89,6 +93,7 @@ void NamedTransformImpl::addAlias(const char * alias) noexcept
             }
         }
     }
+    m_version.changed();
 }
 
 void NamedTransformImpl::removeAlias(const char * name) noexcept
@@ -98,11 +103,13 @@ void NamedTransformImpl::removeAlias(const char * name) noexcept
         const std::string alias{ name };
         StringUtils::Remove(m_aliases, alias);
     }
+    m_version.changed();
 }
 
 void NamedTransformImpl::clearAliases() noexcept
 {
     m_aliases.clear();
+    m_version.changed();
 }
 
 const char * NamedTransformImpl::getFamily() const noexcept
@@ -113,6 +120,7 @@ const char * NamedTransformImpl::getFamily() const noexcept
 void NamedTransformImpl::setFamily(const char * family) noexcept
 {
     m_family = family ? family : "";
+    m_version.changed();
 }
 
 const char * NamedTransformImpl::getDescription() const noexcept
@@ -123,6 +131,7 @@ const char * NamedTransformImpl::getDescription() const noexcept
 void NamedTransformImpl::setDescription(const char * description) noexcept
 {
     m_description = description ? description : "";
+    m_version.changed();
 }
 
 bool NamedTransformImpl::hasCategory(const char * category) const noexcept
@@ -133,11 +142,13 @@ bool NamedTransformImpl::hasCategory(const char * category) const noexcept
 void NamedTransformImpl::addCategory(const char * category) noexcept
 {
     m_categories.addToken(category);
+    m_version.changed();
 }
 
 void NamedTransformImpl::removeCategory(const char * category) noexcept
 {
     m_categories.removeToken(category);
+    m_version.changed();
 }
 
 int NamedTransformImpl::getNumCategories() const noexcept
@@ -153,6 +164,7 @@ const char * NamedTransformImpl::getCategory(int index) const noexcept
 void NamedTransformImpl::clearCategories() noexcept
 {
     m_categories.clearTokens();
+    m_version.changed();
 }
 
 const char * NamedTransformImpl::getEncoding() const noexcept
@@ -163,17 +175,18 @@ const char * NamedTransformImpl::getEncoding() const noexcept
 void NamedTransformImpl::setEncoding(const char * encoding) noexcept
 {
     m_encoding = encoding ? encoding : "";
+    m_version.changed();
 }
 
 ConstTransformRcPtr NamedTransformImpl::getTransform(TransformDirection dir) const
 {
     if (dir == TRANSFORM_DIR_FORWARD)
     {
-        return m_forwardTransform;
+        return ResolveTransform(m_forwardTransform, m_forwardDeferred);
     }
     else if (dir == TRANSFORM_DIR_INVERSE)
     {
-        return m_inverseTransform;
+        return ResolveTransform(m_inverseTransform, m_inverseDeferred);
     }
     throw Exception("Named transform: Unspecified TransformDirection.");
 }
@@ -223,7 +236,9 @@ void NamedTransformImpl::setTransform(const ConstTransformRcPtr & transform, Tra
 {
     if (dir == TRANSFORM_DIR_FORWARD)
     {
-        if (!transform)
+        // A deferred transform (i.e. lazily loaded config) is only created on its first access.
+        m_forwardDeferred = GetDeferredTransform(transform);
+        if (!transform || m_forwardDeferred)
         {
             m_forwardTransform = ConstTransformRcPtr();
         }
@@ -234,7 +249,8 @@ void NamedTransformImpl::setTransform(const ConstTransformRcPtr & transform, Tra
     }
     else if (dir == TRANSFORM_DIR_INVERSE)
     {
-        if (!transform)
+        m_inverseDeferred = GetDeferredTransform(transform);
+        if (!transform || m_inverseDeferred)
         {
             m_inverseTransform = ConstTransformRcPtr();
         }
@@ -247,6 +263,25 @@ void NamedTransformImpl::setTransform(const ConstTransformRcPtr & transform, Tra
     {
         throw Exception("Named transform: Unspecified TransformDirection.");
     }
+    m_version.changed();
+}
+
+bool NamedTransformImpl::hasTransform(TransformDirection dir) const noexcept
+{
+    switch (dir)
+    {
+    case TRANSFORM_DIR_FORWARD:
+        return m_forwardTransform || m_forwardDeferred;
+    case TRANSFORM_DIR_INVERSE:
+        return m_inverseTransform || m_inverseDeferred;
+    }
+    return false;
+}
+
+bool HasTransform(const NamedTransform & nt, TransformDirection dir)
+{
+    const NamedTransformImpl * impl = dynamic_cast<const NamedTransformImpl *>(&nt);
+    return impl ? impl->hasTransform(dir) : static_cast<bool>(nt.getTransform(dir));
 }
 
 std::ostream & operator<< (std::ostream & os, const NamedTransform & t)
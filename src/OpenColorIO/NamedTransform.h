@@ -9,6 +9,8 @@
 
 #include <OpenColorIO/OpenColorIO.h>
 
+#include "DeferredTransform.h"
+#include "ElementVersion.h"
 #include "TokensManager.h"
 
 namespace OCIO_NAMESPACE
@@ -51,6 +53,12 @@ public:
     ConstTransformRcPtr getTransform(TransformDirection dir) const override;
     void setTransform(const ConstTransformRcPtr & transform, TransformDirection dir) override;
 
+    // Unlike getTransform(), a deferred transform is not created.
+    bool hasTransform(TransformDirection dir) const noexcept;
+
+    // Refer to ElementVersion.
+    size_t getVersion() const noexcept { return m_version.get(); }
+
     static void Deleter(NamedTransform * nt);
 
 private:
@@ -59,15 +67,26 @@ private:
     ConstTransformRcPtr m_forwardTransform;
     ConstTransformRcPtr m_inverseTransform;
 
+    // The transforms of a lazily loaded config.
+    ConstDeferredTransformRcPtr m_forwardDeferred;
+    ConstDeferredTransformRcPtr m_inverseDeferred;
+
     std::string m_family;
     std::string m_description;
     TokensManager m_categories;
     std::string m_encoding;
+
+    // Changed by all the setters (refer to ElementVersion).
+    ElementVersion m_version;
 };
 
 ConstTransformRcPtr GetTransform(const ConstNamedTransformRcPtr & src,
                                  const ConstNamedTransformRcPtr & dst);
 
+// Return true if the named transform has a transform in the direction, without creating the
+// deferred transform of a lazily loaded config.
+bool HasTransform(const NamedTransform & nt, TransformDirection dir);
+
 } // namespace OCIO_NAMESPACE
 
 #endif // INCLUDED_OCIO_NAMEDTRANSFORM_H
@@ -2,16 +2,21 @@
 // Copyright Contributors to the OpenColorIO Project.
 
 #include <cstring>
+#include <map>
 #include <unordered_set>
+#include <vector>
 
 #include <pystring.h>
 
 #include <OpenColorIO/OpenColorIO.h>
 
+#include "DeferredTransform.h"
 #include "Display.h"
 #include "FileRules.h"
+#include "HashUtils.h"
 #include "Logging.h"
 #include "MathUtils.h"
+#include "Mutex.h"
 #include "OCIOYaml.h"
 #include "ops/exposurecontrast/ExposureContrastOpData.h"
 #include "ops/gradingprimary/GradingPrimaryOpData.h"
@@ -21,6 +26,7 @@
 #include "ParseUtils.h"
 #include "PathUtils.h"
 #include "Platform.h"
+#include "TransformHash.h"
 #include "utils/StringUtils.h"
 #include "ViewingRules.h"
 #include "yaml-cpp/yaml.h"
@@ -3165,7 +3171,182 @@ void save(YAML::Emitter& out, ConstTransformRcPtr t, unsigned int majorVersion)
 
 // ColorSpace
 
-inline void load(const YAML::Node& node, ColorSpaceRcPtr& cs, unsigned int majorVersion)
+// Lazy loading
+
+inline std::string GetLoadingError(const char * filename, const char * what)
+{
+    std::ostringstream os;
+    os << "Error: Loading the OCIO profile ";
+    if (filename && filename[0] && 
+        Platform::Strcasecmp(filename, "from Archive/ConfigIOProxy") != 0)
+    {
+        os << "'" << filename << "' ";
+    }
+    os << "failed. " << what;
+    return os.str();
+}
+
+// Create the deferred transforms of the config elements when the config is lazily loaded.
+class LazyTransformLoader
+{
+public:
+    // The transforms are loaded with the config.
+    LazyTransformLoader() = default;
+
+    LazyTransformLoader(const char * filename,
+                        unsigned int majorVersion,
+                        unsigned int minorVersion,
+                        const OCIOYaml::TransformCheck & check)
+        :   m_state(std::make_shared<State>())
+    {
+        m_state->m_filename     = filename ? filename : "";
+        m_state->m_majorVersion = majorVersion;
+        m_state->m_minorVersion = minorVersion;
+        m_state->m_check        = check;
+    }
+
+    bool isEnabled() const noexcept { return m_state != nullptr; }
+
+    // Return a null pointer if the transform type is unknown, so it is loaded now (i.e. reporting
+    // the error like the eager loading).
+    ConstDeferredTransformRcPtr defer(const YAML::Node & node) const
+    {
+        TransformType type;
+        if (node.Type() != YAML::NodeType::Map || !GetTransformType(node.Tag(), type))
+        {
+            return ConstDeferredTransformRcPtr();
+        }
+
+        // The direction is only checked when the transform is created.
+        TransformDirection dir = TRANSFORM_DIR_FORWARD;
+        const YAML::Node & dirNode = node["direction"];
+        if (dirNode.IsDefined() && dirNode.IsScalar())
+        {
+            try
+            {
+                dir = TransformDirectionFromString(dirNode.Scalar().c_str());
+            }
+            catch (const Exception &)
+            {
+            }
+        }
+
+        // The node copy holds the YAML document, which is shared by all the deferred transforms
+        // of the config so they are loaded one at a time.
+        std::shared_ptr<const State> state = m_state;
+        return std::make_shared<DeferredTransform>(type, dir, [node, state]()
+        {
+            AutoMutex lock(state->m_mutex);
+
+            TransformRcPtr transform;
+            try
+            {
+                load(node, transform);
+                state->m_check(transform, state->m_majorVersion, state->m_minorVersion);
+            }
+            catch (const std::exception & e)
+            {
+                throw Exception(GetLoadingError(state->m_filename.c_str(), e.what()).c_str());
+            }
+            return transform;
+        });
+    }
+
+private:
+    static bool GetTransformType(const std::string & tag, TransformType & type)
+    {
+        static const std::map<std::string, TransformType> types = {
+            { "AllocationTransform",         TRANSFORM_TYPE_ALLOCATION },
+            { "BuiltinTransform",            TRANSFORM_TYPE_BUILTIN },
+            { "CDLTransform",                TRANSFORM_TYPE_CDL },
+            { "ColorSpaceTransform",         TRANSFORM_TYPE_COLORSPACE },
+            { "DisplayViewTransform",        TRANSFORM_TYPE_DISPLAY_VIEW },
+            { "ExponentTransform",           TRANSFORM_TYPE_EXPONENT },
+            { "ExponentWithLinearTransform", TRANSFORM_TYPE_EXPONENT_WITH_LINEAR },
+            { "ExposureContrastTransform",   TRANSFORM_TYPE_EXPOSURE_CONTRAST },
+            { "FileTransform",               TRANSFORM_TYPE_FILE },
+            { "FixedFunctionTransform",      TRANSFORM_TYPE_FIXED_FUNCTION },
+            { "GradingPrimaryTransform",     TRANSFORM_TYPE_GRADING_PRIMARY },
+            { "GradingRGBCurveTransform",    TRANSFORM_TYPE_GRADING_RGB_CURVE },
+            { "GradingToneTransform",        TRANSFORM_TYPE_GRADING_TONE },
+            { "GroupTransform",              TRANSFORM_TYPE_GROUP },
+            { "LogAffineTransform",          TRANSFORM_TYPE_LOG_AFFINE },
+            { "LogCameraTransform",          TRANSFORM_TYPE_LOG_CAMERA },
+            { "LogTransform",                TRANSFORM_TYPE_LOG },
+            { "LookTransform",               TRANSFORM_TYPE_LOOK },
+            { "MatrixTransform",             TRANSFORM_TYPE_MATRIX },
+            { "RangeTransform",              TRANSFORM_TYPE_RANGE }
+        };
+
+        const auto it = types.find(tag);
+        if (it == types.end())
+        {
+            return false;
+        }
+        type = it->second;
+        return true;
+    }
+
+    struct State
+    {
+        std::string m_filename;
+        unsigned int m_majorVersion = 0;
+        unsigned int m_minorVersion = 0;
+        OCIOYaml::TransformCheck m_check;
+        mutable Mutex m_mutex;
+    };
+
+    std::shared_ptr<State> m_state;
+};
+
+// Load a transform of a config element, either now or on its first access when the config is
+// lazily loaded (i.e. the element setters keep the deferred transform).
+inline ConstTransformRcPtr loadTransform(const YAML::Node & node, const LazyTransformLoader & lazy)
+{
+    if (lazy.isEnabled())
+    {
+        ConstDeferredTransformRcPtr deferred = lazy.defer(node);
+        if (deferred)
+        {
+            return deferred;
+        }
+    }
+
+    TransformRcPtr val;
+    load(node, val);
+    return val;
+}
+
+template<typename Element, typename Direction>
+inline void loadTransform(const YAML::Node & node,
+                          const LazyTransformLoader & lazy,
+                          Element & element,
+                          Direction dir)
+{
+    element.setTransform(loadTransform(node, lazy), dir);
+}
+
+inline void loadTransform(const YAML::Node & node,
+                          const LazyTransformLoader & lazy,
+                          Look & look,
+                          TransformDirection dir)
+{
+    if (dir == TRANSFORM_DIR_FORWARD)
+    {
+        look.setTransform(loadTransform(node, lazy));
+    }
+    else
+    {
+        look.setInverseTransform(loadTransform(node, lazy));
+    }
+}
+
+// ColorSpace
+
+inline void load(const YAML::Node & node,
+                 ColorSpaceRcPtr & cs,
+                 unsigned int majorVersion,
+                 const LazyTransformLoader & lazy)
 {
     if(node.Tag() != "ColorSpace")
         return; // not a !<ColorSpace> tag
@@ -3262,9 +3443,7 @@ inline void load(const YAML::Node& node, ColorSpaceRcPtr& cs, unsigned int major
                 throwError(node, "'to_reference' or 'to_scene_reference' cannot be used for a "
                                  "display color space.");
             }
-            TransformRcPtr val;
-            load(iter->second, val);
-            cs->setTransform(val, COLORSPACE_DIR_TO_REFERENCE);
+            loadTransform(iter->second, lazy, *cs, COLORSPACE_DIR_TO_REFERENCE);
         }
         else if (key == "to_display_reference")
         {
@@ -3273,9 +3452,7 @@ inline void load(const YAML::Node& node, ColorSpaceRcPtr& cs, unsigned int major
                 throwError(node, "'to_display_reference' cannot be used for a "
                                  "non-display color space.");
             }
-            TransformRcPtr val;
-            load(iter->second, val);
-            cs->setTransform(val, COLORSPACE_DIR_TO_REFERENCE);
+            loadTransform(iter->second, lazy, *cs, COLORSPACE_DIR_TO_REFERENCE);
         }
         else if(key == "from_reference" || (majorVersion >= 2 && key == "from_scene_reference"))
         {
@@ -3284,9 +3461,7 @@ inline void load(const YAML::Node& node, ColorSpaceRcPtr& cs, unsigned int major
                 throwError(node, "'from_reference' or 'from_scene_reference' cannot be used for "
                                  "a display color space.");
             }
-            TransformRcPtr val;
-            load(iter->second, val);
-            cs->setTransform(val, COLORSPACE_DIR_FROM_REFERENCE);
+            loadTransform(iter->second, lazy, *cs, COLORSPACE_DIR_FROM_REFERENCE);
         }
         else if (key == "from_display_reference")
         {
@@ -3295,9 +3470,7 @@ inline void load(const YAML::Node& node, ColorSpaceRcPtr& cs, unsigned int major
                 throwError(node, "'from_display_reference' cannot be used for a "
                                  "non-display color space.");
             }
-            TransformRcPtr val;
-            load(iter->second, val);
-            cs->setTransform(val, COLORSPACE_DIR_FROM_REFERENCE);
+            loadTransform(iter->second, lazy, *cs, COLORSPACE_DIR_FROM_REFERENCE);
         }
         else
         {
@@ -3359,7 +3532,10 @@ inline void save(YAML::Emitter& out, ConstColorSpaceRcPtr cs, unsigned int major
     }
 
     const auto isDisplay = (cs->getReferenceSpaceType() == REFERENCE_SPACE_DISPLAY);
+
     ConstTransformRcPtr toref = cs->getTransform(COLORSPACE_DIR_TO_REFERENCE);
+    ConstTransformRcPtr fromref = cs->getTransform(COLORSPACE_DIR_FROM_REFERENCE);
+
     if(toref)
     {
         out << YAML::Key << (isDisplay ? "to_display_reference" :
@@ -3368,7 +3544,6 @@ inline void save(YAML::Emitter& out, ConstColorSpaceRcPtr cs, unsigned int major
         save(out, toref, majorVersion);
     }
 
-    ConstTransformRcPtr fromref = cs->getTransform(COLORSPACE_DIR_FROM_REFERENCE);
     if(fromref)
     {
         out << YAML::Key << (isDisplay ? "from_display_reference" :
@@ -3383,7 +3558,7 @@ inline void save(YAML::Emitter& out, ConstColorSpaceRcPtr cs, unsigned int major
 
 // Look
 
-inline void load(const YAML::Node& node, LookRcPtr& look)
+inline void load(const YAML::Node& node, LookRcPtr& look, const LazyTransformLoader & lazy)
 {
     if(node.Tag() != "Look")
         return;
@@ -3410,15 +3585,11 @@ inline void load(const YAML::Node& node, LookRcPtr& look)
         }
         else if(key == "transform")
         {
-            TransformRcPtr val;
-            load(iter->second, val);
-            look->setTransform(val);
+            loadTransform(iter->second, lazy, *look, TRANSFORM_DIR_FORWARD);
         }
         else if(key == "inverse_transform")
         {
-            TransformRcPtr val;
-            load(iter->second, val);
-            look->setInverseTransform(val);
+            loadTransform(iter->second, lazy, *look, TRANSFORM_DIR_INVERSE);
         }
         else if(key == "description")
         {
@@ -3508,7 +3679,9 @@ inline ReferenceSpaceType peekViewTransformReferenceSpace(const YAML::Node & nod
     return isDisplay ? REFERENCE_SPACE_DISPLAY : REFERENCE_SPACE_SCENE;
 }
 
-inline void load(const YAML::Node & node, ViewTransformRcPtr & vt)
+inline void load(const YAML::Node & node,
+                 ViewTransformRcPtr & vt,
+                 const LazyTransformLoader & lazy)
 {
     if (node.Tag() != "ViewTransform")
     {
@@ -3524,6 +3697,9 @@ inline void load(const YAML::Node & node, ViewTransformRcPtr & vt)
     
     CheckDuplicates(node);
 
+    // Note that the view transforms, which are few, directly create the deferred transforms of a
+    // lazily loaded config (refer to DeferredTransform::createEditableCopy()).
+
     for (Iterator iter = node.begin(); iter != node.end(); ++iter)
     {
         const std::string & key = iter->first.as<std::string>();
@@ -3559,27 +3735,19 @@ inline void load(const YAML::Node & node, ViewTransformRcPtr & vt)
         }
         else if (key == "to_scene_reference")
         {
-            TransformRcPtr val;
-            load(iter->second, val);
-            vt->setTransform(val, VIEWTRANSFORM_DIR_TO_REFERENCE);
+            loadTransform(iter->second, lazy, *vt, VIEWTRANSFORM_DIR_TO_REFERENCE);
         }
         else if (key == "to_display_reference")
         {
-            TransformRcPtr val;
-            load(iter->second, val);
-            vt->setTransform(val, VIEWTRANSFORM_DIR_TO_REFERENCE);
+            loadTransform(iter->second, lazy, *vt, VIEWTRANSFORM_DIR_TO_REFERENCE);
         }
         else if (key == "from_scene_reference")
         {
-            TransformRcPtr val;
-            load(iter->second, val);
-            vt->setTransform(val, VIEWTRANSFORM_DIR_FROM_REFERENCE);
+            loadTransform(iter->second, lazy, *vt, VIEWTRANSFORM_DIR_FROM_REFERENCE);
         }
         else if (key == "from_display_reference")
         {
-            TransformRcPtr val;
-            load(iter->second, val);
-            vt->setTransform(val, VIEWTRANSFORM_DIR_FROM_REFERENCE);
+            loadTransform(iter->second, lazy, *vt, VIEWTRANSFORM_DIR_FROM_REFERENCE);
         }
         else
         {
@@ -3633,7 +3801,9 @@ inline void save(YAML::Emitter & out, ConstViewTransformRcPtr & vt, unsigned int
 
 // NamedTransform
 
-inline void load(const YAML::Node & node, NamedTransformRcPtr & nt)
+inline void load(const YAML::Node & node,
+                 NamedTransformRcPtr & nt,
+                 const LazyTransformLoader & lazy)
 {
     if (node.Tag() != "NamedTransform")
     {
@@ -3697,15 +3867,11 @@ inline void load(const YAML::Node & node, NamedTransformRcPtr & nt)
         }
         else if (key == "transform")
         {
-            TransformRcPtr val;
-            load(iter->second, val);
-            nt->setTransform(val, TRANSFORM_DIR_FORWARD);
+            loadTransform(iter->second, lazy, *nt, TRANSFORM_DIR_FORWARD);
         }
         else if (key == "inverse_transform")
         {
-            TransformRcPtr val;
-            load(iter->second, val);
-            nt->setTransform(val, TRANSFORM_DIR_INVERSE);
+            loadTransform(iter->second, lazy, *nt, TRANSFORM_DIR_INVERSE);
         }
         else
         {
@@ -4122,7 +4288,10 @@ inline void save(YAML::Emitter & out, ConstViewingRulesRcPtr & vr, size_t positi
 
 // Config
 
-inline void load(const YAML::Node& node, ConfigRcPtr & config, const char* filename)
+inline void load(const YAML::Node& node,
+                 ConfigRcPtr & config,
+                 const char* filename,
+                 const OCIOYaml::TransformCheck & lazyCheck)
 {
 
     // check profile version
@@ -4194,6 +4363,14 @@ inline void load(const YAML::Node& node, ConfigRcPtr & config, const char* filen
         throw Exception(os.str().c_str());
     }
 
+    // The transforms of the config elements are loaded on their first access for a lazy loading.
+    const LazyTransformLoader lazy
+        = lazyCheck ? LazyTransformLoader(filename,
+                                          config->getMajorVersion(),
+                                          config->getMinorVersion(),
+                                          lazyCheck)
+                    : LazyTransformLoader();
+
     bool fileRulesFound = false;
     bool defaultFileRuleFound = false;
     auto fileRules = config->getFileRules()->createEditableCopy();
@@ -4509,7 +4686,7 @@ inline void load(const YAML::Node& node, ConfigRcPtr & config, const char* filen
                 if(val.Tag() == "ColorSpace")
                 {
                     ColorSpaceRcPtr cs = ColorSpace::Create(REFERENCE_SPACE_SCENE);
-                    load(val, cs, config->getMajorVersion());
+                    load(val, cs, config->getMajorVersion(), lazy);
                     for(int ii = 0; ii < config->getNumColorSpaces(); ++ii)
                     {
                         if(strcmp(config->getColorSpaceNameByIndex(ii), cs->getName()) == 0)
@@ -4545,7 +4722,7 @@ inline void load(const YAML::Node& node, ConfigRcPtr & config, const char* filen
                 if (val.Tag() == "ColorSpace")
                 {
                     ColorSpaceRcPtr cs = ColorSpace::Create(REFERENCE_SPACE_DISPLAY);
-                    load(val, cs, config->getMajorVersion());
+                    load(val, cs, config->getMajorVersion(), lazy);
                     for (int ii = 0; ii < config->getNumColorSpaces(); ++ii)
                     {
                         if (strcmp(config->getColorSpaceNameByIndex(ii), cs->getName()) == 0)
@@ -4581,7 +4758,7 @@ inline void load(const YAML::Node& node, ConfigRcPtr & config, const char* filen
                 if(val.Tag() == "Look")
                 {
                     LookRcPtr look = Look::Create();
-                    load(val, look);
+                    load(val, look, lazy);
                     config->addLook(look);
                 }
                 else
@@ -4609,7 +4786,7 @@ inline void load(const YAML::Node& node, ConfigRcPtr & config, const char* filen
                 {
                     ReferenceSpaceType rst = peekViewTransformReferenceSpace(val);
                     ViewTransformRcPtr vt = ViewTransform::Create(rst);
-                    load(val, vt);
+                    load(val, vt, lazy);
                     config->addViewTransform(vt);
                 }
                 else
@@ -4642,7 +4819,7 @@ inline void load(const YAML::Node& node, ConfigRcPtr & config, const char* filen
                 if (val.Tag() == "NamedTransform")
                 {
                     auto nt = NamedTransform::Create();
-                    load(val, nt);
+                    load(val, nt, lazy);
                     if (nt->getName())
                     {
                         // Test that the name transform definitions are unique.
@@ -4750,7 +4927,9 @@ inline void load(const YAML::Node& node, ConfigRcPtr & config, const char* filen
     }
 }
 
-inline void save(YAML::Emitter & out, const Config & config)
+// Save the config members other than the elements (i.e. color spaces, looks, view transforms
+// and named transforms), which are saved after them.
+inline void saveMembers(YAML::Emitter & out, const Config & config)
 {
     std::stringstream ss;
     const unsigned configMajorVersion = config.getMajorVersion();
@@ -4760,8 +4939,6 @@ inline void save(YAML::Emitter & out, const Config & config)
         ss << "." << config.getMinorVersion();
     }
 
-    out << YAML::Block;
-    out << YAML::BeginMap;
     out << YAML::Key << "ocio_profile_version" << YAML::Value << ss.str();
     out << YAML::Newline;
     out << YAML::Newline;
@@ -5010,6 +5187,15 @@ inline void save(YAML::Emitter & out, const Config & config)
     }
 
     out << YAML::Newline;
+}
+
+// Save the config elements. When not null, the hashes of the elements replace their
+// serialization.
+inline void saveElements(YAML::Emitter & out,
+                         const Config & config,
+                         OCIOYaml::ElementHashCache * hashes)
+{
+    const unsigned configMajorVersion = config.getMajorVersion();
 
     // Looks
     if(config.getNumLooks() > 0)
@@ -5020,7 +5206,14 @@ inline void save(YAML::Emitter & out, const Config & config)
         for(int i = 0; i < config.getNumLooks(); ++i)
         {
             const char* name = config.getLookNameByIndex(i);
-            save(out, config.getLook(name), configMajorVersion);
+            if (hashes)
+            {
+                out << hashes->getHash(config.getLook(name), configMajorVersion);
+            }
+            else
+            {
+                save(out, config.getLook(name), configMajorVersion);
+            }
         }
         out << YAML::EndSeq;
         out << YAML::Newline;
@@ -5044,7 +5237,14 @@ inline void save(YAML::Emitter & out, const Config & config)
         {
             auto name = config.getViewTransformNameByIndex(i);
             auto vt = config.getViewTransform(name);
-            save(out, vt, configMajorVersion);
+            if (hashes)
+            {
+                out << hashes->getHash(vt, configMajorVersion);
+            }
+            else
+            {
+                save(out, vt, configMajorVersion);
+            }
         }
         out << YAML::EndSeq;
     }
@@ -5082,7 +5282,14 @@ inline void save(YAML::Emitter & out, const Config & config)
         out << YAML::Value << YAML::BeginSeq;
         for (const auto & cs : displayCS)
         {
-            save(out, cs, configMajorVersion);
+            if (hashes)
+            {
+                out << hashes->getHash(cs, configMajorVersion);
+            }
+            else
+            {
+                save(out, cs, configMajorVersion);
+            }
         }
         out << YAML::EndSeq;
     }
@@ -5094,7 +5301,14 @@ inline void save(YAML::Emitter & out, const Config & config)
         out << YAML::Value << YAML::BeginSeq;
         for (const auto & cs : sceneCS)
         {
-            save(out, cs, configMajorVersion);
+            if (hashes)
+            {
+                out << hashes->getHash(cs, configMajorVersion);
+            }
+            else
+            {
+                save(out, cs, configMajorVersion);
+            }
         }
         out << YAML::EndSeq;
     }
@@ -5110,11 +5324,25 @@ inline void save(YAML::Emitter & out, const Config & config)
         {
             auto name = config.getNamedTransformNameByIndex(NAMEDTRANSFORM_ALL, i);
             auto nt = config.getNamedTransform(name);
-            save(out, nt, configMajorVersion);
+            if (hashes)
+            {
+                out << hashes->getHash(nt, configMajorVersion);
+            }
+            else
+            {
+                save(out, nt, configMajorVersion);
+            }
         }
         out << YAML::EndSeq;
     }
+}
 
+inline void save(YAML::Emitter & out, const Config & config)
+{
+    out << YAML::Block;
+    out << YAML::BeginMap;
+    saveMembers(out, config);
+    saveElements(out, config, nullptr);
     out << YAML::EndMap;
 }
 
@@ -5122,24 +5350,19 @@ inline void save(YAML::Emitter & out, const Config & config)
 
 ///////////////////////////////////////////////////////////////////////////
 
-void OCIOYaml::Read(std::istream & istream, ConfigRcPtr & config, const char * filename)
+void OCIOYaml::Read(std::istream & istream,
+                    ConfigRcPtr & config,
+                    const char * filename,
+                    const TransformCheck & lazyCheck)
 {
     try
     {
         YAML::Node node = YAML::Load(istream);
-        load(node, config, filename);
+        load(node, config, filename, lazyCheck);
     }
     catch(const std::exception & e)
     {
-        std::ostringstream os;
-        os << "Error: Loading the OCIO profile ";
-        if (filename && filename[0] && 
-            Platform::Strcasecmp(filename, "from Archive/ConfigIOProxy") != 0)
-        {
-            os << "'" << filename << "' ";
-        }
-        os << "failed. " << e.what();
-        throw Exception(os.str().c_str());
+        throw Exception(GetLoadingError(filename, e.what()).c_str());
     }
 }
 
@@ -5152,4 +5375,212 @@ void OCIOYaml::Write(std::ostream & ostream, const Config & config)
     ostream << out.c_str();
 }
 
+void OCIOYaml::WriteCacheID(std::ostream & ostream, const Config & config, ElementHashCache & cache)
+{
+    // The members are the beginning of the config map (refer to save()).
+    ostream << cache.getMembers([&config]()
+                                {
+                                    YAML::Emitter out;
+                                    out.SetDoublePrecision(std::numeric_limits<double>::digits10);
+                                    out.SetFloatPrecision(7);
+                                    out << YAML::Block;
+                                    out << YAML::BeginMap;
+                                    saveMembers(out, config);
+                                    return std::string(out.c_str());
+                                });
+
+    // Each element section starts with a new line, so the elements emitted in a new map are
+    // identical to the end of the config map.
+    YAML::Emitter out;
+    out << YAML::Block;
+    out << YAML::BeginMap;
+    saveElements(out, config, &cache);
+    out << YAML::EndMap;
+    ostream << out.c_str();
+
+    cache.prune();
+}
+
+namespace
+{
+
+template<typename T>
+std::string SerializeElement(T element, unsigned majorVersion)
+{
+    YAML::Emitter out;
+    out.SetDoublePrecision(std::numeric_limits<double>::digits10);
+    out.SetFloatPrecision(7);
+    save(out, element, majorVersion);
+    return out.c_str();
+}
+
+// Return the hash of the content of the transforms of an element, including their names as they
+// are also serialized.
+size_t GetTransformsHash(const ConstTransformRcPtr & transform1,
+                         const ConstTransformRcPtr & transform2)
+{
+    size_t seed = 0;
+    HashCombine(seed, transform1 ? GetTransformHash(*transform1, true) : 0);
+    HashCombine(seed, transform2 ? GetTransformHash(*transform2, true) : 0);
+    return seed;
+}
+
+} // anon.
+
+const std::string & OCIOYaml::ElementHashCache::getHash(const ConstColorSpaceRcPtr & cs,
+                                                       unsigned majorVersion)
+{
+    return getHash(cs, majorVersion, getVersion(*cs),
+                   GetTransformsHash(cs->getTransform(COLORSPACE_DIR_TO_REFERENCE),
+                                     cs->getTransform(COLORSPACE_DIR_FROM_REFERENCE)),
+                   [&cs, majorVersion]()
+                   {
+                       return SerializeElement(cs, majorVersion);
+                   });
+}
+
+const std::string & OCIOYaml::ElementHashCache::getHash(const ConstLookRcPtr & look,
+                                                       unsigned majorVersion)
+{
+    return getHash(look, majorVersion, getVersion(*look),
+                   GetTransformsHash(look->getTransform(), look->getInverseTransform()),
+                   [&look, majorVersion]()
+                   {
+                       return SerializeElement(look, majorVersion);
+                   });
+}
+
+const std::string & OCIOYaml::ElementHashCache::getHash(const ConstViewTransformRcPtr & vt,
+                                                       unsigned majorVersion)
+{
+    return getHash(vt, majorVersion, getVersion(*vt),
+                   GetTransformsHash(vt->getTransform(VIEWTRANSFORM_DIR_TO_REFERENCE),
+                                     vt->getTransform(VIEWTRANSFORM_DIR_FROM_REFERENCE)),
+                   [&vt, majorVersion]()
+                   {
+                       return SerializeElement(vt, majorVersion);
+                   });
+}
+
+const std::string & OCIOYaml::ElementHashCache::getHash(const ConstNamedTransformRcPtr & nt,
+                                                       unsigned majorVersion)
+{
+    return getHash(nt, majorVersion, getVersion(*nt),
+                   GetTransformsHash(nt->getTransform(TRANSFORM_DIR_FORWARD),
+                                     nt->getTransform(TRANSFORM_DIR_INVERSE)),
+                   [&nt, majorVersion]()
+                   {
+                       return SerializeElement(nt, majorVersion);
+                   });
+}
+
+const std::string & OCIOYaml::ElementHashCache::getHash(
+    const std::shared_ptr<const void> & element,
+    unsigned majorVersion,
+    size_t version,
+    size_t transformsHash,
+    const std::function<std::string()> & serialize)
+{
+    // The serialization of an element depends on the config version.
+    if (majorVersion != m_majorVersion)
+    {
+        m_entries.clear();
+        m_majorVersion = majorVersion;
+    }
+
+    auto it = m_entries.find(element.get());
+    if (it == m_entries.end() || it->second.m_version != version
+        || it->second.m_transformsHash != transformsHash)
+    {
+        // The serialization includes all the element members, including the transform metadata.
+        const std::string str = serialize();
+
+        Entry entry;
+        entry.m_element        = element;
+        entry.m_version        = version;
+        entry.m_transformsHash = transformsHash;
+        entry.m_hash           = CacheIDHash(str.c_str(), str.size());
+
+        if (it == m_entries.end())
+        {
+            it = m_entries.emplace(element.get(), std::move(entry)).first;
+        }
+        else
+        {
+            it->second = std::move(entry);
+        }
+    }
+
+    it->second.m_used = true;
+    return it->second.m_hash;
+}
+
+const std::string & OCIOYaml::ElementHashCache::getMembers(
+    const std::function<std::string()> & serialize)
+{
+    if (m_members.empty())
+    {
+        m_members = serialize();
+    }
+    return m_members;
+}
+
+void OCIOYaml::ElementHashCache::setMembersVersion(const std::string & version)
+{
+    if (version != m_membersVersion)
+    {
+        m_membersVersion = version;
+        m_members.clear();
+    }
+}
+
+void OCIOYaml::ElementHashCache::resetMembers() noexcept
+{
+    m_members.clear();
+}
+
+void OCIOYaml::ElementHashCache::copyEntry(const ElementHashCache & rhs,
+                                           const void * element,
+                                           const std::shared_ptr<const void> & copy)
+{
+    const auto it = rhs.m_entries.find(element);
+    if (it == rhs.m_entries.end())
+    {
+        return;
+    }
+
+    if (rhs.m_majorVersion != m_majorVersion)
+    {
+        m_entries.clear();
+        m_majorVersion = rhs.m_majorVersion;
+    }
+
+    // The copy keeps the element version and the content of its transforms.
+    Entry entry = it->second;
+    entry.m_element = copy;
+    m_entries[copy.get()] = std::move(entry);
+}
+
+void OCIOYaml::ElementHashCache::copyMembers(const ElementHashCache & rhs)
+{
+    m_members        = rhs.m_members;
+    m_membersVersion = rhs.m_membersVersion;
+}
+
+void OCIOYaml::ElementHashCache::prune()
+{
+    for (auto it = m_entries.begin(); it != m_entries.end();)
+    {
+        if (!it->second.m_used)
+        {
+            it = m_entries.erase(it);
+        }
+        else
+        {
+            it->second.m_used = false;
+            ++it;
+        }
+    }
+}
+
 } // namespace OCIO_NAMESPACE
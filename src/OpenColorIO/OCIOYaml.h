@@ -6,15 +6,108 @@
 #ifndef INCLUDED_OCIO_YAML_H
 #define INCLUDED_OCIO_YAML_H
 
+#include <functional>
+#include <memory>
+#include <string>
+#include <unordered_map>
+
 namespace OCIO_NAMESPACE
 {
 
 namespace OCIOYaml
 {
 
-void Read(std::istream & istream, ConfigRcPtr & c, const char * filename);
+// Cache of the hashes of the serialized config elements (i.e. color spaces, looks, view
+// transforms and named transforms) and of the serialization of the other config members, to
+// compute the config cache ID. An element is only serialized again after a change of its version
+// (refer to ElementVersion), or of the content of its transforms as they could be edited in place.
+//
+// The element versions are only accessible to the config, which implements getVersion().
+class ElementHashCache
+{
+public:
+    ElementHashCache() = default;
+    virtual ~ElementHashCache() = default;
+
+    const std::string & getHash(const ConstColorSpaceRcPtr & cs, unsigned majorVersion);
+    const std::string & getHash(const ConstLookRcPtr & look, unsigned majorVersion);
+    const std::string & getHash(const ConstViewTransformRcPtr & vt, unsigned majorVersion);
+    const std::string & getHash(const ConstNamedTransformRcPtr & nt, unsigned majorVersion);
+
+    // Return the serialization of the config members other than the elements (e.g. the roles,
+    // the displays or the rules), only serialized again after resetMembers() or a change of the
+    // members version.
+    const std::string & getMembers(const std::function<std::string()> & serialize);
+
+    // The members version combines the versions of the members which could be edited in place
+    // (i.e. the file rules, the viewing rules and the context).
+    void setMembersVersion(const std::string & version);
+
+    // Called by the config setters changing members other than the elements.
+    void resetMembers() noexcept;
+
+    // Copy the cached hash of an element of another cache to the copy of this element.
+    void copyEntry(const ElementHashCache & rhs,
+                   const void * element,
+                   const std::shared_ptr<const void> & copy);
+
+    // Copy the serialization of the members of another cache.
+    void copyMembers(const ElementHashCache & rhs);
+
+    // Remove the elements not used since the previous call (i.e. removed from the config).
+    void prune();
+
+    size_t size() const noexcept { return m_entries.size(); }
+
+protected:
+    virtual size_t getVersion(const ColorSpace & cs) const = 0;
+    virtual size_t getVersion(const Look & look) const = 0;
+    virtual size_t getVersion(const ViewTransform & vt) const = 0;
+    virtual size_t getVersion(const NamedTransform & nt) const = 0;
+
+private:
+    const std::string & getHash(const std::shared_ptr<const void> & element,
+                                unsigned majorVersion,
+                                size_t version,
+                                size_t transformsHash,
+                                const std::function<std::string()> & serialize);
+
+    struct Entry
+    {
+        // Hold the element so that its address could not be reused while it is cached.
+        std::shared_ptr<const void> m_element;
+        size_t m_version = 0;
+        // The hash of the content of the element transforms (refer to GetTransformHash()).
+        size_t m_transformsHash = 0;
+        std::string m_hash;
+        bool m_used = true;
+    };
+
+    std::unordered_map<const void *, Entry> m_entries;
+    unsigned m_majorVersion = 0;
+
+    std::string m_members;
+    std::string m_membersVersion;
+};
+
+// Check of a transform of a lazily loaded config on its creation, using the version of the read
+// config, as the transforms are not checked when reading the config.
+typedef std::function<void(const ConstTransformRcPtr & transform,
+                           unsigned int majorVersion,
+                           unsigned int minorVersion)> TransformCheck;
+
+// Read a config. When the lazy check is set, the transforms of the config elements are only
+// created on their first access (see SetLazyConfigLoading).
+void Read(std::istream & istream,
+          ConfigRcPtr & c,
+          const char * filename,
+          const TransformCheck & lazyCheck = TransformCheck());
 void Write(std::ostream & ostream, const Config & c);
 
+// Write the config where each element is replaced by its hash, to compute the config cache ID
+// without serializing again all the unchanged elements.
+void WriteCacheID(std::ostream & ostream, const Config & c, ElementHashCache & cache);
+
 } // namespace OCIOYaml
 
 } // namespace OCIO_NAMESPACE
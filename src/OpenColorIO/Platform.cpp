@@ -342,6 +342,32 @@ std::string CreateFileContentHash(const std::string &filename)
     return "";
 }
 
+bool GetFileStamp(const std::string & filename, FileStamp & stamp)
+{
+#if defined(_WIN32) && defined(UNICODE)
+    struct _stat64 fileInfo;
+    if (_wstat64(Platform::Utf8ToUtf16(filename).c_str(), &fileInfo) != 0)
+#else
+    struct stat fileInfo;
+    if (stat(filename.c_str(), &fileInfo) != 0)
+#endif
+    {
+        return false;
+    }
+
+    // Refer to CreateFileContentHash() for the limitations of st_ino on Windows.
+    stamp.m_mtime = static_cast<long long>(fileInfo.st_mtime) * 1000000000LL;
+#if defined(__APPLE__)
+    stamp.m_mtime += static_cast<long long>(fileInfo.st_mtimespec.tv_nsec);
+#elif !defined(_WIN32)
+    stamp.m_mtime += static_cast<long long>(fileInfo.st_mtim.tv_nsec);
+#endif
+    stamp.m_size  = static_cast<long long>(fileInfo.st_size);
+    stamp.m_inode = static_cast<unsigned long long>(fileInfo.st_ino);
+
+    return true;
+}
+
 } // Platform
 
 } // namespace OCIO_NAMESPACE
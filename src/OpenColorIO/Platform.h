@@ -106,6 +106,24 @@ void OpenInputFileStream(std::ifstream & stream, const char * filename, std::ios
 // Create a unique hash of a file provided as a UTF-8 filename on any platform.
 std::string CreateFileContentHash(const std::string &filename);
 
+// The file system information used to detect that a file was modified.
+struct FileStamp
+{
+    long long m_mtime = 0; // The last modification time in nanoseconds.
+    long long m_size  = 0;
+    unsigned long long m_inode = 0;
+
+    bool operator==(const FileStamp & rhs) const noexcept
+    {
+        return m_mtime == rhs.m_mtime && m_size == rhs.m_size && m_inode == rhs.m_inode;
+    }
+    bool operator!=(const FileStamp & rhs) const noexcept { return !(*this == rhs); }
+};
+
+// Get the stamp of a file provided as a UTF-8 filename on any platform. Returns false if the file
+// does not exist.
+bool GetFileStamp(const std::string & filename, FileStamp & stamp);
+
 // Convert UTF-8 string to UTF-16LE.
 std::wstring Utf8ToUtf16(const std::string & str);
 
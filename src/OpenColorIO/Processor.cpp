@@ -16,6 +16,7 @@
 #include "ops/noop/NoOps.h"
 #include "Processor.h"
 #include "TransformBuilder.h"
+#include "transforms/FileTransform.h"
 #include "utils/StringUtils.h"
 
 namespace OCIO_NAMESPACE
@@ -243,6 +244,8 @@ Processor::Impl & Processor::Impl::operator=(const Impl & rhs)
         m_metadata = rhs.m_metadata;
         m_ops      = rhs.m_ops;
 
+        m_fileStates = rhs.m_fileStates;
+
         m_cacheID.clear();
 
         m_cacheFlags = rhs.m_cacheFlags;
@@ -646,6 +649,31 @@ void Processor::Impl::computeMetadata()
     {
         op->dumpMetadata(m_metadata);
     }
+
+    m_fileStates.clear();
+    for (int idx = 0; idx < m_metadata->getNumFiles(); ++idx)
+    {
+        const std::string filepath = m_metadata->getFile(idx);
+        m_fileStates.emplace_back(filepath, GetCachedFileState(filepath));
+    }
+}
+
+bool Processor::Impl::hasModifiedFiles() const
+{
+    if (GetFileCacheValidationInterval() < 0)
+    {
+        return false;
+    }
+
+    for (const auto & file : m_fileStates)
+    {
+        if (IsCachedFileModified(file.first, file.second))
+        {
+            return true;
+        }
+    }
+
+    return false;
 }
 
 } // namespace OCIO_NAMESPACE
@@ -11,6 +11,7 @@
 #include "Mutex.h"
 #include "Op.h"
 #include "PrivateTypes.h"
+#include "transforms/FileTransform.h"
 
 
 namespace OCIO_NAMESPACE
@@ -34,6 +35,9 @@ private:
     mutable ProcessorCache<std::size_t, GPUProcessorRcPtr> m_gpuProcessorCache;
     mutable ProcessorCache<std::size_t, CPUProcessorRcPtr> m_cpuProcessorCache;
 
+    // The file system information of each file used by the processor, when it was loaded.
+    std::vector<std::pair<std::string, CachedFileState>> m_fileStates;
+
 public:
     Impl();
     Impl(Impl &) = delete;
@@ -105,6 +109,10 @@ public:
 
     void computeMetadata();
 
+    // True if a file used by the processor was modified since the processor creation. Always
+    // false when the validation of the FileTransform cache is disabled.
+    bool hasModifiedFiles() const;
+
 protected:
     ConstGPUProcessorRcPtr getGPUProcessor(const OpRcPtrVec & gpuOps,
                                            OptimizationFlags oFlags) const;
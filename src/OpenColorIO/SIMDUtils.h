@@ -0,0 +1,125 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#ifndef INCLUDED_OCIO_SIMDUTILS_H
+#define INCLUDED_OCIO_SIMDUTILS_H
+
+
+#include <cstdint>
+#include <cstring>
+
+#include <OpenColorIO/OpenColorIO.h>
+
+
+namespace OCIO_NAMESPACE
+{
+
+// Scalar version of the SIMD structures (i.e. one pixel at a time) implementing the subset of
+// functions needed by the kernels that also have a fallback for the CPUs without SSE2.
+struct VecScalar
+{
+    typedef float vec;
+    typedef bool mask;
+
+    static constexpr int N = 1;
+
+    static inline vec set1(float v) { return v; }
+
+    static inline void loadRGBA(const float * in, vec & r, vec & g, vec & b, vec & a)
+    {
+        r = in[0];
+        g = in[1];
+        b = in[2];
+        a = in[3];
+    }
+
+    static inline void storeRGBA(float * out, vec r, vec g, vec b, vec a)
+    {
+        out[0] = r;
+        out[1] = g;
+        out[2] = b;
+        out[3] = a;
+    }
+
+    static inline vec add(vec a, vec b) { return a + b; }
+    static inline vec sub(vec a, vec b) { return a - b; }
+    static inline vec mul(vec a, vec b) { return a * b; }
+
+    // Note that 'b' is returned for NaNs like the SIMD versions.
+    static inline vec min(vec a, vec b) { return a < b ? a : b; }
+    static inline vec max(vec a, vec b) { return a > b ? a : b; }
+
+    static inline mask less(vec a, vec b) { return a < b; }
+    static inline mask greater(vec a, vec b) { return a > b; }
+    static inline vec select(mask m, vec t, vec f) { return m ? t : f; }
+
+    // Note that the values must be in the int32 range.
+    static inline vec trunc(vec a) { return static_cast<float>(static_cast<int32_t>(a)); }
+
+    // Load the half float at the 'idx' position (i.e. integer value) of 'base' as float. Note
+    // that the half float infinities & NaNs are not supported (refer to sseHalfToFloat()).
+    static inline vec gatherHalf(const uint16_t * base, vec idx)
+    {
+        const uint32_t h = base[static_cast<int32_t>(idx)];
+
+        const uint32_t mag = (h << 13) & 0x0FFFE000;
+        const uint32_t scale = 0x77800000;
+
+        float fmag, fscale;
+        std::memcpy(&fmag, &mag, sizeof(float));
+        std::memcpy(&fscale, &scale, sizeof(float));
+
+        float res = fmag * fscale;
+        if (h & 0x8000)
+        {
+            res = -res;
+        }
+        return res;
+    }
+};
+
+// Apply the kernel on all the RGBA F32 pixels, V::N pixels at once where V is one of the
+// VecSSE2 (refer to SSE2.h), VecAVX2 (refer to AVX2.h), VecAVX512 (refer to AVX512.h) or
+// VecScalar structures. The kernel receives the R, G and B channels (in the order of the
+// V::loadRGBA() lanes) and the alpha is unchanged. The leftover pixels are processed using a
+// padded copy so 'src' & 'dst' do not need to be aligned and could point to the same buffer.
+template<typename V, typename Kernel>
+inline void ApplySIMDKernel(const float * src, float * dst, long numPixels, const Kernel & kernel)
+{
+    constexpr long N = V::N;
+
+    typename V::vec r, g, b, a;
+
+    const long blockPixelCount = numPixels / N * N;
+
+    for (long idx = 0; idx < blockPixelCount; idx += N)
+    {
+        V::loadRGBA(src, r, g, b, a);
+        kernel(r, g, b);
+        V::storeRGBA(dst, r, g, b, a);
+
+        src += 4 * N;
+        dst += 4 * N;
+    }
+
+    // Handle the leftover pixels.
+    const long remainder = numPixels - blockPixelCount;
+    if (remainder > 0)
+    {
+        float in_buf[4 * N] = {};
+        float out_buf[4 * N];
+
+        std::memcpy(in_buf, src, remainder * 4 * sizeof(float));
+
+        V::loadRGBA(in_buf, r, g, b, a);
+        kernel(r, g, b);
+        V::storeRGBA(out_buf, r, g, b, a);
+
+        std::memcpy(dst, out_buf, remainder * 4 * sizeof(float));
+    }
+}
+
+} // namespace OCIO_NAMESPACE
+
+#endif // INCLUDED_OCIO_SIMDUTILS_H
@@ -47,6 +47,7 @@
 
 #include <OpenColorIO/OpenColorIO.h>
 #include "BitDepthUtils.h"
+#include "SSE.h"
 
 // Macros for alignment declarations
 #define SSE2_SIMD_BYTES 16
@@ -400,6 +401,87 @@ struct SSE2RGBAPack<BIT_DEPTH_F32>
     }
 };
 
+// Convert the half floats stored in the low 16 bits of the 32-bit lanes (i.e. the high bits are
+// ignored) to float. Note that the half float infinities & NaNs are not supported.
+inline __m128 sseHalfToFloat(__m128i h)
+{
+    // Move the exponent & mantissa bits to their float positions, then fix the exponent bias by
+    // multiplying with 2^112 (which also normalizes the half float denormals).
+    const __m128i mag  = _mm_and_si128(_mm_slli_epi32(h, 13), _mm_set1_epi32(0x0FFFE000));
+    const __m128i sign = _mm_and_si128(_mm_slli_epi32(h, 16), _mm_set1_epi32(0x80000000));
+
+    const __m128 res = _mm_mul_ps(_mm_castsi128_ps(mag), _mm_castsi128_ps(_mm_set1_epi32(0x77800000)));
+    return _mm_or_ps(res, _mm_castsi128_ps(sign));
+}
+
+// Arithmetic of one SSE2 register holding N float values, used by the templated SIMD
+// kernels (e.g. refer to ops/fixedfunction/ACES2/TransformSIMD.h) to share the same code
+// between the SSE2, AVX2 and AVX-512 versions. The load & store methods (un)pack N RGBA
+// pixels from/to four registers.
+struct VecSSE2
+{
+    typedef __m128 vec;
+    typedef __m128 mask;
+
+    static constexpr int N = 4;
+
+    static inline vec set1(float v) { return _mm_set1_ps(v); }
+    static inline vec load(const float * in) { return _mm_load_ps(in); }
+    static inline void store(float * out, vec v) { _mm_store_ps(out, v); }
+
+    static inline void loadRGBA(const float * in, vec & r, vec & g, vec & b, vec & a)
+    {
+        SSE2RGBAPack<BIT_DEPTH_F32>::Load(in, r, g, b, a);
+    }
+
+    static inline void storeRGBA(float * out, vec r, vec g, vec b, vec a)
+    {
+        SSE2RGBAPack<BIT_DEPTH_F32>::Store(out, r, g, b, a);
+    }
+
+    static inline vec add(vec a, vec b) { return _mm_add_ps(a, b); }
+    static inline vec sub(vec a, vec b) { return _mm_sub_ps(a, b); }
+    static inline vec mul(vec a, vec b) { return _mm_mul_ps(a, b); }
+    static inline vec div(vec a, vec b) { return _mm_div_ps(a, b); }
+    static inline vec min(vec a, vec b) { return _mm_min_ps(a, b); }
+    static inline vec max(vec a, vec b) { return _mm_max_ps(a, b); }
+    static inline vec sqrt(vec a) { return _mm_sqrt_ps(a); }
+
+    static inline vec abs(vec a)
+    {
+        return _mm_andnot_ps(_mm_castsi128_ps(_mm_set1_epi32(0x80000000)), a);
+    }
+
+    // Magnitude of 'a' with the sign of 'b'.
+    static inline vec copysign(vec a, vec b)
+    {
+        const __m128 sign_mask = _mm_castsi128_ps(_mm_set1_epi32(0x80000000));
+        return _mm_or_ps(_mm_andnot_ps(sign_mask, a), _mm_and_ps(sign_mask, b));
+    }
+
+    static inline mask less(vec a, vec b) { return _mm_cmplt_ps(a, b); }
+    static inline mask greater(vec a, vec b) { return _mm_cmpgt_ps(a, b); }
+    static inline vec select(mask m, vec t, vec f) { return sseSelect(m, t, f); }
+
+    // Note that the values must be in the int32 range.
+    static inline vec trunc(vec a) { return _mm_cvtepi32_ps(_mm_cvttps_epi32(a)); }
+
+    // Load the half floats at the 'idx' positions (i.e. integer values) of 'base' as floats.
+    // Refer to sseHalfToFloat() for the limitations.
+    static inline vec gatherHalf(const uint16_t * base, vec idx)
+    {
+        alignas(16) int32_t pos[4];
+        _mm_store_si128(reinterpret_cast<__m128i *>(pos), _mm_cvttps_epi32(idx));
+
+        return sseHalfToFloat(_mm_setr_epi32(base[pos[0]], base[pos[1]], base[pos[2]], base[pos[3]]));
+    }
+
+    static inline vec log2(vec x) { return sseLog2(x); }
+    static inline vec exp2(vec x) { return sseExp2(x); }
+    static inline vec pow(vec x, vec exp) { return ssePower(x, exp); }
+    static inline vec atan2(vec y, vec x) { return sseAtan2(y, x); }
+    static inline void sincos(vec x, vec & sin_x, vec & cos_x) { sseSinCos(x, sin_x, cos_x); }
+};
 
 } // namespace OCIO_NAMESPACE
 
@@ -34,7 +34,9 @@ template<typename InType, typename OutType>
 GenericScanlineHelper<InType, OutType>::GenericScanlineHelper(BitDepth inputBitDepth,
                                                               const ConstOpCPURcPtr & inBitDepthOp,
                                                               BitDepth outputBitDepth,
-                                                              const ConstOpCPURcPtr & outBitDepthOp)
+                                                              const ConstOpCPURcPtr & outBitDepthOp,
+                                                              ScratchBufferPool & bufferPool,
+                                                              long chunkSize)
     :   ScanlineHelper()
     ,   m_inputBitDepth(inputBitDepth)
     ,   m_outputBitDepth(outputBitDepth)
@@ -42,7 +44,14 @@ GenericScanlineHelper<InType, OutType>::GenericScanlineHelper(BitDepth inputBitD
     ,   m_outBitDepthOp(outBitDepthOp)
     ,   m_inOptimizedMode(NO_OPTIMIZATION)
     ,   m_outOptimizedMode(NO_OPTIMIZATION)
+    ,   m_bufferPool(bufferPool)
     ,   m_yIndex(0)
+    ,   m_yEnd(0)
+    ,   m_xBegin(0)
+    ,   m_xEnd(0)
+    ,   m_chunkSize(chunkSize)
+    ,   m_xIndex(0)
+    ,   m_numPixels(0)
     ,   m_useDstBuffer(false)
 {
 }
@@ -60,6 +69,11 @@ void GenericScanlineHelper<InType, OutType>::init(const ImageDesc & srcImg, cons
         throw Exception("Dimension inconsistency between source and destination image buffers.");
     }
 
+    m_yEnd   = m_dstImg.m_height;
+    m_xBegin = 0;
+    m_xEnd   = m_dstImg.m_width;
+    m_xIndex = 0;
+
     m_inOptimizedMode  = GetOptimizationMode(m_srcImg);
     m_outOptimizedMode = GetOptimizationMode(m_dstImg);
 
@@ -67,17 +81,17 @@ void GenericScanlineHelper<InType, OutType>::init(const ImageDesc & srcImg, cons
     m_useDstBuffer
         = (m_outOptimizedMode & PACKED_FLOAT_OPTIMIZATION) == PACKED_FLOAT_OPTIMIZATION;
 
+    const size_t numValues = 4 * (size_t)getMaxNumPixels();
+
     if( (m_inOptimizedMode & PACKED_OPTIMIZATION) != PACKED_OPTIMIZATION)
     {
-        const long bufferSize = 4 * m_dstImg.m_width;
-        m_inBitDepthBuffer.resize(bufferSize);
+        m_inBitDepthBuffer = m_bufferPool.acquire(numValues * sizeof(InType));
     }
 
     if(!m_useDstBuffer)
     {
-        const long bufferSize = 4 * m_dstImg.m_width;
-        m_rgbaFloatBuffer.resize(bufferSize);
-        m_outBitDepthBuffer.resize(bufferSize);
+        m_rgbaFloatBuffer   = m_bufferPool.acquire(numValues * sizeof(float));
+        m_outBitDepthBuffer = m_bufferPool.acquire(numValues * sizeof(OutType));
     }
 }
 
@@ -89,6 +103,11 @@ void GenericScanlineHelper<InType, OutType>::init(const ImageDesc & img)
     m_srcImg.init(img, m_inputBitDepth, m_inBitDepthOp);
     m_dstImg.init(img, m_outputBitDepth, m_outBitDepthOp);
 
+    m_yEnd   = m_dstImg.m_height;
+    m_xBegin = 0;
+    m_xEnd   = m_dstImg.m_width;
+    m_xIndex = 0;
+
     m_inOptimizedMode  = GetOptimizationMode(m_srcImg);
     m_outOptimizedMode = m_inOptimizedMode;
 
@@ -98,15 +117,31 @@ void GenericScanlineHelper<InType, OutType>::init(const ImageDesc & img)
 
     if(!m_useDstBuffer)
     {
-        // TODO: Re-use memory from thread-safe memory pool, rather
-        // than doing a new allocation each time.
+        // Re-use memory from the pool rather than doing new allocations each time.
 
-        const long bufferSize = 4 * m_dstImg.m_width;
+        const size_t numValues = 4 * (size_t)getMaxNumPixels();
+
+        m_rgbaFloatBuffer   = m_bufferPool.acquire(numValues * sizeof(float));
+        m_inBitDepthBuffer  = m_bufferPool.acquire(numValues * sizeof(InType));
+        m_outBitDepthBuffer = m_bufferPool.acquire(numValues * sizeof(OutType));
+    }
+}
 
-        m_rgbaFloatBuffer.resize(bufferSize);
-        m_inBitDepthBuffer.resize(bufferSize);
-        m_outBitDepthBuffer.resize(bufferSize);
+template<typename InType, typename OutType>
+void GenericScanlineHelper<InType, OutType>::setRegion(long xBegin, long xEnd,
+                                                       long yBegin, long yEnd)
+{
+    if (xBegin < 0 || xBegin >= xEnd || xEnd > m_dstImg.m_width
+        || yBegin < 0 || yBegin >= yEnd || yEnd > m_dstImg.m_height)
+    {
+        throw Exception("Invalid image region to process.");
     }
+
+    m_xBegin = xBegin;
+    m_xEnd   = xEnd;
+    m_xIndex = xBegin;
+    m_yIndex = yBegin;
+    m_yEnd   = yEnd;
 }
 
 template<typename InType, typename OutType>
@@ -118,62 +153,86 @@ GenericScanlineHelper<InType, OutType>::~GenericScanlineHelper()
 template<typename InType, typename OutType>
 void GenericScanlineHelper<InType, OutType>::prepRGBAScanline(float** buffer, long & numPixels)
 {
-    // Note that only a line-by-line processing is done on the image buffer.
+    // Note that only a line-by-line (or chunk-by-chunk) processing is done on the image buffer.
 
-    if(m_yIndex >= m_dstImg.m_height)
+    if(m_yIndex >= m_yEnd)
     {
         numPixels = 0;
         return;
     }
 
-    *buffer = m_useDstBuffer ? (float*)(m_dstImg.m_rData + m_dstImg.m_yStrideBytes * m_yIndex)
-                             : &m_rgbaFloatBuffer[0];
+    m_numPixels = m_xEnd - m_xIndex;
+    if (m_chunkSize > 0)
+    {
+        m_numPixels = std::min(m_numPixels, m_chunkSize);
+    }
+
+    *buffer = m_useDstBuffer ? (float*)(m_dstImg.m_rData
+                                        + m_dstImg.m_yStrideBytes * m_yIndex
+                                        + m_dstImg.m_xStrideBytes * m_xIndex)
+                             : m_rgbaFloatBuffer.get<float>();
 
     if((m_inOptimizedMode&PACKED_OPTIMIZATION)==PACKED_OPTIMIZATION)
     {
-        const void * inBuffer = (void*)(m_srcImg.m_rData + m_srcImg.m_yStrideBytes * m_yIndex);
+        const void * inBuffer = (void*)(m_srcImg.m_rData
+                                        + m_srcImg.m_yStrideBytes * m_yIndex
+                                        + m_srcImg.m_xStrideBytes * m_xIndex);
 
-        m_srcImg.m_bitDepthOp->apply(inBuffer, *buffer, m_dstImg.m_width);
+        m_srcImg.m_bitDepthOp->apply(inBuffer, *buffer, m_numPixels);
     }
     else
     {
         // Pack from any channel ordering & bit-depth to a packed RGBA F32 buffer.
 
         Generic<InType>::PackRGBAFromImageDesc(m_srcImg,
-                                               &m_inBitDepthBuffer[0],
+                                               m_inBitDepthBuffer.get<InType>(),
                                                *buffer,
-                                               m_dstImg.m_width,
-                                               m_yIndex * m_dstImg.m_width);
+                                               m_numPixels,
+                                               m_yIndex * m_dstImg.m_width + m_xIndex);
     }
 
-    numPixels = m_dstImg.m_width;
+    numPixels = m_numPixels;
 }
 
 // Write back the result of our work, from the scanline to our destination image.
 template<typename InType, typename OutType>
 void GenericScanlineHelper<InType, OutType>::finishRGBAScanline()
 {
-    // Note that only a line-by-line processing is done on the image buffer.
+    // Note that only a line-by-line (or chunk-by-chunk) processing is done on the image buffer.
 
     if((m_outOptimizedMode&PACKED_OPTIMIZATION)==PACKED_OPTIMIZATION)
     {
-        void * out = (void*)(m_dstImg.m_rData + m_dstImg.m_yStrideBytes * m_yIndex);
+        void * out = (void*)(m_dstImg.m_rData
+                             + m_dstImg.m_yStrideBytes * m_yIndex
+                             + m_dstImg.m_xStrideBytes * m_xIndex);
 
-        const void * in  = m_useDstBuffer ? out : (void*)&m_rgbaFloatBuffer[0];
+        const void * in  = m_useDstBuffer ? out : (void*)m_rgbaFloatBuffer.get<float>();
 
-        m_dstImg.m_bitDepthOp->apply(in, out, m_dstImg.m_width);
+        m_dstImg.m_bitDepthOp->apply(in, out, m_numPixels);
     }
     else
     {
         // Unpack from packed RGBA F32 to any channel ordering & bit-depth.
         Generic<OutType>::UnpackRGBAToImageDesc(m_dstImg,
-                                                &m_rgbaFloatBuffer[0],
-                                                &m_outBitDepthBuffer[0],
-                                                m_dstImg.m_width,
-                                                m_yIndex * m_dstImg.m_width);
+                                                m_rgbaFloatBuffer.get<float>(),
+                                                m_outBitDepthBuffer.get<OutType>(),
+                                                m_numPixels,
+                                                m_yIndex * m_dstImg.m_width + m_xIndex);
     }
 
-    ++m_yIndex;
+    // Move to the next chunk of the line, or to the next line.
+    m_xIndex += m_numPixels;
+    if (m_xIndex >= m_xEnd)
+    {
+        m_xIndex = m_xBegin;
+        ++m_yIndex;
+    }
+}
+
+template<typename InType, typename OutType>
+long GenericScanlineHelper<InType, OutType>::getMaxNumPixels() const
+{
+    return m_chunkSize > 0 ? std::min(m_chunkSize, m_dstImg.m_width) : m_dstImg.m_width;
 }
 
 
@@ -8,6 +8,7 @@
 #include <OpenColorIO/OpenColorIO.h>
 
 #include "ImagePacking.h"
+#include "ScratchBufferPool.h"
 
 namespace OCIO_NAMESPACE
 {
@@ -37,6 +38,12 @@ public:
     virtual void init(const ImageDesc & srcImg, const ImageDesc & dstImg) = 0;
     virtual void init(const ImageDesc & img) = 0;
 
+    // Restrict the processing to the [xBegin, xEnd) x [yBegin, yEnd) region of the image
+    // (i.e. init() selects the complete image). That allows to split the processing of one
+    // image between several scanline helpers.
+    virtual void setRegion(long xBegin, long xEnd, long yBegin, long yEnd) = 0;
+
+    // Note that a scanline could be a chunk of a line when a chunk size is used.
     virtual void prepRGBAScanline(float** buffer, long & numPixels) = 0;
 
     virtual void finishRGBAScanline() = 0;
@@ -50,12 +57,19 @@ public:
     GenericScanlineHelper(const GenericScanlineHelper&) = delete;
     GenericScanlineHelper& operator=(const GenericScanlineHelper&) = delete;
 
+    // The intermediate buffers are acquired from the scratch buffer pool which must then
+    // outlive the scanline helper. A chunk size (in pixels) greater than zero splits the lines
+    // in chunks of at most that size, so that all the ops process a chunk while it is still in
+    // the CPU caches. Otherwise, complete lines are processed.
     GenericScanlineHelper(BitDepth inputBitDepth, const ConstOpCPURcPtr & inBitDepthOp,
-                          BitDepth outputBitDepth, const ConstOpCPURcPtr & outBitDepthOp);
+                          BitDepth outputBitDepth, const ConstOpCPURcPtr & outBitDepthOp,
+                          ScratchBufferPool & bufferPool, long chunkSize = 0);
 
     void init(const ImageDesc & srcImg, const ImageDesc & dstImg) override;
     void init(const ImageDesc & img) override;
 
+    void setRegion(long xBegin, long xEnd, long yBegin, long yEnd) override;
+
     ~GenericScanlineHelper() override;
 
     // Copy from the src image to our scanline, in our preferred
@@ -69,6 +83,9 @@ public:
     void finishRGBAScanline() override;
 
 private:
+    // The size (in pixels) of the intermediate buffers.
+    long getMaxNumPixels() const;
+
     BitDepth m_inputBitDepth;
     BitDepth m_outputBitDepth;
     ConstOpCPURcPtr m_inBitDepthOp;
@@ -80,16 +97,30 @@ private:
     Optimizations m_inOptimizedMode;  // Optimization applicable to the input buffer.
     Optimizations m_outOptimizedMode; // Optimization applicable to the output buffer.
 
+    ScratchBufferPool & m_bufferPool;
+
     // Processing needs an intermediate buffer as CPU Ops only process packed RGBA F32.
-    std::vector<float> m_rgbaFloatBuffer;
+    ScratchBufferPool::Buffer m_rgbaFloatBuffer;
 
     // Processing needs additional buffers of the same pixel type as the input/output
     // in order to convert arbitrary channel order from/to RGBA.
-    std::vector<InType> m_inBitDepthBuffer;
-    std::vector<OutType> m_outBitDepthBuffer;
+    ScratchBufferPool::Buffer m_inBitDepthBuffer;
+    ScratchBufferPool::Buffer m_outBitDepthBuffer;
 
     // The index of the current line to process.
-    int m_yIndex;
+    long m_yIndex;
+    // The index of the last line (excluded) to process.
+    long m_yEnd;
+
+    // The range of pixels to process in each line.
+    long m_xBegin;
+    long m_xEnd;
+
+    // The maximum number of pixels to process at once (i.e. 0 means complete lines).
+    long m_chunkSize;
+    // The index of the first pixel of the current chunk and its number of pixels.
+    long m_xIndex;
+    long m_numPixels;
 
     // If the destination buffer is packed RGBA F32 it could then be used
     // as the internal processing buffer (i.e. instead of m_rgbaFloatBuffer
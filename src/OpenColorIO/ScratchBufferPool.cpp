@@ -0,0 +1,170 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "Platform.h"
+#include "ScratchBufferPool.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+namespace
+{
+
+// The smallest block is 64 bytes, which is also the alignment of all the blocks.
+constexpr size_t MinBucket = 6;
+constexpr size_t Alignment = size_t(1) << MinBucket;
+
+size_t GetBucket(size_t numBytes)
+{
+    size_t bucket = MinBucket;
+    while ((size_t(1) << bucket) < numBytes)
+    {
+        ++bucket;
+    }
+    return bucket;
+}
+
+} // anon.
+
+constexpr size_t ScratchBufferPool::MaxFreeBuffersPerBucket;
+
+
+ScratchBufferPool::Buffer::Buffer(ScratchBufferPool * pool, void * data, size_t bucket) noexcept
+    :   m_pool(pool)
+    ,   m_data(data)
+    ,   m_bucket(bucket)
+{
+}
+
+ScratchBufferPool::Buffer::Buffer(Buffer && other) noexcept
+    :   m_pool(other.m_pool)
+    ,   m_data(other.m_data)
+    ,   m_bucket(other.m_bucket)
+{
+    other.m_pool = nullptr;
+    other.m_data = nullptr;
+}
+
+ScratchBufferPool::Buffer & ScratchBufferPool::Buffer::operator=(Buffer && other) noexcept
+{
+    if (this != &other)
+    {
+        release();
+
+        m_pool   = other.m_pool;
+        m_data   = other.m_data;
+        m_bucket = other.m_bucket;
+
+        other.m_pool = nullptr;
+        other.m_data = nullptr;
+    }
+    return *this;
+}
+
+ScratchBufferPool::Buffer::~Buffer()
+{
+    release();
+}
+
+size_t ScratchBufferPool::Buffer::size() const noexcept
+{
+    return m_data ? (size_t(1) << m_bucket) : 0;
+}
+
+void ScratchBufferPool::Buffer::release() noexcept
+{
+    if (m_data)
+    {
+        m_pool->release(m_data, m_bucket);
+        m_pool = nullptr;
+        m_data = nullptr;
+    }
+}
+
+ScratchBufferPool::~ScratchBufferPool()
+{
+    clear();
+}
+
+ScratchBufferPool::Buffer ScratchBufferPool::acquire(size_t numBytes)
+{
+    const size_t bucket = GetBucket(numBytes);
+
+    {
+        AutoMutex guard(m_mutex);
+
+        if (bucket < m_freeBuffers.size() && !m_freeBuffers[bucket].empty())
+        {
+            void * data = m_freeBuffers[bucket].back();
+            m_freeBuffers[bucket].pop_back();
+
+            ++m_hits;
+            return Buffer(this, data, bucket);
+        }
+    }
+
+    void * data = Platform::AlignedMalloc(size_t(1) << bucket, Alignment);
+    if (!data)
+    {
+        throw Exception("Failed to allocate a scratch buffer.");
+    }
+
+    ++m_misses;
+    return Buffer(this, data, bucket);
+}
+
+void ScratchBufferPool::release(void * data, size_t bucket) noexcept
+{
+    try
+    {
+        AutoMutex guard(m_mutex);
+
+        if (bucket >= m_freeBuffers.size())
+        {
+            m_freeBuffers.resize(bucket + 1);
+        }
+
+        if (m_freeBuffers[bucket].size() < MaxFreeBuffersPerBucket)
+        {
+            m_freeBuffers[bucket].push_back(data);
+            return;
+        }
+    }
+    catch (...)
+    {
+        // Not being able to keep the block is not an error.
+    }
+
+    Platform::AlignedFree(data);
+}
+
+void ScratchBufferPool::clear()
+{
+    AutoMutex guard(m_mutex);
+
+    for (auto & buffers : m_freeBuffers)
+    {
+        for (void * data : buffers)
+        {
+            Platform::AlignedFree(data);
+        }
+    }
+    m_freeBuffers.clear();
+}
+
+size_t ScratchBufferPool::getNumFreeBuffers() const
+{
+    AutoMutex guard(m_mutex);
+
+    size_t numBuffers = 0;
+    for (const auto & buffers : m_freeBuffers)
+    {
+        numBuffers += buffers.size();
+    }
+    return numBuffers;
+}
+
+} // namespace OCIO_NAMESPACE
@@ -0,0 +1,97 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#ifndef INCLUDED_OCIO_SCRATCHBUFFERPOOL_H
+#define INCLUDED_OCIO_SCRATCHBUFFERPOOL_H
+
+
+#include <atomic>
+#include <cstddef>
+#include <vector>
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "Mutex.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+// Thread-safe pool of scratch memory blocks (e.g. the intermediate buffers used by the
+// scanline helpers). Blocks are grouped in buckets of power of two sizes so a released block
+// could be reused by any later request of a similar size, which avoids a memory allocation
+// (and its initialization) for each processed image.
+class ScratchBufferPool
+{
+public:
+
+    // Memory block acquired from a pool. The block returns to the pool when destroyed.
+    class Buffer
+    {
+    public:
+        Buffer() = default;
+        Buffer(const Buffer &) = delete;
+        Buffer & operator=(const Buffer &) = delete;
+
+        Buffer(Buffer && other) noexcept;
+        Buffer & operator=(Buffer && other) noexcept;
+
+        ~Buffer();
+
+        template<typename T>
+        T * get() const noexcept { return static_cast<T *>(m_data); }
+
+        // Size in bytes of the memory block i.e. could be larger than the requested size.
+        size_t size() const noexcept;
+
+    private:
+        friend class ScratchBufferPool;
+
+        Buffer(ScratchBufferPool * pool, void * data, size_t bucket) noexcept;
+
+        void release() noexcept;
+
+        ScratchBufferPool * m_pool = nullptr;
+        void * m_data = nullptr;
+        size_t m_bucket = 0;
+    };
+
+    // Maximum number of free memory blocks kept per bucket.
+    static constexpr size_t MaxFreeBuffersPerBucket = 32;
+
+    ScratchBufferPool() = default;
+    ScratchBufferPool(const ScratchBufferPool &) = delete;
+    ScratchBufferPool & operator=(const ScratchBufferPool &) = delete;
+
+    // Note that all the acquired buffers must be destroyed before the pool.
+    ~ScratchBufferPool();
+
+    // Get a memory block of at least numBytes bytes. Note that the memory is not initialized.
+    Buffer acquire(size_t numBytes);
+
+    // Free all the memory blocks currently kept by the pool.
+    void clear();
+
+    // Number of requests served by a previously released memory block.
+    size_t getHits() const noexcept { return m_hits; }
+    // Number of requests which needed a memory allocation.
+    size_t getMisses() const noexcept { return m_misses; }
+
+    size_t getNumFreeBuffers() const;
+
+private:
+    void release(void * data, size_t bucket) noexcept;
+
+    mutable Mutex m_mutex;
+    // The free memory blocks per bucket, where a bucket index is the log2 of the block size.
+    std::vector<std::vector<void *>> m_freeBuffers;
+
+    std::atomic<size_t> m_hits{ 0 };
+    std::atomic<size_t> m_misses{ 0 };
+};
+
+
+} // namespace OCIO_NAMESPACE
+
+#endif
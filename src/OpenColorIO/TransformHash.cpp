@@ -0,0 +1,446 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#include <sstream>
+#include <typeinfo>
+#include <vector>
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "HashUtils.h"
+#include "TransformHash.h"
+#include "transforms/Lut1DTransform.h"
+#include "transforms/Lut3DTransform.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+namespace
+{
+
+void HashRGBM(std::size_t & seed, const GradingRGBM & rgbm)
+{
+    HashCombine(seed, rgbm.m_red);
+    HashCombine(seed, rgbm.m_green);
+    HashCombine(seed, rgbm.m_blue);
+    HashCombine(seed, rgbm.m_master);
+}
+
+void HashRGBMSW(std::size_t & seed, const GradingRGBMSW & rgbmsw)
+{
+    HashCombine(seed, rgbmsw.m_red);
+    HashCombine(seed, rgbmsw.m_green);
+    HashCombine(seed, rgbmsw.m_blue);
+    HashCombine(seed, rgbmsw.m_master);
+    HashCombine(seed, rgbmsw.m_start);
+    HashCombine(seed, rgbmsw.m_width);
+}
+
+void HashTransform(std::size_t & seed, const AllocationTransform & t)
+{
+    HashCombine(seed, t.getAllocation());
+
+    std::vector<float> vars(t.getNumVars());
+    if (!vars.empty())
+    {
+        t.getVars(vars.data());
+    }
+    HashCombine(seed, vars.data(), vars.size());
+}
+
+void HashTransform(std::size_t & seed, const CDLTransform & t)
+{
+    double sop[9];
+    t.getSOP(sop);
+    HashCombine(seed, sop, 9);
+    HashCombine(seed, t.getSat());
+    HashCombine(seed, t.getStyle());
+}
+
+void HashTransform(std::size_t & seed, const ExposureContrastTransform & t)
+{
+    HashCombine(seed, t.getStyle());
+    HashCombine(seed, t.getExposure());
+    HashCombine(seed, t.isExposureDynamic());
+    HashCombine(seed, t.getContrast());
+    HashCombine(seed, t.isContrastDynamic());
+    HashCombine(seed, t.getGamma());
+    HashCombine(seed, t.isGammaDynamic());
+    HashCombine(seed, t.getPivot());
+    HashCombine(seed, t.getLogExposureStep());
+    HashCombine(seed, t.getLogMidGray());
+}
+
+void HashTransform(std::size_t & seed, const FixedFunctionTransform & t)
+{
+    HashCombine(seed, t.getStyle());
+
+    std::vector<double> params(t.getNumParams());
+    if (!params.empty())
+    {
+        t.getParams(params.data());
+    }
+    HashCombine(seed, params.data(), params.size());
+}
+
+void HashTransform(std::size_t & seed, const GradingPrimaryTransform & t)
+{
+    HashCombine(seed, t.getStyle());
+    HashCombine(seed, t.isDynamic());
+
+    const GradingPrimary & value = t.getValue();
+    HashRGBM(seed, value.m_brightness);
+    HashRGBM(seed, value.m_contrast);
+    HashRGBM(seed, value.m_gamma);
+    HashRGBM(seed, value.m_offset);
+    HashRGBM(seed, value.m_exposure);
+    HashRGBM(seed, value.m_lift);
+    HashRGBM(seed, value.m_gain);
+    HashCombine(seed, value.m_saturation);
+    HashCombine(seed, value.m_pivot);
+    HashCombine(seed, value.m_pivotBlack);
+    HashCombine(seed, value.m_pivotWhite);
+    HashCombine(seed, value.m_clampBlack);
+    HashCombine(seed, value.m_clampWhite);
+}
+
+void HashTransform(std::size_t & seed, const GradingRGBCurveTransform & t)
+{
+    HashCombine(seed, t.getStyle());
+    HashCombine(seed, t.isDynamic());
+    HashCombine(seed, t.getBypassLinToLog());
+
+    const ConstGradingRGBCurveRcPtr value = t.getValue();
+    for (int c = 0; c < RGB_NUM_CURVES; ++c)
+    {
+        const ConstGradingBSplineCurveRcPtr curve = value->getCurve(static_cast<RGBCurveType>(c));
+
+        const size_t numPoints = curve->getNumControlPoints();
+        HashCombine(seed, numPoints);
+        for (size_t idx = 0; idx < numPoints; ++idx)
+        {
+            const GradingControlPoint & point = curve->getControlPoint(idx);
+            HashCombine(seed, point.m_x);
+            HashCombine(seed, point.m_y);
+            HashCombine(seed, curve->getSlope(idx));
+        }
+    }
+}
+
+void HashTransform(std::size_t & seed, const GradingToneTransform & t)
+{
+    HashCombine(seed, t.getStyle());
+    HashCombine(seed, t.isDynamic());
+
+    const GradingTone & value = t.getValue();
+    HashRGBMSW(seed, value.m_blacks);
+    HashRGBMSW(seed, value.m_shadows);
+    HashRGBMSW(seed, value.m_midtones);
+    HashRGBMSW(seed, value.m_highlights);
+    HashRGBMSW(seed, value.m_whites);
+    HashCombine(seed, value.m_scontrast);
+}
+
+void HashTransform(std::size_t & seed, const LogAffineTransform & t)
+{
+    double values[3];
+
+    HashCombine(seed, t.getBase());
+    t.getLogSideSlopeValue(values);
+    HashCombine(seed, values, 3);
+    t.getLogSideOffsetValue(values);
+    HashCombine(seed, values, 3);
+    t.getLinSideSlopeValue(values);
+    HashCombine(seed, values, 3);
+    t.getLinSideOffsetValue(values);
+    HashCombine(seed, values, 3);
+}
+
+void HashTransform(std::size_t & seed, const LogCameraTransform & t)
+{
+    double values[3];
+
+    HashCombine(seed, t.getBase());
+    t.getLogSideSlopeValue(values);
+    HashCombine(seed, values, 3);
+    t.getLogSideOffsetValue(values);
+    HashCombine(seed, values, 3);
+    t.getLinSideSlopeValue(values);
+    HashCombine(seed, values, 3);
+    t.getLinSideOffsetValue(values);
+    HashCombine(seed, values, 3);
+    t.getLinSideBreakValue(values);
+    HashCombine(seed, values, 3);
+
+    const bool hasLinearSlope = t.getLinearSlopeValue(values);
+    HashCombine(seed, hasLinearSlope);
+    if (hasLinearSlope)
+    {
+        HashCombine(seed, values, 3);
+    }
+}
+
+void HashTransform(std::size_t & seed, const Lut1DTransform & t)
+{
+    HashCombine(seed, t.getLength());
+    HashCombine(seed, t.getInputHalfDomain());
+    HashCombine(seed, t.getOutputRawHalfs());
+    HashCombine(seed, t.getHueAdjust());
+    HashCombine(seed, t.getInterpolation());
+    HashCombine(seed, t.getFileOutputBitDepth());
+    HashCombine(seed, dynamic_cast<const Lut1DTransformImpl &>(t).getValuesHash());
+}
+
+void HashTransform(std::size_t & seed, const Lut3DTransform & t)
+{
+    HashCombine(seed, t.getGridSize());
+    HashCombine(seed, t.getInterpolation());
+    HashCombine(seed, t.getFileOutputBitDepth());
+    HashCombine(seed, dynamic_cast<const Lut3DTransformImpl &>(t).getValuesHash());
+}
+
+void HashTransform(std::size_t & seed, const MatrixTransform & t)
+{
+    double matrix[16];
+    t.getMatrix(matrix);
+    HashCombine(seed, matrix, 16);
+
+    double offset[4];
+    t.getOffset(offset);
+    HashCombine(seed, offset, 4);
+
+    HashCombine(seed, t.getFileInputBitDepth());
+    HashCombine(seed, t.getFileOutputBitDepth());
+}
+
+void HashTransform(std::size_t & seed, const RangeTransform & t)
+{
+    HashCombine(seed, t.getStyle());
+    HashCombine(seed, t.getFileInputBitDepth());
+    HashCombine(seed, t.getFileOutputBitDepth());
+
+    HashCombine(seed, t.hasMinInValue());
+    HashCombine(seed, t.hasMinInValue() ? t.getMinInValue() : 0.);
+    HashCombine(seed, t.hasMaxInValue());
+    HashCombine(seed, t.hasMaxInValue() ? t.getMaxInValue() : 0.);
+    HashCombine(seed, t.hasMinOutValue());
+    HashCombine(seed, t.hasMinOutValue() ? t.getMinOutValue() : 0.);
+    HashCombine(seed, t.hasMaxOutValue());
+    HashCombine(seed, t.hasMaxOutValue() ? t.getMaxOutValue() : 0.);
+}
+
+template<typename T>
+const FormatMetadata * GetMetadata(const Transform & transform)
+{
+    return &dynamic_cast<const T &>(transform).getFormatMetadata();
+}
+
+// Return the format metadata of the transform, or a null pointer if the transform type has none.
+const FormatMetadata * GetFormatMetadata(const Transform & transform)
+{
+    switch (transform.getTransformType())
+    {
+        case TRANSFORM_TYPE_CDL:                return GetMetadata<CDLTransform>(transform);
+        case TRANSFORM_TYPE_EXPONENT:           return GetMetadata<ExponentTransform>(transform);
+        case TRANSFORM_TYPE_EXPONENT_WITH_LINEAR:
+            return GetMetadata<ExponentWithLinearTransform>(transform);
+        case TRANSFORM_TYPE_EXPOSURE_CONTRAST:
+            return GetMetadata<ExposureContrastTransform>(transform);
+        case TRANSFORM_TYPE_FIXED_FUNCTION:     return GetMetadata<FixedFunctionTransform>(transform);
+        case TRANSFORM_TYPE_GRADING_PRIMARY:    return GetMetadata<GradingPrimaryTransform>(transform);
+        case TRANSFORM_TYPE_GRADING_RGB_CURVE:  return GetMetadata<GradingRGBCurveTransform>(transform);
+        case TRANSFORM_TYPE_GRADING_TONE:       return GetMetadata<GradingToneTransform>(transform);
+        case TRANSFORM_TYPE_GROUP:              return GetMetadata<GroupTransform>(transform);
+        case TRANSFORM_TYPE_LOG_AFFINE:         return GetMetadata<LogAffineTransform>(transform);
+        case TRANSFORM_TYPE_LOG_CAMERA:         return GetMetadata<LogCameraTransform>(transform);
+        case TRANSFORM_TYPE_LOG:                return GetMetadata<LogTransform>(transform);
+        case TRANSFORM_TYPE_LUT1D:              return GetMetadata<Lut1DTransform>(transform);
+        case TRANSFORM_TYPE_LUT3D:              return GetMetadata<Lut3DTransform>(transform);
+        case TRANSFORM_TYPE_MATRIX:             return GetMetadata<MatrixTransform>(transform);
+        case TRANSFORM_TYPE_RANGE:              return GetMetadata<RangeTransform>(transform);
+        case TRANSFORM_TYPE_ALLOCATION:
+        case TRANSFORM_TYPE_BUILTIN:
+        case TRANSFORM_TYPE_COLORSPACE:
+        case TRANSFORM_TYPE_DISPLAY_VIEW:
+        case TRANSFORM_TYPE_FILE:
+        case TRANSFORM_TYPE_LOOK:
+            break;
+    }
+    return nullptr;
+}
+
+} // anon.
+
+std::size_t GetTransformHash(const Transform & transform, bool includeNames)
+{
+    std::size_t seed = 0;
+
+    const TransformType type = transform.getTransformType();
+    HashCombine(seed, type);
+    HashCombine(seed, transform.getDirection());
+
+    if (includeNames)
+    {
+        const FormatMetadata * metadata = GetFormatMetadata(transform);
+        HashCombine(seed, metadata ? metadata->getName() : "");
+    }
+
+    switch (type)
+    {
+        case TRANSFORM_TYPE_ALLOCATION:
+        {
+            HashTransform(seed, dynamic_cast<const AllocationTransform &>(transform));
+            break;
+        }
+        case TRANSFORM_TYPE_BUILTIN:
+        {
+            HashCombine(seed, dynamic_cast<const BuiltinTransform &>(transform).getStyle());
+            break;
+        }
+        case TRANSFORM_TYPE_CDL:
+        {
+            HashTransform(seed, dynamic_cast<const CDLTransform &>(transform));
+            break;
+        }
+        case TRANSFORM_TYPE_COLORSPACE:
+        {
+            const auto & t = dynamic_cast<const ColorSpaceTransform &>(transform);
+            HashCombine(seed, t.getSrc());
+            HashCombine(seed, t.getDst());
+            HashCombine(seed, t.getDataBypass());
+            break;
+        }
+        case TRANSFORM_TYPE_DISPLAY_VIEW:
+        {
+            const auto & t = dynamic_cast<const DisplayViewTransform &>(transform);
+            HashCombine(seed, t.getSrc());
+            HashCombine(seed, t.getDisplay());
+            HashCombine(seed, t.getView());
+            HashCombine(seed, t.getLooksBypass());
+            HashCombine(seed, t.getDataBypass());
+            break;
+        }
+        case TRANSFORM_TYPE_EXPONENT:
+        {
+            const auto & t = dynamic_cast<const ExponentTransform &>(transform);
+            double values[4];
+            t.getValue(values);
+            HashCombine(seed, values, 4);
+            HashCombine(seed, t.getNegativeStyle());
+            break;
+        }
+        case TRANSFORM_TYPE_EXPONENT_WITH_LINEAR:
+        {
+            const auto & t = dynamic_cast<const ExponentWithLinearTransform &>(transform);
+            double values[4];
+            t.getGamma(values);
+            HashCombine(seed, values, 4);
+            t.getOffset(values);
+            HashCombine(seed, values, 4);
+            HashCombine(seed, t.getNegativeStyle());
+            break;
+        }
+        case TRANSFORM_TYPE_EXPOSURE_CONTRAST:
+        {
+            HashTransform(seed, dynamic_cast<const ExposureContrastTransform &>(transform));
+            break;
+        }
+        case TRANSFORM_TYPE_FILE:
+        {
+            const auto & t = dynamic_cast<const FileTransform &>(transform);
+            HashCombine(seed, t.getSrc());
+            HashCombine(seed, t.getCCCId());
+            HashCombine(seed, t.getCDLStyle());
+            HashCombine(seed, t.getInterpolation());
+            break;
+        }
+        case TRANSFORM_TYPE_FIXED_FUNCTION:
+        {
+            HashTransform(seed, dynamic_cast<const FixedFunctionTransform &>(transform));
+            break;
+        }
+        case TRANSFORM_TYPE_GRADING_PRIMARY:
+        {
+            HashTransform(seed, dynamic_cast<const GradingPrimaryTransform &>(transform));
+            break;
+        }
+        case TRANSFORM_TYPE_GRADING_RGB_CURVE:
+        {
+            HashTransform(seed, dynamic_cast<const GradingRGBCurveTransform &>(transform));
+            break;
+        }
+        case TRANSFORM_TYPE_GRADING_TONE:
+        {
+            HashTransform(seed, dynamic_cast<const GradingToneTransform &>(transform));
+            break;
+        }
+        case TRANSFORM_TYPE_GROUP:
+        {
+            const auto & t = dynamic_cast<const GroupTransform &>(transform);
+            const int numTransforms = t.getNumTransforms();
+            HashCombine(seed, numTransforms);
+            for (int idx = 0; idx < numTransforms; ++idx)
+            {
+                ConstTransformRcPtr child = t.getTransform(idx);
+                HashCombine(seed, child ? GetTransformHash(*child, includeNames) : 0);
+            }
+            break;
+        }
+        case TRANSFORM_TYPE_LOG_AFFINE:
+        {
+            HashTransform(seed, dynamic_cast<const LogAffineTransform &>(transform));
+            break;
+        }
+        case TRANSFORM_TYPE_LOG_CAMERA:
+        {
+            HashTransform(seed, dynamic_cast<const LogCameraTransform &>(transform));
+            break;
+        }
+        case TRANSFORM_TYPE_LOG:
+        {
+            HashCombine(seed, dynamic_cast<const LogTransform &>(transform).getBase());
+            break;
+        }
+        case TRANSFORM_TYPE_LOOK:
+        {
+            const auto & t = dynamic_cast<const LookTransform &>(transform);
+            HashCombine(seed, t.getSrc());
+            HashCombine(seed, t.getDst());
+            HashCombine(seed, t.getLooks());
+            HashCombine(seed, t.getSkipColorSpaceConversion());
+            break;
+        }
+        case TRANSFORM_TYPE_LUT1D:
+        {
+            HashTransform(seed, dynamic_cast<const Lut1DTransform &>(transform));
+            break;
+        }
+        case TRANSFORM_TYPE_LUT3D:
+        {
+            HashTransform(seed, dynamic_cast<const Lut3DTransform &>(transform));
+            break;
+        }
+        case TRANSFORM_TYPE_MATRIX:
+        {
+            HashTransform(seed, dynamic_cast<const MatrixTransform &>(transform));
+            break;
+        }
+        case TRANSFORM_TYPE_RANGE:
+        {
+            HashTransform(seed, dynamic_cast<const RangeTransform &>(transform));
+            break;
+        }
+        default:
+        {
+            std::ostringstream error;
+            error << "Unknown transform type for hashing: " << typeid(transform).name();
+
+            throw Exception(error.str().c_str());
+        }
+    }
+
+    return seed;
+}
+
+} // namespace OCIO_NAMESPACE
@@ -0,0 +1,23 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#ifndef INCLUDED_OCIO_TRANSFORMHASH_H
+#define INCLUDED_OCIO_TRANSFORMHASH_H
+
+#include <OpenColorIO/OpenColorIO.h>
+
+
+namespace OCIO_NAMESPACE
+{
+
+// Compute a hash value of the transform content without serializing it (e.g. for the processor
+// cache of the Config class). Only the members changing the color processing are hashed (i.e. the
+// format metadata are ignored) and the values of the LUT transforms are only hashed again after
+// a change. The names of the transforms (i.e. the only format metadata saved in a config) could
+// also be hashed, so the hash changes with the config serialization of the transform (e.g. for
+// the cache ID of the config elements).
+std::size_t GetTransformHash(const Transform & transform, bool includeNames = false);
+
+} // namespace OCIO_NAMESPACE
+
+#endif
@@ -5,57 +5,11 @@
 
 #include <OpenColorIO/OpenColorIO.h>
 
-#include "TokensManager.h"
+#include "ViewTransform.h"
 
 namespace OCIO_NAMESPACE
 {
 
-class ViewTransform::Impl
-{
-public:
-    std::string m_name;
-    std::string m_family;
-    std::string m_description;
-    ReferenceSpaceType m_referenceSpaceType{ REFERENCE_SPACE_SCENE };
-
-    TransformRcPtr m_toRefTransform;
-    TransformRcPtr m_fromRefTransform;
-
-    TokensManager m_categories;
-
-    Impl() = delete;
-    explicit Impl(ReferenceSpaceType referenceSpace)
-        : m_referenceSpaceType(referenceSpace)
-    {
-    }
-
-    Impl(const Impl &) = delete;
-    ~Impl() = default;
-
-    Impl & operator= (const Impl & rhs)
-    {
-        if (this != &rhs)
-        {
-            m_name        = rhs.m_name;
-            m_family      = rhs.m_family;
-            m_description = rhs.m_description;
-
-            m_referenceSpaceType = rhs.m_referenceSpaceType;
-
-            m_toRefTransform = rhs.m_toRefTransform ? rhs.m_toRefTransform->createEditableCopy() :
-                                                      rhs.m_toRefTransform;
-
-            m_fromRefTransform = rhs.m_fromRefTransform ?
-                                 rhs.m_fromRefTransform->createEditableCopy() :
-                                 rhs.m_fromRefTransform;
-
-            m_categories = rhs.m_categories;
-        }
-        return *this;
-    }
-};
-
-
 ViewTransformRcPtr ViewTransform::Create(ReferenceSpaceType referenceSpace)
 {
     return ViewTransformRcPtr(new ViewTransform(referenceSpace), &deleter);
@@ -92,6 +46,7 @@ const char * ViewTransform::getName() const noexcept
 void ViewTransform::setName(const char * name) noexcept
 {
     getImpl()->m_name = name;
+    getImpl()->m_version.changed();
 }
 
 const char * ViewTransform::getFamily() const noexcept
@@ -102,6 +57,7 @@ const char * ViewTransform::getFamily() const noexcept
 void ViewTransform::setFamily(const char * family)
 {
     getImpl()->m_family = family;
+    getImpl()->m_version.changed();
 }
 
 const char * ViewTransform::getDescription() const noexcept
@@ -112,6 +68,7 @@ const char * ViewTransform::getDescription() const noexcept
 void ViewTransform::setDescription(const char * description)
 {
     getImpl()->m_description = description;
+    getImpl()->m_version.changed();
 }
 
 bool ViewTransform::hasCategory(const char * category) const
@@ -122,10 +79,12 @@ bool ViewTransform::hasCategory(const char * category) const
 void ViewTransform::addCategory(const char * category)
 {
     getImpl()->m_categories.addToken(category);
+    getImpl()->m_version.changed();
 }
 void ViewTransform::removeCategory(const char * category)
 {
     getImpl()->m_categories.removeToken(category);
+    getImpl()->m_version.changed();
 }
 
 int ViewTransform::getNumCategories() const
@@ -141,6 +100,7 @@ const char * ViewTransform::getCategory(int index) const
 void ViewTransform::clearCategories()
 {
     getImpl()->m_categories.clearTokens();
+    getImpl()->m_version.changed();
 }
 
 
@@ -178,6 +138,7 @@ void ViewTransform::setTransform(const ConstTransformRcPtr & transform, ViewTran
         getImpl()->m_fromRefTransform = transformCopy; 
         break;
     }
+    getImpl()->m_version.changed();
 }
 
 
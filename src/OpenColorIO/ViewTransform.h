@@ -0,0 +1,71 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#ifndef INCLUDED_OCIO_VIEWTRANSFORM_H
+#define INCLUDED_OCIO_VIEWTRANSFORM_H
+
+#include <string>
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "ElementVersion.h"
+#include "TokensManager.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+class ViewTransform::Impl
+{
+public:
+    std::string m_name;
+    std::string m_family;
+    std::string m_description;
+    ReferenceSpaceType m_referenceSpaceType{ REFERENCE_SPACE_SCENE };
+
+    TransformRcPtr m_toRefTransform;
+    TransformRcPtr m_fromRefTransform;
+
+    TokensManager m_categories;
+
+    // Changed by all the setters (refer to ElementVersion).
+    ElementVersion m_version;
+
+    Impl() = delete;
+    explicit Impl(ReferenceSpaceType referenceSpace)
+        : m_referenceSpaceType(referenceSpace)
+    {
+    }
+
+    Impl(const Impl &) = delete;
+    ~Impl() = default;
+
+    Impl & operator= (const Impl & rhs)
+    {
+        if (this != &rhs)
+        {
+            m_name        = rhs.m_name;
+            m_family      = rhs.m_family;
+            m_description = rhs.m_description;
+
+            m_referenceSpaceType = rhs.m_referenceSpaceType;
+
+            m_toRefTransform = rhs.m_toRefTransform ? rhs.m_toRefTransform->createEditableCopy() :
+                                                      rhs.m_toRefTransform;
+
+            m_fromRefTransform = rhs.m_fromRefTransform ?
+                                 rhs.m_fromRefTransform->createEditableCopy() :
+                                 rhs.m_fromRefTransform;
+
+            m_categories = rhs.m_categories;
+
+            m_version = rhs.m_version;
+        }
+        return *this;
+    }
+};
+
+} // namespace OCIO_NAMESPACE
+
+#endif // INCLUDED_OCIO_VIEWTRANSFORM_H
@@ -160,6 +160,8 @@ ViewingRules::Impl & ViewingRules::Impl::operator=(const ViewingRules::Impl & rh
         {
             m_rules.push_back(rule->clone());
         }
+
+        m_version = rhs.m_version;
     }
 
     return *this;
@@ -273,12 +275,14 @@ void ViewingRules::addColorSpace(size_t ruleIndex, const char * colorSpace)
         throw Exception(oss.str().c_str());
     }
     m_impl->m_rules[ruleIndex]->m_colorSpaces.addToken(colorSpace);
+    m_impl->m_version.changed();
 }
 
 void ViewingRules::removeColorSpace(size_t ruleIndex, size_t colorSpaceIndex)
 {
     const char * cs = getColorSpace(ruleIndex, colorSpaceIndex);
     m_impl->m_rules[ruleIndex]->m_colorSpaces.removeToken(cs);
+    m_impl->m_version.changed();
 }
 
 size_t ViewingRules::getNumEncodings(size_t ruleIndex) const
@@ -321,12 +325,14 @@ void ViewingRules::addEncoding(size_t ruleIndex, const char * encoding)
         throw Exception(oss.str().c_str());
     }
     m_impl->m_rules[ruleIndex]->m_encodings.addToken(encoding);
+    m_impl->m_version.changed();
 }
 
 void ViewingRules::removeEncoding(size_t ruleIndex, size_t encodingIndex)
 {
     const char * encoding = getEncoding(ruleIndex, encodingIndex);
     m_impl->m_rules[ruleIndex]->m_encodings.removeToken(encoding);
+    m_impl->m_version.changed();
 }
 
 size_t ViewingRules::getNumCustomKeys(size_t ruleIndex) const
@@ -381,6 +387,7 @@ void ViewingRules::setCustomKey(size_t ruleIndex, const char * key, const char *
             << "' error: " << e.what();
         throw Exception(oss.str().c_str());
     }
+    m_impl->m_version.changed();
 }
 
 void ViewingRules::insertRule(size_t ruleIndex, const char * name)
@@ -399,12 +406,14 @@ void ViewingRules::insertRule(size_t ruleIndex, const char * name)
         m_impl->validatePosition(ruleIndex);
         m_impl->m_rules.insert(m_impl->m_rules.begin() + ruleIndex, newRule);
     }
+    m_impl->m_version.changed();
 }
 
 void ViewingRules::removeRule(size_t ruleIndex)
 {
     m_impl->validatePosition(ruleIndex);
     m_impl->m_rules.erase(m_impl->m_rules.begin() + ruleIndex);
+    m_impl->m_version.changed();
 }
 
 std::ostream & operator<< (std::ostream & os, const ViewingRules & vr)
@@ -11,6 +11,8 @@
 
 #include <OpenColorIO/OpenColorIO.h>
 
+#include "ElementVersion.h"
+
 
 namespace OCIO_NAMESPACE
 {
@@ -43,6 +45,9 @@ public:
     void validate(std::function<ConstColorSpaceRcPtr(const char *)> colorSpaceAccessor,
                      const ColorSpaceSetRcPtr & colorspaces) const;
 
+    // Changed by all the setters (refer to ElementVersion).
+    ElementVersion m_version;
+
 private:
 
     friend class ViewingRules;
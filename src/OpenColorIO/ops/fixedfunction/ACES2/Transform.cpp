@@ -3,6 +3,8 @@
 
 #include "Transform.h"
 
+#include "Caching.h"
+
 #include <array>
 #include <algorithm>
 #include <cmath>
@@ -1395,6 +1397,99 @@ GamutCompressParams init_GamutCompressParams(float peakLuminance, const JMhParam
     return params;
 }
 
+namespace
+{
+
+// The parameters are memoized per peak luminance and limiting primaries.
+
+template<typename T>
+struct ParamsEntry
+{
+    Mutex mutex;
+    std::shared_ptr<const T> params;
+};
+
+typedef std::shared_ptr<ParamsEntry<ToneScaleCompressParams>> ToneScaleCompressEntryPtr;
+typedef std::shared_ptr<ParamsEntry<OutputTransformParams>> OutputTransformEntryPtr;
+
+// i.e. peak luminance, then the xy chromaticities of the red, green, blue and white primaries.
+typedef std::array<float, 9> OutputTransformKey;
+
+class ToneScaleCompressCache : public GenericCache<float, ToneScaleCompressEntryPtr>
+{
+};
+
+class OutputTransformCache : public GenericCache<OutputTransformKey, OutputTransformEntryPtr>
+{
+};
+
+ToneScaleCompressCache g_toneScaleCompressCache;
+OutputTransformCache g_outputTransformCache;
+
+void InitToneScaleCompressParams(ToneScaleCompressParams & params, float peakLuminance)
+{
+    const JMhParams reachGamut = init_JMhParams(ACES_AP1::primaries);
+
+    params.inputJMhParams = init_JMhParams(ACES_AP0::primaries);
+    params.tsParams       = init_ToneScaleParams(peakLuminance);
+    params.shParams       = init_SharedCompressionParams(peakLuminance, params.inputJMhParams, reachGamut);
+    params.ccParams       = init_ChromaCompressParams(peakLuminance, params.tsParams);
+}
+
+} // anon.
+
+ConstToneScaleCompressParamsRcPtr GetToneScaleCompressParams(float peakLuminance)
+{
+    ToneScaleCompressEntryPtr entry = g_toneScaleCompressCache.getSharedEntry(peakLuminance);
+
+    AutoMutex lock(entry->mutex);
+    if (!entry->params)
+    {
+        auto params = std::make_shared<ToneScaleCompressParams>();
+        InitToneScaleCompressParams(*params, peakLuminance);
+        entry->params = params;
+    }
+
+    return entry->params;
+}
+
+ConstOutputTransformParamsRcPtr GetOutputTransformParams(float peakLuminance, const Primaries &limitingPrimaries)
+{
+    const OutputTransformKey key = {
+        peakLuminance,
+        (float) limitingPrimaries.m_red.m_xy[0], (float) limitingPrimaries.m_red.m_xy[1],
+        (float) limitingPrimaries.m_grn.m_xy[0], (float) limitingPrimaries.m_grn.m_xy[1],
+        (float) limitingPrimaries.m_blu.m_xy[0], (float) limitingPrimaries.m_blu.m_xy[1],
+        (float) limitingPrimaries.m_wht.m_xy[0], (float) limitingPrimaries.m_wht.m_xy[1]
+    };
+
+    OutputTransformEntryPtr entry = g_outputTransformCache.getSharedEntry(key);
+
+    AutoMutex lock(entry->mutex);
+    if (!entry->params)
+    {
+        auto params = std::make_shared<OutputTransformParams>();
+
+        // Reuse the tonescale and chroma compression parameters of the same peak luminance.
+        static_cast<ToneScaleCompressParams &>(*params) = *GetToneScaleCompressParams(peakLuminance);
+
+        const JMhParams reachGamut = init_JMhParams(ACES_AP1::primaries);
+
+        params->limitJMhParams = init_JMhParams(limitingPrimaries);
+        params->gcParams       = init_GamutCompressParams(peakLuminance, params->inputJMhParams, params->limitJMhParams,
+                                                          params->tsParams, params->shParams, reachGamut);
+        entry->params = params;
+    }
+
+    return entry->params;
+}
+
+void ClearParamsCaches()
+{
+    g_toneScaleCompressCache.clear();
+    g_outputTransformCache.clear();
+}
+
 } // namespace ACES2
 
 } // OCIO namespace
@@ -4,6 +4,8 @@
 #ifndef INCLUDED_OCIO_ACES2_TRANSFORM_H
 #define INCLUDED_OCIO_ACES2_TRANSFORM_H
 
+#include <memory>
+
 #include "Common.h"
 
 namespace OCIO_NAMESPACE
@@ -40,6 +42,32 @@ f3 chroma_compress_inv(const f3 &JMh, const float J, const float Mnorm, const Re
 f3 gamut_compress_fwd(const f3 &JMh, const ResolvedSharedCompressionParameters &ps, const GamutCompressParams &p);
 f3 gamut_compress_inv(const f3 &JMh, const ResolvedSharedCompressionParameters &ps, const GamutCompressParams &p);
 
+// Parameters of the tonescale and chroma compression, which only depend on the peak luminance.
+struct ToneScaleCompressParams
+{
+    JMhParams inputJMhParams; // i.e. AP0
+    ToneScaleParams tsParams;
+    SharedCompressionParameters shParams;
+    ChromaCompressParams ccParams;
+};
+
+// Parameters of the complete output transform, which also depend on the limiting primaries.
+struct OutputTransformParams : public ToneScaleCompressParams
+{
+    JMhParams limitJMhParams;
+    GamutCompressParams gcParams;
+};
+
+typedef std::shared_ptr<const ToneScaleCompressParams> ConstToneScaleCompressParamsRcPtr;
+typedef std::shared_ptr<const OutputTransformParams> ConstOutputTransformParamsRcPtr;
+
+// Building the parameters is expensive (i.e. the reach, hue and gamut cusp tables) so the
+// immutable instances are memoized and shared by the CPU renderers and the GPU shader builders.
+ConstToneScaleCompressParamsRcPtr GetToneScaleCompressParams(float peakLuminance);
+ConstOutputTransformParamsRcPtr GetOutputTransformParams(float peakLuminance, const Primaries &limitingPrimaries);
+
+void ClearParamsCaches();
+
 
 } // namespace ACES2
 
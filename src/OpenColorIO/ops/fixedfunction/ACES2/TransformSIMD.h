@@ -0,0 +1,497 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#ifndef INCLUDED_OCIO_ACES2_TRANSFORMSIMD_H
+#define INCLUDED_OCIO_ACES2_TRANSFORMSIMD_H
+
+#include "SIMDUtils.h"
+#include "Transform.h"
+
+namespace OCIO_NAMESPACE
+{
+
+namespace ACES2
+{
+
+// Vectorized versions of the ACES 2 renderer steps, shared by the SSE2, AVX2 and AVX-512
+// renderers (refer to FixedFunctionOpCPU_SSE2.cpp, FixedFunctionOpCPU_AVX2.cpp and
+// FixedFunctionOpCPU_AVX512.cpp). The 'V' template parameter provides the arithmetic for one
+// SIMD register type holding V::N pixels.
+//
+// The CAM conversions, the tonescale and the chroma compression normalization are computed
+// on V::N pixels at once using the fast log2/exp2/atan2/sincos approximations (i.e. about
+// 14 bits of mantissa) while the chroma and gamut compressions, which need per-hue table
+// lookups and branches, still call the scalar functions for each pixel.
+//
+// The results differ from the scalar renderers by less than 1e-3 for the forward output
+// transform and 2e-3 for the inverse (i.e. absolute error below one and relative error above),
+// refer to the aces_20_simd test in FixedFunctionOpCPU_tests.cpp which checks random pixels for
+// each instruction set. That's why these versions are only used when the opt-in
+// OPTIMIZATION_FAST_ACES2 flag is set.
+
+namespace SIMD
+{
+
+template<typename V>
+struct Matrix33
+{
+    typedef typename V::vec vec;
+
+    explicit Matrix33(const m33f & m)
+    {
+        for (unsigned int idx = 0; idx < 9; ++idx)
+        {
+            m_values[idx] = V::set1(m[idx]);
+        }
+    }
+
+    // Same convention as mult_f3_f33().
+    inline void apply(vec in0, vec in1, vec in2, vec & out0, vec & out1, vec & out2) const
+    {
+        out0 = V::add(V::add(V::mul(in0, m_values[0]), V::mul(in1, m_values[1])), V::mul(in2, m_values[2]));
+        out1 = V::add(V::add(V::mul(in0, m_values[3]), V::mul(in1, m_values[4])), V::mul(in2, m_values[5]));
+        out2 = V::add(V::add(V::mul(in0, m_values[6]), V::mul(in1, m_values[7])), V::mul(in2, m_values[8]));
+    }
+
+    vec m_values[9];
+};
+
+template<typename V>
+struct JMhParamsSIMD
+{
+    typedef typename V::vec vec;
+
+    explicit JMhParamsSIMD(const JMhParams & p)
+        :   MATRIX_RGB_to_CAM16_c(p.MATRIX_RGB_to_CAM16_c)
+        ,   MATRIX_CAM16_c_to_RGB(p.MATRIX_CAM16_c_to_RGB)
+        ,   MATRIX_cone_response_to_Aab(p.MATRIX_cone_response_to_Aab)
+        ,   MATRIX_Aab_to_cone_response(p.MATRIX_Aab_to_cone_response)
+        ,   F_L_n(V::set1(p.F_L_n))
+        ,   cz(V::set1(p.cz))
+        ,   inv_cz(V::set1(p.inv_cz))
+        ,   A_w_J(V::set1(p.A_w_J))
+        ,   inv_A_w_J(V::set1(p.inv_A_w_J))
+    {
+    }
+
+    Matrix33<V> MATRIX_RGB_to_CAM16_c;
+    Matrix33<V> MATRIX_CAM16_c_to_RGB;
+    Matrix33<V> MATRIX_cone_response_to_Aab;
+    Matrix33<V> MATRIX_Aab_to_cone_response;
+    vec F_L_n;
+    vec cz;
+    vec inv_cz;
+    vec A_w_J;
+    vec inv_A_w_J;
+};
+
+template<typename V>
+struct ToneScaleParamsSIMD
+{
+    typedef typename V::vec vec;
+
+    explicit ToneScaleParamsSIMD(const ToneScaleParams & t)
+        :   n_r(V::set1(t.n_r))
+        ,   g(V::set1(t.g))
+        ,   inv_g(V::set1(1.f / t.g))
+        ,   t_1(V::set1(t.t_1))
+        ,   s_2(V::set1(t.s_2))
+        ,   m_2(V::set1(t.m_2))
+        ,   inverse_limit(V::set1(t.inverse_limit))
+    {
+    }
+
+    vec n_r;
+    vec g;
+    vec inv_g;
+    vec t_1;
+    vec s_2;
+    vec m_2;
+    vec inverse_limit;
+};
+
+//
+// CAM
+//
+
+template<typename V>
+inline typename V::vec post_adaptation_cone_response_compression_fwd(typename V::vec Rc)
+{
+    const typename V::vec F_L_Y = V::pow(Rc, V::set1(0.42f));
+    return V::div(F_L_Y, V::add(V::set1(cam_nl_offset), F_L_Y));
+}
+
+template<typename V>
+inline typename V::vec post_adaptation_cone_response_compression_inv(typename V::vec Ra)
+{
+    const typename V::vec Ra_lim = V::min(Ra, V::set1(0.99f));
+    const typename V::vec F_L_Y  = V::div(V::mul(V::set1(cam_nl_offset), Ra_lim),
+                                          V::sub(V::set1(1.0f), Ra_lim));
+    return V::pow(F_L_Y, V::set1(1.f / 0.42f));
+}
+
+template<typename V>
+inline void RGB_to_Aab(const JMhParamsSIMD<V> & p,
+                       typename V::vec R, typename V::vec G, typename V::vec B,
+                       typename V::vec & A, typename V::vec & a, typename V::vec & b)
+{
+    typename V::vec rgb_m[3];
+    p.MATRIX_RGB_to_CAM16_c.apply(R, G, B, rgb_m[0], rgb_m[1], rgb_m[2]);
+
+    for (auto & v : rgb_m)
+    {
+        v = V::copysign(post_adaptation_cone_response_compression_fwd<V>(V::abs(v)), v);
+    }
+
+    p.MATRIX_cone_response_to_Aab.apply(rgb_m[0], rgb_m[1], rgb_m[2], A, a, b);
+}
+
+template<typename V>
+inline void Aab_to_JMh(const JMhParamsSIMD<V> & p,
+                       typename V::vec A, typename V::vec a, typename V::vec b,
+                       typename V::vec & J, typename V::vec & M, typename V::vec & h)
+{
+    const typename V::vec zero = V::set1(0.f);
+    const typename V::mask valid = V::greater(A, zero);
+
+    J = V::mul(V::set1(J_scale), V::pow(A, p.cz));
+    M = V::sqrt(V::add(V::mul(a, a), V::mul(b, b)));
+    h = V::mul(V::atan2(b, a), V::set1(180.0f / PI));
+    h = V::select(V::less(h, zero), V::add(h, V::set1(hue_limit)), h);
+
+    J = V::select(valid, J, zero);
+    M = V::select(valid, M, zero);
+    h = V::select(valid, h, zero);
+}
+
+template<typename V>
+inline void JMh_to_Aab(const JMhParamsSIMD<V> & p,
+                       typename V::vec J, typename V::vec M,
+                       typename V::vec cos_hr, typename V::vec sin_hr,
+                       typename V::vec & A, typename V::vec & a, typename V::vec & b)
+{
+    A = V::pow(V::mul(J, V::set1(1.0f / J_scale)), p.inv_cz);
+    a = V::mul(M, cos_hr);
+    b = V::mul(M, sin_hr);
+}
+
+template<typename V>
+inline void Aab_to_RGB(const JMhParamsSIMD<V> & p,
+                       typename V::vec A, typename V::vec a, typename V::vec b,
+                       typename V::vec & R, typename V::vec & G, typename V::vec & B)
+{
+    typename V::vec rgb_a[3];
+    p.MATRIX_Aab_to_cone_response.apply(A, a, b, rgb_a[0], rgb_a[1], rgb_a[2]);
+
+    for (auto & v : rgb_a)
+    {
+        v = V::copysign(post_adaptation_cone_response_compression_inv<V>(V::abs(v)), v);
+    }
+
+    p.MATRIX_CAM16_c_to_RGB.apply(rgb_a[0], rgb_a[1], rgb_a[2], R, G, B);
+}
+
+// Compute the cosine and the sine of the hue from the a and b components (i.e. instead of
+// the hue angle) when the colorfulness is not null.
+template<typename V>
+inline void Aab_to_hue_cos_sin(typename V::vec M, typename V::vec a, typename V::vec b,
+                               typename V::vec & cos_hr, typename V::vec & sin_hr)
+{
+    const typename V::vec zero = V::set1(0.f);
+    const typename V::mask valid = V::greater(M, zero);
+
+    cos_hr = V::select(valid, V::div(a, M), V::set1(1.f));
+    sin_hr = V::select(valid, V::div(b, M), zero);
+}
+
+// Equivalent to from_degrees().
+template<typename V>
+inline typename V::vec wrap_to_hue_limit(typename V::vec hue)
+{
+    const typename V::vec limit = V::set1(hue_limit);
+    const typename V::vec y = V::sub(hue, V::mul(limit, V::trunc(V::div(hue, limit))));
+    return V::select(V::less(y, V::set1(0.f)), V::add(y, limit), y);
+}
+
+template<typename V>
+inline void hue_cos_sin(typename V::vec hue, typename V::vec & cos_hr, typename V::vec & sin_hr)
+{
+    V::sincos(V::mul(hue, V::set1(PI / 180.0f)), sin_hr, cos_hr);
+}
+
+//
+// Tonescale / Chroma compress
+//
+
+template<typename V>
+inline typename V::vec A_to_Y(typename V::vec A, const JMhParamsSIMD<V> & p)
+{
+    const typename V::vec Ra = V::mul(p.A_w_J, A);
+    return V::div(post_adaptation_cone_response_compression_inv<V>(Ra), p.F_L_n);
+}
+
+template<typename V>
+inline typename V::vec J_to_Y(typename V::vec abs_J, const JMhParamsSIMD<V> & p)
+{
+    return A_to_Y<V>(V::pow(V::mul(abs_J, V::set1(1.0f / J_scale)), p.inv_cz), p);
+}
+
+template<typename V>
+inline typename V::vec Y_to_J(typename V::vec abs_Y, const JMhParamsSIMD<V> & p)
+{
+    const typename V::vec Ra = post_adaptation_cone_response_compression_fwd<V>(V::mul(abs_Y, p.F_L_n));
+    return V::mul(V::set1(J_scale), V::pow(V::mul(Ra, p.inv_A_w_J), p.cz));
+}
+
+template<typename V>
+inline typename V::vec aces_tonescale_fwd(typename V::vec Y_in, const ToneScaleParamsSIMD<V> & t)
+{
+    const typename V::vec f = V::mul(t.m_2, V::pow(V::div(Y_in, V::add(Y_in, t.s_2)), t.g));
+    const typename V::vec Y_ts = V::max(V::set1(0.f), V::div(V::mul(f, f), V::add(f, t.t_1)));
+    return V::mul(Y_ts, t.n_r);
+}
+
+template<typename V>
+inline typename V::vec aces_tonescale_inv(typename V::vec Y_in, const ToneScaleParamsSIMD<V> & t)
+{
+    const typename V::vec Y_ts_norm = V::div(Y_in, V::set1(reference_luminance));
+    const typename V::vec Z = V::max(V::set1(0.f), V::min(t.inverse_limit, Y_ts_norm));
+    const typename V::vec f
+        = V::mul(V::add(Z, V::sqrt(V::mul(Z, V::add(V::mul(V::set1(4.f), t.t_1), Z)))),
+                 V::set1(0.5f));
+    return V::div(t.s_2, V::sub(V::pow(V::div(t.m_2, f), t.inv_g), V::set1(1.f)));
+}
+
+template<typename V>
+inline typename V::vec tonescale_fwd(typename V::vec J, const JMhParamsSIMD<V> & p,
+                                     const ToneScaleParamsSIMD<V> & t)
+{
+    const typename V::vec Y_in  = J_to_Y<V>(V::abs(J), p);
+    const typename V::vec J_out = Y_to_J<V>(aces_tonescale_fwd<V>(Y_in, t), p);
+    return V::copysign(J_out, J);
+}
+
+template<typename V>
+inline typename V::vec tonescale_inv(typename V::vec J, const JMhParamsSIMD<V> & p,
+                                     const ToneScaleParamsSIMD<V> & t)
+{
+    const typename V::vec Y_in  = J_to_Y<V>(V::abs(J), p);
+    const typename V::vec J_out = Y_to_J<V>(aces_tonescale_inv<V>(Y_in, t), p);
+    return V::copysign(J_out, J);
+}
+
+template<typename V>
+inline typename V::vec tonescale_A_to_J_fwd(typename V::vec A, const JMhParamsSIMD<V> & p,
+                                            const ToneScaleParamsSIMD<V> & t)
+{
+    const typename V::vec Y_in  = A_to_Y<V>(A, p);
+    const typename V::vec J_out = Y_to_J<V>(aces_tonescale_fwd<V>(Y_in, t), p);
+    return V::copysign(J_out, A);
+}
+
+// Same weights as chroma_compress_norm().
+template<typename V>
+inline typename V::vec chroma_compress_norm(typename V::vec cos_hr1, typename V::vec sin_hr1,
+                                            float chroma_compress_scale)
+{
+    const typename V::vec two   = V::set1(2.0f);
+    const typename V::vec three = V::set1(3.0f);
+    const typename V::vec four  = V::set1(4.0f);
+
+    const typename V::vec cos_hr1_2 = V::mul(cos_hr1, cos_hr1);
+    const typename V::vec sin_hr1_2 = V::mul(sin_hr1, sin_hr1);
+
+    const typename V::vec cos_hr2 = V::sub(V::mul(two, cos_hr1_2), V::set1(1.0f));
+    const typename V::vec sin_hr2 = V::mul(V::mul(two, cos_hr1), sin_hr1);
+    const typename V::vec cos_hr3 = V::mul(V::sub(V::mul(four, cos_hr1_2), three), cos_hr1);
+    const typename V::vec sin_hr3 = V::mul(V::sub(three, V::mul(four, sin_hr1_2)), sin_hr1);
+
+    typename V::vec M = V::mul(V::set1(11.34072f), cos_hr1);
+    M = V::add(M, V::mul(V::set1(16.46899f), cos_hr2));
+    M = V::add(M, V::mul(V::set1(7.88380f), cos_hr3));
+    M = V::add(M, V::mul(V::set1(14.66441f), sin_hr1));
+    M = V::add(M, V::mul(V::set1(-6.37224f), sin_hr2));
+    M = V::add(M, V::mul(V::set1(9.19364f), sin_hr3));
+    M = V::add(M, V::set1(77.12896f));
+
+    return V::mul(M, V::set1(chroma_compress_scale));
+}
+
+//
+// Renderers
+//
+
+template<typename V>
+void apply_RGB_to_JMh(const JMhParams & params, const float * src, float * dst, long numPixels)
+{
+    const JMhParamsSIMD<V> p(params);
+
+    ApplySIMDKernel<V>(src, dst, numPixels,
+        [&p](typename V::vec & c0, typename V::vec & c1, typename V::vec & c2)
+        {
+            typename V::vec A, a, b;
+            RGB_to_Aab<V>(p, c0, c1, c2, A, a, b);
+            Aab_to_JMh<V>(p, A, a, b, c0, c1, c2);
+        });
+}
+
+template<typename V>
+void apply_JMh_to_RGB(const JMhParams & params, const float * src, float * dst, long numPixels)
+{
+    const JMhParamsSIMD<V> p(params);
+
+    ApplySIMDKernel<V>(src, dst, numPixels,
+        [&p](typename V::vec & c0, typename V::vec & c1, typename V::vec & c2)
+        {
+            typename V::vec cos_hr, sin_hr, A, a, b;
+            hue_cos_sin<V>(wrap_to_hue_limit<V>(c2), cos_hr, sin_hr);
+            JMh_to_Aab<V>(p, c0, c1, cos_hr, sin_hr, A, a, b);
+            Aab_to_RGB<V>(p, A, a, b, c0, c1, c2);
+        });
+}
+
+template<typename V, bool inverse>
+void apply_tonescale_compress(const JMhParams & params,
+                              const ToneScaleParams & tsParams,
+                              const SharedCompressionParameters & shParams,
+                              const ChromaCompressParams & ccParams,
+                              const float * src, float * dst, long numPixels)
+{
+    const JMhParamsSIMD<V> p(params);
+    const ToneScaleParamsSIMD<V> t(tsParams);
+
+    ApplySIMDKernel<V>(src, dst, numPixels,
+        [&](typename V::vec & c0, typename V::vec & c1, typename V::vec & c2)
+        {
+            alignas(64) float J_in[V::N], M_in[V::N], h[V::N], J_out[V::N], Mnorm[V::N];
+
+            c2 = wrap_to_hue_limit<V>(c2);
+
+            typename V::vec cos_hr, sin_hr;
+            hue_cos_sin<V>(c2, cos_hr, sin_hr);
+
+            V::store(J_in, c0);
+            V::store(M_in, c1);
+            V::store(h, c2);
+            V::store(J_out, inverse ? tonescale_inv<V>(c0, p, t) : tonescale_fwd<V>(c0, p, t));
+            V::store(Mnorm, chroma_compress_norm<V>(cos_hr, sin_hr, ccParams.chroma_compress_scale));
+
+            for (int idx = 0; idx < V::N; ++idx)
+            {
+                const ResolvedSharedCompressionParameters rp = resolve_CompressionParams(h[idx], shParams);
+                const f3 JMh = inverse
+                    ? chroma_compress_inv({J_in[idx], M_in[idx], h[idx]}, J_out[idx], Mnorm[idx], rp, ccParams)
+                    : chroma_compress_fwd({J_in[idx], M_in[idx], h[idx]}, J_out[idx], Mnorm[idx], rp, ccParams);
+
+                J_out[idx] = JMh[0];
+                M_in[idx]  = JMh[1];
+            }
+
+            c0 = V::load(J_out);
+            c1 = V::load(M_in);
+        });
+}
+
+template<typename V>
+void apply_output_transform_fwd(const JMhParams & inputParams,
+                                const JMhParams & limitParams,
+                                const ToneScaleParams & tsParams,
+                                const SharedCompressionParameters & shParams,
+                                const ChromaCompressParams & ccParams,
+                                const GamutCompressParams & gcParams,
+                                const float * src, float * dst, long numPixels)
+{
+    const JMhParamsSIMD<V> pIn(inputParams);
+    const JMhParamsSIMD<V> pOut(limitParams);
+    const ToneScaleParamsSIMD<V> t(tsParams);
+
+    ApplySIMDKernel<V>(src, dst, numPixels,
+        [&](typename V::vec & c0, typename V::vec & c1, typename V::vec & c2)
+        {
+            alignas(64) float J[V::N], M[V::N], h[V::N], J_ts[V::N], Mnorm[V::N];
+
+            typename V::vec A, a, b, JMh[3], cos_hr, sin_hr;
+            RGB_to_Aab<V>(pIn, c0, c1, c2, A, a, b);
+            Aab_to_JMh<V>(pIn, A, a, b, JMh[0], JMh[1], JMh[2]);
+            Aab_to_hue_cos_sin<V>(JMh[1], a, b, cos_hr, sin_hr);
+
+            V::store(J, JMh[0]);
+            V::store(M, JMh[1]);
+            V::store(h, JMh[2]);
+            V::store(J_ts, tonescale_A_to_J_fwd<V>(A, pIn, t));
+            V::store(Mnorm, chroma_compress_norm<V>(cos_hr, sin_hr, ccParams.chroma_compress_scale));
+
+            for (int idx = 0; idx < V::N; ++idx)
+            {
+                const ResolvedSharedCompressionParameters rp = resolve_CompressionParams(h[idx], shParams);
+                const f3 tonemappedJMh = ACES2::chroma_compress_fwd({J[idx], M[idx], h[idx]}, J_ts[idx], Mnorm[idx], rp, ccParams);
+                const f3 compressedJMh = ACES2::gamut_compress_fwd(tonemappedJMh, rp, gcParams);
+
+                J[idx] = compressedJMh[0];
+                M[idx] = compressedJMh[1];
+            }
+
+            JMh_to_Aab<V>(pOut, V::load(J), V::load(M), cos_hr, sin_hr, A, a, b);
+            Aab_to_RGB<V>(pOut, A, a, b, c0, c1, c2);
+        });
+}
+
+template<typename V>
+void apply_output_transform_inv(const JMhParams & inputParams,
+                                const JMhParams & limitParams,
+                                const ToneScaleParams & tsParams,
+                                const SharedCompressionParameters & shParams,
+                                const ChromaCompressParams & ccParams,
+                                const GamutCompressParams & gcParams,
+                                const float * src, float * dst, long numPixels)
+{
+    const JMhParamsSIMD<V> pIn(inputParams);
+    const JMhParamsSIMD<V> pOut(limitParams);
+    const ToneScaleParamsSIMD<V> t(tsParams);
+
+    ApplySIMDKernel<V>(src, dst, numPixels,
+        [&](typename V::vec & c0, typename V::vec & c1, typename V::vec & c2)
+        {
+            alignas(64) float J[V::N], M[V::N], h[V::N], J_in[V::N], Mnorm[V::N];
+            ResolvedSharedCompressionParameters rp[V::N];
+
+            typename V::vec A, a, b, JMh[3], cos_hr, sin_hr;
+            RGB_to_Aab<V>(pOut, c0, c1, c2, A, a, b);
+            Aab_to_JMh<V>(pOut, A, a, b, JMh[0], JMh[1], JMh[2]);
+            Aab_to_hue_cos_sin<V>(JMh[1], a, b, cos_hr, sin_hr);
+
+            V::store(J, JMh[0]);
+            V::store(M, JMh[1]);
+            V::store(h, JMh[2]);
+            V::store(Mnorm, chroma_compress_norm<V>(cos_hr, sin_hr, ccParams.chroma_compress_scale));
+
+            for (int idx = 0; idx < V::N; ++idx)
+            {
+                rp[idx] = resolve_CompressionParams(h[idx], shParams);
+                const f3 tonemappedJMh = ACES2::gamut_compress_inv({J[idx], M[idx], h[idx]}, rp[idx], gcParams);
+
+                J[idx] = tonemappedJMh[0];
+                M[idx] = tonemappedJMh[1];
+            }
+
+            V::store(J_in, tonescale_inv<V>(V::load(J), pIn, t));
+
+            for (int idx = 0; idx < V::N; ++idx)
+            {
+                const f3 JMh = ACES2::chroma_compress_inv({J[idx], M[idx], h[idx]}, J_in[idx], Mnorm[idx], rp[idx], ccParams);
+
+                M[idx] = JMh[1];
+            }
+
+            JMh_to_Aab<V>(pIn, V::load(J_in), V::load(M), cos_hr, sin_hr, A, a, b);
+            Aab_to_RGB<V>(pIn, A, a, b, c0, c1, c2);
+        });
+}
+
+} // namespace SIMD
+
+} // namespace ACES2
+
+} // namespace OCIO_NAMESPACE
+
+#endif
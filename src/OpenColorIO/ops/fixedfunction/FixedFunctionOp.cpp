@@ -122,7 +122,7 @@ std::string FixedFunctionOp::getCacheID() const
 ConstOpCPURcPtr FixedFunctionOp::getCPUOp(bool fastLogExpPow) const
 {
     ConstFixedFunctionOpDataRcPtr data = fnData();
-    return GetFixedFunctionCPURenderer(data, fastLogExpPow);
+    return GetFixedFunctionCPURenderer(data, fastLogExpPow, false);
 }
 
 void FixedFunctionOp::extractGpuShaderInfo(GpuShaderCreatorRcPtr & shaderCreator) const
@@ -11,6 +11,9 @@
 #include "BitDepthUtils.h"
 #include "MathUtils.h"
 #include "ops/fixedfunction/FixedFunctionOpCPU.h"
+#include "ops/fixedfunction/FixedFunctionOpCPU_SSE2.h"
+#include "ops/fixedfunction/FixedFunctionOpCPU_AVX2.h"
+#include "ops/fixedfunction/FixedFunctionOpCPU_AVX512.h"
 #include "SSE.h"
 #include "CPUInfo.h"
 
@@ -130,11 +133,27 @@ public:
     void apply(const void * inImg, void * outImg, long numPixels) const override;
 };
 
+// Signatures of the SIMD versions of the ACES 2 renderers (refer to ACES2/TransformSIMD.h).
+typedef void (ACES2_JMh_func)(const ACES2::JMhParams & p,
+                              const float * src, float * dst, long numPixels);
+typedef void (ACES2_TonescaleCompress_func)(const ACES2::JMhParams & p,
+                                            const ACES2::ToneScaleParams & t,
+                                            const ACES2::SharedCompressionParameters & s,
+                                            const ACES2::ChromaCompressParams & c,
+                                            const float * src, float * dst, long numPixels);
+typedef void (ACES2_OutputTransform_func)(const ACES2::JMhParams & pIn,
+                                          const ACES2::JMhParams & pOut,
+                                          const ACES2::ToneScaleParams & t,
+                                          const ACES2::SharedCompressionParameters & s,
+                                          const ACES2::ChromaCompressParams & c,
+                                          const ACES2::GamutCompressParams & g,
+                                          const float * src, float * dst, long numPixels);
+
 class Renderer_ACES_OutputTransform20 : public OpCPU
 {
 public:
     Renderer_ACES_OutputTransform20() = delete;
-    explicit Renderer_ACES_OutputTransform20(ConstFixedFunctionOpDataRcPtr & data);
+    Renderer_ACES_OutputTransform20(ConstFixedFunctionOpDataRcPtr & data, bool fastACES2);
 
     void apply(const void * inImg, void * outImg, long numPixels) const override;
 
@@ -144,19 +163,22 @@ private:
 
 protected:
     bool m_fwd;
-    ACES2::JMhParams m_pIn;
-    ACES2::JMhParams m_pOut;
-    ACES2::ToneScaleParams m_t;
-    ACES2::SharedCompressionParameters m_s;
-    ACES2::ChromaCompressParams m_c;
-    ACES2::GamutCompressParams m_g;
+    // The parameters are shared with the other renderers & shader builders.
+    ACES2::ConstOutputTransformParamsRcPtr m_params;
+    const ACES2::JMhParams & m_pIn;
+    const ACES2::JMhParams & m_pOut;
+    const ACES2::ToneScaleParams & m_t;
+    const ACES2::SharedCompressionParameters & m_s;
+    const ACES2::ChromaCompressParams & m_c;
+    const ACES2::GamutCompressParams & m_g;
+    ACES2_OutputTransform_func * m_applyFunc;
 };
 
 class Renderer_ACES_RGB_TO_JMh_20 : public OpCPU
 {
 public:
     Renderer_ACES_RGB_TO_JMh_20() = delete;
-    explicit Renderer_ACES_RGB_TO_JMh_20(ConstFixedFunctionOpDataRcPtr & data);
+    Renderer_ACES_RGB_TO_JMh_20(ConstFixedFunctionOpDataRcPtr & data, bool fastACES2);
 
     void apply(const void * inImg, void * outImg, long numPixels) const override;
 
@@ -167,13 +189,14 @@ private:
 protected:
     bool m_fwd;
     ACES2::JMhParams m_p;
+    ACES2_JMh_func * m_applyFunc;
 };
 
 class Renderer_ACES_TONESCALE_COMPRESS_20 : public OpCPU
 {
 public:
     Renderer_ACES_TONESCALE_COMPRESS_20() = delete;
-    explicit Renderer_ACES_TONESCALE_COMPRESS_20(ConstFixedFunctionOpDataRcPtr & data);
+    Renderer_ACES_TONESCALE_COMPRESS_20(ConstFixedFunctionOpDataRcPtr & data, bool fastACES2);
 
     void apply(const void * inImg, void * outImg, long numPixels) const override;
 
@@ -183,10 +206,13 @@ private:
 
 protected:
     bool m_fwd;
-    ACES2::JMhParams m_p;
-    ACES2::ToneScaleParams m_t;
-    ACES2::SharedCompressionParameters m_s;
-    ACES2::ChromaCompressParams m_c;
+    // The parameters are shared with the other renderers & shader builders.
+    ACES2::ConstToneScaleCompressParamsRcPtr m_params;
+    const ACES2::JMhParams & m_p;
+    const ACES2::ToneScaleParams & m_t;
+    const ACES2::SharedCompressionParameters & m_s;
+    const ACES2::ChromaCompressParams & m_c;
+    ACES2_TonescaleCompress_func * m_applyFunc;
 };
 
 class Renderer_ACES_GAMUT_COMPRESS_20 : public OpCPU
@@ -203,8 +229,10 @@ private:
 
 protected:
     bool m_fwd;
-    ACES2::SharedCompressionParameters m_s;
-    ACES2::GamutCompressParams m_g;
+    // The parameters are shared with the other renderers & shader builders.
+    ACES2::ConstOutputTransformParamsRcPtr m_params;
+    const ACES2::SharedCompressionParameters & m_s;
+    const ACES2::GamutCompressParams & m_g;
 };
 
 class Renderer_REC2100_Surround : public OpCPU
@@ -1000,21 +1028,24 @@ void Renderer_ACES_GamutComp13_Inv::apply(const void * inImg, void * outImg, lon
     }
 }
 
-Renderer_ACES_OutputTransform20::Renderer_ACES_OutputTransform20(ConstFixedFunctionOpDataRcPtr & data)
-    :   OpCPU()
+namespace
+{
+
+// Get the shared parameters of the ACES 2 output transform or gamut compression.
+ACES2::ConstOutputTransformParamsRcPtr GetACES2OutputTransformParams(ConstFixedFunctionOpDataRcPtr & data)
 {
-    m_fwd = FixedFunctionOpData::ACES_OUTPUT_TRANSFORM_20_FWD == data->getStyle();
+    const FixedFunctionOpData::Params & params = data->getParams();
 
-    const float peak_luminance = (float) data->getParams()[0];
+    const float peak_luminance = (float) params[0];
 
-    const float lim_red_x   = (float) data->getParams()[1];
-    const float lim_red_y   = (float) data->getParams()[2];
-    const float lim_green_x = (float) data->getParams()[3];
-    const float lim_green_y = (float) data->getParams()[4];
-    const float lim_blue_x  = (float) data->getParams()[5];
-    const float lim_blue_y  = (float) data->getParams()[6];
-    const float lim_white_x = (float) data->getParams()[7];
-    const float lim_white_y = (float) data->getParams()[8];
+    const float lim_red_x   = (float) params[1];
+    const float lim_red_y   = (float) params[2];
+    const float lim_green_x = (float) params[3];
+    const float lim_green_y = (float) params[4];
+    const float lim_blue_x  = (float) params[5];
+    const float lim_blue_y  = (float) params[6];
+    const float lim_white_x = (float) params[7];
+    const float lim_white_y = (float) params[8];
 
     const Primaries lim_primaries = {
         {lim_red_x  , lim_red_y  },
@@ -1023,18 +1054,57 @@ Renderer_ACES_OutputTransform20::Renderer_ACES_OutputTransform20(ConstFixedFunct
         {lim_white_x, lim_white_y}
     };
 
-    m_pIn = ACES2::init_JMhParams(ACES_AP0::primaries);
-    m_pOut = ACES2::init_JMhParams(lim_primaries);
-    m_t = ACES2::init_ToneScaleParams(peak_luminance);
-    const ACES2::JMhParams reachGamut = ACES2::init_JMhParams(ACES_AP1::primaries);
-    m_s = ACES2::init_SharedCompressionParams(peak_luminance, m_pIn, reachGamut);
-    m_c = ACES2::init_ChromaCompressParams(peak_luminance, m_t);
-    m_g = ACES2::init_GamutCompressParams(peak_luminance, m_pIn, m_pOut, m_t, m_s, reachGamut);
+    return ACES2::GetOutputTransformParams(peak_luminance, lim_primaries);
+}
+
+} // anonymous
+
+Renderer_ACES_OutputTransform20::Renderer_ACES_OutputTransform20(ConstFixedFunctionOpDataRcPtr & data,
+                                                                 bool fastACES2)
+    :   OpCPU()
+    ,   m_fwd(FixedFunctionOpData::ACES_OUTPUT_TRANSFORM_20_FWD == data->getStyle())
+    ,   m_params(GetACES2OutputTransformParams(data))
+    ,   m_pIn(m_params->inputJMhParams)
+    ,   m_pOut(m_params->limitJMhParams)
+    ,   m_t(m_params->tsParams)
+    ,   m_s(m_params->shParams)
+    ,   m_c(m_params->ccParams)
+    ,   m_g(m_params->gcParams)
+    ,   m_applyFunc(nullptr)
+{
+    // The SIMD versions rely on the fast (i.e. approximated) power, atan2 and sincos functions.
+    if (fastACES2)
+    {
+#if OCIO_USE_SSE2
+        if (CPUInfo::instance().hasSSE2())
+        {
+            m_applyFunc = m_fwd ? applyACES2OutputTransformFwdSSE2 : applyACES2OutputTransformInvSSE2;
+        }
+#endif
+
+#if OCIO_USE_AVX2
+        if (CPUInfo::instance().hasAVX2())
+        {
+            m_applyFunc = m_fwd ? applyACES2OutputTransformFwdAVX2 : applyACES2OutputTransformInvAVX2;
+        }
+#endif
+
+#if OCIO_USE_AVX512
+        if (CPUInfo::instance().hasAVX512())
+        {
+            m_applyFunc = m_fwd ? applyACES2OutputTransformFwdAVX512 : applyACES2OutputTransformInvAVX512;
+        }
+#endif
+    }
 }
 
 void Renderer_ACES_OutputTransform20::apply(const void * inImg, void * outImg, long numPixels) const
 {
-    if (m_fwd)
+    if (m_applyFunc)
+    {
+        m_applyFunc(m_pIn, m_pOut, m_t, m_s, m_c, m_g, (const float *)inImg, (float *)outImg, numPixels);
+    }
+    else if (m_fwd)
     {
         fwd(inImg, outImg, numPixels);
     }
@@ -1111,8 +1181,10 @@ void Renderer_ACES_OutputTransform20::inv(const void * inImg, void * outImg, lon
     }
 }
 
-Renderer_ACES_RGB_TO_JMh_20::Renderer_ACES_RGB_TO_JMh_20(ConstFixedFunctionOpDataRcPtr & data)
+Renderer_ACES_RGB_TO_JMh_20::Renderer_ACES_RGB_TO_JMh_20(ConstFixedFunctionOpDataRcPtr & data,
+                                                         bool fastACES2)
     :   OpCPU()
+    ,   m_applyFunc(nullptr)
 {
     m_fwd = FixedFunctionOpData::ACES_RGB_TO_JMh_20 == data->getStyle();
 
@@ -1133,11 +1205,39 @@ Renderer_ACES_RGB_TO_JMh_20::Renderer_ACES_RGB_TO_JMh_20(ConstFixedFunctionOpDat
     };
 
     m_p = ACES2::init_JMhParams(primaries);
+
+    if (fastACES2)
+    {
+#if OCIO_USE_SSE2
+        if (CPUInfo::instance().hasSSE2())
+        {
+            m_applyFunc = m_fwd ? applyACES2RGBToJMhSSE2 : applyACES2JMhToRGBSSE2;
+        }
+#endif
+
+#if OCIO_USE_AVX2
+        if (CPUInfo::instance().hasAVX2())
+        {
+            m_applyFunc = m_fwd ? applyACES2RGBToJMhAVX2 : applyACES2JMhToRGBAVX2;
+        }
+#endif
+
+#if OCIO_USE_AVX512
+        if (CPUInfo::instance().hasAVX512())
+        {
+            m_applyFunc = m_fwd ? applyACES2RGBToJMhAVX512 : applyACES2JMhToRGBAVX512;
+        }
+#endif
+    }
 }
 
 void Renderer_ACES_RGB_TO_JMh_20::apply(const void * inImg, void * outImg, long numPixels) const
 {
-    if (m_fwd)
+    if (m_applyFunc)
+    {
+        m_applyFunc(m_p, (const float *)inImg, (float *)outImg, numPixels);
+    }
+    else if (m_fwd)
     {
         fwd(inImg, outImg, numPixels);
     }
@@ -1186,23 +1286,49 @@ void Renderer_ACES_RGB_TO_JMh_20::inv(const void * inImg, void * outImg, long nu
     }
 }
 
-Renderer_ACES_TONESCALE_COMPRESS_20::Renderer_ACES_TONESCALE_COMPRESS_20(ConstFixedFunctionOpDataRcPtr & data)
+Renderer_ACES_TONESCALE_COMPRESS_20::Renderer_ACES_TONESCALE_COMPRESS_20(ConstFixedFunctionOpDataRcPtr & data,
+                                                                         bool fastACES2)
     :   OpCPU()
-{
-    m_fwd = FixedFunctionOpData::ACES_TONESCALE_COMPRESS_20_FWD == data->getStyle();
+    ,   m_fwd(FixedFunctionOpData::ACES_TONESCALE_COMPRESS_20_FWD == data->getStyle())
+    ,   m_params(ACES2::GetToneScaleCompressParams((float) data->getParams()[0]))
+    ,   m_p(m_params->inputJMhParams)
+    ,   m_t(m_params->tsParams)
+    ,   m_s(m_params->shParams)
+    ,   m_c(m_params->ccParams)
+    ,   m_applyFunc(nullptr)
+{
+    if (fastACES2)
+    {
+#if OCIO_USE_SSE2
+        if (CPUInfo::instance().hasSSE2())
+        {
+            m_applyFunc = m_fwd ? applyACES2TonescaleCompressFwdSSE2 : applyACES2TonescaleCompressInvSSE2;
+        }
+#endif
 
-    const float peak_luminance = (float) data->getParams()[0];
+#if OCIO_USE_AVX2
+        if (CPUInfo::instance().hasAVX2())
+        {
+            m_applyFunc = m_fwd ? applyACES2TonescaleCompressFwdAVX2 : applyACES2TonescaleCompressInvAVX2;
+        }
+#endif
 
-    m_p = ACES2::init_JMhParams(ACES_AP0::primaries);
-    m_t = ACES2::init_ToneScaleParams(peak_luminance);
-    const ACES2::JMhParams reachGamut = ACES2::init_JMhParams(ACES_AP1::primaries);
-    m_s = ACES2::init_SharedCompressionParams(peak_luminance, m_p, reachGamut);
-    m_c = ACES2::init_ChromaCompressParams(peak_luminance, m_t);
+#if OCIO_USE_AVX512
+        if (CPUInfo::instance().hasAVX512())
+        {
+            m_applyFunc = m_fwd ? applyACES2TonescaleCompressFwdAVX512 : applyACES2TonescaleCompressInvAVX512;
+        }
+#endif
+    }
 }
 
 void Renderer_ACES_TONESCALE_COMPRESS_20::apply(const void * inImg, void * outImg, long numPixels) const
 {
-    if (m_fwd)
+    if (m_applyFunc)
+    {
+        m_applyFunc(m_p, m_t, m_s, m_c, (const float *)inImg, (float *)outImg, numPixels);
+    }
+    else if (m_fwd)
     {
         fwd(inImg, outImg, numPixels);
     }
@@ -1266,33 +1392,11 @@ void Renderer_ACES_TONESCALE_COMPRESS_20::inv(const void * inImg, void * outImg,
 
 Renderer_ACES_GAMUT_COMPRESS_20::Renderer_ACES_GAMUT_COMPRESS_20(ConstFixedFunctionOpDataRcPtr & data)
     :   OpCPU()
+    ,   m_fwd(FixedFunctionOpData::ACES_GAMUT_COMPRESS_20_FWD == data->getStyle())
+    ,   m_params(GetACES2OutputTransformParams(data))
+    ,   m_s(m_params->shParams)
+    ,   m_g(m_params->gcParams)
 {
-    m_fwd = FixedFunctionOpData::ACES_GAMUT_COMPRESS_20_FWD == data->getStyle();
-
-    const float peakLuminance = (float) data->getParams()[0];
-
-    const float red_x   = (float) data->getParams()[1];
-    const float red_y   = (float) data->getParams()[2];
-    const float green_x = (float) data->getParams()[3];
-    const float green_y = (float) data->getParams()[4];
-    const float blue_x  = (float) data->getParams()[5];
-    const float blue_y  = (float) data->getParams()[6];
-    const float white_x = (float) data->getParams()[7];
-    const float white_y = (float) data->getParams()[8];
-
-    const Primaries limitingPrimaries = {
-        {red_x  , red_y  },
-        {green_x, green_y},
-        {blue_x , blue_y },
-        {white_x, white_y}
-    };
-
-    const ACES2::JMhParams pIn = ACES2::init_JMhParams(ACES_AP0::primaries);
-    const ACES2::JMhParams pLim = ACES2::init_JMhParams(limitingPrimaries);
-    const ACES2::ToneScaleParams t = ACES2::init_ToneScaleParams(peakLuminance);
-    const ACES2::JMhParams reachGamut = ACES2::init_JMhParams(ACES_AP1::primaries);
-    m_s = ACES2::init_SharedCompressionParams(peakLuminance, pIn, reachGamut);
-    m_g = ACES2::init_GamutCompressParams(peakLuminance, pIn, pLim, t, m_s, reachGamut);
 }
 
 void Renderer_ACES_GAMUT_COMPRESS_20::apply(const void * inImg, void * outImg, long numPixels) const
@@ -2138,7 +2242,9 @@ void Renderer_DOUBLE_LOG_TO_LIN::apply(const void* inImg, void* outImg, long num
 
 
 
-ConstOpCPURcPtr GetFixedFunctionCPURenderer(ConstFixedFunctionOpDataRcPtr & func, bool fastLogExpPow)
+ConstOpCPURcPtr GetFixedFunctionCPURenderer(ConstFixedFunctionOpDataRcPtr & func,
+                                            bool fastLogExpPow,
+                                            bool fastACES2)
 {
     // Prevent "unused-parameter" warning/error in case the using code is
     // ifdef'ed out.
@@ -2199,21 +2305,21 @@ ConstOpCPURcPtr GetFixedFunctionCPURenderer(ConstFixedFunctionOpDataRcPtr & func
         case FixedFunctionOpData::ACES_OUTPUT_TRANSFORM_20_INV:
         {
             // Sharing same renderer (param will be inverted to handle direction).
-            return std::make_shared<Renderer_ACES_OutputTransform20>(func);
+            return std::make_shared<Renderer_ACES_OutputTransform20>(func, fastACES2);
         }
 
         case FixedFunctionOpData::ACES_RGB_TO_JMh_20:
         case FixedFunctionOpData::ACES_JMh_TO_RGB_20:
         {
             // Sharing same renderer (param will be inverted to handle direction).
-            return std::make_shared<Renderer_ACES_RGB_TO_JMh_20>(func);
+            return std::make_shared<Renderer_ACES_RGB_TO_JMh_20>(func, fastACES2);
         }
 
         case FixedFunctionOpData::ACES_TONESCALE_COMPRESS_20_FWD:
         case FixedFunctionOpData::ACES_TONESCALE_COMPRESS_20_INV:
         {
             // Sharing same renderer (param will be inverted to handle direction).
-            return std::make_shared<Renderer_ACES_TONESCALE_COMPRESS_20>(func);
+            return std::make_shared<Renderer_ACES_TONESCALE_COMPRESS_20>(func, fastACES2);
         }
 
         case FixedFunctionOpData::ACES_GAMUT_COMPRESS_20_FWD:
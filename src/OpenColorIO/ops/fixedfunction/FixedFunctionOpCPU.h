@@ -14,7 +14,11 @@
 namespace OCIO_NAMESPACE
 {
 
-ConstOpCPURcPtr GetFixedFunctionCPURenderer(ConstFixedFunctionOpDataRcPtr & func, bool fastLogExpPow);
+// The fastACES2 flag selects the SSE2, AVX2 or AVX-512 versions of some ACES 2 renderers
+// (refer to the OPTIMIZATION_FAST_ACES2 flag).
+ConstOpCPURcPtr GetFixedFunctionCPURenderer(ConstFixedFunctionOpDataRcPtr & func,
+                                            bool fastLogExpPow,
+                                            bool fastACES2);
 
 } // namespace OCIO_NAMESPACE
 
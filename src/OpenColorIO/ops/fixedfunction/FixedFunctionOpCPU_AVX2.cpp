@@ -0,0 +1,67 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#include "ops/fixedfunction/FixedFunctionOpCPU_AVX2.h"
+#if OCIO_USE_AVX2
+
+#include <immintrin.h>
+
+#include "AVX2.h"
+#include "ops/fixedfunction/ACES2/TransformSIMD.h"
+
+namespace OCIO_NAMESPACE
+{
+
+void applyACES2RGBToJMhAVX2(const ACES2::JMhParams & p, const float * src, float * dst, long numPixels)
+{
+    ACES2::SIMD::apply_RGB_to_JMh<VecAVX2>(p, src, dst, numPixels);
+}
+
+void applyACES2JMhToRGBAVX2(const ACES2::JMhParams & p, const float * src, float * dst, long numPixels)
+{
+    ACES2::SIMD::apply_JMh_to_RGB<VecAVX2>(p, src, dst, numPixels);
+}
+
+void applyACES2TonescaleCompressFwdAVX2(const ACES2::JMhParams & p,
+                                        const ACES2::ToneScaleParams & t,
+                                        const ACES2::SharedCompressionParameters & s,
+                                        const ACES2::ChromaCompressParams & c,
+                                        const float * src, float * dst, long numPixels)
+{
+    ACES2::SIMD::apply_tonescale_compress<VecAVX2, false>(p, t, s, c, src, dst, numPixels);
+}
+
+void applyACES2TonescaleCompressInvAVX2(const ACES2::JMhParams & p,
+                                        const ACES2::ToneScaleParams & t,
+                                        const ACES2::SharedCompressionParameters & s,
+                                        const ACES2::ChromaCompressParams & c,
+                                        const float * src, float * dst, long numPixels)
+{
+    ACES2::SIMD::apply_tonescale_compress<VecAVX2, true>(p, t, s, c, src, dst, numPixels);
+}
+
+void applyACES2OutputTransformFwdAVX2(const ACES2::JMhParams & pIn,
+                                      const ACES2::JMhParams & pOut,
+                                      const ACES2::ToneScaleParams & t,
+                                      const ACES2::SharedCompressionParameters & s,
+                                      const ACES2::ChromaCompressParams & c,
+                                      const ACES2::GamutCompressParams & g,
+                                      const float * src, float * dst, long numPixels)
+{
+    ACES2::SIMD::apply_output_transform_fwd<VecAVX2>(pIn, pOut, t, s, c, g, src, dst, numPixels);
+}
+
+void applyACES2OutputTransformInvAVX2(const ACES2::JMhParams & pIn,
+                                      const ACES2::JMhParams & pOut,
+                                      const ACES2::ToneScaleParams & t,
+                                      const ACES2::SharedCompressionParameters & s,
+                                      const ACES2::ChromaCompressParams & c,
+                                      const ACES2::GamutCompressParams & g,
+                                      const float * src, float * dst, long numPixels)
+{
+    ACES2::SIMD::apply_output_transform_inv<VecAVX2>(pIn, pOut, t, s, c, g, src, dst, numPixels);
+}
+
+} // OCIO_NAMESPACE
+
+#endif // OCIO_USE_AVX2
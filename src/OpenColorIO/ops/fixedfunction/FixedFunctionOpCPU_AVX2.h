@@ -0,0 +1,49 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#ifndef INCLUDED_OCIO_FIXEDFUNCTIONOP_CPU_AVX2_H
+#define INCLUDED_OCIO_FIXEDFUNCTIONOP_CPU_AVX2_H
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "CPUInfo.h"
+#include "ops/fixedfunction/ACES2/Common.h"
+
+#if OCIO_USE_AVX2
+namespace OCIO_NAMESPACE
+{
+
+void applyACES2RGBToJMhAVX2(const ACES2::JMhParams & p, const float * src, float * dst, long numPixels);
+void applyACES2JMhToRGBAVX2(const ACES2::JMhParams & p, const float * src, float * dst, long numPixels);
+
+void applyACES2TonescaleCompressFwdAVX2(const ACES2::JMhParams & p,
+                                        const ACES2::ToneScaleParams & t,
+                                        const ACES2::SharedCompressionParameters & s,
+                                        const ACES2::ChromaCompressParams & c,
+                                        const float * src, float * dst, long numPixels);
+void applyACES2TonescaleCompressInvAVX2(const ACES2::JMhParams & p,
+                                        const ACES2::ToneScaleParams & t,
+                                        const ACES2::SharedCompressionParameters & s,
+                                        const ACES2::ChromaCompressParams & c,
+                                        const float * src, float * dst, long numPixels);
+
+void applyACES2OutputTransformFwdAVX2(const ACES2::JMhParams & pIn,
+                                      const ACES2::JMhParams & pOut,
+                                      const ACES2::ToneScaleParams & t,
+                                      const ACES2::SharedCompressionParameters & s,
+                                      const ACES2::ChromaCompressParams & c,
+                                      const ACES2::GamutCompressParams & g,
+                                      const float * src, float * dst, long numPixels);
+void applyACES2OutputTransformInvAVX2(const ACES2::JMhParams & pIn,
+                                      const ACES2::JMhParams & pOut,
+                                      const ACES2::ToneScaleParams & t,
+                                      const ACES2::SharedCompressionParameters & s,
+                                      const ACES2::ChromaCompressParams & c,
+                                      const ACES2::GamutCompressParams & g,
+                                      const float * src, float * dst, long numPixels);
+
+} // namespace OCIO_NAMESPACE
+
+#endif // OCIO_USE_AVX2
+
+#endif /* INCLUDED_OCIO_FIXEDFUNCTIONOP_CPU_AVX2_H */
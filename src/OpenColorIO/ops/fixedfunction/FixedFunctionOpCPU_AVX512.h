@@ -0,0 +1,49 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#ifndef INCLUDED_OCIO_FIXEDFUNCTIONOP_CPU_AVX512_H
+#define INCLUDED_OCIO_FIXEDFUNCTIONOP_CPU_AVX512_H
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "CPUInfo.h"
+#include "ops/fixedfunction/ACES2/Common.h"
+
+#if OCIO_USE_AVX512
+namespace OCIO_NAMESPACE
+{
+
+void applyACES2RGBToJMhAVX512(const ACES2::JMhParams & p, const float * src, float * dst, long numPixels);
+void applyACES2JMhToRGBAVX512(const ACES2::JMhParams & p, const float * src, float * dst, long numPixels);
+
+void applyACES2TonescaleCompressFwdAVX512(const ACES2::JMhParams & p,
+                                          const ACES2::ToneScaleParams & t,
+                                          const ACES2::SharedCompressionParameters & s,
+                                          const ACES2::ChromaCompressParams & c,
+                                          const float * src, float * dst, long numPixels);
+void applyACES2TonescaleCompressInvAVX512(const ACES2::JMhParams & p,
+                                          const ACES2::ToneScaleParams & t,
+                                          const ACES2::SharedCompressionParameters & s,
+                                          const ACES2::ChromaCompressParams & c,
+                                          const float * src, float * dst, long numPixels);
+
+void applyACES2OutputTransformFwdAVX512(const ACES2::JMhParams & pIn,
+                                        const ACES2::JMhParams & pOut,
+                                        const ACES2::ToneScaleParams & t,
+                                        const ACES2::SharedCompressionParameters & s,
+                                        const ACES2::ChromaCompressParams & c,
+                                        const ACES2::GamutCompressParams & g,
+                                        const float * src, float * dst, long numPixels);
+void applyACES2OutputTransformInvAVX512(const ACES2::JMhParams & pIn,
+                                        const ACES2::JMhParams & pOut,
+                                        const ACES2::ToneScaleParams & t,
+                                        const ACES2::SharedCompressionParameters & s,
+                                        const ACES2::ChromaCompressParams & c,
+                                        const ACES2::GamutCompressParams & g,
+                                        const float * src, float * dst, long numPixels);
+
+} // namespace OCIO_NAMESPACE
+
+#endif // OCIO_USE_AVX512
+
+#endif /* INCLUDED_OCIO_FIXEDFUNCTIONOP_CPU_AVX512_H */
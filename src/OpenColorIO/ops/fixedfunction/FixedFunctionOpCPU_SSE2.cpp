@@ -0,0 +1,66 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#include "ops/fixedfunction/FixedFunctionOpCPU_SSE2.h"
+#if OCIO_USE_SSE2
+
+#include "ops/fixedfunction/ACES2/TransformSIMD.h"
+#include "SSE.h"
+#include "SSE2.h"
+
+namespace OCIO_NAMESPACE
+{
+
+void applyACES2RGBToJMhSSE2(const ACES2::JMhParams & p, const float * src, float * dst, long numPixels)
+{
+    ACES2::SIMD::apply_RGB_to_JMh<VecSSE2>(p, src, dst, numPixels);
+}
+
+void applyACES2JMhToRGBSSE2(const ACES2::JMhParams & p, const float * src, float * dst, long numPixels)
+{
+    ACES2::SIMD::apply_JMh_to_RGB<VecSSE2>(p, src, dst, numPixels);
+}
+
+void applyACES2TonescaleCompressFwdSSE2(const ACES2::JMhParams & p,
+                                        const ACES2::ToneScaleParams & t,
+                                        const ACES2::SharedCompressionParameters & s,
+                                        const ACES2::ChromaCompressParams & c,
+                                        const float * src, float * dst, long numPixels)
+{
+    ACES2::SIMD::apply_tonescale_compress<VecSSE2, false>(p, t, s, c, src, dst, numPixels);
+}
+
+void applyACES2TonescaleCompressInvSSE2(const ACES2::JMhParams & p,
+                                        const ACES2::ToneScaleParams & t,
+                                        const ACES2::SharedCompressionParameters & s,
+                                        const ACES2::ChromaCompressParams & c,
+                                        const float * src, float * dst, long numPixels)
+{
+    ACES2::SIMD::apply_tonescale_compress<VecSSE2, true>(p, t, s, c, src, dst, numPixels);
+}
+
+void applyACES2OutputTransformFwdSSE2(const ACES2::JMhParams & pIn,
+                                      const ACES2::JMhParams & pOut,
+                                      const ACES2::ToneScaleParams & t,
+                                      const ACES2::SharedCompressionParameters & s,
+                                      const ACES2::ChromaCompressParams & c,
+                                      const ACES2::GamutCompressParams & g,
+                                      const float * src, float * dst, long numPixels)
+{
+    ACES2::SIMD::apply_output_transform_fwd<VecSSE2>(pIn, pOut, t, s, c, g, src, dst, numPixels);
+}
+
+void applyACES2OutputTransformInvSSE2(const ACES2::JMhParams & pIn,
+                                      const ACES2::JMhParams & pOut,
+                                      const ACES2::ToneScaleParams & t,
+                                      const ACES2::SharedCompressionParameters & s,
+                                      const ACES2::ChromaCompressParams & c,
+                                      const ACES2::GamutCompressParams & g,
+                                      const float * src, float * dst, long numPixels)
+{
+    ACES2::SIMD::apply_output_transform_inv<VecSSE2>(pIn, pOut, t, s, c, g, src, dst, numPixels);
+}
+
+} // OCIO_NAMESPACE
+
+#endif // OCIO_USE_SSE2
@@ -0,0 +1,49 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#ifndef INCLUDED_OCIO_FIXEDFUNCTIONOP_CPU_SSE2_H
+#define INCLUDED_OCIO_FIXEDFUNCTIONOP_CPU_SSE2_H
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "CPUInfo.h"
+#include "ops/fixedfunction/ACES2/Common.h"
+
+#if OCIO_USE_SSE2
+namespace OCIO_NAMESPACE
+{
+
+void applyACES2RGBToJMhSSE2(const ACES2::JMhParams & p, const float * src, float * dst, long numPixels);
+void applyACES2JMhToRGBSSE2(const ACES2::JMhParams & p, const float * src, float * dst, long numPixels);
+
+void applyACES2TonescaleCompressFwdSSE2(const ACES2::JMhParams & p,
+                                        const ACES2::ToneScaleParams & t,
+                                        const ACES2::SharedCompressionParameters & s,
+                                        const ACES2::ChromaCompressParams & c,
+                                        const float * src, float * dst, long numPixels);
+void applyACES2TonescaleCompressInvSSE2(const ACES2::JMhParams & p,
+                                        const ACES2::ToneScaleParams & t,
+                                        const ACES2::SharedCompressionParameters & s,
+                                        const ACES2::ChromaCompressParams & c,
+                                        const float * src, float * dst, long numPixels);
+
+void applyACES2OutputTransformFwdSSE2(const ACES2::JMhParams & pIn,
+                                      const ACES2::JMhParams & pOut,
+                                      const ACES2::ToneScaleParams & t,
+                                      const ACES2::SharedCompressionParameters & s,
+                                      const ACES2::ChromaCompressParams & c,
+                                      const ACES2::GamutCompressParams & g,
+                                      const float * src, float * dst, long numPixels);
+void applyACES2OutputTransformInvSSE2(const ACES2::JMhParams & pIn,
+                                      const ACES2::JMhParams & pOut,
+                                      const ACES2::ToneScaleParams & t,
+                                      const ACES2::SharedCompressionParameters & s,
+                                      const ACES2::ChromaCompressParams & c,
+                                      const ACES2::GamutCompressParams & g,
+                                      const float * src, float * dst, long numPixels);
+
+} // namespace OCIO_NAMESPACE
+
+#endif // OCIO_USE_SSE2
+
+#endif /* INCLUDED_OCIO_FIXEDFUNCTIONOP_CPU_SSE2_H */
@@ -1298,13 +1298,15 @@ void Add_ACES_OutputTransform_Fwd_Shader(
         {white_x, white_y}
     };
 
-    const ACES2::JMhParams pIn = ACES2::init_JMhParams(ACES_AP0::primaries);
-    const ACES2::JMhParams pLim = ACES2::init_JMhParams(lim_primaries);
-    const ACES2::ToneScaleParams t = ACES2::init_ToneScaleParams(peak_luminance);
-    const ACES2::JMhParams reachGamut = ACES2::init_JMhParams(ACES_AP1::primaries);
-    const ACES2::SharedCompressionParameters s = ACES2::init_SharedCompressionParams(peak_luminance, pIn, reachGamut);
-    const ACES2::ChromaCompressParams c = ACES2::init_ChromaCompressParams(peak_luminance, t);
-    const ACES2::GamutCompressParams g = ACES2::init_GamutCompressParams(peak_luminance, pIn, pLim, t, s, reachGamut);
+    const ACES2::ConstOutputTransformParamsRcPtr sharedParams
+        = ACES2::GetOutputTransformParams(peak_luminance, lim_primaries);
+
+    const ACES2::JMhParams & pIn = sharedParams->inputJMhParams;
+    const ACES2::JMhParams & pLim = sharedParams->limitJMhParams;
+    const ACES2::ToneScaleParams & t = sharedParams->tsParams;
+    const ACES2::SharedCompressionParameters & s = sharedParams->shParams;
+    const ACES2::ChromaCompressParams & c = sharedParams->ccParams;
+    const ACES2::GamutCompressParams & g = sharedParams->gcParams;
 
     unsigned resourceIndex = shaderCreator->getNextResourceIndex();
 
@@ -1379,13 +1381,15 @@ void Add_ACES_OutputTransform_Inv_Shader(
         {white_x, white_y}
     };
 
-    const ACES2::JMhParams pIn = ACES2::init_JMhParams(ACES_AP0::primaries);
-    const ACES2::JMhParams pLim = ACES2::init_JMhParams(lim_primaries);
-    const ACES2::ToneScaleParams t = ACES2::init_ToneScaleParams(peak_luminance);
-    const ACES2::JMhParams reachGamut = ACES2::init_JMhParams(ACES_AP1::primaries);
-    const ACES2::SharedCompressionParameters s = ACES2::init_SharedCompressionParams(peak_luminance, pIn, reachGamut);
-    const ACES2::ChromaCompressParams c = ACES2::init_ChromaCompressParams(peak_luminance, t);
-    const ACES2::GamutCompressParams g = ACES2::init_GamutCompressParams(peak_luminance, pIn, pLim, t, s, reachGamut);
+    const ACES2::ConstOutputTransformParamsRcPtr sharedParams
+        = ACES2::GetOutputTransformParams(peak_luminance, lim_primaries);
+
+    const ACES2::JMhParams & pIn = sharedParams->inputJMhParams;
+    const ACES2::JMhParams & pLim = sharedParams->limitJMhParams;
+    const ACES2::ToneScaleParams & t = sharedParams->tsParams;
+    const ACES2::SharedCompressionParameters & s = sharedParams->shParams;
+    const ACES2::ChromaCompressParams & c = sharedParams->ccParams;
+    const ACES2::GamutCompressParams & g = sharedParams->gcParams;
 
     unsigned resourceIndex = shaderCreator->getNextResourceIndex();
     const std::string pxl(shaderCreator->getPixelName());
@@ -1489,11 +1493,13 @@ void Add_Tonescale_Compress_Fwd_Shader(
 {
     const float peak_luminance = (float) params[0];
 
-    const ACES2::JMhParams p = ACES2::init_JMhParams(ACES_AP0::primaries);
-    const ACES2::ToneScaleParams t = ACES2::init_ToneScaleParams(peak_luminance);
-    const ACES2::JMhParams reachGamut = ACES2::init_JMhParams(ACES_AP1::primaries);
-    const ACES2::SharedCompressionParameters s = ACES2::init_SharedCompressionParams(peak_luminance, p, reachGamut);
-    const ACES2::ChromaCompressParams c = ACES2::init_ChromaCompressParams(peak_luminance, t);
+    const ACES2::ConstToneScaleCompressParamsRcPtr sharedParams
+        = ACES2::GetToneScaleCompressParams(peak_luminance);
+
+    const ACES2::JMhParams & p = sharedParams->inputJMhParams;
+    const ACES2::ToneScaleParams & t = sharedParams->tsParams;
+    const ACES2::SharedCompressionParameters & s = sharedParams->shParams;
+    const ACES2::ChromaCompressParams & c = sharedParams->ccParams;
 
     unsigned resourceIndex = shaderCreator->getNextResourceIndex();
     const std::string pxl(shaderCreator->getPixelName());
@@ -1517,11 +1523,13 @@ void Add_Tonescale_Compress_Inv_Shader(
 {
     const float peak_luminance = (float) params[0];
 
-    const ACES2::JMhParams p = ACES2::init_JMhParams(ACES_AP0::primaries);
-    const ACES2::ToneScaleParams t = ACES2::init_ToneScaleParams(peak_luminance);
-    const ACES2::JMhParams reachGamut = ACES2::init_JMhParams(ACES_AP1::primaries);
-    const ACES2::SharedCompressionParameters s = ACES2::init_SharedCompressionParams(peak_luminance, p, reachGamut);
-    const ACES2::ChromaCompressParams c = ACES2::init_ChromaCompressParams(peak_luminance, t);
+    const ACES2::ConstToneScaleCompressParamsRcPtr sharedParams
+        = ACES2::GetToneScaleCompressParams(peak_luminance);
+
+    const ACES2::JMhParams & p = sharedParams->inputJMhParams;
+    const ACES2::ToneScaleParams & t = sharedParams->tsParams;
+    const ACES2::SharedCompressionParameters & s = sharedParams->shParams;
+    const ACES2::ChromaCompressParams & c = sharedParams->ccParams;
 
     unsigned resourceIndex = shaderCreator->getNextResourceIndex();
     const std::string pxl(shaderCreator->getPixelName());
@@ -1561,12 +1569,11 @@ void Add_Gamut_Compress_Fwd_Shader(
         {white_x, white_y}
     };
 
-    const ACES2::JMhParams pIn = ACES2::init_JMhParams(ACES_AP0::primaries);
-    const ACES2::JMhParams pLim = ACES2::init_JMhParams(primaries);
-    const ACES2::ToneScaleParams t = ACES2::init_ToneScaleParams(peak_luminance);
-    const ACES2::JMhParams reachGamut = ACES2::init_JMhParams(ACES_AP1::primaries);
-    const ACES2::SharedCompressionParameters s = ACES2::init_SharedCompressionParams(peak_luminance, pIn, reachGamut);
-    const ACES2::GamutCompressParams g = ACES2::init_GamutCompressParams(peak_luminance, pIn, pLim, t, s, reachGamut); 
+    const ACES2::ConstOutputTransformParamsRcPtr sharedParams
+        = ACES2::GetOutputTransformParams(peak_luminance, primaries);
+
+    const ACES2::SharedCompressionParameters & s = sharedParams->shParams;
+    const ACES2::GamutCompressParams & g = sharedParams->gcParams;
 
     unsigned resourceIndex = shaderCreator->getNextResourceIndex();
     const std::string pxl(shaderCreator->getPixelName());
@@ -1604,12 +1611,11 @@ void Add_Gamut_Compress_Inv_Shader(
         {white_x, white_y}
     };
 
-    const ACES2::JMhParams pIn = ACES2::init_JMhParams(ACES_AP0::primaries);
-    const ACES2::JMhParams pLim = ACES2::init_JMhParams(primaries);
-    const ACES2::ToneScaleParams t = ACES2::init_ToneScaleParams(peak_luminance);
-    const ACES2::JMhParams reachGamut = ACES2::init_JMhParams(ACES_AP1::primaries);
-    const ACES2::SharedCompressionParameters s = ACES2::init_SharedCompressionParams(peak_luminance, pIn, reachGamut);
-    const ACES2::GamutCompressParams g = ACES2::init_GamutCompressParams(peak_luminance, pIn, pLim, t, s, reachGamut);
+    const ACES2::ConstOutputTransformParamsRcPtr sharedParams
+        = ACES2::GetOutputTransformParams(peak_luminance, primaries);
+
+    const ACES2::SharedCompressionParameters & s = sharedParams->shParams;
+    const ACES2::GamutCompressParams & g = sharedParams->gcParams;
 
     unsigned resourceIndex = shaderCreator->getNextResourceIndex();
     const std::string pxl(shaderCreator->getPixelName());
@@ -10,13 +10,22 @@
 #include "BitDepthUtils.h"
 #include "MathUtils.h"
 #include "ops/gradingprimary/GradingPrimaryOpCPU.h"
+#include "ops/gradingprimary/GradingPrimaryOpCPU_SSE2.h"
+#include "ops/gradingprimary/GradingPrimaryOpCPU_AVX2.h"
+#include "ops/gradingprimary/GradingPrimaryOpCPU_AVX512.h"
 #include "SSE.h"
+#include "CPUInfo.h"
 
 namespace OCIO_NAMESPACE
 {
 
 namespace
 {
+
+typedef void (GradingPrimary_func)(GradingStyle style, TransformDirection dir,
+                                   const GradingPrimary & v, const GradingPrimaryPreRender & comp,
+                                   const float * src, float * dst, long numPixels);
+
 class GradingPrimaryOpCPU : public OpCPU
 {
 public:
@@ -30,17 +39,61 @@ public:
     DynamicPropertyRcPtr getDynamicProperty(DynamicPropertyType type) const override;
 
 protected:
+    // Process the pixels using the SIMD version (when available) processing several pixels at
+    // once. Returns false if the pixels still need to be processed.
+    bool applySIMD(const void * inImg, void * outImg, long numPixels) const;
+
     DynamicPropertyGradingPrimaryImplRcPtr m_gp;
+
+private:
+    GradingStyle m_style;
+    TransformDirection m_direction;
+    GradingPrimary_func * m_applyFunc;
 };
 
 GradingPrimaryOpCPU::GradingPrimaryOpCPU(ConstGradingPrimaryOpDataRcPtr & gp)
-    : OpCPU()
+    :   OpCPU()
+    ,   m_style(gp->getStyle())
+    ,   m_direction(gp->getDirection())
+    ,   m_applyFunc(nullptr)
 {
     m_gp = gp->getDynamicPropertyInternal();
     if (m_gp->isDynamic())
     {
         m_gp = m_gp->createEditableCopy();
     }
+
+#if OCIO_USE_SSE2
+    if (CPUInfo::instance().hasSSE2())
+    {
+        m_applyFunc = applyGradingPrimarySSE2;
+    }
+#endif
+
+#if OCIO_USE_AVX2
+    if (CPUInfo::instance().hasAVX2())
+    {
+        m_applyFunc = applyGradingPrimaryAVX2;
+    }
+#endif
+
+#if OCIO_USE_AVX512
+    if (CPUInfo::instance().hasAVX512())
+    {
+        m_applyFunc = applyGradingPrimaryAVX512;
+    }
+#endif
+}
+
+bool GradingPrimaryOpCPU::applySIMD(const void * inImg, void * outImg, long numPixels) const
+{
+    if (m_applyFunc && numPixels > 1)
+    {
+        m_applyFunc(m_style, m_direction, m_gp->getValue(), m_gp->getComputedValue(),
+                    (const float *)inImg, (float *)outImg, numPixels);
+        return true;
+    }
+    return false;
 }
 
 bool GradingPrimaryOpCPU::isDynamic() const
@@ -267,6 +320,11 @@ void GradingPrimaryLogFwdOpCPU::apply(const void * inImg, void * outImg, long nu
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
@@ -446,6 +504,11 @@ void GradingPrimaryLogRevOpCPU::apply(const void * inImg, void * outImg, long nu
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
@@ -620,6 +683,11 @@ void GradingPrimaryLinFwdOpCPU::apply(const void * inImg, void * outImg, long nu
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
@@ -794,6 +862,11 @@ void GradingPrimaryLinRevOpCPU::apply(const void * inImg, void * outImg, long nu
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
@@ -962,6 +1035,11 @@ void GradingPrimaryVidFwdOpCPU::apply(const void * inImg, void * outImg, long nu
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
@@ -1142,6 +1220,11 @@ void GradingPrimaryVidRevOpCPU::apply(const void * inImg, void * outImg, long nu
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
@@ -0,0 +1,24 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#include "ops/gradingprimary/GradingPrimaryOpCPU_AVX2.h"
+#if OCIO_USE_AVX2
+
+#include <immintrin.h>
+
+#include "AVX2.h"
+#include "ops/gradingprimary/GradingPrimarySIMD.h"
+
+namespace OCIO_NAMESPACE
+{
+
+void applyGradingPrimaryAVX2(GradingStyle style, TransformDirection dir,
+                             const GradingPrimary & v, const GradingPrimaryPreRender & comp,
+                             const float * src, float * dst, long numPixels)
+{
+    GradingPrimarySIMD::Apply<VecAVX2>(style, dir, v, comp, src, dst, numPixels);
+}
+
+} // OCIO_NAMESPACE
+
+#endif // OCIO_USE_AVX2
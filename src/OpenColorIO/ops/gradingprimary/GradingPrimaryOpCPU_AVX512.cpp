@@ -0,0 +1,24 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#include "ops/gradingprimary/GradingPrimaryOpCPU_AVX512.h"
+#if OCIO_USE_AVX512
+
+#include <immintrin.h>
+
+#include "AVX512.h"
+#include "ops/gradingprimary/GradingPrimarySIMD.h"
+
+namespace OCIO_NAMESPACE
+{
+
+void applyGradingPrimaryAVX512(GradingStyle style, TransformDirection dir,
+                               const GradingPrimary & v, const GradingPrimaryPreRender & comp,
+                               const float * src, float * dst, long numPixels)
+{
+    GradingPrimarySIMD::Apply<VecAVX512>(style, dir, v, comp, src, dst, numPixels);
+}
+
+} // OCIO_NAMESPACE
+
+#endif // OCIO_USE_AVX512
@@ -0,0 +1,22 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#include "ops/gradingprimary/GradingPrimaryOpCPU_SSE2.h"
+#if OCIO_USE_SSE2
+
+#include "SSE2.h"
+#include "ops/gradingprimary/GradingPrimarySIMD.h"
+
+namespace OCIO_NAMESPACE
+{
+
+void applyGradingPrimarySSE2(GradingStyle style, TransformDirection dir,
+                             const GradingPrimary & v, const GradingPrimaryPreRender & comp,
+                             const float * src, float * dst, long numPixels)
+{
+    GradingPrimarySIMD::Apply<VecSSE2>(style, dir, v, comp, src, dst, numPixels);
+}
+
+} // OCIO_NAMESPACE
+
+#endif // OCIO_USE_SSE2
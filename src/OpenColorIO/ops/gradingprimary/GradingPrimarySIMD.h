@@ -0,0 +1,272 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#ifndef INCLUDED_OCIO_GRADINGPRIMARYSIMD_H
+#define INCLUDED_OCIO_GRADINGPRIMARYSIMD_H
+
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "ops/gradingprimary/GradingPrimary.h"
+#include "SIMDUtils.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+// Vectorized version of the GradingPrimary renderers (refer to GradingPrimaryOpCPU.cpp) shared
+// by the SSE2, AVX2 and AVX-512 versions. The pixels are processed V::N at a time with one
+// register per channel (instead of one pixel per register) so the per-channel values are
+// broadcast once per call.
+
+namespace GradingPrimarySIMD
+{
+
+template<typename V>
+struct Channels
+{
+    typedef typename V::vec vec;
+
+    explicit Channels(const Float3 & values)
+        :   m_r(V::set1(values[0]))
+        ,   m_g(V::set1(values[1]))
+        ,   m_b(V::set1(values[2]))
+    {
+    }
+
+    vec m_r;
+    vec m_g;
+    vec m_b;
+};
+
+template<typename V>
+inline void ApplyOffset(typename V::vec & r, typename V::vec & g, typename V::vec & b,
+                        const Channels<V> & offset)
+{
+    r = V::add(r, offset.m_r);
+    g = V::add(g, offset.m_g);
+    b = V::add(b, offset.m_b);
+}
+
+template<typename V>
+inline void ApplySlope(typename V::vec & r, typename V::vec & g, typename V::vec & b,
+                       const Channels<V> & slope)
+{
+    r = V::mul(r, slope.m_r);
+    g = V::mul(g, slope.m_g);
+    b = V::mul(b, slope.m_b);
+}
+
+template<typename V>
+inline typename V::vec Contrast(typename V::vec pix,
+                                typename V::vec contrast,
+                                typename V::vec pivot)
+{
+    return V::add(V::mul(V::sub(pix, pivot), contrast), pivot);
+}
+
+template<typename V>
+inline void ApplyContrast(typename V::vec & r, typename V::vec & g, typename V::vec & b,
+                          const Channels<V> & contrast, typename V::vec pivot)
+{
+    r = Contrast<V>(r, contrast.m_r, pivot);
+    g = Contrast<V>(g, contrast.m_g, pivot);
+    b = Contrast<V>(b, contrast.m_b, pivot);
+}
+
+template<typename V>
+inline typename V::vec LinContrast(typename V::vec pix,
+                                   typename V::vec contrast,
+                                   typename V::vec pivot)
+{
+    pix = V::div(pix, pivot);
+    return V::copysign(V::mul(V::pow(V::abs(pix), contrast), pivot), pix);
+}
+
+template<typename V>
+inline void ApplyLinContrast(typename V::vec & r, typename V::vec & g, typename V::vec & b,
+                             const Channels<V> & contrast, typename V::vec pivot)
+{
+    r = LinContrast<V>(r, contrast.m_r, pivot);
+    g = LinContrast<V>(g, contrast.m_g, pivot);
+    b = LinContrast<V>(b, contrast.m_b, pivot);
+}
+
+template<typename V>
+inline typename V::vec Gamma(typename V::vec pix,
+                             typename V::vec gamma,
+                             typename V::vec blackPivot,
+                             typename V::vec range)
+{
+    pix = V::sub(pix, blackPivot);
+    const typename V::vec res = V::pow(V::div(V::abs(pix), range), gamma);
+    return V::add(V::mul(V::copysign(res, pix), range), blackPivot);
+}
+
+template<typename V>
+inline void ApplyGamma(typename V::vec & r, typename V::vec & g, typename V::vec & b,
+                       const Channels<V> & gamma, typename V::vec blackPivot, typename V::vec range)
+{
+    r = Gamma<V>(r, gamma.m_r, blackPivot, range);
+    g = Gamma<V>(g, gamma.m_g, blackPivot, range);
+    b = Gamma<V>(b, gamma.m_b, blackPivot, range);
+}
+
+template<typename V>
+inline void ApplySaturation(typename V::vec & r, typename V::vec & g, typename V::vec & b,
+                            typename V::vec saturation)
+{
+    const typename V::vec luma = V::add(V::add(V::mul(r, V::set1(0.2126f)),
+                                               V::mul(g, V::set1(0.7152f))),
+                                        V::mul(b, V::set1(0.0722f)));
+
+    r = V::add(luma, V::mul(saturation, V::sub(r, luma)));
+    g = V::add(luma, V::mul(saturation, V::sub(g, luma)));
+    b = V::add(luma, V::mul(saturation, V::sub(b, luma)));
+}
+
+template<typename V>
+inline void ApplyClamp(typename V::vec & r, typename V::vec & g, typename V::vec & b,
+                       typename V::vec clampBlack, typename V::vec clampWhite)
+{
+    r = V::min(V::max(r, clampBlack), clampWhite);
+    g = V::min(V::max(g, clampBlack), clampWhite);
+    b = V::min(V::max(b, clampBlack), clampWhite);
+}
+
+// Apply the GradingPrimary op using the same steps as the scalar renderers. Note that the
+// computed values (i.e. 'comp') are already inverted for the inverse direction.
+template<typename V>
+void Apply(GradingStyle style, TransformDirection dir,
+           const GradingPrimary & v, const GradingPrimaryPreRender & comp,
+           const float * src, float * dst, long numPixels)
+{
+    typedef typename V::vec vec;
+
+    const vec pivot      = V::set1(static_cast<float>(comp.getPivot()));
+    const vec blackPivot = V::set1(static_cast<float>(v.m_pivotBlack));
+    const vec whitePivot = V::set1(static_cast<float>(v.m_pivotWhite));
+    const vec range      = V::sub(whitePivot, blackPivot);
+    const vec clampBlack = V::set1(static_cast<float>(v.m_clampBlack));
+    const vec clampWhite = V::set1(static_cast<float>(v.m_clampWhite));
+
+    const Channels<V> contrast(comp.getContrast());
+    const Channels<V> gamma(comp.getGamma());
+
+    // Note that the gamma & the contrast use the same identity flag.
+    const bool applyPower = !comp.isGammaIdentity();
+
+    if (dir == TRANSFORM_DIR_FORWARD)
+    {
+        const bool applySat = v.m_saturation != 1.;
+        const vec saturation = V::set1(static_cast<float>(v.m_saturation));
+
+        switch (style)
+        {
+        case GRADING_LOG:
+        {
+            const Channels<V> brightness(comp.getBrightness());
+
+            ApplySIMDKernel<V>(src, dst, numPixels, [&](vec & r, vec & g, vec & b)
+            {
+                ApplyOffset<V>(r, g, b, brightness);
+                ApplyContrast<V>(r, g, b, contrast, pivot);
+                if (applyPower) ApplyGamma<V>(r, g, b, gamma, blackPivot, range);
+                if (applySat) ApplySaturation<V>(r, g, b, saturation);
+                ApplyClamp<V>(r, g, b, clampBlack, clampWhite);
+            });
+            break;
+        }
+        case GRADING_LIN:
+        {
+            const Channels<V> offset(comp.getOffset());
+            const Channels<V> exposure(comp.getExposure());
+
+            ApplySIMDKernel<V>(src, dst, numPixels, [&](vec & r, vec & g, vec & b)
+            {
+                ApplyOffset<V>(r, g, b, offset);
+                ApplySlope<V>(r, g, b, exposure);
+                if (applyPower) ApplyLinContrast<V>(r, g, b, contrast, pivot);
+                if (applySat) ApplySaturation<V>(r, g, b, saturation);
+                ApplyClamp<V>(r, g, b, clampBlack, clampWhite);
+            });
+            break;
+        }
+        case GRADING_VIDEO:
+        {
+            const Channels<V> offset(comp.getOffset());
+            const Channels<V> slope(comp.getSlope());
+
+            ApplySIMDKernel<V>(src, dst, numPixels, [&](vec & r, vec & g, vec & b)
+            {
+                ApplyOffset<V>(r, g, b, offset);
+                ApplyContrast<V>(r, g, b, slope, blackPivot);
+                if (applyPower) ApplyGamma<V>(r, g, b, gamma, blackPivot, range);
+                if (applySat) ApplySaturation<V>(r, g, b, saturation);
+                ApplyClamp<V>(r, g, b, clampBlack, clampWhite);
+            });
+            break;
+        }
+        }
+    }
+    else
+    {
+        const bool applySat = v.m_saturation != 1. && v.m_saturation != 0.;
+        const vec satInv = V::set1(applySat ? static_cast<float>(1. / v.m_saturation) : 1.f);
+
+        switch (style)
+        {
+        case GRADING_LOG:
+        {
+            const Channels<V> brightness(comp.getBrightness());
+
+            ApplySIMDKernel<V>(src, dst, numPixels, [&](vec & r, vec & g, vec & b)
+            {
+                ApplyClamp<V>(r, g, b, clampBlack, clampWhite);
+                if (applySat) ApplySaturation<V>(r, g, b, satInv);
+                if (applyPower) ApplyGamma<V>(r, g, b, gamma, blackPivot, range);
+                ApplyContrast<V>(r, g, b, contrast, pivot);
+                ApplyOffset<V>(r, g, b, brightness);
+            });
+            break;
+        }
+        case GRADING_LIN:
+        {
+            const Channels<V> offset(comp.getOffset());
+            const Channels<V> exposure(comp.getExposure());
+
+            ApplySIMDKernel<V>(src, dst, numPixels, [&](vec & r, vec & g, vec & b)
+            {
+                ApplyClamp<V>(r, g, b, clampBlack, clampWhite);
+                if (applySat) ApplySaturation<V>(r, g, b, satInv);
+                if (applyPower) ApplyLinContrast<V>(r, g, b, contrast, pivot);
+                ApplySlope<V>(r, g, b, exposure);
+                ApplyOffset<V>(r, g, b, offset);
+            });
+            break;
+        }
+        case GRADING_VIDEO:
+        {
+            const Channels<V> offset(comp.getOffset());
+            const Channels<V> slope(comp.getSlope());
+
+            ApplySIMDKernel<V>(src, dst, numPixels, [&](vec & r, vec & g, vec & b)
+            {
+                ApplyClamp<V>(r, g, b, clampBlack, clampWhite);
+                if (applySat) ApplySaturation<V>(r, g, b, satInv);
+                if (applyPower) ApplyGamma<V>(r, g, b, gamma, blackPivot, range);
+                ApplyContrast<V>(r, g, b, slope, blackPivot);
+                ApplyOffset<V>(r, g, b, offset);
+            });
+            break;
+        }
+        }
+    }
+}
+
+} // namespace GradingPrimarySIMD
+
+} // namespace OCIO_NAMESPACE
+
+#endif // INCLUDED_OCIO_GRADINGPRIMARYSIMD_H
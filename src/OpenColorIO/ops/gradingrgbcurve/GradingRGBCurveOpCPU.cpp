@@ -10,13 +10,22 @@
 #include "BitDepthUtils.h"
 #include "MathUtils.h"
 #include "ops/gradingrgbcurve/GradingRGBCurveOpCPU.h"
+#include "ops/gradingrgbcurve/GradingRGBCurveOpCPU_SSE2.h"
+#include "ops/gradingrgbcurve/GradingRGBCurveOpCPU_AVX2.h"
+#include "ops/gradingrgbcurve/GradingRGBCurveOpCPU_AVX512.h"
 #include "SSE.h"
+#include "CPUInfo.h"
 
 namespace OCIO_NAMESPACE
 {
 
 namespace
 {
+
+typedef void (GradingRGBCurve_func)(bool linToLog, TransformDirection dir,
+                                    const GradingBSplineCurveImpl::KnotsCoefs & knotsCoefs,
+                                    const float * src, float * dst, long numPixels);
+
 class GradingRGBCurveOpCPU : public OpCPU
 {
 public:
@@ -52,17 +61,61 @@ protected:
         out[2] = knotsCoefs.evalCurveRev(static_cast<int>(RGB_BLUE), out[2]);
     }
 
+    // Process the pixels using the SIMD version (when available) processing several pixels at
+    // once. Returns false if the pixels still need to be processed.
+    bool applySIMD(const void * inImg, void * outImg, long numPixels) const;
+
     DynamicPropertyGradingRGBCurveImplRcPtr m_grgbcurve;
+
+private:
+    bool m_linToLog;
+    TransformDirection m_direction;
+    GradingRGBCurve_func * m_applyFunc;
 };
 
 GradingRGBCurveOpCPU::GradingRGBCurveOpCPU(ConstGradingRGBCurveOpDataRcPtr & grgbc)
-    : OpCPU()
+    :   OpCPU()
+    ,   m_linToLog((grgbc->getStyle() == GRADING_LIN) && !grgbc->getBypassLinToLog())
+    ,   m_direction(grgbc->getDirection())
+    ,   m_applyFunc(nullptr)
 {
     m_grgbcurve = grgbc->getDynamicPropertyInternal();
     if (m_grgbcurve->isDynamic())
     {
         m_grgbcurve = m_grgbcurve->createEditableCopy();
     }
+
+#if OCIO_USE_SSE2
+    if (CPUInfo::instance().hasSSE2())
+    {
+        m_applyFunc = applyGradingRGBCurveSSE2;
+    }
+#endif
+
+#if OCIO_USE_AVX2
+    if (CPUInfo::instance().hasAVX2())
+    {
+        m_applyFunc = applyGradingRGBCurveAVX2;
+    }
+#endif
+
+#if OCIO_USE_AVX512
+    if (CPUInfo::instance().hasAVX512())
+    {
+        m_applyFunc = applyGradingRGBCurveAVX512;
+    }
+#endif
+}
+
+bool GradingRGBCurveOpCPU::applySIMD(const void * inImg, void * outImg, long numPixels) const
+{
+    if (m_applyFunc && numPixels > 1)
+    {
+        m_applyFunc(m_linToLog, m_direction, m_grgbcurve->getKnotsCoefs(),
+                    (const float *)inImg, (float *)outImg, numPixels);
+        return true;
+    }
+    return false;
 }
 
 bool GradingRGBCurveOpCPU::isDynamic() const
@@ -126,6 +179,11 @@ void GradingRGBCurveFwdOpCPU::apply(const void * inImg, void * outImg, long numP
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
@@ -251,6 +309,11 @@ void GradingRGBCurveLinearFwdOpCPU::apply(const void * inImg, void * outImg, lon
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
@@ -296,6 +359,11 @@ void GradingRGBCurveRevOpCPU::apply(const void * inImg, void * outImg, long numP
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
@@ -336,6 +404,11 @@ void GradingRGBCurveLinearRevOpCPU::apply(const void * inImg, void * outImg, lon
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
@@ -0,0 +1,24 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#include "ops/gradingrgbcurve/GradingRGBCurveOpCPU_AVX2.h"
+#if OCIO_USE_AVX2
+
+#include <immintrin.h>
+
+#include "AVX2.h"
+#include "ops/gradingrgbcurve/GradingRGBCurveSIMD.h"
+
+namespace OCIO_NAMESPACE
+{
+
+void applyGradingRGBCurveAVX2(bool linToLog, TransformDirection dir,
+                              const GradingBSplineCurveImpl::KnotsCoefs & knotsCoefs,
+                              const float * src, float * dst, long numPixels)
+{
+    GradingRGBCurveSIMD::Apply<VecAVX2>(linToLog, dir, knotsCoefs, src, dst, numPixels);
+}
+
+} // OCIO_NAMESPACE
+
+#endif // OCIO_USE_AVX2
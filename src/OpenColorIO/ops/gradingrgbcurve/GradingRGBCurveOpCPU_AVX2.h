@@ -0,0 +1,24 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#ifndef INCLUDED_OCIO_GRADINGRGBCURVEOP_CPU_AVX2_H
+#define INCLUDED_OCIO_GRADINGRGBCURVEOP_CPU_AVX2_H
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "CPUInfo.h"
+#include "ops/gradingrgbcurve/GradingBSplineCurve.h"
+
+#if OCIO_USE_AVX2
+namespace OCIO_NAMESPACE
+{
+
+void applyGradingRGBCurveAVX2(bool linToLog, TransformDirection dir,
+                              const GradingBSplineCurveImpl::KnotsCoefs & knotsCoefs,
+                              const float * src, float * dst, long numPixels);
+
+} // namespace OCIO_NAMESPACE
+
+#endif // OCIO_USE_AVX2
+
+#endif /* INCLUDED_OCIO_GRADINGRGBCURVEOP_CPU_AVX2_H */
@@ -0,0 +1,24 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#include "ops/gradingrgbcurve/GradingRGBCurveOpCPU_AVX512.h"
+#if OCIO_USE_AVX512
+
+#include <immintrin.h>
+
+#include "AVX512.h"
+#include "ops/gradingrgbcurve/GradingRGBCurveSIMD.h"
+
+namespace OCIO_NAMESPACE
+{
+
+void applyGradingRGBCurveAVX512(bool linToLog, TransformDirection dir,
+                                const GradingBSplineCurveImpl::KnotsCoefs & knotsCoefs,
+                                const float * src, float * dst, long numPixels)
+{
+    GradingRGBCurveSIMD::Apply<VecAVX512>(linToLog, dir, knotsCoefs, src, dst, numPixels);
+}
+
+} // OCIO_NAMESPACE
+
+#endif // OCIO_USE_AVX512
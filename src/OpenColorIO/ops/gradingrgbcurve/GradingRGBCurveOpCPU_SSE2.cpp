@@ -0,0 +1,22 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#include "ops/gradingrgbcurve/GradingRGBCurveOpCPU_SSE2.h"
+#if OCIO_USE_SSE2
+
+#include "SSE2.h"
+#include "ops/gradingrgbcurve/GradingRGBCurveSIMD.h"
+
+namespace OCIO_NAMESPACE
+{
+
+void applyGradingRGBCurveSSE2(bool linToLog, TransformDirection dir,
+                              const GradingBSplineCurveImpl::KnotsCoefs & knotsCoefs,
+                              const float * src, float * dst, long numPixels)
+{
+    GradingRGBCurveSIMD::Apply<VecSSE2>(linToLog, dir, knotsCoefs, src, dst, numPixels);
+}
+
+} // OCIO_NAMESPACE
+
+#endif // OCIO_USE_SSE2
@@ -0,0 +1,292 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#ifndef INCLUDED_OCIO_GRADINGRGBCURVESIMD_H
+#define INCLUDED_OCIO_GRADINGRGBCURVESIMD_H
+
+
+#include <cmath>
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "ops/gradingrgbcurve/GradingBSplineCurve.h"
+#include "SIMDUtils.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+// Vectorized version of the GradingRGBCurve renderers (refer to GradingRGBCurveOpCPU.cpp) shared
+// by the SSE2, AVX2 and AVX-512 versions. The pixels are processed V::N at a time with one
+// register per channel.
+//
+// Instead of searching the segment of each value (refer to KnotsCoefs::evalCurve()), the
+// coefficients of all the segments are scanned once for the V::N values and selected per lane.
+// The number of knots is small (i.e. less than MAX_NUM_KNOTS for all the curves) so that's
+// faster than the gather instructions and it works the same way for all the instruction sets.
+
+namespace GradingRGBCurveSIMD
+{
+
+// Curve data not depending on the pixel values (refer to KnotsCoefs::evalCurve() and
+// KnotsCoefs::evalCurveRev()).
+template<typename V>
+struct Curve
+{
+    typedef typename V::vec vec;
+
+    Curve(const GradingBSplineCurveImpl::KnotsCoefs & knotsCoefs, int c, bool isInv)
+    {
+        m_coefsSets = knotsCoefs.m_coefsOffsetsArray[2 * c + 1] / 3;
+        if (m_coefsSets == 0)
+        {
+            return;
+        }
+
+        const int coefsOffs = knotsCoefs.m_coefsOffsetsArray[2 * c];
+        const int knotsOffs = knotsCoefs.m_knotsOffsetsArray[2 * c];
+
+        m_knotsCnt = knotsCoefs.m_knotsOffsetsArray[2 * c + 1];
+        m_knots = &knotsCoefs.m_knotsArray[knotsOffs];
+        m_A = &knotsCoefs.m_coefsArray[coefsOffs];
+        m_B = m_A + m_coefsSets;
+        m_C = m_B + m_coefsSets;
+
+        const float knStart = m_knots[0];
+        const float knEnd = m_knots[m_knotsCnt - 1];
+
+        // Linear extrapolation below the first knot.
+        const float startSlope = m_B[0];
+        const float startOffs = m_C[0];
+
+        // Linear extrapolation above the last knot.
+        const float A  = m_A[m_coefsSets - 1];
+        const float B  = m_B[m_coefsSets - 1];
+        const float C  = m_C[m_coefsSets - 1];
+        const float kn = m_knots[m_knotsCnt - 2];
+        const float t = knEnd - kn;
+        const float endSlope = 2.f * A * t + B;
+        const float endOffs = (A * t + B) * t + C;
+
+        m_knStart = V::set1(knStart);
+        m_knEnd = V::set1(knEnd);
+        m_startSlope = V::set1(startSlope);
+        m_startOffs = V::set1(startOffs);
+        m_endSlope = V::set1(endSlope);
+        m_endOffs = V::set1(endOffs);
+
+        if (isInv)
+        {
+            m_startFlat = std::fabs(startSlope) < 1e-5f;
+            m_endFlat = std::fabs(endSlope) < 1e-5f;
+        }
+    }
+
+    bool isIdentity() const { return m_coefsSets == 0; }
+
+    int m_coefsSets{ 0 };
+    int m_knotsCnt{ 0 };
+
+    const float * m_knots{ nullptr };
+    const float * m_A{ nullptr };
+    const float * m_B{ nullptr };
+    const float * m_C{ nullptr };
+
+    vec m_knStart;
+    vec m_knEnd;
+    vec m_startSlope;
+    vec m_startOffs;
+    vec m_endSlope;
+    vec m_endOffs;
+
+    bool m_startFlat{ false };
+    bool m_endFlat{ false };
+};
+
+template<typename V>
+inline typename V::vec EvalCurve(const Curve<V> & curve, typename V::vec x)
+{
+    typedef typename V::vec vec;
+
+    if (curve.isIdentity())
+    {
+        return x;
+    }
+
+    // Find the segment i.e. the last knot smaller or equal to x.
+    vec A  = V::set1(curve.m_A[0]);
+    vec B  = V::set1(curve.m_B[0]);
+    vec C  = V::set1(curve.m_C[0]);
+    vec kn = V::set1(curve.m_knots[0]);
+    for (int i = 1; i < curve.m_knotsCnt - 1; ++i)
+    {
+        const vec knot = V::set1(curve.m_knots[i]);
+        const typename V::mask before = V::less(x, knot);
+
+        A  = V::select(before, A,  V::set1(curve.m_A[i]));
+        B  = V::select(before, B,  V::set1(curve.m_B[i]));
+        C  = V::select(before, C,  V::set1(curve.m_C[i]));
+        kn = V::select(before, kn, knot);
+    }
+
+    const vec t = V::sub(x, kn);
+    vec res = V::add(V::mul(V::add(V::mul(A, t), B), t), C);
+
+    // Note that the start extrapolation has the priority like in the scalar version.
+    const vec resEnd = V::add(V::mul(V::sub(x, curve.m_knEnd), curve.m_endSlope), curve.m_endOffs);
+    res = V::select(V::less(x, curve.m_knEnd), res, resEnd);
+
+    const vec resStart
+        = V::add(V::mul(V::sub(x, curve.m_knStart), curve.m_startSlope), curve.m_startOffs);
+    return V::select(V::greater(x, curve.m_knStart), res, resStart);
+}
+
+template<typename V>
+inline typename V::vec EvalCurveRev(const Curve<V> & curve, typename V::vec y)
+{
+    typedef typename V::vec vec;
+
+    if (curve.isIdentity())
+    {
+        return y;
+    }
+
+    // Find the segment using the knot values i.e. the C coefficients.
+    vec A  = V::set1(curve.m_A[0]);
+    vec B  = V::set1(curve.m_B[0]);
+    vec C  = V::set1(curve.m_C[0]);
+    vec kn = V::set1(curve.m_knots[0]);
+    for (int i = 1; i < curve.m_knotsCnt - 1; ++i)
+    {
+        const vec knotY = V::set1(curve.m_C[i]);
+        const typename V::mask before = V::less(y, knotY);
+
+        A  = V::select(before, A,  V::set1(curve.m_A[i]));
+        B  = V::select(before, B,  V::set1(curve.m_B[i]));
+        C  = V::select(before, C,  knotY);
+        kn = V::select(before, kn, V::set1(curve.m_knots[i]));
+    }
+
+    const vec C0 = V::sub(C, y);
+    const vec discrim = V::sqrt(V::sub(V::mul(B, B), V::mul(V::mul(V::set1(4.f), A), C0)));
+    vec res = V::add(kn, V::div(V::mul(V::set1(-2.f), C0), V::add(discrim, B)));
+
+    // Note that the start extrapolation has the priority like in the scalar version. The knot
+    // values of the two ends are the extrapolation offsets.
+    const vec resEnd
+        = curve.m_endFlat ? curve.m_knEnd
+                          : V::add(V::div(V::sub(y, curve.m_endOffs), curve.m_endSlope),
+                                   curve.m_knEnd);
+    res = V::select(V::less(y, curve.m_endOffs), res, resEnd);
+
+    const vec resStart
+        = curve.m_startFlat ? curve.m_knStart
+                            : V::add(V::div(V::sub(y, curve.m_startOffs), curve.m_startSlope),
+                                     curve.m_knStart);
+    return V::select(V::greater(y, curve.m_startOffs), res, resStart);
+}
+
+// Refer to LinLog() & LogLin() in GradingRGBCurveOpCPU.cpp.
+namespace LogLinConstants
+{
+    static constexpr float xbrk = 0.0041318374739483946f;
+    static constexpr float shift = -0.000157849851665374f;
+    static constexpr float m = 1.f / (0.18f + shift);
+    static constexpr float gain = 363.034608563f;
+    static constexpr float offs = -7.f;
+    static constexpr float ybrk = -5.5f;
+}
+
+template<typename V>
+inline typename V::vec LinLog(typename V::vec pix)
+{
+    const typename V::vec pixLin = V::add(V::mul(pix, V::set1(LogLinConstants::gain)),
+                                          V::set1(LogLinConstants::offs));
+    const typename V::vec pixLog = V::log2(V::mul(V::add(pix, V::set1(LogLinConstants::shift)),
+                                                  V::set1(LogLinConstants::m)));
+
+    return V::select(V::greater(pix, V::set1(LogLinConstants::xbrk)), pixLog, pixLin);
+}
+
+template<typename V>
+inline typename V::vec LogLin(typename V::vec pix)
+{
+    const typename V::vec pixLin = V::mul(V::sub(pix, V::set1(LogLinConstants::offs)),
+                                          V::set1(1.f / LogLinConstants::gain));
+    const typename V::vec pixExp = V::sub(V::mul(V::exp2(pix),
+                                                 V::set1(0.18f + LogLinConstants::shift)),
+                                          V::set1(LogLinConstants::shift));
+
+    return V::select(V::greater(pix, V::set1(LogLinConstants::ybrk)), pixExp, pixLin);
+}
+
+// Apply the GradingRGBCurve op using the same steps as the scalar renderers. The 'linToLog'
+// argument is true for the linear style when the lin-to-log conversion is not bypassed.
+template<typename V>
+void Apply(bool linToLog, TransformDirection dir,
+           const GradingBSplineCurveImpl::KnotsCoefs & knotsCoefs,
+           const float * src, float * dst, long numPixels)
+{
+    typedef typename V::vec vec;
+
+    const bool isInv = dir == TRANSFORM_DIR_INVERSE;
+
+    const Curve<V> red(knotsCoefs, static_cast<int>(RGB_RED), isInv);
+    const Curve<V> green(knotsCoefs, static_cast<int>(RGB_GREEN), isInv);
+    const Curve<V> blue(knotsCoefs, static_cast<int>(RGB_BLUE), isInv);
+    const Curve<V> master(knotsCoefs, static_cast<int>(RGB_MASTER), isInv);
+
+    if (!isInv)
+    {
+        ApplySIMDKernel<V>(src, dst, numPixels, [&](vec & r, vec & g, vec & b)
+        {
+            if (linToLog)
+            {
+                r = LinLog<V>(r);
+                g = LinLog<V>(g);
+                b = LinLog<V>(b);
+            }
+
+            r = EvalCurve<V>(master, EvalCurve<V>(red, r));
+            g = EvalCurve<V>(master, EvalCurve<V>(green, g));
+            b = EvalCurve<V>(master, EvalCurve<V>(blue, b));
+
+            if (linToLog)
+            {
+                r = LogLin<V>(r);
+                g = LogLin<V>(g);
+                b = LogLin<V>(b);
+            }
+        });
+    }
+    else
+    {
+        ApplySIMDKernel<V>(src, dst, numPixels, [&](vec & r, vec & g, vec & b)
+        {
+            if (linToLog)
+            {
+                r = LinLog<V>(r);
+                g = LinLog<V>(g);
+                b = LinLog<V>(b);
+            }
+
+            r = EvalCurveRev<V>(red, EvalCurveRev<V>(master, r));
+            g = EvalCurveRev<V>(green, EvalCurveRev<V>(master, g));
+            b = EvalCurveRev<V>(blue, EvalCurveRev<V>(master, b));
+
+            if (linToLog)
+            {
+                r = LogLin<V>(r);
+                g = LogLin<V>(g);
+                b = LogLin<V>(b);
+            }
+        });
+    }
+}
+
+} // namespace GradingRGBCurveSIMD
+
+} // namespace OCIO_NAMESPACE
+
+#endif // INCLUDED_OCIO_GRADINGRGBCURVESIMD_H
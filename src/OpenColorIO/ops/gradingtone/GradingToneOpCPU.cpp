@@ -10,13 +10,22 @@
 #include "BitDepthUtils.h"
 #include "MathUtils.h"
 #include "ops/gradingtone/GradingToneOpCPU.h"
+#include "ops/gradingtone/GradingToneOpCPU_SSE2.h"
+#include "ops/gradingtone/GradingToneOpCPU_AVX2.h"
+#include "ops/gradingtone/GradingToneOpCPU_AVX512.h"
 #include "SSE.h"
+#include "CPUInfo.h"
 
 namespace OCIO_NAMESPACE
 {
 
 namespace
 {
+
+typedef void (GradingTone_func)(GradingStyle style, TransformDirection dir,
+                                const GradingTone & v, const GradingTonePreRender & vpr,
+                                const float * src, float * dst, long numPixels);
+
 class GradingToneOpCPU : public OpCPU
 {
 public:
@@ -30,12 +39,22 @@ public:
     DynamicPropertyRcPtr getDynamicProperty(DynamicPropertyType type) const override;
 
 protected:
+    // Process the pixels using the SIMD version (when available) processing several pixels at
+    // once. Returns false if the pixels still need to be processed.
+    bool applySIMD(const void * inImg, void * outImg, long numPixels) const;
+
     DynamicPropertyGradingToneImplRcPtr m_gt;
     GradingStyle m_style;
+
+private:
+    TransformDirection m_direction;
+    GradingTone_func * m_applyFunc;
 };
 
 GradingToneOpCPU::GradingToneOpCPU(ConstGradingToneOpDataRcPtr & gt)
-    : OpCPU()
+    :   OpCPU()
+    ,   m_direction(gt->getDirection())
+    ,   m_applyFunc(nullptr)
 {
     m_gt = gt->getDynamicPropertyInternal();
     m_style = gt->getStyle();
@@ -43,6 +62,38 @@ GradingToneOpCPU::GradingToneOpCPU(ConstGradingToneOpDataRcPtr & gt)
     {
         m_gt = m_gt->createEditableCopy();
     }
+
+#if OCIO_USE_SSE2
+    if (CPUInfo::instance().hasSSE2())
+    {
+        m_applyFunc = applyGradingToneSSE2;
+    }
+#endif
+
+#if OCIO_USE_AVX2
+    if (CPUInfo::instance().hasAVX2())
+    {
+        m_applyFunc = applyGradingToneAVX2;
+    }
+#endif
+
+#if OCIO_USE_AVX512
+    if (CPUInfo::instance().hasAVX512())
+    {
+        m_applyFunc = applyGradingToneAVX512;
+    }
+#endif
+}
+
+bool GradingToneOpCPU::applySIMD(const void * inImg, void * outImg, long numPixels) const
+{
+    if (m_applyFunc && numPixels > 1)
+    {
+        m_applyFunc(m_style, m_direction, m_gt->getValue(), m_gt->getComputedValue(),
+                    (const float *)inImg, (float *)outImg, numPixels);
+        return true;
+    }
+    return false;
 }
 
 bool GradingToneOpCPU::isDynamic() const
@@ -958,6 +1009,11 @@ void GradingToneFwdOpCPU::apply(const void * inImg, void * outImg, long numPixel
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
@@ -1015,6 +1071,11 @@ void GradingToneRevOpCPU::apply(const void * inImg, void * outImg, long numPixel
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
@@ -1155,6 +1216,11 @@ void GradingToneLinearFwdOpCPU::apply(const void * inImg, void * outImg, long nu
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
@@ -1212,6 +1278,11 @@ void GradingToneLinearRevOpCPU::apply(const void * inImg, void * outImg, long nu
         return;
     }
 
+    if (applySIMD(inImg, outImg, numPixels))
+    {
+        return;
+    }
+
     const float * in = (float *)inImg;
     float * out = (float *)outImg;
 
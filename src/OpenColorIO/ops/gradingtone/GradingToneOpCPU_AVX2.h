@@ -0,0 +1,24 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#ifndef INCLUDED_OCIO_GRADINGTONEOP_CPU_AVX2_H
+#define INCLUDED_OCIO_GRADINGTONEOP_CPU_AVX2_H
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "CPUInfo.h"
+#include "ops/gradingtone/GradingTone.h"
+
+#if OCIO_USE_AVX2
+namespace OCIO_NAMESPACE
+{
+
+void applyGradingToneAVX2(GradingStyle style, TransformDirection dir,
+                          const GradingTone & v, const GradingTonePreRender & vpr,
+                          const float * src, float * dst, long numPixels);
+
+} // namespace OCIO_NAMESPACE
+
+#endif // OCIO_USE_AVX2
+
+#endif /* INCLUDED_OCIO_GRADINGTONEOP_CPU_AVX2_H */
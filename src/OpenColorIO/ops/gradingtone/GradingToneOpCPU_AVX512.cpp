@@ -0,0 +1,24 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#include "ops/gradingtone/GradingToneOpCPU_AVX512.h"
+#if OCIO_USE_AVX512
+
+#include <immintrin.h>
+
+#include "AVX512.h"
+#include "ops/gradingtone/GradingToneSIMD.h"
+
+namespace OCIO_NAMESPACE
+{
+
+void applyGradingToneAVX512(GradingStyle style, TransformDirection dir,
+                            const GradingTone & v, const GradingTonePreRender & vpr,
+                            const float * src, float * dst, long numPixels)
+{
+    GradingToneSIMD::Apply<VecAVX512>(style, dir, v, vpr, src, dst, numPixels);
+}
+
+} // OCIO_NAMESPACE
+
+#endif // OCIO_USE_AVX512
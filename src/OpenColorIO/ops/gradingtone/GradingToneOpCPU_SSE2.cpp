@@ -0,0 +1,22 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+#include "ops/gradingtone/GradingToneOpCPU_SSE2.h"
+#if OCIO_USE_SSE2
+
+#include "SSE2.h"
+#include "ops/gradingtone/GradingToneSIMD.h"
+
+namespace OCIO_NAMESPACE
+{
+
+void applyGradingToneSSE2(GradingStyle style, TransformDirection dir,
+                          const GradingTone & v, const GradingTonePreRender & vpr,
+                          const float * src, float * dst, long numPixels)
+{
+    GradingToneSIMD::Apply<VecSSE2>(style, dir, v, vpr, src, dst, numPixels);
+}
+
+} // OCIO_NAMESPACE
+
+#endif // OCIO_USE_SSE2
@@ -0,0 +1,696 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#ifndef INCLUDED_OCIO_GRADINGTONESIMD_H
+#define INCLUDED_OCIO_GRADINGTONESIMD_H
+
+
+#include <algorithm>
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "MathUtils.h"
+#include "ops/gradingtone/GradingTone.h"
+#include "SIMDUtils.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+// Vectorized version of the GradingTone renderers (refer to GradingToneOpCPU.cpp) shared by the
+// SSE2, AVX2 and AVX-512 versions. The pixels are processed V::N at a time with one register
+// per channel. All the segments of a curve are evaluated and the result is selected per lane,
+// in the same order as the scalar version so the boundary cases are identical.
+
+namespace GradingToneSIMD
+{
+
+// Wrapper of one register so the equations keep the same syntax as the scalar version (i.e.
+// the 'float3' type from GradingToneOpCPU.cpp).
+template<typename V>
+struct Vec
+{
+    typedef typename V::vec vec;
+
+    Vec() = default;
+    Vec(vec v) : m_v(v) {}
+
+    vec m_v;
+};
+
+template<typename V>
+inline Vec<V> operator+(const Vec<V> & a, const Vec<V> & b) { return V::add(a.m_v, b.m_v); }
+template<typename V>
+inline Vec<V> operator+(const Vec<V> & a, float b) { return V::add(a.m_v, V::set1(b)); }
+template<typename V>
+inline Vec<V> operator+(float a, const Vec<V> & b) { return V::add(V::set1(a), b.m_v); }
+
+template<typename V>
+inline Vec<V> operator-(const Vec<V> & a, const Vec<V> & b) { return V::sub(a.m_v, b.m_v); }
+template<typename V>
+inline Vec<V> operator-(const Vec<V> & a, float b) { return V::sub(a.m_v, V::set1(b)); }
+template<typename V>
+inline Vec<V> operator-(float a, const Vec<V> & b) { return V::sub(V::set1(a), b.m_v); }
+
+template<typename V>
+inline Vec<V> operator*(const Vec<V> & a, const Vec<V> & b) { return V::mul(a.m_v, b.m_v); }
+template<typename V>
+inline Vec<V> operator*(const Vec<V> & a, float b) { return V::mul(a.m_v, V::set1(b)); }
+template<typename V>
+inline Vec<V> operator*(float a, const Vec<V> & b) { return V::mul(V::set1(a), b.m_v); }
+
+template<typename V>
+inline Vec<V> operator/(const Vec<V> & a, const Vec<V> & b) { return V::div(a.m_v, b.m_v); }
+template<typename V>
+inline Vec<V> operator/(const Vec<V> & a, float b) { return V::div(a.m_v, V::set1(b)); }
+template<typename V>
+inline Vec<V> operator/(float a, const Vec<V> & b) { return V::div(V::set1(a), b.m_v); }
+
+template<typename V>
+inline Vec<V> Sqrt(const Vec<V> & val) { return V::sqrt(val.m_v); }
+
+// Same as the scalar version i.e. res = val < limit ? below : above.
+template<typename V>
+inline void setOnLimit(Vec<V> & res, const Vec<V> & val, float limit,
+                       const Vec<V> & below, const Vec<V> & above)
+{
+    res = V::select(V::less(val.m_v, V::set1(limit)), below.m_v, above.m_v);
+}
+
+// res = val > limit ? above : res.
+template<typename V>
+inline void setAboveLimit(Vec<V> & res, const Vec<V> & val, float limit, const Vec<V> & above)
+{
+    res = V::select(V::greater(val.m_v, V::set1(limit)), above.m_v, res.m_v);
+}
+
+// The three channels, processed together for the master (i.e. M) adjustments.
+template<typename V>
+struct Pixels
+{
+    Vec<V> m_rgb[3];
+};
+
+template<typename V, typename Func>
+inline void ApplyChannel(RGBMChannel channel, Pixels<V> & pix, const Func & func)
+{
+    if (channel != M)
+    {
+        pix.m_rgb[channel] = func(pix.m_rgb[channel]);
+    }
+    else
+    {
+        pix.m_rgb[0] = func(pix.m_rgb[0]);
+        pix.m_rgb[1] = func(pix.m_rgb[1]);
+        pix.m_rgb[2] = func(pix.m_rgb[2]);
+    }
+}
+
+template<typename V>
+void MidsFwd(const GradingTone & v, const GradingTonePreRender & vpr,
+             RGBMChannel channel, Pixels<V> & pix)
+{
+    const float mid_adj = Clamp(GetChannelValue(v.m_midtones, channel), 0.01f, 1.99f);
+    if (mid_adj == 1.f) return;
+
+    const float * x = vpr.m_midX[channel];
+    const float * y = vpr.m_midY[channel];
+    const float * m = vpr.m_midM[channel];
+
+    ApplyChannel<V>(channel, pix, [channel, x, y, m](const Vec<V> & t)
+    {
+        const Vec<V> tL  = (t - x[0]) / (x[1] - x[0]);
+        const Vec<V> tM  = (t - x[1]) / (x[2] - x[1]);
+        const Vec<V> tR  = (t - x[2]) / (x[3] - x[2]);
+        const Vec<V> tR2 = (t - x[3]) / (x[4] - x[3]);
+        const Vec<V> tR3 = (t - x[4]) / (x[5] - x[4]);
+        const Vec<V> fL  = tL * (x[1] - x[0]) * ( tL * 0.5f * (m[1] - m[0]) + m[0] ) + y[0];
+        const Vec<V> fM  = tM * (x[2] - x[1]) * ( tM * 0.5f * (m[2] - m[1]) + m[1] ) + y[1];
+        const Vec<V> fR  = tR * (x[3] - x[2]) * ( tR * 0.5f * (m[3] - m[2]) + m[2] ) + y[2];
+        const Vec<V> fR2 = tR2 * (x[4] - x[3]) * ( tR2 * 0.5f * (m[4] - m[3]) + m[3] ) + y[3];
+        const Vec<V> fR3 = tR3 * (x[5] - x[4]) * ( tR3 * 0.5f * (m[5] - m[4]) + m[4] ) + y[4];
+        const Vec<V> fR4 = (t - x[0]) * m[0] + y[0];
+        const Vec<V> fR5 = (t - x[5]) * m[5] + y[5];
+
+        Vec<V> res;
+        setOnLimit(res, t, x[1], fL, fM);
+        if (channel != M)
+        {
+            setAboveLimit(res, t, x[2], fR);
+            setAboveLimit(res, t, x[3], fR2);
+            setAboveLimit(res, t, x[4], fR3);
+            setOnLimit(res, t, x[0], fR4, res);
+            setAboveLimit(res, t, x[5], fR5);
+        }
+        else
+        {
+            setOnLimit(res, t, x[2], res, fR);
+            setOnLimit(res, t, x[3], res, fR2);
+            setOnLimit(res, t, x[4], res, fR3);
+            setOnLimit(res, t, x[0], fR4, res);
+            setOnLimit(res, t, x[5], res, fR5);
+        }
+        return res;
+    });
+}
+
+template<typename V>
+void MidsRev(const GradingTone & v, const GradingTonePreRender & vpr,
+             RGBMChannel channel, Pixels<V> & pix)
+{
+    const float mid_adj = Clamp(GetChannelValue(v.m_midtones, channel), 0.01f, 1.99f);
+    if (mid_adj == 1.f) return;
+
+    const float * x = vpr.m_midX[channel];
+    const float * y = vpr.m_midY[channel];
+    const float * m = vpr.m_midM[channel];
+
+    ApplyChannel<V>(channel, pix, [channel, x, y, m](const Vec<V> & t)
+    {
+        Vec<V> outSeg[5];
+        for (int i = 0; i < 5; ++i)
+        {
+            const Vec<V> c = y[i] - t;
+            const float b = m[i] * (x[i + 1] - x[i]);
+            const float a = 0.5f * (m[i + 1] - m[i]) * (x[i + 1] - x[i]);
+            const Vec<V> discrim = Sqrt( b * b - 4.f * a * c);
+            const Vec<V> tmp = (2.f * c) / (-b - discrim);
+            outSeg[i] = tmp * (x[i + 1] - x[i]) + x[i];
+        }
+
+        const Vec<V> outL0 = x[0] + (t - y[0]) / m[0];
+        // Note that the scalar version of the R, G & B channels uses the bottom segment (and not
+        // the top one) above y5.
+        const Vec<V> outR4 = (channel != M) ? outL0 : x[5] + (t - y[5]) / m[5];
+
+        Vec<V> res;
+        setOnLimit(res, t, y[1], outSeg[0], outSeg[1]);
+        setOnLimit(res, t, y[2], res, outSeg[2]);
+        setOnLimit(res, t, y[3], res, outSeg[3]);
+        setOnLimit(res, t, y[4], res, outSeg[4]);
+        setOnLimit(res, t, y[0], outL0, res);
+        setOnLimit(res, t, y[5], res, outR4);
+        return res;
+    });
+}
+
+template<typename V>
+Vec<V> ComputeHSFwd(float x0, float x1, float x2, float y0, float y1, float y2,
+                    float m0, float m2, const Vec<V> & t)
+{
+    Vec<V> res{ t }, tL, tR, fL, fR;
+    tL = (t - x0) / (x1 - x0);
+    tR = (t - x1) / (x2 - x1);
+    fL = y0 * (1.f - tL*tL) + y1 * tL*tL + m0 * (1.f - tL) * tL * (x1 - x0);
+    fR = y1 * (1.f - tR)*(1.f - tR) + y2 * (2.f - tR)*tR + m2 * (tR - 1.f)*tR * (x2 - x1);
+
+    setOnLimit(res, t, x1, fL, fR);
+
+    Vec<V> r0 = (t - x0) * m0 + y0;
+    setOnLimit(res, t, x0, r0, res);
+
+    Vec<V> r2 = (t - x2) * m2 + y2;
+    setOnLimit(res, t, x2, res, r2);
+
+    return res;
+}
+
+template<typename V>
+Vec<V> ComputeHSRev(float x0, float x1, float x2, float y0, float y1, float y2,
+                    float m0, float m2, const Vec<V> & t)
+{
+    Vec<V> res{ t }, cL, cR, discrimL, discrimR, outL, outR;
+
+    float bL = m0 * (x1 - x0);
+    float aL = y1 - y0 - m0 * (x1 - x0);
+    cL = y0 - t;
+    discrimL = Sqrt(bL * bL - 4.f * aL * cL);
+    outL = (-2.f * cL) / (discrimL + bL) * (x1 - x0) + x0;
+
+    float bR = 2.f*y2 - 2.f*y1 - m2 * (x2 - x1);
+    float aR = y1 - y2 + m2 * (x2 - x1);
+    cR = y1 - t;
+    discrimR = Sqrt(bR * bR - 4.f * aR * cR);
+    outR = (-2.f * cR) / (discrimR + bR) * (x2 - x1) + x1;
+
+    setOnLimit(res, t, y1, outL, outR);
+
+    Vec<V> r0 = (t - y0) / m0 + x0;
+    setOnLimit(res, t, y0, r0, res);
+
+    Vec<V> r2 = (t - y2) / m2 + x2;
+    setOnLimit(res, t, y2, res, r2);
+
+    return res;
+}
+
+template<typename V>
+void HighlightShadow(bool isFwd, const GradingTone & v, const GradingTonePreRender & vpr,
+                     RGBMChannel channel, bool isShadow, Pixels<V> & pix)
+{
+    // The effect of val is symmetric around 1 (<1 uses Fwd algorithm, >1 uses Rev algorithm).
+    float val = isShadow ? GetChannelValue(v.m_shadows, channel) :
+                           GetChannelValue(v.m_highlights, channel);
+    if (!isShadow)
+    {
+        val = 2.f - val;
+    }
+
+    if (val == 1.) return;
+
+    const int idx = isShadow ? 1 : 0;
+
+    const float x0 = vpr.m_hsX[idx][channel][0];
+    const float x1 = vpr.m_hsX[idx][channel][1];
+    const float x2 = vpr.m_hsX[idx][channel][2];
+    const float y0 = vpr.m_hsY[idx][channel][0];
+    const float y1 = vpr.m_hsY[idx][channel][1];
+    const float y2 = vpr.m_hsY[idx][channel][2];
+    const float m0 = vpr.m_hsM[idx][channel][0];
+    const float m2 = vpr.m_hsM[idx][channel][1];
+
+    // The inverse renderer swaps the two algorithms.
+    if ((val < 1.) == isFwd)
+    {
+        ApplyChannel<V>(channel, pix, [=](const Vec<V> & t)
+        {
+            return ComputeHSFwd<V>(x0, x1, x2, y0, y1, y2, m0, m2, t);
+        });
+    }
+    else
+    {
+        ApplyChannel<V>(channel, pix, [=](const Vec<V> & t)
+        {
+            return ComputeHSRev<V>(x0, x1, x2, y0, y1, y2, m0, m2, t);
+        });
+    }
+}
+
+template<typename V>
+Vec<V> ComputeWBFwd(bool isBlack, float mtest, float x0, float x1, float y0, float y1,
+                    float m0, float m1, float gain, Vec<V> t)
+{
+    if (mtest < 1.f)
+    {
+        // Slope is decreasing case.
+        Vec<V> tlocal = (t - x0) / (x1 - x0);
+        Vec<V> res = tlocal * (x1 - x0) * (tlocal * 0.5f * (m1 - m0) + m0) + y0;
+
+        Vec<V> res0 = y0 + (t - x0) * m0;
+        setOnLimit(res, t, x0, res0, res);
+
+        Vec<V> res1 = y1 + (t - x1) * m1;
+        setOnLimit(res, t, x1, res, res1);
+
+        return res;
+    }
+    else if (mtest > 1.f)
+    {
+        // Slope is increasing case.
+        t = (!isBlack) ? (t - x0) * gain + x0 : (t - x1) * gain + x1;
+
+        const float a = 0.5f * (m1 - m0) * (x1 - x0);
+        const float b = m0 * (x1 - x0);
+        Vec<V> c = y0 - t;
+        Vec<V> discrim = Sqrt(b * b - 4.f * a * c);
+        Vec<V> tmp = (-2.f * c) / (discrim + b);
+        Vec<V> res = tmp * (x1 - x0) + x0;
+
+        Vec<V> res0 = x0 + (t - y0) / m0;
+        setOnLimit(res, t, y0, res0, res);
+
+        if (!isBlack)
+        {
+            res = (res - x0) / gain + x0;
+
+            // Quadratic extrapolation for better HDR control.
+            const float new_y1 = (x1 - x0) / gain + x0;
+            const float xd = x0 + (x1 - x0) * 0.99f;
+            float md = m0 + (xd - x0) * (m1 - m0) / (x1 - x0);
+            md = 1.f / md;
+            const float aa = 0.5f * (1.f / m1 - md) / (x1 - xd);
+            const float bb = 1.f / m1 - 2.f * aa * x1;
+            const float cc = new_y1 - bb * x1 - aa * x1 * x1;
+
+            t = (t - x0) / gain + x0;
+            Vec<V> res1 = (aa * t + bb) * t + cc;
+            setOnLimit(res, t, x1, res, res1);
+        }
+        else
+        {
+            Vec<V> res1 = x1 + (t - y1) / m1;
+            setOnLimit(res, t, y1, res, res1);
+            res = (res - x1) / gain + x1;
+        }
+
+        return res;
+    }
+
+    return t;
+}
+
+template<typename V>
+Vec<V> ComputeWBRev(bool isBlack, float mtest, float x0, float x1, float y0, float y1,
+                    float m0, float m1, float gain, Vec<V> t)
+{
+    if (mtest < 1.f)
+    {
+        // Slope is decreasing case.
+        const float a = 0.5f * (m1 - m0) * (x1 - x0);
+        const float b = m0 * (x1 - x0);
+        Vec<V> c = y0 - t;
+        Vec<V> discrim = Sqrt(b * b - 4.f * a * c);
+        Vec<V> tmp = (-2.f * c) / (discrim + b);
+        Vec<V> res = tmp * (x1 - x0) + x0;
+
+        Vec<V> res0 = x0 + (t - y0) / m0;
+        setOnLimit(res, t, y0, res0, res);
+
+        Vec<V> res1 = x1 + (t - y1) / m1;
+        setOnLimit(res, t, y1, res, res1);
+
+        return res;
+    }
+    else if (mtest > 1.f)
+    {
+        // Slope is increasing case.
+        t = (!isBlack) ? (t - x0) * gain + x0 : (t - x1) * gain + x1;
+
+        Vec<V> tlocal = (t - x0) / (x1 - x0);
+        Vec<V> res = tlocal * (x1 - x0) * (tlocal * 0.5f * (m1 - m0) + m0) + y0;
+
+        Vec<V> res0 = y0 + (t - x0) * m0;
+        setOnLimit(res, t, x0, res0, res);
+
+        if (!isBlack)
+        {
+            res = (res - x0) / gain + x0;
+
+            // Quadratic extrapolation for better HDR control.
+            const float new_y1 = (x1 - x0) / gain + x0;
+            const float xd = x0 + (x1 - x0) * 0.99f;
+            float md = m0 + (xd - x0) * (m1 - m0) / (x1 - x0);
+            md = 1.f / md;
+            const float aa = 0.5f * (1.f / m1 - md) / (x1 - xd);
+            const float bb = 1.f / m1 - 2.f * aa * x1;
+            const float cc = new_y1 - bb * x1 - aa * x1 * x1;
+
+            t = (t - x0) / gain + x0;
+            Vec<V> c = cc - t;
+            Vec<V> discrim = Sqrt(bb * bb - 4.f * aa * c);
+            Vec<V> res1 = (-2.f * c) / (discrim + bb);
+            const float brk = (aa * x1 + bb) * x1 + cc;
+            setOnLimit(res, t, brk, res, res1);
+        }
+        else
+        {
+            Vec<V> res1 = y1 + (t - x1) * m1;
+            setOnLimit(res, t, x1, res, res1);
+            res = (res - x1) / gain + x1;
+        }
+
+        return res;
+    }
+
+    return t;
+}
+
+template<typename V>
+void WhiteBlack(bool isFwd, const GradingTone & v, const GradingTonePreRender & vpr,
+                RGBMChannel channel, bool isBlack, Pixels<V> & pix)
+{
+    const float val = isBlack ? GetChannelValue(v.m_blacks, channel) :
+                                GetChannelValue(v.m_whites, channel);
+
+    const float mtest = (!isBlack) ? val : 2.f - val;
+    if (mtest == 1.f) return;
+
+    const int idx = isBlack ? 1 : 0;
+
+    const float x0 = vpr.m_wbX[idx][channel][0];
+    const float x1 = vpr.m_wbX[idx][channel][1];
+    const float y0 = vpr.m_wbY[idx][channel][0];
+    const float y1 = vpr.m_wbY[idx][channel][1];
+    const float m0 = vpr.m_wbM[idx][channel][0];
+    const float m1 = vpr.m_wbM[idx][channel][1];
+    const float gain = vpr.m_wbGain[idx][channel];
+
+    if (isFwd)
+    {
+        ApplyChannel<V>(channel, pix, [=](const Vec<V> & t)
+        {
+            return ComputeWBFwd<V>(isBlack, mtest, x0, x1, y0, y1, m0, m1, gain, t);
+        });
+    }
+    else
+    {
+        ApplyChannel<V>(channel, pix, [=](const Vec<V> & t)
+        {
+            return ComputeWBRev<V>(isBlack, mtest, x0, x1, y0, y1, m0, m1, gain, t);
+        });
+    }
+}
+
+template<typename V>
+void SContrast(bool isFwd, const GradingTone & v, const GradingTonePreRender & vpr,
+               Pixels<V> & pix)
+{
+    float contrast = static_cast<float>(v.m_scontrast);
+    if (contrast == 1.) return;
+
+    // Limit the range of values to prevent reversals.
+    contrast = (contrast > 1.f) ? 1.f / (1.8125f - 0.8125f * std::min(contrast, 1.99f)) :
+                                  0.28125f + 0.71875f * std::max(contrast, 0.01f);
+
+    if (isFwd)
+    {
+        ApplyChannel<V>(M, pix, [contrast, &vpr](const Vec<V> & t)
+        {
+            Vec<V> outColor{ (t - vpr.m_pivot) * contrast + vpr.m_pivot };
+
+            // Top end
+            {
+                const float x1 = vpr.m_scX[0][1];
+                const float x2 = vpr.m_scX[0][2];
+                const float y1 = vpr.m_scY[0][1];
+                const float y2 = vpr.m_scY[0][2];
+                const float m0 = vpr.m_scM[0][0];
+                const float m3 = vpr.m_scM[0][1];
+
+                Vec<V> tR  = (t - x1) / (x2 - x1);
+                Vec<V> res = tR * (x2 - x1) * ( tR * 0.5f * (m3 - m0) + m0 ) + y1;
+                setOnLimit(outColor, t, x1, outColor, res);
+                Vec<V> res2 = y2 + (t - x2) * m3;
+                setOnLimit(outColor, t, x2, outColor, res2);
+            }
+
+            // Bottom end
+            {
+                const float x1 = vpr.m_scX[1][1];
+                const float x2 = vpr.m_scX[1][2];
+                const float y1 = vpr.m_scY[1][1];
+                const float m0 = vpr.m_scM[1][0];
+                const float m3 = vpr.m_scM[1][1];
+
+                Vec<V> tR = (t - x1) / (x2 - x1);
+                Vec<V> res = tR * (x2 - x1) * (tR * 0.5f * (m3 - m0) + m0) + y1;
+                setOnLimit(outColor, t, x2, res, outColor);
+                Vec<V> res1 = y1 + (t - x1) * m0;
+                setOnLimit(outColor, t, x1, res1, outColor);
+            }
+
+            return outColor;
+        });
+    }
+    else
+    {
+        ApplyChannel<V>(M, pix, [contrast, &vpr](const Vec<V> & t)
+        {
+            Vec<V> outColor{ (t - vpr.m_pivot) / contrast + vpr.m_pivot };
+
+            // Top end
+            {
+                const float x1 = vpr.m_scX[0][1];
+                const float x2 = vpr.m_scX[0][2];
+                const float y1 = vpr.m_scY[0][1];
+                const float y2 = vpr.m_scY[0][2];
+                const float m0 = vpr.m_scM[0][0];
+                const float m3 = vpr.m_scM[0][1];
+
+                float b = m0 * (x2 - x1);
+                float a = (m3 - m0) * 0.5f * (x2 - x1);
+                Vec<V> c = y1 - t;
+                Vec<V> discrim = Sqrt(b * b - 4.f * a * c);
+                Vec<V> res =  (x2 - x1) * (-2.f * c) / (discrim + b) + x1;
+                setOnLimit(outColor, t, y1, outColor, res);
+                setOnLimit(outColor, t, y2, outColor, x2 + (t - y2) / m3);
+            }
+
+            // Bottom end
+            {
+                const float x1 = vpr.m_scX[1][1];
+                const float x2 = vpr.m_scX[1][2];
+                const float y1 = vpr.m_scY[1][1];
+                const float y2 = vpr.m_scY[1][2];
+                const float m0 = vpr.m_scM[1][0];
+                const float m3 = vpr.m_scM[1][1];
+
+                float b = m0 * (x2 - x1);
+                float a = (m3 - m0) * 0.5f * (x2 - x1);
+                Vec<V> c = y1 - t;
+                Vec<V> discrim = Sqrt(b * b - 4.f * a * c);
+                Vec<V> res =  (x2 - x1) * (-2.f * c) / (discrim + b) + x1;
+                setOnLimit(outColor, t, y2, res, outColor);
+                setOnLimit(outColor, t, y1, x1 + (t - y1) / m0, outColor);
+            }
+
+            return outColor;
+        });
+    }
+}
+
+// Refer to LinLog() & LogLin() in GradingToneOpCPU.cpp.
+namespace LogLinConstants
+{
+    static constexpr float xbrk = 0.0041318374739483946f;
+    static constexpr float shift = -0.000157849851665374f;
+    static constexpr float m = 1.f / (0.18f + shift);
+    static constexpr float gain = 363.034608563f;
+    static constexpr float offs = -7.f;
+    static constexpr float ybrk = -5.5f;
+}
+
+template<typename V>
+inline typename V::vec LinLog(typename V::vec pix)
+{
+    const typename V::vec pixLin = V::add(V::mul(pix, V::set1(LogLinConstants::gain)),
+                                          V::set1(LogLinConstants::offs));
+    const typename V::vec pixLog = V::log2(V::mul(V::add(pix, V::set1(LogLinConstants::shift)),
+                                                  V::set1(LogLinConstants::m)));
+
+    return V::select(V::greater(pix, V::set1(LogLinConstants::xbrk)), pixLog, pixLin);
+}
+
+template<typename V>
+inline typename V::vec LogLin(typename V::vec pix)
+{
+    const typename V::vec pixLin = V::mul(V::sub(pix, V::set1(LogLinConstants::offs)),
+                                          V::set1(1.f / LogLinConstants::gain));
+    const typename V::vec pixExp = V::sub(V::mul(V::exp2(pix),
+                                                 V::set1(0.18f + LogLinConstants::shift)),
+                                          V::set1(LogLinConstants::shift));
+
+    return V::select(V::greater(pix, V::set1(LogLinConstants::ybrk)), pixExp, pixLin);
+}
+
+// Apply the GradingTone op using the same steps as the scalar renderers.
+template<typename V>
+void Apply(GradingStyle style, TransformDirection dir,
+           const GradingTone & v, const GradingTonePreRender & vpr,
+           const float * src, float * dst, long numPixels)
+{
+    typedef typename V::vec vec;
+
+    const bool linToLog = style == GRADING_LIN;
+
+    // Note that the order of the min() arguments preserves the NaNs like std::min().
+    const vec maxValue = V::set1(65504.f);
+
+    if (dir == TRANSFORM_DIR_FORWARD)
+    {
+        ApplySIMDKernel<V>(src, dst, numPixels, [&](vec & r, vec & g, vec & b)
+        {
+            Pixels<V> pix;
+            pix.m_rgb[0] = linToLog ? LinLog<V>(r) : r;
+            pix.m_rgb[1] = linToLog ? LinLog<V>(g) : g;
+            pix.m_rgb[2] = linToLog ? LinLog<V>(b) : b;
+
+            MidsFwd<V>(v, vpr, R, pix);
+            MidsFwd<V>(v, vpr, G, pix);
+            MidsFwd<V>(v, vpr, B, pix);
+            MidsFwd<V>(v, vpr, M, pix);
+
+            HighlightShadow<V>(true, v, vpr, R, false, pix);
+            HighlightShadow<V>(true, v, vpr, G, false, pix);
+            HighlightShadow<V>(true, v, vpr, B, false, pix);
+            HighlightShadow<V>(true, v, vpr, M, false, pix);
+
+            WhiteBlack<V>(true, v, vpr, R, false, pix);
+            WhiteBlack<V>(true, v, vpr, G, false, pix);
+            WhiteBlack<V>(true, v, vpr, B, false, pix);
+            WhiteBlack<V>(true, v, vpr, M, false, pix);
+
+            HighlightShadow<V>(true, v, vpr, R, true, pix);
+            HighlightShadow<V>(true, v, vpr, G, true, pix);
+            HighlightShadow<V>(true, v, vpr, B, true, pix);
+            HighlightShadow<V>(true, v, vpr, M, true, pix);
+
+            WhiteBlack<V>(true, v, vpr, R, true, pix);
+            WhiteBlack<V>(true, v, vpr, G, true, pix);
+            WhiteBlack<V>(true, v, vpr, B, true, pix);
+            WhiteBlack<V>(true, v, vpr, M, true, pix);
+
+            SContrast<V>(true, v, vpr, pix);
+
+            r = linToLog ? LogLin<V>(pix.m_rgb[0].m_v) : pix.m_rgb[0].m_v;
+            g = linToLog ? LogLin<V>(pix.m_rgb[1].m_v) : pix.m_rgb[1].m_v;
+            b = linToLog ? LogLin<V>(pix.m_rgb[2].m_v) : pix.m_rgb[2].m_v;
+
+            r = V::min(maxValue, r);
+            g = V::min(maxValue, g);
+            b = V::min(maxValue, b);
+        });
+    }
+    else
+    {
+        ApplySIMDKernel<V>(src, dst, numPixels, [&](vec & r, vec & g, vec & b)
+        {
+            Pixels<V> pix;
+            pix.m_rgb[0] = linToLog ? LinLog<V>(r) : r;
+            pix.m_rgb[1] = linToLog ? LinLog<V>(g) : g;
+            pix.m_rgb[2] = linToLog ? LinLog<V>(b) : b;
+
+            SContrast<V>(false, v, vpr, pix);
+
+            WhiteBlack<V>(false, v, vpr, M, true, pix);
+            WhiteBlack<V>(false, v, vpr, R, true, pix);
+            WhiteBlack<V>(false, v, vpr, G, true, pix);
+            WhiteBlack<V>(false, v, vpr, B, true, pix);
+
+            HighlightShadow<V>(false, v, vpr, M, true, pix);
+            HighlightShadow<V>(false, v, vpr, R, true, pix);
+            HighlightShadow<V>(false, v, vpr, G, true, pix);
+            HighlightShadow<V>(false, v, vpr, B, true, pix);
+
+            WhiteBlack<V>(false, v, vpr, M, false, pix);
+            WhiteBlack<V>(false, v, vpr, R, false, pix);
+            WhiteBlack<V>(false, v, vpr, G, false, pix);
+            WhiteBlack<V>(false, v, vpr, B, false, pix);
+
+            HighlightShadow<V>(false, v, vpr, M, false, pix);
+            HighlightShadow<V>(false, v, vpr, R, false, pix);
+            HighlightShadow<V>(false, v, vpr, G, false, pix);
+            HighlightShadow<V>(false, v, vpr, B, false, pix);
+
+            MidsRev<V>(v, vpr, M, pix);
+            MidsRev<V>(v, vpr, R, pix);
+            MidsRev<V>(v, vpr, G, pix);
+            MidsRev<V>(v, vpr, B, pix);
+
+            r = linToLog ? LogLin<V>(pix.m_rgb[0].m_v) : pix.m_rgb[0].m_v;
+            g = linToLog ? LogLin<V>(pix.m_rgb[1].m_v) : pix.m_rgb[1].m_v;
+            b = linToLog ? LogLin<V>(pix.m_rgb[2].m_v) : pix.m_rgb[2].m_v;
+
+            r = V::min(maxValue, r);
+            g = V::min(maxValue, g);
+            b = V::min(maxValue, b);
+        });
+    }
+}
+
+} // namespace GradingToneSIMD
+
+} // namespace OCIO_NAMESPACE
+
+#endif // INCLUDED_OCIO_GRADINGTONESIMD_H
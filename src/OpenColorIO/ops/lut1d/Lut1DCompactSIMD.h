@@ -0,0 +1,65 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#ifndef INCLUDED_OCIO_LUT1DCOMPACTSIMD_H
+#define INCLUDED_OCIO_LUT1DCOMPACTSIMD_H
+
+
+#include <cstdint>
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "SIMDUtils.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+// Vectorized version of the Lut1D renderer using a LUT stored as half floats (refer to
+// Lut1DCompactRenderer in Lut1DOpCPU.cpp) shared by the scalar, SSE2, AVX2 and AVX-512 versions.
+// The LUT holds the interleaved RGB values of the dim entries followed by one padding element,
+// and the entries are loaded using V::gatherHalf().
+
+namespace Lut1DCompactSIMD
+{
+
+template<typename V>
+inline typename V::vec Interpolate(const uint16_t * lut, typename V::vec x, typename V::vec lutMax)
+{
+    typedef typename V::vec vec;
+
+    // Note that NaNs become 0.
+    x = V::min(V::max(V::mul(x, lutMax), V::set1(0.f)), lutMax);
+
+    const vec p = V::trunc(x);
+    const vec frac = V::sub(x, p);
+
+    const vec stride = V::set1(3.f);
+    const vec prev = V::gatherHalf(lut, V::mul(p, stride));
+    const vec next = V::gatherHalf(lut, V::mul(V::min(V::add(p, V::set1(1.f)), lutMax), stride));
+
+    return V::add(V::mul(V::sub(next, prev), frac), prev);
+}
+
+// Apply the linear interpolation for a LUT having a regular (i.e. not half) domain.
+template<typename V>
+void ApplyLinear(const uint16_t * lut, long dim, const float * src, float * dst, long numPixels)
+{
+    typedef typename V::vec vec;
+
+    const vec lutMax = V::set1(static_cast<float>(dim - 1));
+
+    ApplySIMDKernel<V>(src, dst, numPixels, [&](vec & r, vec & g, vec & b)
+    {
+        r = Interpolate<V>(lut, r, lutMax);
+        g = Interpolate<V>(lut + 1, g, lutMax);
+        b = Interpolate<V>(lut + 2, b, lutMax);
+    });
+}
+
+} // namespace Lut1DCompactSIMD
+
+} // namespace OCIO_NAMESPACE
+
+#endif // INCLUDED_OCIO_LUT1DCOMPACTSIMD_H
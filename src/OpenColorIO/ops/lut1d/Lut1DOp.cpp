@@ -235,9 +235,7 @@ void CreateLut1DTransform(GroupTransformRcPtr & group, ConstOpRcPtr & op)
     }
     auto lutData = DynamicPtrCast<const Lut1DOpData>(op->data());
     auto lutTransform = Lut1DTransform::Create();
-    auto & data = dynamic_cast<Lut1DTransformImpl *>(lutTransform.get())->data();
-
-    data = *lutData;
+    dynamic_cast<Lut1DTransformImpl *>(lutTransform.get())->setData(*lutData);
     group->appendTransform(lutTransform);
 }
 
@@ -5,6 +5,7 @@
 #include <math.h>
 #include <memory>
 #include <stdint.h>
+#include <vector>
 
 #include <OpenColorIO/OpenColorIO.h>
 
@@ -20,6 +21,7 @@
 #include "Lut1DOpCPU_AVX.h"
 #include "Lut1DOpCPU_AVX2.h"
 #include "Lut1DOpCPU_AVX512.h"
+#include "ops/lut1d/Lut1DCompactSIMD.h"
 
 
 #define L_ADJUST(val) \
@@ -176,6 +178,30 @@ public:
     void apply(const void * inImg, void * outImg, long numPixels) const override;
 };
 
+typedef void (Lut1DCompactApplyFunc)(const uint16_t *, int, const float *, float *, long);
+
+// Forward F32 renderer storing the LUT values as half floats i.e. 6 bytes per entry instead of
+// the 12 bytes of the other renderers. The values are clamped to the half float range and the
+// relative error of each entry is at most 2^-11.
+class Lut1DCompactRenderer : public OpCPU
+{
+public:
+    Lut1DCompactRenderer() = delete;
+    explicit Lut1DCompactRenderer(ConstLut1DOpDataRcPtr & lut);
+    Lut1DCompactRenderer(const Lut1DCompactRenderer &) = delete;
+    Lut1DCompactRenderer & operator=(const Lut1DCompactRenderer &) = delete;
+
+    void apply(const void * inImg, void * outImg, long numPixels) const override;
+
+private:
+    // Interleaved RGB values followed by one padding element (refer to Lut1DCompactSIMD.h).
+    std::vector<uint16_t> m_lut;
+    unsigned long m_dim = 0;
+    bool m_halfDomain = false;
+
+    Lut1DCompactApplyFunc * m_applyLutFunc = nullptr;
+};
+
 // Holds the parameters of a color component.
 // Note: The structure does not own any of the pointers.
 struct ComponentParams
@@ -1623,6 +1649,88 @@ void InvLut1DRendererHalfCodeHueAdjust<inBD, outBD>::apply(const void * inImg, v
     }
 }
 
+Lut1DCompactRenderer::Lut1DCompactRenderer(ConstLut1DOpDataRcPtr & lut)
+    :   OpCPU()
+    ,   m_dim(lut->getArray().getLength())
+    ,   m_halfDomain(lut->isInputHalfDomain())
+{
+    const Array::Values & lutValues = lut->getArray().getValues();
+    const size_t numValues = m_dim * 3;
+
+    m_lut.resize(numValues + 1, 0);
+    for (size_t i = 0; i < numValues; ++i)
+    {
+        // Note that NaNs become 0 and the infinities become the largest half float values.
+        const float val = Clamp(SanitizeFloat(lutValues[i]), -HALF_MAX, HALF_MAX);
+        m_lut[i] = half(val).bits();
+    }
+
+    // The half domain LUTs are indexed using the bits of the input values instead.
+    if (m_halfDomain)
+    {
+        return;
+    }
+
+#if OCIO_USE_SSE2
+    if (CPUInfo::instance().hasSSE2())
+    {
+        m_applyLutFunc = applyLinearCompactSSE2;
+    }
+#endif
+
+#if OCIO_USE_AVX2
+    if (CPUInfo::instance().hasAVX2() && !CPUInfo::instance().AVX2SlowGather())
+    {
+        m_applyLutFunc = applyLinearCompactAVX2;
+    }
+#endif
+
+#if OCIO_USE_AVX512
+    if (CPUInfo::instance().hasAVX512())
+    {
+        m_applyLutFunc = applyLinearCompactAVX512;
+    }
+#endif
+}
+
+void Lut1DCompactRenderer::apply(const void * inImg, void * outImg, long numPixels) const
+{
+    const float * in = (const float *)inImg;
+    float * out = (float *)outImg;
+
+    if (!m_halfDomain)
+    {
+        if (m_applyLutFunc)
+        {
+            m_applyLutFunc(m_lut.data(), m_dim, in, out, numPixels);
+        }
+        else
+        {
+            Lut1DCompactSIMD::ApplyLinear<VecScalar>(m_lut.data(), m_dim, in, out, numPixels);
+        }
+        return;
+    }
+
+    // Refer to Lut1DRendererHalfCode::apply().
+    half valA, valB;
+    for (long idx = 0; idx < numPixels; ++idx)
+    {
+        for (int c = 0; c < 3; ++c)
+        {
+            const IndexPair interVals = IndexPair::GetEdgeFloatValues(in[c]);
+
+            valA.setBits(m_lut[interVals.valA * 3 + c]);
+            valB.setBits(m_lut[interVals.valB * 3 + c]);
+
+            out[c] = lerpf(valB, valA, 1.0f - interVals.fraction);
+        }
+        out[3] = in[3];
+
+        in  += 4;
+        out += 4;
+    }
+}
+
 template<BitDepth inBD, BitDepth outBD>
 OpCPURcPtr GetForwardLut1DRenderer(ConstLut1DOpDataRcPtr & lut)
 {
@@ -1751,6 +1859,17 @@ ConstOpCPURcPtr GetLut1DRenderer(ConstLut1DOpDataRcPtr & lut, BitDepth inBD, Bit
     return ConstOpCPURcPtr();
 }
 
+ConstOpCPURcPtr GetLut1DCompactRenderer(ConstLut1DOpDataRcPtr & lut)
+{
+    if (lut->getDirection() == TRANSFORM_DIR_FORWARD && lut->getHueAdjust() == HUE_NONE)
+    {
+        return std::make_shared<Lut1DCompactRenderer>(lut);
+    }
+
+    // The inverse & hue adjust renderers keep the float values.
+    return GetLut1DRenderer(lut, BIT_DEPTH_F32, BIT_DEPTH_F32);
+}
+
 
 } // namespace OCIO_NAMESPACE
 
@@ -13,6 +13,10 @@ namespace OCIO_NAMESPACE
 
 ConstOpCPURcPtr GetLut1DRenderer(ConstLut1DOpDataRcPtr & lut, BitDepth in, BitDepth out);
 
+// Get a F32 renderer storing the LUT values as half floats (i.e. smaller but less accurate).
+// Note that only the forward direction without hue adjustment uses a different renderer.
+ConstOpCPURcPtr GetLut1DCompactRenderer(ConstLut1DOpDataRcPtr & lut);
+
 } // namespace OCIO_NAMESPACE
 
 #endif
\ No newline at end of file
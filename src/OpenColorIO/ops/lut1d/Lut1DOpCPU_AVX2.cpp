@@ -8,6 +8,7 @@
 #include <string.h>
 
 #include "AVX2.h"
+#include "ops/lut1d/Lut1DCompactSIMD.h"
 
 namespace OCIO_NAMESPACE
 {
@@ -172,6 +173,11 @@ Lut1DOpCPUApplyFunc * AVX2GetLut1DApplyFunc(BitDepth inBD, BitDepth outBD)
     return nullptr;
 }
 
+void applyLinearCompactAVX2(const uint16_t *lut1d, int dim, const float *src, float *dst, long numPixels)
+{
+    Lut1DCompactSIMD::ApplyLinear<VecAVX2>(lut1d, dim, src, dst, numPixels);
+}
+
 } // OCIO_NAMESPACE
 
 #endif // OCIO_USE_AVX2
\ No newline at end of file
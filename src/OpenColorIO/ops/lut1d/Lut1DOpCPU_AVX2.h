@@ -16,6 +16,9 @@ namespace OCIO_NAMESPACE
 
 Lut1DOpCPUApplyFunc * AVX2GetLut1DApplyFunc(BitDepth inBD, BitDepth outBD);
 
+// Version using a LUT stored as half floats (refer to Lut1DCompactSIMD.h).
+void applyLinearCompactAVX2(const uint16_t *lut1d, int dim, const float *src, float *dst, long numPixels);
+
 } // namespace OCIO_NAMESPACE
 
 #endif // OCIO_USE_AVX2
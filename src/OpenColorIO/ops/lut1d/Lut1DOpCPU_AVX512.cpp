@@ -8,6 +8,7 @@
 #include <string.h>
 
 #include "AVX512.h"
+#include "ops/lut1d/Lut1DCompactSIMD.h"
 
 namespace OCIO_NAMESPACE
 {
@@ -145,6 +146,11 @@ Lut1DOpCPUApplyFunc * AVX512GetLut1DApplyFunc(BitDepth inBD, BitDepth outBD)
     return nullptr;
 }
 
+void applyLinearCompactAVX512(const uint16_t *lut1d, int dim, const float *src, float *dst, long numPixels)
+{
+    Lut1DCompactSIMD::ApplyLinear<VecAVX512>(lut1d, dim, src, dst, numPixels);
+}
+
 } // OCIO_NAMESPACE
 
 #endif // OCIO_USE_AVX512
\ No newline at end of file
@@ -8,6 +8,7 @@
 #include <string.h>
 
 #include "SSE2.h"
+#include "ops/lut1d/Lut1DCompactSIMD.h"
 
 namespace OCIO_NAMESPACE
 {
@@ -203,6 +204,11 @@ Lut1DOpCPUApplyFunc * SSE2GetLut1DApplyFunc(BitDepth inBD, BitDepth outBD)
     return nullptr;
 }
 
+void applyLinearCompactSSE2(const uint16_t *lut1d, int dim, const float *src, float *dst, long numPixels)
+{
+    Lut1DCompactSIMD::ApplyLinear<VecSSE2>(lut1d, dim, src, dst, numPixels);
+}
+
 } // OCIO_NAMESPACE
 
 #endif // OCIO_USE_SSE2
\ No newline at end of file
@@ -0,0 +1,156 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#ifndef INCLUDED_OCIO_LUT3DCOMPACTSIMD_H
+#define INCLUDED_OCIO_LUT3DCOMPACTSIMD_H
+
+
+#include <cstdint>
+
+#include <OpenColorIO/OpenColorIO.h>
+
+#include "SIMDUtils.h"
+
+
+namespace OCIO_NAMESPACE
+{
+
+// Vectorized version of the Lut3D renderers using a LUT stored as half floats (refer to
+// Lut3DCompactRenderer in Lut3DOpCPU.cpp) shared by the scalar, SSE2, AVX2 and AVX-512 versions.
+// The LUT holds the RGB values of the dim^3 entries (i.e. blue changes fastest) followed by one
+// padding element, and the entries are loaded using V::gatherHalf().
+//
+// Note that all the LUT positions are float values (i.e. exact as the maximum LUT size is
+// 129^3 * 3 < 2^24) so the same code works for all the instruction sets.
+
+namespace Lut3DCompactSIMD
+{
+
+// Grid position of one channel i.e. the positions of the two surrounding entries (already
+// multiplied by the channel stride) and the fraction between them.
+template<typename V>
+struct GridPos
+{
+    typedef typename V::vec vec;
+
+    GridPos(vec x, vec lutMax, vec stride)
+    {
+        // Note that NaNs become 0.
+        x = V::min(V::max(V::mul(x, lutMax), V::set1(0.f)), lutMax);
+
+        const vec p = V::trunc(x);
+        m_frac = V::sub(x, p);
+        m_prev = V::mul(p, stride);
+        m_next = V::mul(V::min(V::add(p, V::set1(1.f)), lutMax), stride);
+    }
+
+    vec m_prev;
+    vec m_next;
+    vec m_frac;
+};
+
+// Add the weighted LUT entry at position 'pos' to the RGB values.
+template<typename V>
+inline void AddEntry(const uint16_t * lut, typename V::vec pos, typename V::vec weight,
+                     typename V::vec & r, typename V::vec & g, typename V::vec & b)
+{
+    r = V::add(r, V::mul(weight, V::gatherHalf(lut, pos)));
+    g = V::add(g, V::mul(weight, V::gatherHalf(lut + 1, pos)));
+    b = V::add(b, V::mul(weight, V::gatherHalf(lut + 2, pos)));
+}
+
+template<typename V>
+void ApplyTetrahedral(const uint16_t * lut, long dim, const float * src, float * dst,
+                      long numPixels)
+{
+    typedef typename V::vec vec;
+
+    const vec lutMax  = V::set1(static_cast<float>(dim - 1));
+    const vec strideR = V::set1(static_cast<float>(3 * dim * dim));
+    const vec strideG = V::set1(static_cast<float>(3 * dim));
+    const vec strideB = V::set1(3.f);
+
+    ApplySIMDKernel<V>(src, dst, numPixels, [&](vec & r, vec & g, vec & b)
+    {
+        const GridPos<V> pr(r, lutMax, strideR);
+        const GridPos<V> pg(g, lutMax, strideG);
+        const GridPos<V> pb(b, lutMax, strideB);
+
+        // Sort the fractions i.e. x0 >= x1 >= x2.
+        const vec x0 = V::max(V::max(pr.m_frac, pg.m_frac), pb.m_frac);
+        const vec x1 = V::max(V::min(pr.m_frac, pg.m_frac),
+                              V::min(V::max(pr.m_frac, pg.m_frac), pb.m_frac));
+        const vec x2 = V::min(V::min(pr.m_frac, pg.m_frac), pb.m_frac);
+
+        // The two middle vertices of the tetrahedron step along the axis of the largest
+        // fraction, then along the two axes of the largest fractions. When fractions are equal
+        // the selected vertex could differ from the scalar version but its weight is then 0.
+        const vec pos000 = V::add(V::add(pr.m_prev, pg.m_prev), pb.m_prev);
+        const vec pos111 = V::add(V::add(pr.m_next, pg.m_next), pb.m_next);
+
+        const vec posA = V::add(V::add(V::select(V::less(pr.m_frac, x0), pr.m_prev, pr.m_next),
+                                       V::select(V::less(pg.m_frac, x0), pg.m_prev, pg.m_next)),
+                                V::select(V::less(pb.m_frac, x0), pb.m_prev, pb.m_next));
+
+        const vec posB
+            = V::add(V::add(V::select(V::greater(pr.m_frac, x2), pr.m_next, pr.m_prev),
+                            V::select(V::greater(pg.m_frac, x2), pg.m_next, pg.m_prev)),
+                     V::select(V::greater(pb.m_frac, x2), pb.m_next, pb.m_prev));
+
+        r = g = b = V::set1(0.f);
+
+        AddEntry<V>(lut, pos000, V::sub(V::set1(1.f), x0), r, g, b);
+        AddEntry<V>(lut, posA, V::sub(x0, x1), r, g, b);
+        AddEntry<V>(lut, posB, V::sub(x1, x2), r, g, b);
+        AddEntry<V>(lut, pos111, x2, r, g, b);
+    });
+}
+
+template<typename V>
+void ApplyTrilinear(const uint16_t * lut, long dim, const float * src, float * dst,
+                    long numPixels)
+{
+    typedef typename V::vec vec;
+
+    const vec lutMax  = V::set1(static_cast<float>(dim - 1));
+    const vec strideR = V::set1(static_cast<float>(3 * dim * dim));
+    const vec strideG = V::set1(static_cast<float>(3 * dim));
+    const vec strideB = V::set1(3.f);
+    const vec one     = V::set1(1.f);
+
+    ApplySIMDKernel<V>(src, dst, numPixels, [&](vec & r, vec & g, vec & b)
+    {
+        const GridPos<V> pr(r, lutMax, strideR);
+        const GridPos<V> pg(g, lutMax, strideG);
+        const GridPos<V> pb(b, lutMax, strideB);
+
+        const vec wr[2] = { V::sub(one, pr.m_frac), pr.m_frac };
+        const vec wg[2] = { V::sub(one, pg.m_frac), pg.m_frac };
+        const vec wb[2] = { V::sub(one, pb.m_frac), pb.m_frac };
+
+        const vec posR[2] = { pr.m_prev, pr.m_next };
+        const vec posG[2] = { pg.m_prev, pg.m_next };
+        const vec posB[2] = { pb.m_prev, pb.m_next };
+
+        r = g = b = V::set1(0.f);
+
+        for (int i = 0; i < 2; ++i)
+        {
+            for (int j = 0; j < 2; ++j)
+            {
+                const vec posRG = V::add(posR[i], posG[j]);
+                const vec wRG = V::mul(wr[i], wg[j]);
+
+                AddEntry<V>(lut, V::add(posRG, posB[0]), V::mul(wRG, wb[0]), r, g, b);
+                AddEntry<V>(lut, V::add(posRG, posB[1]), V::mul(wRG, wb[1]), r, g, b);
+            }
+        }
+    });
+}
+
+} // namespace Lut3DCompactSIMD
+
+} // namespace OCIO_NAMESPACE
+
+#endif // INCLUDED_OCIO_LUT3DCOMPACTSIMD_H
@@ -241,9 +241,7 @@ void CreateLut3DTransform(GroupTransformRcPtr & group, ConstOpRcPtr & op)
     }
     auto lutData = DynamicPtrCast<const Lut3DOpData>(op->data());
     auto lutTransform = Lut3DTransform::Create();
-    Lut3DOpData & data = dynamic_cast<Lut3DTransformImpl*>(lutTransform.get())->data();
-
-    data = *lutData;
+    dynamic_cast<Lut3DTransformImpl*>(lutTransform.get())->setData(*lutData);
 
     group->appendTransform(lutTransform);
 }
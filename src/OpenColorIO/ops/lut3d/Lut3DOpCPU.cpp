@@ -19,6 +19,7 @@
 #include "Lut3DOpCPU_AVX.h"
 #include "Lut3DOpCPU_AVX2.h"
 #include "Lut3DOpCPU_AVX512.h"
+#include "ops/lut3d/Lut3DCompactSIMD.h"
 
 namespace OCIO_NAMESPACE
 {
@@ -26,6 +27,7 @@ namespace
 {
 
 typedef void (apply_lut_func)(const float *lut3d, int dim, const float *src, float *dst, int total_pixel_count);
+typedef void (apply_lut_compact_func)(const uint16_t *lut3d, int dim, const float *src, float *dst, int total_pixel_count);
 
 class BaseLut3DRenderer : public OpCPU
 {
@@ -75,6 +77,30 @@ public:
 
 };
 
+// Forward renderer storing the LUT values as half floats i.e. 6 bytes per entry instead of the
+// 16 bytes of the other renderers. The values are clamped to the half float range and the
+// relative error of each entry is at most 2^-11.
+class Lut3DCompactRenderer : public OpCPU
+{
+public:
+    explicit Lut3DCompactRenderer(ConstLut3DOpDataRcPtr & lut);
+    virtual ~Lut3DCompactRenderer();
+
+    void apply(const void * inImg, void * outImg, long numPixels) const override;
+
+private:
+    // RGB values followed by one padding element (refer to Lut3DCompactSIMD.h).
+    std::vector<uint16_t>  m_lut;
+    long                   m_dim;
+    bool                   m_tetrahedral;
+    apply_lut_compact_func *m_applyLutFunc;
+
+private:
+    Lut3DCompactRenderer() = delete;
+    Lut3DCompactRenderer(const Lut3DCompactRenderer&) = delete;
+    Lut3DCompactRenderer& operator=(const Lut3DCompactRenderer&) = delete;
+};
+
 class InvLut3DRenderer : public OpCPU
 {
     typedef std::vector<unsigned long> ulongVector;
@@ -1733,6 +1759,68 @@ void InvLut3DRenderer::apply(const void * inImg, void * outImg, long numPixels)
     }
 }
 
+Lut3DCompactRenderer::Lut3DCompactRenderer(ConstLut3DOpDataRcPtr & lut)
+    : OpCPU()
+    , m_dim(lut->getArray().getLength())
+    , m_tetrahedral(lut->getConcreteInterpolation() == INTERP_TETRAHEDRAL)
+    , m_applyLutFunc(nullptr)
+{
+    const Array::Values & values = lut->getArray().getValues();
+    const size_t numValues = m_dim * m_dim * m_dim * 3;
+
+    m_lut.resize(numValues + 1, 0);
+    for (size_t idx = 0; idx < numValues; ++idx)
+    {
+        // Note that NaNs become 0 and the infinities become the largest half float values.
+        const float val = Clamp(SanitizeFloat(values[idx]), -HALF_MAX, HALF_MAX);
+        m_lut[idx] = half(val).bits();
+    }
+
+    #if OCIO_USE_SSE2
+    if (CPUInfo::instance().hasSSE2())
+    {
+        m_applyLutFunc = m_tetrahedral ? applyTetrahedralCompactSSE2 : applyTrilinearCompactSSE2;
+    }
+    #endif
+
+    #if OCIO_USE_AVX2
+    if (CPUInfo::instance().hasAVX2() && !CPUInfo::instance().AVX2SlowGather())
+    {
+        m_applyLutFunc = m_tetrahedral ? applyTetrahedralCompactAVX2 : applyTrilinearCompactAVX2;
+    }
+    #endif
+
+    #if OCIO_USE_AVX512
+    if (CPUInfo::instance().hasAVX512())
+    {
+        m_applyLutFunc = m_tetrahedral ? applyTetrahedralCompactAVX512 : applyTrilinearCompactAVX512;
+    }
+    #endif
+}
+
+Lut3DCompactRenderer::~Lut3DCompactRenderer()
+{
+}
+
+void Lut3DCompactRenderer::apply(const void * inImg, void * outImg, long numPixels) const
+{
+    const float * in = (const float *)inImg;
+    float * out = (float *)outImg;
+
+    if (m_applyLutFunc)
+    {
+        m_applyLutFunc(m_lut.data(), m_dim, in, out, numPixels);
+    }
+    else if (m_tetrahedral)
+    {
+        Lut3DCompactSIMD::ApplyTetrahedral<VecScalar>(m_lut.data(), m_dim, in, out, numPixels);
+    }
+    else
+    {
+        Lut3DCompactSIMD::ApplyTrilinear<VecScalar>(m_lut.data(), m_dim, in, out, numPixels);
+    }
+}
+
 ConstOpCPURcPtr GetForwardLut3DRenderer(ConstLut3DOpDataRcPtr & lut)
 {
     const Interpolation interp = lut->getConcreteInterpolation();
@@ -1762,4 +1850,15 @@ ConstOpCPURcPtr GetLut3DRenderer(ConstLut3DOpDataRcPtr & lut)
     throw Exception("Illegal LUT3D direction.");
 }
 
+ConstOpCPURcPtr GetLut3DCompactRenderer(ConstLut3DOpDataRcPtr & lut)
+{
+    if (lut->getDirection() == TRANSFORM_DIR_FORWARD)
+    {
+        return std::make_shared<Lut3DCompactRenderer>(lut);
+    }
+
+    // The inverse renderer does not use the LUT values directly.
+    return GetLut3DRenderer(lut);
+}
+
 } // namespace OCIO_NAMESPACE
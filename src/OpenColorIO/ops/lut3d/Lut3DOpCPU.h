@@ -14,6 +14,10 @@ namespace OCIO_NAMESPACE
 
 ConstOpCPURcPtr GetLut3DRenderer(ConstLut3DOpDataRcPtr & lut);
 
+// Get a renderer storing the LUT values as half floats (i.e. smaller but less accurate). Note
+// that only the forward direction uses a different renderer.
+ConstOpCPURcPtr GetLut3DCompactRenderer(ConstLut3DOpDataRcPtr & lut);
+
 } // namespace OCIO_NAMESPACE
 
 #endif
\ No newline at end of file
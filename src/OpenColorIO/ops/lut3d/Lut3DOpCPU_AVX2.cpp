@@ -8,6 +8,7 @@
 #include <string.h>
 
 #include "AVX2.h"
+#include "ops/lut3d/Lut3DCompactSIMD.h"
 
 namespace OCIO_NAMESPACE
 {
@@ -275,6 +276,16 @@ void applyTetrahedralAVX2(const float *lut3d, int dim, const float *src, float *
     applyTetrahedralAVX2Func<BIT_DEPTH_F32, BIT_DEPTH_F32>(lut3d, dim, src, dst, total_pixel_count);
 }
 
+void applyTetrahedralCompactAVX2(const uint16_t *lut3d, int dim, const float *src, float *dst, int total_pixel_count)
+{
+    Lut3DCompactSIMD::ApplyTetrahedral<VecAVX2>(lut3d, dim, src, dst, total_pixel_count);
+}
+
+void applyTrilinearCompactAVX2(const uint16_t *lut3d, int dim, const float *src, float *dst, int total_pixel_count)
+{
+    Lut3DCompactSIMD::ApplyTrilinear<VecAVX2>(lut3d, dim, src, dst, total_pixel_count);
+}
+
 } // OCIO_NAMESPACE
 
 #endif // OCIO_USE_AVX2
\ No newline at end of file
@@ -8,6 +8,7 @@
 #include <string.h>
 
 #include "AVX512.h"
+#include "ops/lut3d/Lut3DCompactSIMD.h"
 
 namespace OCIO_NAMESPACE
 {
@@ -254,6 +255,16 @@ void applyTetrahedralAVX512(const float *lut3d, int dim, const float *src, float
     applyTetrahedralAVX512Func<BIT_DEPTH_F32, BIT_DEPTH_F32>(lut3d, dim, src, dst, total_pixel_count);
 }
 
+void applyTetrahedralCompactAVX512(const uint16_t *lut3d, int dim, const float *src, float *dst, int total_pixel_count)
+{
+    Lut3DCompactSIMD::ApplyTetrahedral<VecAVX512>(lut3d, dim, src, dst, total_pixel_count);
+}
+
+void applyTrilinearCompactAVX512(const uint16_t *lut3d, int dim, const float *src, float *dst, int total_pixel_count)
+{
+    Lut3DCompactSIMD::ApplyTrilinear<VecAVX512>(lut3d, dim, src, dst, total_pixel_count);
+}
+
 } // OCIO_NAMESPACE
 
 #endif // OCIO_USE_AVX512
\ No newline at end of file
@@ -14,6 +14,10 @@ namespace OCIO_NAMESPACE
 
 void applyTetrahedralAVX512(const float *lut3d, int dim, const float *src, float *dst, int total_pixel_count);
 
+// Versions using a LUT stored as half floats (refer to Lut3DCompactSIMD.h).
+void applyTetrahedralCompactAVX512(const uint16_t *lut3d, int dim, const float *src, float *dst, int total_pixel_count);
+void applyTrilinearCompactAVX512(const uint16_t *lut3d, int dim, const float *src, float *dst, int total_pixel_count);
+
 } // namespace OCIO_NAMESPACE
 
 #endif // OCIO_USE_AVX512
@@ -6,6 +6,7 @@
 #if OCIO_USE_SSE2
 
 #include "SSE2.h"
+#include "ops/lut3d/Lut3DCompactSIMD.h"
 
 namespace OCIO_NAMESPACE
 {
@@ -316,6 +317,16 @@ void applyTetrahedralSSE2(const float *lut3d, int dim, const float *src, float *
     applyTetrahedralSSE2Func<BIT_DEPTH_F32, BIT_DEPTH_F32>(lut3d, dim, src, dst, total_pixel_count);
 }
 
+void applyTetrahedralCompactSSE2(const uint16_t *lut3d, int dim, const float *src, float *dst, int total_pixel_count)
+{
+    Lut3DCompactSIMD::ApplyTetrahedral<VecSSE2>(lut3d, dim, src, dst, total_pixel_count);
+}
+
+void applyTrilinearCompactSSE2(const uint16_t *lut3d, int dim, const float *src, float *dst, int total_pixel_count)
+{
+    Lut3DCompactSIMD::ApplyTrilinear<VecSSE2>(lut3d, dim, src, dst, total_pixel_count);
+}
+
 } // OCIO_NAMESPACE
 
 #endif // OCIO_USE_SSE2
\ No newline at end of file
@@ -1,14 +1,22 @@
 // SPDX-License-Identifier: BSD-3-Clause
 // Copyright Contributors to the OpenColorIO Project.
 
+#include <algorithm>
+#include <atomic>
+#include <exception>
 #include <sstream>
+#include <system_error>
+#include <thread>
+#include <vector>
 
 #include <OpenColorIO/OpenColorIO.h>
 
 #include "BitDepthUtils.h"
+#include "Caching.h"
 #include "HashUtils.h"
 #include "MathUtils.h"
 #include "ops/lut3d/Lut3DOp.h"
+#include "ops/lut3d/Lut3DOpCPU.h"
 #include "ops/lut3d/Lut3DOpData.h"
 #include "ops/OpTools.h"
 #include "ops/range/RangeOpData.h"
@@ -27,6 +35,165 @@ namespace OCIO_NAMESPACE
 // forward 3D LUT are clamped to someplace on the exterior surface
 // of the 3D LUT.
 
+namespace
+{
+
+// The grid size of the 3D LUTs baked from the inverse 3D LUTs.
+std::atomic<unsigned> g_fastInverseGridSize{ 48 };
+
+// The baked LUTs are memoized per inverse LUT (i.e. using its cache ID) and grid size.
+
+struct FastInverseLut3DEntry
+{
+    Mutex mutex;
+    ConstLut3DOpDataRcPtr lut;
+};
+
+typedef std::shared_ptr<FastInverseLut3DEntry> FastInverseLut3DEntryPtr;
+
+class FastInverseLut3DCache : public GenericCache<std::string, FastInverseLut3DEntryPtr>
+{
+public:
+    FastInverseLut3DCache()
+    {
+        // Note that a 129x129x129 LUT takes 25 MB.
+        setCapacity(16);
+    }
+};
+
+FastInverseLut3DCache g_fastInverseLut3DCache;
+
+// The minimum number of grid points processed by a thread.
+constexpr long MinPointsPerThread = 4096;
+
+// The number of grid points processed at once by the renderer.
+constexpr long PointsBlockSize = 1024;
+
+// Evaluate the inverse LUT on packed RGB values (in place). The points are split between
+// several threads sharing the same renderer so the RangeTree of the inverse LUT is only
+// built once.
+void EvalInverseLut3D(ConstLut3DOpDataRcPtr & lut, float * values, long numPoints)
+{
+    ConstOpCPURcPtr renderer = GetLut3DRenderer(lut);
+
+    const long maxThreads
+        = static_cast<long>(std::max(1u, std::thread::hardware_concurrency()));
+    const long numBands
+        = std::max(1L, std::min(maxThreads, numPoints / MinPointsPerThread));
+
+    std::vector<std::exception_ptr> errors(numBands);
+
+    auto processBand = [&renderer, &errors, values, numPoints, numBands](long band)
+    {
+        try
+        {
+            const long begin = numPoints * band / numBands;
+            const long end   = numPoints * (band + 1) / numBands;
+
+            std::vector<float> rgba(PointsBlockSize * 4);
+
+            for (long first = begin; first < end; first += PointsBlockSize)
+            {
+                const long count = std::min(PointsBlockSize, end - first);
+                float * rgb = values + 3 * first;
+
+                for (long idx = 0; idx < count; ++idx)
+                {
+                    rgba[4 * idx + 0] = rgb[3 * idx + 0];
+                    rgba[4 * idx + 1] = rgb[3 * idx + 1];
+                    rgba[4 * idx + 2] = rgb[3 * idx + 2];
+                    rgba[4 * idx + 3] = 1.0f;
+                }
+
+                renderer->apply(rgba.data(), rgba.data(), count);
+
+                for (long idx = 0; idx < count; ++idx)
+                {
+                    rgb[3 * idx + 0] = rgba[4 * idx + 0];
+                    rgb[3 * idx + 1] = rgba[4 * idx + 1];
+                    rgb[3 * idx + 2] = rgba[4 * idx + 2];
+                }
+            }
+        }
+        catch (...)
+        {
+            errors[band] = std::current_exception();
+        }
+    };
+
+    std::vector<std::thread> workers;
+    workers.reserve(numBands - 1);
+
+    for (long band = 1; band < numBands; ++band)
+    {
+        try
+        {
+            workers.emplace_back(processBand, band);
+        }
+        catch (const std::system_error &)
+        {
+            // Process the band in the caller thread if a new thread cannot be started.
+            processBand(band);
+        }
+    }
+
+    // The caller thread processes the first band.
+    processBand(0);
+
+    for (auto & worker : workers)
+    {
+        worker.join();
+    }
+
+    for (const auto & error : errors)
+    {
+        if (error)
+        {
+            std::rethrow_exception(error);
+        }
+    }
+}
+
+ConstLut3DOpDataRcPtr BakeFastLut3D(ConstLut3DOpDataRcPtr & lut, long gridSize)
+{
+    lut->validate();
+
+    // Like the composition of LUTs, use the larger of both grid sizes.
+    const long domainSize = std::max(gridSize, static_cast<long>(lut->getArray().getLength()));
+
+    Lut3DOpDataRcPtr result = std::make_shared<Lut3DOpData>(domainSize);
+
+    Array::Values & values = result->getArray().getValues();
+    EvalInverseLut3D(lut, values.data(), domainSize * domainSize * domainSize);
+
+    return result;
+}
+
+} // anon.
+
+unsigned GetFastInverseLut3DGridSize()
+{
+    return g_fastInverseGridSize;
+}
+
+void SetFastInverseLut3DGridSize(unsigned gridSize)
+{
+    if (gridSize < 2 || gridSize > Lut3DOpData::maxSupportedLength)
+    {
+        std::ostringstream oss;
+        oss << "Fast inverse Lut3D grid size '" << gridSize
+            << "' must be in the range [2, " << Lut3DOpData::maxSupportedLength << "].";
+        throw Exception(oss.str().c_str());
+    }
+
+    g_fastInverseGridSize = gridSize;
+}
+
+void ClearFastInverseLut3DCache()
+{
+    g_fastInverseLut3DCache.clear();
+}
+
 Lut3DOpDataRcPtr MakeFastLut3DFromInverse(ConstLut3DOpDataRcPtr & lut)
 {
     if (lut->getDirection() != TRANSFORM_DIR_INVERSE)
@@ -37,18 +204,32 @@ Lut3DOpDataRcPtr MakeFastLut3DFromInverse(ConstLut3DOpDataRcPtr & lut)
     // TODO: The FastLut will limit inputs to [0,1].  If the forward LUT has an extended range
     // output, perhaps add a Range op before the FastLut to bring values into [0,1].
 
-    // Make a domain for the composed Lut3D.
-    // TODO: Using a large number like 48 here is better for accuracy,
-    // but it causes a delay when creating the renderer.
-    const long GridSize = 48u;
-    Lut3DOpDataRcPtr newDomain = std::make_shared<Lut3DOpData>(GridSize);
+    // Note: Using a large grid size is better for accuracy but it causes a delay when creating
+    // the renderer, hence the grid points are evaluated in parallel and the result is cached.
+    const unsigned gridSize = GetFastInverseLut3DGridSize();
+
+    std::ostringstream key;
+    key << lut->getCacheID() << gridSize;
 
-    newDomain->setFileOutputBitDepth(lut->getFileOutputBitDepth());
+    FastInverseLut3DEntryPtr entry = g_fastInverseLut3DCache.getSharedEntry(key.str());
 
-    ConstLut3DOpDataRcPtr constNewDomain = newDomain;
+    ConstLut3DOpDataRcPtr baked;
+    {
+        AutoMutex lock(entry->mutex);
+        if (!entry->lut)
+        {
+            entry->lut = BakeFastLut3D(lut, gridSize);
+        }
+        baked = entry->lut;
+    }
+
+    // The cached LUT is shared so return a copy holding the metadata of the inverse LUT.
+    Lut3DOpDataRcPtr result = baked->clone();
+
+    // TODO: May want to revisit metadata propagation.
+    result->getFormatMetadata().combine(lut->getFormatMetadata());
 
-    // Compose the LUT newDomain with our inverse LUT (using INV_EXACT style).
-    Lut3DOpDataRcPtr result = Lut3DOpData::Compose(constNewDomain, lut);
+    result->setFileOutputBitDepth(lut->getFileOutputBitDepth());
 
     // The INV_EXACT inversion style computes an inverse to the tetrahedral
     // style of forward evaluation.
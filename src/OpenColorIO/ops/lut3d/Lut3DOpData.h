@@ -142,8 +142,13 @@ bool operator==(const Lut3DOpData & lhs, const Lut3DOpData & rhs);
 // Make a forward Lut3DOpData that approximates the exact inverse Lut3DOpData
 // to be used for the fast rendering style.
 // LUT has to be inverse or the function will throw.
+// The grid size is the larger of GetFastInverseLut3DGridSize() and the LUT size. The results
+// are cached per LUT (i.e. using its cache ID) and grid size.
 Lut3DOpDataRcPtr MakeFastLut3DFromInverse(ConstLut3DOpDataRcPtr & lut);
 
+// Clear the cache of MakeFastLut3DFromInverse().
+void ClearFastInverseLut3DCache();
+
 } // namespace OCIO_NAMESPACE
 
 #endif
@@ -2,6 +2,8 @@
 // Copyright Contributors to the OpenColorIO Project.
 
 #include <algorithm>
+#include <atomic>
+#include <chrono>
 #include <fstream>
 #include <map>
 #include <sstream>
@@ -19,6 +21,7 @@
 #include "Mutex.h"
 #include "OCIOZArchive.h"
 #include "ops/noop/NoOps.h"
+#include "ParseUtils.h"
 #include "PathUtils.h"
 #include "Platform.h"
 #include "utils/StringUtils.h"
@@ -786,17 +789,98 @@ struct FileCacheResult
     CachedFileRcPtr cachedFile;
     std::string exceptionText;
 
+    // The file system information when the file was loaded, to detect a modified file.
+    bool exists = false;
+    Platform::FileStamp stamp;
+    std::chrono::steady_clock::time_point validationTime;
+
     FileCacheResult() = default;
 };
 
 typedef OCIO_SHARED_PTR<FileCacheResult> FileCacheResultPtr;
 
+// The file content cache is unbounded unless the OCIO_FILE_CACHE_CAPACITY env. variable is set,
+// and does not check for modified files unless the OCIO_FILE_CACHE_VALIDATION_INTERVAL env.
+// variable is set.
+class FileCache : public GenericCache<std::string, FileCacheResultPtr>
+{
+public:
+    FileCache()
+        :   GenericCache<std::string, FileCacheResultPtr>()
+    {
+        std::string envvar;
+        int value = 0;
+        if (Platform::Getenv(OCIO_FILE_CACHE_CAPACITY, envvar)
+            && StringToInt(&value, envvar.c_str(), true) && value > 0)
+        {
+            setCapacity(static_cast<size_t>(value));
+        }
+
+        if (Platform::Getenv(OCIO_FILE_CACHE_VALIDATION_INTERVAL, envvar)
+            && StringToInt(&value, envvar.c_str(), true))
+        {
+            m_validationInterval = value;
+        }
+    }
+
+    void setValidationInterval(int milliseconds) noexcept { m_validationInterval = milliseconds; }
+    int getValidationInterval() const noexcept { return m_validationInterval; }
+
+    CacheStatistics getStatistics() const
+    {
+        CacheStatistics stats = GenericCache<std::string, FileCacheResultPtr>::getStatistics();
+        stats.m_invalidations = m_invalidations;
+        return stats;
+    }
+
+    // Record the file system information of the file about to be loaded.
+    // Note that the lock of the entry must be held.
+    void startLoading(FileCacheResult & result, const std::string & filepath)
+    {
+        result.exists         = Platform::GetFileStamp(filepath, result.stamp);
+        result.validationTime = std::chrono::steady_clock::now();
+    }
+
+    // Check if the loaded file was modified, in which case the entry is marked to be reloaded.
+    // Note that the lock of the entry must be held.
+    bool validate(FileCacheResult & result, const std::string & filepath)
+    {
+        const int interval = m_validationInterval;
+        if (interval < 0 || !result.ready)
+        {
+            return false;
+        }
+
+        const auto now = std::chrono::steady_clock::now();
+        if (interval > 0 && now - result.validationTime < std::chrono::milliseconds(interval))
+        {
+            return false;
+        }
+        result.validationTime = now;
+
+        Platform::FileStamp stamp;
+        const bool exists = Platform::GetFileStamp(filepath, stamp);
+        if (exists == result.exists && (!exists || stamp == result.stamp))
+        {
+            return false;
+        }
+
+        result.ready = false;
+        ++m_invalidations;
+        return true;
+    }
+
+private:
+    std::atomic<int> m_validationInterval{ -1 };
+    std::atomic<size_t> m_invalidations{ 0 };
+};
+
 } // namespace
 
 
 // A global file content cache.
 template class GenericCache<std::string, FileCacheResultPtr>;
-GenericCache<std::string, FileCacheResultPtr> g_fileCache;
+FileCache g_fileCache;
 
 void GetCachedFileAndFormat(FileFormat * & format,
                             CachedFileRcPtr & cachedFile,
@@ -804,40 +888,20 @@ void GetCachedFileAndFormat(FileFormat * & format,
                             Interpolation interp,
                             const Config& config)
 {
-    // Have a two-mutex approach to decouple the cache entry creation from
-    // the data creation. It was originally done to improve the multi-threaded
-    // file lookup.  Refer to PR #309 for details.
-
-    // Load the file cache ptr from the global map
-    FileCacheResultPtr result;
-    {
-        AutoMutex guard(g_fileCache.lock());
-    
-        if (g_fileCache.isEnabled())
-        {
-            // As the entry is a shared pointer instance, having an empty one
-            // means that the entry does not exist in the cache. So, it provides
-            // a fast existence check.
-            result = g_fileCache[filepath];
-            if (!result)
-            {
-                result = std::make_shared<FileCacheResult>();
-                g_fileCache[filepath] = result;
-            }
-        }
-        else
-        {
-            result = std::make_shared<FileCacheResult>();
-        }
-    }
+    // Load the file cache ptr from the global map (refer to GenericCache::getSharedEntry()).
+    FileCacheResultPtr result = g_fileCache.getSharedEntry(filepath);
 
     // If this file has already been loaded, return the result immediately.
 
     AutoMutex lock(result->mutex);
+    g_fileCache.validate(*result, filepath);
     if (!result->ready)
     {
         result->ready = true;
         result->error = false;
+        result->cachedFile.reset();
+
+        g_fileCache.startLoading(*result, filepath);
 
         try
         {
@@ -887,11 +951,96 @@ void GetCachedFileAndFormat(FileFormat * & format,
     }
 }
 
+namespace
+{
+
+FileCacheResultPtr FindCachedFile(const std::string & filepath)
+{
+    AutoMutex guard(g_fileCache.lock());
+
+    auto it = g_fileCache.find(filepath);
+    return it == g_fileCache.end() ? FileCacheResultPtr() : it->second;
+}
+
+CachedFileState GetFileState(const std::string & filepath)
+{
+    CachedFileState state;
+    state.m_exists = Platform::GetFileStamp(filepath, state.m_stamp);
+    return state;
+}
+
+} // anon.
+
+CachedFileState GetCachedFileState(const std::string & filepath)
+{
+    if (FileCacheResultPtr result = FindCachedFile(filepath))
+    {
+        AutoMutex lock(result->mutex);
+        if (result->ready)
+        {
+            CachedFileState state;
+            state.m_exists = result->exists;
+            state.m_stamp  = result->stamp;
+            return state;
+        }
+    }
+
+    return GetFileState(filepath);
+}
+
+bool IsCachedFileModified(const std::string & filepath, const CachedFileState & state)
+{
+    if (g_fileCache.getValidationInterval() < 0)
+    {
+        return false;
+    }
+
+    if (FileCacheResultPtr result = FindCachedFile(filepath))
+    {
+        AutoMutex lock(result->mutex);
+        g_fileCache.validate(*result, filepath);
+        if (result->ready)
+        {
+            return result->exists != state.m_exists
+                || (state.m_exists && result->stamp != state.m_stamp);
+        }
+    }
+
+    // The file is not in the cache (e.g. evicted) or is about to be reloaded, so check the file
+    // itself.
+    return GetFileState(filepath) != state;
+}
+
 void ClearFileTransformCaches()
 {
     g_fileCache.clear();
 }
 
+void SetFileCacheCapacity(size_t capacity)
+{
+    g_fileCache.setCapacity(capacity);
+}
+
+size_t GetFileCacheCapacity()
+{
+    return g_fileCache.getCapacity();
+}
+
+CacheStatistics GetFileCacheStatistics()
+{
+    return g_fileCache.getStatistics();
+}
+
+void SetFileCacheValidationInterval(int milliseconds)
+{
+    g_fileCache.setValidationInterval(milliseconds);
+}
+
+int GetFileCacheValidationInterval()
+{
+    return g_fileCache.getValidationInterval();
+}
+
 void BuildFileTransformOps(OpRcPtrVec & ops,
                            const Config& config,
                            const ConstContextRcPtr & context,
@@ -12,6 +12,7 @@
 
 #include "Op.h"
 #include "ops/noop/NoOps.h"
+#include "Platform.h"
 #include "PrivateTypes.h"
 #include "utils/StringUtils.h"
 
@@ -114,6 +115,29 @@ void GetCachedFileAndFormat(FileFormat * & format,
                             Interpolation interp,
                             const Config& config);
 
+// The file system information of a file used by a processor, to detect a modified file.
+struct CachedFileState
+{
+    bool m_exists = false;
+    Platform::FileStamp m_stamp;
+
+    bool operator==(const CachedFileState & rhs) const noexcept
+    {
+        return m_exists == rhs.m_exists && (!m_exists || m_stamp == rhs.m_stamp);
+    }
+    bool operator!=(const CachedFileState & rhs) const noexcept { return !(*this == rhs); }
+};
+
+// Get the file system information of the file when it was loaded in the FileTransform cache, or
+// its current one if the file is not in the cache (e.g. the cache is disabled).
+CachedFileState GetCachedFileState(const std::string & filepath);
+
+// Check if the file was modified since its state was recorded. The state of the file in the
+// FileTransform cache is used (the file is then reloaded on its next access), or the current
+// one if the file is not in the cache anymore (e.g. evicted). Always false when the validation
+// of the cached files is disabled i.e. refer to SetFileCacheValidationInterval().
+bool IsCachedFileModified(const std::string & filepath, const CachedFileState & state);
+
 typedef std::map<std::string, FileFormat*> FileFormatMap;
 typedef std::vector<FileFormat*> FileFormatVector;
 typedef std::map<std::string, FileFormatVector> FileFormatVectorMap;
@@ -8,6 +8,7 @@
 
 #include <OpenColorIO/OpenColorIO.h>
 
+#include "HashUtils.h"
 #include "transforms/Lut1DTransform.h"
 
 namespace OCIO_NAMESPACE
@@ -42,7 +43,7 @@ Lut1DTransformImpl::Lut1DTransformImpl(Lut1DOpData::HalfFlags halfFlag, unsigned
 TransformRcPtr Lut1DTransformImpl::createEditableCopy() const
 {
     Lut1DTransformRcPtr transform = Lut1DTransform::Create();
-    dynamic_cast<Lut1DTransformImpl*>(transform.get())->data() = data();
+    dynamic_cast<Lut1DTransformImpl*>(transform.get())->setData(data());
     return transform;
 }
 
@@ -103,6 +104,7 @@ void Lut1DTransformImpl::setLength(unsigned long length)
     auto & lutArray = m_data.getArray();
     // Use NaNs for the 2048 NaN values in the domain.
     lutArray = Lut1DOpData::Lut3by1DArray(m_data.getHalfFlags(), 3, length, false);
+    resetValuesHash();
 }
 
 namespace
@@ -123,9 +125,10 @@ void CheckLUT1DIndex(const char * function, unsigned long index, unsigned long s
 void Lut1DTransformImpl::setValue(unsigned long index, float r, float g, float b)
 {
     CheckLUT1DIndex("setValue", index, getLength());
-    data().getArray()[3 * index] = r;
-    data().getArray()[3 * index + 1] = g;
-    data().getArray()[3 * index + 2] = b;
+    m_data.getArray()[3 * index] = r;
+    m_data.getArray()[3 * index + 1] = g;
+    m_data.getArray()[3 * index + 2] = b;
+    resetValuesHash();
 }
 
 void Lut1DTransformImpl::setInputHalfDomain(bool isHalfDomain) noexcept
@@ -181,6 +184,33 @@ Interpolation Lut1DTransformImpl::getInterpolation() const
     return data().getInterpolation();
 }
 
+void Lut1DTransformImpl::setData(const Lut1DOpData & data)
+{
+    m_data = data;
+    resetValuesHash();
+}
+
+void Lut1DTransformImpl::resetValuesHash()
+{
+    AutoMutex lock(m_valuesHashMutex);
+    m_valuesHashValid = false;
+}
+
+std::size_t Lut1DTransformImpl::getValuesHash() const
+{
+    AutoMutex lock(m_valuesHashMutex);
+
+    if (!m_valuesHashValid)
+    {
+        const auto & values = m_data.getArray().getValues();
+        m_valuesHash = CacheKeyHash(reinterpret_cast<const char *>(values.data()),
+                                    values.size() * sizeof(values[0]));
+        m_valuesHashValid = true;
+    }
+
+    return m_valuesHash;
+}
+
 std::ostream & operator<< (std::ostream & os, const Lut1DTransform & t)
 {
     os << "<Lut1DTransform ";
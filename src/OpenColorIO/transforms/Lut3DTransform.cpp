@@ -8,6 +8,7 @@
 
 #include <OpenColorIO/OpenColorIO.h>
 
+#include "HashUtils.h"
 #include "transforms/Lut3DTransform.h"
 
 namespace OCIO_NAMESPACE
@@ -40,7 +41,7 @@ Lut3DTransformImpl::Lut3DTransformImpl(unsigned long gridSize)
 TransformRcPtr Lut3DTransformImpl::createEditableCopy() const
 {
     Lut3DTransformRcPtr transform = Lut3DTransform::Create();
-    dynamic_cast<Lut3DTransformImpl*>(transform.get())->data() = data();
+    dynamic_cast<Lut3DTransformImpl*>(transform.get())->setData(data());
     return transform;
 }
 
@@ -104,6 +105,7 @@ void Lut3DTransformImpl::setGridSize(unsigned long gridSize)
 {
     auto & lutArray = m_data.getArray();
     lutArray = Lut3DOpData::Lut3DArray(gridSize);
+    resetValuesHash();
 }
 
 namespace
@@ -138,9 +140,11 @@ void Lut3DTransformImpl::setValue(unsigned long indexR,
 
     // Array is stored in blue-fastest order.
     const unsigned long arrayIdx = 3 * ((indexR*gs + indexG)*gs + indexB);
-    m_data.getArray()[arrayIdx] = r;
-    m_data.getArray()[arrayIdx + 1] = g;
-    m_data.getArray()[arrayIdx + 2] = b;
+    auto & lutArray = m_data.getArray();
+    lutArray[arrayIdx] = r;
+    lutArray[arrayIdx + 1] = g;
+    lutArray[arrayIdx + 2] = b;
+    resetValuesHash();
 }
 
 
@@ -171,6 +175,33 @@ Interpolation Lut3DTransformImpl::getInterpolation() const
     return m_data.getInterpolation();
 }
 
+void Lut3DTransformImpl::setData(const Lut3DOpData & data)
+{
+    m_data = data;
+    resetValuesHash();
+}
+
+void Lut3DTransformImpl::resetValuesHash()
+{
+    AutoMutex lock(m_valuesHashMutex);
+    m_valuesHashValid = false;
+}
+
+std::size_t Lut3DTransformImpl::getValuesHash() const
+{
+    AutoMutex lock(m_valuesHashMutex);
+
+    if (!m_valuesHashValid)
+    {
+        const auto & values = m_data.getArray().getValues();
+        m_valuesHash = CacheKeyHash(reinterpret_cast<const char *>(values.data()),
+                                    values.size() * sizeof(values[0]));
+        m_valuesHashValid = true;
+    }
+
+    return m_valuesHash;
+}
+
 std::ostream & operator<< (std::ostream & os, const Lut3DTransform & t)
 {
     os << "<Lut3DTransform ";
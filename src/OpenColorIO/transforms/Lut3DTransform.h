@@ -7,6 +7,7 @@
 
 #include <OpenColorIO/OpenColorIO.h>
 
+#include "Mutex.h"
 #include "ops/lut3d/Lut3DOpData.h"
 
 
@@ -52,13 +53,26 @@ public:
     Interpolation getInterpolation() const override;
     void setInterpolation(Interpolation algo) override;
 
+    // Note that the LUT values must only be changed using the setters (e.g. setData()) so the
+    // hash of the values is recomputed on the next call to getValuesHash().
     Lut3DOpData & data() noexcept { return m_data; }
     const Lut3DOpData & data() const noexcept { return m_data; }
 
+    void setData(const Lut3DOpData & data);
+
+    // Hash of the LUT values, only recomputed when the values change.
+    std::size_t getValuesHash() const;
+
     static void deleter(Lut3DTransform * t);
 
 private:
+    void resetValuesHash();
+
     Lut3DOpData m_data;
+
+    mutable Mutex m_valuesHashMutex;
+    mutable std::size_t m_valuesHash = 0;
+    mutable bool m_valuesHashValid = false;
 };
 
 
@@ -7,10 +7,13 @@
 #include "apputils/argparse.h"
 #include "utils/StringUtils.h"
 
+#include <algorithm>
 #include <chrono>
 #include <cmath>
 #include <limits>
 #include <iostream>
+#include <sstream>
+#include <thread>
 
 
 namespace OCIO = OCIO_NAMESPACE;
@@ -167,6 +170,586 @@ void ProcessPixels(CustomMeasure & m,
     m.pause();
 }
 
+// Measure the hits of the processor cache of the config for all the (display, view) pairs.
+void MeasureCacheHits(const OCIO::ConstConfigRcPtr & srcConfig, unsigned iterations)
+{
+    OCIO::ConfigRcPtr config = srcConfig->createEditableCopy();
+
+    // The display/view transforms and their equivalent group transforms which contain all the
+    // inline LUTs, matrices, fixed functions, etc. of the display pipelines.
+    std::vector<OCIO::ConstTransformRcPtr> displayViews;
+    std::vector<OCIO::ConstTransformRcPtr> groups;
+
+    for (int d = 0; d < config->getNumDisplays(); ++d)
+    {
+        const char * display = config->getDisplay(d);
+        for (int v = 0; v < config->getNumViews(display); ++v)
+        {
+            OCIO::DisplayViewTransformRcPtr transform = OCIO::DisplayViewTransform::Create();
+            transform->setSrc(OCIO::ROLE_SCENE_LINEAR);
+            transform->setDisplay(display);
+            transform->setView(config->getView(display, v));
+
+            displayViews.push_back(transform);
+            groups.push_back(config->getProcessor(transform)->createGroupTransform());
+        }
+    }
+
+    std::cout << "Measure the processor cache hits for " << displayViews.size()
+              << " (display, view) pairs:" << std::endl << std::endl;
+
+    // Populate the cache.
+    for (const auto & group : groups)
+    {
+        config->getProcessor(group);
+    }
+
+    {
+        // The cache key used to be a hash of the serialized transform.
+        CustomMeasure m("Serialize the group transforms (previous cache key):\t", iterations);
+        for (unsigned iter = 0; iter < iterations; ++iter)
+        {
+            m.resume();
+            for (const auto & group : groups)
+            {
+                std::ostringstream oss;
+                oss << *group;
+                std::hash<std::string>{}(oss.str());
+            }
+            m.pause();
+        }
+    }
+
+    {
+        CustomMeasure m("Get the cached processors (group transforms):\t\t", iterations);
+        for (unsigned iter = 0; iter < iterations; ++iter)
+        {
+            m.resume();
+            for (const auto & group : groups)
+            {
+                config->getProcessor(group);
+            }
+            m.pause();
+        }
+    }
+
+    {
+        CustomMeasure m("Get the cached processors (display/view transforms):\t", iterations);
+        for (unsigned iter = 0; iter < iterations; ++iter)
+        {
+            m.resume();
+            for (const auto & transform : displayViews)
+            {
+                config->getProcessor(transform);
+            }
+            m.pause();
+        }
+    }
+
+    std::cout << std::endl << config->getProcessorCacheStatistics() << std::endl;
+}
+
+// Measure the color space lookups by name and alias for several config sizes.
+void MeasureColorSpaceLookups(unsigned iterations)
+{
+    std::cout << "Measure the color space lookups by name and alias:" << std::endl << std::endl;
+
+    // The same number of lookups is performed whatever the number of color spaces.
+    static constexpr size_t NumLookups = 1000;
+
+    for (size_t numColorSpaces : { 100, 1000, 10000 })
+    {
+        OCIO::ConfigRcPtr config = OCIO::Config::CreateRaw()->createEditableCopy();
+
+        std::vector<std::string> names;
+        for (size_t idx = 0; idx < numColorSpaces; ++idx)
+        {
+            const std::string name = "Color Space " + std::to_string(idx);
+            const std::string alias = "cs_" + std::to_string(idx);
+
+            OCIO::ColorSpaceRcPtr cs = OCIO::ColorSpace::Create();
+            cs->setName(name.c_str());
+            cs->addAlias(alias.c_str());
+            config->addColorSpace(cs);
+
+            names.push_back(name);
+            names.push_back(alias);
+        }
+
+        // Look up names and aliases spread over all the color spaces.
+        std::vector<std::string> lookups;
+        for (size_t idx = 0; idx < NumLookups; ++idx)
+        {
+            lookups.push_back(names[idx * names.size() / NumLookups]);
+        }
+
+        std::ostringstream oss;
+        oss << "Look up " << NumLookups << " names in " << numColorSpaces << " color spaces:\t";
+
+        CustomMeasure m(oss.str().c_str(), iterations);
+        for (unsigned iter = 0; iter < iterations; ++iter)
+        {
+            m.resume();
+            for (const auto & name : lookups)
+            {
+                config->getColorSpace(name.c_str());
+            }
+            m.pause();
+        }
+    }
+}
+
+// Measure the time to load a config and to create a first processor (i.e. the default
+// (display, view) pair from the scene linear role), with the eager and lazy config loadings.
+void MeasureStartup(const char * configName, unsigned iterations)
+{
+    const bool lazyLoading = OCIO::GetLazyConfigLoading();
+
+    for (const bool lazy : { false, true })
+    {
+        OCIO::SetLazyConfigLoading(lazy);
+
+        CustomMeasure load(lazy ? "Lazy loading, load the config:				"
+                                : "Eager loading, load the config:				",
+                           iterations);
+        CustomMeasure first(lazy ? "Lazy loading, load the config and get a processor:	"
+                                 : "Eager loading, load the config and get a processor:	",
+                            iterations);
+
+        for (unsigned iter = 0; iter < iterations; ++iter)
+        {
+            // Do not reuse the LUT files loaded by the previous iteration.
+            OCIO::ClearAllCaches();
+
+            load.resume();
+            first.resume();
+            OCIO::ConstConfigRcPtr config = OCIO::Config::CreateFromFile(configName);
+            load.pause();
+
+            const char * display = config->getDefaultDisplay();
+
+            OCIO::DisplayViewTransformRcPtr transform = OCIO::DisplayViewTransform::Create();
+            transform->setSrc(config->hasRole(OCIO::ROLE_SCENE_LINEAR)
+                                  ? OCIO::ROLE_SCENE_LINEAR
+                                  : config->getColorSpaceNameByIndex(0));
+            transform->setDisplay(display);
+            transform->setView(config->getDefaultView(display));
+
+            config->getProcessor(transform)->getDefaultCPUProcessor();
+            first.pause();
+        }
+    }
+
+    OCIO::SetLazyConfigLoading(lazyLoading);
+}
+
+// Measure the copy of a config and the processor creation from the copy.
+void MeasureConfigCopies(OCIO::ConstConfigRcPtr config, unsigned iterations)
+{
+    std::vector<OCIO::ConstTransformRcPtr> displayViews;
+
+    for (int d = 0; d < config->getNumDisplays(); ++d)
+    {
+        const char * display = config->getDisplay(d);
+        for (int v = 0; v < config->getNumViews(display); ++v)
+        {
+            OCIO::DisplayViewTransformRcPtr transform = OCIO::DisplayViewTransform::Create();
+            transform->setSrc(OCIO::ROLE_SCENE_LINEAR);
+            transform->setDisplay(display);
+            transform->setView(config->getView(display, v));
+
+            displayViews.push_back(transform);
+
+            // Populate the cache of the source config.
+            config->getProcessor(transform);
+        }
+    }
+
+    std::cout << "Measure the config copies with " << config->getNumColorSpaces()
+              << " color spaces and " << displayViews.size() << " (display, view) pairs:"
+              << std::endl << std::endl;
+
+    {
+        CustomMeasure m("Copy the config:\t\t\t\t\t", iterations);
+        for (unsigned iter = 0; iter < iterations; ++iter)
+        {
+            m.resume();
+            OCIO::ConfigRcPtr copy = config->createEditableCopy();
+            m.pause();
+        }
+    }
+
+    {
+        CustomMeasure m("Copy the config and get the processors:\t\t\t", iterations);
+        for (unsigned iter = 0; iter < iterations; ++iter)
+        {
+            m.resume();
+            OCIO::ConfigRcPtr copy = config->createEditableCopy();
+            for (const auto & transform : displayViews)
+            {
+                copy->getProcessor(transform);
+            }
+            m.pause();
+        }
+    }
+
+    {
+        OCIO::ColorSpaceRcPtr cs = OCIO::ColorSpace::Create();
+        cs->setName("ocioperf_new_color_space");
+
+        CustomMeasure m("Copy and edit the config, and get the processors:\t", iterations);
+        for (unsigned iter = 0; iter < iterations; ++iter)
+        {
+            m.resume();
+            OCIO::ConfigRcPtr copy = config->createEditableCopy();
+            copy->addColorSpace(cs);
+            for (const auto & transform : displayViews)
+            {
+                copy->getProcessor(transform);
+            }
+            m.pause();
+        }
+    }
+}
+
+// Measure the ACES 2.0 output transforms with the scalar and with the SIMD versions (i.e. using
+// the OPTIMIZATION_FAST_ACES2 flag) of the CPU renderers, and report the largest difference.
+void MeasureACES2OutputTransforms(unsigned iterations)
+{
+    static constexpr long Width  = 1024;
+    static constexpr long Height = 256;
+
+    // Create scene-referred values from 2^-10 up to 2^maxStop.
+    auto createImage = [](float maxStop)
+    {
+        std::vector<float> img(Width * Height * 4);
+        for (long idx = 0; idx < Width * Height; ++idx)
+        {
+            const float scale = std::pow(2.0f, float(idx % Width) / Width * (maxStop + 10.0f) - 10.0f);
+
+            img[4 * idx + 0] = scale * float(idx % 7) / 6.0f;
+            img[4 * idx + 1] = scale * float(idx % 11) / 10.0f;
+            img[4 * idx + 2] = scale * float(idx % 13) / 12.0f;
+            img[4 * idx + 3] = 1.0f;
+        }
+        return img;
+    };
+
+    const OCIO::OptimizationFlags scalarFlags = OCIO::OPTIMIZATION_DEFAULT;
+    const OCIO::OptimizationFlags fastFlags
+        = OCIO::OptimizationFlags(OCIO::OPTIMIZATION_DEFAULT | OCIO::OPTIMIZATION_FAST_ACES2);
+
+    OCIO::ConstConfigRcPtr config = OCIO::Config::CreateRaw();
+
+    // Only used to measure the creation of the processors.
+    OCIO::ConfigRcPtr noCacheConfig = config->createEditableCopy();
+    noCacheConfig->setProcessorCacheFlags(OCIO::PROCESSOR_CACHE_OFF);
+
+    std::cout << "Measure the ACES 2.0 output transforms on a " << Width << "x" << Height
+              << " image:" << std::endl;
+
+    for (const char * style : { "ACES-OUTPUT - ACES2065-1_to_CIE-XYZ-D65 - SDR-100nit-REC709_2.0",
+                                "ACES-OUTPUT - ACES2065-1_to_CIE-XYZ-D65 - HDR-1000nit-P3-D65_2.0" })
+    {
+        std::cout << std::endl << style << std::endl;
+
+        OCIO::BuiltinTransformRcPtr transform = OCIO::BuiltinTransform::Create();
+        transform->setStyle(style);
+
+        // The ACES 2.0 parameters & tables are shared between the CPU and GPU processors, and
+        // only built once per peak luminance & limiting primaries unless the caches are cleared.
+        for (const bool warm : { false, true })
+        {
+            CustomMeasure m(warm ? "Create the CPU & GPU processors, warm:\t"
+                                 : "Create the CPU & GPU processors, cold:\t", iterations);
+            for (unsigned iter = 0; iter < iterations; ++iter)
+            {
+                if (!warm)
+                {
+                    OCIO::ClearAllCaches();
+                }
+
+                m.resume();
+                OCIO::ConstProcessorRcPtr processor
+                    = noCacheConfig->getProcessor(transform, OCIO::TRANSFORM_DIR_FORWARD);
+                processor->getDefaultCPUProcessor();
+                OCIO::GpuShaderDescRcPtr shaderDesc = OCIO::GpuShaderDesc::CreateShaderDesc();
+                processor->getDefaultGPUProcessor()->extractGpuShaderInfo(shaderDesc);
+                m.pause();
+            }
+        }
+
+        OCIO::ConstProcessorRcPtr fwdProcessor
+            = config->getProcessor(transform, OCIO::TRANSFORM_DIR_FORWARD);
+        OCIO::ConstProcessorRcPtr invProcessor
+            = config->getProcessor(transform, OCIO::TRANSFORM_DIR_INVERSE);
+
+        // The inverse is measured on display-referred values away from the peak luminance,
+        // where the inverse is very sensitive to the input values.
+        const std::vector<float> fwdImage = createImage(6.0f);
+        std::vector<float> invImage = createImage(0.0f);
+        {
+            OCIO::PackedImageDesc desc(invImage.data(), Width, Height, 4);
+            fwdProcessor->getOptimizedCPUProcessor(scalarFlags)->apply(desc);
+        }
+
+        for (const bool inverse : { false, true })
+        {
+            const std::vector<float> & srcImage = inverse ? invImage : fwdImage;
+            OCIO::ConstProcessorRcPtr processor = inverse ? invProcessor : fwdProcessor;
+
+            std::vector<float> results[2];
+
+            for (const bool fast : { false, true })
+            {
+                OCIO::ConstCPUProcessorRcPtr cpu = processor->getOptimizedCPUProcessor(
+                    fast ? fastFlags : scalarFlags);
+
+                std::ostringstream oss;
+                oss << (inverse ? "Inverse" : "Forward") << (fast ? ", SIMD:\t" : ", scalar:\t");
+
+                std::vector<float> & img = results[fast ? 1 : 0];
+
+                CustomMeasure m(oss.str().c_str(), iterations);
+                for (unsigned iter = 0; iter < iterations; ++iter)
+                {
+                    img = srcImage;
+                    OCIO::PackedImageDesc desc(img.data(), Width, Height, 4);
+
+                    m.resume();
+                    cpu->apply(desc);
+                    m.pause();
+                }
+            }
+
+            // Absolute difference below one and relative difference above.
+            float maxDiff = 0.0f;
+            for (size_t idx = 0; idx < results[0].size(); ++idx)
+            {
+                const float diff = std::abs(results[1][idx] - results[0][idx])
+                                       / std::max(1.0f, std::abs(results[0][idx]));
+                maxDiff = std::max(maxDiff, diff);
+            }
+
+            std::cout << (inverse ? "Inverse" : "Forward")
+                      << ", max difference between SIMD and scalar: " << maxDiff << std::endl;
+        }
+    }
+}
+
+// Measure the CPU renderers of the grading transforms (i.e. primary, RGB curve & tone) in both
+// directions. The SIMD versions are used when available, so compare with a build using
+// OCIO_USE_SIMD=OFF to measure the scalar versions.
+void MeasureGradingTransforms(unsigned iterations)
+{
+    static constexpr long Width  = 1024;
+    static constexpr long Height = 256;
+
+    // Create values from -0.1 up to 1.2.
+    std::vector<float> srcImage(Width * Height * 4);
+    for (long idx = 0; idx < Width * Height; ++idx)
+    {
+        const float val = float(idx % Width) / Width * 1.3f - 0.1f;
+
+        srcImage[4 * idx + 0] = val * float(idx % 7 + 1) / 7.0f;
+        srcImage[4 * idx + 1] = val * float(idx % 11 + 1) / 11.0f;
+        srcImage[4 * idx + 2] = val;
+        srcImage[4 * idx + 3] = 1.0f;
+    }
+
+    OCIO::GradingPrimary primaryValues(OCIO::GRADING_LOG);
+    primaryValues.m_brightness = OCIO::GradingRGBM(-10., 45., -5., 50.);
+    primaryValues.m_contrast   = OCIO::GradingRGBM(0.9, 1.4, 0.7, 0.75);
+    primaryValues.m_gamma      = OCIO::GradingRGBM(1.1, 0.7, 1.05, 1.15);
+    primaryValues.m_saturation = 1.21;
+
+    OCIO::GradingPrimaryTransformRcPtr primary
+        = OCIO::GradingPrimaryTransform::Create(OCIO::GRADING_LOG);
+    primary->setValue(primaryValues);
+
+    auto red   = OCIO::GradingBSplineCurve::Create({ { 0.1f, 0.15f }, { 0.55f, 0.45f }, { 0.9f, 1.1f } });
+    auto green = OCIO::GradingBSplineCurve::Create({ { 0.1f, 0.15f }, { 0.55f, 0.35f }, { 0.9f, 1.1f } });
+    auto blue  = OCIO::GradingBSplineCurve::Create({ { 0.1f, 0.15f }, { 0.55f, 0.85f }, { 0.9f, 1.1f } });
+    auto master = OCIO::GradingBSplineCurve::Create({ { -0.1f, 0.1f }, { 0.5f, 0.6f }, { 1.1f, 1.3f } });
+
+    OCIO::GradingRGBCurveTransformRcPtr curves
+        = OCIO::GradingRGBCurveTransform::Create(OCIO::GRADING_LOG);
+    curves->setValue(OCIO::GradingRGBCurve::Create(red, green, blue, master));
+
+    OCIO::GradingTone toneValues(OCIO::GRADING_LOG);
+    toneValues.m_midtones   = OCIO::GradingRGBMSW(0.3, 1.0, 1.8, 1.2, 0.47, 0.6);
+    toneValues.m_highlights = OCIO::GradingRGBMSW(0.3, 1.0, 1.8, 1.4, -0.1, 0.9);
+    toneValues.m_blacks     = OCIO::GradingRGBMSW(0.3, 1.0, 1.9, 0.6, 0.8, 0.9);
+    toneValues.m_scontrast  = 1.8;
+
+    OCIO::GradingToneTransformRcPtr tone = OCIO::GradingToneTransform::Create(OCIO::GRADING_LOG);
+    tone->setValue(toneValues);
+
+    OCIO::ConstConfigRcPtr config = OCIO::Config::CreateRaw();
+
+    std::cout << "Measure the grading transforms on a " << Width << "x" << Height
+              << " image:" << std::endl << std::endl;
+
+    const std::pair<const char *, OCIO::ConstTransformRcPtr> transforms[] = {
+        { "GradingPrimary", primary }, { "GradingRGBCurve", curves }, { "GradingTone", tone } };
+
+    for (const auto & transform : transforms)
+    {
+        for (const bool inverse : { false, true })
+        {
+            OCIO::ConstCPUProcessorRcPtr cpu
+                = config->getProcessor(transform.second, inverse ? OCIO::TRANSFORM_DIR_INVERSE
+                                                                 : OCIO::TRANSFORM_DIR_FORWARD)
+                        ->getDefaultCPUProcessor();
+
+            std::ostringstream oss;
+            oss << transform.first << (inverse ? ", inverse:\t" : ", forward:\t");
+
+            CustomMeasure m(oss.str().c_str(), iterations);
+            for (unsigned iter = 0; iter < iterations; ++iter)
+            {
+                std::vector<float> img = srcImage;
+                OCIO::PackedImageDesc desc(img.data(), Width, Height, 4);
+
+                m.resume();
+                cpu->apply(desc);
+                m.pause();
+            }
+        }
+    }
+}
+
+// Measure the Lut3D & Lut1D CPU renderers storing the LUT values as floats (the default) or as
+// half floats (i.e. OPTIMIZATION_COMPACT_LUTS), and report the memory used by the LUT values and
+// the largest difference between the two storages.
+void MeasureLutStorage(unsigned iterations)
+{
+    static constexpr long Width  = 1024;
+    static constexpr long Height = 256;
+
+    // Create values from -0.1 up to 1.2.
+    std::vector<float> srcImage(Width * Height * 4);
+    for (long idx = 0; idx < Width * Height; ++idx)
+    {
+        const float val = float(idx % Width) / Width * 1.3f - 0.1f;
+
+        srcImage[4 * idx + 0] = val * float(idx % 7 + 1) / 7.0f;
+        srcImage[4 * idx + 1] = val * float(idx % 11 + 1) / 11.0f;
+        srcImage[4 * idx + 2] = val;
+        srcImage[4 * idx + 3] = 1.0f;
+    }
+
+    struct Lut
+    {
+        std::string m_name;
+        OCIO::ConstTransformRcPtr m_transform;
+        size_t m_entries;
+        // Bytes per LUT entry for the float & half float storages.
+        size_t m_floatBytes;
+        size_t m_halfBytes;
+    };
+
+    std::vector<Lut> luts;
+
+    for (const unsigned long gridSize : { 33ul, 65ul, 129ul })
+    {
+        OCIO::Lut3DTransformRcPtr lut = OCIO::Lut3DTransform::Create(gridSize);
+        lut->setInterpolation(OCIO::INTERP_TETRAHEDRAL);
+
+        const float scale = 1.0f / float(gridSize - 1);
+        for (unsigned long r = 0; r < gridSize; ++r)
+        {
+            for (unsigned long g = 0; g < gridSize; ++g)
+            {
+                for (unsigned long b = 0; b < gridSize; ++b)
+                {
+                    const float R = r * scale, G = g * scale, B = b * scale;
+                    lut->setValue(r, g, b,
+                                  std::pow(0.8f * R + 0.1f * G + 0.1f * B, 1.5f) * 4.0f,
+                                  std::pow(0.1f * R + 0.8f * G + 0.1f * B, 1.5f) * 4.0f,
+                                  std::pow(0.1f * R + 0.1f * G + 0.8f * B, 1.5f) * 4.0f);
+                }
+            }
+        }
+
+        // The float renderers use RGBA values in order to load them using SSE2.
+        const size_t entries = gridSize * gridSize * gridSize;
+        luts.push_back({ "Lut3D " + std::to_string(gridSize) + "^3", lut, entries, 16, 6 });
+    }
+
+    for (const bool halfDomain : { false, true })
+    {
+        const unsigned long length = halfDomain ? 65536 : 4096;
+        OCIO::Lut1DTransformRcPtr lut = OCIO::Lut1DTransform::Create(length, halfDomain);
+
+        for (unsigned long idx = 0; idx < length; ++idx)
+        {
+            float val = float(idx) / float(length - 1);
+            if (halfDomain)
+            {
+                // Refer to the half float encoding.
+                const unsigned long exp = (idx >> 10) & 0x1f;
+                const float mant = float(idx & 0x3ff) / 1024.0f;
+                val = exp == 0x1f ? 0.0f
+                                  : std::ldexp(exp == 0 ? mant : 1.0f + mant, int(exp) - 15);
+                val = (idx & 0x8000) ? -val : val;
+            }
+
+            const float res = std::cbrt(val);
+            lut->setValue(idx, res, res * 0.9f, res * 1.1f);
+        }
+
+        luts.push_back({ halfDomain ? "Lut1D half domain" : "Lut1D 4096", lut, length, 12, 6 });
+    }
+
+    OCIO::ConstConfigRcPtr config = OCIO::Config::CreateRaw();
+
+    std::cout << "Measure the LUT storages on a " << Width << "x" << Height
+              << " image:" << std::endl << std::endl;
+
+    for (const auto & lut : luts)
+    {
+        OCIO::ConstProcessorRcPtr processor = config->getProcessor(lut.m_transform);
+
+        std::vector<float> outImages[2];
+
+        for (const bool compact : { false, true })
+        {
+            const OCIO::OptimizationFlags flags
+                = compact ? OCIO::OptimizationFlags(OCIO::OPTIMIZATION_DEFAULT
+                                                    | OCIO::OPTIMIZATION_COMPACT_LUTS)
+                          : OCIO::OPTIMIZATION_DEFAULT;
+
+            OCIO::ConstCPUProcessorRcPtr cpu = processor->getOptimizedCPUProcessor(flags);
+
+            std::ostringstream oss;
+            oss << lut.m_name << (compact ? ", half:\t" : ", float:\t");
+
+            CustomMeasure m(oss.str().c_str(), iterations);
+            for (unsigned iter = 0; iter < iterations; ++iter)
+            {
+                outImages[compact] = srcImage;
+                OCIO::PackedImageDesc desc(outImages[compact].data(), Width, Height, 4);
+
+                m.resume();
+                cpu->apply(desc);
+                m.pause();
+            }
+        }
+
+        float maxDiff = 0.0f;
+        for (size_t idx = 0; idx < srcImage.size(); ++idx)
+        {
+            maxDiff = std::max(maxDiff, std::abs(outImages[0][idx] - outImages[1][idx]));
+        }
+
+        std::cout << lut.m_name << ", LUT values: "
+                  << lut.m_entries * lut.m_floatBytes / 1024 << " KB (float) vs. "
+                  << lut.m_entries * lut.m_halfBytes / 1024 << " KB (half), "
+                  << "max difference: " << maxDiff << std::endl << std::endl;
+    }
+}
+
 int main(int argc, const char **argv)
 {
     bool help = false;
@@ -176,7 +759,18 @@ int main(int argc, const char **argv)
     std::string inColorSpace, outColorSpace, display, view;
     std::string inBitDepthStr("f32"), outBitDepthStr("f32");
     unsigned iterations = 50;
+    unsigned numThreads = 1;
+    unsigned chunkSize = 0;
     bool nocache = false, nooptim = false;
+    bool scaling = false;
+    bool chunking = false;
+    bool cachehits = false;
+    bool lookups = false;
+    bool copies = false;
+    bool startup = false;
+    bool aces2 = false;
+    bool grading = false;
+    bool luts = false;
 
     bool useColorspaces = false;
     bool useDisplayview = false;
@@ -218,6 +812,42 @@ int main(int argc, const char **argv)
                                             "Bypass all caches. Default is false",
                "--nooptim",                 &nooptim, 
                                             "Disable the processor optimizations. Default is false",
+               "--threads %d",              &numThreads,
+                                            "Number of threads processing the complete image "\
+                                            "(0 means all the hardware threads). Default is 1",
+               "--scaling",                 &scaling,
+                                            "Measure the multi-threaded processing across several "\
+                                            "image sizes and thread counts. Default is false",
+               "--chunk %d",                &chunkSize,
+                                            "Number of pixels processed at once by all the ops "\
+                                            "(0 means complete lines). Default is 0",
+               "--chunking",                &chunking,
+                                            "Measure the processing of very wide images across "\
+                                            "several chunk sizes. Default is false",
+               "--cachehits",               &cachehits,
+                                            "Measure the processor cache hits for all the (display, view) "\
+                                            "pairs of the config (default: the ACES studio config). Default is false",
+               "--lookups",                 &lookups,
+                                            "Measure the color space lookups by name and alias "\
+                                            "across several config sizes. Default is false",
+               "--copies",                  &copies,
+                                            "Measure the config copies and the processor creation "\
+                                            "from the copies (default: the ACES studio config). Default is false",
+               "--startup",                 &startup,
+                                            "Measure the time to load the config and to create a first "\
+                                            "processor with the eager and lazy config loadings "\
+                                            "(default: the ACES studio config). Default is false",
+               "--aces2",                   &aces2,
+                                            "Measure the ACES 2.0 output transforms i.e. the processor "\
+                                            "creation with and without the shared parameters, and the "\
+                                            "scalar and SIMD versions of the CPU renderers. Default is false",
+               "--grading",                 &grading,
+                                            "Measure the CPU renderers of the grading primary, RGB curve "\
+                                            "and tone transforms in both directions. Default is false",
+               "--luts",                    &luts,
+                                            "Measure the CPU renderers of large Lut3D and Lut1D transforms "\
+                                            "storing the LUT values as floats or as half floats, and report "\
+                                            "their memory and accuracy. Default is false",
                NULL);
 
     if (ap.parse (argc, argv) < 0)
@@ -239,6 +869,8 @@ int main(int argc, const char **argv)
         std::cout << "OCIO Version: " << OCIO::GetVersion() << std::endl;
     }
 
+    OCIO::SetCPUProcessorChunkSize(chunkSize);
+
     if (!transformFile.empty())
     {
         std::cout << std::endl;
@@ -251,6 +883,54 @@ int main(int argc, const char **argv)
     // Process the image.
     try
     {
+        if (cachehits)
+        {
+            const char * configName = !inputconfig.empty() ? inputconfig.c_str()
+                                                           : "ocio://studio-config-latest";
+            MeasureCacheHits(OCIO::Config::CreateFromFile(configName), iterations);
+            return 0;
+        }
+
+        if (lookups)
+        {
+            MeasureColorSpaceLookups(iterations);
+            return 0;
+        }
+
+        if (copies)
+        {
+            const char * configName = !inputconfig.empty() ? inputconfig.c_str()
+                                                           : "ocio://studio-config-latest";
+            MeasureConfigCopies(OCIO::Config::CreateFromFile(configName), iterations);
+            return 0;
+        }
+
+        if (startup)
+        {
+            const char * configName = !inputconfig.empty() ? inputconfig.c_str()
+                                                           : "ocio://studio-config-latest";
+            MeasureStartup(configName, iterations);
+            return 0;
+        }
+
+        if (aces2)
+        {
+            MeasureACES2OutputTransforms(iterations);
+            return 0;
+        }
+
+        if (grading)
+        {
+            MeasureGradingTransforms(iterations);
+            return 0;
+        }
+
+        if (luts)
+        {
+            MeasureLutStorage(iterations);
+            return 0;
+        }
+
         // Load the current config.
 
         OCIO::ConstProcessorRcPtr processor;
@@ -602,7 +1282,7 @@ int main(int argc, const char **argv)
 
                     // Apply the color transformation.
                     m.resume();
-                    cpuProcessor->apply(imgDesc);
+                    cpuProcessor->apply(imgDesc, numThreads);
                     m.pause();
                 }
             }
@@ -650,7 +1330,7 @@ int main(int argc, const char **argv)
                 {
                     // Apply the color transformation.
                     m.resume();
-                    cpu->apply(inImgDesc, outImgDesc);
+                    cpu->apply(inImgDesc, outImgDesc, numThreads);
                     m.pause();
                 }
             }
@@ -700,6 +1380,177 @@ int main(int argc, const char **argv)
             }
         }
 
+        if (scaling && inBitDepth == outBitDepth)
+        {
+            // Process images of several sizes (in place) with an increasing number of threads.
+
+            std::cout << std::endl << std::endl;
+            std::cout << "Multi-threaded processing statistics:" << std::endl << std::endl;
+
+            struct ImageSize
+            {
+                const char * m_name;
+                size_t m_width;
+                size_t m_height;
+            };
+
+            static constexpr ImageSize imageSizes[]
+            {
+                { "HD",  1920, 1080 },
+                { "UHD", 3840, 2160 },
+                { "8K",  7680, 4320 }
+            };
+
+            const unsigned maxThreads = std::max(1u, std::thread::hardware_concurrency());
+
+            std::vector<unsigned> threadCounts;
+            for (unsigned count = 1; count < maxThreads; count *= 2)
+            {
+                threadCounts.push_back(count);
+            }
+            threadCounts.push_back(maxThreads);
+
+            for (const auto & imageSize : imageSizes)
+            {
+                const size_t numValues = imageSize.m_width * imageSize.m_height * numChannels;
+
+                // Tile the synthetic image to get the requested image size.
+                std::vector<float>    refImg_f32;
+                std::vector<uint16_t> refImg_ui16;
+                if (inBitDepth == OCIO::BIT_DEPTH_F32)
+                {
+                    refImg_f32.resize(numValues);
+                    for (size_t idx = 0; idx < numValues; ++idx)
+                    {
+                        refImg_f32[idx] = img_f32_ref[idx % img_f32_ref.size()];
+                    }
+                }
+                else
+                {
+                    refImg_ui16.resize(numValues);
+                    for (size_t idx = 0; idx < numValues; ++idx)
+                    {
+                        refImg_ui16[idx] = img_ui16_ref[idx % img_ui16_ref.size()];
+                    }
+                }
+
+                for (unsigned count : threadCounts)
+                {
+                    std::ostringstream oss;
+                    oss << "Process the " << imageSize.m_name << " image ("
+                        << imageSize.m_width << "x" << imageSize.m_height << ") with "
+                        << count << (count == 1 ? " thread:\t\t\t" : " threads:\t\t\t");
+
+                    CustomMeasure m(oss.str().c_str(), iterations);
+
+                    for(unsigned iter=0; iter<iterations; ++iter)
+                    {
+                        std::vector<float>    inImg_f32  = refImg_f32;
+                        std::vector<uint16_t> inImg_ui16 = refImg_ui16;
+
+                        OCIO::PackedImageDesc imgDesc(inBitDepth == OCIO::BIT_DEPTH_F32
+                                                        ? (void*)&inImg_f32[0] : (void*)&inImg_ui16[0],
+                                                      imageSize.m_width,
+                                                      imageSize.m_height,
+                                                      numChannels,
+                                                      inBitDepth,
+                                                      OCIO::AutoStride,
+                                                      OCIO::AutoStride,
+                                                      OCIO::AutoStride);
+
+                        // Apply the color transformation.
+                        m.resume();
+                        cpuProcessor->apply(imgDesc, count);
+                        m.pause();
+                    }
+                }
+
+                std::cout << std::endl;
+            }
+        }
+
+        if (chunking && inBitDepth == outBitDepth)
+        {
+            // Process very wide images (in place) with several chunk sizes i.e. the number
+            // of pixels processed by all the ops before moving to the next pixels.
+
+            std::cout << std::endl << std::endl;
+            std::cout << "Chunked processing statistics:" << std::endl << std::endl;
+
+            static constexpr size_t imageWidths[] { 8192, 16384, 32768 };
+            static constexpr size_t imageHeight = 64;
+
+            static constexpr unsigned chunkSizes[] { 0, 128, 256, 512, 1024, 2048, 4096 };
+
+            for (size_t imageWidth : imageWidths)
+            {
+                const size_t numValues = imageWidth * imageHeight * numChannels;
+
+                // Tile the synthetic image to get the requested image size.
+                std::vector<float>    refImg_f32;
+                std::vector<uint16_t> refImg_ui16;
+                if (inBitDepth == OCIO::BIT_DEPTH_F32)
+                {
+                    refImg_f32.resize(numValues);
+                    for (size_t idx = 0; idx < numValues; ++idx)
+                    {
+                        refImg_f32[idx] = img_f32_ref[idx % img_f32_ref.size()];
+                    }
+                }
+                else
+                {
+                    refImg_ui16.resize(numValues);
+                    for (size_t idx = 0; idx < numValues; ++idx)
+                    {
+                        refImg_ui16[idx] = img_ui16_ref[idx % img_ui16_ref.size()];
+                    }
+                }
+
+                for (unsigned size : chunkSizes)
+                {
+                    OCIO::SetCPUProcessorChunkSize(size);
+
+                    std::ostringstream oss;
+                    oss << "Process the " << imageWidth << "x" << imageHeight << " image with ";
+                    if (size == 0)
+                    {
+                        oss << "complete lines:\t\t\t";
+                    }
+                    else
+                    {
+                        oss << "chunks of " << size << " pixels:\t\t";
+                    }
+
+                    CustomMeasure m(oss.str().c_str(), iterations);
+
+                    for(unsigned iter=0; iter<iterations; ++iter)
+                    {
+                        std::vector<float>    inImg_f32  = refImg_f32;
+                        std::vector<uint16_t> inImg_ui16 = refImg_ui16;
+
+                        OCIO::PackedImageDesc imgDesc(inBitDepth == OCIO::BIT_DEPTH_F32
+                                                        ? (void*)&inImg_f32[0] : (void*)&inImg_ui16[0],
+                                                      imageWidth,
+                                                      imageHeight,
+                                                      numChannels,
+                                                      inBitDepth,
+                                                      OCIO::AutoStride,
+                                                      OCIO::AutoStride,
+                                                      OCIO::AutoStride);
+
+                        // Apply the color transformation.
+                        m.resume();
+                        cpuProcessor->apply(imgDesc, numThreads);
+                        m.pause();
+                    }
+                }
+
+                std::cout << std::endl;
+            }
+
+            OCIO::SetCPUProcessorChunkSize(chunkSize);
+        }
+
         std::cout << std::endl << std::endl;
 
     }
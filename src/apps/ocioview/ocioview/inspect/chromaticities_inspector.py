@@ -493,11 +493,10 @@ class ChromaticitiesInspector(QtWidgets.QWidget):
 
         conversion_chain = []
 
-        image_array = np.copy(self._image_array)
         # Don't try to process single or zero pixel images
-        image_empty = image_array.size <= 3
+        image_empty = self._image_array.size <= 3
 
-        # 1. Apply current active processor
+        # 1. Apply current active processor, keeping the source image intact
         if not image_empty and self._processor is not None:
             if self._context.transform_item_name is not None:
                 conversion_chain += [
@@ -516,7 +515,10 @@ class ChromaticitiesInspector(QtWidgets.QWidget):
                 self._visuals[
                     "rgb_color_space_input_3d"
                 ].colourspace = rgb_colourspace
-            self._processor.applyRGB(image_array)
+            image_array = np.empty_like(self._image_array)
+            self._processor.applyRGB(self._image_array, image_array)
+        else:
+            image_array = np.copy(self._image_array)
 
         # 2. Convert from chromaticities input space to "CIE-XYZ-D65" interchange
         config = ocio.GetCurrentConfig()
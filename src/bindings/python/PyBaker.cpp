@@ -131,13 +131,15 @@ Each item is a tuple containing format name and format extension.
                 self->bake(f);
                 f.close();
             }, 
-             "fileName"_a)
+             "fileName"_a,
+             py::call_guard<py::gil_scoped_release>())
         .def("bake", [](BakerRcPtr & self) 
             {
                 std::ostringstream os;
                 self->bake(os);
                 return os.str();
             },
+            py::call_guard<py::gil_scoped_release>(),
             DOC(Baker, bake));
 
     clsFormatIterator
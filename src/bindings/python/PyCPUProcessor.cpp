@@ -2,6 +2,7 @@
 // Copyright Contributors to the OpenColorIO Project.
 
 #include <sstream>
+#include <string>
 #include <vector>
 
 #include "PyDynamicProperty.h"
@@ -12,6 +13,20 @@
 namespace OCIO_NAMESPACE
 {
 
+namespace
+{
+
+// Note of the docstrings of the apply methods taking dynamic property values.
+const std::string DYNAMIC_VALUES_NOTE = R"doc(.. note::
+    Set ``values`` to a ``DynamicPropertyValues`` instance to override 
+    the dynamic property values of the CPU processor for that call 
+    only, e.g. to concurrently process several images with different 
+    grading values using one CPU processor.
+
+)doc";
+
+} // namespace
+
 void bindPyCPUProcessor(py::module & m)
 {
     auto clsCPUProcessor = 
@@ -43,20 +58,36 @@ void bindPyCPUProcessor(py::module & m)
              DOC(CPUProcessor, hasDynamicProperty))
         .def("isDynamic", &CPUProcessor::isDynamic,
              DOC(CPUProcessor, isDynamic))
+        .def("getScratchBufferPoolHits", &CPUProcessor::getScratchBufferPoolHits,
+             DOC(CPUProcessor, getScratchBufferPoolHits))
+        .def("getScratchBufferPoolMisses", &CPUProcessor::getScratchBufferPoolMisses,
+             DOC(CPUProcessor, getScratchBufferPoolMisses))
 
-        .def("apply", [](CPUProcessorRcPtr & self, PyImageDesc & imgDesc) 
+        .def("apply", [](CPUProcessorRcPtr & self, 
+                         PyImageDesc & imgDesc, 
+                         unsigned numThreads,
+                         const DynamicPropertyValuesRcPtr & values) 
             {
-                self->apply((*imgDesc.m_img));
+                if (values)
+                {
+                    self->apply((*imgDesc.m_img), *values, numThreads);
+                }
+                else
+                {
+                    self->apply((*imgDesc.m_img), numThreads);
+                }
             },
-             "imgDesc"_a,
+             "imgDesc"_a, "numThreads"_a = 1, "values"_a = DynamicPropertyValuesRcPtr(),
              py::call_guard<py::gil_scoped_release>(), 
-             R"doc(
+             (R"doc(
 Apply to an image with any kind of channel ordering while respecting 
 the input and output bit-depths. Image values are modified in place.
 
 .. note::
     The GIL is released during processing, freeing up Python to execute 
-    other threads concurrently.
+    other threads concurrently. Set ``numThreads`` to split the 
+    processing of the image between several threads (0 uses all the 
+    hardware threads).
 
 .. note::
     For large images, ``applyRGB`` or ``applyRGBA`` are preferred for 
@@ -65,23 +96,35 @@ the input and output bit-depths. Image values are modified in place.
     pointer. The dedicated packed ``apply*`` methods utilize 
     ``ImageDesc`` on the C++ side so avoid the copy.
 
-)doc")
+)doc" + DYNAMIC_VALUES_NOTE).c_str())
         .def("apply", [](CPUProcessorRcPtr & self, 
                          PyImageDesc & srcImgDesc, 
-                         PyImageDesc & dstImgDesc)
+                         PyImageDesc & dstImgDesc,
+                         unsigned numThreads,
+                         const DynamicPropertyValuesRcPtr & values)
             {
-                self->apply((*srcImgDesc.m_img), (*dstImgDesc.m_img));
+                if (values)
+                {
+                    self->apply((*srcImgDesc.m_img), (*dstImgDesc.m_img), *values, numThreads);
+                }
+                else
+                {
+                    self->apply((*srcImgDesc.m_img), (*dstImgDesc.m_img), numThreads);
+                }
             },
-             "srcImgDesc"_a, "dstImgDesc"_a,
+             "srcImgDesc"_a, "dstImgDesc"_a, "numThreads"_a = 1, 
+             "values"_a = DynamicPropertyValuesRcPtr(),
              py::call_guard<py::gil_scoped_release>(),
-             R"doc(
+             (R"doc(
 Apply to an image with any kind of channel ordering while respecting 
 the input and output bit-depths. Modified srcImgDesc image values are
 written to the dstImgDesc image, leaving srcImgDesc unchanged.
 
 .. note::
     The GIL is released during processing, freeing up Python to execute 
-    other threads concurrently.
+    other threads concurrently. Set ``numThreads`` to split the 
+    processing of the image between several threads (0 uses all the 
+    hardware threads).
 
 .. note::
     For large images, ``applyRGB`` or ``applyRGBA`` are preferred for 
@@ -90,50 +133,99 @@ written to the dstImgDesc image, leaving srcImgDesc unchanged.
     pointer. The dedicated packed ``apply*`` methods utilize 
     ``ImageDesc`` on the C++ side so avoid the copy.
 
-)doc")
-        .def("applyRGB", [](CPUProcessorRcPtr & self, py::buffer & data) 
+)doc" + DYNAMIC_VALUES_NOTE).c_str())
+        .def("applyRGB", [](CPUProcessorRcPtr & self, 
+                            py::buffer & data, 
+                            unsigned numThreads,
+                            const DynamicPropertyValuesRcPtr & values) 
             {
                 py::buffer_info info = data.request();
-                checkBufferDivisible(info, 3);
-
-                // Interpret as single row of RGB pixels
-                BitDepth bitDepth = getBufferBitDepth(info);
+                ImageDescRcPtr img = getBufferImageDesc(info, 3);
 
                 py::gil_scoped_release release;
 
-                long numChannels = 3;
-                long width = (long)info.size / numChannels;
-                long height = 1;
-                ptrdiff_t chanStrideBytes = (ptrdiff_t)info.itemsize;
-                ptrdiff_t xStrideBytes = chanStrideBytes * numChannels;
-                ptrdiff_t yStrideBytes = xStrideBytes * width;
-
-                PackedImageDesc img(info.ptr, 
-                                    width, height, 
-                                    numChannels, 
-                                    bitDepth, 
-                                    chanStrideBytes, 
-                                    xStrideBytes, 
-                                    yStrideBytes);
-                self->apply(img);
+                if (values)
+                {
+                    self->apply(*img, *values, numThreads);
+                }
+                else
+                {
+                    self->apply(*img, numThreads);
+                }
             },
-             "data"_a, 
-             R"doc(
-Apply to a packed RGB array adhering to the Python buffer protocol. 
+             "data"_a, "numThreads"_a = 1, "values"_a = DynamicPropertyValuesRcPtr(),
+             (R"doc(
+Apply to an RGB array adhering to the Python buffer protocol. 
 This will typically be a NumPy array. Input and output bit-depths are
-respected but must match. Any array size or shape is supported as long
-as the flattened array size is divisible by 3. Array values are 
-modified in place.
+respected but must match. A C-contiguous array of any size or shape is 
+supported as long as the flattened array size is divisible by 3. Array 
+values are modified in place.
+
+.. note::
+    Other memory layouts are supported as long as the last dimension 
+    of the array holds the 3 channels, and the other dimensions map 
+    to rows of pixels. This includes strided arrays (e.g. 
+    ``img[..., :3]`` or ``img[::2, ::2]`` on a larger image), Fortran 
+    ordered arrays, and planar arrays (e.g. ``np.moveaxis(planes, 0, 
+    -1)`` on an array of shape (3, height, width)). These arrays are 
+    processed in place without any copy.
 
 .. note::
     This differs from the C++ implementation which only applies to a 
-    single pixel. This method uses a ``PackedImageDesc`` under the 
-    hood to apply to an entire image at once. The GIL is released 
+    single pixel. This method uses a ``PackedImageDesc`` (or a 
+    ``PlanarImageDesc`` for the Fortran ordered and planar arrays) 
+    under the hood to apply to an entire image at once. The GIL is 
+    released during processing, freeing up Python to execute other 
+    threads concurrently. Set ``numThreads`` to split the processing 
+    of the array between several threads (0 uses all the hardware 
+    threads).
+
+)doc" + DYNAMIC_VALUES_NOTE).c_str())
+        .def("applyRGB", [](CPUProcessorRcPtr & self, 
+                            py::buffer & srcData, 
+                            py::buffer & dstData, 
+                            unsigned numThreads,
+                            const DynamicPropertyValuesRcPtr & values) 
+            {
+                py::buffer_info srcInfo = srcData.request();
+                py::buffer_info dstInfo = dstData.request(true);
+                auto imgs = getBufferImageDescs(srcInfo, dstInfo, 3);
+
+                py::gil_scoped_release release;
+
+                if (values)
+                {
+                    self->apply(*imgs.first, *imgs.second, *values, numThreads);
+                }
+                else
+                {
+                    self->apply(*imgs.first, *imgs.second, numThreads);
+                }
+            },
+             "srcData"_a, "dstData"_a, "numThreads"_a = 1, 
+             "values"_a = DynamicPropertyValuesRcPtr(),
+             (R"doc(
+Apply to an RGB array adhering to the Python buffer protocol. 
+This will typically be a NumPy array. Input and output bit-depths are
+respected and must match the source and destination arrays respectively.
+The source and destination arrays must have the same size, or the same
+shape when not C-contiguous. The same memory layouts as the in place 
+``applyRGB`` are supported (strided, Fortran ordered and planar 
+arrays), as long as the rows of pixels are shared by both arrays. 
+Modified srcData array values are written to the dstData array, 
+leaving srcData unchanged.
+
+.. note::
+    This avoids copying the source array before an in place 
+    processing when it must be kept intact. The GIL is released 
     during processing, freeing up Python to execute other threads 
-    concurrently.
+    concurrently. Set ``numThreads`` to split the processing of the 
+    array between several threads (0 uses all the hardware threads).
 
-)doc")
-        .def("applyRGB", [](CPUProcessorRcPtr & self, std::vector<float> & data) 
+)doc" + DYNAMIC_VALUES_NOTE).c_str())
+        .def("applyRGB", [](CPUProcessorRcPtr & self, 
+                            std::vector<float> & data,
+                            const DynamicPropertyValuesRcPtr & values) 
             {
                 checkVectorDivisible(data, 3);
 
@@ -142,13 +234,20 @@ modified in place.
                 long height = 1;
 
                 PackedImageDesc img(&data[0], width, height, numChannels);
-                self->apply(img);
+                if (values)
+                {
+                    self->apply(img, *values);
+                }
+                else
+                {
+                    self->apply(img);
+                }
 
                 return data;
             },
-             "data"_a,
+             "data"_a, "values"_a = DynamicPropertyValuesRcPtr(),
              py::call_guard<py::gil_scoped_release>(), 
-             R"doc(
+             (R"doc(
 Apply to a packed RGB list of float values. Any size is supported as 
 long as the list length is divisible by 3. A new list with processed
 float values is returned, leaving the input list unchanged.
@@ -165,50 +264,99 @@ float values is returned, leaving the input list unchanged.
     List values are copied on input and output, where an array is 
     modified in place.
 
-)doc")
-        .def("applyRGBA", [](CPUProcessorRcPtr & self, py::buffer & data) 
+)doc" + DYNAMIC_VALUES_NOTE).c_str())
+        .def("applyRGBA", [](CPUProcessorRcPtr & self, 
+                            py::buffer & data, 
+                            unsigned numThreads,
+                            const DynamicPropertyValuesRcPtr & values) 
             {
                 py::buffer_info info = data.request();
-                checkBufferDivisible(info, 4);
-
-                // Interpret as single row of RGBA pixels
-                BitDepth bitDepth = getBufferBitDepth(info);
+                ImageDescRcPtr img = getBufferImageDesc(info, 4);
 
                 py::gil_scoped_release release;
 
-                long numChannels = 4;
-                long width = (long)info.size / numChannels;
-                long height = 1;
-                ptrdiff_t chanStrideBytes = (ptrdiff_t)info.itemsize;
-                ptrdiff_t xStrideBytes = chanStrideBytes * numChannels;
-                ptrdiff_t yStrideBytes = xStrideBytes * width;
-
-                PackedImageDesc img(info.ptr, 
-                                    width, height, 
-                                    numChannels, 
-                                    bitDepth, 
-                                    chanStrideBytes, 
-                                    xStrideBytes, 
-                                    yStrideBytes);
-                self->apply(img);
+                if (values)
+                {
+                    self->apply(*img, *values, numThreads);
+                }
+                else
+                {
+                    self->apply(*img, numThreads);
+                }
             },
-             "data"_a, 
-             R"doc(
-Apply to a packed RGBA array adhering to the Python buffer protocol. 
+             "data"_a, "numThreads"_a = 1, "values"_a = DynamicPropertyValuesRcPtr(),
+             (R"doc(
+Apply to an RGBA array adhering to the Python buffer protocol. 
 This will typically be a NumPy array. Input and output bit-depths are
-respected but must match. Any array size or shape is supported as long
-as the flattened array size is divisible by 4. Array values are 
-modified in place.
+respected but must match. A C-contiguous array of any size or shape is 
+supported as long as the flattened array size is divisible by 4. Array 
+values are modified in place.
+
+.. note::
+    Other memory layouts are supported as long as the last dimension 
+    of the array holds the 4 channels, and the other dimensions map 
+    to rows of pixels. This includes strided arrays (e.g. 
+    ``img[..., :4]`` or ``img[::2, ::2]`` on a larger image), Fortran 
+    ordered arrays, and planar arrays (e.g. ``np.moveaxis(planes, 0, 
+    -1)`` on an array of shape (4, height, width)). These arrays are 
+    processed in place without any copy.
 
 .. note::
     This differs from the C++ implementation which only applies to a 
-    single pixel. This method uses a ``PackedImageDesc`` under the 
-    hood to apply to an entire image at once. The GIL is released 
+    single pixel. This method uses a ``PackedImageDesc`` (or a 
+    ``PlanarImageDesc`` for the Fortran ordered and planar arrays) 
+    under the hood to apply to an entire image at once. The GIL is 
+    released during processing, freeing up Python to execute other 
+    threads concurrently. Set ``numThreads`` to split the processing 
+    of the array between several threads (0 uses all the hardware 
+    threads).
+
+)doc" + DYNAMIC_VALUES_NOTE).c_str())
+        .def("applyRGBA", [](CPUProcessorRcPtr & self, 
+                            py::buffer & srcData, 
+                            py::buffer & dstData, 
+                            unsigned numThreads,
+                            const DynamicPropertyValuesRcPtr & values) 
+            {
+                py::buffer_info srcInfo = srcData.request();
+                py::buffer_info dstInfo = dstData.request(true);
+                auto imgs = getBufferImageDescs(srcInfo, dstInfo, 4);
+
+                py::gil_scoped_release release;
+
+                if (values)
+                {
+                    self->apply(*imgs.first, *imgs.second, *values, numThreads);
+                }
+                else
+                {
+                    self->apply(*imgs.first, *imgs.second, numThreads);
+                }
+            },
+             "srcData"_a, "dstData"_a, "numThreads"_a = 1, 
+             "values"_a = DynamicPropertyValuesRcPtr(),
+             (R"doc(
+Apply to an RGBA array adhering to the Python buffer protocol. 
+This will typically be a NumPy array. Input and output bit-depths are
+respected and must match the source and destination arrays respectively.
+The source and destination arrays must have the same size, or the same
+shape when not C-contiguous. The same memory layouts as the in place 
+``applyRGBA`` are supported (strided, Fortran ordered and planar 
+arrays), as long as the rows of pixels are shared by both arrays. 
+Modified srcData array values are written to the dstData array, 
+leaving srcData unchanged.
+
+.. note::
+    This avoids copying the source array before an in place 
+    processing when it must be kept intact. The GIL is released 
     during processing, freeing up Python to execute other threads 
-    concurrently.
+    concurrently. Set ``numThreads`` to split the processing of the 
+    array between several threads (0 uses all the hardware threads).
 
-)doc")
-        .def("applyRGBA", [](CPUProcessorRcPtr & self, std::vector<float> & data) 
+)doc" + DYNAMIC_VALUES_NOTE).c_str())
+        .def("applyRGBA", [](CPUProcessorRcPtr & self, 
+                            std::vector<float> & data,
+                            const DynamicPropertyValuesRcPtr & values) 
             {
                 checkVectorDivisible(data, 4);
 
@@ -217,13 +365,20 @@ modified in place.
                 long height = 1;
 
                 PackedImageDesc img(&data[0], width, height, numChannels);
-                self->apply(img);
+                if (values)
+                {
+                    self->apply(img, *values);
+                }
+                else
+                {
+                    self->apply(img);
+                }
 
                 return data;
             },
-             "data"_a,
+             "data"_a, "values"_a = DynamicPropertyValuesRcPtr(),
              py::call_guard<py::gil_scoped_release>(), 
-             R"doc(
+             (R"doc(
 Apply to a packed RGBA list of float values. Any size is supported as 
 long as the list length is divisible by 4. A new list with processed
 float values is returned, leaving the input list unchanged.
@@ -240,7 +395,55 @@ float values is returned, leaving the input list unchanged.
     List values are copied on input and output, where an array is 
     modified in place.
 
-)doc");
+)doc" + DYNAMIC_VALUES_NOTE).c_str())
+        .def("applyRGBPoints", [](CPUProcessorRcPtr & self, 
+                                 py::buffer & data,
+                                 const DynamicPropertyValuesRcPtr & values) 
+            {
+                py::buffer_info info = data.request(true);
+                checkBufferType(info, BIT_DEPTH_F32);
+                checkBufferDivisible(info, 3);
+                checkBufferContiguous(info);
+
+                py::gil_scoped_release release;
+
+                float * points = static_cast<float *>(info.ptr);
+                const size_t numPoints = (size_t)info.size / 3;
+                if (values)
+                {
+                    self->applyRGBPoints(points, numPoints, *values);
+                }
+                else
+                {
+                    self->applyRGBPoints(points, numPoints);
+                }
+            },
+             "data"_a, "values"_a = DynamicPropertyValuesRcPtr(),
+             DOC(CPUProcessor, applyRGBPoints))
+        .def("applyRGBAPoints", [](CPUProcessorRcPtr & self, 
+                                 py::buffer & data,
+                                 const DynamicPropertyValuesRcPtr & values) 
+            {
+                py::buffer_info info = data.request(true);
+                checkBufferType(info, BIT_DEPTH_F32);
+                checkBufferDivisible(info, 4);
+                checkBufferContiguous(info);
+
+                py::gil_scoped_release release;
+
+                float * points = static_cast<float *>(info.ptr);
+                const size_t numPoints = (size_t)info.size / 4;
+                if (values)
+                {
+                    self->applyRGBAPoints(points, numPoints, *values);
+                }
+                else
+                {
+                    self->applyRGBAPoints(points, numPoints);
+                }
+            },
+             "data"_a, "values"_a = DynamicPropertyValuesRcPtr(),
+             DOC(CPUProcessor, applyRGBAPoints));
 }
 
 } // namespace OCIO_NAMESPACE
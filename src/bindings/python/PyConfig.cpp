@@ -184,23 +184,66 @@ void bindPyConfig(py::module & m)
             },
             "memo"_a)
 
+        // The working directory is kept so the relative search paths still resolve once
+        // unpickled (e.g. in the processes of a process pool).
+        .def(py::pickle(
+            [](const ConfigRcPtr & self)
+            {
+                std::ostringstream os;
+                self->serialize(os);
+                return py::make_tuple(os.str(), self->getWorkingDir());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 2)
+                {
+                    throw Exception("Invalid pickled config state.");
+                }
+
+                std::istringstream is(state[0].cast<std::string>());
+                ConfigRcPtr config
+                    = std::const_pointer_cast<Config>(Config::CreateFromStream(is));
+                config->setWorkingDir(state[1].cast<std::string>().c_str());
+                return config;
+            }))
+
         .def_static("CreateRaw", &Config::CreateRaw, 
                     DOC(Config, CreateRaw))
         .def_static("CreateFromEnv", &Config::CreateFromEnv, 
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, CreateFromEnv))
         .def_static("CreateFromFile", &Config::CreateFromFile, "fileName"_a, 
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, CreateFromFile))
+        // The cached config is shared and the constness is lost in Python, so an editable copy
+        // is returned.
+        .def_static("CreateFromEnvCached", []()
+            {
+                return Config::CreateFromEnvCached()->createEditableCopy();
+            },
+             py::call_guard<py::gil_scoped_release>(),
+             DOC(Config, CreateFromEnvCached))
+        .def_static("CreateFromFileCached", [](const std::string & fileName)
+            {
+                return Config::CreateFromFileCached(fileName.c_str())->createEditableCopy();
+            },
+             "fileName"_a,
+             py::call_guard<py::gil_scoped_release>(),
+             DOC(Config, CreateFromFileCached))
         .def_static("CreateFromStream", [](const std::string & str) 
             {
                 std::istringstream is(str);
                 return Config::CreateFromStream(is);
             }, 
              "str"_a, 
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, CreateFromStream))
 
         .def_static("CreateFromBuiltinConfig", &Config::CreateFromBuiltinConfig, 
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, CreateFromBuiltinConfig))
         .def_static("CreateFromConfigIOProxy", &Config::CreateFromConfigIOProxy,
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, CreateFromConfigIOProxy))
         .def("getMajorVersion", &Config::getMajorVersion, 
              DOC(Config, getMajorVersion))
@@ -671,6 +714,32 @@ void bindPyConfig(py::module & m)
                 return py::make_tuple(csName, ruleIndex);
             }, "filePath"_a, 
             DOC(Config, getColorSpaceFromFilepath))
+        .def("getColorSpacesFromFilepaths",
+            [](ConfigRcPtr & self, const std::vector<std::string> & filePaths)
+            {
+                std::vector<const char *> paths;
+                paths.reserve(filePaths.size());
+                for (const auto & filePath : filePaths)
+                {
+                    paths.push_back(filePath.c_str());
+                }
+
+                std::vector<const char *> csNames(paths.size(), nullptr);
+                std::vector<size_t> ruleIndices(paths.size(), 0);
+                {
+                    py::gil_scoped_release release;
+                    self->getColorSpacesFromFilepaths(paths.data(), paths.size(),
+                                                      csNames.data(), ruleIndices.data());
+                }
+
+                py::list result;
+                for (size_t i = 0; i < paths.size(); ++i)
+                {
+                    result.append(py::make_tuple(std::string(csNames[i]), ruleIndices[i]));
+                }
+                return result;
+            }, "filePaths"_a,
+            DOC(Config, getColorSpacesFromFilepaths))
         .def("filepathOnlyMatchesDefaultRule", &Config::filepathOnlyMatchesDefaultRule, 
              "filePath"_a, 
              DOC(Config, filepathOnlyMatchesDefaultRule))
@@ -681,6 +750,7 @@ void bindPyConfig(py::module & m)
                                               const ConstColorSpaceRcPtr &) const) 
              &Config::getProcessor, 
              "srcColorSpace"_a, "dstColorSpace"_a, 
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, getProcessor))
         .def("getProcessor", 
              (ConstProcessorRcPtr (Config::*)(const ConstContextRcPtr &, 
@@ -688,11 +758,13 @@ void bindPyConfig(py::module & m)
                                               const ConstColorSpaceRcPtr &) const) 
              &Config::getProcessor, 
              "context"_a, "srcColorSpace"_a, "dstColorSpace"_a, 
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, getProcessor, 2))
         .def("getProcessor", 
              (ConstProcessorRcPtr (Config::*)(const char *, const char *) const) 
              &Config::getProcessor, 
              "srcColorSpaceName"_a, "dstColorSpaceName"_a, 
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, getProcessor, 3))
         .def("getProcessor", 
              (ConstProcessorRcPtr (Config::*)(const ConstContextRcPtr &, 
@@ -700,6 +772,7 @@ void bindPyConfig(py::module & m)
                                               const char *) const) 
              &Config::getProcessor, 
              "context"_a, "srcColorSpaceName"_a, "dstColorSpaceName"_a, 
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, getProcessor, 4))
         .def("getProcessor", 
              (ConstProcessorRcPtr (Config::*)(const char *,
@@ -708,6 +781,7 @@ void bindPyConfig(py::module & m)
                                               TransformDirection) const) 
              &Config::getProcessor, 
              "srcColorSpaceName"_a, "display"_a, "view"_a, "direction"_a, 
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, getProcessor, 5))
         .def("getProcessor", 
              (ConstProcessorRcPtr (Config::*)(const ConstContextRcPtr &, 
@@ -717,12 +791,14 @@ void bindPyConfig(py::module & m)
                                               TransformDirection) const) 
              &Config::getProcessor, 
              "context"_a, "srcColorSpaceName"_a, "display"_a, "view"_a, "direction"_a, 
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, getProcessor, 6))
         .def("getProcessor", 
              (ConstProcessorRcPtr (Config::*)(const ConstNamedTransformRcPtr &, 
                                               TransformDirection) const) 
              &Config::getProcessor, 
              "namedTransform"_a, "direction"_a, 
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, getProcessor, 7))
         .def("getProcessor", 
              (ConstProcessorRcPtr (Config::*)(const ConstContextRcPtr &, 
@@ -730,12 +806,14 @@ void bindPyConfig(py::module & m)
                                               TransformDirection) const) 
              &Config::getProcessor, 
              "context"_a, "namedTransform"_a, "direction"_a, 
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, getProcessor, 8))
         .def("getProcessor", 
              (ConstProcessorRcPtr (Config::*)(const char *, 
                                               TransformDirection) const) 
              &Config::getProcessor, 
              "namedTransformName"_a, "direction"_a,
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, getProcessor, 9))
         .def("getProcessor", 
              (ConstProcessorRcPtr (Config::*)(const ConstContextRcPtr &, 
@@ -743,17 +821,20 @@ void bindPyConfig(py::module & m)
                                               TransformDirection) const)
              &Config::getProcessor, 
              "context"_a, "namedTransformName"_a, "direction"_a,
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, getProcessor, 10))
         .def("getProcessor", 
              (ConstProcessorRcPtr (Config::*)(const ConstTransformRcPtr &) const) 
              &Config::getProcessor, 
              "transform"_a, 
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, getProcessor, 11))
         .def("getProcessor", 
              (ConstProcessorRcPtr (Config::*)(const ConstTransformRcPtr &, 
                                               TransformDirection) const) 
              &Config::getProcessor, 
              "transform"_a, "direction"_a, 
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, getProcessor, 12))
         .def("getProcessor", 
              (ConstProcessorRcPtr (Config::*)(const ConstContextRcPtr &, 
@@ -761,6 +842,7 @@ void bindPyConfig(py::module & m)
                                               TransformDirection) const) 
              &Config::getProcessor, 
              "context"_a, "transform"_a, "direction"_a, 
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Config, getProcessor, 13))
         .def_static("GetProcessorToBuiltinColorSpace", [](const ConstConfigRcPtr & srcConfig,
                                                           const char * srcColorSpaceName,
@@ -771,6 +853,7 @@ void bindPyConfig(py::module & m)
                                                                builtinColorSpaceName);
             },
                     "srcConfig"_a, "srcColorSpaceName"_a, "builtinColorSpaceName"_a,
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, GetProcessorToBuiltinColorSpace))
         .def_static("GetProcessorFromBuiltinColorSpace", [](const char * builtinColorSpaceName,
                                                           ConstConfigRcPtr srcConfig,
@@ -781,6 +864,7 @@ void bindPyConfig(py::module & m)
                                                                  srcColorSpaceName);
             },
                     "builtinColorSpaceName"_a, "srcConfig"_a, "srcColorSpaceName"_a,
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, GetProcessorFromBuiltinColorSpace))
         .def_static("GetProcessorFromConfigs", [](const ConstConfigRcPtr & srcConfig,
                                                   const char * srcColorSpaceName,
@@ -791,6 +875,7 @@ void bindPyConfig(py::module & m)
                                                        dstConfig, dstColorSpaceName);
             },
                     "srcConfig"_a, "srcColorSpaceName"_a, "dstConfig"_a, "dstColorSpaceName"_a, 
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, GetProcessorFromConfigs))
         .def_static("GetProcessorFromConfigs", [](const ConstContextRcPtr & srcContext,
                                                   const ConstConfigRcPtr & srcConfig,
@@ -804,6 +889,7 @@ void bindPyConfig(py::module & m)
             },
                     "srcContext"_a, "srcConfig"_a, "srcColorSpaceName"_a, 
                     "dstContext"_a, "dstConfig"_a, "dstColorSpaceName"_a, 
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, GetProcessorFromConfigs, 2))
         .def_static("GetProcessorFromConfigs", [](const ConstConfigRcPtr & srcConfig,
                                                   const char * srcColorSpaceName,
@@ -821,6 +907,7 @@ void bindPyConfig(py::module & m)
             }, 
                     "srcConfig"_a, "srcColorSpaceName"_a, "srcInterchangeName"_a, 
                     "dstConfig"_a, "dstColorSpaceName"_a, "dstInterchangeName"_a, 
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, GetProcessorFromConfigs, 3))
         .def_static("GetProcessorFromConfigs", [](const ConstContextRcPtr & srcContext,
                                                   const ConstConfigRcPtr & srcConfig,
@@ -842,6 +929,7 @@ void bindPyConfig(py::module & m)
             }, 
                     "srcContext"_a, "srcConfig"_a, "srcColorSpaceName"_a, "srcInterchangeName"_a, 
                     "dstContext"_a, "dstConfig"_a, "dstColorSpaceName"_a, "dstInterchangeName"_a, 
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, GetProcessorFromConfigs, 4))
         .def_static("GetProcessorFromConfigs", [](const ConstConfigRcPtr & srcConfig,
                                                   const char * srcColorSpaceName,
@@ -854,6 +942,7 @@ void bindPyConfig(py::module & m)
                                                        dstConfig, dstDisplay, dstView, direction);
             },
                     "srcConfig"_a, "srcColorSpaceName"_a, "dstConfig"_a, "dstDisplay"_a, "dstView"_a, "direction"_a,
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, GetProcessorFromConfigs, 5))
         .def_static("GetProcessorFromConfigs", [](const ConstContextRcPtr & srcContext,
                                                   const ConstConfigRcPtr & srcConfig,
@@ -869,6 +958,7 @@ void bindPyConfig(py::module & m)
             },
                     "srcContext"_a, "srcConfig"_a, "srcColorSpaceName"_a,
                     "dstContext"_a, "dstConfig"_a, "dstView"_a, "dstDisplay"_a, "direction"_a,
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, GetProcessorFromConfigs, 6))
         .def_static("GetProcessorFromConfigs", [](const ConstConfigRcPtr & srcConfig,
                                                   const char * srcColorSpaceName,
@@ -890,6 +980,7 @@ void bindPyConfig(py::module & m)
             },
                     "srcConfig"_a, "srcColorSpaceName"_a, "srcInterchangeName"_a,
                     "dstConfig"_a, "dstDisplay"_a, "dstView"_a, "dstInterchangeName"_a, "direction"_a,
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, GetProcessorFromConfigs, 7))
         .def_static("GetProcessorFromConfigs", [](const ConstContextRcPtr & srcContext,
                                                   const ConstConfigRcPtr & srcConfig,
@@ -915,11 +1006,18 @@ void bindPyConfig(py::module & m)
             },
                     "srcContext"_a, "srcConfig"_a, "srcColorSpaceName"_a, "srcInterchangeName"_a,
                     "dstContext"_a, "dstConfig"_a, "dstDisplay"_a, "dstView"_a, "dstInterchangeName"_a, "direction"_a,
+                    py::call_guard<py::gil_scoped_release>(),
                     DOC(Config, GetProcessorFromConfigs, 8))
         .def("setProcessorCacheFlags", &Config::setProcessorCacheFlags, "flags"_a, 
              DOC(Config, setProcessorCacheFlags))
         .def("clearProcessorCache", &Config::clearProcessorCache, 
              DOC(Config, setProcessorCacheFlags))
+        .def("setProcessorCacheCapacity", &Config::setProcessorCacheCapacity, "capacity"_a,
+             DOC(Config, setProcessorCacheCapacity))
+        .def("getProcessorCacheCapacity", &Config::getProcessorCacheCapacity,
+             DOC(Config, getProcessorCacheCapacity))
+        .def("getProcessorCacheStatistics", &Config::getProcessorCacheStatistics,
+             DOC(Config, getProcessorCacheStatistics))
 
         // Archiving
         .def("isArchivable", &Config::isArchivable, DOC(Config, isArchivable))
@@ -31,6 +31,36 @@ void bindPyDynamicProperty(py::module & m)
              DOC(DynamicPropertyValue, AsGradingTone))
         .def("setGradingTone", &PyDynamicProperty::setGradingTone, "val"_a, 
              DOC(DynamicPropertyValue, AsGradingTone));
+
+    auto clsDynamicPropertyValues = 
+        py::class_<DynamicPropertyValues, DynamicPropertyValuesRcPtr>(
+            m.attr("DynamicPropertyValues"))
+
+        .def(py::init(&DynamicPropertyValues::Create), 
+             DOC(DynamicPropertyValues, Create))
+
+        .def("hasValue", &DynamicPropertyValues::hasValue, "type"_a, 
+             DOC(DynamicPropertyValues, hasValue))
+        .def("removeValue", &DynamicPropertyValues::removeValue, "type"_a, 
+             DOC(DynamicPropertyValues, removeValue))
+        .def("clear", &DynamicPropertyValues::clear, 
+             DOC(DynamicPropertyValues, clear))
+        .def("getDouble", &DynamicPropertyValues::getDouble, "type"_a, 
+             DOC(DynamicPropertyValues, getDouble))
+        .def("setDouble", &DynamicPropertyValues::setDouble, "type"_a, "val"_a, 
+             DOC(DynamicPropertyValues, setDouble))
+        .def("getGradingPrimary", &DynamicPropertyValues::getGradingPrimary, 
+             DOC(DynamicPropertyValues, getGradingPrimary))
+        .def("setGradingPrimary", &DynamicPropertyValues::setGradingPrimary, "val"_a, 
+             DOC(DynamicPropertyValues, setGradingPrimary))
+        .def("getGradingRGBCurve", &DynamicPropertyValues::getGradingRGBCurve, 
+             DOC(DynamicPropertyValues, getGradingRGBCurve))
+        .def("setGradingRGBCurve", &DynamicPropertyValues::setGradingRGBCurve, "val"_a, 
+             DOC(DynamicPropertyValues, setGradingRGBCurve))
+        .def("getGradingTone", &DynamicPropertyValues::getGradingTone, 
+             DOC(DynamicPropertyValues, getGradingTone))
+        .def("setGradingTone", &DynamicPropertyValues::setGradingTone, "val"_a, 
+             DOC(DynamicPropertyValues, setGradingTone));
 }
 
 } // namespace OCIO_NAMESPACE
@@ -2,6 +2,7 @@
 // Copyright Contributors to the OpenColorIO Project.
 
 #include "PyOpenColorIO.h"
+#include "PyUtils.h"
 
 namespace OCIO_NAMESPACE
 {
@@ -40,6 +41,28 @@ PYBIND11_MODULE(PyOpenColorIO, m)
     // Global functions
     m.def("ClearAllCaches", &ClearAllCaches,
           DOC(PyOpenColorIO, ClearAllCaches));
+    m.def("SetFileCacheCapacity", &SetFileCacheCapacity, "capacity"_a,
+          DOC(PyOpenColorIO, SetFileCacheCapacity));
+    m.def("GetFileCacheCapacity", &GetFileCacheCapacity,
+          DOC(PyOpenColorIO, GetFileCacheCapacity));
+    m.def("GetFileCacheStatistics", &GetFileCacheStatistics,
+          DOC(PyOpenColorIO, GetFileCacheStatistics));
+    m.def("SetFileCacheValidationInterval", &SetFileCacheValidationInterval, "milliseconds"_a,
+          DOC(PyOpenColorIO, SetFileCacheValidationInterval));
+    m.def("GetFileCacheValidationInterval", &GetFileCacheValidationInterval,
+          DOC(PyOpenColorIO, GetFileCacheValidationInterval));
+    m.def("ClearConfigCache", &ClearConfigCache,
+          DOC(PyOpenColorIO, ClearConfigCache));
+    m.def("SetConfigCacheCapacity", &SetConfigCacheCapacity, "capacity"_a,
+          DOC(PyOpenColorIO, SetConfigCacheCapacity));
+    m.def("GetConfigCacheCapacity", &GetConfigCacheCapacity,
+          DOC(PyOpenColorIO, GetConfigCacheCapacity));
+    m.def("GetConfigCacheStatistics", &GetConfigCacheStatistics,
+          DOC(PyOpenColorIO, GetConfigCacheStatistics));
+    m.def("SetLazyConfigLoading", &SetLazyConfigLoading, "lazy"_a,
+          DOC(PyOpenColorIO, SetLazyConfigLoading));
+    m.def("GetLazyConfigLoading", &GetLazyConfigLoading,
+          DOC(PyOpenColorIO, GetLazyConfigLoading));
     m.def("GetVersion", &GetVersion,
           DOC(PyOpenColorIO, GetVersion));
     m.def("GetVersionHex", &GetVersionHex,
@@ -58,6 +81,14 @@ PYBIND11_MODULE(PyOpenColorIO, m)
           DOC(PyOpenColorIO, SetComputeHashFunction));
     m.def("ResetComputeHashFunction", &ResetComputeHashFunction,
           DOC(PyOpenColorIO, ResetComputeHashFunction));
+    m.def("GetCPUProcessorChunkSize", &GetCPUProcessorChunkSize,
+          DOC(PyOpenColorIO, GetCPUProcessorChunkSize));
+    m.def("SetCPUProcessorChunkSize", &SetCPUProcessorChunkSize, "numPixels"_a,
+          DOC(PyOpenColorIO, SetCPUProcessorChunkSize));
+    m.def("GetFastInverseLut3DGridSize", &GetFastInverseLut3DGridSize,
+          DOC(PyOpenColorIO, GetFastInverseLut3DGridSize));
+    m.def("SetFastInverseLut3DGridSize", &SetFastInverseLut3DGridSize, "gridSize"_a,
+          DOC(PyOpenColorIO, SetFastInverseLut3DGridSize));
     m.def("GetEnvVariable", &GetEnvVariable, "name"_a,
           DOC(PyOpenColorIO, GetEnvVariable));
     m.def("SetEnvVariable", &SetEnvVariable, "name"_a, "value"_a,
@@ -67,6 +98,28 @@ PYBIND11_MODULE(PyOpenColorIO, m)
     m.def("IsEnvVariablePresent", &IsEnvVariablePresent, "name"_a,
           DOC(PyOpenColorIO, IsEnvVariablePresent));
 
+    // Cache statistics
+    auto clsCacheStatistics =
+        py::class_<CacheStatistics>(
+            m.attr("CacheStatistics"))
+
+        .def(py::init<>())
+
+        .def_readonly("hits", &CacheStatistics::m_hits,
+                      DOC(CacheStatistics, m_hits))
+        .def_readonly("misses", &CacheStatistics::m_misses,
+                      DOC(CacheStatistics, m_misses))
+        .def_readonly("evictions", &CacheStatistics::m_evictions,
+                      DOC(CacheStatistics, m_evictions))
+        .def_readonly("invalidations", &CacheStatistics::m_invalidations,
+                      DOC(CacheStatistics, m_invalidations))
+        .def_readonly("size", &CacheStatistics::m_size,
+                      DOC(CacheStatistics, m_size))
+        .def_readonly("capacity", &CacheStatistics::m_capacity,
+                      DOC(CacheStatistics, m_capacity));
+
+    defRepr(clsCacheStatistics);
+
     // OpenColorIO
     bindPyBaker(m);
     bindPyBuiltinConfigRegistry(m);
@@ -48,6 +48,24 @@ void bindPyProcessor(py::module & m)
             })
         .def("createGroupTransform", &Processor::createGroupTransform,
              DOC(Processor, createGroupTransform))
+
+        // A processor is pickled as the group transform of its ops, so the config it comes
+        // from is not needed to create it again.
+        .def(py::pickle(
+            [](const ProcessorRcPtr & self)
+            {
+                return py::make_tuple(self->createGroupTransform());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 1)
+                {
+                    throw Exception("Invalid pickled processor state.");
+                }
+
+                ConstTransformRcPtr group = state[0].cast<GroupTransformRcPtr>();
+                return std::const_pointer_cast<Processor>(Config::CreateRaw()->getProcessor(group));
+            }))
         .def("getDynamicProperty", [](ProcessorRcPtr & self, DynamicPropertyType type)
             {
                 return PyDynamicProperty(self->getDynamicProperty(type));
@@ -64,31 +82,38 @@ void bindPyProcessor(py::module & m)
         .def("getOptimizedProcessor",
              (ConstProcessorRcPtr(Processor::*)(OptimizationFlags) const)
              &Processor::getOptimizedProcessor, "oFlags"_a,
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Processor, getOptimizedProcessor))
         .def("getOptimizedProcessor",
              (ConstProcessorRcPtr(Processor::*)(BitDepth, BitDepth, OptimizationFlags) const)
              &Processor::getOptimizedProcessor,
              "inBitDepth"_a, "outBitDepth"_a, "oFlags"_a,
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Processor, getOptimizedProcessor))
 
         // GPU Renderer
         .def("getDefaultGPUProcessor", &Processor::getDefaultGPUProcessor,
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Processor, getDefaultGPUProcessor))
         .def("getOptimizedGPUProcessor", &Processor::getOptimizedGPUProcessor, "oFlags"_a,
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Processor, getOptimizedGPUProcessor))
 
         // CPU Renderer
         .def("getDefaultCPUProcessor", &Processor::getDefaultCPUProcessor,
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Processor, getDefaultCPUProcessor))
         .def("getOptimizedCPUProcessor", 
              (ConstCPUProcessorRcPtr (Processor::*)(OptimizationFlags) const) 
              &Processor::getOptimizedCPUProcessor, 
              "oFlags"_a,
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Processor, getOptimizedCPUProcessor))
         .def("getOptimizedCPUProcessor", 
              (ConstCPUProcessorRcPtr (Processor::*)(BitDepth, BitDepth, OptimizationFlags) const) 
              &Processor::getOptimizedCPUProcessor, 
              "inBitDepth"_a, "outBitDepth"_a, "oFlags"_a,
+             py::call_guard<py::gil_scoped_release>(),
              DOC(Processor, getOptimizedCPUProcessor));
 
     clsTransformFormatMetadataIterator
@@ -18,6 +18,10 @@ void bindPyTypes(py::module & m)
         m, "Baker", 
         DOC(Baker));
 
+    py::class_<CacheStatistics>(
+        m, "CacheStatistics",
+        DOC(CacheStatistics));
+
     py::class_<PyBuiltinConfigRegistry>(
         m, "BuiltinConfigRegistry", 
         DOC(BuiltinConfigRegistry));
@@ -107,6 +111,10 @@ void bindPyTypes(py::module & m)
         m, "DynamicProperty", 
         DOC(DynamicProperty));
 
+    py::class_<DynamicPropertyValues, DynamicPropertyValuesRcPtr /* holder */>(
+        m, "DynamicPropertyValues", 
+        DOC(DynamicPropertyValues));
+
     py::class_<FormatMetadata>(
         m, "FormatMetadata", 
         DOC(FormatMetadata));
@@ -751,6 +759,10 @@ void bindPyTypes(py::module & m)
                DOC(PyOpenColorIO, OptimizationFlags, OPTIMIZATION_SIMPLIFY_OPS))
         .value("OPTIMIZATION_NO_DYNAMIC_PROPERTIES", OPTIMIZATION_NO_DYNAMIC_PROPERTIES, 
                DOC(PyOpenColorIO, OptimizationFlags, OPTIMIZATION_NO_DYNAMIC_PROPERTIES))
+        .value("OPTIMIZATION_COMPACT_LUTS", OPTIMIZATION_COMPACT_LUTS, 
+               DOC(PyOpenColorIO, OptimizationFlags, OPTIMIZATION_COMPACT_LUTS))
+        .value("OPTIMIZATION_FAST_ACES2", OPTIMIZATION_FAST_ACES2, 
+               DOC(PyOpenColorIO, OptimizationFlags, OPTIMIZATION_FAST_ACES2))
         .value("OPTIMIZATION_ALL", OPTIMIZATION_ALL, 
                DOC(PyOpenColorIO, OptimizationFlags, OPTIMIZATION_ALL))
         .value("OPTIMIZATION_LOSSLESS", OPTIMIZATION_LOSSLESS, 
@@ -866,6 +878,7 @@ void bindPyTypes(py::module & m)
     m.attr("OCIO_INACTIVE_COLORSPACES_ENVVAR") = OCIO_INACTIVE_COLORSPACES_ENVVAR;
     m.attr("OCIO_OPTIMIZATION_FLAGS_ENVVAR") = OCIO_OPTIMIZATION_FLAGS_ENVVAR;
     m.attr("OCIO_USER_CATEGORIES_ENVVAR") = OCIO_USER_CATEGORIES_ENVVAR;
+    m.attr("OCIO_LAZY_CONFIG_LOADING_ENVVAR") = OCIO_LAZY_CONFIG_LOADING_ENVVAR;
 
     // Roles
     m.attr("ROLE_DEFAULT") = ROLE_DEFAULT;
@@ -896,6 +909,8 @@ void bindPyTypes(py::module & m)
     m.attr("OCIO_DISABLE_ALL_CACHES") = OCIO_DISABLE_ALL_CACHES;
     m.attr("OCIO_DISABLE_PROCESSOR_CACHES") = OCIO_DISABLE_PROCESSOR_CACHES;
     m.attr("OCIO_DISABLE_CACHE_FALLBACK") = OCIO_DISABLE_CACHE_FALLBACK;
+    m.attr("OCIO_FILE_CACHE_CAPACITY") = OCIO_FILE_CACHE_CAPACITY;
+    m.attr("OCIO_FILE_CACHE_VALIDATION_INTERVAL") = OCIO_FILE_CACHE_VALIDATION_INTERVAL;
 
     m.attr("OCIO_CONFIG_DEFAULT_NAME") = OCIO_CONFIG_DEFAULT_NAME;
     m.attr("OCIO_CONFIG_DEFAULT_FILE_EXT") = OCIO_CONFIG_DEFAULT_FILE_EXT;
@@ -1,8 +1,11 @@
 // SPDX-License-Identifier: BSD-3-Clause
 // Copyright Contributors to the OpenColorIO Project.
 
+#include <algorithm>
 #include <cmath>
+#include <cstdlib>
 #include <sstream>
+#include <utility>
 
 #include "PyUtils.h"
 
@@ -201,6 +204,245 @@ void checkBufferSize(const py::buffer_info & info, py::ssize_t numEntries)
     }
 }
 
+bool isBufferContiguous(const py::buffer_info & info)
+{
+    py::ssize_t stride = info.itemsize;
+    for (py::ssize_t i = info.ndim - 1; i >= 0; --i)
+    {
+        if (info.shape[i] > 1 && info.strides[i] != stride)
+        {
+            return false;
+        }
+        stride *= info.shape[i];
+    }
+    return true;
+}
+
+void checkBufferContiguous(const py::buffer_info & info)
+{
+    if (!isBufferContiguous(info))
+    {
+        std::ostringstream os;
+        os << "Incompatible buffer memory layout: expected a C-contiguous array, but ";
+        os << "received a strided array of shape " << getBufferShapeStr(info);
+        throw std::runtime_error(os.str().c_str());
+    }
+}
+
+namespace
+{
+
+// Rows and columns of pixels shared by buffers of the same shape.
+struct PixelLayout
+{
+    long m_width = 1;
+    long m_height = 1;
+    std::vector<ptrdiff_t> m_chanStrideBytes;
+    std::vector<ptrdiff_t> m_xStrideBytes;
+    std::vector<ptrdiff_t> m_yStrideBytes;
+};
+
+// A pixel dimension of the buffers i.e. its size and its stride in each buffer.
+struct PixelDim
+{
+    py::ssize_t m_size;
+    std::vector<ptrdiff_t> m_strideBytes;
+};
+
+PixelLayout getBuffersPixelLayout(const std::vector<const py::buffer_info *> & infos, 
+                                  long numChannels)
+{
+    PixelLayout layout;
+
+    const bool contiguous = std::all_of(infos.begin(), infos.end(), 
+                                        [](const py::buffer_info * info)
+                                        {
+                                            return isBufferContiguous(*info);
+                                        });
+
+    if (contiguous)
+    {
+        // Interpret as single row of pixels.
+        for (const py::buffer_info * info : infos)
+        {
+            checkBufferDivisible(*info, numChannels);
+            checkBufferSize(*info, infos[0]->size);
+        }
+
+        layout.m_width = (long)infos[0]->size / numChannels;
+
+        for (const py::buffer_info * info : infos)
+        {
+            const ptrdiff_t chanStrideBytes = (ptrdiff_t)info->itemsize;
+            layout.m_chanStrideBytes.push_back(chanStrideBytes);
+            layout.m_xStrideBytes.push_back(chanStrideBytes * numChannels);
+            layout.m_yStrideBytes.push_back(chanStrideBytes * numChannels * layout.m_width);
+        }
+
+        return layout;
+    }
+
+    // A strided array (e.g. a slice or a Fortran ordered array) must hold the channels in its 
+    // last dimension.
+    const py::buffer_info & ref = *infos[0];
+
+    if (ref.ndim < 1 || ref.shape[ref.ndim - 1] != numChannels)
+    {
+        std::ostringstream os;
+        os << "Incompatible buffer dimensions: expected the last dimension of a strided array ";
+        os << "to be " << numChannels << ", but received shape " << getBufferShapeStr(ref);
+        throw std::runtime_error(os.str().c_str());
+    }
+
+    for (const py::buffer_info * info : infos)
+    {
+        if (info->shape != ref.shape)
+        {
+            std::ostringstream os;
+            os << "Incompatible buffer dimensions: expected shape " << getBufferShapeStr(ref);
+            os << ", but received shape " << getBufferShapeStr(*info);
+            throw std::runtime_error(os.str().c_str());
+        }
+    }
+
+    // Pixels are processed independently so the other dimensions could be visited in any
+    // order. Sort them from the smallest to the largest stride (of the first buffer) and merge
+    // the ones contiguous to each other in all the buffers, to end up with a row (and a column)
+    // of pixels.
+    std::vector<PixelDim> dims;
+    for (py::ssize_t i = 0; i < ref.ndim - 1; ++i)
+    {
+        if (ref.shape[i] != 1)
+        {
+            PixelDim dim{ ref.shape[i], {} };
+            for (const py::buffer_info * info : infos)
+            {
+                dim.m_strideBytes.push_back((ptrdiff_t)info->strides[i]);
+            }
+            dims.push_back(dim);
+        }
+    }
+
+    std::stable_sort(dims.begin(), dims.end(),
+                     [](const PixelDim & lhs, const PixelDim & rhs)
+                     {
+                         return std::abs(lhs.m_strideBytes[0]) < std::abs(rhs.m_strideBytes[0]);
+                     });
+
+    std::vector<PixelDim> pixelDims;
+    for (const PixelDim & dim : dims)
+    {
+        bool merge = !pixelDims.empty();
+        for (size_t b = 0; merge && b < infos.size(); ++b)
+        {
+            const PixelDim & prev = pixelDims.back();
+            merge = prev.m_strideBytes[b] * (ptrdiff_t)prev.m_size == dim.m_strideBytes[b];
+        }
+
+        if (merge)
+        {
+            pixelDims.back().m_size *= dim.m_size;
+        }
+        else
+        {
+            pixelDims.push_back(dim);
+        }
+    }
+
+    if (pixelDims.size() > 2)
+    {
+        std::ostringstream os;
+        os << "Incompatible buffer memory layout: the strides of an array of shape ";
+        os << getBufferShapeStr(ref) << " could not be mapped to rows of pixels";
+        throw std::runtime_error(os.str().c_str());
+    }
+
+    layout.m_width  = pixelDims.empty() ? 1 : (long)pixelDims[0].m_size;
+    layout.m_height = pixelDims.size() < 2 ? 1 : (long)pixelDims[1].m_size;
+
+    for (size_t b = 0; b < infos.size(); ++b)
+    {
+        const ptrdiff_t chanStrideBytes = (ptrdiff_t)infos[b]->strides[ref.ndim - 1];
+        const ptrdiff_t xStrideBytes 
+            = pixelDims.empty() ? chanStrideBytes * numChannels : pixelDims[0].m_strideBytes[b];
+        const ptrdiff_t yStrideBytes 
+            = pixelDims.size() < 2 ? xStrideBytes * layout.m_width : pixelDims[1].m_strideBytes[b];
+
+        // The rows of pixels must not overlap (e.g. source and destination arrays with different
+        // memory orders).
+        if (std::abs(xStrideBytes) * layout.m_width > std::abs(yStrideBytes))
+        {
+            std::ostringstream os;
+            os << "Incompatible buffer memory layout: the strides of an array of shape ";
+            os << getBufferShapeStr(ref) << " could not be mapped to rows of pixels";
+            if (infos.size() > 1)
+            {
+                os << " shared by all the arrays";
+            }
+            throw std::runtime_error(os.str().c_str());
+        }
+
+        layout.m_chanStrideBytes.push_back(chanStrideBytes);
+        layout.m_xStrideBytes.push_back(xStrideBytes);
+        layout.m_yStrideBytes.push_back(yStrideBytes);
+    }
+
+    return layout;
+}
+
+ImageDescRcPtr createBufferImageDesc(const py::buffer_info & info, 
+                                     long numChannels, 
+                                     const PixelLayout & layout, 
+                                     size_t index)
+{
+    const BitDepth bitDepth = getBufferBitDepth(info);
+
+    const ptrdiff_t chanStrideBytes = layout.m_chanStrideBytes[index];
+    const ptrdiff_t xStrideBytes    = layout.m_xStrideBytes[index];
+    const ptrdiff_t yStrideBytes    = layout.m_yStrideBytes[index];
+
+    if (std::abs(chanStrideBytes * numChannels) <= std::abs(xStrideBytes))
+    {
+        return std::make_shared<PackedImageDesc>(info.ptr,
+                                                 layout.m_width, layout.m_height,
+                                                 numChannels,
+                                                 bitDepth,
+                                                 chanStrideBytes,
+                                                 xStrideBytes,
+                                                 yStrideBytes);
+    }
+
+    // The channels are further apart than the pixels (e.g. a Fortran ordered array), so the
+    // array is described as channel planes.
+    char * rData = static_cast<char *>(info.ptr);
+    return std::make_shared<PlanarImageDesc>(rData,
+                                             rData + chanStrideBytes,
+                                             rData + 2 * chanStrideBytes,
+                                             numChannels == 4 ? rData + 3 * chanStrideBytes 
+                                                              : nullptr,
+                                             layout.m_width, layout.m_height,
+                                             bitDepth,
+                                             xStrideBytes,
+                                             yStrideBytes);
+}
+
+} // namespace
+
+ImageDescRcPtr getBufferImageDesc(const py::buffer_info & info, long numChannels)
+{
+    const PixelLayout layout = getBuffersPixelLayout({ &info }, numChannels);
+    return createBufferImageDesc(info, numChannels, layout, 0);
+}
+
+std::pair<ImageDescRcPtr, ImageDescRcPtr> getBufferImageDescs(const py::buffer_info & srcInfo,
+                                                              const py::buffer_info & dstInfo,
+                                                              long numChannels)
+{
+    const PixelLayout layout = getBuffersPixelLayout({ &srcInfo, &dstInfo }, numChannels);
+    return std::make_pair(createBufferImageDesc(srcInfo, numChannels, layout, 0),
+                          createBufferImageDesc(dstInfo, numChannels, layout, 1));
+}
+
 unsigned long getBufferLut3DGridSize(const py::buffer_info & info)
 {
     checkBufferDivisible(info, 3);
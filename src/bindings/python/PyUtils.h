@@ -6,6 +6,7 @@
 
 #include <string>
 #include <tuple>
+#include <utility>
 #include <vector>
 
 #include "PyOpenColorIO.h"
@@ -82,6 +83,19 @@ void checkBufferType(const py::buffer_info & info, BitDepth bitDepth);
 void checkBufferDivisible(const py::buffer_info & info, py::ssize_t numChannels);
 // Throw if Python buffer does not have an exact count of entries
 void checkBufferSize(const py::buffer_info & info, py::ssize_t numEntries);
+// Return true if Python buffer entries are contiguous in memory (i.e. C order)
+bool isBufferContiguous(const py::buffer_info & info);
+// Throw if Python buffer entries are not contiguous in memory (i.e. C order)
+void checkBufferContiguous(const py::buffer_info & info);
+// Describe a Python buffer of RGB or RGBA pixels, honoring its shape and strides. A C-contiguous
+// buffer of any shape is a single row of pixels, a strided buffer must hold the channels in its 
+// last dimension.
+ImageDescRcPtr getBufferImageDesc(const py::buffer_info & info, long numChannels);
+// Describe source and destination Python buffers of RGB or RGBA pixels, refer to 
+// getBufferImageDesc. Strided buffers must have the same shape.
+std::pair<ImageDescRcPtr, ImageDescRcPtr> getBufferImageDescs(const py::buffer_info & srcInfo,
+                                                              const py::buffer_info & dstInfo,
+                                                              long numChannels);
 
 // Calculate 3D grid size from a packed 3D LUT buffer
 unsigned long getBufferLut3DGridSize(const py::buffer_info & info);
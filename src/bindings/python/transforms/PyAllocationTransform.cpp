@@ -68,7 +68,29 @@ void bindPyAllocationTransform(py::module & m)
                 setVars(self, vars);
             }, 
              "vars"_a,
-             DOC(AllocationTransform, setVars));
+             DOC(AllocationTransform, setVars))
+
+        .def(py::pickle(
+            [](const AllocationTransformRcPtr & self)
+            {
+                return py::make_tuple(self->getAllocation(),
+                                      getVarsStdVec(self),
+                                      self->getDirection());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 3)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                AllocationTransformRcPtr p = AllocationTransform::Create();
+                p->setAllocation(state[0].cast<Allocation>());
+                const std::vector<float> vars = state[1].cast<std::vector<float>>();
+                if (!vars.empty()) { setVars(p, vars); }
+                p->setDirection(state[2].cast<TransformDirection>());
+                return p;
+            }));
 
     defRepr(clsAllocationTransform);
 }
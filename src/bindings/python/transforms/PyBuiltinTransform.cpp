@@ -33,7 +33,26 @@ void bindPyBuiltinTransform(py::module & m)
         .def("getStyle", &BuiltinTransform::getStyle, 
              DOC(BuiltinTransform, getStyle))
         .def("getDescription", &BuiltinTransform::getDescription, 
-             DOC(BuiltinTransform, getDescription));
+             DOC(BuiltinTransform, getDescription))
+
+        .def(py::pickle(
+            [](const BuiltinTransformRcPtr & self)
+            {
+                return py::make_tuple(self->getStyle(),
+                                      self->getDirection());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 2)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                BuiltinTransformRcPtr p = BuiltinTransform::Create();
+                p->setStyle(state[0].cast<std::string>().c_str());
+                p->setDirection(state[1].cast<TransformDirection>());
+                return p;
+            }));
 
     defRepr(clsBuiltinTransform);
 }
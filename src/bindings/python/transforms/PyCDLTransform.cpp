@@ -151,7 +151,44 @@ void bindPyCDLTransform(py::module & m)
              DOC(CDLTransform, getFirstSOPDescription))
         .def("setFirstSOPDescription", &CDLTransform::setFirstSOPDescription,
              "description"_a.none(false),
-             DOC(CDLTransform, setFirstSOPDescription));
+             DOC(CDLTransform, setFirstSOPDescription))
+
+        .def(py::pickle(
+            [](const CDLTransformRcPtr & self)
+            {
+                std::array<double, 3> slope, offset, power;
+                self->getSlope(slope.data());
+                self->getOffset(offset.data());
+                self->getPower(power.data());
+                return py::make_tuple(slope,
+                                      offset,
+                                      power,
+                                      self->getSat(),
+                                      self->getStyle(),
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID(),
+                                      self->getFirstSOPDescription());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 9)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                CDLTransformRcPtr p = CDLTransform::Create();
+                p->setSlope(state[0].cast<std::array<double, 3>>().data());
+                p->setOffset(state[1].cast<std::array<double, 3>>().data());
+                p->setPower(state[2].cast<std::array<double, 3>>().data());
+                p->setSat(state[3].cast<double>());
+                p->setStyle(state[4].cast<CDLStyle>());
+                p->setDirection(state[5].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[6].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[7].cast<std::string>().c_str());
+                p->setFirstSOPDescription(state[8].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsCDLTransform);
 }
@@ -46,7 +46,30 @@ void bindPyColorSpaceTransform(py::module & m)
         .def("getDataBypass", &ColorSpaceTransform::getDataBypass, 
              DOC(ColorSpaceTransform, getDataBypass))
         .def("setDataBypass", &ColorSpaceTransform::setDataBypass, "dataBypass"_a, 
-             DOC(ColorSpaceTransform, setDataBypass));
+             DOC(ColorSpaceTransform, setDataBypass))
+
+        .def(py::pickle(
+            [](const ColorSpaceTransformRcPtr & self)
+            {
+                return py::make_tuple(self->getSrc(),
+                                      self->getDst(),
+                                      self->getDataBypass(),
+                                      self->getDirection());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 4)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                ColorSpaceTransformRcPtr p = ColorSpaceTransform::Create();
+                p->setSrc(state[0].cast<std::string>().c_str());
+                p->setDst(state[1].cast<std::string>().c_str());
+                p->setDataBypass(state[2].cast<bool>());
+                p->setDirection(state[3].cast<TransformDirection>());
+                return p;
+            }));
 
     defRepr(clsColorSpaceTransform);
 }
@@ -60,7 +60,34 @@ void bindPyDisplayViewTransform(py::module & m)
         .def("getDataBypass", &DisplayViewTransform::getDataBypass, 
              DOC(DisplayViewTransform, getDataBypass))
         .def("setDataBypass", &DisplayViewTransform::setDataBypass, "dataBypass"_a, 
-             DOC(DisplayViewTransform, setDataBypass));
+             DOC(DisplayViewTransform, setDataBypass))
+
+        .def(py::pickle(
+            [](const DisplayViewTransformRcPtr & self)
+            {
+                return py::make_tuple(self->getSrc(),
+                                      self->getDisplay(),
+                                      self->getView(),
+                                      self->getLooksBypass(),
+                                      self->getDataBypass(),
+                                      self->getDirection());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 6)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                DisplayViewTransformRcPtr p = DisplayViewTransform::Create();
+                p->setSrc(state[0].cast<std::string>().c_str());
+                p->setDisplay(state[1].cast<std::string>().c_str());
+                p->setView(state[2].cast<std::string>().c_str());
+                p->setLooksBypass(state[3].cast<bool>());
+                p->setDataBypass(state[4].cast<bool>());
+                p->setDirection(state[5].cast<TransformDirection>());
+                return p;
+            }));
 
     defRepr(clsDisplayViewTransform);
 }
@@ -57,7 +57,35 @@ void bindPyExponentTransform(py::module & m)
         .def("getNegativeStyle", &ExponentTransform::getNegativeStyle, 
              DOC(ExponentTransform, getNegativeStyle))
         .def("setNegativeStyle", &ExponentTransform::setNegativeStyle, "style"_a, 
-             DOC(ExponentTransform, setNegativeStyle));
+             DOC(ExponentTransform, setNegativeStyle))
+
+        .def(py::pickle(
+            [](const ExponentTransformRcPtr & self)
+            {
+                std::array<double, 4> value;
+                self->getValue(*reinterpret_cast<double(*)[4]>(value.data()));
+                return py::make_tuple(value,
+                                      self->getNegativeStyle(),
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 5)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                ExponentTransformRcPtr p = ExponentTransform::Create();
+                const std::array<double, 4> value = state[0].cast<std::array<double, 4>>();
+                p->setValue(*reinterpret_cast<const double(*)[4]>(value.data()));
+                p->setNegativeStyle(state[1].cast<NegativeStyle>());
+                p->setDirection(state[2].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[3].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[4].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsExponentTransform);
 }
@@ -79,7 +79,39 @@ void bindPyExponentWithLinearTransform(py::module & m)
         .def("getNegativeStyle", &ExponentWithLinearTransform::getNegativeStyle, 
              DOC(ExponentWithLinearTransform, getNegativeStyle))
         .def("setNegativeStyle", &ExponentWithLinearTransform::setNegativeStyle, "style"_a, 
-             DOC(ExponentWithLinearTransform, setNegativeStyle));
+             DOC(ExponentWithLinearTransform, setNegativeStyle))
+
+        .def(py::pickle(
+            [](const ExponentWithLinearTransformRcPtr & self)
+            {
+                std::array<double, 4> gamma, offset;
+                self->getGamma(*reinterpret_cast<double(*)[4]>(gamma.data()));
+                self->getOffset(*reinterpret_cast<double(*)[4]>(offset.data()));
+                return py::make_tuple(gamma,
+                                      offset,
+                                      self->getNegativeStyle(),
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 6)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                ExponentWithLinearTransformRcPtr p = ExponentWithLinearTransform::Create();
+                const std::array<double, 4> gamma = state[0].cast<std::array<double, 4>>();
+                const std::array<double, 4> offset = state[1].cast<std::array<double, 4>>();
+                p->setGamma(*reinterpret_cast<const double(*)[4]>(gamma.data()));
+                p->setOffset(*reinterpret_cast<const double(*)[4]>(offset.data()));
+                p->setNegativeStyle(state[2].cast<NegativeStyle>());
+                p->setDirection(state[3].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[4].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[5].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsExponentWithLinearTransform);
 }
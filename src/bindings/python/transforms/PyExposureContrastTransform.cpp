@@ -109,7 +109,48 @@ void bindPyExposureContrastTransform(py::module & m)
         .def("getLogMidGray", &ExposureContrastTransform::getLogMidGray, 
              DOC(ExposureContrastTransform, getLogMidGray))
         .def("setLogMidGray", &ExposureContrastTransform::setLogMidGray, "logMidGray"_a, 
-             DOC(ExposureContrastTransform, setLogMidGray));
+             DOC(ExposureContrastTransform, setLogMidGray))
+
+        .def(py::pickle(
+            [](const ExposureContrastTransformRcPtr & self)
+            {
+                return py::make_tuple(self->getStyle(),
+                                      self->getExposure(),
+                                      self->getContrast(),
+                                      self->getGamma(),
+                                      self->getPivot(),
+                                      self->getLogExposureStep(),
+                                      self->getLogMidGray(),
+                                      self->isExposureDynamic(),
+                                      self->isContrastDynamic(),
+                                      self->isGammaDynamic(),
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 13)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                ExposureContrastTransformRcPtr p = ExposureContrastTransform::Create();
+                p->setStyle(state[0].cast<ExposureContrastStyle>());
+                p->setExposure(state[1].cast<double>());
+                p->setContrast(state[2].cast<double>());
+                p->setGamma(state[3].cast<double>());
+                p->setPivot(state[4].cast<double>());
+                p->setLogExposureStep(state[5].cast<double>());
+                p->setLogMidGray(state[6].cast<double>());
+                if (state[7].cast<bool>()) { p->makeExposureDynamic(); }
+                if (state[8].cast<bool>()) { p->makeContrastDynamic(); }
+                if (state[9].cast<bool>()) { p->makeGammaDynamic(); }
+                p->setDirection(state[10].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[11].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[12].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsExposureContrastTransform);
 }
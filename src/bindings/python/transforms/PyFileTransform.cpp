@@ -74,7 +74,32 @@ void bindPyFileTransform(py::module & m)
         .def("setInterpolation", &FileTransform::setInterpolation, "interpolation"_a, 
              DOC(FileTransform, setInterpolation))
         .def_static("IsFormatExtensionSupported", &FileTransform::IsFormatExtensionSupported, "extension"_a,
-             DOC(FileTransform, IsFormatExtensionSupported));
+             DOC(FileTransform, IsFormatExtensionSupported))
+
+        .def(py::pickle(
+            [](const FileTransformRcPtr & self)
+            {
+                return py::make_tuple(self->getSrc(),
+                                      self->getCCCId(),
+                                      self->getCDLStyle(),
+                                      self->getInterpolation(),
+                                      self->getDirection());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 5)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                FileTransformRcPtr p = FileTransform::Create();
+                p->setSrc(state[0].cast<std::string>().c_str());
+                p->setCCCId(state[1].cast<std::string>().c_str());
+                p->setCDLStyle(state[2].cast<CDLStyle>());
+                p->setInterpolation(state[3].cast<Interpolation>());
+                p->setDirection(state[4].cast<TransformDirection>());
+                return p;
+            }));
 
     defRepr(clsFileTransform);
 
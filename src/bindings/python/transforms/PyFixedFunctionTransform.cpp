@@ -7,7 +7,7 @@ namespace OCIO_NAMESPACE
 {
 
 namespace {
-    std::vector<double> getParamsStdVec(FixedFunctionTransformRcPtr & p) {
+    std::vector<double> getParamsStdVec(const FixedFunctionTransformRcPtr & p) {
         std::vector<double> params;
         params.resize(p->getNumParams());
         p->getParams(params.data());
@@ -62,7 +62,36 @@ void bindPyFixedFunctionTransform(py::module & m)
                 self->setParams(params.data(), params.size());
             }, 
              "params"_a, 
-             DOC(FixedFunctionTransform, setParams));
+             DOC(FixedFunctionTransform, setParams))
+
+        .def(py::pickle(
+            [](const FixedFunctionTransformRcPtr & self)
+            {
+                return py::make_tuple(self->getStyle(),
+                                      getParamsStdVec(self),
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 5)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                const FixedFunctionStyle style = state[0].cast<FixedFunctionStyle>();
+                const std::vector<double> params = state[1].cast<std::vector<double>>();
+                FixedFunctionTransformRcPtr p = params.empty() ?
+                                                FixedFunctionTransform::Create(style) :
+                                                FixedFunctionTransform::Create(style,
+                                                                               params.data(),
+                                                                               params.size());
+                p->setDirection(state[2].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[3].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[4].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsFixedFunctionTransform);
 }
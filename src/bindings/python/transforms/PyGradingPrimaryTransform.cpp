@@ -6,6 +6,65 @@
 namespace OCIO_NAMESPACE
 {
 
+namespace
+{
+
+// The grading values are pickled as a tuple of their members.
+
+py::tuple getRGBMState(const GradingRGBM & rgbm)
+{
+    return py::make_tuple(rgbm.m_red, rgbm.m_green, rgbm.m_blue, rgbm.m_master);
+}
+
+GradingRGBM createRGBMFromState(const py::handle & state)
+{
+    const std::array<double, 4> rgbm = state.cast<std::array<double, 4>>();
+    return GradingRGBM(rgbm[0], rgbm[1], rgbm[2], rgbm[3]);
+}
+
+py::tuple getValuesState(const GradingPrimary & values)
+{
+    return py::make_tuple(getRGBMState(values.m_brightness),
+                          getRGBMState(values.m_contrast),
+                          getRGBMState(values.m_gamma),
+                          getRGBMState(values.m_offset),
+                          getRGBMState(values.m_exposure),
+                          getRGBMState(values.m_lift),
+                          getRGBMState(values.m_gain),
+                          values.m_saturation,
+                          values.m_pivot,
+                          values.m_pivotBlack,
+                          values.m_pivotWhite,
+                          values.m_clampBlack,
+                          values.m_clampWhite);
+}
+
+GradingPrimary createValuesFromState(const py::tuple & state, GradingStyle style)
+{
+    if (state.size() != 13)
+    {
+        throw Exception("Invalid pickled transform state.");
+    }
+
+    GradingPrimary values(style);
+    values.m_brightness = createRGBMFromState(state[0]);
+    values.m_contrast   = createRGBMFromState(state[1]);
+    values.m_gamma      = createRGBMFromState(state[2]);
+    values.m_offset     = createRGBMFromState(state[3]);
+    values.m_exposure   = createRGBMFromState(state[4]);
+    values.m_lift       = createRGBMFromState(state[5]);
+    values.m_gain       = createRGBMFromState(state[6]);
+    values.m_saturation = state[7].cast<double>();
+    values.m_pivot      = state[8].cast<double>();
+    values.m_pivotBlack = state[9].cast<double>();
+    values.m_pivotWhite = state[10].cast<double>();
+    values.m_clampBlack = state[11].cast<double>();
+    values.m_clampWhite = state[12].cast<double>();
+    return values;
+}
+
+} // namespace
+
 void bindPyGradingPrimaryTransform(py::module & m)
 {
     GradingPrimaryTransformRcPtr DEFAULT = GradingPrimaryTransform::Create(GRADING_LOG);
@@ -67,7 +126,34 @@ void bindPyGradingPrimaryTransform(py::module & m)
         .def("makeDynamic", &GradingPrimaryTransform::makeDynamic, 
              DOC(GradingPrimaryTransform, makeDynamic))
         .def("makeNonDynamic", &GradingPrimaryTransform::makeNonDynamic, 
-             DOC(GradingPrimaryTransform, makeNonDynamic));
+             DOC(GradingPrimaryTransform, makeNonDynamic))
+
+        .def(py::pickle(
+            [](const GradingPrimaryTransformRcPtr & self)
+            {
+                return py::make_tuple(getValuesState(self->getValue()),
+                                      self->getStyle(),
+                                      self->isDynamic(),
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 6)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                const GradingStyle style = state[1].cast<GradingStyle>();
+                GradingPrimaryTransformRcPtr p = GradingPrimaryTransform::Create(style);
+                p->setValue(createValuesFromState(state[0].cast<py::tuple>(), style));
+                if (state[2].cast<bool>()) { p->makeDynamic(); }
+                p->setDirection(state[3].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[4].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[5].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsGradingPrimaryTransform);
 }
@@ -6,6 +6,71 @@
 namespace OCIO_NAMESPACE
 {
 
+namespace
+{
+
+// The curves are pickled as the list of their control points and the list of their slopes.
+
+py::tuple getCurveState(const ConstGradingBSplineCurveRcPtr & curve)
+{
+    py::list points;
+    py::list slopes;
+    for (size_t i = 0; i < curve->getNumControlPoints(); ++i)
+    {
+        const GradingControlPoint & point = curve->getControlPoint(i);
+        points.append(py::make_tuple(point.m_x, point.m_y));
+        slopes.append(curve->getSlope(i));
+    }
+    return py::make_tuple(points, slopes);
+}
+
+ConstGradingBSplineCurveRcPtr createCurveFromState(const py::handle & state)
+{
+    const py::tuple curveState = state.cast<py::tuple>();
+    if (curveState.size() != 2)
+    {
+        throw Exception("Invalid pickled transform state.");
+    }
+
+    const auto points = curveState[0].cast<std::vector<std::array<float, 2>>>();
+    const auto slopes = curveState[1].cast<std::vector<float>>();
+    if (points.size() != slopes.size())
+    {
+        throw Exception("Invalid pickled transform state.");
+    }
+
+    GradingBSplineCurveRcPtr curve = GradingBSplineCurve::Create(points.size());
+    for (size_t i = 0; i < points.size(); ++i)
+    {
+        curve->getControlPoint(i) = GradingControlPoint(points[i][0], points[i][1]);
+        curve->setSlope(i, slopes[i]);
+    }
+    return curve;
+}
+
+py::tuple getValuesState(const ConstGradingRGBCurveRcPtr & values)
+{
+    return py::make_tuple(getCurveState(values->getCurve(RGB_RED)),
+                          getCurveState(values->getCurve(RGB_GREEN)),
+                          getCurveState(values->getCurve(RGB_BLUE)),
+                          getCurveState(values->getCurve(RGB_MASTER)));
+}
+
+ConstGradingRGBCurveRcPtr createValuesFromState(const py::tuple & state)
+{
+    if (state.size() != 4)
+    {
+        throw Exception("Invalid pickled transform state.");
+    }
+
+    return GradingRGBCurve::Create(createCurveFromState(state[0]),
+                                   createCurveFromState(state[1]),
+                                   createCurveFromState(state[2]),
+                                   createCurveFromState(state[3]));
+}
+
+} // namespace
+
 void bindPyGradingRGBCurveTransform(py::module & m)
 {
     GradingRGBCurveTransformRcPtr DEFAULT = GradingRGBCurveTransform::Create(GRADING_LOG);
@@ -77,7 +142,36 @@ void bindPyGradingRGBCurveTransform(py::module & m)
         .def("makeDynamic", &GradingRGBCurveTransform::makeDynamic, 
              DOC(GradingRGBCurveTransform, makeDynamic))
         .def("makeNonDynamic", &GradingRGBCurveTransform::makeNonDynamic, 
-             DOC(GradingRGBCurveTransform, makeNonDynamic));
+             DOC(GradingRGBCurveTransform, makeNonDynamic))
+
+        .def(py::pickle(
+            [](const GradingRGBCurveTransformRcPtr & self)
+            {
+                return py::make_tuple(getValuesState(self->getValue()),
+                                      self->getStyle(),
+                                      self->getBypassLinToLog(),
+                                      self->isDynamic(),
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 7)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                const GradingStyle style = state[1].cast<GradingStyle>();
+                GradingRGBCurveTransformRcPtr p = GradingRGBCurveTransform::Create(style);
+                p->setValue(createValuesFromState(state[0].cast<py::tuple>()));
+                p->setBypassLinToLog(state[2].cast<bool>());
+                if (state[3].cast<bool>()) { p->makeDynamic(); }
+                p->setDirection(state[4].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[5].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[6].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsGradingRGBCurveTransform);
 }
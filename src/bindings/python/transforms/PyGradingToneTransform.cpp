@@ -6,6 +6,52 @@
 namespace OCIO_NAMESPACE
 {
 
+namespace
+{
+
+// The grading values are pickled as a tuple of their members.
+
+py::tuple getRGBMSWState(const GradingRGBMSW & rgbmsw)
+{
+    return py::make_tuple(rgbmsw.m_red, rgbmsw.m_green, rgbmsw.m_blue, rgbmsw.m_master,
+                          rgbmsw.m_start, rgbmsw.m_width);
+}
+
+GradingRGBMSW createRGBMSWFromState(const py::handle & state)
+{
+    const std::array<double, 6> rgbmsw = state.cast<std::array<double, 6>>();
+    return GradingRGBMSW(rgbmsw[0], rgbmsw[1], rgbmsw[2], rgbmsw[3], rgbmsw[4], rgbmsw[5]);
+}
+
+py::tuple getValuesState(const GradingTone & values)
+{
+    return py::make_tuple(getRGBMSWState(values.m_blacks),
+                          getRGBMSWState(values.m_shadows),
+                          getRGBMSWState(values.m_midtones),
+                          getRGBMSWState(values.m_highlights),
+                          getRGBMSWState(values.m_whites),
+                          values.m_scontrast);
+}
+
+GradingTone createValuesFromState(const py::tuple & state, GradingStyle style)
+{
+    if (state.size() != 6)
+    {
+        throw Exception("Invalid pickled transform state.");
+    }
+
+    GradingTone values(style);
+    values.m_blacks     = createRGBMSWFromState(state[0]);
+    values.m_shadows    = createRGBMSWFromState(state[1]);
+    values.m_midtones   = createRGBMSWFromState(state[2]);
+    values.m_highlights = createRGBMSWFromState(state[3]);
+    values.m_whites     = createRGBMSWFromState(state[4]);
+    values.m_scontrast  = state[5].cast<double>();
+    return values;
+}
+
+} // namespace
+
 void bindPyGradingToneTransform(py::module & m)
 {
     GradingToneTransformRcPtr DEFAULT = GradingToneTransform::Create(GRADING_LOG);
@@ -67,7 +113,34 @@ void bindPyGradingToneTransform(py::module & m)
         .def("makeDynamic", &GradingToneTransform::makeDynamic, 
              DOC(GradingToneTransform, makeDynamic))
         .def("makeNonDynamic", &GradingToneTransform::makeNonDynamic, 
-             DOC(GradingToneTransform, makeNonDynamic));
+             DOC(GradingToneTransform, makeNonDynamic))
+
+        .def(py::pickle(
+            [](const GradingToneTransformRcPtr & self)
+            {
+                return py::make_tuple(getValuesState(self->getValue()),
+                                      self->getStyle(),
+                                      self->isDynamic(),
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 6)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                const GradingStyle style = state[1].cast<GradingStyle>();
+                GradingToneTransformRcPtr p = GradingToneTransform::Create(style);
+                p->setValue(createValuesFromState(state[0].cast<py::tuple>(), style));
+                if (state[2].cast<bool>()) { p->makeDynamic(); }
+                p->setDirection(state[3].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[4].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[5].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsGradingToneTransform);
 }
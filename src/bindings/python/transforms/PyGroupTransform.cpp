@@ -121,7 +121,40 @@ void bindPyGroupTransform(py::module & m)
             }, 
             "formatName"_a.none(false),
             "config"_a = nullptr, 
-            DOC(GroupTransform, write));
+            DOC(GroupTransform, write))
+
+        // The child transforms are pickled with their own pickling (e.g. the LUT values are
+        // pickled as NumPy arrays).
+        .def(py::pickle(
+            [](const GroupTransformRcPtr & self)
+            {
+                py::list transforms;
+                for (int i = 0; i < self->getNumTransforms(); ++i)
+                {
+                    transforms.append(self->getTransform(i));
+                }
+                return py::make_tuple(transforms,
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 4)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                GroupTransformRcPtr p = GroupTransform::Create();
+                for (const auto & transform : state[0].cast<std::vector<TransformRcPtr>>())
+                {
+                    p->appendTransform(transform);
+                }
+                p->setDirection(state[1].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[2].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[3].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsGroupTransform);
 
@@ -115,7 +115,48 @@ void bindPyLogAffineTransform(py::module & m)
                 self->setLinSideOffsetValue(*reinterpret_cast<const double(*)[3]>(values.data()));
             }, 
              "values"_a,
-             DOC(LogAffineTransform, setLinSideOffsetValue));
+             DOC(LogAffineTransform, setLinSideOffsetValue))
+
+        .def(py::pickle(
+            [](const LogAffineTransformRcPtr & self)
+            {
+                std::array<double, 3> logSideSlope, logSideOffset, linSideSlope, linSideOffset;
+                self->getLogSideSlopeValue(*reinterpret_cast<double(*)[3]>(logSideSlope.data()));
+                self->getLogSideOffsetValue(*reinterpret_cast<double(*)[3]>(logSideOffset.data()));
+                self->getLinSideSlopeValue(*reinterpret_cast<double(*)[3]>(linSideSlope.data()));
+                self->getLinSideOffsetValue(*reinterpret_cast<double(*)[3]>(linSideOffset.data()));
+                return py::make_tuple(self->getBase(),
+                                      logSideSlope,
+                                      logSideOffset,
+                                      linSideSlope,
+                                      linSideOffset,
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 8)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                const std::array<double, 3> logSideSlope = state[1].cast<std::array<double, 3>>();
+                const std::array<double, 3> logSideOffset = state[2].cast<std::array<double, 3>>();
+                const std::array<double, 3> linSideSlope = state[3].cast<std::array<double, 3>>();
+                const std::array<double, 3> linSideOffset = state[4].cast<std::array<double, 3>>();
+
+                LogAffineTransformRcPtr p = LogAffineTransform::Create();
+                p->setBase(state[0].cast<double>());
+                p->setLogSideSlopeValue(*reinterpret_cast<const double(*)[3]>(logSideSlope.data()));
+                p->setLogSideOffsetValue(*reinterpret_cast<const double(*)[3]>(logSideOffset.data()));
+                p->setLinSideSlopeValue(*reinterpret_cast<const double(*)[3]>(linSideSlope.data()));
+                p->setLinSideOffsetValue(*reinterpret_cast<const double(*)[3]>(linSideOffset.data()));
+                p->setDirection(state[5].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[6].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[7].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsLogAffineTransform);
 }
@@ -177,7 +177,64 @@ Return LinearSlope or 3 qnan values if not defined.
                 return self->getLinearSlopeValue(*reinterpret_cast<double(*)[3]>(values.data()));
             })
         .def("unsetLinearSlopeValue", &LogCameraTransform::unsetLinearSlopeValue,
-             DOC(LogCameraTransform, unsetLinearSlopeValue));
+             DOC(LogCameraTransform, unsetLinearSlopeValue))
+
+        // An unset linear slope is pickled as an empty list, as in the constructor.
+        .def(py::pickle(
+            [](const LogCameraTransformRcPtr & self)
+            {
+                std::array<double, 3> logSideSlope, logSideOffset, linSideSlope, linSideOffset;
+                std::array<double, 3> linSideBreak, linearSlope;
+                self->getLogSideSlopeValue(*reinterpret_cast<double(*)[3]>(logSideSlope.data()));
+                self->getLogSideOffsetValue(*reinterpret_cast<double(*)[3]>(logSideOffset.data()));
+                self->getLinSideSlopeValue(*reinterpret_cast<double(*)[3]>(linSideSlope.data()));
+                self->getLinSideOffsetValue(*reinterpret_cast<double(*)[3]>(linSideOffset.data()));
+                self->getLinSideBreakValue(*reinterpret_cast<double(*)[3]>(linSideBreak.data()));
+                std::vector<double> linearSlopeState;
+                if (self->getLinearSlopeValue(*reinterpret_cast<double(*)[3]>(linearSlope.data())))
+                {
+                    linearSlopeState.assign(linearSlope.begin(), linearSlope.end());
+                }
+                return py::make_tuple(linSideBreak,
+                                      self->getBase(),
+                                      logSideSlope,
+                                      logSideOffset,
+                                      linSideSlope,
+                                      linSideOffset,
+                                      linearSlopeState,
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 10)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                const std::array<double, 3> linSideBreak = state[0].cast<std::array<double, 3>>();
+                const std::array<double, 3> logSideSlope = state[2].cast<std::array<double, 3>>();
+                const std::array<double, 3> logSideOffset = state[3].cast<std::array<double, 3>>();
+                const std::array<double, 3> linSideSlope = state[4].cast<std::array<double, 3>>();
+                const std::array<double, 3> linSideOffset = state[5].cast<std::array<double, 3>>();
+                const std::vector<double> linearSlope = state[6].cast<std::vector<double>>();
+
+                LogCameraTransformRcPtr p = LogCameraTransform::Create(*reinterpret_cast<const double(*)[3]>(linSideBreak.data()));
+                p->setBase(state[1].cast<double>());
+                p->setLogSideSlopeValue(*reinterpret_cast<const double(*)[3]>(logSideSlope.data()));
+                p->setLogSideOffsetValue(*reinterpret_cast<const double(*)[3]>(logSideOffset.data()));
+                p->setLinSideSlopeValue(*reinterpret_cast<const double(*)[3]>(linSideSlope.data()));
+                p->setLinSideOffsetValue(*reinterpret_cast<const double(*)[3]>(linSideOffset.data()));
+                if (linearSlope.size() == 3)
+                {
+                    p->setLinearSlopeValue(*reinterpret_cast<const double(*)[3]>(linearSlope.data()));
+                }
+                p->setDirection(state[7].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[8].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[9].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsLogCameraTransform);
 }
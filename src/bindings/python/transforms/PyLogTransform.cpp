@@ -38,7 +38,30 @@ void bindPyLogTransform(py::module & m)
         .def("getBase", &LogTransform::getBase, 
              DOC(LogTransform, getBase))
         .def("setBase", &LogTransform::setBase, "base"_a, 
-             DOC(LogTransform, setBase));
+             DOC(LogTransform, setBase))
+
+        .def(py::pickle(
+            [](const LogTransformRcPtr & self)
+            {
+                return py::make_tuple(self->getBase(),
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 4)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                LogTransformRcPtr p = LogTransform::Create();
+                p->setBase(state[0].cast<double>());
+                p->setDirection(state[1].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[2].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[3].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsLogTransform);
 }
@@ -54,7 +54,32 @@ void bindPyLookTransform(py::module & m)
              DOC(LookTransform, getSkipColorSpaceConversion))
         .def("setSkipColorSpaceConversion", &LookTransform::setSkipColorSpaceConversion,
              "skipColorSpaceConversion"_a,
-             DOC(LookTransform, setSkipColorSpaceConversion));
+             DOC(LookTransform, setSkipColorSpaceConversion))
+
+        .def(py::pickle(
+            [](const LookTransformRcPtr & self)
+            {
+                return py::make_tuple(self->getSrc(),
+                                      self->getDst(),
+                                      self->getLooks(),
+                                      self->getSkipColorSpaceConversion(),
+                                      self->getDirection());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 5)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                LookTransformRcPtr p = LookTransform::Create();
+                p->setSrc(state[0].cast<std::string>().c_str());
+                p->setDst(state[1].cast<std::string>().c_str());
+                p->setLooks(state[2].cast<std::string>().c_str());
+                p->setSkipColorSpaceConversion(state[3].cast<bool>());
+                p->setDirection(state[4].cast<TransformDirection>());
+                return p;
+            }));
 
     defRepr(clsLookTransform);
 }
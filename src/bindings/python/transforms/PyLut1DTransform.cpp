@@ -6,6 +6,54 @@
 namespace OCIO_NAMESPACE
 {
 
+namespace
+{
+
+void setData(Lut1DTransformRcPtr & self, py::buffer & data)
+{
+    py::buffer_info info = data.request();
+    checkBufferType(info, py::dtype("float32"));
+    checkBufferDivisible(info, 3);
+
+    py::gil_scoped_release release;
+
+    unsigned long size = (info.size >= 0 ? static_cast<unsigned long>(info.size) : 0);
+    float * values = static_cast<float *>(info.ptr);
+
+    self->setLength(size / 3);
+
+    for (unsigned long i = 0; i < size; i += 3)
+    {
+        self->setValue(i / 3, values[i], values[i+1], values[i+2]);
+    }
+}
+
+py::array getData(const Lut1DTransformRcPtr & self)
+{
+    py::gil_scoped_release gil;
+
+    std::vector<float> values;
+    values.reserve(static_cast<size_t>(self->getLength() * 3));
+
+    for (unsigned long i = 0; i < self->getLength(); i++)
+    {
+        float r, g, b;
+        self->getValue(i, r, g, b);
+        values.push_back(r);
+        values.push_back(g);
+        values.push_back(b);
+    }
+    
+    py::gil_scoped_acquire acquire;
+
+    return py::array(py::dtype("float32"), 
+                     { static_cast<py::ssize_t>(values.size()) },
+                     { sizeof(float) },
+                     values.data());
+}
+
+} // namespace
+
 void bindPyLut1DTransform(py::module & m)
 {
     Lut1DTransformRcPtr DEFAULT = Lut1DTransform::Create();
@@ -75,48 +123,8 @@ void bindPyLut1DTransform(py::module & m)
              DOC(Lut1DTransform, getValue))
         .def("setValue", &Lut1DTransform::setValue, "index"_a, "r"_a, "g"_a, "b"_a, 
              DOC(Lut1DTransform, setValue))
-        .def("setData", [](Lut1DTransformRcPtr & self, py::buffer & data) 
-            {
-                py::buffer_info info = data.request();
-                checkBufferType(info, py::dtype("float32"));
-                checkBufferDivisible(info, 3);
-
-                py::gil_scoped_release release;
-
-                unsigned long size = (info.size >= 0 ? static_cast<unsigned long>(info.size) : 0);
-                float * values = static_cast<float *>(info.ptr);
-
-                self->setLength(size / 3);
-
-                for (unsigned long i = 0; i < size; i += 3)
-                {
-                    self->setValue(i / 3, values[i], values[i+1], values[i+2]);
-                }
-            },
-             "data"_a)
-        .def("getData", [](Lut1DTransformRcPtr & self) 
-            {
-                py::gil_scoped_release gil;
-
-                std::vector<float> values;
-                values.reserve(static_cast<size_t>(self->getLength() * 3));
-
-                for (unsigned long i = 0; i < self->getLength(); i++)
-                {
-                    float r, g, b;
-                    self->getValue(i, r, g, b);
-                    values.push_back(r);
-                    values.push_back(g);
-                    values.push_back(b);
-                }
-                
-                py::gil_scoped_acquire acquire;
-
-                return py::array(py::dtype("float32"), 
-                                 { static_cast<py::ssize_t>(values.size()) },
-                                 { sizeof(float) },
-                                 values.data());
-            })
+        .def("setData", &setData, "data"_a)
+        .def("getData", &getData)
         .def("getInputHalfDomain", &Lut1DTransform::getInputHalfDomain, 
              DOC(Lut1DTransform, getInputHalfDomain))
         .def("setInputHalfDomain", &Lut1DTransform::setInputHalfDomain, "isHalfDomain"_a, 
@@ -132,7 +140,43 @@ void bindPyLut1DTransform(py::module & m)
         .def("getInterpolation", &Lut1DTransform::getInterpolation, 
              DOC(Lut1DTransform, getInterpolation))
         .def("setInterpolation", &Lut1DTransform::setInterpolation, "interpolation"_a, 
-             DOC(Lut1DTransform, setInterpolation));
+             DOC(Lut1DTransform, setInterpolation))
+
+        // The LUT values are pickled as a NumPy array, so they are an out-of-band buffer with
+        // the pickle protocol 5.
+        .def(py::pickle(
+            [](const Lut1DTransformRcPtr & self)
+            {
+                return py::make_tuple(getData(self),
+                                      self->getInputHalfDomain(),
+                                      self->getOutputRawHalfs(),
+                                      self->getFileOutputBitDepth(),
+                                      self->getHueAdjust(),
+                                      self->getInterpolation(),
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 9)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                Lut1DTransformRcPtr p = Lut1DTransform::Create();
+                py::buffer data = state[0].cast<py::buffer>();
+                setData(p, data);
+                p->setInputHalfDomain(state[1].cast<bool>());
+                p->setOutputRawHalfs(state[2].cast<bool>());
+                p->setFileOutputBitDepth(state[3].cast<BitDepth>());
+                p->setHueAdjust(state[4].cast<Lut1DHueAdjust>());
+                p->setInterpolation(state[5].cast<Interpolation>());
+                p->setDirection(state[6].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[7].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[8].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsLut1DTransform);
 }
@@ -8,6 +8,71 @@
 namespace OCIO_NAMESPACE
 {
 
+namespace
+{
+
+void setData(Lut3DTransformRcPtr & self, py::buffer & data)
+{
+    py::buffer_info info = data.request();
+    checkBufferType(info, py::dtype("float32"));
+    
+    unsigned long gs = getBufferLut3DGridSize(info);
+
+    py::gil_scoped_release gil;
+
+    self->setGridSize(gs);
+
+    float * values = static_cast<float *>(info.ptr);
+
+    for (unsigned long indexR = 0; indexR < gs; indexR++)
+    {
+        for (unsigned long indexG = 0; indexG < gs; indexG++)
+        {
+            for (unsigned long indexB = 0; indexB < gs; indexB++)
+            {
+                const unsigned long i = 3 * ((indexR*gs + indexG)*gs + indexB);
+                self->setValue(indexR, indexG, indexB, 
+                                values[i], 
+                                values[i+1], 
+                                values[i+2]);
+            }
+        }
+    }
+}
+
+py::array getData(const Lut3DTransformRcPtr & self)
+{
+    py::gil_scoped_release release;
+
+    unsigned long gs = self->getGridSize();
+    std::vector<float> values;
+    values.reserve(static_cast<size_t>(gs*gs*gs * 3));
+
+    for (unsigned long indexR = 0; indexR < gs; indexR++)
+    {
+        for (unsigned long indexG = 0; indexG < gs; indexG++)
+        {
+            for (unsigned long indexB = 0; indexB < gs; indexB++)
+            {
+                float r, g, b;
+                self->getValue(indexR, indexG, indexB, r, g, b);
+                values.push_back(r);
+                values.push_back(g);
+                values.push_back(b);
+            }
+        }
+    }
+
+    py::gil_scoped_acquire acquire;
+
+    return py::array(py::dtype("float32"), 
+                     { static_cast<py::ssize_t>(values.size()) },
+                     { sizeof(float) },
+                     values.data());
+}
+
+} // namespace
+
 void bindPyLut3DTransform(py::module & m)
 {
     Lut3DTransformRcPtr DEFAULT = Lut3DTransform::Create();
@@ -73,69 +138,42 @@ void bindPyLut3DTransform(py::module & m)
         .def("setValue", &Lut3DTransform::setValue, 
              "indexR"_a, "indexG"_a, "indexB"_a, "r"_a, "g"_a, "b"_a,
              DOC(Lut3DTransform, setValue))
-        .def("setData", [](Lut3DTransformRcPtr & self, py::buffer & data) 
-            {
-                py::buffer_info info = data.request();
-                checkBufferType(info, py::dtype("float32"));
-                
-                unsigned long gs = getBufferLut3DGridSize(info);
-
-                py::gil_scoped_release gil;
-
-                self->setGridSize(gs);
-
-                float * values = static_cast<float *>(info.ptr);
+        .def("setData", &setData, "data"_a)
+        .def("getData", &getData)
+        .def("getInterpolation", &Lut3DTransform::getInterpolation,
+             DOC(Lut3DTransform, getInterpolation))
+        .def("setInterpolation", &Lut3DTransform::setInterpolation, "interpolation"_a,
+             DOC(Lut3DTransform, setInterpolation))
 
-                for (unsigned long indexR = 0; indexR < gs; indexR++)
-                {
-                    for (unsigned long indexG = 0; indexG < gs; indexG++)
-                    {
-                        for (unsigned long indexB = 0; indexB < gs; indexB++)
-                        {
-                            const unsigned long i = 3 * ((indexR*gs + indexG)*gs + indexB);
-                            self->setValue(indexR, indexG, indexB, 
-                                            values[i], 
-                                            values[i+1], 
-                                            values[i+2]);
-                        }
-                    }
-                }
+        // The LUT values are pickled as a NumPy array, so they are an out-of-band buffer with
+        // the pickle protocol 5.
+        .def(py::pickle(
+            [](const Lut3DTransformRcPtr & self)
+            {
+                return py::make_tuple(getData(self),
+                                      self->getFileOutputBitDepth(),
+                                      self->getInterpolation(),
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
             },
-             "data"_a)
-        .def("getData", [](Lut3DTransformRcPtr & self) 
+            [](const py::tuple & state)
             {
-                py::gil_scoped_release release;
-
-                unsigned long gs = self->getGridSize();
-                std::vector<float> values;
-                values.reserve(static_cast<size_t>(gs*gs*gs * 3));
-
-                for (unsigned long indexR = 0; indexR < gs; indexR++)
+                if (state.size() != 6)
                 {
-                    for (unsigned long indexG = 0; indexG < gs; indexG++)
-                    {
-                        for (unsigned long indexB = 0; indexB < gs; indexB++)
-                        {
-                            float r, g, b;
-                            self->getValue(indexR, indexG, indexB, r, g, b);
-                            values.push_back(r);
-                            values.push_back(g);
-                            values.push_back(b);
-                        }
-                    }
+                    throw Exception("Invalid pickled transform state.");
                 }
 
-                py::gil_scoped_acquire acquire;
-
-                return py::array(py::dtype("float32"), 
-                                 { static_cast<py::ssize_t>(values.size()) },
-                                 { sizeof(float) },
-                                 values.data());
-            })
-        .def("getInterpolation", &Lut3DTransform::getInterpolation,
-             DOC(Lut3DTransform, getInterpolation))
-        .def("setInterpolation", &Lut3DTransform::setInterpolation, "interpolation"_a,
-             DOC(Lut3DTransform, setInterpolation));
+                Lut3DTransformRcPtr p = Lut3DTransform::Create();
+                py::buffer data = state[0].cast<py::buffer>();
+                setData(p, data);
+                p->setFileOutputBitDepth(state[1].cast<BitDepth>());
+                p->setInterpolation(state[2].cast<Interpolation>());
+                p->setDirection(state[3].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[4].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[5].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsLut3DTransform);
 }
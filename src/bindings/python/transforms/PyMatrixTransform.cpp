@@ -152,7 +152,40 @@ void bindPyMatrixTransform(py::module & m)
         .def("getFileOutputBitDepth", &MatrixTransform::getFileOutputBitDepth, 
              DOC(MatrixTransform, getFileOutputBitDepth))
         .def("setFileOutputBitDepth", &MatrixTransform::setFileOutputBitDepth, "bitDepth"_a, 
-             DOC(MatrixTransform, setFileOutputBitDepth));
+             DOC(MatrixTransform, setFileOutputBitDepth))
+
+        .def(py::pickle(
+            [](const MatrixTransformRcPtr & self)
+            {
+                std::array<double, 16> m44;
+                std::array<double, 4> offset4;
+                self->getMatrix(m44.data());
+                self->getOffset(offset4.data());
+                return py::make_tuple(m44,
+                                      offset4,
+                                      self->getFileInputBitDepth(),
+                                      self->getFileOutputBitDepth(),
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 7)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                MatrixTransformRcPtr p = MatrixTransform::Create();
+                p->setMatrix(state[0].cast<std::array<double, 16>>().data());
+                p->setOffset(state[1].cast<std::array<double, 4>>().data());
+                p->setFileInputBitDepth(state[2].cast<BitDepth>());
+                p->setFileOutputBitDepth(state[3].cast<BitDepth>());
+                p->setDirection(state[4].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[5].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[6].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsMatrixTransform);
 }
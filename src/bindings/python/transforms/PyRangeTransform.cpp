@@ -6,6 +6,20 @@
 namespace OCIO_NAMESPACE
 {
 
+namespace
+{
+
+py::object getValueState(bool isSet, double value)
+{
+    if (!isSet)
+    {
+        return py::none();
+    }
+    return py::cast(value);
+}
+
+} // namespace
+
 void bindPyRangeTransform(py::module & m)
 {
     RangeTransformRcPtr DEFAULT = RangeTransform::Create();
@@ -87,7 +101,47 @@ void bindPyRangeTransform(py::module & m)
         .def("hasMaxOutValue", &RangeTransform::hasMaxOutValue,
              DOC(RangeTransform, hasMaxOutValue))
         .def("unsetMaxOutValue", &RangeTransform::unsetMaxOutValue,
-             DOC(RangeTransform, unsetMaxOutValue));
+             DOC(RangeTransform, unsetMaxOutValue))
+
+        // The unset values are pickled as None.
+        .def(py::pickle(
+            [](const RangeTransformRcPtr & self)
+            {
+                return py::make_tuple(self->getStyle(),
+                                      self->getFileInputBitDepth(),
+                                      self->getFileOutputBitDepth(),
+                                      getValueState(self->hasMinInValue(),
+                                                    self->getMinInValue()),
+                                      getValueState(self->hasMaxInValue(),
+                                                    self->getMaxInValue()),
+                                      getValueState(self->hasMinOutValue(),
+                                                    self->getMinOutValue()),
+                                      getValueState(self->hasMaxOutValue(),
+                                                    self->getMaxOutValue()),
+                                      self->getDirection(),
+                                      self->getFormatMetadata().getName(),
+                                      self->getFormatMetadata().getID());
+            },
+            [](const py::tuple & state)
+            {
+                if (state.size() != 10)
+                {
+                    throw Exception("Invalid pickled transform state.");
+                }
+
+                RangeTransformRcPtr p = RangeTransform::Create();
+                p->setStyle(state[0].cast<RangeStyle>());
+                p->setFileInputBitDepth(state[1].cast<BitDepth>());
+                p->setFileOutputBitDepth(state[2].cast<BitDepth>());
+                if (!state[3].is_none()) { p->setMinInValue(state[3].cast<double>()); }
+                if (!state[4].is_none()) { p->setMaxInValue(state[4].cast<double>()); }
+                if (!state[5].is_none()) { p->setMinOutValue(state[5].cast<double>()); }
+                if (!state[6].is_none()) { p->setMaxOutValue(state[6].cast<double>()); }
+                p->setDirection(state[7].cast<TransformDirection>());
+                p->getFormatMetadata().setName(state[8].cast<std::string>().c_str());
+                p->getFormatMetadata().setID(state[9].cast<std::string>().c_str());
+                return p;
+            }));
 
     defRepr(clsRangeTransform);
 }
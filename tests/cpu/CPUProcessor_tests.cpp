@@ -2908,3 +2908,660 @@ OCIO_ADD_TEST(CPUProcessor, optimizations)
                                                                __LINE__);
     }
 }
+
+OCIO_ADD_TEST(CPUProcessor, compact_luts)
+{
+    // Validate the OPTIMIZATION_COMPACT_LUTS flag i.e. the Lut1D & Lut3D values are stored
+    // as half floats.
+
+    constexpr unsigned long lut1dSize = 1024;
+    constexpr unsigned long lut3dSize = 17;
+
+    OCIO::Lut1DTransformRcPtr lut1d = OCIO::Lut1DTransform::Create(lut1dSize, false);
+    for (unsigned long idx = 0; idx < lut1dSize; ++idx)
+    {
+        const float val = std::pow(float(idx) / float(lut1dSize - 1), 2.2f);
+        lut1d->setValue(idx, val, val * 0.9f, val * 1.1f);
+    }
+
+    OCIO::Lut3DTransformRcPtr lut3d = OCIO::Lut3DTransform::Create(lut3dSize);
+    for (unsigned long r = 0; r < lut3dSize; ++r)
+    {
+        for (unsigned long g = 0; g < lut3dSize; ++g)
+        {
+            for (unsigned long b = 0; b < lut3dSize; ++b)
+            {
+                const float scale = 1.f / float(lut3dSize - 1);
+                lut3d->setValue(r, g, b,
+                                (0.7f * r + 0.2f * g + 0.1f * b) * scale,
+                                (0.1f * r + 0.8f * g + 0.1f * b) * scale,
+                                (0.1f * r + 0.1f * g + 0.8f * b) * scale * 1.5f);
+            }
+        }
+    }
+
+    OCIO::GroupTransformRcPtr group = OCIO::GroupTransform::Create();
+    group->appendTransform(lut1d);
+    group->appendTransform(lut3d);
+    group->appendTransform(lut1d);
+
+    OCIO::ConfigRcPtr config = OCIO::Config::Create();
+    OCIO::ConstProcessorRcPtr processor;
+    OCIO_CHECK_NO_THROW(processor = config->getProcessor(group));
+
+    OCIO::ConstCPUProcessorRcPtr cpuProcessor;
+    OCIO_CHECK_NO_THROW(cpuProcessor
+        = processor->getOptimizedCPUProcessor(OCIO::OPTIMIZATION_NONE));
+
+    OCIO::ConstCPUProcessorRcPtr compactCpuProcessor;
+    OCIO_CHECK_NO_THROW(compactCpuProcessor
+        = processor->getOptimizedCPUProcessor(OCIO::OPTIMIZATION_COMPACT_LUTS));
+
+    OCIO_CHECK_NE(std::string(cpuProcessor->getCacheID()),
+                  std::string(compactCpuProcessor->getCacheID()));
+
+    constexpr long numPixels = 4096;
+
+    std::vector<float> inImg(numPixels * 4);
+    for (size_t idx = 0; idx < inImg.size(); ++idx)
+    {
+        inImg[idx] = float(idx % 1237) / 1000.f - 0.1f;
+    }
+
+    std::vector<float> outImg(inImg);
+    std::vector<float> compactOutImg(inImg);
+
+    OCIO::PackedImageDesc desc(outImg.data(), numPixels, 1, 4);
+    OCIO_CHECK_NO_THROW(cpuProcessor->apply(desc));
+
+    OCIO::PackedImageDesc compactDesc(compactOutImg.data(), numPixels, 1, 4);
+    OCIO_CHECK_NO_THROW(compactCpuProcessor->apply(compactDesc));
+
+    // Note that the LUT values are less than 2 so the error of one LUT entry is at most 2^-10,
+    // and the errors are propagated through the following LUTs.
+    float maxDiff = 0.f;
+    for (size_t idx = 0; idx < outImg.size(); ++idx)
+    {
+        maxDiff = std::max(maxDiff, std::abs(outImg[idx] - compactOutImg[idx]));
+    }
+
+    OCIO_CHECK_LT(maxDiff, 0.01f);
+    OCIO_CHECK_GT(maxDiff, 0.f);
+}
+
+OCIO_ADD_TEST(CPUProcessor, multi_threaded)
+{
+    // The unit test validates that splitting the processing of an image between several
+    // threads gives the same results as the single-threaded processing.
+
+    OCIO::ConfigRcPtr config = OCIO::Config::Create();
+
+    OCIO::GroupTransformRcPtr group = OCIO::GroupTransform::Create();
+
+    OCIO::ExposureContrastTransformRcPtr ec = OCIO::ExposureContrastTransform::Create();
+    ec->setExposure(0.8);
+    ec->makeExposureDynamic();
+    group->appendTransform(ec);
+
+    OCIO::LogTransformRcPtr log = OCIO::LogTransform::Create();
+    group->appendTransform(log);
+
+    OCIO::MatrixTransformRcPtr matrix = OCIO::MatrixTransform::Create();
+    constexpr double offset4[4] = { 0.1, 0.2, 0.3, 0.4 };
+    matrix->setOffset(offset4);
+    group->appendTransform(matrix);
+
+    OCIO::ConstProcessorRcPtr processor;
+    OCIO_CHECK_NO_THROW(processor = config->getProcessor(group));
+
+    constexpr long width  = 67;
+    constexpr long height = 23;
+
+    // Packed RGBA F32 image processed in place.
+    {
+        OCIO::ConstCPUProcessorRcPtr cpuProcessor;
+        OCIO_CHECK_NO_THROW(cpuProcessor = processor->getDefaultCPUProcessor());
+
+        std::vector<float> inImg(width * height * 4);
+        for (size_t idx = 0; idx < inImg.size(); ++idx)
+        {
+            inImg[idx] = float(idx) / float(inImg.size());
+        }
+
+        std::vector<float> refImg = inImg;
+        OCIO::PackedImageDesc refDesc(&refImg[0], width, height, 4);
+        OCIO_CHECK_NO_THROW(cpuProcessor->apply(refDesc));
+
+        for (unsigned numThreads : { 0u, 1u, 2u, 3u, 8u, 64u })
+        {
+            std::vector<float> outImg = inImg;
+            OCIO::PackedImageDesc outDesc(&outImg[0], width, height, 4);
+            OCIO_CHECK_NO_THROW(cpuProcessor->apply(outDesc, numThreads));
+
+            for (size_t idx = 0; idx < outImg.size(); ++idx)
+            {
+                OCIO_REQUIRE_EQUAL(outImg[idx], refImg[idx]);
+            }
+        }
+
+        // A single line of pixels is split along the columns.
+
+        std::vector<float> lineImg = inImg;
+        OCIO::PackedImageDesc lineDesc(&lineImg[0], width * height, 1, 4);
+        OCIO_CHECK_NO_THROW(cpuProcessor->apply(lineDesc, 4));
+
+        for (size_t idx = 0; idx < lineImg.size(); ++idx)
+        {
+            OCIO_REQUIRE_EQUAL(lineImg[idx], refImg[idx]);
+        }
+
+        // The dynamic property is shared by all the threads.
+
+        OCIO::DynamicPropertyRcPtr dp;
+        OCIO_CHECK_NO_THROW(dp = cpuProcessor->getDynamicProperty(OCIO::DYNAMIC_PROPERTY_EXPOSURE));
+        OCIO::DynamicPropertyDoubleRcPtr dpExposure = OCIO::DynamicPropertyValue::AsDouble(dp);
+        dpExposure->setValue(1.5);
+
+        std::vector<float> refImg2 = inImg;
+        OCIO::PackedImageDesc refDesc2(&refImg2[0], width, height, 4);
+        OCIO_CHECK_NO_THROW(cpuProcessor->apply(refDesc2));
+
+        std::vector<float> outImg2 = inImg;
+        OCIO::PackedImageDesc outDesc2(&outImg2[0], width, height, 4);
+        OCIO_CHECK_NO_THROW(cpuProcessor->apply(outDesc2, 4));
+
+        for (size_t idx = 0; idx < outImg2.size(); ++idx)
+        {
+            OCIO_REQUIRE_EQUAL(outImg2[idx], refImg2[idx]);
+        }
+        OCIO_CHECK_NE(outImg2[40], refImg[40]);
+    }
+
+    // Planar UINT16 image processed to a packed RGB F32 image i.e. no optimizations.
+    {
+        OCIO::ConstCPUProcessorRcPtr cpuProcessor;
+        OCIO_CHECK_NO_THROW(cpuProcessor
+            = processor->getOptimizedCPUProcessor(OCIO::BIT_DEPTH_UINT16,
+                                                  OCIO::BIT_DEPTH_F32,
+                                                  OCIO::OPTIMIZATION_DEFAULT));
+
+        std::vector<uint16_t> inR(width * height), inG(width * height), inB(width * height);
+        for (size_t idx = 0; idx < inR.size(); ++idx)
+        {
+            inR[idx] = uint16_t(idx * 3 + 0);
+            inG[idx] = uint16_t(idx * 3 + 1);
+            inB[idx] = uint16_t(idx * 3 + 2);
+        }
+
+        OCIO::PlanarImageDesc srcDesc(&inR[0], &inG[0], &inB[0], nullptr,
+                                      width, height,
+                                      OCIO::BIT_DEPTH_UINT16,
+                                      OCIO::AutoStride,
+                                      OCIO::AutoStride);
+
+        std::vector<float> refImg(width * height * 3);
+        OCIO::PackedImageDesc refDesc(&refImg[0], width, height, 3);
+        OCIO_CHECK_NO_THROW(cpuProcessor->apply(srcDesc, refDesc));
+
+        std::vector<float> outImg(width * height * 3);
+        OCIO::PackedImageDesc outDesc(&outImg[0], width, height, 3);
+        OCIO_CHECK_NO_THROW(cpuProcessor->apply(srcDesc, outDesc, 5));
+
+        for (size_t idx = 0; idx < outImg.size(); ++idx)
+        {
+            OCIO_REQUIRE_EQUAL(outImg[idx], refImg[idx]);
+        }
+
+        // Errors are still reported.
+
+        std::vector<float> badImg(width * (height - 1) * 3);
+        OCIO::PackedImageDesc badDesc(&badImg[0], width, height - 1, 3);
+        OCIO_CHECK_THROW_WHAT(cpuProcessor->apply(srcDesc, badDesc, 4),
+                              OCIO::Exception,
+                              "Dimension inconsistency between source and destination image buffers.");
+    }
+}
+
+OCIO_ADD_TEST(CPUProcessor, scratch_buffer_pool)
+{
+    // The unit test validates that the intermediate buffers are re-used between apply calls.
+
+    OCIO::ConfigRcPtr config = OCIO::Config::Create();
+
+    OCIO::LogTransformRcPtr log = OCIO::LogTransform::Create();
+
+    OCIO::ConstProcessorRcPtr processor;
+    OCIO_CHECK_NO_THROW(processor = config->getProcessor(log));
+
+    OCIO::ConstCPUProcessorRcPtr cpuProcessor;
+    OCIO_CHECK_NO_THROW(cpuProcessor
+        = processor->getOptimizedCPUProcessor(OCIO::BIT_DEPTH_UINT16,
+                                              OCIO::BIT_DEPTH_UINT16,
+                                              OCIO::OPTIMIZATION_DEFAULT));
+
+    OCIO_CHECK_EQUAL(cpuProcessor->getScratchBufferPoolHits(), 0);
+    OCIO_CHECK_EQUAL(cpuProcessor->getScratchBufferPoolMisses(), 0);
+
+    constexpr long width  = 16;
+    constexpr long height = 4;
+
+    std::vector<uint16_t> inImg(width * height * 3);
+    for (size_t idx = 0; idx < inImg.size(); ++idx)
+    {
+        inImg[idx] = uint16_t(idx * 100);
+    }
+
+    std::vector<uint16_t> refImg = inImg;
+    OCIO::PackedImageDesc refDesc(&refImg[0], width, height, 3,
+                                  OCIO::BIT_DEPTH_UINT16,
+                                  OCIO::AutoStride, OCIO::AutoStride, OCIO::AutoStride);
+    OCIO_CHECK_NO_THROW(cpuProcessor->apply(refDesc));
+
+    // The packed RGB image needs three intermediate buffers.
+    OCIO_CHECK_EQUAL(cpuProcessor->getScratchBufferPoolHits(), 0);
+    OCIO_CHECK_EQUAL(cpuProcessor->getScratchBufferPoolMisses(), 3);
+
+    for (size_t iter = 1; iter < 5; ++iter)
+    {
+        std::vector<uint16_t> outImg = inImg;
+        OCIO::PackedImageDesc outDesc(&outImg[0], width, height, 3,
+                                      OCIO::BIT_DEPTH_UINT16,
+                                      OCIO::AutoStride, OCIO::AutoStride, OCIO::AutoStride);
+        OCIO_CHECK_NO_THROW(cpuProcessor->apply(outDesc));
+
+        OCIO_CHECK_EQUAL(cpuProcessor->getScratchBufferPoolHits(), 3 * iter);
+        OCIO_CHECK_EQUAL(cpuProcessor->getScratchBufferPoolMisses(), 3);
+
+        for (size_t idx = 0; idx < outImg.size(); ++idx)
+        {
+            OCIO_REQUIRE_EQUAL(outImg[idx], refImg[idx]);
+        }
+    }
+
+    // A packed RGBA F32 image does not need any intermediate buffer.
+
+    OCIO_CHECK_NO_THROW(cpuProcessor = processor->getDefaultCPUProcessor());
+
+    std::vector<float> img(width * height * 4, 0.5f);
+    OCIO::PackedImageDesc imgDesc(&img[0], width, height, 4);
+    OCIO_CHECK_NO_THROW(cpuProcessor->apply(imgDesc));
+
+    OCIO_CHECK_EQUAL(cpuProcessor->getScratchBufferPoolHits(), 0);
+    OCIO_CHECK_EQUAL(cpuProcessor->getScratchBufferPoolMisses(), 0);
+}
+
+namespace
+{
+
+// A guard to restore the default chunk size.
+struct ChunkSizeGuard
+{
+    explicit ChunkSizeGuard(unsigned numPixels)
+    {
+        OCIO::SetCPUProcessorChunkSize(numPixels);
+    }
+
+    ~ChunkSizeGuard()
+    {
+        OCIO::SetCPUProcessorChunkSize(0);
+    }
+};
+
+}
+
+OCIO_ADD_TEST(CPUProcessor, chunk_size)
+{
+    // The unit test validates that processing the lines by chunks of pixels gives the same
+    // results as processing complete lines.
+
+    OCIO_CHECK_EQUAL(OCIO::GetCPUProcessorChunkSize(), 0);
+
+    OCIO::ConfigRcPtr config = OCIO::Config::Create();
+
+    OCIO::GroupTransformRcPtr group = OCIO::GroupTransform::Create();
+
+    OCIO::LogTransformRcPtr log = OCIO::LogTransform::Create();
+    group->appendTransform(log);
+
+    OCIO::MatrixTransformRcPtr matrix = OCIO::MatrixTransform::Create();
+    constexpr double offset4[4] = { 0.1, 0.2, 0.3, 0.4 };
+    matrix->setOffset(offset4);
+    group->appendTransform(matrix);
+
+    OCIO::ConstProcessorRcPtr processor;
+    OCIO_CHECK_NO_THROW(processor = config->getProcessor(group));
+
+    constexpr long width  = 67;
+    constexpr long height = 5;
+
+    std::vector<float> inImg(width * height * 4);
+    for (size_t idx = 0; idx < inImg.size(); ++idx)
+    {
+        inImg[idx] = float(idx) / float(inImg.size());
+    }
+
+    std::vector<uint16_t> inImg16(width * height * 3);
+    for (size_t idx = 0; idx < inImg16.size(); ++idx)
+    {
+        inImg16[idx] = uint16_t(idx * 50);
+    }
+
+    OCIO::ConstCPUProcessorRcPtr cpuProcessor;
+    OCIO_CHECK_NO_THROW(cpuProcessor = processor->getDefaultCPUProcessor());
+
+    OCIO::ConstCPUProcessorRcPtr cpuProcessor16;
+    OCIO_CHECK_NO_THROW(cpuProcessor16
+        = processor->getOptimizedCPUProcessor(OCIO::BIT_DEPTH_UINT16,
+                                              OCIO::BIT_DEPTH_F32,
+                                              OCIO::OPTIMIZATION_DEFAULT));
+
+    // Reference results processing complete lines.
+
+    std::vector<float> refImg = inImg;
+    OCIO::PackedImageDesc refDesc(&refImg[0], width, height, 4);
+    OCIO_CHECK_NO_THROW(cpuProcessor->apply(refDesc));
+
+    std::vector<float> refImg16(width * height * 3);
+    {
+        OCIO::PackedImageDesc srcDesc(&inImg16[0], width, height, 3,
+                                      OCIO::BIT_DEPTH_UINT16,
+                                      OCIO::AutoStride, OCIO::AutoStride, OCIO::AutoStride);
+        OCIO::PackedImageDesc dstDesc(&refImg16[0], width, height, 3);
+        OCIO_CHECK_NO_THROW(cpuProcessor16->apply(srcDesc, dstDesc));
+    }
+
+    for (unsigned chunkSize : { 1u, 7u, 16u, 67u, 1000u })
+    {
+        ChunkSizeGuard guard(chunkSize);
+        OCIO_CHECK_EQUAL(OCIO::GetCPUProcessorChunkSize(), chunkSize);
+
+        // Packed RGBA F32 image processed in place.
+        for (unsigned numThreads : { 1u, 3u })
+        {
+            std::vector<float> outImg = inImg;
+            OCIO::PackedImageDesc outDesc(&outImg[0], width, height, 4);
+            OCIO_CHECK_NO_THROW(cpuProcessor->apply(outDesc, numThreads));
+
+            for (size_t idx = 0; idx < outImg.size(); ++idx)
+            {
+                OCIO_REQUIRE_EQUAL(outImg[idx], refImg[idx]);
+            }
+        }
+
+        // Packed RGB UINT16 image to packed RGB F32 image.
+        {
+            std::vector<float> outImg16(width * height * 3);
+            OCIO::PackedImageDesc srcDesc(&inImg16[0], width, height, 3,
+                                          OCIO::BIT_DEPTH_UINT16,
+                                          OCIO::AutoStride, OCIO::AutoStride, OCIO::AutoStride);
+            OCIO::PackedImageDesc dstDesc(&outImg16[0], width, height, 3);
+            OCIO_CHECK_NO_THROW(cpuProcessor16->apply(srcDesc, dstDesc));
+
+            for (size_t idx = 0; idx < outImg16.size(); ++idx)
+            {
+                OCIO_REQUIRE_EQUAL(outImg16[idx], refImg16[idx]);
+            }
+        }
+    }
+
+    OCIO_CHECK_EQUAL(OCIO::GetCPUProcessorChunkSize(), 0);
+}
+
+OCIO_ADD_TEST(CPUProcessor, apply_points)
+{
+    // The unit test validates that processing an array of points gives the same results as
+    // processing the points one by one.
+
+    OCIO::ConfigRcPtr config = OCIO::Config::Create();
+
+    OCIO::GroupTransformRcPtr group = OCIO::GroupTransform::Create();
+
+    OCIO::LogTransformRcPtr log = OCIO::LogTransform::Create();
+    group->appendTransform(log);
+
+    OCIO::MatrixTransformRcPtr matrix = OCIO::MatrixTransform::Create();
+    constexpr double offset4[4] = { 0.1, 0.2, 0.3, 0.4 };
+    matrix->setOffset(offset4);
+    group->appendTransform(matrix);
+
+    OCIO::ConstProcessorRcPtr processor;
+    OCIO_CHECK_NO_THROW(processor = config->getProcessor(group));
+
+    OCIO::ConstCPUProcessorRcPtr cpuProcessor;
+    OCIO_CHECK_NO_THROW(cpuProcessor = processor->getDefaultCPUProcessor());
+
+    // More points than processed at once by the ops.
+    constexpr size_t numPoints = 2500;
+
+    std::vector<float> inRGBA(numPoints * 4);
+    for (size_t idx = 0; idx < inRGBA.size(); ++idx)
+    {
+        inRGBA[idx] = float(idx) / float(inRGBA.size());
+    }
+
+    std::vector<float> inRGB(numPoints * 3);
+    for (size_t idx = 0; idx < numPoints; ++idx)
+    {
+        inRGB[3 * idx]     = inRGBA[4 * idx];
+        inRGB[3 * idx + 1] = inRGBA[4 * idx + 1];
+        inRGB[3 * idx + 2] = inRGBA[4 * idx + 2];
+    }
+
+    {
+        std::vector<float> refRGBA = inRGBA;
+        for (size_t idx = 0; idx < numPoints; ++idx)
+        {
+            cpuProcessor->applyRGBA(&refRGBA[4 * idx]);
+        }
+
+        std::vector<float> outRGBA = inRGBA;
+        OCIO_CHECK_NO_THROW(cpuProcessor->applyRGBAPoints(&outRGBA[0], numPoints));
+
+        for (size_t idx = 0; idx < outRGBA.size(); ++idx)
+        {
+            OCIO_REQUIRE_EQUAL(outRGBA[idx], refRGBA[idx]);
+        }
+    }
+
+    {
+        std::vector<float> refRGB = inRGB;
+        for (size_t idx = 0; idx < numPoints; ++idx)
+        {
+            cpuProcessor->applyRGB(&refRGB[3 * idx]);
+        }
+
+        std::vector<float> outRGB = inRGB;
+        OCIO_CHECK_NO_THROW(cpuProcessor->applyRGBPoints(&outRGB[0], numPoints));
+
+        for (size_t idx = 0; idx < outRGB.size(); ++idx)
+        {
+            OCIO_REQUIRE_EQUAL(outRGB[idx], refRGB[idx]);
+        }
+
+        // The intermediate buffer is re-used by the next calls.
+        const size_t misses = cpuProcessor->getScratchBufferPoolMisses();
+        OCIO_CHECK_NO_THROW(cpuProcessor->applyRGBPoints(&outRGB[0], numPoints));
+        OCIO_CHECK_EQUAL(cpuProcessor->getScratchBufferPoolMisses(), misses);
+    }
+
+    // No points to process.
+    OCIO_CHECK_NO_THROW(cpuProcessor->applyRGBPoints(nullptr, 0));
+    OCIO_CHECK_NO_THROW(cpuProcessor->applyRGBAPoints(nullptr, 0));
+}
+
+OCIO_ADD_TEST(CPUProcessor, dynamic_property_values)
+{
+    // The unit test validates that the dynamic property values of an apply call only apply to
+    // that call, and give the same results as a CPU processor using the same values.
+
+    OCIO::ConfigRcPtr config = OCIO::Config::Create();
+    // Do not share the dynamic properties, so the reference CPU processor is another instance.
+    config->setProcessorCacheFlags(OCIO::PROCESSOR_CACHE_ENABLED);
+
+    OCIO::GroupTransformRcPtr group = OCIO::GroupTransform::Create();
+
+    OCIO::ExposureContrastTransformRcPtr ec = OCIO::ExposureContrastTransform::Create();
+    ec->setExposure(0.8);
+    ec->setContrast(1.1);
+    ec->setPivot(0.18);
+    ec->makeExposureDynamic();
+    ec->makeContrastDynamic();
+    group->appendTransform(ec);
+
+    OCIO::GradingPrimaryTransformRcPtr primary
+        = OCIO::GradingPrimaryTransform::Create(OCIO::GRADING_LIN);
+    primary->makeDynamic();
+    group->appendTransform(primary);
+
+    OCIO::MatrixTransformRcPtr matrix = OCIO::MatrixTransform::Create();
+    constexpr double offset4[4] = { 0.1, 0.2, 0.3, 0.4 };
+    matrix->setOffset(offset4);
+    group->appendTransform(matrix);
+
+    OCIO::ConstProcessorRcPtr processor;
+    OCIO_CHECK_NO_THROW(processor = config->getProcessor(group));
+
+    OCIO::ConstCPUProcessorRcPtr cpuProcessor;
+    OCIO_CHECK_NO_THROW(cpuProcessor = processor->getDefaultCPUProcessor());
+
+    // The contrast is not overridden so the current value of the CPU processor is used.
+    OCIO::DynamicPropertyRcPtr dp = cpuProcessor->getDynamicProperty(OCIO::DYNAMIC_PROPERTY_CONTRAST);
+    OCIO::DynamicPropertyValue::AsDouble(dp)->setValue(1.3);
+
+    OCIO::GradingPrimary gp{ OCIO::GRADING_LIN };
+    gp.m_saturation = 1.4;
+    gp.m_offset.m_red = 0.05;
+
+    OCIO::DynamicPropertyValuesRcPtr values = OCIO::DynamicPropertyValues::Create();
+    values->setDouble(OCIO::DYNAMIC_PROPERTY_EXPOSURE, 1.5);
+    values->setGradingPrimary(gp);
+    // Not used by the CPU processor.
+    values->setDouble(OCIO::DYNAMIC_PROPERTY_GAMMA, 2.);
+
+    // The reference CPU processor has the same dynamic property values.
+    OCIO::ConstCPUProcessorRcPtr refProcessor;
+    OCIO_CHECK_NO_THROW(refProcessor = processor->getDefaultCPUProcessor());
+    dp = refProcessor->getDynamicProperty(OCIO::DYNAMIC_PROPERTY_EXPOSURE);
+    OCIO::DynamicPropertyValue::AsDouble(dp)->setValue(1.5);
+    dp = refProcessor->getDynamicProperty(OCIO::DYNAMIC_PROPERTY_CONTRAST);
+    OCIO::DynamicPropertyValue::AsDouble(dp)->setValue(1.3);
+    dp = refProcessor->getDynamicProperty(OCIO::DYNAMIC_PROPERTY_GRADING_PRIMARY);
+    OCIO::DynamicPropertyValue::AsGradingPrimary(dp)->setValue(gp);
+
+    constexpr long width  = 31;
+    constexpr long height = 7;
+
+    std::vector<float> inImg(width * height * 4);
+    for (size_t idx = 0; idx < inImg.size(); ++idx)
+    {
+        inImg[idx] = float(idx) / float(inImg.size());
+    }
+
+    std::vector<float> refImg = inImg;
+    OCIO::PackedImageDesc refDesc(&refImg[0], width, height, 4);
+    OCIO_CHECK_NO_THROW(refProcessor->apply(refDesc));
+
+    std::vector<float> defaultImg = inImg;
+    OCIO::PackedImageDesc defaultDesc(&defaultImg[0], width, height, 4);
+    OCIO_CHECK_NO_THROW(cpuProcessor->apply(defaultDesc));
+    OCIO_CHECK_NE(defaultImg[40], refImg[40]);
+
+    for (unsigned numThreads : { 1u, 4u })
+    {
+        std::vector<float> outImg = inImg;
+        OCIO::PackedImageDesc outDesc(&outImg[0], width, height, 4);
+        OCIO_CHECK_NO_THROW(cpuProcessor->apply(outDesc, *values, numThreads));
+
+        for (size_t idx = 0; idx < outImg.size(); ++idx)
+        {
+            OCIO_REQUIRE_EQUAL(outImg[idx], refImg[idx]);
+        }
+    }
+
+    std::vector<float> dstImg(inImg.size());
+    OCIO::PackedImageDesc srcDesc(&inImg[0], width, height, 4);
+    OCIO::PackedImageDesc dstDesc(&dstImg[0], width, height, 4);
+    OCIO_CHECK_NO_THROW(cpuProcessor->apply(srcDesc, dstDesc, *values));
+    for (size_t idx = 0; idx < dstImg.size(); ++idx)
+    {
+        OCIO_REQUIRE_EQUAL(dstImg[idx], refImg[idx]);
+    }
+
+    // The single pixel and points methods.
+
+    float rgba[4]{ inImg[40], inImg[41], inImg[42], inImg[43] };
+    OCIO_CHECK_NO_THROW(cpuProcessor->applyRGBA(rgba, *values));
+    OCIO_CHECK_CLOSE(rgba[0], refImg[40], 1e-6f);
+    OCIO_CHECK_CLOSE(rgba[3], refImg[43], 1e-6f);
+
+    float rgb[3]{ inImg[40], inImg[41], inImg[42] };
+    OCIO_CHECK_NO_THROW(cpuProcessor->applyRGB(rgb, *values));
+    OCIO_CHECK_CLOSE(rgb[0], refImg[40], 1e-6f);
+    OCIO_CHECK_CLOSE(rgb[2], refImg[42], 1e-6f);
+
+    std::vector<float> points = inImg;
+    OCIO_CHECK_NO_THROW(cpuProcessor->applyRGBAPoints(&points[0], width * height, *values));
+    for (size_t idx = 0; idx < points.size(); ++idx)
+    {
+        OCIO_CHECK_CLOSE(points[idx], refImg[idx], 1e-6f);
+    }
+
+    // The CPU processor itself is unchanged.
+
+    dp = cpuProcessor->getDynamicProperty(OCIO::DYNAMIC_PROPERTY_EXPOSURE);
+    OCIO_CHECK_EQUAL(OCIO::DynamicPropertyValue::AsDouble(dp)->getValue(), 0.8);
+
+    std::vector<float> outImg = inImg;
+    OCIO::PackedImageDesc outDesc(&outImg[0], width, height, 4);
+    OCIO_CHECK_NO_THROW(cpuProcessor->apply(outDesc));
+    for (size_t idx = 0; idx < outImg.size(); ++idx)
+    {
+        OCIO_REQUIRE_EQUAL(outImg[idx], defaultImg[idx]);
+    }
+
+    // Concurrent calls using different values.
+
+    constexpr size_t numRequests = 4;
+    std::vector<std::vector<float>> images(numRequests, inImg);
+    std::vector<std::thread> requests;
+    for (size_t req = 0; req < numRequests; ++req)
+    {
+        requests.emplace_back([&cpuProcessor, &images, req]()
+        {
+            OCIO::DynamicPropertyValuesRcPtr reqValues = OCIO::DynamicPropertyValues::Create();
+            reqValues->setDouble(OCIO::DYNAMIC_PROPERTY_EXPOSURE, 0.5 * double(req));
+
+            OCIO::PackedImageDesc desc(&images[req][0], width, height, 4);
+            cpuProcessor->apply(desc, *reqValues);
+        });
+    }
+    for (auto & request : requests)
+    {
+        request.join();
+    }
+
+    for (size_t req = 0; req < numRequests; ++req)
+    {
+        dp = refProcessor->getDynamicProperty(OCIO::DYNAMIC_PROPERTY_EXPOSURE);
+        OCIO::DynamicPropertyValue::AsDouble(dp)->setValue(0.5 * double(req));
+        dp = refProcessor->getDynamicProperty(OCIO::DYNAMIC_PROPERTY_GRADING_PRIMARY);
+        OCIO::DynamicPropertyValue::AsGradingPrimary(dp)->setValue(
+            OCIO::GradingPrimary(OCIO::GRADING_LIN));
+
+        std::vector<float> reqImg = inImg;
+        OCIO::PackedImageDesc reqDesc(&reqImg[0], width, height, 4);
+        OCIO_CHECK_NO_THROW(refProcessor->apply(reqDesc));
+
+        for (size_t idx = 0; idx < reqImg.size(); ++idx)
+        {
+            OCIO_REQUIRE_EQUAL(images[req][idx], reqImg[idx]);
+        }
+    }
+
+    // The values are validated by the apply call.
+
+    gp.m_contrast.m_master = 0.;
+    values->setGradingPrimary(gp);
+    OCIO_CHECK_THROW_WHAT(cpuProcessor->apply(outDesc, *values), OCIO::Exception,
+                          "GradingPrimary contrast");
+}
@@ -244,4 +244,110 @@ OCIO_ADD_TEST(Caching, processor_cache)
             OCIO_CHECK_EQUAL(procA, procB); 
         }
     }
-}
\ No newline at end of file
+}
+OCIO_ADD_TEST(Caching, generic_cache_lru)
+{
+    OCIO::GenericCache<std::size_t, DataRcPtr> cache;
+    OCIO_CHECK_EQUAL(cache.getCapacity(), 0);
+
+    {
+        OCIO::AutoMutex guard(cache.lock());
+
+        // The cache is unbounded by default.
+        for (std::size_t key = 0; key < 10; ++key)
+        {
+            cache[key] = std::make_shared<Data>();
+        }
+    }
+
+    OCIO::CacheStatistics stats = cache.getStatistics();
+    OCIO_CHECK_EQUAL(stats.m_hits, 0);
+    OCIO_CHECK_EQUAL(stats.m_misses, 10);
+    OCIO_CHECK_EQUAL(stats.m_evictions, 0);
+    OCIO_CHECK_EQUAL(stats.m_size, 10);
+    OCIO_CHECK_EQUAL(stats.m_capacity, 0);
+
+    // Shrinking the capacity evicts the extra entries.
+    cache.setCapacity(3);
+    OCIO_CHECK_EQUAL(cache.getCapacity(), 3);
+
+    stats = cache.getStatistics();
+    OCIO_CHECK_EQUAL(stats.m_evictions, 7);
+    OCIO_CHECK_EQUAL(stats.m_size, 3);
+    OCIO_CHECK_EQUAL(stats.m_capacity, 3);
+
+    cache.clear();
+    cache.resetStatistics();
+
+    stats = cache.getStatistics();
+    OCIO_CHECK_EQUAL(stats.m_hits, 0);
+    OCIO_CHECK_EQUAL(stats.m_misses, 0);
+    OCIO_CHECK_EQUAL(stats.m_evictions, 0);
+    OCIO_CHECK_EQUAL(stats.m_size, 0);
+
+    {
+        OCIO::AutoMutex guard(cache.lock());
+
+        cache[1] = std::make_shared<Data>();
+        cache[2] = std::make_shared<Data>();
+        cache[3] = std::make_shared<Data>();
+
+        // Access the first entry so the second one becomes the least recently used.
+        OCIO_CHECK_ASSERT(cache[1]);
+
+        cache[4] = std::make_shared<Data>();
+
+        OCIO_CHECK_ASSERT(cache.exists(1));
+        OCIO_CHECK_ASSERT(!cache.exists(2));
+        OCIO_CHECK_ASSERT(cache.exists(3));
+        OCIO_CHECK_ASSERT(cache.exists(4));
+    }
+
+    stats = cache.getStatistics();
+    OCIO_CHECK_EQUAL(stats.m_hits, 1);
+    OCIO_CHECK_EQUAL(stats.m_misses, 4);
+    OCIO_CHECK_EQUAL(stats.m_evictions, 1);
+    OCIO_CHECK_EQUAL(stats.m_size, 3);
+
+    // Removing the limit keeps the existing entries.
+    cache.setCapacity(0);
+
+    {
+        OCIO::AutoMutex guard(cache.lock());
+
+        cache[5] = std::make_shared<Data>();
+        cache[6] = std::make_shared<Data>();
+    }
+
+    stats = cache.getStatistics();
+    OCIO_CHECK_EQUAL(stats.m_evictions, 1);
+    OCIO_CHECK_EQUAL(stats.m_size, 5);
+    OCIO_CHECK_EQUAL(stats.m_capacity, 0);
+
+    // Erasing entries does not change the statistics, and keeps the usage order of the others.
+    cache.setCapacity(4);
+
+    {
+        OCIO::AutoMutex guard(cache.lock());
+
+        cache[6]->status = true;
+        cache[3]->status = true;
+        cache.erase([](const DataRcPtr & entry) { return !entry->status; });
+
+        OCIO_CHECK_ASSERT(cache.exists(3));
+        OCIO_CHECK_ASSERT(!cache.exists(5));
+        OCIO_CHECK_ASSERT(cache.exists(6));
+
+        cache[7] = std::make_shared<Data>();
+        cache[8] = std::make_shared<Data>();
+        cache[9] = std::make_shared<Data>();
+
+        OCIO_CHECK_ASSERT(!cache.exists(6));
+        OCIO_CHECK_ASSERT(cache.exists(3));
+    }
+
+    // The first entry, as the least recently used one, was evicted by the capacity change.
+    stats = cache.getStatistics();
+    OCIO_CHECK_EQUAL(stats.m_evictions, 3);
+    OCIO_CHECK_EQUAL(stats.m_size, 4);
+}
@@ -314,3 +314,165 @@ OCIO_ADD_TEST(ColorSpaceSet, operations_on_set)
 
     OCIO_CHECK_EQUAL(css4->getNumColorSpaces(), 0);
 }
+
+OCIO_ADD_TEST(ColorSpaceSet, name_and_alias_index)
+{
+    OCIO::ColorSpaceSetRcPtr css = OCIO::ColorSpaceSet::Create();
+
+    for (int i = 0; i < 5; ++i)
+    {
+        OCIO::ColorSpaceRcPtr cs = OCIO::ColorSpace::Create();
+        cs->setName(("cs" + std::to_string(i)).c_str());
+        cs->addAlias(("Alias" + std::to_string(i)).c_str());
+        OCIO_CHECK_NO_THROW(css->addColorSpace(cs));
+    }
+
+    // The names and aliases are case insensitive.
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs3"), 3);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("CS3"), 3);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias3"), 3);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("ALIAS3"), 3);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs5"), -1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex(""), -1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex(nullptr), -1);
+
+    // An alias is not removed, only a name.
+    css->removeColorSpace("alias1");
+    OCIO_CHECK_EQUAL(css->getNumColorSpaces(), 5);
+
+    // Removing a color space moves the following ones.
+    css->removeColorSpace("CS1");
+    OCIO_REQUIRE_EQUAL(css->getNumColorSpaces(), 4);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs1"), -1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias1"), -1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs0"), 0);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs2"), 1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias4"), 3);
+    OCIO_CHECK_EQUAL(std::string(css->getColorSpace("alias4")->getName()), "cs4");
+
+    // Replacing a color space updates its aliases.
+    OCIO::ColorSpaceRcPtr cs = OCIO::ColorSpace::Create();
+    cs->setName("cs2");
+    cs->addAlias("new alias");
+    OCIO_CHECK_NO_THROW(css->addColorSpace(cs));
+    OCIO_REQUIRE_EQUAL(css->getNumColorSpaces(), 4);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias2"), -1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("New Alias"), 1);
+
+    // An alias of a removed color space could be used again.
+    cs = OCIO::ColorSpace::Create();
+    cs->setName("cs5");
+    cs->addAlias("alias1");
+    OCIO_CHECK_NO_THROW(css->addColorSpace(cs));
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias1"), 4);
+
+    // A copy has its own index.
+    OCIO::ColorSpaceSetRcPtr copy = css->createEditableCopy();
+    css->clearColorSpaces();
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias1"), -1);
+    OCIO_CHECK_EQUAL(copy->getColorSpaceIndex("alias1"), 4);
+    OCIO_CHECK_EQUAL(copy->getColorSpaceIndex("cs4"), 3);
+}
+
+OCIO_ADD_TEST(ColorSpaceSet, name_and_alias_index_edited_in_place)
+{
+    OCIO::ColorSpaceSetRcPtr css = OCIO::ColorSpaceSet::Create();
+
+    for (int i = 0; i < 3; ++i)
+    {
+        OCIO::ColorSpaceRcPtr cs = OCIO::ColorSpace::Create();
+        cs->setName(("cs" + std::to_string(i)).c_str());
+        cs->addAlias(("alias" + std::to_string(i)).c_str());
+        OCIO_CHECK_NO_THROW(css->addColorSpace(cs));
+    }
+
+    // The const of the color spaces could be lost (e.g. in the Python binding) so the color
+    // spaces of the set could be renamed or re-aliased in place.
+    auto cs1 = std::const_pointer_cast<OCIO::ColorSpace>(css->getColorSpace("cs1"));
+    OCIO_REQUIRE_ASSERT(cs1);
+    cs1->setName("renamed");
+    cs1->removeAlias("alias1");
+    cs1->addAlias("new alias");
+
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs1"), -1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias1"), -1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("Renamed"), 1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("NEW ALIAS"), 1);
+    OCIO_CHECK_ASSERT(!css->hasColorSpace("cs1"));
+
+    // The old name could be used by another color space.
+    OCIO::ColorSpaceRcPtr cs = OCIO::ColorSpace::Create();
+    cs->setName("cs1");
+    OCIO_CHECK_NO_THROW(css->addColorSpace(cs));
+    OCIO_REQUIRE_EQUAL(css->getNumColorSpaces(), 4);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs1"), 3);
+
+    // The new name is found when adding & removing color spaces.
+    cs = OCIO::ColorSpace::Create();
+    cs->setName("cs3");
+    cs->addAlias("renamed");
+    OCIO_CHECK_THROW_WHAT(css->addColorSpace(cs), OCIO::Exception,
+                          "existing color space, 'renamed' is using the same alias");
+
+    css->removeColorSpace("renamed");
+    OCIO_REQUIRE_EQUAL(css->getNumColorSpaces(), 3);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("new alias"), -1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs2"), 1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias2"), 1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs1"), 2);
+
+    // A color space removed from the set no longer changes the set.
+    auto cs0 = std::const_pointer_cast<OCIO::ColorSpace>(css->getColorSpace("cs0"));
+    OCIO_REQUIRE_ASSERT(cs0);
+    css->removeColorSpace("cs0");
+    cs0->setName("cs2");
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs0"), -1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs2"), 0);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs1"), 1);
+
+    // The copies of the set have their own index.
+    OCIO::ColorSpaceSetRcPtr copy = css->createEditableCopy();
+    std::const_pointer_cast<OCIO::ColorSpace>(copy->getColorSpace("cs2"))->setName("cs4");
+    OCIO_CHECK_EQUAL(copy->getColorSpaceIndex("cs4"), 0);
+    OCIO_CHECK_EQUAL(copy->getColorSpaceIndex("cs2"), -1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs2"), 0);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs4"), -1);
+}
+
+OCIO_ADD_TEST(ColorSpaceSet, name_and_alias_index_collisions)
+{
+    OCIO::ColorSpaceSetRcPtr css = OCIO::ColorSpaceSet::Create();
+
+    for (int i = 0; i < 4; ++i)
+    {
+        OCIO::ColorSpaceRcPtr cs = OCIO::ColorSpace::Create();
+        cs->setName(("cs" + std::to_string(i)).c_str());
+        cs->addAlias(("alias" + std::to_string(i)).c_str());
+        OCIO_CHECK_NO_THROW(css->addColorSpace(cs));
+    }
+
+    // An in-place rename could use the name or an alias of another color space, then the first
+    // color space using it is found (like the linear search).
+    std::const_pointer_cast<OCIO::ColorSpace>(css->getColorSpace("cs2"))->setName("cs1");
+    std::const_pointer_cast<OCIO::ColorSpace>(css->getColorSpace("cs3"))->addAlias("ALIAS0");
+
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs1"), 1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias2"), 2);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias0"), 0);
+
+    // Removing the first color space using a name or an alias finds the next one.
+    css->removeColorSpace("cs0");
+    OCIO_REQUIRE_EQUAL(css->getNumColorSpaces(), 3);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias0"), 2);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs1"), 0);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias1"), 0);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias2"), 1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs3"), 2);
+
+    css->removeColorSpace("cs1");
+    OCIO_REQUIRE_EQUAL(css->getNumColorSpaces(), 2);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("cs1"), 0);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias1"), -1);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias2"), 0);
+    OCIO_CHECK_EQUAL(css->getColorSpaceIndex("alias0"), 1);
+}
@@ -2,11 +2,16 @@
 // Copyright Contributors to the OpenColorIO Project.
 
 
+#include <chrono>
 #include <sstream>
+#include <string>
+#include <thread>
+#include <vector>
 
 #include <pystring.h>
 
 #include "ColorSpace.cpp"
+#include "ConfigUtils.h"
 
 #include "testutils/UnitTest.h"
 #include "UnitTestUtils.h"
@@ -1582,13 +1587,50 @@ colorspaces:
         OCIO_CHECK_EQUAL(std::string(csname), std::string("texture sRGB"));
     }
 
+    // The results of the heuristics are memoized using the config cache IDs, so a copy of the
+    // config gives the same result (but owned by the copy).
+    {
+        OCIO::ConstConfigRcPtr copy = editableCfg->createEditableCopy();
+        const char * csname = OCIO::Config::IdentifyBuiltinColorSpace(copy, builtinConfig, "sRGB - Texture");
+        OCIO_CHECK_EQUAL(std::string(csname), std::string("texture sRGB"));
+        OCIO_CHECK_EQUAL(csname, copy->getColorSpace("texture sRGB")->getName());
+
+        OCIO::ClearAllCaches();
+
+        csname = OCIO::Config::IdentifyBuiltinColorSpace(copy, builtinConfig, "sRGB - Texture");
+        OCIO_CHECK_EQUAL(std::string(csname), std::string("texture sRGB"));
+    }
+
     // The color space is present in editableCfg but it's inactive, so not found.
     {
+        const OCIO::CacheStatistics before = OCIO::ConfigUtils::GetHeuristicsCacheStatistics();
+
+        OCIO_CHECK_THROW_WHAT(
+            OCIO::Config::IdentifyBuiltinColorSpace(editableCfg, builtinConfig, "ACES2065-1"),
+            OCIO::Exception,
+            "Heuristics were not able to find an equivalent to the requested color space: ACES2065-1."
+        );
+
+        const OCIO::CacheStatistics after = OCIO::ConfigUtils::GetHeuristicsCacheStatistics();
+        OCIO_CHECK_EQUAL(after.m_misses, before.m_misses + 1);
+        OCIO_CHECK_EQUAL(after.m_size, before.m_size + 1);
+    }
+
+    // A failure of the heuristics is memoized too.
+    {
+        const OCIO::CacheStatistics before = OCIO::ConfigUtils::GetHeuristicsCacheStatistics();
+
         OCIO_CHECK_THROW_WHAT(
             OCIO::Config::IdentifyBuiltinColorSpace(editableCfg, builtinConfig, "ACES2065-1"),
             OCIO::Exception,
             "Heuristics were not able to find an equivalent to the requested color space: ACES2065-1."
         );
+
+        // Only lookups of the memoized results, without running the heuristics again.
+        const OCIO::CacheStatistics after = OCIO::ConfigUtils::GetHeuristicsCacheStatistics();
+        OCIO_CHECK_EQUAL(after.m_misses, before.m_misses);
+        OCIO_CHECK_ASSERT(after.m_hits > before.m_hits);
+        OCIO_CHECK_EQUAL(after.m_size, before.m_size);
     }
 
     // Use interchange role rather than heuristics.
@@ -1702,3 +1744,77 @@ colorspaces:
         );
     }
 }
+
+OCIO_ADD_TEST(ConfigUtils, find_first_candidate)
+{
+    // Enough candidates to be evaluated by several threads, if there are several hardware
+    // threads.
+    constexpr int numCandidates = 64;
+
+    OCIO_CHECK_EQUAL(OCIO::ConfigUtils::FindFirstCandidate(0, [](int) { return true; }), -1);
+    OCIO_CHECK_EQUAL(OCIO::ConfigUtils::FindFirstCandidate(numCandidates,
+                                                           [](int) { return false; }), -1);
+
+    // The lowest matching candidate is returned, even if higher candidates match first.
+    OCIO_CHECK_EQUAL(OCIO::ConfigUtils::FindFirstCandidate(numCandidates, [](int idx)
+        {
+            if (idx == 10)
+            {
+                std::this_thread::sleep_for(std::chrono::milliseconds(50));
+                return true;
+            }
+            return idx >= 20;
+        }), 10);
+
+    // The exception of the lowest failing candidate is thrown, even if higher candidates fail
+    // first.
+    OCIO_CHECK_THROW_WHAT(OCIO::ConfigUtils::FindFirstCandidate(numCandidates, [](int idx) -> bool
+        {
+            if (idx == 10)
+            {
+                std::this_thread::sleep_for(std::chrono::milliseconds(50));
+            }
+            if (idx >= 10)
+            {
+                throw OCIO::Exception(("Candidate " + std::to_string(idx) + " failed.").c_str());
+            }
+            return false;
+        }), OCIO::Exception, "Candidate 10 failed.");
+
+    // A lower failing candidate wins over a higher matching candidate, and the reverse.
+    OCIO_CHECK_THROW_WHAT(OCIO::ConfigUtils::FindFirstCandidate(numCandidates, [](int idx) -> bool
+        {
+            if (idx == 10)
+            {
+                std::this_thread::sleep_for(std::chrono::milliseconds(50));
+                throw OCIO::Exception("Candidate 10 failed.");
+            }
+            return idx >= 20;
+        }), OCIO::Exception, "Candidate 10 failed.");
+
+    OCIO_CHECK_EQUAL(OCIO::ConfigUtils::FindFirstCandidate(numCandidates, [](int idx) -> bool
+        {
+            if (idx == 10)
+            {
+                std::this_thread::sleep_for(std::chrono::milliseconds(50));
+                return true;
+            }
+            if (idx >= 20)
+            {
+                throw OCIO::Exception("Candidate failed.");
+            }
+            return false;
+        }), 10);
+
+    // A short list of candidates is evaluated by the caller thread only.
+    std::vector<std::thread::id> threadIds(3);
+    OCIO_CHECK_EQUAL(OCIO::ConfigUtils::FindFirstCandidate(3, [&threadIds](int idx)
+        {
+            threadIds[idx] = std::this_thread::get_id();
+            return false;
+        }), -1);
+    for (const auto & id : threadIds)
+    {
+        OCIO_CHECK_ASSERT(id == std::this_thread::get_id());
+    }
+}
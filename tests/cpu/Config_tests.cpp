@@ -7849,12 +7849,11 @@ colorspaces:
         OCIO_CHECK_EQUAL(config->getProcessor("ref", "cs2").get(),
                          config->getProcessor("ref", "cs3").get());
 
-        // Making a copy also flushes the internal processor cache.
+        // Making a copy keeps the processors of the internal processor cache.
         OCIO::ConfigRcPtr cfg = config->createEditableCopy();
 
-        // Check that caches are different between Config instances.
-        OCIO_CHECK_NE(config->getProcessor("ref", "cs1").get(),
-                      cfg->getProcessor("ref", "cs1").get());
+        OCIO_CHECK_EQUAL(config->getProcessor("ref", "cs1").get(),
+                         cfg->getProcessor("ref", "cs1").get());
 
         OCIO_CHECK_NO_THROW(cfg->addEnvironmentVar("VAR", "ref"));
 
@@ -7869,6 +7868,449 @@ colorspaces:
     }
 }
 
+OCIO_ADD_TEST(Config, cache_id_elements)
+{
+    // Validate that the config cache ID follows the changes of the config elements.
+
+    OCIO::ConfigRcPtr cfg = OCIO::Config::CreateRaw()->createEditableCopy();
+
+    OCIO::ColorSpaceRcPtr cs = OCIO::ColorSpace::Create();
+    cs->setName("cs1");
+    cs->setTransform(OCIO::MatrixTransform::Create(), OCIO::COLORSPACE_DIR_TO_REFERENCE);
+    cfg->addColorSpace(cs);
+
+    OCIO::LookRcPtr look = OCIO::Look::Create();
+    look->setName("look1");
+    look->setProcessSpace("cs1");
+    cfg->addLook(look);
+
+    OCIO::ViewTransformRcPtr vt = OCIO::ViewTransform::Create(OCIO::REFERENCE_SPACE_SCENE);
+    vt->setName("vt1");
+    vt->setTransform(OCIO::MatrixTransform::Create(), OCIO::VIEWTRANSFORM_DIR_FROM_REFERENCE);
+    cfg->addViewTransform(vt);
+
+    OCIO::NamedTransformRcPtr nt = OCIO::NamedTransform::Create();
+    nt->setName("nt1");
+    nt->setTransform(OCIO::MatrixTransform::Create(), OCIO::TRANSFORM_DIR_FORWARD);
+    cfg->addNamedTransform(nt);
+
+    const std::string cacheID = cfg->getCacheID();
+
+    // A copy has the same cache ID.
+    OCIO_CHECK_EQUAL(cacheID, cfg->createEditableCopy()->getCacheID());
+
+    // Any change of a color space changes the cache ID, and restoring it restores the cache ID.
+    OCIO::ColorSpaceRcPtr cs2 = cs->createEditableCopy();
+    cs2->setDescription("description");
+    cfg->addColorSpace(cs2);
+    OCIO_CHECK_NE(cacheID, cfg->getCacheID());
+    cfg->addColorSpace(cs);
+    OCIO_CHECK_EQUAL(cacheID, cfg->getCacheID());
+
+    OCIO::LookRcPtr look2 = look->createEditableCopy();
+    look2->setTransform(OCIO::MatrixTransform::Create());
+    cfg->addLook(look2);
+    OCIO_CHECK_NE(cacheID, cfg->getCacheID());
+    cfg->addLook(look);
+    OCIO_CHECK_EQUAL(cacheID, cfg->getCacheID());
+
+    OCIO::ViewTransformRcPtr vt2 = vt->createEditableCopy();
+    vt2->setFamily("family");
+    cfg->addViewTransform(vt2);
+    OCIO_CHECK_NE(cacheID, cfg->getCacheID());
+    cfg->addViewTransform(vt);
+    OCIO_CHECK_EQUAL(cacheID, cfg->getCacheID());
+
+    OCIO::NamedTransformRcPtr nt2 = nt->createEditableCopy();
+    nt2->addAlias("alias");
+    cfg->addNamedTransform(nt2);
+    OCIO_CHECK_NE(cacheID, cfg->getCacheID());
+    cfg->addNamedTransform(nt);
+    OCIO_CHECK_EQUAL(cacheID, cfg->getCacheID());
+
+    // The order of the elements matters.
+    OCIO::ColorSpaceRcPtr cs3 = cs->createEditableCopy();
+    cs3->setName("cs3");
+    cfg->addColorSpace(cs3);
+    const std::string cacheID3 = cfg->getCacheID();
+    OCIO_CHECK_NE(cacheID, cacheID3);
+
+    cfg->removeColorSpace("cs1");
+    cfg->addColorSpace(cs);
+    OCIO_CHECK_NE(cacheID3, cfg->getCacheID());
+
+    cfg->removeColorSpace("cs3");
+    OCIO_CHECK_EQUAL(cacheID, cfg->getCacheID());
+
+    // The elements could be edited in place (e.g. the const is lost in the Python binding), the
+    // next cache ID computation (i.e. after any config change) must not use a stale hash.
+    const std::string description = cfg->getDescription();
+
+    auto csInPlace = std::const_pointer_cast<OCIO::ColorSpace>(cfg->getColorSpace("cs1"));
+    csInPlace->setDescription("edited in place");
+    cfg->setDescription(description.c_str());
+    OCIO_CHECK_NE(cacheID, cfg->getCacheID());
+    csInPlace->setDescription("");
+    cfg->setDescription(description.c_str());
+    OCIO_CHECK_EQUAL(cacheID, cfg->getCacheID());
+
+    auto mat = OCIO::DynamicPtrCast<OCIO::MatrixTransform>(
+        std::const_pointer_cast<OCIO::Transform>(
+            csInPlace->getTransform(OCIO::COLORSPACE_DIR_TO_REFERENCE)));
+    OCIO_REQUIRE_ASSERT(mat);
+    const double offset[4]{ 0.1, 0.2, 0.3, 0. };
+    mat->setOffset(offset);
+    cfg->setDescription(description.c_str());
+    OCIO_CHECK_NE(cacheID, cfg->getCacheID());
+
+    const double noOffset[4]{ 0., 0., 0., 0. };
+    mat->setOffset(noOffset);
+    cfg->setDescription(description.c_str());
+    OCIO_CHECK_EQUAL(cacheID, cfg->getCacheID());
+
+    // The transform metadata is also part of the cache ID.
+    mat->getFormatMetadata().setName("name");
+    cfg->setDescription(description.c_str());
+    OCIO_CHECK_NE(cacheID, cfg->getCacheID());
+    mat->getFormatMetadata().setName("");
+    cfg->setDescription(description.c_str());
+    OCIO_CHECK_EQUAL(cacheID, cfg->getCacheID());
+
+    // A transform edited in place and then released is detected too.
+    mat.reset();
+    {
+        auto vtMat = OCIO::DynamicPtrCast<OCIO::MatrixTransform>(
+            std::const_pointer_cast<OCIO::Transform>(
+                cfg->getViewTransform("vt1")->getTransform(OCIO::VIEWTRANSFORM_DIR_FROM_REFERENCE)));
+        OCIO_REQUIRE_ASSERT(vtMat);
+        vtMat->setOffset(offset);
+    }
+    cfg->setDescription(description.c_str());
+    OCIO_CHECK_NE(cacheID, cfg->getCacheID());
+    cfg->addViewTransform(vt);
+    OCIO_CHECK_EQUAL(cacheID, cfg->getCacheID());
+
+    // Only the config setters reset the cache IDs, but the element setters (e.g. adding a color
+    // space) keep the serialization of the other config members. The file rules and the viewing
+    // rules edited in place are still detected.
+    auto fileRules = std::const_pointer_cast<OCIO::FileRules>(cfg->getFileRules());
+    fileRules->insertRule(0, "rule1", "cs1", "*", "exr");
+    cfg->addColorSpace(cs);
+    const std::string cacheIDRules = cfg->getCacheID();
+    OCIO_CHECK_NE(cacheID, cacheIDRules);
+    fileRules->removeRule(0);
+    cfg->addColorSpace(cs);
+    OCIO_CHECK_EQUAL(cacheID, cfg->getCacheID());
+
+    auto viewingRules = std::const_pointer_cast<OCIO::ViewingRules>(cfg->getViewingRules());
+    viewingRules->insertRule(0, "rule1");
+    cfg->addColorSpace(cs);
+    OCIO_CHECK_NE(cacheID, cfg->getCacheID());
+    viewingRules->removeRule(0);
+    cfg->addColorSpace(cs);
+    OCIO_CHECK_EQUAL(cacheID, cfg->getCacheID());
+
+    // The other config members are still part of the cache ID.
+    cfg->setDescription("new description");
+    OCIO_CHECK_NE(cacheID, cfg->getCacheID());
+    cfg->setDescription(description.c_str());
+    OCIO_CHECK_EQUAL(cacheID, cfg->getCacheID());
+
+    cfg->setRole("role1", "cs1");
+    OCIO_CHECK_NE(cacheID, cfg->getCacheID());
+    cfg->setRole("role1", nullptr);
+    OCIO_CHECK_EQUAL(cacheID, cfg->getCacheID());
+}
+
+namespace
+{
+// The element versions are only accessible to the config, so the test sets them.
+class TestElementHashes : public OCIO::OCIOYaml::ElementHashCache
+{
+public:
+    size_t m_version = 1;
+
+protected:
+    size_t getVersion(const OCIO::ColorSpace &) const override { return m_version; }
+    size_t getVersion(const OCIO::Look &) const override { return m_version; }
+    size_t getVersion(const OCIO::ViewTransform &) const override { return m_version; }
+    size_t getVersion(const OCIO::NamedTransform &) const override { return m_version; }
+};
+}
+
+OCIO_ADD_TEST(Config, cache_id_serialization)
+{
+    // The cache ID serialization is the config serialization where the elements are replaced by
+    // their hashes, even if the members and the elements are emitted apart.
+
+    OCIO::ConfigRcPtr cfg = OCIO::Config::CreateRaw()->createEditableCopy();
+    cfg->clearColorSpaces();
+    cfg->addDisplayView("display", "view", "raw", "");
+
+    std::ostringstream config;
+    cfg->serialize(config);
+
+    TestElementHashes cache;
+    std::ostringstream cacheID;
+    OCIO::OCIOYaml::WriteCacheID(cacheID, *cfg, cache);
+    OCIO_CHECK_EQUAL(config.str(), cacheID.str());
+
+    // The elements are only serialized again after a change of their version or of the content
+    // of their transforms.
+
+    OCIO::ColorSpaceRcPtr cs = OCIO::ColorSpace::Create();
+    cs->setName("raw");
+    cs->setIsData(true);
+    cs->setTransform(OCIO::MatrixTransform::Create(), OCIO::COLORSPACE_DIR_TO_REFERENCE);
+    cfg->addColorSpace(cs);
+
+    OCIO::ConstColorSpaceRcPtr raw = cfg->getColorSpace("raw");
+    const std::string hash = cache.getHash(raw, cfg->getMajorVersion());
+    OCIO_CHECK_EQUAL(hash, cache.getHash(raw, cfg->getMajorVersion()));
+
+    // The version is unchanged so the serialization is not done again.
+    std::const_pointer_cast<OCIO::ColorSpace>(raw)->setDescription("description");
+    OCIO_CHECK_EQUAL(hash, cache.getHash(raw, cfg->getMajorVersion()));
+
+    ++cache.m_version;
+    const std::string hashDesc = cache.getHash(raw, cfg->getMajorVersion());
+    OCIO_CHECK_NE(hash, hashDesc);
+
+    // Reading a transform is not a change, unlike editing it in place.
+    auto mat = OCIO::DynamicPtrCast<OCIO::MatrixTransform>(
+        std::const_pointer_cast<OCIO::Transform>(
+            raw->getTransform(OCIO::COLORSPACE_DIR_TO_REFERENCE)));
+    OCIO_REQUIRE_ASSERT(mat);
+    OCIO_CHECK_EQUAL(hashDesc, cache.getHash(raw, cfg->getMajorVersion()));
+
+    mat->getFormatMetadata().setName("name");
+    const std::string hashName = cache.getHash(raw, cfg->getMajorVersion());
+    OCIO_CHECK_NE(hashDesc, hashName);
+
+    const double offset[4]{ 0.1, 0.2, 0.3, 0. };
+    mat->setOffset(offset);
+    OCIO_CHECK_NE(hashName, cache.getHash(raw, cfg->getMajorVersion()));
+
+    // The removed elements are dropped by the next computation.
+    OCIO_CHECK_EQUAL(cache.size(), 1);
+    cfg->removeColorSpace("raw");
+    cacheID.str("");
+    OCIO::OCIOYaml::WriteCacheID(cacheID, *cfg, cache);
+    cacheID.str("");
+    OCIO::OCIOYaml::WriteCacheID(cacheID, *cfg, cache);
+    OCIO_CHECK_EQUAL(cache.size(), 0);
+}
+
+OCIO_ADD_TEST(Config, processor_cache_capacity)
+{
+    OCIO::ConfigRcPtr config = OCIO::Config::CreateRaw()->createEditableCopy();
+
+    auto getMatrix = [](double offset)
+    {
+        auto matrix = OCIO::MatrixTransform::Create();
+        const double offset4[4]{ offset, offset, offset, 0. };
+        matrix->setOffset(offset4);
+        return matrix;
+    };
+
+    // The cache is unbounded by default.
+
+    OCIO_CHECK_EQUAL(config->getProcessorCacheCapacity(), 0);
+
+    OCIO::ConstProcessorRcPtr proc1 = config->getProcessor(getMatrix(0.1));
+    OCIO::ConstProcessorRcPtr proc2 = config->getProcessor(getMatrix(0.2));
+    OCIO::ConstProcessorRcPtr proc3 = config->getProcessor(getMatrix(0.3));
+    OCIO_CHECK_EQUAL(config->getProcessor(getMatrix(0.1)), proc1);
+
+    OCIO::CacheStatistics stats = config->getProcessorCacheStatistics();
+    OCIO_CHECK_EQUAL(stats.m_hits, 1);
+    OCIO_CHECK_EQUAL(stats.m_misses, 3);
+    OCIO_CHECK_EQUAL(stats.m_evictions, 0);
+    OCIO_CHECK_EQUAL(stats.m_size, 3);
+    OCIO_CHECK_EQUAL(stats.m_capacity, 0);
+
+    // Reducing the capacity evicts the extra processors.
+
+    OCIO_CHECK_NO_THROW(config->setProcessorCacheCapacity(2));
+    OCIO_CHECK_EQUAL(config->getProcessorCacheCapacity(), 2);
+
+    stats = config->getProcessorCacheStatistics();
+    OCIO_CHECK_EQUAL(stats.m_evictions, 1);
+    OCIO_CHECK_EQUAL(stats.m_size, 2);
+    OCIO_CHECK_EQUAL(stats.m_capacity, 2);
+
+    // The least recently used processor is evicted.
+
+    config->clearProcessorCache();
+    proc1 = config->getProcessor(getMatrix(0.1));
+    proc2 = config->getProcessor(getMatrix(0.2));
+    OCIO_CHECK_EQUAL(config->getProcessor(getMatrix(0.1)), proc1);
+    proc3 = config->getProcessor(getMatrix(0.3));
+
+    OCIO_CHECK_EQUAL(config->getProcessor(getMatrix(0.1)), proc1);
+    OCIO_CHECK_EQUAL(config->getProcessor(getMatrix(0.3)), proc3);
+    OCIO_CHECK_NE(config->getProcessor(getMatrix(0.2)), proc2);
+
+    stats = config->getProcessorCacheStatistics();
+    OCIO_CHECK_EQUAL(stats.m_evictions, 3);
+    OCIO_CHECK_EQUAL(stats.m_size, 2);
+
+    // A copy keeps the capacity and the processors.
+
+    OCIO::ConfigRcPtr copy = config->createEditableCopy();
+    OCIO_CHECK_EQUAL(copy->getProcessorCacheCapacity(), 2);
+    OCIO_CHECK_EQUAL(copy->getProcessorCacheStatistics().m_size, 2);
+    OCIO_CHECK_EQUAL(copy->getProcessor(getMatrix(0.3)), proc3);
+
+    // A zero capacity removes the limit.
+
+    OCIO_CHECK_NO_THROW(config->setProcessorCacheCapacity(0));
+    config->getProcessor(getMatrix(0.4));
+    OCIO_CHECK_EQUAL(config->getProcessorCacheStatistics().m_size, 3);
+}
+
+OCIO_ADD_TEST(Config, copy_keeps_caches)
+{
+    // A copy deep copies the elements but keeps the processors of the source config.
+
+    OCIO::ConfigRcPtr config = OCIO::Config::CreateRaw()->createEditableCopy();
+
+    OCIO::ColorSpaceRcPtr cs = OCIO::ColorSpace::Create();
+    cs->setName("cs1");
+    cs->setTransform(OCIO::MatrixTransform::Create(), OCIO::COLORSPACE_DIR_TO_REFERENCE);
+    config->addColorSpace(cs);
+
+    OCIO::LookRcPtr look = OCIO::Look::Create();
+    look->setName("look1");
+    look->setProcessSpace("cs1");
+    config->addLook(look);
+
+    OCIO::ConstProcessorRcPtr proc = config->getProcessor("raw", "cs1");
+    const std::string cacheID = config->getCacheID();
+
+    OCIO::ConfigRcPtr copy = config->createEditableCopy();
+    OCIO_CHECK_NE(copy->getColorSpace("cs1").get(), config->getColorSpace("cs1").get());
+    OCIO_CHECK_NE(copy->getLook("look1").get(), config->getLook("look1").get());
+    OCIO_CHECK_EQUAL(std::string(copy->getCacheID()), cacheID);
+
+    OCIO_CHECK_EQUAL(copy->getProcessor("raw", "cs1").get(), proc.get());
+    OCIO_CHECK_EQUAL(copy->getProcessorCacheStatistics().m_hits, 1);
+
+    // An element of the copy edited in place (e.g. from the Python binding) does not change the
+    // source config.
+
+    auto copyLook = std::const_pointer_cast<OCIO::Look>(copy->getLook("look1"));
+    copyLook->setProcessSpace("raw");
+    OCIO_CHECK_EQUAL(std::string(config->getLook("look1")->getProcessSpace()), "cs1");
+    OCIO_CHECK_EQUAL(std::string(config->getCacheID()), cacheID);
+
+    // An unrelated change of the copy keeps its processors, and leaves the source config
+    // unchanged.
+
+    OCIO::ColorSpaceRcPtr cs2 = cs->createEditableCopy();
+    cs2->setName("cs2");
+    copy->addColorSpace(cs2);
+
+    OCIO_CHECK_EQUAL(copy->getProcessorCacheStatistics().m_size, 1);
+    OCIO_CHECK_EQUAL(copy->getProcessor("raw", "cs1").get(), proc.get());
+    OCIO_CHECK_EQUAL(copy->getProcessorCacheStatistics().m_hits, 2);
+    OCIO_CHECK_NE(std::string(copy->getCacheID()), cacheID);
+
+    OCIO_CHECK_ASSERT(!config->getColorSpace("cs2"));
+    OCIO_CHECK_EQUAL(config->getNumColorSpaces(), 2);
+    OCIO_CHECK_EQUAL(copy->getNumColorSpaces(), 3);
+    OCIO_CHECK_EQUAL(config->getProcessor("raw", "cs1").get(), proc.get());
+
+    // A change of an element used by a processor flushes it.
+
+    OCIO::ColorSpaceRcPtr cs1 = cs->createEditableCopy();
+    cs1->setDescription("changed");
+    copy->addColorSpace(cs1);
+
+    OCIO_CHECK_EQUAL(copy->getProcessorCacheStatistics().m_size, 0);
+    OCIO::ConstProcessorRcPtr copyProc = copy->getProcessor("raw", "cs1");
+    OCIO_CHECK_NE(copyProc.get(), proc.get());
+    OCIO_CHECK_EQUAL(config->getProcessor("raw", "cs1").get(), proc.get());
+
+    // The same for an element edited in place (e.g. from the Python binding), flushed by the next
+    // element change.
+
+    auto copyCs1 = std::const_pointer_cast<OCIO::ColorSpace>(copy->getColorSpace("cs1"));
+    copyCs1->setDescription("changed again");
+    copy->removeColorSpace("cs2");
+
+    OCIO_CHECK_EQUAL(copy->getProcessorCacheStatistics().m_size, 0);
+    OCIO_CHECK_NE(copy->getProcessor("raw", "cs1").get(), copyProc.get());
+
+    // The same for a look.
+
+    OCIO::LookTransformRcPtr lookTransform = OCIO::LookTransform::Create();
+    lookTransform->setSrc("raw");
+    lookTransform->setDst("cs1");
+    lookTransform->setLooks("look1");
+    copyProc = copy->getProcessor(lookTransform);
+
+    OCIO::LookRcPtr look2 = look->createEditableCopy();
+    look2->setName("look2");
+    copy->addLook(look2);
+    OCIO_CHECK_EQUAL(copy->getProcessor(lookTransform).get(), copyProc.get());
+
+    OCIO::LookRcPtr look1 = look->createEditableCopy();
+    look1->setDescription("changed");
+    copy->addLook(look1);
+    OCIO_CHECK_NE(copy->getProcessor(lookTransform).get(), copyProc.get());
+
+    // Any other change flushes all the processors.
+
+    copy->setName("copy");
+    OCIO_CHECK_EQUAL(copy->getProcessorCacheStatistics().m_size, 0);
+
+    // The cache ID of a copy of an unchanged config is the one of the source config.
+
+    OCIO::ConfigRcPtr copy2 = config->createEditableCopy();
+    copy2->setName("copy");
+    copy2->setName(config->getName());
+    OCIO_CHECK_EQUAL(std::string(copy2->getCacheID()), cacheID);
+}
+
+OCIO_ADD_TEST(Config, processor_cache_inline_luts)
+{
+    // The processor cache key is computed from the LUT values of the inline LUT transforms.
+
+    OCIO::ConfigRcPtr config = OCIO::Config::CreateRaw()->createEditableCopy();
+
+    auto getGroup = [](float value)
+    {
+        OCIO::Lut3DTransformRcPtr lut = OCIO::Lut3DTransform::Create(3);
+        lut->setValue(1, 1, 1, value, value, value);
+
+        OCIO::GroupTransformRcPtr group = OCIO::GroupTransform::Create();
+        group->appendTransform(OCIO::MatrixTransform::Create());
+        group->appendTransform(lut);
+        return group;
+    };
+
+    OCIO::ConstProcessorRcPtr proc1 = config->getProcessor(getGroup(0.4f));
+
+    // An identical transform is a cache hit.
+    OCIO_CHECK_EQUAL(config->getProcessor(getGroup(0.4f)), proc1);
+    OCIO_CHECK_EQUAL(config->getProcessorCacheStatistics().m_hits, 1);
+
+    // Same grid size & same range of values but a different LUT.
+    OCIO::ConstProcessorRcPtr proc2 = config->getProcessor(getGroup(0.6f));
+    OCIO_CHECK_NE(proc2, proc1);
+    OCIO_CHECK_NE(std::string(proc2->getCacheID()), std::string(proc1->getCacheID()));
+
+    // Changing the LUT values of a transform changes its key.
+    OCIO::GroupTransformRcPtr group = getGroup(0.4f);
+    OCIO_CHECK_EQUAL(config->getProcessor(group), proc1);
+
+    auto lut = OCIO::DynamicPtrCast<OCIO::Lut3DTransform>(group->getTransform(1));
+    OCIO_REQUIRE_ASSERT(lut);
+    lut->setValue(1, 1, 1, 0.6f, 0.6f, 0.6f);
+    OCIO_CHECK_EQUAL(config->getProcessor(group), proc2);
+}
+
 OCIO_ADD_TEST(Config, context_variables_typical_use_cases)
 {
     // Case 1 - No context variables used in the config.
@@ -9948,3 +10390,294 @@ OCIO_ADD_TEST(Config, set_config_io_proxy)
         OCIO::ClearAllCaches();
     }
 }
+
+namespace
+{
+
+void WriteConfig(const std::string & filename, const std::string & description)
+{
+    std::ofstream ofs(filename, std::ios_base::out | std::ios_base::trunc);
+    ofs << "ocio_profile_version: 2\n"
+        << "description: " << description << "\n"
+        << "environment:\n"
+        << "  CONFIG_CACHE_SHOT: \"001\"\n"
+        << "roles:\n"
+        << "  default: raw\n"
+        << "displays:\n"
+        << "  sRGB:\n"
+        << "    - !<View> {name: Raw, colorspace: raw}\n"
+        << "colorspaces:\n"
+        << "  - !<ColorSpace>\n"
+        << "    name: raw\n";
+}
+
+} // anon.
+
+OCIO_ADD_TEST(Config, create_from_file_cached)
+{
+    const std::string filename = OCIO::Platform::CreateTempFilename(".ocio");
+    WriteConfig(filename, "v1");
+
+    OCIO::ClearAllCaches();
+    OCIO_CHECK_EQUAL(OCIO::GetConfigCacheCapacity(), 0);
+
+    const OCIO::CacheStatistics stats = OCIO::GetConfigCacheStatistics();
+
+    // The config is shared while the file and the environment are unchanged.
+    OCIO::ConstConfigRcPtr config = OCIO::Config::CreateFromFileCached(filename.c_str());
+    OCIO_REQUIRE_ASSERT(config);
+    OCIO_CHECK_EQUAL(std::string(config->getDescription()), "v1");
+    OCIO_CHECK_EQUAL(OCIO::Config::CreateFromFileCached(filename.c_str()), config);
+    OCIO_CHECK_EQUAL(OCIO::GetConfigCacheStatistics().m_misses - stats.m_misses, 1);
+    OCIO_CHECK_EQUAL(OCIO::GetConfigCacheStatistics().m_hits - stats.m_hits, 1);
+    OCIO_CHECK_EQUAL(OCIO::GetConfigCacheStatistics().m_size, 1);
+
+    // The uncached method always loads the file.
+    OCIO_CHECK_NE(OCIO::Config::CreateFromFile(filename.c_str()), config);
+
+    // A modified file is loaded again.
+    WriteConfig(filename, "version 2");
+    OCIO::ConstConfigRcPtr other = OCIO::Config::CreateFromFileCached(filename.c_str());
+    OCIO_CHECK_NE(other, config);
+    OCIO_CHECK_EQUAL(std::string(other->getDescription()), "version 2");
+    OCIO_CHECK_EQUAL(OCIO::GetConfigCacheStatistics().m_invalidations - stats.m_invalidations, 1);
+    config = other;
+
+    // A change of a context variable loads the config again.
+    OCIO::SetEnvVariable("CONFIG_CACHE_SHOT", "002");
+    other = OCIO::Config::CreateFromFileCached(filename.c_str());
+    OCIO_CHECK_NE(other, config);
+    OCIO_CHECK_EQUAL(std::string(other->getCurrentContext()->getStringVar("CONFIG_CACHE_SHOT")),
+                     "002");
+    OCIO_CHECK_EQUAL(OCIO::Config::CreateFromFileCached(filename.c_str()), other);
+    OCIO_CHECK_EQUAL(OCIO::GetConfigCacheStatistics().m_invalidations - stats.m_invalidations, 2);
+    OCIO::UnsetEnvVariable("CONFIG_CACHE_SHOT");
+    config = OCIO::Config::CreateFromFileCached(filename.c_str());
+    OCIO_CHECK_NE(other, config);
+
+    // The overrides of the active displays and views are part of the key too.
+    OCIO::SetEnvVariable(OCIO::OCIO_ACTIVE_VIEWS_ENVVAR, "Raw");
+    other = OCIO::Config::CreateFromFileCached(filename.c_str());
+    OCIO_CHECK_NE(other, config);
+    OCIO::UnsetEnvVariable(OCIO::OCIO_ACTIVE_VIEWS_ENVVAR);
+    config = OCIO::Config::CreateFromFileCached(filename.c_str());
+    OCIO_CHECK_NE(other, config);
+
+    // The built-in config URIs are cached too.
+    const std::string uri = "ocio://default";
+    OCIO::ConstConfigRcPtr builtin = OCIO::Config::CreateFromFileCached(uri.c_str());
+    OCIO_CHECK_EQUAL(OCIO::Config::CreateFromFileCached(uri.c_str()), builtin);
+    OCIO_CHECK_EQUAL(OCIO::GetConfigCacheStatistics().m_size, 2);
+
+    // The least recently used config is evicted.
+    OCIO::SetConfigCacheCapacity(1);
+    OCIO_CHECK_EQUAL(OCIO::GetConfigCacheCapacity(), 1);
+    OCIO_CHECK_EQUAL(OCIO::GetConfigCacheStatistics().m_size, 1);
+    builtin = OCIO::Config::CreateFromFileCached(uri.c_str());
+    OCIO_CHECK_EQUAL(OCIO::Config::CreateFromFileCached(uri.c_str()), builtin);
+    OCIO_CHECK_NO_THROW(OCIO::Config::CreateFromFileCached(filename.c_str()));
+    OCIO_CHECK_NE(OCIO::Config::CreateFromFileCached(uri.c_str()), builtin);
+    OCIO::SetConfigCacheCapacity(0);
+
+    // Clearing the cache loads the configs again.
+    config = OCIO::Config::CreateFromFileCached(filename.c_str());
+    OCIO::ClearConfigCache();
+    OCIO_CHECK_EQUAL(OCIO::GetConfigCacheStatistics().m_size, 0);
+    OCIO_CHECK_NE(OCIO::Config::CreateFromFileCached(filename.c_str()), config);
+
+    // Errors are not cached.
+    std::remove(filename.c_str());
+    OCIO_CHECK_THROW(OCIO::Config::CreateFromFileCached(filename.c_str()), OCIO::Exception);
+    OCIO_CHECK_THROW_WHAT(OCIO::Config::CreateFromFileCached(""), OCIO::ExceptionMissingFile,
+                          "The config filepath is missing.");
+
+    OCIO::ClearAllCaches();
+}
+
+OCIO_ADD_TEST(Config, lazy_loading)
+{
+    static const std::string CONFIG =
+        "ocio_profile_version: 2\n"
+        "\n"
+        "environment:\n"
+        "  {}\n"
+        "search_path: \"\"\n"
+        "strictparsing: true\n"
+        "luma: [0.2126, 0.7152, 0.0722]\n"
+        "\n"
+        "roles:\n"
+        "  default: raw\n"
+        "  scene_linear: lin\n"
+        "\n"
+        "file_rules:\n"
+        "  - !<Rule> {name: Default, colorspace: default}\n"
+        "\n"
+        "displays:\n"
+        "  sRGB:\n"
+        "    - !<View> {name: Raw, colorspace: raw}\n"
+        "    - !<View> {name: Film, view_transform: film, display_colorspace: display}\n"
+        "\n"
+        "active_displays: []\n"
+        "active_views: []\n"
+        "\n"
+        "view_transforms:\n"
+        "  - !<ViewTransform>\n"
+        "    name: film\n"
+        "    from_scene_reference: !<ExponentTransform> {value: 2.2}\n"
+        "\n"
+        "display_colorspaces:\n"
+        "  - !<ColorSpace>\n"
+        "    name: display\n"
+        "    family: \"\"\n"
+        "    equalitygroup: \"\"\n"
+        "    bitdepth: unknown\n"
+        "    isdata: false\n"
+        "    allocation: uniform\n"
+        "    from_display_reference: !<MatrixTransform> {offset: [0.1, 0.1, 0.1, 0]}\n"
+        "\n"
+        "looks:\n"
+        "  - !<Look>\n"
+        "    name: look\n"
+        "    process_space: lin\n"
+        "    transform: !<CDLTransform> {slope: [1, 2, 1]}\n"
+        "\n"
+        "colorspaces:\n"
+        "  - !<ColorSpace>\n"
+        "    name: raw\n"
+        "    family: \"\"\n"
+        "    equalitygroup: \"\"\n"
+        "    bitdepth: unknown\n"
+        "    isdata: true\n"
+        "    allocation: uniform\n"
+        "\n"
+        "  - !<ColorSpace>\n"
+        "    name: lin\n"
+        "    family: \"\"\n"
+        "    equalitygroup: \"\"\n"
+        "    bitdepth: unknown\n"
+        "    isdata: false\n"
+        "    allocation: uniform\n"
+        "    to_scene_reference: !<GroupTransform>\n"
+        "      children:\n"
+        "        - !<RangeTransform> {min_in_value: 0, min_out_value: 0}\n"
+        "        - !<LogTransform> {base: 10, direction: inverse}\n"
+        "\n"
+        "named_transforms:\n"
+        "  - !<NamedTransform>\n"
+        "    name: nt\n"
+        "    inverse_transform: !<ExponentTransform> {value: 1.8}\n";
+
+    OCIO_CHECK_ASSERT(!OCIO::GetLazyConfigLoading());
+
+    std::istringstream iss;
+    iss.str(CONFIG);
+    OCIO::ConstConfigRcPtr eager;
+    OCIO_CHECK_NO_THROW(eager = OCIO::Config::CreateFromStream(iss));
+
+    OCIO::SetLazyConfigLoading(true);
+    OCIO_CHECK_ASSERT(OCIO::GetLazyConfigLoading());
+
+    iss.clear();
+    iss.str(CONFIG);
+    OCIO::ConstConfigRcPtr lazy;
+    OCIO_CHECK_NO_THROW(lazy = OCIO::Config::CreateFromStream(iss));
+
+    OCIO::SetLazyConfigLoading(false);
+
+    // The lazily loaded config gives the same processors.
+    OCIO::ConstProcessorRcPtr eagerProc, lazyProc;
+    OCIO_CHECK_NO_THROW(eagerProc = eager->getProcessor("lin", "sRGB", "Film",
+                                                        OCIO::TRANSFORM_DIR_FORWARD));
+    OCIO_CHECK_NO_THROW(lazyProc = lazy->getProcessor("lin", "sRGB", "Film",
+                                                      OCIO::TRANSFORM_DIR_FORWARD));
+    OCIO_CHECK_EQUAL(std::string(lazyProc->getCacheID()), std::string(eagerProc->getCacheID()));
+
+    OCIO::LookTransformRcPtr lt = OCIO::LookTransform::Create();
+    lt->setSrc("lin");
+    lt->setDst("raw");
+    lt->setLooks("look");
+    OCIO_CHECK_EQUAL(std::string(lazy->getProcessor(lt)->getCacheID()),
+                     std::string(eager->getProcessor(lt)->getCacheID()));
+
+    OCIO_CHECK_EQUAL(std::string(lazy->getProcessor("nt", OCIO::TRANSFORM_DIR_FORWARD)->getCacheID()),
+                     std::string(eager->getProcessor("nt", OCIO::TRANSFORM_DIR_FORWARD)->getCacheID()));
+
+    // The serialization and the copies are identical.
+    OCIO_CHECK_NO_THROW(lazy->validate());
+    std::ostringstream eagerStr, lazyStr, copyStr;
+    eager->serialize(eagerStr);
+    lazy->serialize(lazyStr);
+    lazy->createEditableCopy()->serialize(copyStr);
+    OCIO_CHECK_EQUAL(lazyStr.str(), eagerStr.str());
+    OCIO_CHECK_EQUAL(copyStr.str(), eagerStr.str());
+    OCIO_CHECK_EQUAL(std::string(lazy->getCacheID()), std::string(eager->getCacheID()));
+
+    // An in-place edit of a transform of a copy does not impact the source config.
+    const std::string cacheID = lazy->getCacheID();
+    OCIO::ConfigRcPtr copy = lazy->createEditableCopy();
+    OCIO::ConstTransformRcPtr transform
+        = copy->getColorSpace("lin")->getTransform(OCIO::COLORSPACE_DIR_TO_REFERENCE);
+    OCIO_REQUIRE_ASSERT(transform);
+    OCIO_CHECK_NE(transform,
+                  lazy->getColorSpace("lin")->getTransform(OCIO::COLORSPACE_DIR_TO_REFERENCE));
+    std::const_pointer_cast<OCIO::Transform>(transform)->setDirection(OCIO::TRANSFORM_DIR_INVERSE);
+    OCIO_CHECK_EQUAL(std::string(lazy->getCacheID()), cacheID);
+}
+
+OCIO_ADD_TEST(Config, lazy_loading_errors)
+{
+    static const std::string CONFIG_V1 =
+        "ocio_profile_version: 1\n"
+        "\n"
+        "roles:\n"
+        "  default: raw\n"
+        "\n"
+        "displays:\n"
+        "  sRGB:\n"
+        "    - !<View> {name: Raw, colorspace: raw}\n"
+        "\n"
+        "colorspaces:\n"
+        "  - !<ColorSpace>\n"
+        "    name: raw\n"
+        "\n"
+        "  - !<ColorSpace>\n"
+        "    name: log\n"
+        "    to_reference: !<LogAffineTransform> {base: 10}\n"
+        "\n"
+        "  - !<ColorSpace>\n"
+        "    name: faulty\n"
+        "    to_reference: !<MatrixTransform> {offset: [0.1, 0.1]}\n";
+
+    // The eager loading fails.
+    std::istringstream iss;
+    iss.str(CONFIG_V1);
+    OCIO_CHECK_THROW_WHAT(OCIO::Config::CreateFromStream(iss), OCIO::Exception,
+                          "'offset' values must be 4 numbers. Found '2'.");
+
+    // The lazy loading only fails on the first access of the faulty transforms.
+    OCIO::SetLazyConfigLoading(true);
+    iss.clear();
+    iss.str(CONFIG_V1);
+    OCIO::ConstConfigRcPtr config;
+    OCIO_CHECK_NO_THROW(config = OCIO::Config::CreateFromStream(iss));
+    OCIO::SetLazyConfigLoading(false);
+    OCIO_REQUIRE_ASSERT(config);
+
+    OCIO_CHECK_NO_THROW(config->getProcessor("raw", "raw"));
+
+    OCIO_CHECK_THROW_WHAT(config->getProcessor("faulty", "raw"), OCIO::Exception,
+                          "'offset' values must be 4 numbers. Found '2'.");
+    OCIO_CHECK_THROW_WHAT(config->getColorSpace("faulty")->getTransform(
+                              OCIO::COLORSPACE_DIR_TO_REFERENCE),
+                          OCIO::Exception,
+                          "'offset' values must be 4 numbers. Found '2'.");
+
+    // The config version is checked on the first access too.
+    OCIO_CHECK_THROW_WHAT(config->getProcessor("log", "raw"), OCIO::Exception,
+                          "Only config version 2 (or higher) can have LogAffineTransform.");
+
+    OCIO_CHECK_THROW(config->validate(), OCIO::Exception);
+
+    // As a transform fails to load, any color space is considered as used.
+    OCIO_CHECK_ASSERT(config->isColorSpaceUsed("log"));
+}
@@ -0,0 +1,171 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#include "DeferredTransform.cpp"
+
+#include "NamedTransform.h"
+
+#include "testutils/UnitTest.h"
+#include "UnitTestUtils.h"
+
+namespace OCIO = OCIO_NAMESPACE;
+
+
+OCIO_ADD_TEST(DeferredTransform, basic)
+{
+    int calls = 0;
+    auto deferred = std::make_shared<OCIO::DeferredTransform>(
+        OCIO::TRANSFORM_TYPE_MATRIX, OCIO::TRANSFORM_DIR_INVERSE, [&calls]()
+        {
+            ++calls;
+            return OCIO::MatrixTransform::Create();
+        });
+
+    // The transform is only created on the first access.
+    OCIO_CHECK_ASSERT(!deferred->isLoaded());
+    OCIO_CHECK_EQUAL(deferred->getTransformType(), OCIO::TRANSFORM_TYPE_MATRIX);
+    OCIO_CHECK_EQUAL(deferred->getDirection(), OCIO::TRANSFORM_DIR_INVERSE);
+    OCIO_CHECK_EQUAL(calls, 0);
+
+    OCIO::ConstTransformRcPtr transform = deferred->get();
+    OCIO_REQUIRE_ASSERT(transform);
+    OCIO_CHECK_EQUAL(transform->getTransformType(), OCIO::TRANSFORM_TYPE_MATRIX);
+    OCIO_CHECK_EQUAL(transform->getDirection(), OCIO::TRANSFORM_DIR_INVERSE);
+    OCIO_CHECK_ASSERT(deferred->isLoaded());
+    OCIO_CHECK_EQUAL(deferred->get(), transform);
+    OCIO_CHECK_EQUAL(calls, 1);
+
+    // The loading error is thrown by all the accesses.
+    auto faulty = std::make_shared<OCIO::DeferredTransform>(
+        OCIO::TRANSFORM_TYPE_RANGE, OCIO::TRANSFORM_DIR_FORWARD, [&calls]() -> OCIO::TransformRcPtr
+        {
+            ++calls;
+            throw OCIO::Exception("Faulty transform.");
+        });
+
+    OCIO_CHECK_THROW_WHAT(faulty->get(), OCIO::Exception, "Faulty transform.");
+    OCIO_CHECK_ASSERT(faulty->isLoaded());
+    OCIO_CHECK_THROW_WHAT(faulty->get(), OCIO::Exception, "Faulty transform.");
+    OCIO_CHECK_EQUAL(calls, 2);
+
+    // The copies keep the loading error.
+    OCIO_CHECK_THROW_WHAT(faulty->createDeferredCopy()->get(), OCIO::Exception, "Faulty transform.");
+    OCIO_CHECK_EQUAL(calls, 2);
+
+    OCIO_CHECK_THROW_WHAT(OCIO::DeferredTransform(OCIO::TRANSFORM_TYPE_MATRIX,
+                                                  OCIO::TRANSFORM_DIR_FORWARD,
+                                                  nullptr),
+                          OCIO::Exception,
+                          "DeferredTransform: the loader is missing.");
+}
+
+OCIO_ADD_TEST(DeferredTransform, config_elements)
+{
+    int calls = 0;
+    auto deferred = std::make_shared<OCIO::DeferredTransform>(
+        OCIO::TRANSFORM_TYPE_EXPONENT, OCIO::TRANSFORM_DIR_FORWARD, [&calls]()
+        {
+            ++calls;
+            return OCIO::ExponentTransform::Create();
+        });
+
+    // The element setters keep the deferred transform.
+    OCIO::ColorSpaceRcPtr cs = OCIO::ColorSpace::Create();
+    cs->setTransform(deferred, OCIO::COLORSPACE_DIR_TO_REFERENCE);
+    OCIO_CHECK_ASSERT(!cs->getTransform(OCIO::COLORSPACE_DIR_FROM_REFERENCE));
+    OCIO_CHECK_EQUAL(calls, 0);
+
+    // Each copy creates its own transform instance.
+    OCIO::ColorSpaceRcPtr copy = cs->createEditableCopy();
+    OCIO::ConstTransformRcPtr transform = copy->getTransform(OCIO::COLORSPACE_DIR_TO_REFERENCE);
+    OCIO_REQUIRE_ASSERT(transform);
+    OCIO_CHECK_EQUAL(transform->getTransformType(), OCIO::TRANSFORM_TYPE_EXPONENT);
+    OCIO_CHECK_EQUAL(calls, 1);
+
+    OCIO::ConstTransformRcPtr csTransform = cs->getTransform(OCIO::COLORSPACE_DIR_TO_REFERENCE);
+    OCIO_REQUIRE_ASSERT(csTransform);
+    OCIO_CHECK_NE(csTransform, transform);
+    OCIO_CHECK_EQUAL(calls, 2);
+
+    // Once created, the transform is copied i.e. an in-place edit (e.g. from Python) does not
+    // impact the other copies.
+    OCIO::ColorSpaceRcPtr copy2 = copy->createEditableCopy();
+    OCIO::ConstTransformRcPtr transform2 = copy2->getTransform(OCIO::COLORSPACE_DIR_TO_REFERENCE);
+    OCIO_REQUIRE_ASSERT(transform2);
+    OCIO_CHECK_NE(transform2, transform);
+    OCIO_CHECK_EQUAL(calls, 2);
+
+    std::const_pointer_cast<OCIO::Transform>(transform)->setDirection(OCIO::TRANSFORM_DIR_INVERSE);
+    OCIO_CHECK_EQUAL(transform2->getDirection(), OCIO::TRANSFORM_DIR_FORWARD);
+    OCIO_CHECK_EQUAL(csTransform->getDirection(), OCIO::TRANSFORM_DIR_FORWARD);
+
+    // Setting a transform replaces the deferred one.
+    cs->setTransform(OCIO::LogTransform::Create(), OCIO::COLORSPACE_DIR_TO_REFERENCE);
+    OCIO_CHECK_EQUAL(cs->getTransform(OCIO::COLORSPACE_DIR_TO_REFERENCE)->getTransformType(),
+                     OCIO::TRANSFORM_TYPE_LOG);
+    OCIO_CHECK_EQUAL(copy->getTransform(OCIO::COLORSPACE_DIR_TO_REFERENCE), transform);
+
+    OCIO::LookRcPtr look = OCIO::Look::Create();
+    look->setInverseTransform(deferred);
+    OCIO_CHECK_ASSERT(!look->getTransform());
+    OCIO_CHECK_EQUAL(look->getInverseTransform(), csTransform);
+
+    // Checking if a named transform has a transform does not create it.
+    calls = 0;
+    auto other = std::make_shared<OCIO::DeferredTransform>(
+        OCIO::TRANSFORM_TYPE_RANGE, OCIO::TRANSFORM_DIR_FORWARD, [&calls]()
+        {
+            ++calls;
+            return OCIO::RangeTransform::Create();
+        });
+
+    OCIO::NamedTransformRcPtr nt = OCIO::NamedTransform::Create();
+    nt->setTransform(other, OCIO::TRANSFORM_DIR_FORWARD);
+    OCIO_CHECK_ASSERT(OCIO::HasTransform(*nt, OCIO::TRANSFORM_DIR_FORWARD));
+    OCIO_CHECK_ASSERT(!OCIO::HasTransform(*nt, OCIO::TRANSFORM_DIR_INVERSE));
+    OCIO_CHECK_EQUAL(calls, 0);
+
+    OCIO::ConstTransformRcPtr range
+        = nt->createEditableCopy()->getTransform(OCIO::TRANSFORM_DIR_FORWARD);
+    OCIO_REQUIRE_ASSERT(range);
+    OCIO_CHECK_EQUAL(range->getTransformType(), OCIO::TRANSFORM_TYPE_RANGE);
+    OCIO_CHECK_EQUAL(calls, 1);
+
+    // Only the copy created its transform.
+    OCIO_CHECK_ASSERT(!other->isLoaded());
+
+    // The other elements create a copy of the transform.
+    OCIO::ViewTransformRcPtr vt = OCIO::ViewTransform::Create(OCIO::REFERENCE_SPACE_SCENE);
+    vt->setTransform(other, OCIO::VIEWTRANSFORM_DIR_FROM_REFERENCE);
+    OCIO_CHECK_EQUAL(calls, 2);
+    OCIO::ConstTransformRcPtr vtTransform
+        = vt->getTransform(OCIO::VIEWTRANSFORM_DIR_FROM_REFERENCE);
+    OCIO_REQUIRE_ASSERT(vtTransform);
+    OCIO_CHECK_EQUAL(vtTransform->getTransformType(), OCIO::TRANSFORM_TYPE_RANGE);
+    OCIO_CHECK_NE(vtTransform, range);
+    OCIO_CHECK_EQUAL(calls, 2);
+}
+
+OCIO_ADD_TEST(DeferredTransform, loading_error)
+{
+    auto faulty = std::make_shared<OCIO::DeferredTransform>(
+        OCIO::TRANSFORM_TYPE_MATRIX, OCIO::TRANSFORM_DIR_FORWARD, []() -> OCIO::TransformRcPtr
+        {
+            throw OCIO::Exception("Faulty transform.");
+        });
+
+    OCIO::ColorSpaceRcPtr cs = OCIO::ColorSpace::Create();
+    cs->setTransform(faulty, OCIO::COLORSPACE_DIR_TO_REFERENCE);
+
+    // The loading error is thrown by all the accesses, and by the copies.
+    OCIO_CHECK_THROW_WHAT(cs->getTransform(OCIO::COLORSPACE_DIR_TO_REFERENCE),
+                          OCIO::Exception, "Faulty transform.");
+    OCIO_CHECK_THROW_WHAT(cs->getTransform(OCIO::COLORSPACE_DIR_TO_REFERENCE),
+                          OCIO::Exception, "Faulty transform.");
+    OCIO::ConstColorSpaceRcPtr copy = cs->createEditableCopy();
+    OCIO_CHECK_THROW_WHAT(copy->getTransform(OCIO::COLORSPACE_DIR_TO_REFERENCE),
+                          OCIO::Exception, "Faulty transform.");
+
+    OCIO_CHECK_ASSERT(!cs->getTransform(OCIO::COLORSPACE_DIR_FROM_REFERENCE));
+}
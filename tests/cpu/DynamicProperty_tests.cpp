@@ -422,4 +422,81 @@ OCIO_ADD_TEST(DynamicPropertyImpl, get_as)
     gplog.m_pivot = 0.12;
     asPrimary->setValue(gplog);
     OCIO_CHECK_EQUAL(dpImpl0->getValue(), gplog);
-}
\ No newline at end of file
+}
+
+OCIO_ADD_TEST(DynamicPropertyValues, basic)
+{
+    OCIO::DynamicPropertyValuesRcPtr values = OCIO::DynamicPropertyValues::Create();
+    OCIO_REQUIRE_ASSERT(values);
+    OCIO_CHECK_ASSERT(!values->hasValue(OCIO::DYNAMIC_PROPERTY_EXPOSURE));
+    OCIO_CHECK_THROW_WHAT(values->getDouble(OCIO::DYNAMIC_PROPERTY_EXPOSURE), OCIO::Exception,
+                          "Dynamic property values do not hold a value of that type");
+    OCIO_CHECK_THROW_WHAT(values->getGradingPrimary(), OCIO::Exception,
+                          "Dynamic property values do not hold a grading primary");
+    OCIO_CHECK_THROW_WHAT(values->getGradingRGBCurve(), OCIO::Exception,
+                          "Dynamic property values do not hold a grading RGB curve");
+    OCIO_CHECK_THROW_WHAT(values->getGradingTone(), OCIO::Exception,
+                          "Dynamic property values do not hold a grading tone");
+
+    OCIO_CHECK_NO_THROW(values->setDouble(OCIO::DYNAMIC_PROPERTY_EXPOSURE, 1.5));
+    OCIO_CHECK_NO_THROW(values->setDouble(OCIO::DYNAMIC_PROPERTY_GAMMA, 1.1));
+    OCIO_CHECK_ASSERT(values->hasValue(OCIO::DYNAMIC_PROPERTY_EXPOSURE));
+    OCIO_CHECK_ASSERT(!values->hasValue(OCIO::DYNAMIC_PROPERTY_CONTRAST));
+    OCIO_CHECK_EQUAL(values->getDouble(OCIO::DYNAMIC_PROPERTY_EXPOSURE), 1.5);
+    OCIO_CHECK_EQUAL(values->getDouble(OCIO::DYNAMIC_PROPERTY_GAMMA), 1.1);
+    OCIO_CHECK_THROW_WHAT(values->setDouble(OCIO::DYNAMIC_PROPERTY_GRADING_PRIMARY, 1.),
+                          OCIO::Exception, "Dynamic property value is not a double");
+
+    OCIO::GradingPrimary gp{ OCIO::GRADING_LIN };
+    gp.m_saturation = 1.2;
+    OCIO_CHECK_NO_THROW(values->setGradingPrimary(gp));
+    OCIO_CHECK_ASSERT(values->hasValue(OCIO::DYNAMIC_PROPERTY_GRADING_PRIMARY));
+    OCIO_CHECK_EQUAL(values->getGradingPrimary(), gp);
+    OCIO_CHECK_THROW_WHAT(values->getDouble(OCIO::DYNAMIC_PROPERTY_GRADING_PRIMARY),
+                          OCIO::Exception, "Dynamic property value is not a double");
+
+    // The grading RGB curve and the grading tone are validated.
+
+    OCIO_CHECK_THROW_WHAT(values->setGradingRGBCurve(OCIO::ConstGradingRGBCurveRcPtr()),
+                          OCIO::Exception, "Grading RGB curve value is null");
+    OCIO::GradingRGBCurveRcPtr curve = OCIO::GradingRGBCurve::Create(OCIO::GRADING_LOG);
+    OCIO_CHECK_NO_THROW(values->setGradingRGBCurve(curve));
+    OCIO_CHECK_ASSERT(values->hasValue(OCIO::DYNAMIC_PROPERTY_GRADING_RGBCURVE));
+    // The set holds a copy of the curve.
+    OCIO_CHECK_NE(values->getGradingRGBCurve().get(), curve.get());
+    OCIO_CHECK_EQUAL(*values->getGradingRGBCurve(), *curve);
+
+    OCIO::GradingTone tone{ OCIO::GRADING_LOG };
+    tone.m_blacks.m_red = 0.;
+    OCIO_CHECK_THROW_WHAT(values->setGradingTone(tone), OCIO::Exception,
+                          "GradingTone blacks");
+    OCIO_CHECK_ASSERT(!values->hasValue(OCIO::DYNAMIC_PROPERTY_GRADING_TONE));
+    tone.m_blacks.m_red = 1.1;
+    OCIO_CHECK_NO_THROW(values->setGradingTone(tone));
+    OCIO_CHECK_EQUAL(values->getGradingTone(), tone);
+
+    // A copy is independent.
+
+    OCIO::DynamicPropertyValuesRcPtr copy = values->createEditableCopy();
+    OCIO_CHECK_EQUAL(copy->getDouble(OCIO::DYNAMIC_PROPERTY_EXPOSURE), 1.5);
+    OCIO_CHECK_EQUAL(copy->getGradingPrimary(), gp);
+    OCIO_CHECK_EQUAL(*copy->getGradingRGBCurve(), *curve);
+    OCIO_CHECK_EQUAL(copy->getGradingTone(), tone);
+
+    values->removeValue(OCIO::DYNAMIC_PROPERTY_EXPOSURE);
+    OCIO_CHECK_ASSERT(!values->hasValue(OCIO::DYNAMIC_PROPERTY_EXPOSURE));
+    OCIO_CHECK_ASSERT(values->hasValue(OCIO::DYNAMIC_PROPERTY_GAMMA));
+    OCIO_CHECK_ASSERT(copy->hasValue(OCIO::DYNAMIC_PROPERTY_EXPOSURE));
+
+    values->clear();
+    for (const auto type : { OCIO::DYNAMIC_PROPERTY_EXPOSURE,
+                             OCIO::DYNAMIC_PROPERTY_CONTRAST,
+                             OCIO::DYNAMIC_PROPERTY_GAMMA,
+                             OCIO::DYNAMIC_PROPERTY_GRADING_PRIMARY,
+                             OCIO::DYNAMIC_PROPERTY_GRADING_RGBCURVE,
+                             OCIO::DYNAMIC_PROPERTY_GRADING_TONE })
+    {
+        OCIO_CHECK_ASSERT(!values->hasValue(type));
+    }
+    OCIO_CHECK_ASSERT(copy->hasValue(OCIO::DYNAMIC_PROPERTY_GRADING_TONE));
+}
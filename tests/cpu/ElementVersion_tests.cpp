@@ -0,0 +1,30 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#include "ElementVersion.cpp"
+
+#include "testutils/UnitTest.h"
+
+namespace OCIO = OCIO_NAMESPACE;
+
+
+OCIO_ADD_TEST(ElementVersion, basic)
+{
+    OCIO::ElementVersion version1;
+    OCIO::ElementVersion version2;
+    OCIO_CHECK_NE(version1.get(), version2.get());
+
+    // A copy keeps the version.
+    OCIO::ElementVersion version3(version1);
+    OCIO_CHECK_EQUAL(version1.get(), version3.get());
+    version2 = version1;
+    OCIO_CHECK_EQUAL(version1.get(), version2.get());
+
+    // A change gives a new unique version.
+    version3.changed();
+    OCIO_CHECK_NE(version1.get(), version3.get());
+    version2.changed();
+    OCIO_CHECK_NE(version1.get(), version2.get());
+    OCIO_CHECK_NE(version3.get(), version2.get());
+}
@@ -1092,6 +1092,73 @@ OCIO_ADD_TEST(FileRules, rules_priority)
     OCIO_CHECK_ASSERT(colorSpace != nullptr && 0 == strcmp(colorSpace, OCIO::ROLE_DEFAULT));
 }
 
+OCIO_ADD_TEST(FileRules, rules_batch)
+{
+    std::istringstream is;
+    is.str(g_config);
+    OCIO::ConfigRcPtr config;
+    OCIO_CHECK_NO_THROW(config = OCIO::Config::CreateFromStream(is)->createEditableCopy());
+    auto rules = config->getFileRules()->createEditableCopy();
+    OCIO_CHECK_NO_THROW(rules->insertRule(0, "dpx file", "raw", "*", "dpx"));
+    OCIO_CHECK_NO_THROW(rules->insertRule(1, "plates", "cs2", "*/plates/*", "*"));
+    OCIO_CHECK_NO_THROW(rules->insertPathSearchRule(2));
+    OCIO_CHECK_NO_THROW(rules->insertRule(3, "regex rule", "cs1", ".*_v[0-9]+\\.exr"));
+    config->setFileRules(rules);
+
+    const std::vector<const char *> filePaths
+    {
+        "/mnt/show/img.0001.dpx",
+        "/mnt/show/img.0002.DPX",
+        "/mnt/show/plates/img.0001.exr",
+        "/mnt/show/plates/img_cs1.0002.exr",
+        "/mnt/show/plates/img",
+        "/mnt/show/img_cs2.0001.exr",
+        "/mnt/show/img_cs2.0002.exr",
+        "/mnt/show/img_v2.exr",
+        "/mnt/show/img_v3.exr",
+        "/mnt/show/img.exr",
+        "/mnt/show/img.",
+        "/mnt/show/img",
+        "img.dpx",
+        "",
+        nullptr
+    };
+
+    std::vector<const char *> colorSpaces(filePaths.size(), nullptr);
+    std::vector<size_t> ruleIndices(filePaths.size(), 0);
+    OCIO_CHECK_NO_THROW(config->getColorSpacesFromFilepaths(filePaths.data(), filePaths.size(),
+                                                            colorSpaces.data(), ruleIndices.data()));
+
+    // The results are the same as the lookups of each file path.
+    for (size_t idx = 0; idx < filePaths.size(); ++idx)
+    {
+        size_t rulePos = 0;
+        const std::string colorSpace = config->getColorSpaceFromFilepath(filePaths[idx], rulePos);
+        OCIO_REQUIRE_ASSERT(colorSpaces[idx]);
+        OCIO_CHECK_EQUAL(std::string(colorSpaces[idx]), colorSpace);
+        OCIO_CHECK_EQUAL(ruleIndices[idx], rulePos);
+    }
+
+    OCIO_CHECK_EQUAL(ruleIndices[0], 0);
+    OCIO_CHECK_EQUAL(std::string(colorSpaces[2]), "cs2");
+    OCIO_CHECK_EQUAL(ruleIndices[4], 4); // Default rule.
+    OCIO_CHECK_EQUAL(std::string(colorSpaces[6]), "cs2");
+    OCIO_CHECK_EQUAL(ruleIndices[6], 2);
+    OCIO_CHECK_EQUAL(ruleIndices[8], 3);
+    OCIO_CHECK_EQUAL(ruleIndices[9], 4); // Default rule.
+    OCIO_CHECK_EQUAL(ruleIndices[14], 4); // Default rule.
+
+    // The rule indices are optional.
+    OCIO_CHECK_NO_THROW(config->getColorSpacesFromFilepaths(filePaths.data(), 2,
+                                                            colorSpaces.data()));
+    OCIO_CHECK_EQUAL(std::string(colorSpaces[0]), "raw");
+    OCIO_CHECK_EQUAL(std::string(colorSpaces[1]), "raw"); // The extension is case-insensitive.
+
+    OCIO_CHECK_NO_THROW(config->getColorSpacesFromFilepaths(nullptr, 0, nullptr));
+    OCIO_CHECK_THROW_WHAT(config->getColorSpacesFromFilepaths(nullptr, 2, colorSpaces.data()),
+                          OCIO::Exception, "the file paths and the color spaces can't be null");
+}
+
 OCIO_ADD_TEST(FileRules, config_no_default)
 {
     constexpr char configNoDefault[] = { R"(ocio_profile_version: 2
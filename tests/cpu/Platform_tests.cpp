@@ -3,6 +3,7 @@
 
 
 #include <cstring>
+#include <fstream>
 #include <set>
 
 #include "Platform.cpp"
@@ -206,6 +207,37 @@ OCIO_ADD_TEST(Platform, create_temp_filename)
     OCIO_CHECK_EQUAL(uids.size(), TestMax);
 }
 
+OCIO_ADD_TEST(Platform, get_file_stamp)
+{
+    const std::string filename = OCIO::Platform::CreateTempFilename(".txt");
+
+    OCIO::Platform::FileStamp stamp;
+    OCIO_CHECK_ASSERT(!OCIO::Platform::GetFileStamp(filename, stamp));
+
+    {
+        std::ofstream stream(filename);
+        stream << "abc";
+    }
+
+    OCIO_CHECK_ASSERT(OCIO::Platform::GetFileStamp(filename, stamp));
+    OCIO_CHECK_EQUAL(stamp.m_size, 3);
+
+    OCIO::Platform::FileStamp other;
+    OCIO_CHECK_ASSERT(OCIO::Platform::GetFileStamp(filename, other));
+    OCIO_CHECK_ASSERT(stamp == other);
+
+    {
+        std::ofstream stream(filename);
+        stream << "abcdef";
+    }
+
+    OCIO_CHECK_ASSERT(OCIO::Platform::GetFileStamp(filename, other));
+    OCIO_CHECK_EQUAL(other.m_size, 6);
+    OCIO_CHECK_ASSERT(stamp != other);
+
+    std::remove(filename.c_str());
+}
+
 OCIO_ADD_TEST(Platform, utf8_utf16_convert)
 {
 #ifdef _WIN32
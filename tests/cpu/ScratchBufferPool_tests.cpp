@@ -0,0 +1,116 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#include <thread>
+
+#include "ScratchBufferPool.cpp"
+
+#include "testutils/UnitTest.h"
+
+namespace OCIO = OCIO_NAMESPACE;
+
+
+OCIO_ADD_TEST(ScratchBufferPool, acquire_release)
+{
+    OCIO::ScratchBufferPool pool;
+    OCIO_CHECK_EQUAL(pool.getHits(), 0);
+    OCIO_CHECK_EQUAL(pool.getMisses(), 0);
+    OCIO_CHECK_EQUAL(pool.getNumFreeBuffers(), 0);
+
+    {
+        OCIO::ScratchBufferPool::Buffer buffer = pool.acquire(100 * sizeof(float));
+        OCIO_REQUIRE_ASSERT(buffer.get<float>());
+        OCIO_CHECK_EQUAL(buffer.size(), 512);
+        OCIO_CHECK_EQUAL(reinterpret_cast<uintptr_t>(buffer.get<void>()) % 64, 0);
+
+        // The memory is writable.
+        for (size_t idx = 0; idx < 100; ++idx)
+        {
+            buffer.get<float>()[idx] = float(idx);
+        }
+
+        OCIO_CHECK_EQUAL(pool.getMisses(), 1);
+        OCIO_CHECK_EQUAL(pool.getNumFreeBuffers(), 0);
+    }
+
+    // The buffer is back in the pool.
+    OCIO_CHECK_EQUAL(pool.getNumFreeBuffers(), 1);
+
+    {
+        // Any size of the same bucket reuses the free buffer.
+        OCIO::ScratchBufferPool::Buffer buffer = pool.acquire(300);
+        OCIO_CHECK_EQUAL(buffer.size(), 512);
+        OCIO_CHECK_EQUAL(pool.getHits(), 1);
+        OCIO_CHECK_EQUAL(pool.getMisses(), 1);
+
+        // A different bucket needs an allocation.
+        OCIO::ScratchBufferPool::Buffer other = pool.acquire(513);
+        OCIO_CHECK_EQUAL(other.size(), 1024);
+        OCIO_CHECK_EQUAL(pool.getHits(), 1);
+        OCIO_CHECK_EQUAL(pool.getMisses(), 2);
+
+        // Move semantics transfer the ownership.
+        OCIO::ScratchBufferPool::Buffer moved(std::move(other));
+        OCIO_CHECK_ASSERT(!other.get<void>());
+        OCIO_CHECK_EQUAL(other.size(), 0);
+        OCIO_CHECK_EQUAL(moved.size(), 1024);
+
+        // Assigning a buffer releases the previous one.
+        moved = pool.acquire(10);
+        OCIO_CHECK_EQUAL(moved.size(), 64);
+        OCIO_CHECK_EQUAL(pool.getNumFreeBuffers(), 1);
+    }
+
+    OCIO_CHECK_EQUAL(pool.getNumFreeBuffers(), 3);
+
+    pool.clear();
+    OCIO_CHECK_EQUAL(pool.getNumFreeBuffers(), 0);
+    OCIO_CHECK_EQUAL(pool.getHits(), 1);
+    OCIO_CHECK_EQUAL(pool.getMisses(), 3);
+}
+
+OCIO_ADD_TEST(ScratchBufferPool, max_free_buffers)
+{
+    OCIO::ScratchBufferPool pool;
+
+    {
+        std::vector<OCIO::ScratchBufferPool::Buffer> buffers;
+        for (size_t idx = 0; idx < 2 * OCIO::ScratchBufferPool::MaxFreeBuffersPerBucket; ++idx)
+        {
+            buffers.push_back(pool.acquire(128));
+        }
+    }
+
+    // The extra buffers are freed.
+    OCIO_CHECK_EQUAL(pool.getNumFreeBuffers(), OCIO::ScratchBufferPool::MaxFreeBuffersPerBucket);
+}
+
+OCIO_ADD_TEST(ScratchBufferPool, multi_threaded)
+{
+    OCIO::ScratchBufferPool pool;
+
+    static constexpr size_t numThreads = 8;
+    static constexpr size_t numIterations = 200;
+
+    std::vector<std::thread> threads;
+    for (size_t t = 0; t < numThreads; ++t)
+    {
+        threads.emplace_back([&pool, t]()
+        {
+            for (size_t idx = 0; idx < numIterations; ++idx)
+            {
+                OCIO::ScratchBufferPool::Buffer buffer = pool.acquire(64 * (t + 1));
+                buffer.get<char>()[0] = char(idx);
+            }
+        });
+    }
+
+    for (auto & thread : threads)
+    {
+        thread.join();
+    }
+
+    OCIO_CHECK_EQUAL(pool.getHits() + pool.getMisses(), numThreads * numIterations);
+    OCIO_CHECK_EQUAL(pool.getMisses(), pool.getNumFreeBuffers());
+}
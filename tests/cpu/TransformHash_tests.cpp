@@ -0,0 +1,134 @@
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenColorIO Project.
+
+
+#include "TransformHash.cpp"
+
+#include "testutils/UnitTest.h"
+#include "UnitTestUtils.h"
+
+namespace OCIO = OCIO_NAMESPACE;
+
+
+OCIO_ADD_TEST(TransformHash, basic)
+{
+    OCIO::MatrixTransformRcPtr m1 = OCIO::MatrixTransform::Create();
+    OCIO::MatrixTransformRcPtr m2 = OCIO::MatrixTransform::Create();
+
+    // Identical transforms have the same hash.
+    OCIO_CHECK_EQUAL(OCIO::GetTransformHash(*m1), OCIO::GetTransformHash(*m2));
+
+    const double offset[4]{ 0.1, 0.2, 0.3, 0. };
+    m2->setOffset(offset);
+    OCIO_CHECK_NE(OCIO::GetTransformHash(*m1), OCIO::GetTransformHash(*m2));
+
+    m1->setOffset(offset);
+    OCIO_CHECK_EQUAL(OCIO::GetTransformHash(*m1), OCIO::GetTransformHash(*m2));
+
+    m2->setDirection(OCIO::TRANSFORM_DIR_INVERSE);
+    OCIO_CHECK_NE(OCIO::GetTransformHash(*m1), OCIO::GetTransformHash(*m2));
+
+    // The format metadata are ignored.
+    m1->setDirection(OCIO::TRANSFORM_DIR_INVERSE);
+    m1->getFormatMetadata().setName("name");
+    OCIO_CHECK_EQUAL(OCIO::GetTransformHash(*m1), OCIO::GetTransformHash(*m2));
+
+    // Except the names, if requested.
+    OCIO_CHECK_NE(OCIO::GetTransformHash(*m1, true), OCIO::GetTransformHash(*m2, true));
+    m2->getFormatMetadata().setName("name");
+    OCIO_CHECK_EQUAL(OCIO::GetTransformHash(*m1, true), OCIO::GetTransformHash(*m2, true));
+    m2->getFormatMetadata().setID("id");
+    OCIO_CHECK_EQUAL(OCIO::GetTransformHash(*m1, true), OCIO::GetTransformHash(*m2, true));
+
+    // The strings are hashed by content.
+    OCIO::ColorSpaceTransformRcPtr cs1 = OCIO::ColorSpaceTransform::Create();
+    cs1->setSrc("src");
+    cs1->setDst("dst");
+    OCIO::ColorSpaceTransformRcPtr cs2 = OCIO::ColorSpaceTransform::Create();
+    cs2->setSrc(std::string("src").c_str());
+    cs2->setDst(std::string("dst").c_str());
+    OCIO_CHECK_EQUAL(OCIO::GetTransformHash(*cs1), OCIO::GetTransformHash(*cs2));
+
+    cs2->setDst("src");
+    OCIO_CHECK_NE(OCIO::GetTransformHash(*cs1), OCIO::GetTransformHash(*cs2));
+
+    // Different transform types with default values do not collide.
+    OCIO_CHECK_NE(OCIO::GetTransformHash(*OCIO::LogTransform::Create()),
+                  OCIO::GetTransformHash(*OCIO::ExponentTransform::Create()));
+}
+
+OCIO_ADD_TEST(TransformHash, lut_values)
+{
+    OCIO::Lut3DTransformRcPtr lut1 = OCIO::Lut3DTransform::Create(3);
+    OCIO::Lut3DTransformRcPtr lut2 = OCIO::Lut3DTransform::Create(3);
+
+    const std::size_t hash = OCIO::GetTransformHash(*lut1);
+    OCIO_CHECK_EQUAL(hash, OCIO::GetTransformHash(*lut2));
+
+    // Changing a value invalidates the hash of the LUT values.
+    lut2->setValue(1, 1, 1, 0.1f, 0.2f, 0.3f);
+    OCIO_CHECK_NE(hash, OCIO::GetTransformHash(*lut2));
+
+    lut2->setValue(1, 1, 1, 0.5f, 0.5f, 0.5f);
+    OCIO_CHECK_EQUAL(hash, OCIO::GetTransformHash(*lut2));
+
+    // A copy has the same hash.
+    OCIO::ConstTransformRcPtr copy = lut2->createEditableCopy();
+    OCIO_CHECK_EQUAL(hash, OCIO::GetTransformHash(*copy));
+
+    // Replacing the LUT data invalidates the hash too.
+    auto & impl = dynamic_cast<OCIO::Lut3DTransformImpl &>(*lut2);
+    OCIO::Lut3DOpData data(3);
+    data.getArray()[0] = 0.5f;
+    impl.setData(data);
+    OCIO_CHECK_NE(hash, OCIO::GetTransformHash(*lut2));
+
+    lut2->setGridSize(3);
+    OCIO_CHECK_EQUAL(hash, OCIO::GetTransformHash(*lut2));
+
+    OCIO::Lut1DTransformRcPtr lut1d = OCIO::Lut1DTransform::Create(4, false);
+    const std::size_t hash1d = OCIO::GetTransformHash(*lut1d);
+
+    lut1d->setValue(2, 0.f, 0.f, 0.f);
+    OCIO_CHECK_NE(hash1d, OCIO::GetTransformHash(*lut1d));
+
+    lut1d->setLength(4);
+    OCIO_CHECK_EQUAL(hash1d, OCIO::GetTransformHash(*lut1d));
+
+    lut1d->setInterpolation(OCIO::INTERP_NEAREST);
+    OCIO_CHECK_NE(hash1d, OCIO::GetTransformHash(*lut1d));
+}
+
+OCIO_ADD_TEST(TransformHash, group)
+{
+    OCIO::GroupTransformRcPtr group1 = OCIO::GroupTransform::Create();
+    group1->appendTransform(OCIO::Lut3DTransform::Create(3));
+    group1->appendTransform(OCIO::MatrixTransform::Create());
+
+    OCIO::GroupTransformRcPtr group2 = OCIO::GroupTransform::Create();
+    group2->appendTransform(OCIO::Lut3DTransform::Create(3));
+    group2->appendTransform(OCIO::MatrixTransform::Create());
+
+    OCIO_CHECK_EQUAL(OCIO::GetTransformHash(*group1), OCIO::GetTransformHash(*group2));
+
+    // A change in a nested transform changes the hash of the group.
+    auto lut = OCIO::DynamicPtrCast<OCIO::Lut3DTransform>(group2->getTransform(0));
+    OCIO_REQUIRE_ASSERT(lut);
+    lut->setValue(0, 0, 0, 0.1f, 0.1f, 0.1f);
+    OCIO_CHECK_NE(OCIO::GetTransformHash(*group1), OCIO::GetTransformHash(*group2));
+
+    // The order of the transforms matters.
+    OCIO::GroupTransformRcPtr group3 = OCIO::GroupTransform::Create();
+    group3->appendTransform(OCIO::MatrixTransform::Create());
+    group3->appendTransform(OCIO::Lut3DTransform::Create(3));
+    OCIO_CHECK_NE(OCIO::GetTransformHash(*group1), OCIO::GetTransformHash(*group3));
+
+    // The names of the nested transforms are hashed too, if requested.
+    OCIO::MatrixTransformRcPtr matrix = OCIO::MatrixTransform::Create();
+    matrix->getFormatMetadata().setName("name");
+    group2 = OCIO::GroupTransform::Create();
+    group2->appendTransform(group1->getTransform(0));
+    group2->appendTransform(matrix);
+    OCIO_CHECK_EQUAL(OCIO::GetTransformHash(*group1), OCIO::GetTransformHash(*group2));
+    OCIO_CHECK_NE(OCIO::GetTransformHash(*group1, true), OCIO::GetTransformHash(*group2, true));
+}
@@ -4,6 +4,7 @@
 
 #include <OpenColorIO/OpenColorIO.h>
 
+#include "CPUInfo.h"
 #include "Logging.h"
 #include "OpBuilders.h"
 #include "UnitTestUtils.h"
@@ -189,4 +190,81 @@ void RemoveTemporaryDirectory(const std::string & sDirectoryPath)
 
 }
 
+std::vector<float> CreateRampImage(long numPixels, float minValue, float maxValue)
+{
+    const float step = (maxValue - minValue) / static_cast<float>(numPixels - 1);
+
+    std::vector<float> image(4 * numPixels);
+    for (long idx = 0; idx < numPixels; ++idx)
+    {
+        image[4 * idx + 0] = minValue + step * static_cast<float>(idx);
+        image[4 * idx + 1] = maxValue - step * static_cast<float>(idx);
+        image[4 * idx + 2] = minValue + step * static_cast<float>((idx * 7) % numPixels);
+        image[4 * idx + 3] = static_cast<float>(idx % 3) * 0.5f;
+    }
+
+    return image;
+}
+
+namespace
+{
+// Restore the CPU flags changed by a test.
+class CPUFlagsGuard
+{
+public:
+    CPUFlagsGuard() : m_flags(CPUInfo::instance().flags) {}
+    ~CPUFlagsGuard() { CPUInfo::instance().flags = m_flags; }
+
+    unsigned int getFlags() const noexcept { return m_flags; }
+
+private:
+    const unsigned int m_flags;
+};
+}
+
+void ValidateSIMDRenderers(const std::vector<float> & image,
+                           const CPURendererCreator & createRenderer,
+                           const ImageValidator & validate)
+{
+    const long numPixels = static_cast<long>(image.size() / 4);
+
+    CPUInfo & cpu = CPUInfo::instance();
+    const CPUFlagsGuard guard;
+
+    // The flags of each instruction set supported by the CPU.
+    std::vector<unsigned int> simdFlags;
+    if (cpu.hasSSE2())
+    {
+        simdFlags.push_back(guard.getFlags()
+                            & ~(X86_CPU_FLAG_AVX | X86_CPU_FLAG_AVX2 | X86_CPU_FLAG_AVX512));
+    }
+    if (cpu.hasAVX2())
+    {
+        simdFlags.push_back(guard.getFlags() & ~X86_CPU_FLAG_AVX512);
+    }
+    if (cpu.hasAVX512())
+    {
+        simdFlags.push_back(guard.getFlags());
+    }
+
+    cpu.flags = 0;
+    std::vector<float> expected(image.size());
+    createRenderer()->apply(image.data(), expected.data(), numPixels);
+
+    for (const unsigned int flags : simdFlags)
+    {
+        cpu.flags = flags;
+        ConstOpCPURcPtr op = createRenderer();
+
+        std::vector<float> res(image.size());
+        op->apply(image.data(), res.data(), numPixels);
+        validate(expected.data(), res.data(), numPixels);
+
+        // In-place processing.
+        res = image;
+        op->apply(res.data(), res.data(), numPixels);
+        validate(expected.data(), res.data(), numPixels);
+    }
+}
+
 } // namespace OCIO_NAMESPACE
@@ -6,6 +6,8 @@
 
 
 #include <fstream>
+#include <functional>
+#include <vector>
 
 #ifdef __has_include
 # if __has_include(<version>)
@@ -150,6 +152,34 @@ std::string CreateTemporaryDirectory(const std::string & name);
  */
 void RemoveTemporaryDirectory(const std::string & directoryPath);
 
+/**
+ * \brief Create an RGBA image whose color channels are ramps in the [minValue, maxValue] range.
+ * 
+ * \param numPixels Number of pixels, preferably not a multiple of the SIMD widths.
+ * \param minValue Minimum value of the color channels.
+ * \param maxValue Maximum value of the color channels.
+ * \return The RGBA pixels.
+ */
+std::vector<float> CreateRampImage(long numPixels, float minValue, float maxValue);
+
+typedef std::function<ConstOpCPURcPtr()> CPURendererCreator;
+typedef std::function<void(const float * expected, const float * res, long numPixels)> ImageValidator;
+
+/**
+ * \brief Compare the SSE2, AVX2 and AVX-512 renderers with the default renderer.
+ * 
+ * The renderers are created for each instruction set supported by the CPU, as the instruction
+ * set is selected when a renderer is created, and the image is processed out of place and in
+ * place.
+ * 
+ * \param image RGBA pixels to process.
+ * \param createRenderer Create the renderer for the current CPU flags.
+ * \param validate Compare the result of the default renderer with a SIMD one.
+ */
+void ValidateSIMDRenderers(const std::vector<float> & image,
+                           const CPURendererCreator & createRenderer,
+                           const ImageValidator & validate);
+
 }
 // namespace OCIO_NAMESPACE
 
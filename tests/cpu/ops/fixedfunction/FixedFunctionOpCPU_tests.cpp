@@ -3,6 +3,7 @@
 
 
 #include <cstring>
+#include <random>
 
 #include "ops/fixedfunction/FixedFunctionOpCPU.cpp"
 
@@ -21,11 +22,13 @@ void ApplyFixedFunction(float * input_32f,
                         OCIO::ConstFixedFunctionOpDataRcPtr & fnData, 
                         float errorThreshold,
                         int lineNo,
-                        bool fastLogExpPow = false
+                        bool fastLogExpPow = false,
+                        bool fastACES2 = false
 )
 {
     OCIO::ConstOpCPURcPtr op;
-    OCIO_CHECK_NO_THROW_FROM(op = OCIO::GetFixedFunctionCPURenderer(fnData, fastLogExpPow), lineNo);
+    OCIO_CHECK_NO_THROW_FROM(op = OCIO::GetFixedFunctionCPURenderer(fnData, fastLogExpPow, fastACES2),
+                             lineNo);
     OCIO_CHECK_NO_THROW_FROM(op->apply(input_32f, input_32f, numSamples), lineNo);
 
     for(unsigned idx=0; idx<(numSamples*4); ++idx)
@@ -542,6 +545,25 @@ OCIO_ADD_TEST(FixedFunctionOpCPU, aces_output_transform_20)
                        funcData2,
                        1e-4f,
                        __LINE__);
+
+    // SIMD versions enabled (i.e. the SSE2, AVX2 or AVX-512 versions are used if available).
+    {
+        memcpy(&input2_32f[0], &input_32f[0], sizeof(float)*num_samples * 4);
+
+        ApplyFixedFunction(&input2_32f[0], &expected_32f[0], num_samples,
+                           funcData,
+                           1e-3f,
+                           __LINE__,
+                           false,
+                           true);
+
+        ApplyFixedFunction(&input2_32f[0], &input_32f[0], num_samples,
+                           funcData2,
+                           2e-3f,
+                           __LINE__,
+                           false,
+                           true);
+    }
 }
 
 // NB: The ACES 2 FixedFunction takes linear ACES2065-1 values and produces linear RGB values
@@ -573,7 +595,7 @@ OCIO_ADD_TEST(FixedFunctionOpCPU, aces_ot_20_rec709_100n_rt)
                                                       params);
 
     OCIO::ConstOpCPURcPtr op;
-    OCIO_CHECK_NO_THROW(op = OCIO::GetFixedFunctionCPURenderer(funcData, false));
+    OCIO_CHECK_NO_THROW(op = OCIO::GetFixedFunctionCPURenderer(funcData, false, false));
     OCIO_CHECK_NO_THROW(op->apply(&input_32f[0], &output_32f[0], num_samples));
 
     OCIO::ConstFixedFunctionOpDataRcPtr funcData2
@@ -608,7 +630,7 @@ OCIO_ADD_TEST(FixedFunctionOpCPU, aces_ot_20_p3d65_100n_rt)
                                                       params);
 
     OCIO::ConstOpCPURcPtr op;
-    OCIO_CHECK_NO_THROW(op = OCIO::GetFixedFunctionCPURenderer(funcData, false));
+    OCIO_CHECK_NO_THROW(op = OCIO::GetFixedFunctionCPURenderer(funcData, false, false));
     OCIO_CHECK_NO_THROW(op->apply(&input_32f[0], &output_32f[0], num_samples));
 
     OCIO::ConstFixedFunctionOpDataRcPtr funcData2
@@ -649,7 +671,7 @@ OCIO_ADD_TEST(FixedFunctionOpCPU, aces_ot_20_p3d65_1000n_rt)
                                                       params);
 
     OCIO::ConstOpCPURcPtr op;
-    OCIO_CHECK_NO_THROW(op = OCIO::GetFixedFunctionCPURenderer(funcData, false));
+    OCIO_CHECK_NO_THROW(op = OCIO::GetFixedFunctionCPURenderer(funcData, false, false));
     OCIO_CHECK_NO_THROW(op->apply(&input_32f[0], &output_32f[0], num_samples));
 
     OCIO::ConstFixedFunctionOpDataRcPtr funcData2
@@ -757,6 +779,25 @@ OCIO_ADD_TEST(FixedFunctionOpCPU, aces_rgb_to_jmh_20)
                        funcData2,
                        1e-4f,
                        __LINE__);
+
+    // SIMD versions enabled (i.e. the SSE2, AVX2 or AVX-512 versions are used if available).
+    {
+        memcpy(&input2_32f[0], &input_32f[0], sizeof(float)*num_samples * 4);
+
+        ApplyFixedFunction(&input2_32f[0], &expected_32f[0], num_samples,
+                           funcData,
+                           5e-4f,
+                           __LINE__,
+                           false,
+                           true);
+
+        ApplyFixedFunction(&input2_32f[0], &input_32f[0], num_samples,
+                           funcData2,
+                           5e-4f,
+                           __LINE__,
+                           false,
+                           true);
+    }
 }
 
 OCIO_ADD_TEST(FixedFunctionOpCPU, aces_tonescale_compress_20)
@@ -850,6 +891,25 @@ OCIO_ADD_TEST(FixedFunctionOpCPU, aces_tonescale_compress_20)
                        funcData2,
                        1e-4f,
                        __LINE__);
+
+    // SIMD versions enabled (i.e. the SSE2, AVX2 or AVX-512 versions are used if available).
+    {
+        memcpy(&input2_32f[0], &input_32f[0], sizeof(float)*num_samples * 4);
+
+        ApplyFixedFunction(&input2_32f[0], &expected_32f[0], num_samples,
+                           funcData,
+                           1e-4f,
+                           __LINE__,
+                           false,
+                           true);
+
+        ApplyFixedFunction(&input2_32f[0], &input_32f[0], num_samples,
+                           funcData2,
+                           1e-4f,
+                           __LINE__,
+                           false,
+                           true);
+    }
 }
 
 OCIO_ADD_TEST(FixedFunctionOpCPU, aces_gamut_map_20)
@@ -950,6 +1010,210 @@ OCIO_ADD_TEST(FixedFunctionOpCPU, aces_gamut_map_20)
                        __LINE__);
 }
 
+OCIO_ADD_TEST(FixedFunctionOpCPU, aces_20_shared_params)
+{
+    OCIO::ClearAllCaches();
+
+    const OCIO::Primaries p3d65 = { {0.680, 0.320}, {0.265, 0.690}, {0.150, 0.060}, {0.3127, 0.3290} };
+
+    OCIO::ACES2::ConstOutputTransformParamsRcPtr params
+        = OCIO::ACES2::GetOutputTransformParams(1000.f, p3d65);
+    OCIO_REQUIRE_ASSERT(params);
+
+    // The parameters are the ones built from scratch.
+    const OCIO::ACES2::JMhParams pIn = OCIO::ACES2::init_JMhParams(OCIO::ACES_AP0::primaries);
+    const OCIO::ACES2::JMhParams pLim = OCIO::ACES2::init_JMhParams(p3d65);
+    const OCIO::ACES2::JMhParams reachGamut = OCIO::ACES2::init_JMhParams(OCIO::ACES_AP1::primaries);
+    const OCIO::ACES2::ToneScaleParams t = OCIO::ACES2::init_ToneScaleParams(1000.f);
+    const OCIO::ACES2::SharedCompressionParameters s
+        = OCIO::ACES2::init_SharedCompressionParams(1000.f, pIn, reachGamut);
+    const OCIO::ACES2::GamutCompressParams g
+        = OCIO::ACES2::init_GamutCompressParams(1000.f, pIn, pLim, t, s, reachGamut);
+
+    OCIO_CHECK_EQUAL(params->tsParams.n_r, t.n_r);
+    OCIO_CHECK_EQUAL(params->shParams.limit_J_max, s.limit_J_max);
+    OCIO_CHECK_EQUAL(params->gcParams.mid_J, g.mid_J);
+    OCIO_CHECK_EQUAL(params->limitJMhParams.cz, pLim.cz);
+    for (unsigned idx = 0; idx < OCIO::ACES2::TableBase::total_size; ++idx)
+    {
+        OCIO_CHECK_EQUAL(params->shParams.reach_m_table[idx], s.reach_m_table[idx]);
+        OCIO_CHECK_EQUAL(params->gcParams.hue_table[idx], g.hue_table[idx]);
+        for (unsigned c = 0; c < 3; ++c)
+        {
+            OCIO_CHECK_EQUAL(params->gcParams.gamut_cusp_table[idx][c], g.gamut_cusp_table[idx][c]);
+        }
+    }
+
+    // The same peak luminance & limiting primaries share the same instance.
+    OCIO_CHECK_EQUAL(params.get(), OCIO::ACES2::GetOutputTransformParams(1000.f, p3d65).get());
+    OCIO_CHECK_NE(params.get(), OCIO::ACES2::GetOutputTransformParams(100.f, p3d65).get());
+    OCIO_CHECK_NE(params.get(),
+                  OCIO::ACES2::GetOutputTransformParams(1000.f, OCIO::REC709::primaries).get());
+
+    OCIO::ACES2::ConstToneScaleCompressParamsRcPtr tsParams
+        = OCIO::ACES2::GetToneScaleCompressParams(1000.f);
+    OCIO_CHECK_EQUAL(tsParams.get(), OCIO::ACES2::GetToneScaleCompressParams(1000.f).get());
+    OCIO_CHECK_EQUAL(tsParams->shParams.reach_m_table[10], s.reach_m_table[10]);
+
+    // Clearing the caches does not invalidate the instances in use.
+    OCIO::ClearAllCaches();
+    OCIO_CHECK_NE(params.get(), OCIO::ACES2::GetOutputTransformParams(1000.f, p3d65).get());
+    OCIO_CHECK_EQUAL(params->gcParams.mid_J, g.mid_J);
+}
+
+namespace
+{
+// Compare the SSE2, AVX2 and AVX-512 versions (i.e. the fast power, atan2 and sincos
+// approximations) of an ACES 2 renderer with the scalar renderer. Like ApplyFixedFunction(),
+// the error is absolute for the values below one and relative above.
+void ValidateACES2SIMD(OCIO::FixedFunctionOpData::Style style,
+                       const OCIO::FixedFunctionOpData::Params & params,
+                       const std::vector<float> & image,
+                       float errorThreshold,
+                       unsigned line)
+{
+    OCIO::ConstFixedFunctionOpDataRcPtr funcData
+        = std::make_shared<OCIO::FixedFunctionOpData>(style, params);
+
+    OCIO_CHECK_NO_THROW_FROM(OCIO::ValidateSIMDRenderers(
+        image,
+        [&funcData]() { return OCIO::GetFixedFunctionCPURenderer(funcData, false, true); },
+        [errorThreshold, line](const float * expected, const float * res, long numPixels)
+        {
+            for (long idx = 0; idx < 4 * numPixels; ++idx)
+            {
+                float computedError = 0.0f;
+                if (!OCIO::EqualWithSafeRelError(res[idx], expected[idx],
+                                                 errorThreshold, 1.0f, &computedError))
+                {
+                    std::ostringstream errorMsg;
+                    errorMsg.precision(14);
+                    errorMsg << "Index: " << idx;
+                    errorMsg << " - Values: " << res[idx] << " expected: " << expected[idx];
+                    errorMsg << " - Error: " << computedError;
+                    OCIO_CHECK_ASSERT_MESSAGE_FROM(0, errorMsg.str(), line);
+                    return;
+                }
+            }
+        }), line);
+}
+}
+
+OCIO_ADD_TEST(FixedFunctionOpCPU, aces_20_simd)
+{
+    // Use a pixel count which is not a multiple of the SIMD register sizes.
+    constexpr long numPixels = 4099;
+
+    std::mt19937 gen(0);
+    std::uniform_real_distribution<float> stopsDist(-12.f, 6.f);
+    std::uniform_real_distribution<float> unitDist(0.f, 1.f);
+
+    // Scene-referred ACES2065-1 values from about 0.0002 to 64 (i.e. 18 stops).
+    std::vector<float> sceneImage(4 * numPixels);
+    for (long idx = 0; idx < numPixels; ++idx)
+    {
+        for (long c = 0; c < 3; ++c)
+        {
+            sceneImage[4 * idx + c] = std::exp2(stopsDist(gen));
+        }
+        sceneImage[4 * idx + 3] = unitDist(gen);
+    }
+
+    // Display-referred values (i.e. normalized to 100 nits) in the display gamut.
+    auto createDisplayImage = [&gen, &unitDist](float normPeakLuminance)
+    {
+        std::vector<float> image(4 * numPixels);
+        for (long idx = 0; idx < numPixels; ++idx)
+        {
+            for (long c = 0; c < 3; ++c)
+            {
+                image[4 * idx + c] = normPeakLuminance * unitDist(gen);
+            }
+            image[4 * idx + 3] = unitDist(gen);
+        }
+        return image;
+    };
+
+    // JMh values.
+    std::vector<float> jmhImage(4 * numPixels);
+    for (long idx = 0; idx < numPixels; ++idx)
+    {
+        jmhImage[4 * idx + 0] = 120.f * unitDist(gen);
+        jmhImage[4 * idx + 1] =  80.f * unitDist(gen);
+        jmhImage[4 * idx + 2] = 360.f * unitDist(gen);
+        jmhImage[4 * idx + 3] = unitDist(gen);
+    }
+
+    const OCIO::FixedFunctionOpData::Params sdrParams = {
+        // Peak luminance
+        100.f,
+        // Rec.709 gamut
+        0.640, 0.330, 0.300, 0.600, 0.150, 0.060, 0.3127, 0.3290
+    };
+    const OCIO::FixedFunctionOpData::Params hdrParams = {
+        // Peak luminance
+        1000.f,
+        // P3D65 gamut
+        0.680, 0.320, 0.265, 0.690, 0.150, 0.060, 0.3127, 0.3290
+    };
+
+    ValidateACES2SIMD(OCIO::FixedFunctionOpData::ACES_OUTPUT_TRANSFORM_20_FWD,
+                      sdrParams, sceneImage, 1e-3f, __LINE__);
+    ValidateACES2SIMD(OCIO::FixedFunctionOpData::ACES_OUTPUT_TRANSFORM_20_FWD,
+                      hdrParams, sceneImage, 1e-3f, __LINE__);
+
+    ValidateACES2SIMD(OCIO::FixedFunctionOpData::ACES_OUTPUT_TRANSFORM_20_INV,
+                      sdrParams, createDisplayImage(1.f), 2e-3f, __LINE__);
+    ValidateACES2SIMD(OCIO::FixedFunctionOpData::ACES_OUTPUT_TRANSFORM_20_INV,
+                      hdrParams, createDisplayImage(10.f), 2e-3f, __LINE__);
+
+    // ACES AP0
+    const OCIO::FixedFunctionOpData::Params ap0Params = {
+        0.7347, 0.2653, 0.0000, 1.0000, 0.0001, -0.0770, 0.32168, 0.33767
+    };
+
+    ValidateACES2SIMD(OCIO::FixedFunctionOpData::ACES_RGB_TO_JMh_20,
+                      ap0Params, sceneImage, 5e-4f, __LINE__);
+    ValidateACES2SIMD(OCIO::FixedFunctionOpData::ACES_JMh_TO_RGB_20,
+                      ap0Params, jmhImage, 5e-4f, __LINE__);
+
+    const OCIO::FixedFunctionOpData::Params tsParams = { 1000.f };
+
+    ValidateACES2SIMD(OCIO::FixedFunctionOpData::ACES_TONESCALE_COMPRESS_20_FWD,
+                      tsParams, jmhImage, 1e-4f, __LINE__);
+
+    // The inverse processes the forward results, as the random JMh values are often outside of
+    // its domain.
+    OCIO::ConstFixedFunctionOpDataRcPtr funcData
+        = std::make_shared<OCIO::FixedFunctionOpData>(OCIO::FixedFunctionOpData::ACES_TONESCALE_COMPRESS_20_FWD,
+                                                      tsParams);
+    OCIO::ConstOpCPURcPtr op;
+    OCIO_CHECK_NO_THROW(op = OCIO::GetFixedFunctionCPURenderer(funcData, false, false));
+    OCIO_CHECK_NO_THROW(op->apply(jmhImage.data(), jmhImage.data(), numPixels));
+
+    ValidateACES2SIMD(OCIO::FixedFunctionOpData::ACES_TONESCALE_COMPRESS_20_INV,
+                      tsParams, jmhImage, 1e-4f, __LINE__);
+
+    // The SIMD versions are used whatever the pixel count i.e. processing the pixels one by one
+    // gives the same results as processing the whole image.
+    funcData = std::make_shared<OCIO::FixedFunctionOpData>(OCIO::FixedFunctionOpData::ACES_OUTPUT_TRANSFORM_20_FWD,
+                                                           hdrParams);
+    OCIO_CHECK_NO_THROW(op = OCIO::GetFixedFunctionCPURenderer(funcData, false, true));
+
+    std::vector<float> image(sceneImage.size());
+    OCIO_CHECK_NO_THROW(op->apply(sceneImage.data(), image.data(), numPixels));
+
+    std::vector<float> pixel(4);
+    for (long idx = 0; idx < numPixels; ++idx)
+    {
+        op->apply(&sceneImage[4 * idx], pixel.data(), 1);
+        for (long c = 0; c < 4; ++c)
+        {
+            OCIO_CHECK_EQUAL(pixel[c], image[4 * idx + c]);
+        }
+    }
+}
+
 OCIO_ADD_TEST(FixedFunctionOpCPU, rec2100_surround)
 {
     const unsigned num_samples = 5;
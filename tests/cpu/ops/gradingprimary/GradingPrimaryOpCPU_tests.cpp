@@ -5,6 +5,7 @@
 #include "ops/gradingprimary/GradingPrimaryOpCPU.cpp"
 
 #include "testutils/UnitTest.h"
+#include "UnitTestUtils.h"
 #include "utils/StringUtils.h"
 
 namespace OCIO = OCIO_NAMESPACE;
@@ -405,3 +406,78 @@ OCIO_ADD_TEST(GradingPrimaryOpCPU, video)
     OCIO_CHECK_NO_THROW(op->apply(TS3::expected_wbpivot_32f, res, TS3::num_samples));
     ValidateImage(TS3::input_32f, res, TS3::num_samples, __LINE__);
 }
+
+namespace
+{
+// Compare the SSE2, AVX2 and AVX-512 versions (i.e. several pixels at once) with the default
+// renderer.
+void ValidateSIMD(OCIO::ConstGradingPrimaryOpDataRcPtr & gpd, unsigned line)
+{
+    // Not a multiple of the SIMD widths.
+    const std::vector<float> image = OCIO::CreateRampImage(37, -0.25f, 1.55f);
+
+    OCIO_CHECK_NO_THROW_FROM(OCIO::ValidateSIMDRenderers(
+        image,
+        [&gpd]() { return OCIO::GetGradingPrimaryCPURenderer(gpd); },
+        [line](const float * expected, const float * res, long numPixels)
+        {
+            ValidateImage(expected, res, numPixels, line);
+        }), line);
+}
+}
+
+OCIO_ADD_TEST(GradingPrimaryOpCPU, simd)
+{
+    for (const auto dir : { OCIO::TRANSFORM_DIR_FORWARD, OCIO::TRANSFORM_DIR_INVERSE })
+    {
+        auto gd = std::make_shared<OCIO::GradingPrimaryOpData>(TS1::style);
+        gd->setDirection(dir);
+        OCIO::ConstGradingPrimaryOpDataRcPtr gdc = gd;
+
+        OCIO::GradingPrimary gdp(TS1::style);
+        gdp.m_brightness = TS1::brightness;
+        gdp.m_contrast   = TS1::contrast;
+        gdp.m_gamma      = TS1::gamma;
+        gdp.m_pivot      = TS1::pivot;
+        gdp.m_saturation = TS1::saturation;
+        gdp.m_pivotBlack = TS1::pivotBlack;
+        gdp.m_pivotWhite = TS1::pivotWhite;
+        gd->setValue(gdp);
+        ValidateSIMD(gdc, __LINE__);
+
+        gdp.m_clampBlack = TS1::clampBlack;
+        gdp.m_clampWhite = TS1::clampWhite;
+        gd->setValue(gdp);
+        ValidateSIMD(gdc, __LINE__);
+
+        gd = std::make_shared<OCIO::GradingPrimaryOpData>(TS2::style);
+        gd->setDirection(dir);
+        gdc = gd;
+
+        gdp = OCIO::GradingPrimary(TS2::style);
+        gdp.m_exposure   = TS2::exposure;
+        gdp.m_offset     = TS2::offset;
+        gdp.m_contrast   = TS2::contrast;
+        gdp.m_pivot      = TS2::pivot;
+        gdp.m_saturation = TS2::saturation;
+        gdp.m_clampBlack = TS2::clampBlack;
+        gdp.m_clampWhite = TS2::clampWhite;
+        gd->setValue(gdp);
+        ValidateSIMD(gdc, __LINE__);
+
+        gd = std::make_shared<OCIO::GradingPrimaryOpData>(TS3::style);
+        gd->setDirection(dir);
+        gdc = gd;
+
+        gdp = OCIO::GradingPrimary(TS3::style);
+        gdp.m_lift       = TS3::lift;
+        gdp.m_gamma      = TS3::gamma;
+        gdp.m_gain       = TS3::gain;
+        gdp.m_offset     = TS3::offset;
+        gdp.m_saturation = TS3::saturation;
+        gdp.m_pivotBlack = TS3::pivotBlack;
+        gdp.m_pivotWhite = TS3::pivotWhite;
+        gd->setValue(gdp);
+        ValidateSIMD(gdc, __LINE__);
+    }
+}
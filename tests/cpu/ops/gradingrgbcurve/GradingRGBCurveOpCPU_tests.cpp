@@ -5,6 +5,7 @@
 #include "ops/gradingrgbcurve/GradingRGBCurveOpCPU.cpp"
 
 #include "testutils/UnitTest.h"
+#include "UnitTestUtils.h"
 #include "utils/StringUtils.h"
 
 namespace OCIO = OCIO_NAMESPACE;
@@ -440,3 +441,93 @@ OCIO_ADD_TEST(GradingRGBCurveOpCPU, slopes)
     OCIO_CHECK_NO_THROW(op->apply(rev_input_32f, rev_input_32f, num_samples));
     ValidateImage(rev_expected_32f, rev_input_32f, num_samples, __LINE__);
 }
+
+namespace
+{
+// Compare the SSE2, AVX2 and AVX-512 versions (i.e. several pixels at once) with the default
+// renderer, using values in the [minValue, maxValue] range.
+void ValidateSIMD(OCIO::ConstGradingRGBCurveOpDataRcPtr & gcc,
+                  float minValue, float maxValue, unsigned line)
+{
+    // Not a multiple of the SIMD widths.
+    const std::vector<float> image = OCIO::CreateRampImage(37, minValue, maxValue);
+
+    OCIO_CHECK_NO_THROW_FROM(OCIO::ValidateSIMDRenderers(
+        image,
+        [&gcc]() { return OCIO::GetGradingRGBCurveCPURenderer(gcc); },
+        [line](const float * expected, const float * res, long numPixels)
+        {
+            // Note that the log to lin conversion uses a different exp2() approximation so the
+            // error is relative above one.
+            for (long idx = 0; idx < 4 * numPixels; ++idx)
+            {
+                const float error = 5e-4f * std::max(1.f, std::abs(expected[idx]));
+                OCIO_CHECK_CLOSE_FROM(expected[idx], res[idx], error, line);
+            }
+        }), line);
+}
+}
+
+OCIO_ADD_TEST(GradingRGBCurveOpCPU, simd)
+{
+    auto rnc = OCIO::GradingBSplineCurve::Create({ { 0.1f, 0.15f }, { 0.55f, 0.45f }, { 0.9f, 1.1f } });
+    auto gnc = OCIO::GradingBSplineCurve::Create({ { 0.1f, 0.15f }, { 0.55f, 0.35f }, { 0.9f, 1.1f } });
+    auto bnc = OCIO::GradingBSplineCurve::Create({ { 0.1f, 0.15f }, { 0.55f, 0.85f }, { 0.9f, 1.1f } });
+    auto mnc = OCIO::GradingBSplineCurve::Create({ { -0.1f, 0.1f }, { 1.1f, 1.3f } });
+
+    OCIO::ConstGradingBSplineCurveRcPtr r = rnc;
+    OCIO::ConstGradingBSplineCurveRcPtr g = gnc;
+    OCIO::ConstGradingBSplineCurveRcPtr b = bnc;
+    OCIO::ConstGradingBSplineCurveRcPtr m = mnc;
+    auto gc = std::make_shared<OCIO::GradingRGBCurveOpData>(OCIO::GRADING_LOG, r, g, b, m);
+    OCIO::ConstGradingRGBCurveOpDataRcPtr gcc = gc;
+
+    ValidateSIMD(gcc, -0.25f, 1.5f, __LINE__);
+    gc->setDirection(OCIO::TRANSFORM_DIR_INVERSE);
+    ValidateSIMD(gcc, -0.25f, 1.5f, __LINE__);
+
+    // Linear style.
+
+    auto lnc = OCIO::GradingBSplineCurve::Create({ { -6.f, -8.f }, { -2.f, -5.f },
+                                                   {  2.f,  4.f }, {  5.f,  6.f } });
+    auto lmnc = OCIO::GradingBSplineCurve::Create({ { 0.f, 0.f }, { 0.5f, 0.5f }, { 1.f, 1.f } });
+    OCIO::ConstGradingBSplineCurveRcPtr l = lnc;
+    OCIO::ConstGradingBSplineCurveRcPtr lm = lmnc;
+    gc = std::make_shared<OCIO::GradingRGBCurveOpData>(OCIO::GRADING_LIN, l, l, l, lm);
+    gcc = gc;
+
+    ValidateSIMD(gcc, -0.01f, 3.f, __LINE__);
+    gc->setDirection(OCIO::TRANSFORM_DIR_INVERSE);
+    ValidateSIMD(gcc, -0.01f, 3.f, __LINE__);
+
+    gc->setBypassLinToLog(true);
+    ValidateSIMD(gcc, -7.f, 7.f, __LINE__);
+    gc->setDirection(OCIO::TRANSFORM_DIR_FORWARD);
+    ValidateSIMD(gcc, -7.f, 7.f, __LINE__);
+
+    // Flat extrapolations.
+
+    auto curve = OCIO::GradingBSplineCurve::Create({
+            {-5.26017743f, -4.f},
+            {-3.75502745f, -3.57868829f},
+            {-2.24987747f, -1.82131329f},
+            {-0.74472749f,  0.68124124f},
+            { 1.06145248f,  2.87457742f},
+            { 2.86763245f,  3.83406206f},
+            { 4.67381243f,  4.f}
+        });
+    float slopes[] = { 0.f,  0.55982688f,  1.77532247f,  1.55f,  0.8787017f,  0.18374463f,  0.f };
+    for (size_t i = 0; i < 7; ++i)
+    {
+        curve->setSlope( i, slopes[i] );
+    }
+    OCIO::ConstGradingBSplineCurveRcPtr s = curve;
+    auto identity = OCIO::GradingBSplineCurve::Create({ { 0.f, 0.f }, { 1.f, 1.f } });
+    OCIO::ConstGradingBSplineCurveRcPtr z = identity;
+    gc = std::make_shared<OCIO::GradingRGBCurveOpData>(OCIO::GRADING_LOG, s, z, s, s);
+    gcc = gc;
+
+    ValidateSIMD(gcc, -7.f, 7.f, __LINE__);
+    gc->setDirection(OCIO::TRANSFORM_DIR_INVERSE);
+    ValidateSIMD(gcc, -3.9f, 3.9f, __LINE__);
+}
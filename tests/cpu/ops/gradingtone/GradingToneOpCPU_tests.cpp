@@ -6,6 +6,7 @@
 #include "ops/gradingtone/GradingToneOpCPU.cpp"
 
 #include "testutils/UnitTest.h"
+#include "UnitTestUtils.h"
 #include "utils/StringUtils.h"
 
 namespace OCIO = OCIO_NAMESPACE;
@@ -503,3 +504,71 @@ OCIO_ADD_TEST(GradingToneOpCPU, lin_midtones)
     OCIO_CHECK_NO_THROW(op->apply(TS7::expected_32f, res, TS7::num_samples));
     ValidateImage(TS7::input_32f, res, TS7::num_samples, __LINE__);
 }
+
+namespace
+{
+// Compare the SSE2, AVX2 and AVX-512 versions (i.e. several pixels at once) with the default
+// renderer, in both directions.
+void ValidateSIMD(OCIO::GradingStyle style, const OCIO::GradingTone & gtd, unsigned line)
+{
+    // Not a multiple of the SIMD widths.
+    const std::vector<float> image = OCIO::CreateRampImage(37, -0.25f, 1.55f);
+
+    for (const auto dir : { OCIO::TRANSFORM_DIR_FORWARD, OCIO::TRANSFORM_DIR_INVERSE })
+    {
+        auto gt = std::make_shared<OCIO::GradingToneOpData>(style);
+        gt->setDirection(dir);
+        gt->setValue(gtd);
+        OCIO::ConstGradingToneOpDataRcPtr gtc = gt;
+
+        OCIO_CHECK_NO_THROW_FROM(OCIO::ValidateSIMDRenderers(
+            image,
+            [&gtc]() { return OCIO::GetGradingToneCPURenderer(gtc); },
+            [line](const float * expected, const float * res, long numPixels)
+            {
+                ValidateImage(expected, res, numPixels, line);
+            }), line);
+    }
+}
+}
+
+OCIO_ADD_TEST(GradingToneOpCPU, simd)
+{
+    OCIO::GradingTone gtd(OCIO::GRADING_LOG);
+    gtd.m_midtones = TS1::midtones;
+    ValidateSIMD(OCIO::GRADING_LOG, gtd, __LINE__);
+
+    gtd = OCIO::GradingTone(OCIO::GRADING_LOG);
+    gtd.m_highlights = TS2::highlights;
+    ValidateSIMD(OCIO::GRADING_LOG, gtd, __LINE__);
+
+    gtd = OCIO::GradingTone(OCIO::GRADING_VIDEO);
+    gtd.m_shadows = TS3::shadows;
+    ValidateSIMD(OCIO::GRADING_VIDEO, gtd, __LINE__);
+
+    gtd = OCIO::GradingTone(OCIO::GRADING_VIDEO);
+    gtd.m_whites = TS4::whiteDetail;
+    ValidateSIMD(OCIO::GRADING_VIDEO, gtd, __LINE__);
+
+    gtd = OCIO::GradingTone(OCIO::GRADING_LOG);
+    gtd.m_blacks = TS5::blackDetail;
+    ValidateSIMD(OCIO::GRADING_LOG, gtd, __LINE__);
+
+    gtd = OCIO::GradingTone(OCIO::GRADING_LOG);
+    gtd.m_scontrast = TS6::scontrast;
+    ValidateSIMD(OCIO::GRADING_LOG, gtd, __LINE__);
+    gtd.m_scontrast = TS6::scontrast2;
+    ValidateSIMD(OCIO::GRADING_LOG, gtd, __LINE__);
+
+    gtd = OCIO::GradingTone(OCIO::GRADING_LIN);
+    gtd.m_midtones = TS7::midtones;
+    ValidateSIMD(OCIO::GRADING_LIN, gtd, __LINE__);
+
+    // All the controls at once.
+    gtd = OCIO::GradingTone(OCIO::GRADING_LOG);
+    gtd.m_midtones   = TS1::midtones;
+    gtd.m_highlights = TS2::highlights;
+    gtd.m_blacks     = TS5::blackDetail;
+    gtd.m_scontrast  = TS6::scontrast;
+    ValidateSIMD(OCIO::GRADING_LOG, gtd, __LINE__);
+}
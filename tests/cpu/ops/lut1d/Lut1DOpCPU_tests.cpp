@@ -2,6 +2,8 @@
 // Copyright Contributors to the OpenColorIO Project.
 
 
+#include <random>
+
 #include "ops/lut1d/Lut1DOpCPU.cpp"
 
 #include "testutils/UnitTest.h"
@@ -208,6 +210,103 @@ OCIO_ADD_TEST(Lut1DRenderer, nan_half_test)
     OCIO_CHECK_ASSERT(OCIO::IsNan(pixels[15]));
 }
 
+namespace
+{
+void Lut1DCompactRendererTest(OCIO::Lut1DOpDataRcPtr & lut, float inMin, float inMax, unsigned line)
+{
+    std::mt19937 gen(0);
+    std::uniform_real_distribution<float> lutDist(-1.f, 3.f);
+
+    OCIO::Array::Values & values = lut->getArray().getValues();
+    for (auto & val : values)
+    {
+        val = lutDist(gen);
+    }
+
+    OCIO::ConstLut1DOpDataRcPtr lutConst = lut;
+    OCIO::ConstOpCPURcPtr renderer;
+    OCIO_CHECK_NO_THROW_FROM(renderer = OCIO::GetLut1DRenderer(lutConst,
+                                                               OCIO::BIT_DEPTH_F32,
+                                                               OCIO::BIT_DEPTH_F32), line);
+    OCIO::ConstOpCPURcPtr compactRenderer;
+    OCIO_CHECK_NO_THROW_FROM(compactRenderer = OCIO::GetLut1DCompactRenderer(lutConst), line);
+
+    // Use a pixel count which is not a multiple of the SIMD register sizes.
+    constexpr long numPixels = 1021;
+
+    const float qnan = std::numeric_limits<float>::quiet_NaN();
+    const float inf = std::numeric_limits<float>::infinity();
+
+    std::uniform_real_distribution<float> inDist(inMin, inMax);
+
+    std::vector<float> inImg(numPixels * 4);
+    for (auto & val : inImg)
+    {
+        val = inDist(gen);
+    }
+
+    const float special[] = { qnan, inf, -inf, 0.f, 1.f, 65519.f, -65519.f };
+    for (size_t idx = 0; idx < sizeof(special) / sizeof(float); ++idx)
+    {
+        inImg[idx * 4 + idx % 3] = special[idx];
+    }
+
+    std::vector<float> outImg(numPixels * 4);
+    std::vector<float> compactOutImg(numPixels * 4);
+
+    renderer->apply(inImg.data(), outImg.data(), numPixels);
+    compactRenderer->apply(inImg.data(), compactOutImg.data(), numPixels);
+
+    // The error is bounded by the largest half float rounding error of the LUT entries.
+    const float tol = 3.f * std::pow(2.f, -11.f) + 1e-5f;
+
+    for (long idx = 0; idx < numPixels * 4; ++idx)
+    {
+        if (idx % 4 == 3)
+        {
+            OCIO_CHECK_EQUAL_FROM(compactOutImg[idx], inImg[idx], line);
+        }
+        else
+        {
+            OCIO_CHECK_CLOSE_FROM(compactOutImg[idx], outImg[idx], tol, line);
+        }
+    }
+}
+}
+
+OCIO_ADD_TEST(Lut1DRenderer, compact)
+{
+    OCIO::Lut1DOpDataRcPtr lut = std::make_shared<OCIO::Lut1DOpData>(4096);
+    Lut1DCompactRendererTest(lut, -0.2f, 1.2f, __LINE__);
+}
+
+OCIO_ADD_TEST(Lut1DRenderer, compact_half)
+{
+    OCIO::Lut1DOpDataRcPtr lut = std::make_shared<OCIO::Lut1DOpData>(
+        OCIO::Lut1DOpData::LUT_INPUT_HALF_CODE, 65536, false);
+    Lut1DCompactRendererTest(lut, -100.f, 100.f, __LINE__);
+}
+
+OCIO_ADD_TEST(Lut1DRenderer, compact_not_supported)
+{
+    // The inverse direction and the hue adjustment use the regular renderers.
+    OCIO::Lut1DOpDataRcPtr lut = std::make_shared<OCIO::Lut1DOpData>(16);
+    lut->setDirection(OCIO::TRANSFORM_DIR_INVERSE);
+
+    OCIO::ConstLut1DOpDataRcPtr lutConst = lut;
+    OCIO::ConstOpCPURcPtr renderer = OCIO::GetLut1DCompactRenderer(lutConst);
+    OCIO_CHECK_ASSERT(!OCIO::DynamicPtrCast<const OCIO::Lut1DCompactRenderer>(renderer));
+
+    lut->setDirection(OCIO::TRANSFORM_DIR_FORWARD);
+    lut->setHueAdjust(OCIO::HUE_DW3);
+    renderer = OCIO::GetLut1DCompactRenderer(lutConst);
+    OCIO_CHECK_ASSERT(!OCIO::DynamicPtrCast<const OCIO::Lut1DCompactRenderer>(renderer));
+
+    lut->setHueAdjust(OCIO::HUE_NONE);
+    renderer = OCIO::GetLut1DCompactRenderer(lutConst);
+    OCIO_CHECK_ASSERT(OCIO::DynamicPtrCast<const OCIO::Lut1DCompactRenderer>(renderer));
+}
+
 namespace
 {
 OCIO::ConstLut1DOpDataRcPtr FastFromInverse(OCIO::Lut1DOpDataRcPtr & invLutData, unsigned line)
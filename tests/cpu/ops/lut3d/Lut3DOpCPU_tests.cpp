@@ -3,6 +3,7 @@
 
 
 #include <limits>
+#include <random>
 
 #include "ops/lut3d/Lut3DOpCPU.cpp"
 
@@ -11,7 +12,7 @@
 namespace OCIO = OCIO_NAMESPACE;
 
 
-void Lut3DRendererNaNTest(OCIO::Interpolation interpol)
+void Lut3DRendererNaNTest(OCIO::Interpolation interpol, bool compact)
 {
     OCIO::Lut3DOpDataRcPtr lut = std::make_shared<OCIO::Lut3DOpData>(interpol, 4);
 
@@ -20,7 +21,8 @@ void Lut3DRendererNaNTest(OCIO::Interpolation interpol)
     values[65] += 0.001f;
 
     OCIO::ConstLut3DOpDataRcPtr lutConst = lut;
-    OCIO::ConstOpCPURcPtr renderer = OCIO::GetLut3DRenderer(lutConst);
+    OCIO::ConstOpCPURcPtr renderer = compact ? OCIO::GetLut3DCompactRenderer(lutConst)
+                                             : OCIO::GetLut3DRenderer(lutConst);
 
     const float qnan = std::numeric_limits<float>::quiet_NaN();
     const float inf = std::numeric_limits<float>::infinity();
@@ -47,11 +49,100 @@ void Lut3DRendererNaNTest(OCIO::Interpolation interpol)
 
 OCIO_ADD_TEST(Lut3DRenderer, nan_linear_test)
 {
-    Lut3DRendererNaNTest(OCIO::INTERP_LINEAR);
+    Lut3DRendererNaNTest(OCIO::INTERP_LINEAR, false);
+    Lut3DRendererNaNTest(OCIO::INTERP_LINEAR, true);
 }
 
 OCIO_ADD_TEST(Lut3DRenderer, nan_tetra_test)
 {
-    Lut3DRendererNaNTest(OCIO::INTERP_TETRAHEDRAL);
+    Lut3DRendererNaNTest(OCIO::INTERP_TETRAHEDRAL, false);
+    Lut3DRendererNaNTest(OCIO::INTERP_TETRAHEDRAL, true);
+}
+
+namespace
+{
+
+void Lut3DCompactRendererTest(OCIO::Interpolation interpol, unsigned line)
+{
+    constexpr unsigned long dim = 33;
+    OCIO::Lut3DOpDataRcPtr lut = std::make_shared<OCIO::Lut3DOpData>(interpol, dim);
+
+    std::mt19937 gen(0);
+    std::uniform_real_distribution<float> lutDist(-1.f, 3.f);
+
+    OCIO::Array::Values & values = lut->getArray().getValues();
+    for (auto & val : values)
+    {
+        val = lutDist(gen);
+    }
+
+    OCIO::ConstLut3DOpDataRcPtr lutConst = lut;
+    OCIO::ConstOpCPURcPtr renderer = OCIO::GetLut3DRenderer(lutConst);
+    OCIO::ConstOpCPURcPtr compactRenderer = OCIO::GetLut3DCompactRenderer(lutConst);
+
+    // Use a pixel count which is not a multiple of the SIMD register sizes.
+    constexpr long numPixels = 1021;
+
+    const float qnan = std::numeric_limits<float>::quiet_NaN();
+    const float inf = std::numeric_limits<float>::infinity();
+
+    std::uniform_real_distribution<float> inDist(-0.2f, 1.2f);
+
+    std::vector<float> inImg(numPixels * 4);
+    for (auto & val : inImg)
+    {
+        val = inDist(gen);
+    }
+
+    const float special[] = { qnan, inf, -inf, 0.f, 1.f, 0.5f };
+    for (size_t idx = 0; idx < sizeof(special) / sizeof(float); ++idx)
+    {
+        inImg[idx * 4 + idx % 3] = special[idx];
+    }
+
+    std::vector<float> outImg(numPixels * 4);
+    std::vector<float> compactOutImg(numPixels * 4);
+
+    renderer->apply(inImg.data(), outImg.data(), numPixels);
+    compactRenderer->apply(inImg.data(), compactOutImg.data(), numPixels);
+
+    // The interpolation weights sum to 1 so the error is bounded by the largest half float
+    // rounding error of the LUT entries.
+    const float tol = 3.f * std::pow(2.f, -11.f) + 1e-5f;
+
+    for (long idx = 0; idx < numPixels * 4; ++idx)
+    {
+        if (idx % 4 == 3)
+        {
+            OCIO_CHECK_EQUAL_FROM(compactOutImg[idx], inImg[idx], line);
+        }
+        else
+        {
+            OCIO_CHECK_CLOSE_FROM(compactOutImg[idx], outImg[idx], tol, line);
+        }
+    }
+}
+
+} // anon.
+
+OCIO_ADD_TEST(Lut3DRenderer, compact_tetra_test)
+{
+    Lut3DCompactRendererTest(OCIO::INTERP_TETRAHEDRAL, __LINE__);
+}
+
+OCIO_ADD_TEST(Lut3DRenderer, compact_linear_test)
+{
+    Lut3DCompactRendererTest(OCIO::INTERP_LINEAR, __LINE__);
+}
+
+OCIO_ADD_TEST(Lut3DRenderer, compact_inverse)
+{
+    // The inverse direction does not use a compact renderer.
+    OCIO::Lut3DOpDataRcPtr lut = std::make_shared<OCIO::Lut3DOpData>(OCIO::INTERP_LINEAR, 4);
+    lut->setDirection(OCIO::TRANSFORM_DIR_INVERSE);
+
+    OCIO::ConstLut3DOpDataRcPtr lutConst = lut;
+    OCIO::ConstOpCPURcPtr renderer = OCIO::GetLut3DCompactRenderer(lutConst);
+    OCIO_CHECK_ASSERT(OCIO::DynamicPtrCast<const OCIO::InvLut3DRenderer>(renderer));
 }
 
@@ -312,6 +312,87 @@ OCIO_ADD_TEST(Lut3DOpData, inv_lut3d_lut_size)
     OCIO_CHECK_EQUAL(invFastLutData->getArray().getLength(), 48);
 }
 
+OCIO_ADD_TEST(Lut3DOpData, inv_lut3d_grid_size)
+{
+    OCIO_CHECK_EQUAL(OCIO::GetFastInverseLut3DGridSize(), 48);
+
+    OCIO_CHECK_THROW_WHAT(OCIO::SetFastInverseLut3DGridSize(1), OCIO::Exception,
+                          "must be in the range [2, 129]");
+    OCIO_CHECK_THROW_WHAT(OCIO::SetFastInverseLut3DGridSize(130), OCIO::Exception,
+                          "must be in the range [2, 129]");
+    OCIO_CHECK_EQUAL(OCIO::GetFastInverseLut3DGridSize(), 48);
+
+    OCIO::Lut3DOpDataRcPtr lut = std::make_shared<OCIO::Lut3DOpData>(17);
+    for (auto & val : lut->getArray().getValues())
+    {
+        val *= val;
+    }
+    lut->setDirection(OCIO::TRANSFORM_DIR_INVERSE);
+    OCIO::ConstLut3DOpDataRcPtr invLut = lut;
+
+    OCIO_CHECK_NO_THROW(OCIO::SetFastInverseLut3DGridSize(33));
+    OCIO_CHECK_EQUAL(OCIO::GetFastInverseLut3DGridSize(), 33);
+    OCIO_CHECK_EQUAL(OCIO::MakeFastLut3DFromInverse(invLut)->getArray().getLength(), 33);
+
+    // The grid size of the forward LUT is used if larger.
+    OCIO_CHECK_NO_THROW(OCIO::SetFastInverseLut3DGridSize(9));
+    OCIO_CHECK_EQUAL(OCIO::MakeFastLut3DFromInverse(invLut)->getArray().getLength(), 17);
+
+    OCIO_CHECK_NO_THROW(OCIO::SetFastInverseLut3DGridSize(48));
+}
+
+OCIO_ADD_TEST(Lut3DOpData, inv_lut3d_cache)
+{
+    OCIO::ClearFastInverseLut3DCache();
+
+    OCIO::Lut3DOpDataRcPtr lut = std::make_shared<OCIO::Lut3DOpData>(17);
+    for (auto & val : lut->getArray().getValues())
+    {
+        val = std::pow(val, 2.2f);
+    }
+    lut->setDirection(OCIO::TRANSFORM_DIR_INVERSE);
+    lut->setFileOutputBitDepth(OCIO::BIT_DEPTH_UINT10);
+    lut->getFormatMetadata().addAttribute(OCIO::METADATA_NAME, "inverse");
+    OCIO::ConstLut3DOpDataRcPtr invLut = lut;
+
+    // The baked LUT is the composition of an identity LUT with the inverse LUT.
+    OCIO::ConstLut3DOpDataRcPtr domain = std::make_shared<OCIO::Lut3DOpData>(48);
+    OCIO::Lut3DOpDataRcPtr ref = OCIO::Lut3DOpData::Compose(domain, invLut);
+
+    OCIO::Lut3DOpDataRcPtr fastLut1 = OCIO::MakeFastLut3DFromInverse(invLut);
+    OCIO_CHECK_EQUAL(fastLut1->getDirection(), OCIO::TRANSFORM_DIR_FORWARD);
+    OCIO_CHECK_EQUAL(fastLut1->getFileOutputBitDepth(), OCIO::BIT_DEPTH_UINT10);
+    OCIO_CHECK_EQUAL(std::string(fastLut1->getFormatMetadata().getAttributeValue(OCIO::METADATA_NAME)),
+                     "inverse");
+    OCIO_CHECK_ASSERT(fastLut1->getArray().getValues() == ref->getArray().getValues());
+
+    // The returned LUTs are copies of the cached one.
+    fastLut1->getArray().getValues()[3] = 0.5f;
+
+    OCIO::Lut3DOpDataRcPtr fastLut2 = OCIO::MakeFastLut3DFromInverse(invLut);
+    OCIO_CHECK_NE(fastLut1.get(), fastLut2.get());
+    OCIO_CHECK_ASSERT(fastLut2->getArray().getValues() == ref->getArray().getValues());
+
+    // The metadata & bit-depth are the ones of the inverse LUT even when the values are cached.
+    OCIO::Lut3DOpDataRcPtr lut2 = lut->clone();
+    lut2->setFileOutputBitDepth(OCIO::BIT_DEPTH_UINT12);
+    OCIO::ConstLut3DOpDataRcPtr invLut2 = lut2;
+
+    OCIO::Lut3DOpDataRcPtr fastLut3 = OCIO::MakeFastLut3DFromInverse(invLut2);
+    OCIO_CHECK_EQUAL(fastLut3->getFileOutputBitDepth(), OCIO::BIT_DEPTH_UINT12);
+    OCIO_CHECK_ASSERT(fastLut3->getArray().getValues() == ref->getArray().getValues());
+
+    // A different LUT is not using the cached values.
+    lut2->getArray().getValues()[3 * 17 * 17 * 17 - 1] = 0.9f;
+    OCIO::Lut3DOpDataRcPtr fastLut4 = OCIO::MakeFastLut3DFromInverse(invLut2);
+    OCIO_CHECK_ASSERT(fastLut4->getArray().getValues() != ref->getArray().getValues());
+
+    OCIO::ClearFastInverseLut3DCache();
+
+    OCIO::Lut3DOpDataRcPtr fastLut5 = OCIO::MakeFastLut3DFromInverse(invLut);
+    OCIO_CHECK_ASSERT(fastLut5->getArray().getValues() == ref->getArray().getValues());
+}
+
 OCIO_ADD_TEST(Lut3DOpData, compose_inverse_luts)
 {
     OCIO::ConstLut3DOpDataRcPtr lutRef = std::make_shared<OCIO::Lut3DOpData>(5);
@@ -3,6 +3,7 @@
 
 
 #include <algorithm>
+#include <fstream>
 
 #include "transforms/FileTransform.cpp"
 
@@ -569,3 +570,150 @@ OCIO_ADD_TEST(FileTransform, cc_file_with_different_file_extension)
         OCIO_CHECK_NO_THROW(cfg->getProcessor(tr2));
     }
 }
+
+OCIO_ADD_TEST(FileTransform, file_cache_capacity)
+{
+    OCIO::ClearAllCaches();
+    OCIO_CHECK_EQUAL(OCIO::GetFileCacheCapacity(), 0);
+
+    OCIO::SetFileCacheCapacity(2);
+    OCIO_CHECK_EQUAL(OCIO::GetFileCacheCapacity(), 2);
+
+    const OCIO::CacheStatistics initial = OCIO::GetFileCacheStatistics();
+
+    OCIO_CHECK_NO_THROW(OCIO::GetFileTransformProcessor("lut1d_1.spi1d"));
+    OCIO_CHECK_NO_THROW(OCIO::GetFileTransformProcessor("lut1d_2.spi1d"));
+    OCIO_CHECK_NO_THROW(OCIO::GetFileTransformProcessor("lut1d_3.spi1d"));
+
+    OCIO::CacheStatistics stats = OCIO::GetFileCacheStatistics();
+    OCIO_CHECK_EQUAL(stats.m_size, 2);
+    OCIO_CHECK_EQUAL(stats.m_capacity, 2);
+    OCIO_CHECK_EQUAL(stats.m_misses - initial.m_misses, 3);
+    OCIO_CHECK_EQUAL(stats.m_evictions - initial.m_evictions, 1);
+
+    // The most recently used file is still in the cache.
+    OCIO_CHECK_NO_THROW(OCIO::GetFileTransformProcessor("lut1d_3.spi1d"));
+    OCIO::CacheStatistics other = OCIO::GetFileCacheStatistics();
+    OCIO_CHECK_EQUAL(other.m_misses, stats.m_misses);
+    OCIO_CHECK_ASSERT(other.m_hits > stats.m_hits);
+
+    // The least recently used file was evicted.
+    OCIO_CHECK_NO_THROW(OCIO::GetFileTransformProcessor("lut1d_1.spi1d"));
+    stats = OCIO::GetFileCacheStatistics();
+    OCIO_CHECK_EQUAL(stats.m_misses - other.m_misses, 1);
+    OCIO_CHECK_EQUAL(stats.m_evictions - other.m_evictions, 1);
+    OCIO_CHECK_EQUAL(stats.m_size, 2);
+
+    std::ostringstream oss;
+    oss << stats;
+    OCIO_CHECK_NE(oss.str().find("capacity=2"), std::string::npos);
+
+    OCIO::SetFileCacheCapacity(0);
+    OCIO::ClearAllCaches();
+}
+
+namespace
+{
+
+void WriteLut1D(const std::string & filename, const std::string & maxValue)
+{
+    std::ofstream stream(filename);
+    stream << "Version 1\n"
+           << "From 0.0 1.0\n"
+           << "Length 2\n"
+           << "Components 1\n"
+           << "{\n"
+           << "    0.0\n"
+           << "    " << maxValue << "\n"
+           << "}\n";
+}
+
+float ApplyLut1D(const OCIO::ConstProcessorRcPtr & proc)
+{
+    float pixel[3]{ 1.0f, 1.0f, 1.0f };
+    proc->getDefaultCPUProcessor()->applyRGB(pixel);
+    return pixel[0];
+}
+
+} // anon.
+
+OCIO_ADD_TEST(FileTransform, file_cache_validation)
+{
+    const std::string filename1 = OCIO::Platform::CreateTempFilename(".spi1d");
+    const std::string filename2 = OCIO::Platform::CreateTempFilename(".spi1d");
+
+    // Different LUTs, so the processor cache does not share a processor between the two files.
+    WriteLut1D(filename1, "0.5");
+    WriteLut1D(filename2, "0.75");
+
+    OCIO::ClearAllCaches();
+    OCIO_CHECK_EQUAL(OCIO::GetFileCacheValidationInterval(), -1);
+
+    OCIO::ConfigRcPtr config = OCIO::Config::CreateRaw()->createEditableCopy();
+
+    auto file1 = OCIO::FileTransform::Create();
+    file1->setSrc(filename1.c_str());
+    auto file2 = OCIO::FileTransform::Create();
+    file2->setSrc(filename2.c_str());
+
+    OCIO::ConstProcessorRcPtr proc1 = config->getProcessor(file1);
+    OCIO::ConstProcessorRcPtr proc2 = config->getProcessor(file2);
+    OCIO_CHECK_EQUAL(ApplyLut1D(proc1), 0.5f);
+
+    // By default, the modified files are not detected.
+
+    WriteLut1D(filename1, "0.25");
+    OCIO_CHECK_EQUAL(config->getProcessor(file1), proc1);
+
+    const size_t invalidations = OCIO::GetFileCacheStatistics().m_invalidations;
+
+    // Check the files on each access.
+    OCIO::SetFileCacheValidationInterval(0);
+    OCIO_CHECK_EQUAL(OCIO::GetFileCacheValidationInterval(), 0);
+
+    // Only the processor using the modified file is rebuilt.
+    OCIO::ConstProcessorRcPtr proc = config->getProcessor(file1);
+    OCIO_CHECK_NE(proc, proc1);
+    OCIO_CHECK_EQUAL(ApplyLut1D(proc), 0.25f);
+    OCIO_CHECK_EQUAL(config->getProcessor(file2), proc2);
+    OCIO_CHECK_EQUAL(OCIO::GetFileCacheStatistics().m_invalidations - invalidations, 1);
+
+    // The processor is reused while the file is unchanged.
+    proc1 = proc;
+    OCIO_CHECK_EQUAL(config->getProcessor(file1), proc1);
+
+    // A large interval delays the check.
+    OCIO::SetFileCacheValidationInterval(3600 * 1000);
+    WriteLut1D(filename1, "0.125");
+    OCIO_CHECK_EQUAL(config->getProcessor(file1), proc1);
+
+    // The file is reloaded by a new config instance too.
+    OCIO::SetFileCacheValidationInterval(0);
+    OCIO::ConfigRcPtr other = OCIO::Config::CreateRaw()->createEditableCopy();
+    OCIO_CHECK_EQUAL(ApplyLut1D(other->getProcessor(file1)), 0.125f);
+    OCIO_CHECK_EQUAL(ApplyLut1D(config->getProcessor(file1)), 0.125f);
+    OCIO_CHECK_EQUAL(OCIO::GetFileCacheStatistics().m_invalidations - invalidations, 2);
+
+    // A processor using a file evicted from the cache is only rebuilt if the file was modified.
+    OCIO::SetFileCacheCapacity(1);
+    proc1 = config->getProcessor(file1);
+    OCIO_CHECK_NO_THROW(other->getProcessor(file2));
+    OCIO_CHECK_EQUAL(OCIO::GetFileCacheStatistics().m_size, 1);
+
+    const size_t misses = OCIO::GetFileCacheStatistics().m_misses;
+    OCIO_CHECK_EQUAL(config->getProcessor(file1), proc1);
+    OCIO_CHECK_EQUAL(OCIO::GetFileCacheStatistics().m_misses, misses);
+
+    WriteLut1D(filename1, "0.0625");
+    proc = config->getProcessor(file1);
+    OCIO_CHECK_NE(proc, proc1);
+    OCIO_CHECK_EQUAL(ApplyLut1D(proc), 0.0625f);
+    OCIO_CHECK_GT(OCIO::GetFileCacheStatistics().m_misses, misses);
+
+    OCIO::SetFileCacheCapacity(0);
+    OCIO::SetFileCacheValidationInterval(-1);
+    OCIO::ClearAllCaches();
+
+    std::remove(filename1.c_str());
+    std::remove(filename2.c_str());
+}
@@ -292,6 +292,92 @@ class CPUProcessorTest(unittest.TestCase):
             [2.0, 2.0, 2.0]
         )
 
+    def test_dynamic_property_values(self):
+        tr = OCIO.ExposureContrastTransform(
+            style=OCIO.EXPOSURE_CONTRAST_LINEAR,
+            dynamicExposure=True
+        )
+
+        proc = self.config.getProcessor(tr)
+        cpu_proc = proc.getDefaultCPUProcessor()
+
+        # The cached processors share their dynamic properties.
+        dyn_prop = cpu_proc.getDynamicProperty(OCIO.DYNAMIC_PROPERTY_EXPOSURE)
+        dyn_prop.setDouble(0.0)
+
+        values = OCIO.DynamicPropertyValues()
+        self.assertFalse(values.hasValue(OCIO.DYNAMIC_PROPERTY_EXPOSURE))
+        with self.assertRaises(OCIO.Exception):
+            values.getDouble(OCIO.DYNAMIC_PROPERTY_EXPOSURE)
+        with self.assertRaises(OCIO.Exception):
+            values.setDouble(OCIO.DYNAMIC_PROPERTY_GRADING_TONE, 1.0)
+
+        # The values only apply to that call, the CPU processor is unchanged
+        values.setDouble(OCIO.DYNAMIC_PROPERTY_EXPOSURE, 1.0)
+        self.assertTrue(values.hasValue(OCIO.DYNAMIC_PROPERTY_EXPOSURE))
+        self.assertEqual(values.getDouble(OCIO.DYNAMIC_PROPERTY_EXPOSURE), 1.0)
+
+        self.assertEqual(
+            cpu_proc.applyRGB([1.0, 1.0, 1.0], values=values),
+            [2.0, 2.0, 2.0]
+        )
+        self.assertEqual(
+            cpu_proc.applyRGBA([1.0, 1.0, 1.0, 1.0], values),
+            [2.0, 2.0, 2.0, 1.0]
+        )
+        self.assertEqual(
+            cpu_proc.applyRGB([1.0, 1.0, 1.0]),
+            [1.0, 1.0, 1.0]
+        )
+
+        self.assertEqual(dyn_prop.getDouble(), 0.0)
+
+        # Without any value of a type used by the CPU processor
+        values.removeValue(OCIO.DYNAMIC_PROPERTY_EXPOSURE)
+        values.setDouble(OCIO.DYNAMIC_PROPERTY_GAMMA, 2.0)
+        self.assertEqual(
+            cpu_proc.applyRGB([1.0, 1.0, 1.0], values=values),
+            [1.0, 1.0, 1.0]
+        )
+
+        values.clear()
+        self.assertFalse(values.hasValue(OCIO.DYNAMIC_PROPERTY_GAMMA))
+
+        if not np:
+            logger.warning("NumPy not found. Skipping part of test!")
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Concurrent requests using different exposure values
+        def process(exposure):
+            req_values = OCIO.DynamicPropertyValues()
+            req_values.setDouble(OCIO.DYNAMIC_PROPERTY_EXPOSURE, exposure)
+
+            arr = np.ones(16*16*4, dtype=np.float32)
+            cpu_proc.applyRGBA(arr, values=req_values)
+            return arr
+
+        exposures = [0.0, 1.0, 2.0, 3.0, -1.0, 0.5]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(process, exposures))
+
+        for exposure, arr in zip(exposures, results):
+            rgba = arr.reshape(-1, 4)
+            np.testing.assert_allclose(rgba[:, :3], 2.0 ** exposure, rtol=1e-6)
+            np.testing.assert_array_equal(rgba[:, 3], 1.0)
+
+        # The points and ImageDesc overloads
+        values.setDouble(OCIO.DYNAMIC_PROPERTY_EXPOSURE, 1.0)
+
+        arr = np.ones((10, 3), dtype=np.float32)
+        cpu_proc.applyRGBPoints(arr, values)
+        np.testing.assert_allclose(arr, 2.0, rtol=1e-6)
+
+        image = OCIO.PackedImageDesc(np.ones(4*3*4, dtype=np.float32), 4, 3, 4)
+        cpu_proc.apply(image, numThreads=2, values=values)
+        np.testing.assert_allclose(image.getData().reshape(-1, 4)[:, :3], 2.0, rtol=1e-6)
+
     def test_apply(self):
         if not np:
             logger.warning("NumPy not found. Skipping test!")
@@ -627,3 +713,239 @@ class CPUProcessorTest(unittest.TestCase):
                         arr.flat[i],
                         delta=self.UINT_DELTA
                     )
+
+    def test_apply_strided_buffer(self):
+        if not np:
+            logger.warning("NumPy not found. Skipping test!")
+            return
+
+        log_tr = OCIO.LogTransform(base=10)
+        cpu_proc = self.config.getProcessor(log_tr).getDefaultCPUProcessor()
+
+        rgba = np.linspace(0.01, 4.0, num=16*8*4).astype(np.float32).reshape(16, 8, 4)
+
+        # RGB channels of an RGBA image are processed in place, alpha is unchanged
+        ref = np.ascontiguousarray(rgba[..., :3])
+        cpu_proc.applyRGB(ref)
+
+        arr = rgba.copy()
+        cpu_proc.applyRGB(arr[..., :3])
+        np.testing.assert_array_equal(arr[..., :3], ref)
+        np.testing.assert_array_equal(arr[..., 3], rgba[..., 3])
+
+        rgb = np.ascontiguousarray(rgba[..., :3])
+        for num_threads in [1, 4]:
+            for view in [
+                # Fortran ordered array
+                np.asfortranarray(rgb),
+                # Transposed rows and columns
+                rgb.copy().transpose(1, 0, 2),
+                # Every other row
+                rgb.copy()[::2],
+                # Reversed columns
+                rgb.copy()[:, ::-1],
+            ]:
+                expected = np.ascontiguousarray(view)
+                cpu_proc.applyRGB(expected)
+
+                cpu_proc.applyRGB(view, num_threads)
+                np.testing.assert_array_equal(view, expected)
+
+        # Strided RGBA array
+        arr = rgba.copy()
+        view = arr[::2, ::3]
+        expected = np.ascontiguousarray(view)
+        cpu_proc.applyRGBA(expected)
+
+        cpu_proc.applyRGBA(view)
+        np.testing.assert_array_equal(view, expected)
+        np.testing.assert_array_equal(arr[1::2], rgba[1::2])
+
+        # The last dimension of a strided array must hold the channels
+        with self.assertRaises(RuntimeError):
+            cpu_proc.applyRGB(np.zeros((8, 8), dtype=np.float32)[:, :6])
+
+        # Strides which cannot be mapped to rows of pixels
+        with self.assertRaises(RuntimeError):
+            cpu_proc.applyRGB(np.zeros((4, 4, 4, 3), dtype=np.float32)[::2, ::2, ::2])
+
+    def test_apply_src_dst_buffer(self):
+        if not np:
+            logger.warning("NumPy not found. Skipping test!")
+            return
+
+        for src, num_channels in [
+            (self.float_rgb_3d, 3),
+            (self.float_rgba_3d, 4),
+        ]:
+            apply_func = (
+                self.default_cpu_proc_fwd.applyRGB if num_channels == 3 
+                else self.default_cpu_proc_fwd.applyRGBA
+            )
+
+            expected = src.copy()
+            apply_func(expected)
+
+            # Source values are unchanged
+            src_copy = src.copy()
+            dst = np.zeros_like(src)
+            apply_func(src_copy, dst)
+            np.testing.assert_array_equal(src_copy, src)
+            np.testing.assert_array_equal(dst, expected)
+
+            # Any contiguous shape of the same size
+            dst = np.zeros(src.size, dtype=src.dtype)
+            apply_func(srcData=src_copy, dstData=dst, numThreads=2)
+            np.testing.assert_array_equal(dst, expected.flatten())
+
+            # Strided source and destination
+            src_padded = np.zeros((7, 3, 6), dtype=src.dtype)
+            src_padded[..., :num_channels] = src
+            dst = np.zeros((7, 3, 5), dtype=src.dtype)
+            apply_func(src_padded[..., :num_channels], dst[..., :num_channels])
+            np.testing.assert_array_equal(dst[..., :num_channels], expected)
+            np.testing.assert_array_equal(dst[..., num_channels:], 0)
+
+            # Incompatible sizes
+            with self.assertRaises(RuntimeError):
+                apply_func(src, np.zeros(src.size + num_channels, dtype=src.dtype))
+            with self.assertRaises(RuntimeError):
+                apply_func(
+                    src, 
+                    np.zeros((3, 7, num_channels), dtype=src.dtype).transpose(1, 0, 2)[:, :2]
+                )
+
+        # Differing source and destination bit-depths
+        cpu_proc = self.proc_fwd.getOptimizedCPUProcessor(
+            OCIO.BIT_DEPTH_F32,
+            OCIO.BIT_DEPTH_UINT16,
+            OCIO.OPTIMIZATION_DEFAULT
+        )
+
+        src = np.linspace(0.0, 1.0, num=63).astype(np.float32).reshape(21, 3)
+        dst = np.zeros((21, 3), dtype=np.uint16)
+        cpu_proc.applyRGB(src, dst)
+
+        np.testing.assert_allclose(
+            dst, 
+            src * 0.5 * (2**16-1), 
+            atol=self.UINT_DELTA
+        )
+
+    def test_apply_multi_threaded(self):
+        if not np:
+            logger.warning("NumPy not found. Skipping test!")
+            return
+
+        log_tr = OCIO.LogTransform(base=10)
+        cpu_proc = self.config.getProcessor(log_tr).getDefaultCPUProcessor()
+
+        rgba = np.linspace(0.01, 4.0, num=97*31*4).astype(np.float32)
+        ref = rgba.copy()
+        cpu_proc.applyRGBA(ref)
+
+        for num_threads in (0, 1, 2, 5, 16):
+            # Buffer overloads (split along the columns of a single row)
+            arr = rgba.copy()
+            cpu_proc.applyRGBA(arr, numThreads=num_threads)
+            np.testing.assert_array_equal(arr, ref)
+
+            arr = rgba[:97*31*3].copy()
+            ref_rgb = arr.copy()
+            cpu_proc.applyRGB(ref_rgb)
+            cpu_proc.applyRGB(arr, num_threads)
+            np.testing.assert_array_equal(arr, ref_rgb)
+
+            # ImageDesc overloads (split along the lines)
+            arr = rgba.copy()
+            image = OCIO.PackedImageDesc(arr, 97, 31, 4)
+            cpu_proc.apply(image, numThreads=num_threads)
+            np.testing.assert_array_equal(image.getData(), ref)
+
+            src_image = OCIO.PackedImageDesc(rgba.copy(), 97, 31, 4)
+            dst_image = OCIO.PackedImageDesc(np.zeros_like(rgba), 97, 31, 4)
+            cpu_proc.apply(src_image, dst_image, num_threads)
+            np.testing.assert_array_equal(dst_image.getData(), ref)
+
+    def test_scratch_buffer_pool(self):
+        if not np:
+            logger.warning("NumPy not found. Skipping test!")
+            return
+
+        log_tr = OCIO.LogTransform(base=10)
+        cpu_proc = self.config.getProcessor(log_tr).getOptimizedCPUProcessor(
+            OCIO.BIT_DEPTH_UINT8,
+            OCIO.BIT_DEPTH_UINT8,
+            OCIO.OPTIMIZATION_DEFAULT
+        )
+
+        self.assertEqual(cpu_proc.getScratchBufferPoolHits(), 0)
+        self.assertEqual(cpu_proc.getScratchBufferPoolMisses(), 0)
+
+        # Repeated small applies re-use the intermediate buffers
+        for i in range(10):
+            arr = np.arange(8*8*3, dtype=np.uint8)
+            cpu_proc.applyRGB(arr)
+
+        self.assertEqual(cpu_proc.getScratchBufferPoolMisses(), 3)
+        self.assertEqual(cpu_proc.getScratchBufferPoolHits(), 27)
+
+    def test_chunk_size(self):
+        if not np:
+            logger.warning("NumPy not found. Skipping test!")
+            return
+
+        self.assertEqual(OCIO.GetCPUProcessorChunkSize(), 0)
+
+        log_tr = OCIO.LogTransform(base=10)
+        cpu_proc = self.config.getProcessor(log_tr).getDefaultCPUProcessor()
+
+        rgba = np.linspace(0.01, 4.0, num=1000*4).astype(np.float32)
+        ref = rgba.copy()
+        cpu_proc.applyRGBA(ref)
+
+        try:
+            for chunk_size in (1, 64, 333, 4096):
+                OCIO.SetCPUProcessorChunkSize(chunk_size)
+                self.assertEqual(OCIO.GetCPUProcessorChunkSize(), chunk_size)
+
+                arr = rgba.copy()
+                cpu_proc.applyRGBA(arr)
+                np.testing.assert_array_equal(arr, ref)
+        finally:
+            OCIO.SetCPUProcessorChunkSize(0)
+
+    def test_apply_points(self):
+        if not np:
+            logger.warning("NumPy not found. Skipping test!")
+            return
+
+        log_tr = OCIO.LogTransform(base=10)
+        cpu_proc = self.config.getProcessor(log_tr).getDefaultCPUProcessor()
+
+        # Scattered RGB points as an (N, 3) array
+        rgb = np.linspace(0.01, 4.0, num=2000*3).astype(np.float32).reshape(2000, 3)
+        ref = rgb.copy()
+        for point in ref:
+            cpu_proc.applyRGB(point)
+
+        arr = rgb.copy()
+        cpu_proc.applyRGBPoints(arr)
+        np.testing.assert_array_equal(arr, ref)
+
+        # Scattered RGBA points as an (N, 4) array
+        rgba = np.linspace(0.01, 4.0, num=2000*4).astype(np.float32).reshape(2000, 4)
+        ref = rgba.copy()
+        cpu_proc.applyRGBA(ref)
+
+        arr = rgba.copy()
+        cpu_proc.applyRGBAPoints(data=arr)
+        np.testing.assert_array_equal(arr, ref)
+
+        # Only contiguous float32 arrays are supported
+        with self.assertRaises(RuntimeError):
+            cpu_proc.applyRGBPoints(rgb.astype(np.float64))
+        with self.assertRaises(RuntimeError):
+            cpu_proc.applyRGBPoints(np.zeros(10, dtype=np.float32))
+        with self.assertRaises(RuntimeError):
+            cpu_proc.applyRGBAPoints(np.zeros((8, 8), dtype=np.float32)[:, :4])
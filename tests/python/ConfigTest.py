@@ -2,6 +2,7 @@
 # Copyright Contributors to the OpenColorIO Project.
 
 import copy
+import pickle
 import unittest
 import os
 import sys
@@ -287,6 +288,33 @@ class ConfigTest(unittest.TestCase):
         other.setFileRules(rules)
         self.assertEqual(other.getFileRules().getNumEntries(), cfg.getFileRules().getNumEntries() - 1)
 
+    def test_pickle(self):
+        """
+        Test the pickling of a config.
+        """
+        cfg = OCIO.Config.CreateRaw()
+        cfg.setName('test config')
+        cfg.setSearchPath('.')
+        cfg.setWorkingDir(TEST_DATAFILES_DIR)
+        cfg.addColorSpace(
+            OCIO.ColorSpace(OCIO.REFERENCE_SPACE_SCENE,
+                            "cdl_cs",
+                            toReference=OCIO.CDLTransform(sat=1.5)))
+        file_tr = OCIO.FileTransform(src='lut1d_green.ctf')
+
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(cfg, protocol=protocol))
+            self.assertFalse(other is cfg)
+
+            self.assertEqual(other.getName(), cfg.getName())
+            self.assertEqual(other.getWorkingDir(), cfg.getWorkingDir())
+            self.assertEqual(other.getCacheID(), cfg.getCacheID())
+            self.assertEqual(list(other.getColorSpaceNames()), list(cfg.getColorSpaceNames()))
+
+            # The relative search path still resolves the files.
+            proc = other.getProcessor(file_tr)
+            self.assertEqual(proc.getCacheID(), cfg.getProcessor(file_tr).getCacheID())
+
     def test_shared_views(self):
         # Test these Config functions: addSharedView, getSharedViews, removeSharedView, clearSharedViews.
 
@@ -1139,6 +1167,60 @@ colorspaces:
         with self.assertRaises(OCIO.Exception):
             config.getProcessor("plain_lut1_cs", "shot1_lut1_cs")
 
+    def test_create_from_file_cached(self):
+        # CreateFromFileCached reuses the cached config while the file is unchanged, but returns
+        # an editable copy of it.
+        config_file = os.path.normpath(
+            os.path.join(TEST_DATAFILES_DIR, 'configs', 'context_test1', 'config.ocio')
+        )
+
+        OCIO.ClearConfigCache()
+        try:
+            config = OCIO.Config.CreateFromFileCached(config_file)
+            config.validate()
+            self.assertEqual(len(config.getColorSpaceNames()), 13)
+
+            stats = OCIO.GetConfigCacheStatistics()
+            editable = OCIO.Config.CreateFromFileCached(fileName=config_file)
+            self.assertIsNot(editable, config)
+            self.assertEqual(editable.getCacheID(), config.getCacheID())
+            self.assertEqual(OCIO.GetConfigCacheStatistics().hits - stats.hits, 1)
+            self.assertEqual(OCIO.GetConfigCacheStatistics().size, 1)
+
+            # An edit of the returned config (including an in-place edit of one of its color
+            # spaces) does not leak into the cached config.
+            editable.setDescription('edited')
+            editable.removeColorSpace('shot1_lut1_cs')
+            cs = editable.getColorSpace('plain_lut1_cs')
+            cs.setDescription('edited')
+
+            config = OCIO.Config.CreateFromFileCached(config_file)
+            self.assertEqual(OCIO.GetConfigCacheStatistics().hits - stats.hits, 2)
+            self.assertNotEqual(config.getDescription(), 'edited')
+            self.assertEqual(len(config.getColorSpaceNames()), 13)
+            self.assertNotEqual(config.getColorSpace('plain_lut1_cs').getDescription(), 'edited')
+            self.assertNotEqual(config.getCacheID(), editable.getCacheID())
+
+            # The config is loaded again after clearing the cache.
+            OCIO.ClearConfigCache()
+            self.assertEqual(OCIO.GetConfigCacheStatistics().size, 0)
+            OCIO.Config.CreateFromFileCached(config_file)
+            self.assertEqual(OCIO.GetConfigCacheStatistics().misses - stats.misses, 1)
+
+            OCIO.SetConfigCacheCapacity(capacity=1)
+            self.assertEqual(OCIO.GetConfigCacheCapacity(), 1)
+
+            # The OCIO environment variable is used too.
+            OCIO.SetEnvVariable('OCIO', config_file)
+            stats = OCIO.GetConfigCacheStatistics()
+            config = OCIO.Config.CreateFromEnvCached()
+            self.assertEqual(OCIO.Config.CreateFromEnvCached().getCacheID(), config.getCacheID())
+            self.assertEqual(OCIO.GetConfigCacheStatistics().hits - stats.hits, 2)
+        finally:
+            OCIO.UnsetEnvVariable('OCIO')
+            OCIO.SetConfigCacheCapacity(0)
+            OCIO.ClearConfigCache()
+
     def test_config_io_proxy(self):
         
         # Simulate that the config and LUT are in memory by initializing three variables
@@ -17,11 +17,15 @@ class ConstantsTest(unittest.TestCase):
         self.assertEqual(OCIO.OCIO_INACTIVE_COLORSPACES_ENVVAR, 'OCIO_INACTIVE_COLORSPACES')
         self.assertEqual(OCIO.OCIO_OPTIMIZATION_FLAGS_ENVVAR, 'OCIO_OPTIMIZATION_FLAGS')
         self.assertEqual(OCIO.OCIO_USER_CATEGORIES_ENVVAR, 'OCIO_USER_CATEGORIES')
+        self.assertEqual(OCIO.OCIO_LAZY_CONFIG_LOADING_ENVVAR, 'OCIO_LAZY_CONFIG_LOADING')
 
         # Cache (env. variables).
         self.assertEqual(OCIO.OCIO_DISABLE_ALL_CACHES, 'OCIO_DISABLE_ALL_CACHES')
         self.assertEqual(OCIO.OCIO_DISABLE_PROCESSOR_CACHES, 'OCIO_DISABLE_PROCESSOR_CACHES')
         self.assertEqual(OCIO.OCIO_DISABLE_CACHE_FALLBACK, 'OCIO_DISABLE_CACHE_FALLBACK')
+        self.assertEqual(OCIO.OCIO_FILE_CACHE_CAPACITY, 'OCIO_FILE_CACHE_CAPACITY')
+        self.assertEqual(OCIO.OCIO_FILE_CACHE_VALIDATION_INTERVAL,
+                         'OCIO_FILE_CACHE_VALIDATION_INTERVAL')
 
         # Roles.
         self.assertEqual(OCIO.ROLE_DEFAULT, 'default')
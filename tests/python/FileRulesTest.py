@@ -404,3 +404,27 @@ class FileRulesTest(unittest.TestCase):
         self.assertEqual(ruleIndex, 1) # Default rule.
         csName, ruleIndex = cfg.getColorSpaceFromFilepath('')
         self.assertEqual(ruleIndex, 1) # Default rule.
+
+    def test_using_rules_batch(self):
+        """
+        Test Config.getColorSpacesFromFilepaths().
+        """
+        cfg = OCIO.Config.CreateRaw()
+        cs = OCIO.ColorSpace(name = 'cs1')
+        cfg.addColorSpace(cs)
+        cs = OCIO.ColorSpace(name = 'cs2')
+        cfg.addColorSpace(cs)
+
+        rules = OCIO.FileRules()
+        rules.insertRule(0, 'A', 'cs1', '*', 'jpg')
+        rules.insertPathSearchRule(1)
+        cfg.setFileRules(rules)
+
+        filePaths = ['/show/img.0001.jpg', '/show/img_cs2.0001.exr', '/show/img.0001.exr', '']
+        results = cfg.getColorSpacesFromFilepaths(filePaths=filePaths)
+        self.assertEqual(results, [('cs1', 0), ('cs2', 1), ('default', 2), ('default', 2)])
+
+        for filePath, result in zip(filePaths, results):
+            self.assertEqual(cfg.getColorSpaceFromFilepath(filePath), result)
+
+        self.assertEqual(cfg.getColorSpacesFromFilepaths([]), [])
@@ -2,6 +2,7 @@
 # Copyright Contributors to the OpenColorIO Project.
 
 import logging
+import pickle
 import unittest
 
 logger = logging.getLogger(__name__)
@@ -167,6 +168,41 @@ class Lut3DTransformTest(unittest.TestCase, TransformsBaseTest):
         self.assertAlmostEqual(g, 1.1, delta=1e-6)
         self.assertAlmostEqual(b, 1.2, delta=1e-6)
 
+    def test_fast_inverse_grid_size(self):
+        """
+        Test the grid size of the LUTs baked from the inverse LUTs.
+        """
+        self.assertEqual(OCIO.GetFastInverseLut3DGridSize(), 48)
+
+        with self.assertRaises(OCIO.Exception):
+            OCIO.SetFastInverseLut3DGridSize(1)
+        with self.assertRaises(OCIO.Exception):
+            OCIO.SetFastInverseLut3DGridSize(130)
+        self.assertEqual(OCIO.GetFastInverseLut3DGridSize(), 48)
+
+        lut = OCIO.Lut3DTransform(gridSize=5, direction=OCIO.TRANSFORM_DIR_INVERSE)
+        for r in range(5):
+            for g in range(5):
+                for b in range(5):
+                    lut.setValue(r, g, b, (r / 4) ** 2, (g / 4) ** 2, (b / 4) ** 2)
+
+        try:
+            for grid_size in (17, 33):
+                OCIO.SetFastInverseLut3DGridSize(grid_size)
+                self.assertEqual(OCIO.GetFastInverseLut3DGridSize(), grid_size)
+
+                config = OCIO.Config.CreateRaw()
+                proc = config.getProcessor(lut).getOptimizedProcessor(
+                    OCIO.OPTIMIZATION_LUT_INV_FAST)
+                group = proc.createGroupTransform()
+
+                self.assertEqual(len(group), 1)
+                self.assertIsInstance(group[0], OCIO.Lut3DTransform)
+                self.assertEqual(group[0].getGridSize(), grid_size)
+                self.assertEqual(group[0].getDirection(), OCIO.TRANSFORM_DIR_FORWARD)
+        finally:
+            OCIO.SetFastInverseLut3DGridSize(48)
+
     def test_equals(self):
         """
         Test equals.
@@ -176,3 +212,30 @@ class Lut3DTransformTest(unittest.TestCase, TransformsBaseTest):
         self.assertTrue(lut.equals(lut2))
         lut.setValue(0, 1, 1, 0.1, 0.2, 0.3)
         self.assertFalse(lut.equals(lut2))
+
+    def test_pickle(self):
+        """
+        Test the pickling of the LUT values.
+        """
+        lut = OCIO.Lut3DTransform(gridSize=17, direction=OCIO.TRANSFORM_DIR_INVERSE)
+        lut.setValue(0, 1, 1, 0.1, 0.2, 0.3)
+        lut.getFormatMetadata().setName('name')
+
+        other = pickle.loads(pickle.dumps(lut, protocol=2))
+        self.assertTrue(other.equals(lut))
+        self.assertEqual(other.getDirection(), OCIO.TRANSFORM_DIR_INVERSE)
+        self.assertEqual(other.getFormatMetadata().getName(), 'name')
+
+        if not np or pickle.HIGHEST_PROTOCOL < 5:
+            logger.warning("NumPy or pickle protocol 5 not found. Skipping part of test!")
+            return
+
+        # The LUT values are an out-of-band buffer.
+        buffers = []
+        data = pickle.dumps(lut, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(buffers[0].raw().nbytes, 17 * 17 * 17 * 3 * 4)
+        self.assertLess(len(data), 17 * 17 * 17 * 3)
+
+        other = pickle.loads(data, buffers=buffers)
+        self.assertTrue(other.equals(lut))
@@ -50,7 +50,7 @@ class MixingHelpersTest(unittest.TestCase):
 
         # Print the MixingColorSpaceManager.
         self.assertEqual(str(mix),
-            ('config: 667ca4dc5b3779e570229fb7fd9cffe1:6001c324468d497f99aa06d3014798d8, '
+            ('config: 215b30c104360a4a2b331635997c3ace:6001c324468d497f99aa06d3014798d8, '
             'slider: [minEdge: 0, maxEdge: 0.833864], mixingSpaces: [Rendering Space, '
             'Display Space], selectedMixingSpaceIdx: 0, selectedMixingEncodingIdx: 0'))
 
@@ -226,7 +226,7 @@ class MixingHelpersTest(unittest.TestCase):
 
         # Print the MixingColorSpaceManager.
         self.assertEqual(str(mix),
-            ('config: 779ee109137ff44de9afbf320685f4a2:6001c324468d497f99aa06d3014798d8, '
+            ('config: 36048955821c49667e5092dda0ee66e7:6001c324468d497f99aa06d3014798d8, '
             'slider: [minEdge: 0, maxEdge: 1], mixingSpaces: [color_picking (log_1)], '
             'selectedMixingSpaceIdx: 0, selectedMixingEncodingIdx: 1, colorPicking'))
 
@@ -38,3 +38,71 @@ class OpenColorIOTest(unittest.TestCase):
         OCIO.SetEnvVariable(value='TOTO', name='MY_ENVAR')
         self.assertTrue(OCIO.IsEnvVariablePresent(name='MY_ENVAR'))
         self.assertEqual(OCIO.GetEnvVariable(name='MY_ENVAR'), 'TOTO')
+
+    def test_file_cache_capacity(self):
+        """
+        Test Get/SetFileCacheCapacity() and GetFileCacheStatistics().
+        """
+        self.assertEqual(OCIO.GetFileCacheCapacity(), 0)
+
+        try:
+            OCIO.SetFileCacheCapacity(capacity=4)
+            self.assertEqual(OCIO.GetFileCacheCapacity(), 4)
+
+            stats = OCIO.GetFileCacheStatistics()
+            self.assertIsInstance(stats, OCIO.CacheStatistics)
+            self.assertEqual(stats.capacity, 4)
+            self.assertLessEqual(stats.size, 4)
+            self.assertGreaterEqual(stats.hits, 0)
+            self.assertGreaterEqual(stats.misses, 0)
+            self.assertGreaterEqual(stats.evictions, 0)
+            self.assertIn('capacity=4', repr(stats))
+
+            # The statistics are read-only.
+            with self.assertRaises(AttributeError):
+                stats.hits = 1
+        finally:
+            OCIO.SetFileCacheCapacity(0)
+
+    def test_file_cache_validation_interval(self):
+        """
+        Test Get/SetFileCacheValidationInterval().
+        """
+        self.assertEqual(OCIO.GetFileCacheValidationInterval(), -1)
+
+        try:
+            OCIO.SetFileCacheValidationInterval(milliseconds=500)
+            self.assertEqual(OCIO.GetFileCacheValidationInterval(), 500)
+
+            OCIO.SetFileCacheValidationInterval(0)
+            self.assertEqual(OCIO.GetFileCacheValidationInterval(), 0)
+
+            stats = OCIO.GetFileCacheStatistics()
+            self.assertGreaterEqual(stats.invalidations, 0)
+            self.assertIn('invalidations=', repr(stats))
+        finally:
+            OCIO.SetFileCacheValidationInterval(-1)
+
+    def test_lazy_config_loading(self):
+        """
+        Test Get/SetLazyConfigLoading().
+        """
+        self.assertFalse(OCIO.GetLazyConfigLoading())
+
+        try:
+            OCIO.SetLazyConfigLoading(lazy=True)
+            self.assertTrue(OCIO.GetLazyConfigLoading())
+
+            # A lazily loaded config behaves like an eagerly loaded one.
+            config = OCIO.Config.CreateFromBuiltinConfig('cg-config-latest')
+            cs = config.getColorSpace('ACEScg')
+            self.assertIsNotNone(cs.getTransform(OCIO.COLORSPACE_DIR_TO_REFERENCE))
+            config.validate()
+
+            OCIO.SetLazyConfigLoading(False)
+            self.assertFalse(OCIO.GetLazyConfigLoading())
+
+            eager = OCIO.Config.CreateFromBuiltinConfig('cg-config-latest')
+            self.assertEqual(config.getCacheID(), eager.getCacheID())
+        finally:
+            OCIO.SetLazyConfigLoading(False)
@@ -69,4 +69,29 @@ colorspaces:
       # Confirm that the processor is the same.
       procE = cfg.getProcessor("cs3", "disp1", "view1", OCIO.TRANSFORM_DIR_FORWARD)
 
-      self.assertEqual(procD, procE)
\ No newline at end of file
+      self.assertEqual(procD, procE)
+
+    def test_processor_cache_capacity(self):
+      cfg = OCIO.Config.CreateRaw()
+      self.assertEqual(cfg.getProcessorCacheCapacity(), 0)
+
+      def get_processor(offset):
+          return cfg.getProcessor(OCIO.MatrixTransform(offset=[offset, offset, offset, 0.0]))
+
+      cfg.setProcessorCacheCapacity(capacity=2)
+      self.assertEqual(cfg.getProcessorCacheCapacity(), 2)
+
+      procA = get_processor(0.1)
+      get_processor(0.2)
+      get_processor(0.3)
+
+      # The least recently used processor was evicted.
+      self.assertNotEqual(get_processor(0.1), procA)
+
+      stats = cfg.getProcessorCacheStatistics()
+      self.assertIsInstance(stats, OCIO.CacheStatistics)
+      self.assertEqual(stats.hits, 0)
+      self.assertEqual(stats.misses, 4)
+      self.assertEqual(stats.evictions, 2)
+      self.assertEqual(stats.size, 2)
+      self.assertEqual(stats.capacity, 2)
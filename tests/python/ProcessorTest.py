@@ -2,7 +2,12 @@
 # Copyright Contributors to the OpenColorIO Project.
 
 import os
+import pickle
+import sys
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+
 import PyOpenColorIO as OCIO
 
 from UnitTestUtils import TEST_DATAFILES_DIR
@@ -140,6 +145,25 @@ class ProcessorTest(unittest.TestCase):
         self.assertEqual(t1.getTransformType(), OCIO.TRANSFORM_TYPE_MATRIX)
         self.assertEqual(t1.getOffset(), [3, 2, 1.5, 0])
 
+    def test_pickle(self):
+        # Test the pickling of a processor from its group transform.
+
+        cfg = OCIO.Config.CreateRaw()
+        group = OCIO.GroupTransform()
+        group.appendTransform(OCIO.MatrixTransform(offset=[0.1, 0.2, 0.3, 0.]))
+        test_file = os.path.join(TEST_DATAFILES_DIR, 'clf', 'xyz_to_rgb.clf')
+        group.appendTransform(OCIO.FileTransform(src=test_file))
+        proc = cfg.getProcessor(group)
+
+        other = pickle.loads(pickle.dumps(proc))
+        self.assertFalse(other is proc)
+        self.assertEqual(len(other.createGroupTransform()), len(proc.createGroupTransform()))
+
+        pixel = [0.5, 0.4, 0.3]
+        for value, expected in zip(other.getDefaultCPUProcessor().applyRGB(pixel),
+                                   proc.getDefaultCPUProcessor().applyRGB(pixel)):
+            self.assertAlmostEqual(value, expected, delta=1e-6)
+
     def test_format_meta_data(self):
         # Test FormatMetadata related functions.
 
@@ -183,3 +207,72 @@ class ProcessorTest(unittest.TestCase):
         self.assertEqual(child.getElementName(), 'Description')
         self.assertEqual(child.getElementValue(),
                          'x^1/1.8, with 0.95 and 0.9 scaling for G and B')
+
+    def test_build_multi_threaded(self):
+        # The processor builds release the GIL so they run concurrently from Python threads.
+
+        cfg = OCIO.Config.CreateRaw()
+
+        def create_lut(index):
+            # The inverse of a 3D LUT is slow to build. A different LUT is used for each build
+            # to bypass the processor cache.
+            lut = OCIO.Lut3DTransform(gridSize=33, direction=OCIO.TRANSFORM_DIR_INVERSE)
+            lut.setValue(0, 0, 0, 0.001 * (index + 1), 0., 0.)
+            return lut
+
+        def build(lut):
+            proc = cfg.getProcessor(lut)
+            return proc.getOptimizedCPUProcessor(OCIO.OPTIMIZATION_DEFAULT)
+
+        num_builds = 8
+        num_threads = 4
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            procs = list(executor.map(build, map(create_lut, range(num_builds))))
+
+        # The processors built from the threads are valid.
+        self.assertEqual(len(procs), num_builds)
+        pixel = [0.5, 0.4, 0.3]
+        for proc in procs:
+            for value, expected in zip(proc.applyRGB(pixel), pixel):
+                self.assertAlmostEqual(value, expected, delta=1e-3)
+
+        # The counting thread waits between its counts, which releases the GIL, and a long
+        # switch interval prevents the interpreter from forcing the main thread to give the GIL
+        # back. So the counting thread only makes progress during a call of the main thread if
+        # that call releases the GIL, whatever the timings.
+        progress = [0]
+        stop = threading.Event()
+
+        def count():
+            while not stop.is_set():
+                progress[0] += 1
+                stop.wait(0.001)
+
+        def progress_during(func, *args):
+            before = progress[0]
+            func(*args)
+            return progress[0] - before
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1000.)
+        thread = threading.Thread(target=count)
+        thread.start()
+        try:
+            # A call holding the GIL for a similar time never lets the thread count.
+            for _ in range(4):
+                self.assertEqual(progress_during(sum, range(2000000)), 0)
+
+            # A build releases the GIL. A short build could still end before the thread is
+            # scheduled, so several builds are tried.
+            progressed = False
+            for index in range(num_builds, 2 * num_builds):
+                if progress_during(build, create_lut(index)) > 0:
+                    progressed = True
+                    break
+        finally:
+            stop.set()
+            thread.join()
+            sys.setswitchinterval(switch_interval)
+
+        self.assertTrue(progressed)
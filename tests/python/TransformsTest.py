@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright Contributors to the OpenColorIO Project.
 
-import copy, unittest, os, sys
+import copy, pickle, unittest, os, sys
 import PyOpenColorIO as OCIO
 import inspect
 
@@ -57,6 +57,67 @@ class TransformsTest(unittest.TestCase):
             other.setDirection(OCIO.TRANSFORM_DIR_INVERSE)
             self.assertNotEqual(other.getDirection(), transform.getDirection())
 
+    def test_pickle(self):
+        """
+        Test the pickling of all the transforms.
+        """
+        group = self.all_transforms_as_group()
+
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            for transform in group:
+                other = pickle.loads(pickle.dumps(transform, protocol=protocol))
+                self.assertFalse(other is transform)
+
+                self.assertEqual(type(other), type(transform))
+                self.assertEqual(other.getDirection(), transform.getDirection())
+                if hasattr(transform, 'equals'):
+                    self.assertTrue(other.equals(transform))
+
+            # The group pickles its transforms.
+            other = pickle.loads(pickle.dumps(group, protocol=protocol))
+            self.assertEqual(len(other), len(group))
+            for other_transform, transform in zip(other, group):
+                self.assertEqual(type(other_transform), type(transform))
+
+        # Changes are kept.
+        matrix = OCIO.MatrixTransform(offset=[0.1, 0.2, 0.3, 0.])
+        matrix.setDirection(OCIO.TRANSFORM_DIR_INVERSE)
+        other = pickle.loads(pickle.dumps(matrix))
+        self.assertEqual(other.getOffset(), [0.1, 0.2, 0.3, 0.])
+        self.assertEqual(other.getDirection(), OCIO.TRANSFORM_DIR_INVERSE)
+
+        # The double values are kept exactly (i.e. not only the first 15 significant digits).
+        value = 0.1 + 1e-16
+        self.assertNotEqual(value, 0.1)
+
+        other = pickle.loads(pickle.dumps(OCIO.MatrixTransform(offset=[value, 0., 0., 0.])))
+        self.assertEqual(other.getOffset()[0], value)
+
+        other = pickle.loads(pickle.dumps(OCIO.ExponentTransform(value=[1. + value, 1., 1., 1.])))
+        self.assertEqual(other.getValue()[0], 1. + value)
+
+        other = pickle.loads(pickle.dumps(OCIO.ExposureContrastTransform(exposure=value)))
+        self.assertEqual(other.getExposure(), value)
+
+        other = pickle.loads(pickle.dumps(OCIO.RangeTransform(minInValue=value,
+                                                              maxInValue=1.,
+                                                              minOutValue=value,
+                                                              maxOutValue=1.)))
+        self.assertEqual(other.getMinInValue(), value)
+        self.assertEqual(other.getMinOutValue(), value)
+
+        # The unset values stay unset.
+        range_tr = OCIO.RangeTransform()
+        range_tr.setMinInValue(value)
+        other = pickle.loads(pickle.dumps(range_tr))
+        self.assertEqual(other.getMinInValue(), value)
+        self.assertFalse(other.hasMaxInValue())
+
+        primary = OCIO.GradingPrimary(OCIO.GRADING_LOG)
+        primary.saturation = value
+        other = pickle.loads(pickle.dumps(OCIO.GradingPrimaryTransform(primary)))
+        self.assertEqual(other.getValue().saturation, value)
+
     def test_binding_group_polymorphism(self):
         """
         Tests polymorphism issue where transforms are cast as parent class when using